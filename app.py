@@ -1,14 +1,39 @@
 import streamlit as st
-import cv2
-import mediapipe as mp
-import numpy as np
+import os
 import time
-import threading
-import queue
-import simpleaudio as sa
-from PIL import Image, ImageDraw, ImageFont
+import uuid
 import login_component
-
+from audio import get_audio_engine
+from camera_session import CameraSession
+from display import DisplayPublisher
+from frame_sources import (
+    CameraMode, camera_in_use, configured_mode, discard_warm_camera, prewarm_camera, take_camera
+)
+from metrics import get_metrics, start_exporters
+from landmarks import TasksProvider, tasks_available
+from models import HandsLease, warm_hands_async
+from overlay import QUALITY_FINGERTIPS, QUALITY_FULL, QUALITY_LEVELS, QUALITY_REFLEX
+from pipeline import HandPipeline
+from progress_ui import ChangeOnlyPlaceholder
+from rep_engine import FINGERTIPS, load_contact_config
+from roi import ROITracker
+from scheduler import CueScheduler
+from session_store import get_session_store
+from stations import get_station_manager
+
+
+# Decode the audio bank and build + warm the hand model while the user is
+# still on the login page (both are cached for the whole process)
+get_audio_engine()
+warm_hands_async()
+
+# Per-stage latency export for ops (off unless configured):
+#   NEUROREHAB_METRICS_PORT=9100     → Prometheus text at http://127.0.0.1:9100/metrics
+#   NEUROREHAB_METRICS_CSV=perf.csv  → one row per camera loop every 10 s, rotated at 5 MB
+start_exporters(
+    port=os.environ.get("NEUROREHAB_METRICS_PORT"),
+    csv_path=os.environ.get("NEUROREHAB_METRICS_CSV"),
+)
 
 # Check if user is logged in
 if not st.session_state.get('logged_in', False):
@@ -24,22 +49,12 @@ with st.sidebar:
         login_component.logout()
     st.markdown("---")
 
-# ========== AUDIO QUEUE (NO OVERLAP) ==========
-audio_queue = queue.Queue()
-
-def audio_player():
-    while True:
-        file = audio_queue.get()
-        if file is None:
-            break
-        wave = sa.WaveObject.from_wave_file(file)
-        wave.play().wait_done()
-        audio_queue.task_done()
-
-threading.Thread(target=audio_player, daemon=True).start()
-
-def speak(file):
-    audio_queue.put(file)
+# ========== AUDIO (NO OVERLAP) ==========
+# One engine per process (WAVs decoded once, single playback worker);
+# each browser session only holds a lightweight handle onto it.
+if "audio_session_id" not in st.session_state:
+    st.session_state.audio_session_id = uuid.uuid4().hex
+audio = get_audio_engine().session(st.session_state.audio_session_id)
 
 # Pre-generated audio files (must exist in SAME folder as app.py)
 PRESS_V   = "press.wav"
@@ -52,43 +67,6 @@ RELEASE_V = "release.wav"
 GOOD_V    = "goodjob.wav"
 DING_V    = "ding.wav"
 
-def ding():
-    speak(DING_V)
-
-# ========== PROGRESS CIRCLE UI ==========
-def create_progress_circle(progress):
-    size = 200
-    img = Image.new("RGB", (size, size), (30, 30, 30))
-    draw = ImageDraw.Draw(img)
-    center = size // 2
-    radius = 85
-
-    draw.ellipse(
-        (center-radius, center-radius, center+radius, center+radius),
-        outline=(80, 80, 80),
-        width=10,
-    )
-
-    angle = int(360 * (progress / 100))
-    draw.arc(
-        (center-radius, center-radius, center+radius, center+radius),
-        start=-90,
-        end=angle-90,
-        fill=(0, 255, 0),
-        width=14,
-    )
-
-    text = f"{int(progress)}%"
-    font = ImageFont.load_default()
-    bbox = draw.textbbox((0, 0), text, font=font)
-    draw.text(
-        (center - (bbox[2]-bbox[0])//2, center - (bbox[3]-bbox[1])//2),
-        text,
-        fill=(255, 255, 255),
-        font=font,
-    )
-    return img
-
 # ========== MAIN APP STYLING ==========
 st.markdown("""
     <style>
@@ -386,304 +364,278 @@ HOLD_TIME = st.sidebar.slider(
     step=0.1,
 )
 STABILITY_TIME = 0.25  # seconds of stable press required before starting countdown
+CONTACT_FINGERS = st.sidebar.multiselect(
+    "Pressing fingers",
+    list(FINGERTIPS),
+    default=load_contact_config()["fingers"],
+    format_func=str.capitalize,
+    help="Fingertips that count as pressing the reflex point; the closest one is used. "
+         "Per-finger thresholds come from contact.json.",
+)
 
-# ========== PULSE ANIMATION STATE ==========
-if "pulse_radius" not in st.session_state:
-    st.session_state.pulse_radius = 22
-if "pulse_direction" not in st.session_state:
-    st.session_state.pulse_direction = 1
-
-# ========== SPINE PATH HELPERS / VIRTUAL POINTS ==========
-
-def interpolate_segment(points, count):
-    """Interpolate 'count' evenly spaced points along a path."""
-    pts = np.array(points, dtype=float)
-    if len(pts) == 1:
-        return [tuple(pts[0])] * count
-
-    dists = np.sqrt(((pts[1:] - pts[:-1]) ** 2).sum(axis=1))
-    cumdist = np.insert(np.cumsum(dists), 0, 0.0)
-    total = cumdist[-1]
-    if total == 0:
-        return [tuple(pts[0])] * count
-
-    samples = np.linspace(0, total, count)
-    out = []
-    for s in samples:
-        j = np.searchsorted(cumdist, s)
-        if j == 0:
-            out.append(tuple(pts[0]))
-        else:
-            if j >= len(pts):
-                j = len(pts) - 1
-            d0, d1 = cumdist[j-1], cumdist[j]
-            if d1 == d0:
-                t = 0.0
-            else:
-                t = (s - d0) / (d1 - d0)
-            p = (1 - t) * pts[j-1] + t * pts[j]
-            out.append(tuple(p))
-    return out
-
-def compute_spine_points_for_region(hand, img):
-    """
-    Build virtual spinal reflex points for each region:
-    - Cervical: 7 virtual points along thumb (C1–C7)
-    - Thoracic: 12 virtual points under thumb towards wrist (T1–T12)
-    - Lumbar: placeholder (L1–L5, overridden dynamically)
-    - Sacrum: 5 virtual points at extreme right palm base under pinky (S1–S5)
-    - Coccyx: 4 virtual points just below sacrum (Co1–Co4)
-    """
-    h, w, _ = img.shape
-
-    def LM_vec(i):
-        lm = hand.landmark[i]
-        return np.array([lm.x * w, lm.y * h], dtype=float)
-
-    thumb_tip  = LM_vec(4)
-    thumb_mid  = LM_vec(3)
-    thumb_base = LM_vec(2)
-    mid_base   = LM_vec(9)
-    ring_base  = LM_vec(13)
-    pinky_base = LM_vec(17)
-    wrist      = LM_vec(0)
-
-    # ----- Cervical: along thumb (7 virtual vertebra points: C1–C7)
-    cervical_path = [thumb_tip, thumb_mid, thumb_base]
-    cervical_pts = interpolate_segment(cervical_path, 7)
-
-        # ----- Thoracic: band under thumb toward wrist (12 virtual points: T1–T12)
-    t1 = thumb_base
-    t2 = 0.7 * thumb_base + 0.3 * wrist
-    t3 = 0.4 * thumb_base + 0.6 * wrist
-    thoracic_path = [t1, t2, t3]
-    thoracic_pts = interpolate_segment(thoracic_path, 12)
-
-    # LAST thoracic point = lumbar start base
-    thoracic_end = np.array(thoracic_pts[-1], dtype=float)
-
-    # ----- Lumbar: starts deeper and extends to right edge below pinky at wrist (L1–L5)
-    # Start from deep position near center of wrist
-    lumbar_start = mid_base + 0.85 * (wrist - mid_base)
-    
-    # End point: right edge of palm below pinky finger at wrist level
-    # Move toward pinky base and then down to wrist level, then extend to edge
-    pinky_to_wrist_direction = wrist - pinky_base
-    lumbar_end = pinky_base + 0.95 * pinky_to_wrist_direction  # very close to wrist on pinky side
-    # Shift slightly outward toward palm edge (away from center)
-    outward_shift = (pinky_base - mid_base) * 0.2  # shift toward edge
-    lumbar_end = lumbar_end + outward_shift
-
-    lumbar_path = [lumbar_start, lumbar_end]
-    lumbar_pts = interpolate_segment(lumbar_path, 5)
-
-    # LAST lumbar point = sacrum start
-    lumbar_end_final = np.array(lumbar_pts[-1], dtype=float)
-
-    # ----- Sacrum: endpoint is where S2 appears (S1–S5)
-    sacrum_start = lumbar_end_final  # continue from where lumbar ends (this is S1)
-    
-    # Calculate endpoint so that when interpolated into 5 points,
-    # the second point (S2) is at the endpoint position
-    # We need a very small distance - the endpoint should be close to start
-    # Direction: slightly down and toward edge
-    edge_direction = wrist - pinky_base
-    # Very small movement - just enough for S2 to be visible
-    sacrum_end = sacrum_start + 0.015 * edge_direction  # tiny movement down
-    
-    sacrum_path = [sacrum_start, sacrum_end]
-    sacrum_pts = interpolate_segment(sacrum_path, 5)
-
-    # LAST sacrum point = coccyx start
-    sacrum_end_final = np.array(sacrum_pts[-1], dtype=float)
-
-    # ----- Coccyx: continues from sacrum endpoint (Co1–Co4)
-    coccyx_start = sacrum_end_final
-    
-    # End point: continue with similar small distance
-    edge_direction = wrist - pinky_base
-    coccyx_end = coccyx_start + 0.015 * edge_direction  # similar tiny movement
-
-    coccyx_path = [coccyx_start, coccyx_end]
-    coccyx_pts = interpolate_segment(coccyx_path, 4)
-
-
-    to_int = lambda arr: [(int(x), int(y)) for (x, y) in arr]
+# ========== INFERENCE ==========
+ROI_TRACKING = st.sidebar.checkbox(
+    "ROI tracking (run hand detection on a crop around the hands)",
+    value=False,
+    help="Faster on low-end PCs; falls back to the full frame when a hand is lost.",
+)
+TASKS_BACKEND = st.sidebar.checkbox(
+    "Asynchronous inference (MediaPipe Tasks)",
+    value=False,
+    disabled=not tasks_available(),
+    help="HandLandmarker in live-stream mode: frames are submitted without waiting and results "
+         "arrive as they finish. Needs hand_landmarker.task next to app.py (or NEUROREHAB_HAND_MODEL). "
+         "ROI tracking and stations use the legacy backend.",
+)
+USE_STATION = st.sidebar.checkbox(
+    "Use shared camera station",
+    value=False,
+    help="Capture and inference run in a dedicated worker process per camera, "
+         "so several cameras/patients can be served by one machine.",
+)
+STATION_ID = st.sidebar.number_input(
+    "Station ID (camera index)", min_value=0, max_value=15, value=0, disabled=not USE_STATION
+)
 
-    return {
-        "Cervical (C1–C7)": to_int(cervical_pts),
-        "Thoracic (T1–T12)": to_int(thoracic_pts),
-        "Lumbar (L1–L5)": to_int(lumbar_pts),   # overridden dynamically
-        "Sacrum": to_int(sacrum_pts),
-        "Coccyx": to_int(coccyx_pts),
-    }
+LATENCY_BUDGET_MS = st.sidebar.number_input(
+    "Motion-to-sound budget (ms)",
+    min_value=100,
+    max_value=2000,
+    value=500,
+    step=50,
+    help="Warn when fingertip contact → “Hold” or lift-off → ding takes longer than this "
+         "(includes the stability gate).",
+)
+AUTO_QUALITY = st.sidebar.checkbox(
+    "Auto quality",
+    value=False,
+    help="Lower model, inference resolution, inference rate and overlay detail step by step "
+         "when the camera loop can't hold the target FPS, and raise them again when it can.",
+)
+TARGET_FPS = st.sidebar.slider("Target FPS", 10, 30, 20, disabled=not AUTO_QUALITY)
+if AUTO_QUALITY:
+    warm_hands_async(model_complexity=0)    # first step down switches to the lite model (warmed once per process)
+SHOW_HUD = st.sidebar.checkbox(
+    "Performance HUD",
+    value=False,
+    help="FPS, dropped frames and per-stage p50/p95 latency of the running camera loop.",
+)
 
-def draw_spine_reflex_point(img, spinal_region, hand, rep_index):
-    """
-    Draw reflex point for selected region using virtual points:
-    - Cervical, Thoracic, Sacrum, Coccyx → from compute_spine_points_for_region
-    - Lumbar → dynamic virtual path based on reps (below ring finger → toward pinky)
-    """
-    h, w, _ = img.shape
-
-    def LM_vec_abs(i):
-        lm = hand.landmark[i]
-        return np.array([lm.x * w, lm.y * h], dtype=float)
-
-    if spinal_region == "Lumbar (L1–L5)":
-        # Get landmarks
-        wrist      = LM_vec_abs(0)
-        mid_base   = LM_vec_abs(9)
-        pinky_base = LM_vec_abs(17)
-        
-        # Lumbar starts from deep position near center of wrist
-        lumbar_start = mid_base + 0.85 * (wrist - mid_base)
-        
-        # End point: right edge of palm below pinky finger at wrist level
-        pinky_to_wrist_direction = wrist - pinky_base
-        lumbar_end = pinky_base + 0.95 * pinky_to_wrist_direction  # very close to wrist on pinky side
-        # Shift slightly outward toward palm edge
-        outward_shift = (pinky_base - mid_base) * 0.2
-        lumbar_end = lumbar_end + outward_shift
-
-        lumbar_pts = interpolate_segment([lumbar_start, lumbar_end], 5)
-        points = [(int(x), int(y)) for (x, y) in lumbar_pts]
-    else:
-        region_points_map = compute_spine_points_for_region(hand, img)
-        points = region_points_map[spinal_region]
-
-    if not points:
-        return None, None
-
-    # clamp index
-    rep_index = max(0, min(rep_index, len(points) - 1))
-    cx, cy = points[rep_index]
-
-    cv2.circle(
-        img,
-        (cx, cy),
-        int(st.session_state.pulse_radius),
-        (0, 255, 0),
-        3,
+# ========== DISPLAY STREAMING ==========
+# Frames sent to the browser; lower these on slow/remote connections.
+# The publisher backs off further on its own if the connection can't keep up.
+with st.sidebar.expander("Display Streaming", expanded=False):
+    DISPLAY_FPS = st.slider("Display FPS", 5, 30, 15)
+    DISPLAY_WIDTH = st.select_slider("Display width (px)", [320, 480, 640, 960, 1280], value=640)
+    JPEG_QUALITY = st.slider("JPEG quality", 30, 95, 70, step=5)
+    OVERLAY_QUALITY = st.selectbox(
+        "Overlay",
+        QUALITY_LEVELS,
+        format_func={
+            QUALITY_FULL: "Full hand skeleton",
+            QUALITY_FINGERTIPS: "Fingertips only",
+            QUALITY_REFLEX: "Reflex point only",
+        }.get,
+        help="Draw less on the video on weak hardware.",
     )
 
-    # Animate pulse
-    st.session_state.pulse_radius += st.session_state.pulse_direction * 1.4
-    if st.session_state.pulse_radius >= 40 or st.session_state.pulse_radius <= 20:
-        st.session_state.pulse_direction *= -1
-
-    return cx, cy
-
-# ========== COUNTDOWN THREAD ==========
-def run_countdown():
-    # Voice sequence: Hold, 3, 2, 1, Release
-    speak(HOLD_V)
-    time.sleep(0.4)
-    speak(T3_V)
-    time.sleep(0.8)
-    speak(T2_V)
-    time.sleep(0.8)
-    speak(T1_V)
-    time.sleep(0.3)
-    speak(RELEASE_V)
+# ========== SESSION RECORDING ==========
+# Written on a background thread; frames are dropped, not waited for, if the disk can't keep up.
+with st.sidebar.expander("Session Recording", expanded=False):
+    RECORD_VIDEO = st.checkbox(
+        "Record session video",
+        value=False,
+        help="Saves an .mp4 and a .jsonl file with per-frame landmarks, reflex point, distance and stage "
+             "under recordings/<user>/ for later review.",
+    )
+    RECORD_RAW = st.checkbox("Record raw camera frames (no overlay)", value=False, disabled=not RECORD_VIDEO)
+    RECORD_FPS = st.slider("Recording FPS", 5, 30, 15, disabled=not RECORD_VIDEO)
+
+# ========== CAMERA CAPTURE ==========
+# Requested webcam mode; defaults to the one saved for this station by
+# benchmarks/camera_bench.py --save (camera.json). The driver may grant a
+# different one; what was negotiated is shown below the Start checkbox.
+_saved_mode = configured_mode(0)
+with st.sidebar.expander("Camera", expanded=False):
+    _sizes = ["640x480", "960x540", "1280x720", "1920x1080"]
+    _size = f"{_saved_mode.width}x{_saved_mode.height}"
+    CAMERA_SIZE = st.selectbox("Resolution", _sizes if _size in _sizes else [_size] + _sizes,
+                               index=_sizes.index(_size) if _size in _sizes else 0)
+    _rates = [15, 30, 60]
+    CAMERA_FPS = st.selectbox("Camera FPS", _rates,
+                              index=_rates.index(_saved_mode.fps) if _saved_mode.fps in _rates else 1)
+    CAMERA_FORMAT = st.selectbox(
+        "Pixel format", ["MJPG", "YUYV"], index=1 if _saved_mode.fourcc == "YUYV" else 0,
+        help="MJPG usually allows higher resolution and FPS over USB 2; YUYV skips JPEG decoding.",
+    )
+CAMERA_MODE = CameraMode.parse(f"{CAMERA_SIZE}@{CAMERA_FPS}/{CAMERA_FORMAT}")
+
+# ========== COUNTDOWN SCHEDULER ==========
+# One monotonic-clock scheduler per session; the countdown is a set of
+# tagged events that an early release can cancel.
+if "cue_scheduler" not in st.session_state:
+    st.session_state.cue_scheduler = CueScheduler()
+scheduler = st.session_state.cue_scheduler
+
+CUES = {
+    "ready": READY_V,
+    "press": PRESS_V,
+    "hold": HOLD_V,
+    "numbers": [T3_V, T2_V, T1_V],
+    "release": RELEASE_V,
+    "good": GOOD_V,
+    "ding": DING_V,
+}
 
 # ========== CAMERA SECTION ==========
 FRAME = st.image([])
-progress_box = st.empty()
-counter_box = st.empty()
-
-run_camera = st.checkbox("Start Camera")
-
-if run_camera:
-    speak(READY_V)
-    time.sleep(0.4)
-    speak(PRESS_V)
-
-    cap = cv2.VideoCapture(0)
-    mp_hands = mp.solutions.hands
-    hands = mp_hands.Hands(
-        max_num_hands=2,
-        min_detection_confidence=0.88,
-        min_tracking_confidence=0.88,
+# Progress and counter are only pushed to the browser when their value changes
+progress_box = ChangeOnlyPlaceholder(st.empty())
+counter_box = ChangeOnlyPlaceholder(st.empty())
+status_box = st.empty()
+
+def _mark_camera_click():
+    st.session_state.camera_clicked_at = time.monotonic()
+
+# A session whose camera failed has ended: drop it and untick Start so
+# the next tick opens the camera again
+failed = st.session_state.get("camera_session")
+if failed is not None and failed.failure is not None and not failed.running:
+    st.session_state.camera_session = None
+    st.session_state.run_camera = False
+    status_box.error(f"📷 Camera stopped: {failed.failure}. Tick “Start Camera” to try again.")
+
+run_camera = st.checkbox("Start Camera", key="run_camera", on_change=_mark_camera_click)
+
+# Open the webcam in the background while condition and reps are chosen,
+# but never while a session or a station process already streams from it
+station = get_station_manager().stations().get(0)
+if (
+    not USE_STATION
+    and not run_camera
+    and st.session_state.get("camera_session") is None
+    and not camera_in_use(0)
+    and not (station is not None and station.alive)
+):
+    prewarm_camera(0, CAMERA_MODE)
+startup_box = st.sidebar.empty()
+hud_box = st.sidebar.empty() if SHOW_HUD else None
+alert_box = st.sidebar.empty()
+camera_box = st.sidebar.empty()
+quality_box = st.sidebar.empty()
+
+def start_camera_session(pipeline_key):
+    metrics = get_metrics(f"session-{st.session_state.audio_session_id[:8]}")
+    if USE_STATION:
+        discard_warm_camera(STATION_ID)     # the station process opens the device itself
+        pipeline = get_station_manager().attach(
+            STATION_ID,
+            source=f"camera:{STATION_ID}@{CAMERA_MODE.spec()}",
+            width=CAMERA_MODE.width,
+            height=CAMERA_MODE.height,
+        )
+        on_close = model_switcher = None
+    else:
+        cap = take_camera(0, CAMERA_MODE)
+        st.session_state.camera_negotiated = cap.describe()
+        if TASKS_BACKEND:
+            lease = model_switcher = None
+            provider = TasksProvider()
+        else:
+            lease = HandsLease(wrap=ROITracker if ROI_TRACKING else None)
+            model_switcher = lease.switch
+            provider = lease.provider()
+        pipeline = HandPipeline(cap, provider, metrics=metrics).start()
+
+        def on_close():
+            if lease is not None:
+                lease.release()
+            cap.release()
+
+    display = DisplayPublisher(
+        FRAME,
+        target_fps=DISPLAY_FPS,
+        max_width=DISPLAY_WIDTH,
+        jpeg_quality=JPEG_QUALITY,
+        metrics=metrics,
+    ).start()
+    return CameraSession(
+        pipeline,
+        display,
+        audio,
+        scheduler,
+        CUES,
+        pipeline_key=pipeline_key,
+        on_close=on_close,
+        clicked_at=st.session_state.pop("camera_clicked_at", None),
+        store=get_session_store(),
+        username=st.session_state.username,
+        metrics=metrics,
+        model_switcher=model_switcher,
     )
-    mp_draw = mp.solutions.drawing_utils
-
-    count = 0
-    stage = "waiting_press"
-    distances = []
-    SMOOTH = 5
-    press_timer = None
-
-    while count < target_reps:
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        frame = cv2.flip(frame, 1)
-        img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(img)
-
-        if results.multi_hand_landmarks and len(results.multi_hand_landmarks) == 2:
-            h1, h2 = results.multi_hand_landmarks
-
-            # Identify left and right by x-coordinate
-            if h1.landmark[0].x < h2.landmark[0].x:
-                left = h1
-                right = h2
-            else:
-                left = h2
-                right = h1
-
-            target_hand = right if hand_choice == "Right Hand" else left
-            pressing_hand = left if target_hand == right else right
-
-            # Draw landmarks
-            mp_draw.draw_landmarks(img, target_hand, mp_hands.HAND_CONNECTIONS)
-            mp_draw.draw_landmarks(img, pressing_hand, mp_hands.HAND_CONNECTIONS)
-
-            # ---- Draw correct vertebra reflex point for this region & rep ----
-            cx, cy = draw_spine_reflex_point(img, spinal_region, target_hand, count)
-
-            if cx is not None:
-                # Compute distance between pressing index fingertip and reflex point
-                h_img, w_img, _ = img.shape
-                rx, ry = cx / w_img, cy / h_img  # normalized reflex point
-                press_tip = pressing_hand.landmark[8]
-                px, py = press_tip.x, press_tip.y
-
-                dist = ((rx - px) ** 2 + (ry - py) ** 2) ** 0.5
-
-                distances.append(dist)
-                if len(distances) > SMOOTH:
-                    distances.pop(0)
-                smooth = sum(distances) / len(distances)
-                now = time.time()
-
-                # -------- STABLE PRESS DETECTION --------
-                if stage == "waiting_press":
-                    if smooth < PRESS_TH:
-                        if press_timer is None:
-                            press_timer = now
-                        elif now - press_timer >= STABILITY_TIME:
-                            # Start countdown in background
-                            threading.Thread(target=run_countdown, daemon=True).start()
-                            stage = "countdown_running"
-                    else:
-                        press_timer = None  # lost press, reset
-
-                # -------- RELEASE DETECTION AFTER COUNTDOWN --------
-                if stage == "countdown_running" and smooth > RELEASE_TH:
-                    ding()
-                    speak(GOOD_V)
-                    count += 1
-                    counter_box.success(f"Reps Completed: {count}/{target_reps}")
-                    stage = "waiting_press"
-                    press_timer = None
-                    speak(PRESS_V)
-
-        FRAME.image(img)
-        progress_box.image(create_progress_circle((count / target_reps) * 100))
-
-    cap.release()
-    speak(GOOD_V)
-    st.success("🎉 Session Completed for selected spinal reflex region")
\ No newline at end of file
+
+# The session runs in the background and survives reruns: changing a
+# slider only re-applies settings, it never restarts camera or model.
+# Only inference options (station / ROI) need a new pipeline.
+pipeline_key = (USE_STATION, STATION_ID if USE_STATION else None, ROI_TRACKING, TASKS_BACKEND, CAMERA_MODE)
+session = st.session_state.get("camera_session")
+if session is not None and (
+    not run_camera or (session.running and session.pipeline_key != pipeline_key)
+):
+    session.stop()
+    session = st.session_state.camera_session = None
+
+if run_camera and session is None:
+    session = st.session_state.camera_session = start_camera_session(pipeline_key)
+
+if session is not None:
+    session.configure(
+        region=spinal_region,
+        target_reps=target_reps,
+        hand_choice=hand_choice,
+        press_th=PRESS_TH,
+        release_th=RELEASE_TH,
+        hold_time=HOLD_TIME,
+        stability_time=STABILITY_TIME,
+        latency_budget=LATENCY_BUDGET_MS / 1000,
+        overlay_quality=OVERLAY_QUALITY,
+        auto_quality=AUTO_QUALITY,
+        target_fps=TARGET_FPS,
+        fingers=CONTACT_FINGERS,
+        record_video=RECORD_VIDEO,
+        record_raw=RECORD_RAW,
+        record_fps=float(RECORD_FPS),
+    )
+    session.display.configure(DISPLAY_FPS, DISPLAY_WIDTH, JPEG_QUALITY)
+    session.bind(FRAME, progress_box, counter_box, status_box, startup_box, hud_box, alert_box, quality_box)
+    session.start()     # no-op once running
+    if not USE_STATION and "camera_negotiated" in st.session_state:
+        camera_box.caption(f"📷 {st.session_state.camera_negotiated}")
+
+# ========== SESSION HISTORY ==========
+with st.expander("Session History", expanded=False):
+    store = get_session_store()
+    summary = store.region_summary(st.session_state.username)
+    if not summary:
+        st.info("No reps recorded yet.")
+    else:
+        for row in summary:
+            row["last_rep"] = time.strftime("%Y-%m-%d %H:%M", time.localtime(row["last_rep"]))
+        st.dataframe(summary, use_container_width=True)
+        recent = store.history(st.session_state.username, region=spinal_region, limit=50)
+        if recent:
+            st.markdown(f"**Recent reps — {spinal_region}**")
+            st.dataframe(
+                [
+                    {
+                        "Released": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(r["released_at"])),
+                        "Rep": r["rep_index"],
+                        "Hand": r["hand"],
+                        "Hold (s)": round(r["hold_duration"], 2),
+                        "Finger": (r["finger"] or "").capitalize() or None,
+                        "Min distance": round(r["min_distance"], 4) if r["min_distance"] is not None else None,
+                    }
+                    for r in recent
+                ],
+                use_container_width=True,
+            )
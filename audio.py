@@ -0,0 +1,181 @@
+import json
+import logging
+import mmap
+import os
+import threading
+import time
+import wave
+from collections import deque
+
+try:
+    import simpleaudio as sa
+except ImportError:  # headless harnesses supply their own wave objects
+    sa = None
+
+log = logging.getLogger("neurorehab")
+AUDIO_DIR = os.path.dirname(os.path.abspath(__file__))
+PACK_PATH = os.path.join(AUDIO_DIR, "cues.pcm")     # built by generate_audio.py
+
+# Pre-generated cue files (generate_audio.py), in the same folder as app.py
+CUE_FILES = [
+    "press.wav",
+    "getready.wav",
+    "hold3sec.wav",
+    "3.wav",
+    "2.wav",
+    "1.wav",
+    "release.wav",
+    "goodjob.wav",
+    "ding.wav",
+]
+
+
+# ========== PRELOADED AUDIO BANK ==========
+class AudioBank:
+    """
+    All cues ready to play, keyed by file name. Loaded from the packed PCM
+    bank (memory-mapped, no decoding) or, without one, from loose WAVs.
+    """
+
+    def __init__(self):
+        self.waves = {}
+        self.durations = {}
+        self._mmap = None
+
+    @classmethod
+    def from_pack(cls, path=PACK_PATH):
+        if sa is None:
+            raise RuntimeError("simpleaudio is required to play cue files")
+        with open(os.path.splitext(path)[0] + ".json") as f:
+            index = json.load(f)
+        rate, channels, width = index["sample_rate"], index["channels"], index["sample_width"]
+
+        bank = cls()
+        with open(path, "rb") as f:
+            bank._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data = memoryview(bank._mmap)
+        for name, cue in index["cues"].items():
+            nbytes = cue["frames"] * channels * width
+            bank.waves[name] = sa.WaveObject(data[cue["offset"]:cue["offset"] + nbytes], channels, width, rate)
+            bank.durations[name] = cue["frames"] / float(rate)
+        return bank
+
+    @classmethod
+    def from_directory(cls, directory=AUDIO_DIR, files=CUE_FILES):
+        bank = cls()
+        for name in files:
+            bank.load(name, os.path.join(directory, name))
+        return bank
+
+    def load(self, name, path):
+        if sa is None:
+            raise RuntimeError("simpleaudio is required to play cue files")
+        with wave.open(path, "rb") as w:
+            frames = w.readframes(w.getnframes())
+            self.waves[name] = sa.WaveObject(frames, w.getnchannels(), w.getsampwidth(), w.getframerate())
+            self.durations[name] = w.getnframes() / float(w.getframerate())
+
+    def duration(self, name):
+        return self.durations.get(name, 0.0)
+
+
+# ========== SINGLE PLAYBACK WORKER ==========
+class AudioEngine:
+    """
+    One playback worker per process. Cues are played one at a time (no
+    overlap) in the order they were queued, whichever session queued them.
+    A cue's `on_start` callback gets the time.monotonic() at which playback
+    actually started, for motion-to-sound latency measurement. The worker
+    is shared by every session, so a failing cue or callback is logged and
+    never allowed to end it.
+    """
+
+    def __init__(self, bank):
+        self.bank = bank
+        self._pending = deque()          # (session_id, name, on_start)
+        self._current = None             # (session_id, play object) while a cue is playing
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._play_loop, daemon=True)
+        self._thread.start()
+
+    def session(self, session_id):
+        return AudioSession(self, session_id)
+
+    def enqueue(self, session_id, name, on_start=None):
+        if name not in self.bank.waves:
+            raise KeyError(f"Unknown audio cue: {name}")
+        with self._cond:
+            self._pending.append((session_id, name, on_start))
+            self._cond.notify()
+
+    def clear(self, session_id):
+        """Drop cues still waiting to be played for one session."""
+        with self._cond:
+            kept = [item for item in self._pending if item[0] != session_id]
+            self._pending.clear()
+            self._pending.extend(kept)
+
+    def interrupt(self, session_id):
+        """Drop one session's queued cues and cut off its cue that is playing now."""
+        with self._cond:
+            self.clear(session_id)
+            if self._current is not None and self._current[0] == session_id:
+                self._current[1].stop()
+
+    def _play_loop(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+                session_id, name, on_start = self._pending.popleft()
+            try:
+                play = self.bank.waves[name].play()
+            except Exception:
+                log.exception("cannot play audio cue %s", name)
+                continue
+            if on_start is not None:
+                try:
+                    on_start(time.monotonic())
+                except Exception:
+                    log.exception("on_start callback of audio cue %s failed", name)
+            with self._cond:
+                self._current = (session_id, play)
+            play.wait_done()
+            with self._cond:
+                self._current = None
+
+
+class AudioSession:
+    """Per-browser-session handle onto the shared AudioEngine."""
+
+    def __init__(self, engine, session_id):
+        self.engine = engine
+        self.session_id = session_id
+
+    def speak(self, name, on_start=None):
+        self.engine.enqueue(self.session_id, name, on_start)
+
+    def clear(self):
+        self.engine.clear(self.session_id)
+
+    def interrupt(self):
+        self.engine.interrupt(self.session_id)
+
+    def duration(self, name):
+        return self.engine.bank.duration(name)
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_audio_engine():
+    """Process-wide AudioEngine; created (and the cue bank mapped) on first use only."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            if os.path.exists(PACK_PATH):
+                bank = AudioBank.from_pack()
+            else:
+                bank = AudioBank.from_directory()
+            _engine = AudioEngine(bank)
+        return _engine
@@ -0,0 +1 @@
+"""Headless benchmarks. Run from the repo root, e.g. `python -m benchmarks.pipeline_bench`."""
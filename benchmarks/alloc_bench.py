@@ -0,0 +1,130 @@
+"""
+Bytes allocated per frame on the preprocessing + display path, before and
+after buffer reuse. No camera or model needed.
+
+    before: read() → cv2.flip → cv2.cvtColor → resize → cvtColor → imencode
+            (every step returns a new full-size array)
+    after : read(into pooled buffer) → mirror_to_rgb(into pooled buffer)
+            → DisplayPublisher scaled copy (pooled) → encode (scratch buffer)
+
+Each stage is measured with tracemalloc (which sees numpy/OpenCV array
+data) as the growth of the allocation high-water mark while it runs.
+
+Usage:
+    python -m benchmarks.alloc_bench
+    python -m benchmarks.alloc_bench --source synthetic:1280x720 --frames 300 --json alloc.json
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import cv2
+
+from display import DisplayPublisher
+from frame_sources import open_source
+from pipeline import FramePool, mirror_to_rgb
+
+
+class _NullElement:
+    def image(self, data):
+        pass
+
+
+def measure(stage, fn, stats):
+    """Run fn(), adding its allocated bytes and time to stats[stage]. Returns fn()'s result."""
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - t0
+    grown = tracemalloc.get_traced_memory()[1] - before
+    entry = stats.setdefault(stage, [0, 0.0])
+    entry[0] += grown
+    entry[1] += elapsed
+    return out
+
+
+def run_before(source, frames, display_width, quality):
+    stats = {}
+    for _ in range(frames):
+        ok, frame = measure("read", source.read, stats)
+        if not ok:
+            break
+        frame = measure("flip", lambda: cv2.flip(frame, 1), stats)
+        img = measure("cvtColor", lambda: cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), stats)
+        h, w = img.shape[:2]
+        small = measure("display_resize", lambda: cv2.resize(
+            img, (display_width, int(h * display_width / w)), interpolation=cv2.INTER_AREA), stats)
+        bgr = measure("display_cvtColor", lambda: cv2.cvtColor(small, cv2.COLOR_RGB2BGR), stats)
+        measure("imencode", lambda: cv2.imencode(".jpg", bgr, [cv2.IMWRITE_JPEG_QUALITY, quality]), stats)
+    return stats
+
+
+def run_after(source, frames, display_width, quality):
+    stats = {}
+    bgr_pool, rgb_pool = FramePool(), FramePool()
+    publisher = DisplayPublisher(_NullElement(), max_width=display_width, jpeg_quality=quality)
+    shape = None
+    for _ in range(frames):
+        buf = bgr_pool.acquire(shape) if shape is not None else None
+        ok, frame = measure("read", lambda: source.read(buf), stats)
+        if not ok:
+            break
+        shape = frame.shape
+        img = measure("mirror_to_rgb", lambda: mirror_to_rgb(frame, rgb_pool.acquire(frame.shape)), stats)
+        bgr_pool.release(frame)
+        # publish()'s copy + the send thread's encode, run inline here
+        small = measure("display_copy", lambda: publisher._scaled_copy(img), stats)
+        rgb_pool.release(img)
+        measure("encode", lambda: publisher.encode(small), stats)
+        publisher._pool.release(small)
+    return stats
+
+
+def report(name, stats, frames):
+    total = sum(b for b, _ in stats.values())
+    print(f"\n{name}")
+    print(f"  {'stage':<18}{'KB/frame':>12}{'ms/frame':>10}")
+    for stage, (nbytes, seconds) in stats.items():
+        print(f"  {stage:<18}{nbytes / frames / 1024:>12.1f}{seconds / frames * 1000:>10.2f}")
+    print(f"  {'total':<18}{total / frames / 1024:>12.1f}")
+    return {stage: {"bytes_per_frame": b / frames, "ms_per_frame": s / frames * 1000}
+            for stage, (b, s) in stats.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="synthetic:1280x720")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--display-width", type=int, default=640)
+    parser.add_argument("--jpeg-quality", type=int, default=70)
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    tracemalloc.start()
+    results = {}
+    for name, runner in (("before", run_before), ("after", run_after)):
+        source = open_source(args.source)
+        try:
+            # First frames warm up pools and OpenCV internals
+            runner(source, 5, args.display_width, args.jpeg_quality)
+            stats = runner(source, args.frames, args.display_width, args.jpeg_quality)
+        finally:
+            source.release()
+        results[name] = report(name, stats, args.frames)
+    tracemalloc.stop()
+
+    before = sum(s["bytes_per_frame"] for s in results["before"].values())
+    after = sum(s["bytes_per_frame"] for s in results["after"].values())
+    print(f"\nallocated per frame: {before / 1024:.0f} KB → {after / 1024:.0f} KB")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"source": args.source, "frames": args.frames, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
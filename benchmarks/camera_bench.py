@@ -0,0 +1,172 @@
+"""
+Camera self-benchmark: which capture mode gives this station's webcam the
+lowest latency?
+
+For every mode the camera accepts (frame_sources.probe_modes, or --modes),
+opens it the way the app does (native backend, one-frame buffer, draining
+when the driver ignores that) and measures:
+
+  - delivered FPS and read() time over --seconds of back-to-back reads
+  - frame age: capture → read() returned, from the driver's buffer
+    timestamps (V4L2 only; blank elsewhere)
+  - stale frames: frames still queued after a 300 ms stall, i.e. how old
+    the first frame is after the app was busy
+
+The recommended mode is the lowest-latency one that delivers at least 90%
+of its nominal FPS at --min-width or more; --save stores it in camera.json,
+which CameraSource uses for this camera from then on.
+
+Usage:
+    python -m benchmarks.camera_bench
+    python -m benchmarks.camera_bench --camera 1 --seconds 5 --save
+    python -m benchmarks.camera_bench --modes 640x480@30/MJPG 640x480@30/YUYV --json camera.json
+"""
+import argparse
+import json
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from frame_sources import CameraMode, CameraSource, probe_modes, save_camera_mode
+
+STALL = 0.3
+
+
+def frame_age_ms(cap):
+    """Capture → now from the V4L2 buffer timestamp (CLOCK_MONOTONIC), or None."""
+    stamp = cap.get(cv2.CAP_PROP_POS_MSEC)
+    if stamp <= 0 or not hasattr(time, "CLOCK_MONOTONIC"):
+        return None
+    age = time.clock_gettime(time.CLOCK_MONOTONIC) * 1000 - stamp
+    return age if 0 <= age < 2000 else None
+
+
+def stale_frames(source):
+    """Frames the driver hands out instantly after the reader stalled."""
+    time.sleep(STALL)
+    fresh = 0.5 / source.fps
+    stale = 0
+    for _ in range(10):
+        t0 = time.perf_counter()
+        if not source.cap.grab() or time.perf_counter() - t0 > fresh:
+            break
+        stale += 1
+    return stale
+
+
+def measure(index, mode, seconds, warmup=15):
+    source = CameraSource(index, mode)
+    try:
+        got = source.negotiated
+        frame = None
+        for _ in range(warmup):
+            ok, frame = source.read(frame)
+            if not ok:
+                return {"mode": str(mode), "negotiated": str(got), "error": "no frames"}
+
+        reads, ages = [], []
+        started = time.perf_counter()
+        while time.perf_counter() - started < seconds:
+            t0 = time.perf_counter()
+            ok, frame = source.read(frame)
+            if not ok:
+                break
+            reads.append(time.perf_counter() - t0)
+            age = frame_age_ms(source.cap)
+            if age is not None:
+                ages.append(age)
+        elapsed = time.perf_counter() - started
+
+        # A draining source skips queued frames itself
+        stale = 0 if source.drain else stale_frames(source)
+        read_p50, read_p95 = np.percentile(np.array(reads) * 1000, [50, 95]) if reads else (0.0, 0.0)
+        return {
+            "mode": str(mode),
+            "negotiated": str(got),
+            "negotiated_mode": got,
+            "buffer": source.buffer_size,
+            "draining": source.drain,
+            "fps": len(reads) / elapsed if elapsed > 0 else 0.0,
+            "read_p50_ms": float(read_p50),
+            "read_p95_ms": float(read_p95),
+            "age_p50_ms": float(np.percentile(ages, 50)) if ages else None,
+            "age_p95_ms": float(np.percentile(ages, 95)) if ages else None,
+            "stale_frames": stale,
+        }
+    finally:
+        source.release()
+
+
+def latency_ms(result):
+    """Best available latency figure: driver frame age, else the queue + half a frame."""
+    if result.get("age_p50_ms") is not None:
+        return result["age_p50_ms"]
+    frame_ms = 1000.0 / max(result["fps"], 1e-3)
+    return (result["stale_frames"] + 0.5) * frame_ms
+
+
+def recommend(results, min_width):
+    usable = [
+        r for r in results
+        if "error" not in r
+        and r["negotiated_mode"].width >= min_width
+        and r["fps"] >= 0.9 * r["negotiated_mode"].fps
+    ]
+    return min(usable, key=latency_ms, default=None)
+
+
+def print_report(results, best):
+    print(f"{'mode':<28}{'FPS':>7}{'read p50':>10}{'age p50':>9}{'stale':>7}{'latency':>9}  buffering")
+    for r in results:
+        if "error" in r:
+            print(f"{r['negotiated']:<28}  {r['error']}")
+            continue
+        age = f"{r['age_p50_ms']:.1f}" if r["age_p50_ms"] is not None else "-"
+        buffering = "drain" if r["draining"] else f"buffer {r['buffer']}"
+        mark = "  ← best" if r is best else ""
+        if r["negotiated"] != r["mode"]:
+            mark += f"  (asked for {r['mode']})"
+        print(f"{r['negotiated']:<28}{r['fps']:>7.1f}{r['read_p50_ms']:>10.1f}{age:>9}"
+              f"{r['stale_frames']:>7}{latency_ms(r):>9.1f}  {buffering}{mark}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--camera", type=int, default=0)
+    parser.add_argument("--modes", nargs="*", help="modes to test, e.g. 1280x720@30/MJPG (default: probe)")
+    parser.add_argument("--seconds", type=float, default=3.0, help="measurement time per mode")
+    parser.add_argument("--min-width", type=int, default=640, help="smallest width to recommend")
+    parser.add_argument("--save", action="store_true", help="store the recommended mode in camera.json")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    modes = [CameraMode.parse(m) for m in args.modes] if args.modes else probe_modes(args.camera)
+    if not modes:
+        print(f"camera {args.camera}: no usable modes (is it connected?)")
+        return 1
+    print(f"camera {args.camera}: testing {len(modes)} modes, {args.seconds:g} s each\n")
+
+    results = [measure(args.camera, mode, args.seconds) for mode in modes]
+    best = recommend(results, args.min_width)
+    print_report(results, best)
+
+    if best is None:
+        print("\nno mode delivers its nominal FPS at the minimum width")
+    else:
+        print(f"\nrecommended: {best['negotiated']} (~{latency_ms(best):.0f} ms capture latency)")
+        if args.save:
+            save_camera_mode(args.camera, best["negotiated_mode"])
+            print("saved to camera.json")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            rows = [{k: v for k, v in r.items() if k != "negotiated_mode"} for r in results]
+            json.dump({"camera": args.camera, "results": rows,
+                       "recommended": best["negotiated"] if best else None}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Synthetic press-to-cue latency harness: no camera, no patient, no speakers.
+
+A scripted fingertip trace (contact, hold, lift-off) is sampled at the
+camera frame rate, delayed by a simulated inference time and fed through
+the real RepCounter → CameraSession.handle_event → CueScheduler →
+AudioEngine path. The audio bank uses silent stand-ins with the real cue
+durations and an optional output start delay, so the measured
+motion-to-sound latencies are exactly what the app would report.
+
+Usage:
+    python -m benchmarks.latency_bench
+    python -m benchmarks.latency_bench --reps 5 --inference-ms 60 --audio-start-ms 30 --budget-ms 400
+
+Exits with status 1 when any cue misses the budget or a motion produced
+no cue, so it can run unattended in CI.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import wave
+
+from audio import AUDIO_DIR, CUE_FILES, AudioBank, AudioEngine
+from camera_session import CameraSession
+from latency import PRESS_TO_HOLD, RELEASE_TO_DING
+from scheduler import CueScheduler
+
+CUES = {
+    "ready": "getready.wav",
+    "press": "press.wav",
+    "hold": "hold3sec.wav",
+    "numbers": ["3.wav", "2.wav", "1.wav"],
+    "release": "release.wav",
+    "good": "goodjob.wav",
+    "ding": "ding.wav",
+}
+
+
+class SilentWave:
+    """Plays nothing for the clip's real duration, after `start_delay` of output latency."""
+
+    def __init__(self, duration, start_delay):
+        self.duration = duration
+        self.start_delay = start_delay
+
+    def play(self):
+        time.sleep(self.start_delay)
+        return _SilentPlay(self.duration)
+
+
+class _SilentPlay:
+    def __init__(self, duration):
+        self.duration = duration
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def wait_done(self):
+        self._stopped.wait(self.duration)
+
+
+def silent_bank(start_delay):
+    bank = AudioBank()
+    for name in CUE_FILES:
+        with wave.open(os.path.join(AUDIO_DIR, name), "rb") as w:
+            duration = w.getnframes() / float(w.getframerate())
+        bank.waves[name] = SilentWave(duration, start_delay)
+        bank.durations[name] = duration
+    return bank
+
+
+def fingertip_trace(reps, hold_time, gap):
+    """[(contact_time, liftoff_time), ...] relative to the start, plus total length."""
+    events = []
+    t = gap
+    for _ in range(reps):
+        events.append((t, t + hold_time + 0.5))
+        t += hold_time + 0.5 + gap
+    return events, t
+
+
+def run(args):
+    engine = AudioEngine(silent_bank(args.audio_start_ms / 1000))
+    session = CameraSession(
+        pipeline=None,
+        display=None,
+        audio=engine.session("latency-bench"),
+        scheduler=CueScheduler(),
+        cues=CUES,
+    )
+    session.configure(
+        region="Lumbar (L1–L5)",
+        target_reps=args.reps,
+        hand_choice="Right Hand",
+        press_th=0.028,
+        release_th=0.060,
+        hold_time=args.hold_time,
+        stability_time=args.stability_time,
+        latency_budget=args.budget_ms / 1000,
+    )
+
+    contacts, length = fingertip_trace(args.reps, args.hold_time, args.gap)
+    frame_interval = 1.0 / args.fps
+    inference = args.inference_ms / 1000
+    start = time.monotonic()
+    frame = 0
+    while True:
+        captured = start + frame * frame_interval
+        offset = captured - start
+        if offset > length:
+            break
+        touching = any(c <= offset < r for c, r in contacts)
+        dist = 0.01 if touching else 0.10
+
+        # The frame's result is only available after inference
+        time.sleep(max(0.0, captured + inference - time.monotonic()))
+        event = session.reps.update(dist, captured)
+        session.handle_event(event, captured)
+        frame += 1
+
+    time.sleep(3.0)          # let the last cues play
+    return session
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reps", type=int, default=3)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--inference-ms", type=float, default=40.0, help="simulated hands.process latency")
+    parser.add_argument("--audio-start-ms", type=float, default=20.0, help="simulated output start latency")
+    parser.add_argument("--hold-time", type=float, default=2.5)
+    parser.add_argument("--stability-time", type=float, default=0.25)
+    parser.add_argument("--gap", type=float, default=3.0,
+                        help="seconds between reps (long enough for the previous cues to finish)")
+    parser.add_argument("--budget-ms", type=float, default=500.0)
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    session = run(args)
+    summary = session.latency.summary()
+
+    print(f"{'path':<18}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'over':>6}")
+    for path in (PRESS_TO_HOLD, RELEASE_TO_DING):
+        row = summary.get(path)
+        if row is None:
+            print(f"{path:<18}{0:>7}")
+        else:
+            print(f"{path:<18}{row['count']:>7}{row['p50_ms']:>10.0f}{row['p95_ms']:>10.0f}"
+                  f"{row['max_ms']:>10.0f}{row['over_budget']:>6}")
+
+    missing = [p for p in (PRESS_TO_HOLD, RELEASE_TO_DING) if summary.get(p, {}).get("count", 0) < args.reps]
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "results": summary, "missing": missing}, f, indent=2)
+
+    if missing:
+        print(f"FAIL: no cue measured for some motions on {', '.join(missing)}")
+        return 1
+    if session.latency.violations:
+        print(f"FAIL: {session.latency.violations} cue(s) over the {args.budget_ms:.0f} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
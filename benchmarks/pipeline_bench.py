@@ -0,0 +1,192 @@
+"""
+Headless benchmark of the per-frame camera path, without Streamlit:
+
+    read → preprocess (mirror + BGR→RGB) → hands.process → landmark filter
+         → draw_landmarks (overlay renderer) → reflex point → rep detection
+
+Usage:
+    python -m benchmarks.pipeline_bench --source session.mp4
+    python -m benchmarks.pipeline_bench --source synthetic:1280x720 --frames 600
+    python -m benchmarks.pipeline_bench --source frames/ --json out.json --max-p95-ms 45
+
+Exits with status 1 when --max-p95-ms is given and the p95 total frame
+time exceeds it, so it can gate a deployment.
+"""
+import argparse
+import json
+import sys
+import time
+
+import mediapipe as mp
+import numpy as np
+
+from filters import PRESSING, TARGET, HandPairFilter
+from frame_sources import open_source
+from overlay import QUALITY_LEVELS, OverlayRenderer
+from pipeline import mirror_to_rgb
+from reflex_points import region_point
+from rep_engine import FINGERTIPS, ContactEngine, RepCounter, assign_hands
+from roi import ROITracker
+
+STAGES = ["read", "preprocess", "hands.process", "filter", "draw_landmarks", "reflex_point", "reps"]
+
+REGIONS = [
+    "Cervical (C1–C7)",
+    "Thoracic (T1–T12)",
+    "Lumbar (L1–L5)",
+    "Sacrum",
+    "Coccyx",
+]
+
+
+def percentiles_ms(samples):
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0}
+    arr = np.asarray(samples) * 1000.0
+    p50, p95, p99 = np.percentile(arr, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99), "mean": float(arr.mean())}
+
+
+def run(args):
+    source = open_source(args.source, realtime=args.realtime)
+    mp_hands = mp.solutions.hands
+    hands = mp_hands.Hands(
+        max_num_hands=2,
+        min_detection_confidence=args.detection_confidence,
+        min_tracking_confidence=args.tracking_confidence,
+        model_complexity=args.model_complexity,
+    )
+    if args.roi:
+        hands = ROITracker(hands)
+    overlay = OverlayRenderer(args.overlay)
+    reps = RepCounter(
+        press_th=args.press_th,
+        release_th=args.release_th,
+        stability_time=args.stability_time,
+        hold_time=args.hold_time,
+        smooth=1,
+    )
+    hand_filter = HandPairFilter()
+    contact = ContactEngine(args.fingers)
+
+    timings = {name: [] for name in STAGES}
+    totals = []
+    frames = 0
+    two_hand_frames = 0
+
+    frame = img = None          # reused across frames, as in HandPipeline
+    started = time.perf_counter()
+    try:
+        while args.frames is None or frames < args.frames:
+            t0 = time.perf_counter()
+            ok, frame = source.read(frame)
+            t1 = time.perf_counter()
+            if not ok:
+                break
+            timings["read"].append(t1 - t0)
+
+            if img is None or img.shape != frame.shape:
+                img = np.empty_like(frame)
+            mirror_to_rgb(frame, img)
+            t2 = time.perf_counter()
+            results = hands.process(img)
+            t3 = time.perf_counter()
+            timings["preprocess"].append(t2 - t1)
+            timings["hands.process"].append(t3 - t2)
+
+            target_hand, pressing_hand = assign_hands(results.multi_hand_landmarks, args.hand)
+            if target_hand is not None:
+                two_hand_frames += 1
+                t5 = time.perf_counter()
+                now = frames / source.fps if args.media_time else time.monotonic()
+                h_img, w_img, _ = img.shape
+                filtered = hand_filter.update(target_hand, pressing_hand, now)
+                target_px = filtered[TARGET] * (w_img, h_img)
+                predicted = hand_filter.predict(0.0 if args.media_time else time.monotonic() - now)
+                t6 = time.perf_counter()
+                overlay.draw_hands(img, filtered)
+                t7 = time.perf_counter()
+                point = region_point(target_px, args.region, reps.count)
+                overlay.draw_reflex(img, point, now)
+                t8 = time.perf_counter()
+                if point is not None:
+                    dist = contact.measure(point, predicted[PRESSING], img.shape)
+                    reps.update(dist, now)
+                t9 = time.perf_counter()
+                timings["filter"].append(t6 - t5)
+                timings["draw_landmarks"].append(t7 - t6)
+                timings["reflex_point"].append(t8 - t7)
+                timings["reps"].append(t9 - t8)
+
+            totals.append(time.perf_counter() - t0)
+            frames += 1
+    finally:
+        elapsed = time.perf_counter() - started
+        hands.close()
+        source.release()
+
+    return {
+        "source": args.source,
+        "region": args.region,
+        "frames": frames,
+        "two_hand_frames": two_hand_frames,
+        "elapsed_s": elapsed,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "reps": reps.count,
+        "full_frame_searches": hands.full_frame_searches if args.roi else frames,
+        "total_ms": percentiles_ms(totals),
+        "stages_ms": {name: percentiles_ms(samples) for name, samples in timings.items()},
+    }
+
+
+def print_report(report):
+    print(f"source: {report['source']}   region: {report['region']}")
+    print(
+        f"frames: {report['frames']} ({report['two_hand_frames']} with both hands)   "
+        f"FPS: {report['fps']:.1f}   reps: {report['reps']}"
+    )
+    print(f"{'stage':<16}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = list(report["stages_ms"].items()) + [("total", report["total_ms"])]
+    for name, stats in rows:
+        print(f"{name:<16}{stats['p50']:>10.2f}{stats['p95']:>10.2f}{stats['p99']:>10.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="synthetic", help="camera[:N], synthetic[:WxH], video file or image directory")
+    parser.add_argument("--frames", type=int, default=None, help="stop after this many frames")
+    parser.add_argument("--realtime", action="store_true", help="pace file sources at their native FPS")
+    parser.add_argument("--media-time", action="store_true",
+                        help="use frame index / source FPS as the rep clock (deterministic rep counts)")
+    parser.add_argument("--region", default=REGIONS[0], choices=REGIONS)
+    parser.add_argument("--hand", default="Right Hand", choices=["Right Hand", "Left Hand"])
+    parser.add_argument("--press-th", type=float, default=0.028)
+    parser.add_argument("--release-th", type=float, default=0.060)
+    parser.add_argument("--fingers", nargs="+", choices=list(FINGERTIPS),
+                        help="pressing fingertips to track (default: contact.json or thumb index middle)")
+    parser.add_argument("--stability-time", type=float, default=0.25)
+    parser.add_argument("--hold-time", type=float, default=2.5)
+    parser.add_argument("--detection-confidence", type=float, default=0.88)
+    parser.add_argument("--tracking-confidence", type=float, default=0.88)
+    parser.add_argument("--model-complexity", type=int, default=1, choices=[0, 1])
+    parser.add_argument("--overlay", default=QUALITY_LEVELS[0], choices=QUALITY_LEVELS,
+                        help="overlay quality level")
+    parser.add_argument("--roi", action="store_true", help="run inference on a crop around the tracked hands")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--max-p95-ms", type=float, help="fail if p95 total frame time exceeds this")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.max_p95_ms is not None and report["total_ms"]["p95"] > args.max_p95_ms:
+        print(f"FAIL: p95 {report['total_ms']['p95']:.2f} ms > budget {args.max_p95_ms:.2f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Landmark backends side by side on the same input: the legacy synchronous
+mp.solutions Hands vs the MediaPipe Tasks HandLandmarker in LIVE_STREAM
+mode (landmarks.py).
+
+Each backend runs inside the real HandPipeline on the same recording,
+paced at its native FPS like a camera, and the benchmark reports:
+
+  - throughput: landmark results delivered per second
+  - latency: frame capture → result available to the render loop (p50/p95)
+  - inference time per frame (the pipeline's "process" stage)
+  - frames dropped and frames with both hands found
+
+Usage:
+    python -m benchmarks.provider_bench --source session.mp4
+    python -m benchmarks.provider_bench --source synthetic:1280x720 --frames 300 --backends tasks
+    python -m benchmarks.provider_bench --source session.mp4 --model hand_landmarker.task --json backends.json
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from frame_sources import open_source
+from landmarks import BACKENDS, HAND_LANDMARKER_MODEL, TASKS, create_provider
+from metrics import StageMetrics, summarize
+from pipeline import HandPipeline
+
+
+def run_backend(backend, args):
+    params = dict(model_complexity=args.model_complexity)
+    if backend == TASKS:
+        params["model_path"] = args.model
+    provider = create_provider(backend, **params)
+    options = {"frames": args.frames} if args.source.startswith("synthetic") else {}
+    source = open_source(args.source, realtime=True, **options)
+    metrics = StageMetrics(backend)
+    pipeline = HandPipeline(source, provider, metrics=metrics, max_in_flight=args.max_in_flight)
+
+    latencies = []
+    both_hands = 0
+    started = last = time.perf_counter()
+    pipeline.start()
+    try:
+        for result in pipeline.results():
+            last = time.perf_counter()
+            latencies.append(time.monotonic() - result.timestamp)
+            if result.hands and len(result.hands) == 2:
+                both_hands += 1
+            pipeline.release(result)
+            if args.frames is not None and result.frame_id >= args.frames - 1:
+                break
+    finally:
+        pipeline.stop()
+        source.release()
+    elapsed = last - started
+
+    lat = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    process = summarize(metrics.snapshot())["stages"].get("process", {})
+    return {
+        "backend": backend,
+        "results": len(latencies),
+        "results_per_s": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "latency_p50_ms": float(np.percentile(lat, 50)),
+        "latency_p95_ms": float(np.percentile(lat, 95)),
+        "process_p50_ms": process.get("p50_ms", 0.0),
+        "process_p95_ms": process.get("p95_ms", 0.0),
+        "dropped": pipeline.dropped_frames,
+        "both_hands": both_hands,
+    }
+
+
+def print_report(rows):
+    print(f"{'backend':<11}{'results/s':>10}{'lat p50':>9}{'lat p95':>9}{'infer p50':>11}"
+          f"{'dropped':>9}{'2 hands':>9}")
+    for r in rows:
+        print(f"{r['backend']:<11}{r['results_per_s']:>10.1f}{r['latency_p50_ms']:>9.1f}{r['latency_p95_ms']:>9.1f}"
+              f"{r['process_p50_ms']:>11.1f}{r['dropped']:>9}{r['both_hands']:>9}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="synthetic:640x480", help="video file, image directory or synthetic[:WxH]")
+    parser.add_argument("--frames", type=int, default=None, help="stop after this many frames")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--model", default=HAND_LANDMARKER_MODEL, help="HandLandmarker .task file")
+    parser.add_argument("--model-complexity", type=int, default=1, choices=[0, 1], help="legacy backend only")
+    parser.add_argument("--max-in-flight", type=int, default=2, help="async frames awaiting results")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+    if args.source.startswith("synthetic") and args.frames is None:
+        args.frames = 300
+
+    rows = [run_backend(backend, args) for backend in args.backends]
+    print_report(rows)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"source": args.source, "results": rows}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+What session recording costs the camera loop (recorder.SessionRecorder).
+
+Plays frames through a stand-in render loop (mirror + BGR→RGB, overlay
+drawing) at the camera's pace, once without recording and once per
+recording mode, and reports:
+
+  - record(): time the camera loop spends per recorded frame (p50/p95/max)
+  - loop: total per-frame time with and without recording
+  - frames written, skipped by the recording FPS and dropped by the encoder
+  - encoder time per frame on the writer thread
+
+--encoder-delay adds a sleep to every encoded frame to simulate a slow
+disk or CPU. The encoder then falls behind and must drop frames, and the
+loop cost must stay the same.
+
+Usage:
+    python -m benchmarks.recorder_bench
+    python -m benchmarks.recorder_bench --source synthetic:1280x720 --frames 600 --record-fps 30
+    python -m benchmarks.recorder_bench --source session.mp4 --encoder-delay 0.1 --max-p95-ms 1.5
+
+Exits with status 1 when --max-p95-ms is given and the p95 record() time
+exceeds it.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from frame_sources import open_source
+from metrics import StageMetrics, summarize
+from overlay import OverlayRenderer
+from pipeline import mirror_to_rgb
+from recorder import SessionRecorder
+
+MODES = ("off", "annotated", "raw")
+
+
+def percentiles_ms(samples):
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+    arr = np.array(samples) * 1000
+    return {"p50": float(np.percentile(arr, 50)), "p95": float(np.percentile(arr, 95)), "max": float(arr.max())}
+
+
+def run_mode(mode, args, out_dir):
+    options = {"frames": args.frames} if args.source.startswith("synthetic") else {}
+    source = open_source(args.source, realtime=True, **options)
+    metrics = StageMetrics(f"recorder-{mode}")
+    recorder = None
+    if mode != "off":
+        recorder = SessionRecorder(os.path.join(out_dir, mode), fps=args.record_fps,
+                                   annotated=mode == "annotated", metrics=metrics)
+        if args.encoder_delay:
+            write = recorder._write
+
+            def slow_write(frame, row):
+                time.sleep(args.encoder_delay)
+                write(frame, row)
+            recorder._write = slow_write
+        recorder.start()
+
+    rng = np.random.default_rng(0)
+    hands = (0.3 + 0.4 * rng.random((2, 21, 2))).astype(np.float64)
+    overlay = OverlayRenderer()
+    record_times, loop_times = [], []
+    frame = img = None
+    frames = 0
+    try:
+        while args.frames is None or frames < args.frames:
+            ok, frame = source.read(frame)
+            if not ok:
+                break
+            t0 = time.perf_counter()
+            now = time.monotonic()
+            if img is None or img.shape != frame.shape:
+                img = np.empty_like(frame)
+            mirror_to_rgb(frame, img)
+
+            raw, spent = None, 0.0
+            if recorder is not None and not recorder.annotated and recorder.due(now):
+                t1 = time.perf_counter()
+                raw = recorder.snapshot(img)
+                spent = time.perf_counter() - t1
+            hands += rng.normal(0, 0.002, hands.shape)
+            overlay.draw_hands(img, hands)
+            point = (int(img.shape[1] * 0.5), int(img.shape[0] * 0.5))
+            overlay.draw_reflex(img, point, now)
+            if recorder is not None:
+                t1 = time.perf_counter()
+                if recorder.record(img, now, frames, hands, point, 0.05, "waiting_press", 0, snapshot=raw):
+                    record_times.append(spent + time.perf_counter() - t1)
+            loop_times.append(time.perf_counter() - t0)
+            frames += 1
+    finally:
+        source.release()
+        t_stop = time.perf_counter()
+        if recorder is not None:
+            recorder.stop(timeout=60.0)
+        stop_s = time.perf_counter() - t_stop
+
+    encode = summarize(metrics.snapshot())["stages"].get("video_encode", {})
+    size = os.path.getsize(recorder.video_path) if recorder is not None and os.path.exists(recorder.video_path) else 0
+    return {
+        "mode": mode,
+        "frames": frames,
+        "record_ms": percentiles_ms(record_times),
+        "loop_ms": percentiles_ms(loop_times),
+        "written": recorder.written if recorder else 0,
+        "skipped": recorder.skipped if recorder else 0,
+        "dropped": recorder.dropped if recorder else 0,
+        "encode_p50_ms": encode.get("p50_ms", 0.0),
+        "stop_s": stop_s,
+        "video_kb": size / 1024,
+    }
+
+
+def print_report(rows):
+    print(f"{'mode':<11}{'record p50':>11}{'p95':>7}{'max':>7}{'loop p50':>10}{'p95':>7}"
+          f"{'written':>9}{'skipped':>9}{'dropped':>9}{'encode':>8}{'KB':>8}")
+    for r in rows:
+        rec, loop = r["record_ms"], r["loop_ms"]
+        print(f"{r['mode']:<11}{rec['p50']:>11.3f}{rec['p95']:>7.3f}{rec['max']:>7.2f}{loop['p50']:>10.2f}"
+              f"{loop['p95']:>7.2f}{r['written']:>9}{r['skipped']:>9}{r['dropped']:>9}"
+              f"{r['encode_p50_ms']:>8.2f}{r['video_kb']:>8.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="synthetic:640x480", help="video file, image directory or synthetic[:WxH]")
+    parser.add_argument("--frames", type=int, default=None, help="stop after this many frames")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    parser.add_argument("--record-fps", type=float, default=15.0)
+    parser.add_argument("--encoder-delay", type=float, default=0.0, help="extra seconds per encoded frame")
+    parser.add_argument("--out", help="keep the recordings in this directory (default: temporary)")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--max-p95-ms", type=float, help="fail if p95 record() time exceeds this")
+    args = parser.parse_args(argv)
+    if args.source.startswith("synthetic") and args.frames is None:
+        args.frames = 300
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = args.out or tmp
+        os.makedirs(out_dir, exist_ok=True)
+        rows = [run_mode(mode, args, out_dir) for mode in args.modes]
+    print_report(rows)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"source": args.source, "results": rows}, f, indent=2)
+
+    worst = max((r["record_ms"]["p95"] for r in rows if r["mode"] != "off"), default=0.0)
+    if args.max_p95_ms is not None and worst > args.max_p95_ms:
+        print(f"FAIL: record() p95 {worst:.3f} ms > budget {args.max_p95_ms:.3f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
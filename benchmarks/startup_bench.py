@@ -0,0 +1,122 @@
+"""
+Time to first frame: cold start vs the cached / pre-warmed path.
+
+Measures the two things that happen when "Start Camera" is pressed:
+  - hand model: building mp.solutions.hands.Hands + its first inference,
+    cold vs leased from the warmed pool in models.py
+  - camera: opening the device + reading the first frame, cold vs handed
+    over by frame_sources.take_camera() after prewarm_camera()
+
+Usage:
+    python -m benchmarks.startup_bench
+    python -m benchmarks.startup_bench --source synthetic --runs 3 --json startup.json
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+import cv2
+import mediapipe as mp
+
+import models
+from frame_sources import open_source, prewarm_camera, take_camera
+
+
+def first_inference(hands, frame):
+    rgb = cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
+    hands.process(rgb)
+
+
+def model_cold(frame, params):
+    t0 = time.perf_counter()
+    hands = mp.solutions.hands.Hands(**params)
+    first_inference(hands, frame)
+    elapsed = time.perf_counter() - t0
+    hands.close()
+    return elapsed
+
+
+def model_cached(frame, params):
+    models.warm_hands(**params)
+    t0 = time.perf_counter()
+    hands = models.acquire_hands(**params)
+    first_inference(hands, frame)
+    elapsed = time.perf_counter() - t0
+    models.release_hands(hands)
+    return elapsed
+
+
+def camera_cold(index):
+    t0 = time.perf_counter()
+    cap = open_source(f"camera:{index}")
+    ok, _ = cap.read()
+    elapsed = time.perf_counter() - t0
+    cap.release()
+    return elapsed if ok else None
+
+
+def camera_prewarmed(index, settle):
+    prewarm_camera(index)
+    time.sleep(settle)              # patient choosing condition / reps
+    t0 = time.perf_counter()
+    cap = take_camera(index)
+    ok, _ = cap.read()
+    elapsed = time.perf_counter() - t0
+    cap.release()
+    return elapsed if ok else None
+
+
+def summarize(samples):
+    samples = [s for s in samples if s is not None]
+    if not samples:
+        return None
+    return {"median_ms": statistics.median(samples) * 1000, "max_ms": max(samples) * 1000}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="camera:0",
+                        help="camera:N to include camera timings; any other spec only times the model")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--settle", type=float, default=2.0,
+                        help="seconds between prewarm_camera() and take_camera()")
+    parser.add_argument("--model-complexity", type=int, default=1, choices=[0, 1])
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    params = dict(models.DEFAULT_HANDS_PARAMS, model_complexity=args.model_complexity)
+
+    source = open_source(args.source)
+    ok, frame = source.read()
+    source.release()
+    if not ok:
+        print(f"could not read a frame from {args.source}", file=sys.stderr)
+        return 1
+
+    results = {
+        "model_cold": summarize([model_cold(frame, params) for _ in range(args.runs)]),
+        "model_cached": summarize([model_cached(frame, params) for _ in range(args.runs)]),
+    }
+    spec = args.source
+    if spec.isdigit() or spec == "camera" or spec.startswith("camera:"):
+        index = int(spec.rpartition(":")[2] or 0)
+        results["camera_cold"] = summarize([camera_cold(index) for _ in range(args.runs)])
+        results["camera_prewarmed"] = summarize([camera_prewarmed(index, args.settle) for _ in range(args.runs)])
+
+    print(f"{'step':<18}{'median ms':>12}{'max ms':>10}")
+    for name, row in results.items():
+        if row is None:
+            print(f"{name:<18}{'n/a':>12}{'n/a':>10}")
+        else:
+            print(f"{name:<18}{row['median_ms']:>12.1f}{row['max_ms']:>10.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"source": args.source, "runs": args.runs, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
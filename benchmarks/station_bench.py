@@ -0,0 +1,86 @@
+"""
+FPS per camera station as more stations are added to one machine.
+
+Each station runs capture + MediaPipe inference in its own worker process
+(stations.StationManager). For N = 1 .. --max-stations the benchmark
+starts N stations on the same input, lets them warm up and reports the
+frames each one processed per second.
+
+Usage:
+    python -m benchmarks.station_bench --max-stations 4
+    python -m benchmarks.station_bench --source session.mp4 --seconds 20 --json stations.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from stations import StationManager
+
+
+def measure(manager, count, args):
+    # Sources must not run out during the measurement
+    if args.source.startswith("synthetic"):
+        source_options = {"frames": None}
+    else:
+        source_options = {"loop": True}
+    stations = [
+        manager.start_station(
+            station_id=i,
+            source=args.source,
+            source_options=source_options,
+            width=args.width,
+            height=args.height,
+            model_complexity=args.model_complexity,
+        )
+        for i in range(count)
+    ]
+    try:
+        # Wait until every station produced its first frame (model load), then warm up
+        deadline = time.monotonic() + 60
+        while any(s.frames == 0 for s in stations) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        time.sleep(args.warmup)
+
+        start_frames = [s.frames for s in stations]
+        t0 = time.monotonic()
+        time.sleep(args.seconds)
+        elapsed = time.monotonic() - t0
+        fps = [(s.frames - f0) / elapsed for s, f0 in zip(stations, start_frames)]
+    finally:
+        manager.stop_all()
+    return fps
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="synthetic:640x480",
+                        help="frame source for every station (synthetic[:WxH], video file or image directory; files loop)")
+    parser.add_argument("--max-stations", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--seconds", type=float, default=10.0, help="measurement window per step")
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--model-complexity", type=int, default=1, choices=[0, 1])
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    manager = StationManager()
+    rows = []
+    print(f"cpu cores: {os.cpu_count()}   source: {args.source}")
+    print(f"{'stations':>8}{'mean FPS':>12}{'min FPS':>10}{'total FPS':>12}")
+    for count in range(1, args.max_stations + 1):
+        fps = measure(manager, count, args)
+        row = {"stations": count, "fps": fps, "mean": sum(fps) / count, "min": min(fps), "total": sum(fps)}
+        rows.append(row)
+        print(f"{count:>8}{row['mean']:>12.1f}{row['min']:>10.1f}{row['total']:>12.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"cpu_count": os.cpu_count(), "source": args.source, "results": rows}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,452 @@
+import logging
+import threading
+import time
+import uuid
+
+from filters import PRESSING, TARGET, HandPairFilter
+from governor import LADDER, QualityGovernor
+from latency import PRESS_TO_HOLD, RELEASE_TO_DING, LatencyTracker
+from metrics import NULL_METRICS, drop_metrics, summarize
+from overlay import QUALITY_FULL, QUALITY_LEVELS, OverlayRenderer
+from progress_ui import progress_circle_png
+from reflex_points import region_point
+from recorder import SessionRecorder, recording_path
+from rep_engine import ContactEngine, RepCounter, assign_hands, load_contact_config
+from scheduler import countdown_plan
+
+try:
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except ImportError:  # headless use without Streamlit
+    Runtime = add_script_run_ctx = get_script_run_ctx = None
+
+log = logging.getLogger("neurorehab")
+
+
+# ========== BACKGROUND CAMERA SESSION ==========
+class CameraSession:
+    """
+    A running therapy session, decoupled from the Streamlit script.
+
+    The camera loop runs on its own thread and lives in st.session_state,
+    so a widget change only reruns the (cheap) settings UI: the script
+    calls configure() with the new values and bind() with the freshly
+    created placeholders, and the loop picks both up on its next frame.
+    Pipeline, model and camera are never rebuilt for a settings change.
+
+    `cues` maps ready/press/hold/numbers/release/good/ding to audio files.
+    `on_close` releases whatever the pipeline was built from. With a
+    `store` (session_store.SessionStore) every rep is recorded for `username`.
+    Render-loop stage latencies go to `metrics` (shared with the pipeline
+    and display publisher) and are shown on the HUD placeholder, if bound.
+    With auto quality a QualityGovernor steps pipeline, model (through
+    `model_switcher(pipeline, model_complexity)`) and overlay down or up to
+    hold the target FPS. With recording on, a SessionRecorder writes the
+    frames and a landmark sidecar to disk from its own thread.
+    """
+
+    HUD_INTERVAL = 1.0
+
+    def __init__(self, pipeline, display, audio, scheduler, cues, pipeline_key=None,
+                 on_close=None, clicked_at=None, store=None, username=None, metrics=None,
+                 model_switcher=None):
+        self.pipeline = pipeline
+        self.display = display
+        self.audio = audio
+        self.scheduler = scheduler
+        self.cues = cues
+        self.pipeline_key = pipeline_key
+        self.on_close = on_close
+        self.clicked_at = clicked_at
+        self.store = store
+        self.username = username
+        self.session_id = uuid.uuid4().hex
+        self.metrics = metrics or NULL_METRICS
+        self.latency = LatencyTracker(metrics=self.metrics, on_violation=self._latency_violation)
+        self.model_switcher = model_switcher
+        self.governor = None
+        self.recorder = None
+
+        self.region = None
+        self.target_reps = 1
+        self.hand_choice = "Right Hand"
+        self.reps = RepCounter(smooth=1)    # smoothing is done on the landmarks by hand_filter
+        self.hand_filter = HandPairFilter()
+        self.contact = ContactEngine()
+        self._hold_finger = None        # finger in contact when the countdown started
+        self.overlay = OverlayRenderer()
+        self.overlay_choice = QUALITY_FULL
+        self._tracking = False          # last inferred frame had both hands
+
+        self.frame_box = self.progress_box = self.counter_box = None
+        self.status_box = self.startup_box = self.hud_box = self.alert_box = None
+        self.quality_box = None
+        self._hud_snapshot = None
+        self._pending_alert = None      # set by the audio worker, shown by the camera thread
+
+        self.finished = False
+        self.failure = None             # why the loop ended before the target reps, if it did
+        self._stop = threading.Event()
+        self._thread = None
+        self._ctx = None
+
+    # ---- called from the script on every rerun ----
+    def configure(self, region, target_reps, hand_choice, press_th, release_th,
+                  hold_time, stability_time, latency_budget=0.5, overlay_quality=QUALITY_FULL,
+                  auto_quality=False, target_fps=20.0, fingers=None, record_video=False,
+                  record_raw=False, record_fps=15.0):
+        """Apply settings to the running session; takes effect on the next frame."""
+        self.latency.budget = latency_budget
+        self.overlay_choice = overlay_quality
+        if auto_quality and self.governor is None and self.metrics is not NULL_METRICS:
+            self.governor = QualityGovernor(self.metrics, target_fps)
+        elif not auto_quality and self.governor is not None:
+            self.governor = None
+            self._apply_quality(LADDER[0])
+        if self.governor is not None:
+            self.governor.target_fps = target_fps
+        self.overlay.quality = self._overlay_quality()
+        self.region = region
+        self.target_reps = target_reps
+        self.hand_choice = hand_choice
+        self.reps.press_th = press_th
+        self.reps.release_th = release_th
+        self.reps.hold_time = hold_time
+        self.reps.stability_time = stability_time
+        if fingers and tuple(fingers) != self.contact.fingers:
+            self.contact.configure(fingers, load_contact_config()["thresholds"])
+        self._configure_recorder(record_video, record_raw, record_fps)
+
+    def _configure_recorder(self, enabled, raw, fps):
+        recorder = self.recorder
+        if recorder is not None and (not enabled or recorder.annotated == raw or recorder.fps != fps):
+            # Off, or a different kind of recording: finish this file
+            self.recorder = None
+            recorder.stop()
+            recorder = None
+        if enabled and recorder is None and not self.finished:
+            self.recorder = SessionRecorder(recording_path(self.username, self.session_id), fps=fps,
+                                            annotated=not raw, metrics=self.metrics).start()
+
+    def bind(self, frame_box, progress_box, counter_box, status_box, startup_box, hud_box=None,
+             alert_box=None, quality_box=None):
+        """Point the session at this rerun's placeholders (and its script context)."""
+        self.frame_box = frame_box
+        self.progress_box = progress_box
+        self.counter_box = counter_box
+        self.status_box = status_box
+        self.startup_box = startup_box
+        self.hud_box = hud_box
+        self.alert_box = alert_box
+        self.quality_box = quality_box
+        self.display.element = frame_box
+        if get_script_run_ctx is not None:
+            self._ctx = get_script_run_ctx(suppress_warning=True)
+            for thread in (self._thread, self.display._thread):
+                if thread is not None and self._ctx is not None:
+                    add_script_run_ctx(thread, self._ctx)
+        if self.finished:
+            self._show_finished()
+        else:
+            self._show_progress()
+            if self.failure is not None:
+                self._show_failure()
+        self._show_quality()
+
+    # ---- lifecycle ----
+    def start(self):
+        if self._thread is not None:
+            return self
+        self._thread = threading.Thread(target=self._run, daemon=True, name="camera-session")
+        if add_script_run_ctx is not None:
+            self._ctx = get_script_run_ctx(suppress_warning=True)
+            add_script_run_ctx(self._thread, self._ctx)
+        self._thread.start()
+        return self
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self, timeout=2.0):
+        self._stop.set()
+        self.pipeline.stop()        # unblocks a loop waiting for the next frame
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    # ---- camera loop ----
+    def _run(self):
+        speak = self.audio.speak
+        cues = self.cues
+        overlay = self.overlay
+        metrics = self.metrics
+        record = metrics.record
+        clock = time.perf_counter
+
+        speak(cues["ready"])
+        time.sleep(0.4)
+        speak(cues["press"])
+
+        # Capture and inference run on background threads (or in a shared
+        # station process); this loop is the render/publish stage and always
+        # works on the freshest landmarks.
+        try:
+            for result in self.pipeline.results():
+                if self._stop.is_set() or not self._session_alive():
+                    break
+                img = result.image
+                reps = self.reps
+                recorder = self.recorder
+                raw, record_time = None, 0.0
+                if recorder is not None and not recorder.annotated and recorder.due(result.timestamp):
+                    t0 = clock()
+                    raw = recorder.snapshot(img)        # before the overlay is drawn on img
+                    record_time = clock() - t0
+
+                filtered = point = None
+                if result.inferred:
+                    target_hand, pressing_hand = assign_hands(result.hands, self.hand_choice)
+                    self._tracking = target_hand is not None
+                    if self._tracking:
+                        # ---- Filter both hands ----
+                        t0 = clock()
+                        filtered = self.hand_filter.update(target_hand, pressing_hand, result.timestamp)
+                        record("filter", clock() - t0)
+                elif self._tracking:
+                    # Inference skipped on this frame (quality governor): draw
+                    # the hands where the filter extrapolates them to be
+                    filtered = self.hand_filter.extrapolate(result.timestamp)
+
+                if filtered is not None:
+                    t1 = clock()
+                    h_img, w_img, _ = img.shape
+                    target_px = filtered[TARGET] * (w_img, h_img)
+                    overlay.draw_hands(img, filtered)
+                    t2 = clock()
+
+                    # ---- Draw correct vertebra reflex point for this region & rep ----
+                    point = region_point(target_px, self.region, reps.count)
+                    overlay.draw_reflex(img, point, result.timestamp)
+                    t3 = clock()
+                    record("draw_landmarks", t2 - t1)
+                    record("reflex_point", t3 - t2)
+
+                    # Reps only ever see measured landmarks, predicted to "now"
+                    if point is not None and result.inferred:
+                        predicted = self.hand_filter.predict(time.monotonic() - result.timestamp)
+                        dist = self.contact.measure(point, predicted[PRESSING], img.shape)
+                        event = reps.update(dist, result.timestamp)
+                        record("reps", clock() - t3)
+                        self.handle_event(event, result.timestamp)
+
+                if recorder is not None:
+                    t4 = clock()
+                    if recorder.record(img, result.timestamp, result.frame_id, filtered, point,
+                                       reps.smooth if self._tracking else None, reps.stage, reps.count,
+                                       snapshot=raw):
+                        record("record", record_time + clock() - t4)
+
+                self.display.publish(img)
+                self.pipeline.release(result)
+                metrics.frame()
+                metrics.dropped = self.pipeline.dropped_frames
+                governor = self.governor
+                if governor is not None:
+                    level = governor.tick(time.monotonic())
+                    if level is not None:
+                        self._apply_quality(level)
+                self._report_startup()
+                self._update_hud()
+                self._show_alert()
+                self.progress_box.show(self._progress(), "image", progress_circle_png(self._progress()))
+
+                if reps.count >= self.target_reps:
+                    self.finished = True
+                    speak(cues["good"])
+                    self._show_finished()
+                    break
+        except Exception as e:
+            log.exception("camera session failed")
+            self.failure = f"{type(e).__name__}: {e}"
+        finally:
+            # Ended on its own (camera or source gone, or a crash) rather than
+            # finished or stopped: say so instead of leaving a frozen frame
+            ended_early = not self.finished and not self._stop.is_set() and self._session_alive()
+            self._cancel_countdown()
+            self.pipeline.stop()
+            self.display.stop()
+            if self.recorder is not None:
+                self.recorder.stop()
+                self.recorder = None
+            if self.on_close is not None:
+                self.on_close()
+            drop_metrics(self.metrics.label)
+            if ended_early:
+                if self.failure is None:
+                    error = getattr(self.pipeline, "error", None)
+                    self.failure = f"{type(error).__name__}: {error}" if error else "no more frames from the camera"
+                log.warning("camera session ended early: %s", self.failure)
+                self._show_failure()
+
+    def handle_event(self, event, frame_time):
+        """
+        Cues for a RepCounter event detected on the frame captured at
+        `frame_time`. The "Hold" and "ding" cues are tagged with the motion
+        that caused them, so their start times give motion-to-sound latency.
+        """
+        speak = self.audio.speak
+        cues = self.cues
+        if event == "countdown":
+            # The patient is already pressing: a "press" prompt still queued or
+            # playing would only delay "Hold". press_timer is the contact frame.
+            self.audio.interrupt()
+            self._hold_finger = self.contact.finger
+            self._start_countdown(frame_time, contact_at=self.reps.press_timer)
+        elif event == "cancel":
+            # Released before the hold time: stop the countdown and ask again
+            self._cancel_countdown()
+            speak(cues["press"])
+        elif event == "rep":
+            # Lift-off: the ding must not wait for the rest of the countdown clips
+            self.scheduler.cancel("countdown")
+            self.audio.interrupt()
+            self._record_rep()
+            speak(cues["ding"], on_start=self.latency.expect(RELEASE_TO_DING, frame_time))
+            speak(cues["good"])
+            self._show_progress()
+            speak(cues["press"])
+
+    def _start_countdown(self, started_at, contact_at):
+        # Voice sequence: Hold, (3, 2,) 1, Release — spread over the hold time
+        cues = self.cues
+        plan = countdown_plan(self.reps.hold_time, self.audio.duration, cues["hold"],
+                              cues["numbers"], cues["release"])
+        for offset, cue in plan:
+            on_start = self.latency.expect(PRESS_TO_HOLD, contact_at) if cue == cues["hold"] else None
+            self.scheduler.schedule_at(
+                started_at + offset,
+                lambda cue=cue, on_start=on_start: self.audio.speak(cue, on_start=on_start),
+                tag="countdown",
+            )
+
+    def _latency_violation(self, path, latency):
+        # Runs on the shared audio worker, which has no script context: only
+        # leave the message for the camera thread to show on its next frame
+        what = "press → “Hold”" if path == PRESS_TO_HOLD else "release → ding"
+        self._pending_alert = (
+            f"⚠️ Slow cue: {what} took {latency * 1000:.0f} ms "
+            f"(budget {self.latency.budget * 1000:.0f} ms)"
+        )
+
+    def _show_alert(self):
+        message = self._pending_alert
+        if message is not None and self.alert_box is not None:
+            self._pending_alert = None
+            self.alert_box.warning(message)
+
+    def _cancel_countdown(self):
+        self.scheduler.cancel("countdown")
+        self.audio.clear()
+
+    def _record_rep(self):
+        if self.store is None:
+            return
+        rep = self.reps.last_rep
+        to_wall = time.time() - time.monotonic()      # rep timings are on the monotonic clock
+        self.store.record_rep(
+            username=self.username,
+            session_id=self.session_id,
+            rep_index=self.reps.count,
+            region=self.region,
+            hand=self.hand_choice,
+            pressed_at=rep.pressed_at + to_wall,
+            countdown_at=rep.countdown_at + to_wall,
+            released_at=rep.released_at + to_wall,
+            hold_duration=rep.hold_duration,
+            min_distance=rep.min_distance,
+            finger=self._hold_finger,
+        )
+
+    def _apply_quality(self, level):
+        self.pipeline.configure(level.inference_scale, level.infer_every)
+        if self.model_switcher is not None:
+            self.model_switcher(self.pipeline, level.model_complexity)
+        self.overlay.quality = self._overlay_quality()
+        self._show_quality()
+
+    def _overlay_quality(self):
+        """The user's overlay choice, capped by the governor's level."""
+        if self.governor is None:
+            return self.overlay_choice
+        return max(self.overlay_choice, self.governor.level.overlay, key=QUALITY_LEVELS.index)
+
+    def _show_quality(self):
+        if self.quality_box is None:
+            return
+        if self.governor is None:
+            self.quality_box.empty()
+            return
+        governor = self.governor
+        fps = f" · {governor.last_fps:.1f} / {governor.target_fps:.0f} FPS" if governor.last_fps else ""
+        self.quality_box.caption(f"⚙️ Quality level {governor.index + 1}/{len(governor.ladder)}: "
+                                 f"{governor.level}{fps}")
+
+    def _progress(self):
+        return min(100.0, self.reps.count / max(1, self.target_reps) * 100)
+
+    def _show_progress(self):
+        if self.counter_box is not None and self.reps.count:
+            self.counter_box.show(
+                self.reps.count, "success", f"Reps Completed: {self.reps.count}/{self.target_reps}"
+            )
+
+    def _show_finished(self):
+        self._show_progress()
+        if self.status_box is not None:
+            self.status_box.success("🎉 Session Completed for selected spinal reflex region")
+
+    def _show_failure(self):
+        if self.status_box is not None:
+            self.status_box.error(
+                f"📷 Camera stopped: {self.failure}. Untick “Start Camera” and tick it again to retry."
+            )
+
+    def _report_startup(self):
+        # Click → first annotated frame in the browser
+        if self.clicked_at is None or self.display.first_sent_at is None:
+            return
+        latency = self.display.first_sent_at - self.clicked_at
+        self.clicked_at = None
+        log.info("time to first frame: %.3f s", latency)
+        if self.startup_box is not None:
+            self.startup_box.caption(f"⏱ Time to first frame: {latency:.2f} s")
+
+    def _update_hud(self):
+        if self.hud_box is None or self.metrics is NULL_METRICS:
+            self._hud_snapshot = None
+            return
+        snap = self.metrics.snapshot()
+        previous = self._hud_snapshot
+        if previous is not None and snap["time"] - previous["time"] < self.HUD_INTERVAL:
+            return
+        self._hud_snapshot = snap
+        if previous is None:
+            return
+        summary = summarize(snap, previous)
+        lines = [
+            f"**{summary['fps']:.1f} FPS** · dropped {summary['dropped']}",
+            "",
+            "| stage | p50 ms | p95 ms |",
+            "|---|---:|---:|",
+        ]
+        for name, stage in summary["stages"].items():
+            lines.append(f"| {name} | {stage['p50_ms']:.1f} | {stage['p95_ms']:.1f} |")
+        for path, stage in self.latency.summary().items():
+            lines.append(f"| {path} (session) | {stage['p50_ms']:.0f} | {stage['p95_ms']:.0f} |")
+        self.hud_box.markdown("\n".join(lines))
+
+    def _session_alive(self):
+        """False once the browser session that owns this camera has gone away."""
+        if Runtime is None or self._ctx is None or not Runtime.exists():
+            return True
+        return Runtime.instance().is_active_session(self._ctx.session_id)
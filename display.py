@@ -0,0 +1,302 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from metrics import NULL_METRICS
+from pipeline import FramePool, LatestQueue
+
+try:
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.scriptrunner import add_script_run_ctx
+except ImportError:  # headless use without Streamlit
+    Runtime = add_script_run_ctx = None
+
+log = logging.getLogger("neurorehab")
+
+# ========== BROWSER FETCH ACKNOWLEDGEMENTS ==========
+class MediaFetchTracker:
+    """
+    When did the browser fetch each media file?
+
+    element.image() only stores the JPEG in the runtime's media storage and
+    queues a message; it returns at once however slow the client is. The
+    browser then GETs the file over HTTP, and that request goes through
+    the storage's get_file(). Wrapping it turns the GET into an
+    acknowledgement: a frame not fetched yet means the browser (or the
+    connection to it) has not caught up.
+
+    This hooks Streamlit internals, checked against Streamlit 1.65:
+    Runtime.instance().media_file_mgr._storage (a MemoryMediaFileStorage)
+    and its get_file / get_url / load_and_get_id, which the server's media
+    route and st.image() go through. get_media_fetch_tracker() checks they
+    exist and otherwise returns None, leaving DisplayPublisher to back off
+    on encode cost alone.
+    """
+
+    HOOKS = ("get_file", "get_url", "load_and_get_id")
+
+    MAX_TRACKED = 512
+
+    def __init__(self, storage):
+        self._fetched = OrderedDict()       # file_id → time.monotonic() of the last fetch
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        get_file, get_url, load_and_get_id = storage.get_file, storage.get_url, storage.load_and_get_id
+
+        def tracked_get_file(filename):
+            if not getattr(self._local, "internal", False):
+                self._mark(os.path.splitext(filename)[0])
+            return get_file(filename)
+
+        def tracked_get_url(file_id):
+            self._local.internal = True     # get_url() looks the file up itself: not a fetch
+            try:
+                return get_url(file_id)
+            finally:
+                self._local.internal = False
+
+        def tracked_load_and_get_id(*args, **kwargs):
+            file_id = load_and_get_id(*args, **kwargs)
+            self._local.added = file_id
+            return file_id
+
+        storage.get_file = tracked_get_file
+        storage.get_url = tracked_get_url
+        storage.load_and_get_id = tracked_load_and_get_id
+
+    def _mark(self, file_id):
+        with self._lock:
+            self._fetched[file_id] = time.monotonic()
+            self._fetched.move_to_end(file_id)
+            if len(self._fetched) > self.MAX_TRACKED:
+                self._fetched.popitem(last=False)
+
+    def last_added(self):
+        """ID of the media file most recently stored by the calling thread."""
+        return getattr(self._local, "added", None)
+
+    def fetched_at(self, file_id):
+        with self._lock:
+            return self._fetched.get(file_id)
+
+
+_tracker = None
+_tracker_unavailable = False
+_tracker_lock = threading.Lock()
+
+
+def get_media_fetch_tracker():
+    """
+    Process-wide MediaFetchTracker on the Streamlit runtime's media storage.
+    None when headless, or when this Streamlit version's storage does not
+    have the methods it hooks (logged once).
+    """
+    global _tracker, _tracker_unavailable
+    with _tracker_lock:
+        if _tracker is None and not _tracker_unavailable and Runtime is not None and Runtime.exists():
+            manager = getattr(Runtime.instance(), "media_file_mgr", None)
+            storage = getattr(manager, "_storage", None)
+            if storage is not None and all(callable(getattr(storage, name, None)) for name in MediaFetchTracker.HOOKS):
+                _tracker = MediaFetchTracker(storage)
+            else:
+                _tracker_unavailable = True
+                log.warning("Streamlit media storage has no %s hooks (tested with 1.65); "
+                            "display back-off will use encode cost only", "/".join(MediaFetchTracker.HOOKS))
+        return _tracker
+
+
+# ========== ADAPTIVE DISPLAY PUBLISHER ==========
+class DisplayPublisher:
+    """
+    Sends annotated frames to the browser from its own thread.
+
+    publish() never blocks the camera loop: frames above the target display
+    FPS are skipped, and frames arriving while a send is in flight replace
+    the pending one. Frames are downscaled to `max_width` (or copied) into
+    the publisher's own pooled buffers, so the caller may reuse its frame
+    as soon as publish() returns, then JPEG-encoded on the send thread.
+
+    Under Streamlit the browser's fetch of each frame (MediaFetchTracker)
+    is the backpressure signal: while the previous frame has not been
+    fetched, new frames are skipped rather than piled onto a slow client
+    (for at most ACK_TIMEOUT, e.g. a hidden tab fetches nothing).
+
+    When sends fall behind (a send takes longer than the frame budget,
+    pending frames had to be dropped, the browser was still fetching the
+    previous frame or took more than two frame budgets to fetch it) the
+    publisher backs off: JPEG quality first, then resolution, then display
+    FPS. It recovers one step at a time once sends are comfortably fast
+    again. Headless, without a runtime, only the encode side is measured.
+    """
+
+    QUALITY_STEP = 10
+    WIDTH_STEP = 0.75
+    FPS_STEP = 0.75
+    RECOVER_AFTER = 30      # consecutive fast sends before stepping back up
+    ACK_TIMEOUT = 1.0       # longest wait for the browser to fetch a frame
+
+    def __init__(self, element, target_fps=15.0, max_width=640, jpeg_quality=70,
+                 min_fps=3.0, min_width=320, min_quality=35, metrics=None):
+        self.element = element
+        self.metrics = metrics or NULL_METRICS
+        self.target_fps = target_fps
+        self.max_width = max_width
+        self.jpeg_quality = jpeg_quality
+        self.min_fps = min_fps
+        self.min_width = min_width
+        self.min_quality = min_quality
+
+        # current (possibly backed-off) settings
+        self.fps = target_fps
+        self.width = max_width
+        self.quality = jpeg_quality
+
+        self.sent = 0
+        self.skipped = 0
+        self.last_send_time = 0.0
+        self.first_sent_at = None       # time.monotonic() when the first frame reached the browser
+        self._next_due = 0.0
+        self._fast_sends = 0
+        self._seen_drops = 0
+        self._pool = FramePool(max_free=3)
+        self._bgr = None                # encode scratch buffer (send thread only)
+        self._queue = LatestQueue(on_drop=self._pool.release)
+        self._thread = None
+        self._tracker = None
+        self._awaiting = None           # (file_id, sent_at) of the frame the browser has yet to fetch
+        self._client_lag = False
+        self.client_skipped = 0         # frames skipped because the browser had not caught up
+        self.fetch_latency = None       # send → browser fetch of the last acknowledged frame (s)
+
+    def start(self):
+        self._tracker = get_media_fetch_tracker()
+        self._thread = threading.Thread(target=self._send_loop, daemon=True)
+        if add_script_run_ctx is not None:
+            add_script_run_ctx(self._thread)
+        self._thread.start()
+        return self
+
+    def configure(self, target_fps, max_width, jpeg_quality):
+        """Change the targets while running; the back-off restarts from the new values."""
+        if (target_fps, max_width, jpeg_quality) == (self.target_fps, self.max_width, self.jpeg_quality):
+            return
+        self.target_fps = self.fps = target_fps
+        self.max_width = self.width = max_width
+        self.jpeg_quality = self.quality = jpeg_quality
+        self._fast_sends = 0
+
+    def publish(self, img):
+        """Hand a frame (RGB ndarray) to the publisher. Returns False if it was rate-limited."""
+        now = time.monotonic()
+        if now < self._next_due:
+            self.skipped += 1
+            return False
+        self._next_due = max(self._next_due + 1.0 / self.fps, now)
+        self._queue.put(self._scaled_copy(img))
+        return True
+
+    def _scaled_copy(self, img):
+        h, w = img.shape[:2]
+        if w > self.width:
+            size = (int(self.width), int(h * self.width / w))
+            out = self._pool.acquire((size[1], size[0], 3))
+            return cv2.resize(img, size, dst=out, interpolation=cv2.INTER_AREA)
+        out = self._pool.acquire(img.shape)
+        np.copyto(out, img)
+        return out
+
+    def encode(self, img):
+        h, w = img.shape[:2]
+        if w > self.width:
+            img = cv2.resize(img, (int(self.width), int(h * self.width / w)), interpolation=cv2.INTER_AREA)
+        if self._bgr is None or self._bgr.shape != img.shape:
+            self._bgr = np.empty_like(img)
+        cv2.cvtColor(img, cv2.COLOR_RGB2BGR, dst=self._bgr)
+        ok, buf = cv2.imencode(".jpg", self._bgr, [cv2.IMWRITE_JPEG_QUALITY, int(self.quality)])
+        return buf.tobytes() if ok else None
+
+    def _send_loop(self):
+        while True:
+            img = self._queue.get(timeout=0.5)
+            if img is None:
+                if self._queue.closed:
+                    return
+                continue
+            if self._client_behind():
+                self._pool.release(img)
+                self.client_skipped += 1
+                self._client_lag = True
+                continue
+            t0 = time.perf_counter()
+            data = self.encode(img)
+            self._pool.release(img)
+            t1 = time.perf_counter()
+            self.metrics.record("encode", t1 - t0)
+            if data is not None:
+                self.element.image(data)
+                self.metrics.record("image", time.perf_counter() - t1)
+                if self._tracker is not None:
+                    self._awaiting = (self._tracker.last_added(), time.monotonic())
+                self.sent += 1
+                if self.first_sent_at is None:
+                    self.first_sent_at = time.monotonic()
+            self.last_send_time = time.perf_counter() - t0
+            self._adapt()
+
+    def _client_behind(self):
+        """True while the browser has not fetched the previously sent frame (up to ACK_TIMEOUT)."""
+        if self._awaiting is None:
+            return False
+        file_id, sent_at = self._awaiting
+        fetched = self._tracker.fetched_at(file_id) if file_id is not None else sent_at
+        if fetched is not None:        # (an identical earlier frame counts: the browser has it)
+            self.fetch_latency = max(0.0, fetched - sent_at)
+            self._awaiting = None
+            return False
+        if time.monotonic() - sent_at > self.ACK_TIMEOUT:
+            self._awaiting = None
+            return False
+        return True
+
+    def _adapt(self):
+        budget = 1.0 / self.fps
+        dropped = self._queue.dropped - self._seen_drops
+        self._seen_drops = self._queue.dropped
+        lagging = self._client_lag or (self.fetch_latency is not None and self.fetch_latency > 2 * budget)
+        self._client_lag = False
+
+        if dropped > 0 or lagging or self.last_send_time > budget:
+            self._fast_sends = 0
+            self._back_off()
+        elif self.last_send_time < 0.5 * budget:
+            self._fast_sends += 1
+            if self._fast_sends >= self.RECOVER_AFTER:
+                self._fast_sends = 0
+                self._recover()
+
+    def _back_off(self):
+        if self.quality > self.min_quality:
+            self.quality = max(self.min_quality, self.quality - self.QUALITY_STEP)
+        elif self.width > self.min_width:
+            self.width = max(self.min_width, int(self.width * self.WIDTH_STEP))
+        elif self.fps > self.min_fps:
+            self.fps = max(self.min_fps, self.fps * self.FPS_STEP)
+
+    def _recover(self):
+        if self.fps < self.target_fps:
+            self.fps = min(self.target_fps, self.fps / self.FPS_STEP)
+        elif self.width < self.max_width:
+            self.width = min(self.max_width, int(self.width / self.WIDTH_STEP))
+        elif self.quality < self.jpeg_quality:
+            self.quality = min(self.jpeg_quality, self.quality + self.QUALITY_STEP)
+
+    def stop(self):
+        self._queue.close()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
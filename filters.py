@@ -0,0 +1,110 @@
+import math
+
+import numpy as np
+
+
+# ========== ONE-EURO LANDMARK FILTER ==========
+class OneEuroFilter:
+    """
+    One-Euro filter over a whole landmark array, O(1) per update.
+
+    Low speed → low cutoff (removes jitter while the fingertip rests on the
+    reflex point); high speed → high cutoff (little lag on press/release).
+    All state and scratch buffers are preallocated; update() does not
+    allocate. Timestamps are in seconds.
+    """
+
+    def __init__(self, shape, min_cutoff=1.0, beta=30.0, d_cutoff=1.0, reset_after=0.5):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset_after = reset_after
+        self.x = np.zeros(shape)          # filtered value
+        self.dx = np.zeros(shape)         # filtered velocity (units / s)
+        self._diff = np.empty(shape)
+        self._cut = np.empty(shape)
+        self._den = np.empty(shape)
+        self._pred = np.empty(shape)
+        self.t = None
+
+    def reset(self):
+        self.t = None
+
+    def update(self, value, t):
+        """Filter one sample. Returns the internal filtered array (do not keep a reference)."""
+        dt = None if self.t is None else t - self.t
+        if dt is None or dt <= 0 or dt > self.reset_after:
+            # First sample, or tracking gap: restart from the raw value.
+            self.x[...] = value
+            self.dx.fill(0.0)
+            self.t = t
+            return self.x
+
+        # Velocity, smoothed with a fixed cutoff
+        np.subtract(value, self.x, out=self._diff)
+        self._diff /= dt
+        self._diff -= self.dx
+        self._diff *= _alpha(self.d_cutoff, dt)
+        self.dx += self._diff
+
+        # Per-element cutoff from speed, then alpha = r / (1 + r), r = 2π·cutoff·dt
+        np.abs(self.dx, out=self._cut)
+        self._cut *= self.beta
+        self._cut += self.min_cutoff
+        self._cut *= 2 * math.pi * dt
+        np.add(self._cut, 1.0, out=self._den)
+        self._cut /= self._den
+
+        np.subtract(value, self.x, out=self._diff)
+        self._diff *= self._cut
+        self.x += self._diff
+        self.t = t
+        return self.x
+
+    def predict(self, horizon):
+        """Constant-velocity extrapolation `horizon` seconds past the last update."""
+        np.multiply(self.dx, horizon, out=self._pred)
+        self._pred += self.x
+        return self._pred
+
+
+def _alpha(cutoff, dt):
+    r = 2 * math.pi * cutoff * dt
+    return r / (1.0 + r)
+
+
+# ========== TWO-HAND FILTER ==========
+TARGET, PRESSING = 0, 1
+
+
+class HandPairFilter:
+    """
+    Filters the target and pressing hands together as one (2, 21, 2) array
+    of normalized (x, y) landmarks: [TARGET] and [PRESSING].
+    """
+
+    MAX_HORIZON = 0.1   # never extrapolate further than this (seconds)
+
+    def __init__(self, **params):
+        self.raw = np.zeros((2, 21, 2))
+        self.filter = OneEuroFilter(self.raw.shape, **params)
+
+    def update(self, target_hand, pressing_hand, t):
+        for row, hand in ((TARGET, target_hand), (PRESSING, pressing_hand)):
+            dst = self.raw[row]
+            for i, lm in enumerate(hand.landmark):
+                dst[i, 0] = lm.x
+                dst[i, 1] = lm.y
+        return self.filter.update(self.raw, t)
+
+    def predict(self, horizon):
+        return self.filter.predict(min(max(horizon, 0.0), self.MAX_HORIZON))
+
+    def extrapolate(self, t):
+        """Both hands extrapolated to time `t` (for frames without inference), or None."""
+        if self.filter.t is None:
+            return None
+        return self.predict(t - self.filter.t)
+
+    def reset(self):
+        self.filter.reset()
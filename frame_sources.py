@@ -0,0 +1,467 @@
+import glob
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+import cv2
+import numpy as np
+
+log = logging.getLogger("neurorehab")
+
+
+# ========== FRAME SOURCES ==========
+# Every source exposes the same read() / release() interface as
+# cv2.VideoCapture, so HandPipeline and the headless benchmark can be driven
+# by a webcam, a recorded session or generated frames interchangeably.
+
+class FrameSource:
+    """
+    Base class: read() returns (ok, bgr_frame) like cv2.VideoCapture.
+    Like VideoCapture.read(image), a preallocated `image` of the right shape
+    is filled in place instead of allocating a new frame.
+    """
+
+    fps = 30.0
+
+    def read(self, image=None):
+        raise NotImplementedError
+
+    def release(self):
+        pass
+
+    def __iter__(self):
+        while True:
+            ok, frame = self.read()
+            if not ok:
+                return
+            yield frame
+
+
+class CameraSource(FrameSource):
+    """
+    Live webcam, configured for low latency.
+
+    The capture is opened with the platform's native backend and asked for
+    `mode` (resolution, FPS and pixel format; default: the mode saved for
+    this camera in camera.json, else DEFAULT_MODE) and a one-frame driver
+    buffer. What the driver actually granted is in `negotiated`. When the
+    buffer size cannot be set, read() drains frames that queued up while
+    the caller was busy, so it always returns the newest one.
+    """
+
+    MAX_DRAIN = 4
+
+    def __init__(self, index=0, mode=None, backend=None, buffer_size=1):
+        self.index = index
+        self.cap = open_capture(index, backend)
+        self.configure(mode or configured_mode(index), buffer_size)
+        self._registered = True
+        with _warm_lock:
+            _open_cameras[index] = _open_cameras.get(index, 0) + 1
+
+    def configure(self, mode, buffer_size=1):
+        """Request a mode on the open device (do not call while another thread reads)."""
+        self.mode = mode
+        apply_mode(self.cap, mode)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+        self.buffer_size = int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE))
+        self.drain = self.buffer_size != buffer_size
+        self.negotiated = negotiated_mode(self.cap)
+        self.fps = self.negotiated.fps or 30.0
+        log.info("camera %s: requested %s, got %s (buffer %s%s)", self.index, mode, self.negotiated,
+                 self.buffer_size or "?", ", draining" if self.drain else "")
+
+    def read(self, image=None):
+        if not self.drain:
+            return self.cap.read(image)
+        # A grab() that returns well within the frame interval handed out a
+        # frame that was already waiting in the driver queue: skip it.
+        fresh = 0.5 / self.fps
+        for _ in range(self.MAX_DRAIN):
+            t0 = time.perf_counter()
+            if not self.cap.grab():
+                return False, None
+            if time.perf_counter() - t0 > fresh:
+                break
+        return self.cap.retrieve(image)
+
+    def describe(self):
+        """One-line summary of the negotiated capture settings, for the UI."""
+        buffering = "draining stale frames" if self.drain else f"buffer {self.buffer_size}"
+        return f"{self.negotiated} · {buffering}"
+
+    def release(self):
+        self.cap.release()
+        with _warm_lock:
+            if self._registered:
+                self._registered = False
+                _open_cameras[self.index] -= 1
+
+
+# ========== CAMERA MODES ==========
+# OpenCV cannot list a camera's modes, so they are probed: a mode is
+# requested and kept if the driver reports it back unchanged. FOURCC has
+# to be set before the size (V4L2 picks the size per pixel format).
+
+@dataclass(frozen=True)
+class CameraMode:
+    width: int
+    height: int
+    fps: float
+    fourcc: str = "MJPG"        # MJPG, YUYV, ... ("" = driver default)
+
+    def __str__(self):
+        return f"{self.width}×{self.height} @ {self.fps:g} fps {self.fourcc or '?'}"
+
+    def spec(self):
+        return f"{self.width}x{self.height}@{self.fps:g}/{self.fourcc}"
+
+    @classmethod
+    def parse(cls, text):
+        """"1280x720@30/MJPG" (FPS and format optional) → CameraMode."""
+        size, _, rest = text.partition("@")
+        fps, _, fourcc = rest.partition("/")
+        w, h = (int(v) for v in size.lower().split("x"))
+        return cls(w, h, float(fps or 30), fourcc.upper() or "MJPG")
+
+
+DEFAULT_MODE = CameraMode(640, 480, 30, "MJPG")
+
+CANDIDATE_MODES = [
+    CameraMode(w, h, fps, fourcc)
+    for fourcc in ("MJPG", "YUYV")
+    for w, h in ((640, 480), (960, 540), (1280, 720), (1920, 1080))
+    for fps in (60, 30, 15)
+]
+
+CAMERA_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "camera.json")
+
+
+def _native_backend():
+    if sys.platform.startswith("win"):
+        return cv2.CAP_DSHOW
+    if sys.platform == "darwin":
+        return cv2.CAP_AVFOUNDATION
+    return cv2.CAP_V4L2
+
+
+def open_capture(index, backend=None):
+    """VideoCapture on the native backend, falling back to OpenCV's default."""
+    cap = cv2.VideoCapture(index, _native_backend() if backend is None else backend)
+    if not cap.isOpened() and backend is None:
+        cap.release()
+        cap = cv2.VideoCapture(index)
+    return cap
+
+
+def apply_mode(cap, mode):
+    if mode is None:
+        return
+    if mode.fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*mode.fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, mode.width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, mode.height)
+    cap.set(cv2.CAP_PROP_FPS, mode.fps)
+
+
+def negotiated_mode(cap):
+    code = int(cap.get(cv2.CAP_PROP_FOURCC))
+    fourcc = "".join(chr((code >> 8 * i) & 0xFF) for i in range(4)).strip("\0 ") if code > 0 else ""
+    return CameraMode(
+        int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        round(cap.get(cv2.CAP_PROP_FPS), 2),
+        fourcc,
+    )
+
+
+def _granted(requested, got):
+    return (
+        (got.width, got.height) == (requested.width, requested.height)
+        and abs(got.fps - requested.fps) < 1.0
+        and got.fourcc in ("", requested.fourcc)
+    )
+
+
+def probe_modes(index=0, candidates=CANDIDATE_MODES, backend=None):
+    """The candidate modes this camera accepts, as negotiated."""
+    cap = open_capture(index, backend)
+    supported = []
+    try:
+        if not cap.isOpened():
+            return supported
+        for mode in candidates:
+            apply_mode(cap, mode)
+            ok, _ = cap.read()          # some drivers only commit a mode on the first read
+            got = negotiated_mode(cap)
+            if ok and _granted(mode, got) and got not in supported:
+                supported.append(got)
+    finally:
+        cap.release()
+    return supported
+
+
+def load_camera_config(path=CAMERA_CONFIG):
+    """{camera index: CameraMode} saved by benchmarks/camera_bench.py --save."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return {int(index): CameraMode(**mode) for index, mode in json.load(f).items()}
+
+
+def save_camera_mode(index, mode, path=CAMERA_CONFIG):
+    config = load_camera_config(path)
+    config[index] = mode
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({str(i): asdict(m) for i, m in sorted(config.items())}, f, indent=2)
+    os.replace(tmp, path)
+
+
+def configured_mode(index):
+    return load_camera_config().get(index, DEFAULT_MODE)
+
+
+# ========== PRE-WARMED CAMERAS ==========
+# Opening a webcam can take a second or more. prewarm_camera() opens it in
+# the background while the patient is still choosing condition and reps;
+# take_camera() hands over the already-open device when the session starts.
+# A warmed camera nobody takes is released again after `idle_timeout`.
+# A camera that is already open in this process (a running session holds
+# it) is never warmed a second time: most drivers refuse a second open or
+# hand the device over, breaking the running stream.
+
+_warm_cameras = {}            # index → {"ready": Event, "source": CameraSource, "timer": Timer}
+_open_cameras = {}            # index → CameraSources open in this process
+_warm_lock = threading.Lock()
+
+
+def camera_in_use(index):
+    """True while a CameraSource (warm or taken) holds camera `index` in this process."""
+    with _warm_lock:
+        return index in _warm_cameras or _open_cameras.get(index, 0) > 0
+
+
+def prewarm_camera(index=0, mode=None, idle_timeout=120.0):
+    with _warm_lock:
+        if index in _warm_cameras or _open_cameras.get(index, 0) > 0:
+            return
+        entry = {"ready": threading.Event(), "source": None, "timer": None, "discarded": False}
+        _warm_cameras[index] = entry
+
+    def open_camera():
+        try:
+            source = CameraSource(index, mode)
+        except Exception:
+            log.exception("camera %s: pre-warming failed", index)
+            with _warm_lock:
+                if _warm_cameras.get(index) is entry:
+                    del _warm_cameras[index]
+            entry["ready"].set()
+            return
+        with _warm_lock:
+            entry["source"] = source
+            discarded = entry["discarded"]
+            if not discarded:
+                entry["timer"] = threading.Timer(idle_timeout, _expire_camera, args=(index, entry))
+                entry["timer"].daemon = True
+                entry["timer"].start()
+        entry["ready"].set()
+        if discarded:
+            source.release()
+
+    threading.Thread(target=open_camera, daemon=True).start()
+
+
+def discard_warm_camera(index):
+    """Close a warmed camera nobody is going to take (e.g. a station opens the device itself)."""
+    with _warm_lock:
+        entry = _warm_cameras.pop(index, None)
+        if entry is None:
+            return
+        entry["discarded"] = True
+        source, timer = entry["source"], entry["timer"]
+    if timer is not None:
+        timer.cancel()
+    if source is not None:
+        source.release()        # else open_camera() releases it once open
+
+
+def take_camera(index=0, mode=None, timeout=10.0):
+    """
+    The pre-warmed camera if there is one (waiting for it to finish opening),
+    else a new one. A warmed camera in another mode is switched to `mode`.
+    """
+    with _warm_lock:
+        entry = _warm_cameras.pop(index, None)
+    if entry is not None and not entry["ready"].wait(timeout):
+        with _warm_lock:
+            entry["discarded"] = True       # still opening: close it once it is open
+            source = entry["source"]
+        if source is not None:
+            source.release()
+        entry = None
+    if entry is None or entry["source"] is None:
+        return CameraSource(index, mode)
+    if entry["timer"] is not None:
+        entry["timer"].cancel()
+    source = entry["source"]
+    mode = mode or configured_mode(index)
+    if source.mode != mode:
+        source.configure(mode)
+    return source
+
+
+def _expire_camera(index, entry):
+    with _warm_lock:
+        if _warm_cameras.get(index) is not entry:
+            return          # already taken
+        del _warm_cameras[index]
+    entry["source"].release()
+
+
+class VideoFileSource(FrameSource):
+    """
+    Recorded session video.
+    With realtime=True frames are paced at the file's FPS, so the live
+    pipeline sees the same arrival rate as from a camera.
+    """
+
+    def __init__(self, path, loop=False, realtime=False):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path = path
+        self.loop = loop
+        self.realtime = realtime
+        self.cap = cv2.VideoCapture(path)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self._next_due = None
+
+    def read(self, image=None):
+        ok, frame = self.cap.read(image)
+        if not ok and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.cap.read(image)
+        if ok and self.realtime:
+            _pace(self, self.fps)
+        return ok, frame
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageDirSource(FrameSource):
+    """Sorted still images from a directory (e.g. exported session frames)."""
+
+    EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+    def __init__(self, directory, fps=30.0, loop=False, realtime=False):
+        self.paths = sorted(
+            p for p in glob.glob(os.path.join(directory, "*"))
+            if p.lower().endswith(self.EXTENSIONS)
+        )
+        if not self.paths:
+            raise FileNotFoundError(f"No images found in {directory}")
+        self.fps = fps
+        self.loop = loop
+        self.realtime = realtime
+        self._index = 0
+        self._next_due = None
+
+    def read(self, image=None):
+        if self._index >= len(self.paths):
+            if not self.loop:
+                return False, None
+            self._index = 0
+        frame = cv2.imread(self.paths[self._index])
+        self._index += 1
+        if frame is None:
+            return False, None
+        if self.realtime:
+            _pace(self, self.fps)
+        return True, frame
+
+
+class SyntheticSource(FrameSource):
+    """
+    Generated frames for measuring pipeline cost without any footage.
+    Draws two moving skin-toned blobs on a noisy background.
+    """
+
+    def __init__(self, width=640, height=480, frames=300, fps=30.0, realtime=False, seed=0):
+        self.width = width
+        self.height = height
+        self.frames = frames
+        self.fps = fps
+        self.realtime = realtime
+        self._index = 0
+        self._next_due = None
+        rng = np.random.default_rng(seed)
+        self._background = rng.integers(0, 60, (height, width, 3), dtype=np.uint8)
+
+    def read(self, image=None):
+        if self.frames is not None and self._index >= self.frames:
+            return False, None
+        t = self._index / self.fps
+        self._index += 1
+
+        if image is not None and image.shape == self._background.shape:
+            frame = image
+            np.copyto(frame, self._background)
+        else:
+            frame = self._background.copy()
+        r = min(self.width, self.height) // 6
+        for phase, cx in ((0.0, 0.3), (np.pi, 0.7)):
+            x = int(self.width * (cx + 0.05 * np.sin(2 * np.pi * 0.5 * t + phase)))
+            y = int(self.height * (0.5 + 0.05 * np.cos(2 * np.pi * 0.5 * t + phase)))
+            cv2.circle(frame, (x, y), r, (140, 170, 220), -1)
+
+        if self.realtime:
+            _pace(self, self.fps)
+        return True, frame
+
+
+def _pace(source, fps):
+    """Sleep until the next frame is due so a file source behaves like a camera."""
+    now = time.monotonic()
+    if source._next_due is None:
+        source._next_due = now
+    delay = source._next_due - now
+    if delay > 0:
+        time.sleep(delay)
+    source._next_due = max(source._next_due, now) + 1.0 / fps
+
+
+def open_source(spec, **kwargs):
+    """
+    Build a source from a command-line style spec:
+      "camera" / "camera:1" / "0"   → CameraSource
+      "camera:1@1280x720@30/MJPG"    → CameraSource in that mode
+      "synthetic" / "synthetic:640x480" → SyntheticSource
+      directory                      → ImageDirSource
+      anything else                  → VideoFileSource
+    """
+    spec = str(spec)
+    # File-source options (realtime, loop, ...) do not apply to cameras
+    camera_options = {k: kwargs[k] for k in ("mode", "backend", "buffer_size") if k in kwargs}
+    if spec.isdigit():
+        return CameraSource(int(spec), **camera_options)
+    if spec == "camera" or spec.startswith("camera:"):
+        index, _, mode = spec.partition(":")[2].partition("@")
+        if mode:
+            camera_options.setdefault("mode", CameraMode.parse(mode))
+        return CameraSource(int(index or 0), **camera_options)
+    if spec == "synthetic" or spec.startswith("synthetic:"):
+        size = spec.partition(":")[2]
+        if size:
+            w, h = (int(v) for v in size.lower().split("x"))
+            kwargs.setdefault("width", w)
+            kwargs.setdefault("height", h)
+        return SyntheticSource(**kwargs)
+    if os.path.isdir(spec):
+        return ImageDirSource(spec, **kwargs)
+    return VideoFileSource(spec, **kwargs)
@@ -1,31 +1,72 @@
-import base64
+"""
+Build step for the login page imagery.
+
+Resizes the source images into a few widths, encodes each as WebP with a
+JPEG fallback and writes them to static/login/ (served by Streamlit at
+app/static/login/...). File names carry a content hash, so browsers can
+cache them and revalidate with the ETag the static server sends.
+login_component reads static/login/manifest.json to pick the variants.
+
+Usage:
+    python generate_assets.py
+"""
+import hashlib
+import json
 import os
 
-# Main background image (outer)
-bg_path = '/Users/layyzy/neuro_rehab_mvp/neuro_background_v2.jpg'
-# Overlay container image (inner)
-overlay_path = '/Users/layyzy/.gemini/antigravity/brain/d16dc5ce-ed45-4b0b-938c-599f2f6bef91/uploaded_image_1766059452695.jpg'
-
-output_path = '/Users/layyzy/neuro_rehab_mvp/login_assets.py'
-
-def get_b64(path):
-    try:
-        with open(path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode()
-    except FileNotFoundError:
-        print(f"Error: File not found {path}")
-        return ""
-
-try:
-    bg_b64 = get_b64(bg_path)
-    overlay_b64 = get_b64(overlay_path)
-    
-    if bg_b64 and overlay_b64:
-        with open(output_path, "w") as f:
-            f.write(f'LOGIN_BG_B64 = "data:image/png;base64,{bg_b64}"\n')
-            f.write(f'CONTAINER_BG_B64 = "data:image/jpeg;base64,{overlay_b64}"')
-        print(f"Successfully created {output_path} with both backgrounds")
-    else:
-        print("Failed to encode images")
-except Exception as e:
-    print(f"Error: {e}")
+from PIL import Image
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(ROOT, "static", "login")
+
+# Outer page background and the inner container overlay
+SOURCES = {
+    "login_bg": os.path.join(ROOT, "neuro_background_v2.jpg"),
+    "login_container": os.path.join(ROOT, "login_container.jpg"),
+}
+WIDTHS = (480, 768, 1024)          # never upscaled past the source width
+WEBP_QUALITY = 78
+JPEG_QUALITY = 80
+
+
+def _save(img, name, width, ext, **options):
+    path = os.path.join(OUTPUT_DIR, f"{name}-{width}.tmp.{ext}")
+    img.save(path, **options)
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:10]
+    final = f"{name}-{width}.{digest}.{ext}"
+    os.replace(path, os.path.join(OUTPUT_DIR, final))
+    return "login/" + final
+
+
+def build():
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    for old in os.listdir(OUTPUT_DIR):
+        os.remove(os.path.join(OUTPUT_DIR, old))
+
+    manifest = {}
+    for name, src in SOURCES.items():
+        with Image.open(src) as original:
+            original = original.convert("RGB")
+            widths = sorted({min(w, original.width) for w in WIDTHS})
+            variants = []
+            for width in widths:
+                height = round(original.height * width / original.width)
+                img = original.resize((width, height), Image.LANCZOS) if width != original.width else original
+                variants.append({
+                    "width": width,
+                    "webp": _save(img, name, width, "webp", format="WEBP", quality=WEBP_QUALITY, method=6),
+                    "jpeg": _save(img, name, width, "jpg", format="JPEG", quality=JPEG_QUALITY,
+                                  optimize=True, progressive=True),
+                })
+        manifest[name] = variants
+
+    with open(os.path.join(OUTPUT_DIR, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    total = sum(os.path.getsize(os.path.join(OUTPUT_DIR, p)) for p in os.listdir(OUTPUT_DIR))
+    print(f"Wrote {sum(len(v) for v in manifest.values())} variants to {OUTPUT_DIR} ({total / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    build()
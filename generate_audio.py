@@ -1,19 +1,46 @@
-from gtts import gTTS
+"""
+Build step for the voice prompts.
+
+Synthesizes every prompt with a pluggable TTS backend, converts it to
+mono 16-bit PCM at one sample rate, peak-normalizes it and packs all
+prompts into one file (cues.pcm) with a JSON index (cues.json). The app
+memory-maps the pack at startup instead of decoding loose WAVs.
+
+Prompts are cached by a hash of (text, voice, lang, backend, format), so
+only new or changed prompts are synthesized; the rest are taken from the
+cache. Synthesis and conversion run in a worker pool.
+
+Backends:
+    gtts     Google TTS (network) + ffmpeg
+    pyttsx3  local offline engine + ffmpeg
+    files    the recorded <name>.wav files next to this script (offline)
+    stub     deterministic tones, no dependencies (CI / no network)
+
+Usage:
+    python generate_audio.py                     # gtts
+    python generate_audio.py --backend files
+    python generate_audio.py --backend stub --out /tmp/cues.pcm
+"""
+import argparse
+import hashlib
+import json
+import os
 import subprocess
+import tempfile
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PACK_PATH = os.path.join(ROOT, "cues.pcm")
+CACHE_DIR = os.path.join(ROOT, ".audio_cache")
+
+SAMPLE_RATE = 24000
+PEAK_DBFS = -1.0
 
-def make(file, text):
-    mp3_file = file.replace(".wav", ".mp3")
-    wav_file = file
-    tts = gTTS(text=text, lang='en', slow=False)
-    tts.save(mp3_file)
-    print(f"Generated: {mp3_file}")
-    
-    # Convert MP3 to WAV using ffmpeg
-    subprocess.run(['ffmpeg', '-i', mp3_file, '-y', wav_file], 
-                   capture_output=True, check=True)
-    print(f"Converted: {wav_file}")
-
-sounds = {
+PROMPTS = {
     "press.wav": "Press now",
     "getready.wav": "Get ready",
     "hold3sec.wav": "Hold for three seconds",
@@ -22,10 +49,190 @@ sounds = {
     "1.wav": "One",
     "release.wav": "Release slowly",
     "goodjob.wav": "Good job, next repetition",
-    "ding.wav": "done"
+    "ding.wav": "done",
 }
 
-for file, text in sounds.items():
-    make(file, text)
 
-print("All audio files generated successfully!")
+def index_path(pack_path):
+    return os.path.splitext(pack_path)[0] + ".json"
+
+
+# ========== TTS BACKENDS ==========
+# A backend turns (name, text) into mono int16 samples at SAMPLE_RATE.
+
+def _ffmpeg_to_pcm(path):
+    """Decode any audio file to mono s16le at SAMPLE_RATE."""
+    out = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", path, "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-"],
+        capture_output=True, check=True,
+    ).stdout
+    return np.frombuffer(out, dtype=np.int16)
+
+
+class GTTSBackend:
+    name = "gtts"
+
+    def __init__(self, lang="en", voice=""):
+        self.lang = lang
+        self.voice = voice or "com"     # gTTS top-level domain, selects the accent
+
+    def synthesize(self, name, text):
+        from gtts import gTTS
+
+        with tempfile.TemporaryDirectory() as tmp:
+            mp3 = os.path.join(tmp, "prompt.mp3")
+            gTTS(text=text, lang=self.lang, tld=self.voice, slow=False).save(mp3)
+            return _ffmpeg_to_pcm(mp3)
+
+
+class Pyttsx3Backend:
+    """
+    Offline system voices. pyttsx3.init() returns one engine per process
+    and its run loop is not re-entrant, so synthesis is serialized; the
+    build pool still reads cached prompts in parallel.
+    """
+
+    name = "pyttsx3"
+    _lock = threading.Lock()
+
+    def __init__(self, lang="en", voice=""):
+        self.lang = lang
+        self.voice = voice          # engine voice id; default voice when empty
+
+    def synthesize(self, name, text):
+        import pyttsx3
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "prompt.wav")
+            with self._lock:
+                engine = pyttsx3.init()
+                if self.voice:
+                    engine.setProperty("voice", self.voice)
+                engine.save_to_file(text, path)
+                engine.runAndWait()
+            return _ffmpeg_to_pcm(path)
+
+
+class FilesBackend:
+    """Existing recordings (<name> in `directory`), e.g. the committed WAVs."""
+
+    name = "files"
+
+    def __init__(self, lang="en", voice="", directory=ROOT):
+        self.lang = lang
+        self.voice = voice
+        self.directory = directory
+
+    def synthesize(self, name, text):
+        path = os.path.join(self.directory, name)
+        with wave.open(path, "rb") as w:
+            if (w.getnchannels(), w.getsampwidth(), w.getframerate()) != (1, 2, SAMPLE_RATE):
+                return _ffmpeg_to_pcm(path)
+            return np.frombuffer(w.readframes(w.getnframes()), dtype=np.int16)
+
+    def fingerprint(self, name):
+        with open(os.path.join(self.directory, name), "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+
+class StubBackend:
+    """A short tone per word: right shape and length, no network or engine."""
+
+    name = "stub"
+
+    def __init__(self, lang="en", voice=""):
+        self.lang = lang
+        self.voice = voice
+
+    def synthesize(self, name, text):
+        t = np.arange(int(SAMPLE_RATE * 0.25)) / SAMPLE_RATE
+        words = []
+        for i, _ in enumerate(text.split()):
+            tone = np.sin(2 * np.pi * (440 + 40 * i) * t) * np.hanning(len(t))
+            words += [tone, np.zeros(int(SAMPLE_RATE * 0.05))]
+        return (np.concatenate(words) * 16000).astype(np.int16)
+
+
+BACKENDS = {b.name: b for b in (GTTSBackend, Pyttsx3Backend, FilesBackend, StubBackend)}
+
+
+# ========== BUILD ==========
+def prompt_hash(backend, name, text):
+    parts = {
+        "text": text,
+        "voice": backend.voice,
+        "lang": backend.lang,
+        "backend": backend.name,
+        "rate": SAMPLE_RATE,
+        "peak_dbfs": PEAK_DBFS,
+    }
+    if hasattr(backend, "fingerprint"):
+        parts["source"] = backend.fingerprint(name)
+    return hashlib.sha1(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def normalize(samples):
+    """Peak-normalize to PEAK_DBFS so every prompt plays at the same level."""
+    x = samples.astype(np.float32)
+    peak = np.abs(x).max()
+    if peak == 0:
+        return samples
+    gain = (10 ** (PEAK_DBFS / 20) * 32767) / peak
+    return np.clip(np.round(x * gain), -32768, 32767).astype(np.int16)
+
+
+def build_prompt(backend, name, text):
+    """Cached, normalized PCM for one prompt. Returns (name, digest, samples, cached)."""
+    digest = prompt_hash(backend, name, text)
+    cache_path = os.path.join(CACHE_DIR, digest + ".pcm")
+    if os.path.exists(cache_path):
+        return name, digest, np.fromfile(cache_path, dtype=np.int16), True
+    samples = normalize(backend.synthesize(name, text))
+    tmp = cache_path + ".tmp"
+    samples.tofile(tmp)
+    os.replace(tmp, cache_path)
+    return name, digest, samples, False
+
+
+def build(backend, prompts=PROMPTS, out=PACK_PATH, workers=4):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda item: build_prompt(backend, *item), prompts.items()))
+
+    index = {"sample_rate": SAMPLE_RATE, "channels": 1, "sample_width": 2, "cues": {}}
+    offset = 0
+    tmp = out + ".tmp"
+    with open(tmp, "wb") as f:
+        for name, digest, samples, _ in results:
+            f.write(samples.tobytes())
+            index["cues"][name] = {
+                "offset": offset,                 # bytes into the pack
+                "frames": len(samples),
+                "text": prompts[name],
+                "hash": digest,
+            }
+            offset += samples.nbytes
+    os.replace(tmp, out)
+    with open(index_path(out), "w") as f:
+        json.dump(index, f, indent=2)
+
+    cached = sum(1 for *_, hit in results if hit)
+    print(f"Packed {len(results)} prompts into {out} ({offset / 1024:.0f} KB); "
+          f"{len(results) - cached} synthesized, {cached} from cache")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", default="gtts", choices=sorted(BACKENDS))
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--voice", default="", help="backend-specific voice (gTTS: tld such as com, co.uk)")
+    parser.add_argument("--out", default=PACK_PATH)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    backend = BACKENDS[args.backend](lang=args.lang, voice=args.voice)
+    build(backend, out=args.out, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
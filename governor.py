@@ -0,0 +1,134 @@
+import logging
+from dataclasses import dataclass
+
+from metrics import summarize
+from overlay import QUALITY_FINGERTIPS, QUALITY_FULL, QUALITY_REFLEX
+
+log = logging.getLogger("neurorehab")
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    name: str
+    model_complexity: int       # Hands model_complexity (legacy backend)
+    inference_scale: float      # frame scale fed to the model
+    infer_every: int            # run inference on every Nth frame, extrapolate in between
+    overlay: str                # most detailed overlay allowed
+
+    def __str__(self):
+        return (f"{self.name} (model {self.model_complexity}, {self.inference_scale:.0%} input, "
+                f"inference every {self.infer_every} frame{'s' if self.infer_every > 1 else ''}, "
+                f"{self.overlay} overlay)")
+
+
+# Cheapest step first: the lite model loses little accuracy for a big gain,
+# skipping frames costs the most in responsiveness.
+LADDER = (
+    QualityLevel("high", 1, 1.0, 1, QUALITY_FULL),
+    QualityLevel("lite model", 0, 1.0, 1, QUALITY_FULL),
+    QualityLevel("reduced input", 0, 0.75, 1, QUALITY_FULL),
+    QualityLevel("low input", 0, 0.5, 1, QUALITY_FINGERTIPS),
+    QualityLevel("every 2nd frame", 0, 0.5, 2, QUALITY_FINGERTIPS),
+    QualityLevel("every 3rd frame", 0, 0.5, 3, QUALITY_REFLEX),
+)
+
+
+# ========== CLOSED-LOOP QUALITY GOVERNOR ==========
+class QualityGovernor:
+    """
+    Holds a camera loop at `target_fps` by stepping through LADDER.
+
+    Every `interval` seconds tick() compares the loop's StageMetrics with
+    the previous window. The target is capped at the FPS the source
+    actually delivers (the "read" stage): a 15 FPS webcam cannot make a
+    20 FPS loop, and no quality level would change that. It steps down a
+    level when the achieved FPS is below that target by more than
+    `tolerance` for `down_after` windows in a row and p95 inference is what
+    limits it, i.e. does not fit the per-inference budget. It steps back up after
+    `up_after` windows at target in which p95 inference also used less
+    than `headroom` of the budget, so the costlier level above is likely
+    to fit. It never changes more than one level per window, and the window
+    after a change is not judged (the new level has not settled yet).
+
+    tick() returns the new QualityLevel when the level changed, else None.
+    """
+
+    def __init__(self, metrics, target_fps=20.0, ladder=LADDER, interval=2.0, tolerance=0.1,
+                 headroom=0.5, down_after=2, up_after=3, start_level=0):
+        self.metrics = metrics
+        self.target_fps = target_fps
+        self.ladder = ladder
+        self.interval = interval
+        self.tolerance = tolerance
+        self.headroom = headroom
+        self.down_after = down_after
+        self.up_after = up_after
+        self.index = start_level
+        self.last_fps = None
+        self._snapshot = None
+        self._slow = 0
+        self._fast = 0
+        self._settling = False
+
+    @property
+    def level(self):
+        return self.ladder[self.index]
+
+    def tick(self, now):
+        snap = self.metrics.snapshot()
+        if self._snapshot is None:
+            self._snapshot = snap
+            return None
+        if now - self._snapshot["time"] < self.interval:
+            return None
+        summary = summarize(snap, self._snapshot)
+        elapsed = snap["time"] - self._snapshot["time"]
+        self._snapshot = snap
+        if self._settling:
+            self._settling = False
+            return None
+        reads = summary["stages"].get("read", {}).get("count", 0)
+        source_fps = reads / elapsed if reads and elapsed > 0 else None
+        return self.observe(summary["fps"], summary["stages"].get("process", {}).get("p95_ms"), source_fps)
+
+    def observe(self, fps, inference_p95_ms, source_fps=None):
+        """
+        Judge one window: achieved loop FPS, p95 inference time (ms, or
+        None) and the FPS the source delivered (None if unknown).
+
+        Only inference is stepped down for, so without a p95 (no inference
+        in this process, e.g. a StationClient) a slow loop is left alone.
+        """
+        self.last_fps = fps
+        if fps is None:
+            return None
+        target = min(self.target_fps, source_fps) if source_fps else self.target_fps
+        budget_ms = 1000.0 * self.level.infer_every / target
+        inference_bound = inference_p95_ms is not None and inference_p95_ms > (1 - self.tolerance) * budget_ms
+        if fps < target * (1 - self.tolerance):
+            self._fast = 0
+            if not inference_bound:
+                # Slow for another reason (camera, display, disk): cheaper inference won't help
+                self._slow = 0
+                return None
+            self._slow += 1
+            if self._slow >= self.down_after and self.index < len(self.ladder) - 1:
+                return self._step(+1, fps)
+            return None
+
+        self._slow = 0
+        if inference_p95_ms is not None and inference_p95_ms < self.headroom * budget_ms:
+            self._fast += 1
+            if self._fast >= self.up_after and self.index > 0:
+                return self._step(-1, fps)
+        else:
+            self._fast = 0
+        return None
+
+    def _step(self, direction, fps):
+        self.index += direction
+        self._slow = self._fast = 0
+        self._settling = True
+        log.info("quality %s to %s: %.1f FPS vs target %.0f", "down" if direction > 0 else "up",
+                 self.level, fps, self.target_fps)
+        return self.level
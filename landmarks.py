@@ -0,0 +1,162 @@
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import mediapipe as mp
+
+from models import DEFAULT_HANDS_PARAMS
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+HAND_LANDMARKER_MODEL = os.environ.get(
+    "NEUROREHAB_HAND_MODEL", os.path.join(ROOT, "hand_landmarker.task")
+)
+HAND_LANDMARKER_URL = (
+    "https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/latest/"
+    "hand_landmarker.task"
+)
+
+SOLUTIONS, TASKS = "solutions", "tasks"
+BACKENDS = (SOLUTIONS, TASKS)
+
+
+# ========== LANDMARK PROVIDERS ==========
+# One interface over the inference backends, so HandPipeline (and the
+# benchmarks) can run either on the same frames:
+#
+#   provider.start(on_result, on_dropped)       on_result(item, hands) per finished frame
+#   provider.submit(item, rgb, timestamp)       timestamp: capture time, time.monotonic()
+#   provider.close()
+#
+# `item` is the caller's handle for the frame (HandPipeline passes the
+# pending FrameResult). `hands` is a list of objects with a `.landmark`
+# sequence of (x, y, z) normalized landmarks, like multi_hand_landmarks,
+# or None. A synchronous provider calls on_result before submit() returns;
+# an asynchronous one calls it later from its own thread, and may skip
+# frames it was too busy for: on_dropped(item) hands those back.
+
+class SolutionsProvider:
+    """Legacy mp.solutions.hands.Hands (or an ROITracker around it): blocking process()."""
+
+    name = SOLUTIONS
+    asynchronous = False
+
+    def __init__(self, hands, owned=False):
+        self.hands = hands
+        self.owned = owned          # close the graph with the provider (not for pooled graphs)
+        self._on_result = None
+
+    def start(self, on_result, on_dropped=None):
+        self._on_result = on_result
+        return self
+
+    def submit(self, item, rgb, timestamp):
+        self._on_result(item, self.hands.process(rgb).multi_hand_landmarks)
+
+    def close(self):
+        if self.owned:
+            self.hands.close()
+
+
+class TasksProvider:
+    """
+    MediaPipe Tasks HandLandmarker in LIVE_STREAM mode.
+
+    submit() hands the frame to detect_async() and returns at once; the
+    graph runs on MediaPipe's own threads and results arrive through the
+    result callback, so the caller's loop is never blocked by inference.
+    When the graph is busy MediaPipe drops frames; frames older than a
+    delivered result are passed to on_dropped.
+    """
+
+    name = TASKS
+    asynchronous = True
+
+    def __init__(self, model_path=HAND_LANDMARKER_MODEL, max_num_hands=2, min_detection_confidence=0.88,
+                 min_tracking_confidence=0.88, min_presence_confidence=0.5, **_):
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"HandLandmarker model not found at {model_path}; download it from {HAND_LANDMARKER_URL} "
+                "or set NEUROREHAB_HAND_MODEL"
+            )
+        vision = mp.tasks.vision
+        self._options = vision.HandLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_presence_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            result_callback=self._callback,
+        )
+        self._landmarker = None
+        self._pending = {}              # timestamp_ms → item, in submission order
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._on_result = self._on_dropped = None
+
+    def start(self, on_result, on_dropped=None):
+        self._on_result = on_result
+        self._on_dropped = on_dropped
+        self._landmarker = mp.tasks.vision.HandLandmarker.create_from_options(self._options)
+        return self
+
+    def submit(self, item, rgb, timestamp):
+        # LIVE_STREAM needs strictly increasing millisecond timestamps
+        ts = max(int(timestamp * 1000), self._last_ms + 1)
+        self._last_ms = ts
+        with self._lock:
+            self._pending[ts] = item
+        self._landmarker.detect_async(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb), ts)
+
+    def _callback(self, result, output_image, timestamp_ms):
+        with self._lock:
+            item = self._pending.pop(timestamp_ms, None)
+            skipped = [ts for ts in self._pending if ts < timestamp_ms]
+            dropped = [self._pending.pop(ts) for ts in skipped]
+        if self._on_dropped is not None:
+            for old in dropped:
+                self._on_dropped(old)
+        if item is not None:
+            hands = [SimpleNamespace(landmark=lms) for lms in result.hand_landmarks] or None
+            self._on_result(item, hands)
+
+    @property
+    def in_flight(self):
+        with self._lock:
+            return len(self._pending)
+
+    def close(self):
+        if self._landmarker is not None:
+            self._landmarker.close()
+            self._landmarker = None
+        with self._lock:
+            dropped = list(self._pending.values())
+            self._pending.clear()
+        if self._on_dropped is not None:
+            for old in dropped:
+                self._on_dropped(old)
+
+
+def tasks_available(model_path=HAND_LANDMARKER_MODEL):
+    return hasattr(mp, "tasks") and os.path.exists(model_path)
+
+
+def as_provider(hands):
+    """Wrap a Hands-like object (process(rgb)) as a provider; providers pass through."""
+    return hands if hasattr(hands, "submit") else SolutionsProvider(hands)
+
+
+def create_provider(backend=SOLUTIONS, **params):
+    """A fresh provider for `backend` (SOLUTIONS builds an unpooled Hands graph)."""
+    params = dict(DEFAULT_HANDS_PARAMS, **params)
+    if backend == TASKS:
+        return TasksProvider(**params)
+    return SolutionsProvider(mp.solutions.hands.Hands(**params), owned=True)
+
+
+def wait_idle(provider, timeout=2.0):
+    """Wait for an asynchronous provider's in-flight frames to come back."""
+    deadline = time.monotonic() + timeout
+    while getattr(provider, "in_flight", 0) and time.monotonic() < deadline:
+        time.sleep(0.005)
@@ -0,0 +1,70 @@
+import logging
+import threading
+from collections import deque
+
+import numpy as np
+
+log = logging.getLogger("neurorehab")
+
+# Cue paths a patient actually perceives
+PRESS_TO_HOLD = "press_to_hold"        # fingertip contact → "Hold" starts playing
+RELEASE_TO_DING = "release_to_ding"    # lift-off detected → "ding" starts playing
+
+
+# ========== MOTION-TO-SOUND LATENCY ==========
+class LatencyTracker:
+    """
+    Motion-to-sound latency per cue path for one session.
+
+    expect(path, motion_time) returns an `on_start` callback for the audio
+    engine; when the cue really starts playing, the gap to `motion_time`
+    (the capture timestamp of the frame that showed the motion, on the
+    time.monotonic() clock) is recorded. That gap spans inference, the
+    smoothing and stability gates, the cue scheduler and the audio queue.
+
+    Latencies above `budget` seconds are logged and passed to
+    `on_violation(path, latency)`. With `metrics` the samples are also
+    recorded as a stage of that StageMetrics (HUD / export).
+    """
+
+    def __init__(self, budget=0.5, metrics=None, on_violation=None, max_samples=1000):
+        self.budget = budget
+        self.metrics = metrics
+        self.on_violation = on_violation
+        self.samples = {PRESS_TO_HOLD: deque(maxlen=max_samples), RELEASE_TO_DING: deque(maxlen=max_samples)}
+        self.violations = 0
+        self._lock = threading.Lock()
+
+    def expect(self, path, motion_time):
+        def on_start(started_at):
+            self.record(path, started_at - motion_time)
+        return on_start
+
+    def record(self, path, latency):
+        with self._lock:
+            self.samples[path].append(latency)
+            over = self.budget is not None and latency > self.budget
+            if over:
+                self.violations += 1
+        if self.metrics is not None:
+            self.metrics.record(path, latency)
+        if over:
+            log.warning("%s latency %.0f ms exceeds budget %.0f ms", path, latency * 1000, self.budget * 1000)
+            if self.on_violation is not None:
+                self.on_violation(path, latency)
+
+    def summary(self):
+        """{path: {count, p50_ms, p95_ms, max_ms, over_budget}} for paths with samples."""
+        with self._lock:
+            samples = {path: np.array(values) for path, values in self.samples.items() if values}
+        out = {}
+        for path, values in samples.items():
+            p50, p95 = np.percentile(values, [50, 95])
+            out[path] = {
+                "count": len(values),
+                "p50_ms": p50 * 1000,
+                "p95_ms": p95 * 1000,
+                "max_ms": values.max() * 1000,
+                "over_budget": int((values > self.budget).sum()) if self.budget is not None else 0,
+            }
+        return out
@@ -1,2 +0,0 @@
-LOGIN_BG_B64 = "data:image/png;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/4gHYSUNDX1BST0ZJTEUAAQEAAAHIAAAAAAQwAABtbnRyUkdCIFhZWiAH4AABAAEAAAAAAABhY3NwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAA9tYAAQAAAADTLQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlkZXNjAAAA8AAAACRyWFlaAAABFAAAABRnWFlaAAABKAAAABRiWFlaAAABPAAAABR3dHB0AAABUAAAABRyVFJDAAABZAAAAChnVFJDAAABZAAAAChiVFJDAAABZAAAAChjcHJ0AAABjAAAADxtbHVjAAAAAAAAAAEAAAAMZW5VUwAAAAgAAAAcAHMAUgBHAEJYWVogAAAAAAAAb6IAADj1AAADkFhZWiAAAAAAAABimQAAt4UAABjaWFlaIAAAAAAAACSgAAAPhAAAts9YWVogAAAAAAAA9tYAAQAAAADTLXBhcmEAAAAAAAQAAAACZmYAAPKnAAANWQAAE9AAAApbAAAAAAAAAABtbHVjAAAAAAAAAAEAAAAMZW5VUwAAACAAAAAcAEcAbwBvAGcAbABlACAASQBuAGMALgAgADIAMAAxADb/2wBDAAEBAQEBAQEBAQEBAQEBAQIBAQEBAQIBAQECAgICAgICAgIDAwQDAwMDAwICAwQDAwQEBAQEAgMFBQQEBQQEBAT/2wBDAQEBAQEBAQIBAQIEAwIDBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAT/wAARCAMcBAADASIAAhEBAxEB/8QAHgAAAQQDAQEBAAAAAAAAAAAAAAQFBwgDBgkBAgr/xABuEAABAgMDBggKBQgECAkKAQ0EAAUBAwYHERQIExUhJDECNEFRYXGB8BYjJTM1RFRkkbFFdKHB0QkSFyZDgoThNlWU8SJCRlNiZXWSGCcyUmOFpLTUVnJzg5Oio7XE5Bk3OGZ2s8LD8ld3hqXF/8QAHQEAAQUBAQEBAAAAAAAAAAAAAAQFBgcIAwECCf/EAFkRAAAFAgIFBwcIBgcGBQMEAwACAwQFAQYREgcTFCExIiMyQUJRUhUkM2FxgZEWQ2JyobHB8Ag0U4KS0SVEY6Ky4fEXJjVzk8JUg7PD0zaj0ic34uNkhPL/2gAMAwEAAhEDEQA/AOyVSVsGDKB2/ahI3PDwcqUVs/OJ07z/AEb1gqStnJ8Nw5B2LGWnmTs/cv0asPRktFKi1UPJ0VHn2f0gZzDZ2en4nr1Q3JtnGfBLHIz49GtMK05DxtEBTs7PednQbnChJ0nQpUIUssFGf6PsTgm+TJTggIQIQvibv7YoHqPAfaTZmPT8YLNnY9P+8sM7fHrh8koHdmMCEISgP6PELZW/tgsS8k74dcfkvUBSFCToQgAEpk7odUfmkyUyd0OqPzQPpH0tfcPE4JvThK8zDvzJOHNLiHBYJ3mY9UESd0OqPzRO8zHqgk4l6K2vHiTTvPR64JVO8zHqgks7z0euCUBiR9MFKEIQJiBCEoQFAJM5CEJOF6KwE4JL+2/eXsnfDrj8knCkZpHmuF1/eibv7Yr7QgKEOsC9k7odUfmvEoleZh35kBalxAnBJ0IDkjxChC+JW/tgvtJwqR4BwQhCbxJwo9S786cE3+pd+dOCA2K8Q1zvO/u/gsiTrLK39sEB4S4j7QhCB9hOhKEnQHlHgHCRy9+ZCJHL35kIDolxAhC2BJllh2WWqhXeBE3zMe/OkOsePe+K8z0Oj4RXDUesI9TUJlllb+2CxLLK39sEoDiPtCEICgCcEIScOKKOz0AhCEDuBCEIABJ0oSdAUo8AIQlCB3ChCEJOHgCEIQACEIQACEIQFAEIQgAEIXxN39sUAGJCyyt/bBYkAAhCEAAhCEAAss3f2xWJCAASrCTe8ElTwgATz+TvzrtrkWPEl1yfaeb79qp90OYzP7Xd+C4lSZyvzkI2nSqdr10s5doww1aRxzP0kD74KlNO0GtM2MY7emNWpiLe7hX4UriKT03QKz6zdeh/Vv8AIWfykJOHDkEbxRPinKrw8dk+MeHnClYRrkYyEYb+dbJlIM846lZ5I/GhFANg7vOqOwGv2cjayqeKnrPcdWq9pMJan9WcFz/vjP0a0qvaTCe/8MvkN++Ki5I1eGU3bYRT8btF1AUREu9dpGedj20jn7V+fOhDZrHazS7wPD0q6D/9oKXZ+wavQ6qYrvWml0nsZnLCPOpnp6t6lJMk43JxTJnHfSzbbtBU8s47BtUca5bYHh2eeRyc3OuQFYBYF+OH9r27rXbW2EOdoE8ePVv3rkhWzZ4o9oI401bcJHlUg0HydaND7hZ36PEtqEVkK/ngIIct0O/JFRu//wDKipCO8zFaS8SVqqN4iY6X0ea3iJcGZPMkN48jFlF7CGHHUvX9nZ2LPt5E+Ds/Catfo5bq2zpNONro4ZjFuhewh7Bqb/e1HrbR786ztm2MX1x4O9HN6it063kahtrmwwmrGpIJEboEzvVuV9QgYQm2dUbl5P2QUTjhn9Xjpycp2fbJ7e0YoSlsVfAz+sE8Pz8wtTbIpen9rGEKxxmr0gStJnZ52nSMTPxYt9/NeqfWRZsVlmKB9dIren1XJ/c1n7MNytUWNNnbnGGdOkyNnb4R+ubrkNsnm7VnzMen4wSlI42HVfSJHD70ZOiUnQCMeyd0OqPzTulAeZ9Y+1P2DD4wNioCq/oK22bJLEDNmtK+gDCnIOT8PsSycHCRquh96eG2T9vxU31tRKo223flEmvGyNsn7PgtkDk+O6eXkisLbJ5u1P4cmOen/imFZYbAsm3K1SREhWesOnH4Efm+1dbbJaPwEkH+5UtydaDz5klwzGuHJHeunzRJktQZ7hcsh6abqqu78ktxXumq6de7JFNxUuo5UartrdIj8VaYYG5XqYQ8xJkQ6boXqn9ibDNdHI6pyJEMU7FY0yCs3aVVcmgLM6wq8iOtqYiIx6LlUV6nVVcM4JnXeQpCe/cK4u6lF5FnbbD5kpCjiFbtUnhjaxaJUEifisZU+BEhdds7fDCqGUJRnZPP9q3xCRiMRGIRzfgmUhP4MBvaIiEoWJRiUOwUN6UJOlCcg8LcQIQhA9AhCEAEKmGfFM5jln/2/wAVhMMTOnRnD9Q/LmYuNXlt25woSdJ0J8ECWW1++oEIQlA5AQhKJHL35kAGcPf2filKTB7+z8Vmm7+2KAnHn7PvzpGls3f2xSJd0eIdGQEIQlIdAtlb+2CxJQk6B09AkQCEoSdA9S4hQvZO6HVH5rxeyd0OqPzQFaXpgSd0OqPzS9IJO6HVH5pfK8zDvzJOHFHgMsrf2wX2viVv7YL7QO6voR9ax4974rFOnc2/velaZ0AZhbK39sESZPPv73L7QgSlmijqSAShJ0oQHcCEIQAZv237yzyt/bBYZO+HXH5LNK39sE3h4BN39sViShfErf2wQF6PEZJO6HVH5rOsEndDqj81nQFSPAKEIQk4XhwShJ5HL35koTeJQBCE8IBrtQEOsePe+KSp4TXO87+7+CAIrDIhCEBwAk6EIDqij3hQviVv7YIlb+2C+0BWiiPr9hP78kEuTehAUBQnib5mPfnShCb9f6h5rqhDHxEjD61hned/d/BE7zv7v4LGlAVI8Bllb+2C+0nShAXgQhKJHL35kDqlxChCEJOHMCFlm7+2KxICgCEIQPUeAEIShA7hOhKEJOFAEIQgOAEIQgAEIQgKAISdCAAQhKEACdCEIABCEIAFHqXfnSdCeEACHCTe8ElTwhAAnleZh35kZjp+1KEIAE8rzMO/MhKEIABbPRLjNbKvpZ2H1ki1OAbGF/Ji1pCf2jU5NMf9aDx/7Wm2UQK4jVm5qbjl/wBQnkUde1Og4H6DLSJMSGE7q5FXKwygvB2VaUAPI8mP40g4OEOdWeq+Tn23t38qiWxrGDttRjkkcUdJ8NXKvzwinyidpuG6PA5iV+FaVp8MB+csPJKoW88QQP0zFHD2TKz9V0c4D8aEdBwb7rlcvIzqqcDa1X1IET9RcJ750wIHVeqJoRxqO0eiBx5BOjHVznnNLtu4uUp4sDpBypzKzqK6SVhafbHbF8sd/wDete6Qn8Y9gJCLzl1lGuf18hT+Y0vpGVaUin8S37fKN+4QdNKqkyXUPaY3rm/aFR92lXDlaY43oVprEsotstbd6ppk9rGpV9anOeEGJj/SHSo5tguBcqiHH2WJeu+5UJZCctbM4aDfEyK8gUxo/wDLlrXCdi4JkUHM1+Cw5Z2H4qXDY+hR9NzPj8TxXp3qRzZPn4eybDg//qlHzkH5/wAQVhS9623F15nAauu9FZdrt7cae8VVh52HHamv+OA3qNnh/eDpMByDrhbrsGCtqeGdx1z4SChBYc2qK1Wc2mT+L9UUskY6i7TUNxgm7nlwuJEzdc6mrP2RqaFsHgrOInbQcIIjByB5PnxVVaNoy8rn2hsUggiqKzGnaDDJk9W7qTlJk+Jjd2rNObZwPvYvxT82ts4+dIw8gotTa3LcRb/r6OQCLN2+XI3b+lGZtZ+jcpCDYU5M7DO/zBXMvaqM0GHIb2/UUXzKVLPf6u3Gm4Gyo+0LePOzpObJ/fONIcszjJ4zfteE3J4Zws/2b4a9axNtKvE+THxEfrmAUpsNEGZnaJH8kKySSKO44LQtyWm5Hysu2yJnMGiTJz8dylOhKIn1G8SG8eRqKhr5L96bWdiknGQAaLi+XqXRmxOzKRTkB45jFvpiq++73Rt2OOvX0vYF5T1xtLQg+ztPZE22b2bSqVlAj5gq4TctkthfotTRIpdvh5UqHjev0eOpIeHhto5hnvDhP2YQTveoHolnMrF+n1BUHGiyvgsXIu1pR4e5Jb0RP75xkyMWWlJE9yTwmyg2HAhyPs5FWHL2ryS1UIx0APP2qoCsaZdyDt938lexuDkjyO964O5QdpH6U7VKpqYc6BbFidCU5zQHH5VINEkIpdN/llHPom3PG9u7Cnx3+4TDRBArXTfBH7j0bblGFffF971jSqdO6t3UvlbtG6x8Td/bFfaEICgezt0eqHzXisExVpZoFY9U9NH0zi64K4MYDVB+bf8AnRjujfyXKv07dHqh80zxcqtILOm7hqZPVmyEz4c5TDjT1e3CobkfOKrUXRMTIb+MeIXxK39sFiTwFIrOhEmck6mKPAfj4str99QIXs7dHqh814u45AQhCAATwmdPCBwW4AXxN39sV9pNO3x64fJd0eI7skaLrYjNN39sUiWedvj1w+SwIR4hYyAhCzyd8OuPySkOg9QhCAAQlCToCgCeEzp4XwrxC9nxHknfDrj8kpSaTvh1x+SUrkHkfErf2wX2viVv7YL7QAezvMx6oJLO89HrgnFN07z0euCAnZ+m/PqCqTuh1R+azrBJ3Q6o/NZ0CepcRnk74dcfksCEIH2BCEIABLZHmuF1/esMnfDrj8kpTeHgC+JW/tgibv7Yr7QF6PEeyd0OqPzS6Tvh1x+SwLPno9PwggOKHWM0rf2wX2k6UJOHFHgFEjl78yUIQm8P6HWFQnnV8+pd+dfQnnV8+pd+dercAK+mCdCEoXgcAL69oxPfvBfKEAAhCEB1S4j4lb+2C+0JRDzJCA5gQhC+FeIUo8A4h7p/V96XpAHun9X3pemtbgEq3pgzoQss3f2xS8OIJW/tgvtCEBQBOCb0okcvfmQFKPAEjl78yUIQk4XI8QIQhAUgQhKEBQh1hOlCEIABCEJOFAEIQgOAEIQgAEL4m7+2KxICgKEnQlRfnUACVCE8IAGdPCTyvMw78yUIABCEJOACE3oSgKdTQOCEIScJgnleZh35kJQhKAAQhCTgAsk6T5+P8dfcsa+f2P7yAD9HRs6S6s4JA/rYqjez1ukgh1GMNI42URC+O9J8nmpPDGw6zx3jDVoLBmc8SANl/FbZTcMw8vY8fnr5l+aZk1o4r+LX7B60/grgPzMWRVi6uWDgccbGZLlOygqcpGM7CNjTWB54nTdC9Xjs+tJoKobTa+zDo1iPpTofSsRL/KB+HVL7VeDNsdylXZ2HxQgpcMaGZddxhVkqRtMBqQHEX6ULa8cZ9YIWvXtmt7+1UoVfVprNCZK4Y7+mpWv2f5DTk7EUu9p5Wfn5s5SkL++fOLH2hWYV5Y9aFIrhg0mILisaG8ckBuZXerUyTXFEtVYMEgWMXXjYnvCrrYzlUPALbIpi0iQLVbFhcEZyuOHVkHKvbFPBt0eKYqIWAt22NENgcG9QO6q3OhJsm8wz85R5BF0uWRQnr7t/eG2dtu7drbbfFeckN6VLlkOOWr+wzgKjkDjzhcLDjkDd60pyDnDzsfmNmxXYp1DruijXGQ0VvTsRWKJXHGWN8AFJVo9ijjPo9qq+kDRarpgXbQywdV456vT5WUiniEfM01es7R+gf38MfV8BZ07JeRFvJU6fnBzmqSdOkTp/P0qN506d9ynOvGHMTjv7coMnSe8VbCK2vaJjFmlJo7Yzg9z04ffit6Vhhzjp2zSCt16cmFhMfHIFvHkcbK5V0Ws/s9YqBbJ5LRRP6X66E1RDBu0ewEKL3RcSNsN8zimsUP2Ph11wpT4/GoYrbsl5KpUfODmI2IKzUVk7WgVe24gClnMps6Y3KzUnJxo6zVmnu9auzYWULxKhQTRInuBKaKqkZa1pYk4CMhzpNi5GmlgNHt6hSdkXZRMdoGBJL5daq55dUpIVqWRlkEEs3QROQ9f+qetMPdT2VE2otIRWRdiw6Hb7YsRTdBNNUtkip3isKOsfYzIbGIyQx9YxHW5NuRc/u0CHij63pit/Kess4HX/ABVyiyVkUVSA2yHeuaqYaejhdYZz6JGGIVvw22fZxk+T2ewh98LCqfhjngsHfh9aiE7dDpgsT5JzRVKHUyeipqSE6sVOPxrvElkp2511SP2Jy9LKUpuWQQzUeTTXlHhzyBmoXfrwKhqTZVWBxk/TE4r6n37Vb2m7d6qkUu1z44qtyWBzHZKv2DWeOepEmuTFUmYIaJEBIw5ta5tr4u2NqdvLppnw7ZPz10wr68Q7wWkC5qYbcQv1iCCLN7McPGQOPI2rf0rodQdISacD18aL7IRWk0HTYY8mQ4aoXcu9aFlL2wTqHZwaQp87CVPUAmouGuLAOqnuCVlr6myQTLtm/PwEUkZKc0iXESCQ8Q0O02sJVqlbAtDAdAumKeK3b208n2pXHs9pWSxs4Lfv5lUvJvonMSZDgRI3q6NS1KxUBSznV9QT8I1tIuONjyQTPfSqDQ6FpRO9In9849vRZJFYlpxNebR/vnFc8sy1+TZ1ZybR7MdDwwrUXBR18QH9cKXFjMdP2qTLSLRn602r3urqgn7U67hI729u9lUZyfHx5+f7lrHRTZFbHtjYj/rSmB1fb3e7hQa60W2X8irdO3X/AFg/KMFCZ08IVpCyQ3oQhAUD4m7+2KxJQhAAIUjO9JUwFQLBUoFZtzo9uhMAnalY8LgxPY4x3whCEb4XdMOVR347/RTZHyqEkgo5a9R8m+lab6buvq7q8K8abg3orJL05jxZBVVCEKyx+P4EIQgAEIQgAeEIQgJwIQk07fHrh8kD6RxX3jAhZ52+PXD5LAlqXEPCKwFnk74dcfksCWyt/bBfYc0Ue8E3f2xX2vibv7YrEgCvECEIQPsKZO6HVH5rOsEndDqj81nQHVD0VQfsu/MlErzMO/Mk8rz0O/MlErzMO/Mk4EuIUIQlCAr12oCSf5rg9f3rEk6ctZEe98EBWjruNO2YfKF8St/bBfaBK0VdejtFAIQlEjl78yAqAhCEAGeTvh1x+SUr4kea4XX96+0gW4BcijVBHEKEIWeTvh1x+S8EqCGTuh1R+aXpOlsrf2wXwrxAh1glb+2C+0IXIPCKIcEIQm8SAKhPOr59S786+hPOr59S7869W4BOr6YfErf2wX2sc7zv7v4LIvAtS4gSdKEICtDrH1/j/wAV96+UL65J3b8kBYjSqH8Q+Uoh5khJ0oh5khAc1uIEIQvhXiFSPACWA+egka2BcVuI5LLczvCCduj1Q+a8SdC9CwKEIQgKAJwSeRy9+ZEjl78yApR4BOnBN6cEnHdDrAss3f2xX2hAUBOhCUIDgE6UJOlC4LcAsZAQhC8HMCEIQHACTpQk6AoAhZZW/tgvtAB7mYdHxilGZh7PH4rB+x/dS5AAn/a9+de5mHs8fis6EADehCeEBUssGdCeEmD39n4oHmuoECE8IQDXUDOhCXh7+z8UDuEC+p3nu/NBOyTB7+z8UDhrqBShCEnCYCEIQFA64ZB9RyXazKo6Yv2mn6onwuu9oVmzJOBd57hyc65s5BVSaEtPe6PIn/0rYtj54kt+pdHLW5M6RSrqSN8t6wVpLh6sdJ7xhX0bkxD/AMf+YwBpNiKMtIbxj+2N/jHJbKzrBtrK04fRE67RJV+M3Nyga0AOH6QZxMLrsJIOSStg54LwcNz/AGpn0lOdZMjSHGhNhiZzjLZltQqUVFMUmB+bTTyfd/IatjbXjmSMVEsD9ApDiQqPol+dJ0nYbxStijqT68M86nHh1byJFxXgvPjsMFdPJvsxz4YLhjsWL78tstisUpJq0nV1SziNBC3BNNOxj/gnEc93KqqkNKDMtzHinO+nDCnHHHh+fbUSSN0sxCFzngnH1S5PGOV00Mw4w7DyCSo3T4atydqbtBruzQzE0xUUdja8dBo4/Tzh7qUs7w5Tpxp0MxokaG4MKOj1qrnmc9//AIv/AIyuGqCMqhRtIIlOkfsBbpGh0kIk7hxmJnF3GyyuncryyBktXp8IWz6sTCp7GWFGGwHkt8VUysMjW2trhIHHp0kuO7YdvXQLI4ql+rfJ3bGinqcFLdLPyp4IenD9Ht1QYhb3W1pOUtSzdPZmfJ8c3bCQv8IgasEf29w+qrOEZfl52nOO7ZYro6pFU5CkWOQtSEx3VxrX7N/GlKD84PlHIVVWinxCrJ5Sco4oezWB1rYVZx4cEU7CNY1C6YHFw1ttIDqOA6pqRqbZADOdFp97CA0e4/WijFee0+pLdaCsTc7XgWkpqJLJ/OqOhXyOkHBgH9qguRNSW2Vg+Z8gdqEaSiytcQd0FZFlzD25Unb+YImvzhuWTE+8vzeHVSnVvrSvHcLx0Z6WLHtC3dmuRhkc9nKLCGO9VXz4kPj8WLddfA4vRywyYY/Z9KFR/j1BdnNuFaU85QHeTsW1uscE7RN5Fu9kwdbWmWgyWhhainaEH2RESMeSGLUzZvWhY5WQNQiaNN+foe3Hhhh7ai2Yf9JKx3CyGzxqgk5nYZJzxJb9KNcMWVrLNP1RV9KujNsRsqApGiJwzq6OrqCCWEJDHuR458bjI3JotbyWKkMrX/iwIJp+HgzjWcME65ug4yOf7FO9FWVULZLRdIVhbC60vT9ctQY8C6jqp9g37R8etUVfF/Qcqzj3tHGsT6Wz9sx+rH1bsN2PqEQ0maabYumKbbCQxEycvL8BB9B1g5tVeWwUO3tYv6vMI52EhDSF5Cz0raRaE6vOHIo4WIonra2mpLVLDLF51cWoj1ELVgtbvsgH9VvL7ceQPBV0d8umcRIn/o5oiDVEve71TDek0ZEy90VO5iIbOkoVIuc/IpQ9E6azjv7+8Z8hmaz1fZ2KJdYcpReqpLQ2ygKV8Jq3wosYQuDaIa4nkKiDA5PFotYHVe/wwjm6k33+wdCq68VfUlfv0Knq91KdXP2ze3Aa+RWvsBDnHTodfKpe2sJOwoRy/dHKd8cvK7iU7qfj3/AaJgrFRsm2FpbP5yco6WWY03Jam2RDMR57lSXL1tTxDmyWYs8+8ZpzD3Ud+raPU/tXRulpOGCkxuvuhfHkXAi1SqvDi0GsKwu9Kvs81VnociC3LpAWm3/o2pc/75+H3V+AgehqHrcV5Hl1/wCrcoRqhbU7sb4zYIh2bHxrgSNjBMaDgMePDkj0rVVs5u5bukNqa13d426isiuiBCeELsPkM6EIQAfWsiPe+CzQnbsN1rD+x/dTjEQs2dhwJBJRPOEvKmoWmJq4UCbU1CROCTTt8euHyQHv7PxXAeq+hFUET+TvzpOhWAPx3AhCEAAl4e/s/FIEvD39n4oAAPf2filKEICcCb04JvSgKGYEIQlAkAzyd8OuPyWaVv7YLDJ3w64/JKUBSjwCdCUIQPAnQhCABVq/zP2QTnK39sFiQk4kCKIEoSaTvh1x+SVSd0OqPzQFjIeJQk6ULxbiGx5wDdO89HrgiTvh1x+SJ3no9cESd8OuPyXokEZ6YgUoQhAk4EoSdKEADgvrx3+ivle56HR8IpvDyjwHiEIQOXoEiBQlsrf2wWGTvh1x+SzSt/bBAlbPiESWyZ3Pv73JF43ves8nfDrj8kDgh1hxWeTvh1x+SwJQmcTACUJOlMndDqj80AHnqXfnWOd53938Fk9S786xzvO/u/ggCXphkQhCA4DHmZv+isiEIChDrAviVv7YIm7+2K+0BxR4AShJ0oh5khAXhOlCTpQgdUuIFsC19OMnicer8E3r9Q8V+b9wTJQk6UJQHQCEIQACcEnkcvfmShJw4IdYELyTvh1x+S9QFAEIQgOAEIQgAUISdKEnCxkBCEICwCEIQAJ1lm7+2KJu/tisonnUBQPJO6HVH5pekInnVmleZh35kAChN6cE3r4S4hSjwAnD13vzJOH57v0LOHv7PxX2BbgAPf2filKFj8Z3uSceDIhCEBOExm/s/BKUIQFAEIQgJwIQhAB9SYZ+Tzda8k7odUfmvEJOFAEIQgAkSyatZNnNoNK1fHdTz9tkfdyBMKYu+NRSse2Qjvxgl8Ll+cEzz87r+5dzMl2vJ1o1ilOkET46Up+E+lni+F3F1mP9IiByqR92NuHQP399Px+Iyp+kPbdEFGdyIfUMOUdvzDOa6wN5L93QoObQ508wgf2vnXRPLAoOdDPvGY1/bFc/meT5SBv9q38iuvR9PIytoouKV35ftF16M5JK4rTZvvnSFyDsNkihTvAMHEaysKPy64LDljuRjVRLWQN/X0hSrYCzxaqPBHzHUoey3f8A8nAH+3h/uWRI9ZJ7pZT+msKAtZZKU06tq+NccqDI5h3c5BG1Exz4Wvb9oxa3Czeg/wBI1YSGgifARsaqXnnVHfuAHHL2xaIbOw7lifYyuZbrSFd1TQLua8Uy6NbUU6tmDLx3lBuPHI5VsOZQlPI50IepSusvJ7vxG37ujnb23nCET+uk6IeKkcjapdwWih6jFspyfqJfr2d3BBdm7SA+66HtRKulTWVFUlYweyLOaOJdqEpQXA6Yx/pDVyKjdqduz7W7DgD2qmBMLCffAHXs/uq6iZNDP/xD07AYJivqyl9ZkVRl/smsHbrV/PMynVzZCEz4071FDqEwqorWnfw+/wDMe+7c+TqpNfl+rnziqIeWkxETiCHghrKYXaGBMaDT77lCVYWV5GtRzp1QUxamJSntjRAHT6mGvfyftIWf2fVhXA9Y1jW9TtLZjg2cEG6LgQqQhsL8PJw8bOn7jP8A5JXKS2izsyWqpIWVIKtapmyHy8jPw/aUw9+HqDpaFnxNxLbRRyVFPw5c4eaUsNsNdXiQO4V9hBfXDN6655OlK5OtDxntFl7q2Fud3lgvHaQcVyXZ6WtAPkYkazN9+pwpO5TNZlTdrNO1S1j0fZYV4YxhE2JtUAaOp6A666QIRGcjlUPLOXk+izplJ/5gtm4tH+jdC3jvkJIrZTL4MhDjufo3DyZ7gPyb474Ln3lmM9htVMLn4TOlLfp2amGIdOU4CffUTh7rg0/5bFuVU2ZZPel6In4V+qx0HY/CML/J8YjcuLmT45SYW1068VO67M7FRBdzDdvjtHtSp7RTo3mHzRa/KPTIUamNlKT0h8mFcOvdXhWnGvVgMus1thlkKIENrTiarcaQDo6yGzsa4Xyq+nHBh+764quInmlbPLdcm2dVdA0ezkClC0/TGOLgDHqgqsBSfE/PmWw9HSq720EX7qvOLmOf413C7LF1z2ROv4CkJ/3jb2Hz0epdIcmMPx0jm+K5vMPno9S6f5Ln7HtUG0vq6i3lvz3C5NI9dRY58Be+q3KbTlntUu8dzUwkG3R5eVfnXk5nxAxHst/Ou7OVGZEHJ3tEI/1DG/miuGgXHB+r8FXf6OLSiMXJv/EoQn8FKfzEc/RyZ/0S+lvqlG/WgWl1naHo0erXMMmLCPEVqjwW+7BSLrr4/CHwUdmb+z8EpQtFMGDKIbkbRyZU0id26nr4DSrJm0YokbtyZEwokts7BkOF29M8/k786WbZ4/je7tWx07Rb5V5ZEhgDJJID/wAbhR/Nh8V9rLosUTuH5y6oPKy0dqUXCBBqE3z0e/OsInnU7O7Q4064zwD5GFJF7YRTeuqC6LlFM1K7qhCM87z0euCsRk91lVdDGVbVlN0aJU47IyTy6gMNmQ4HCDkQh+d+bwefVCOrmgq4ZnzH3RTlJMMBkzxxzicMXsJYYR+5NVxwyU7DHiKZec8fux4Vp1ev48A3STNJ8zOwcZeWPHcuc6OJp+YiJinNN2Z8dAYeHXqR5+dyxvgs2enSJ2I9kJ3p1pSjUtCl6g5/Pe4VJQhCsMfjaBCEIAHhCEICcCEJNO3x64fJKB3RR2iozTd/bFYZ2+PXD5Iz07p+CwIC1FHUAQhCUBzR4jPJ3w64/JKUmk74dcfks0rf2wQFSPAfaEnQgeAQhCAB4QkEndDqj81nScPSKwUJTJ3Q6o/NJZO+HXH5JVJ3Q6o/NAcmPpSfnroPEoSdKEnDat6b89wZ04JNO89HrgiTvh1x+SUCSRqwcUIQgSIZ5O+HXH5LAs8nfDrj8l5+2/eQAKkokcvfmSdCbw6MgoQhCA8pcQnXsndDqj81jm7+2KySd0OqPzQBLiHdCEJOJWBOCb0okcvfmScKUeAUJUJ51JUIC7U1GST53938Vk9S786PUu/Osc7zv7v4JOOHp1gTvO/u/gsixzvO/u/gsiAoS9CBCEnQF6KO0VGWbv7Yom7+2KJu/tiibv7YoC1D5sErf2wSuHmSFh/YT+/JBfKA6BQhJ0oXwrxClHgNgTXO87+7+CdE1zvO/u/gkSHWOTL0v57xjWWVv7YL7XxK39sEoCwfaEIQFAUSOXvzJQk8jl78yUJOHBL0IEIQuC3AOAEIQvB6jwAhCEoHcCUIQk4ckUQIQhA7AQhCAoAk6EqE86gA8leZndSXpD+x/dS5AUBvQhCAoDwkwe/s/FAe/s/FefVudATj0Pf2filKEJOACEIQE4EIQgAEIQgA+JHmuF1/evtCEnCgezt0eqHzXi+JHmuF1/evtAAIQhAB8T/NcHr+9XVyEa84NNWnOtJFcVrUWN2v1hv3qoIeZnhx5OzUvGJ9cqddwXdnhhXNqKkPYhcfaB1F7ut9K67aewBeJy7seGPGnwqIjekDS6bZdxVR3VtmonwqYSB7ox5dS5dsNmM9qqoLESI34rV9y7Cs7w3VxSrJU7RtYtQtkg6F0N6idys3bSHie4R5ljyw77dwDJzEuOAyJoz0grWgk4inHoziWaPDwLaCPu2Xsiq35YDnCRZW+D+tF8qtQzyflr5VT/LGjOIoN1H92xyjdi02i+GePUoT8B7onrt2k5g4p+2HH6duj1Q+azyZM+fJn3+yz+tE6T478IozPipEN21TwehfofUfodJNOePr+2URW5MzkdO0eBtjq7lDsbOHv4wuzloAb/k+ZN1EUgwYp2faUbJATtBkh6x64qQ5ONITZ9bvdfYIV28CSohU4GdD0hULuXhWeKv5ldzq8arJZzBQDX4VvhY36x+vuOH73rPGlS5/K97Q9tFqXZklMx6Hruz1w4+ylffjQfmTpA2Rjc+4nN5uUUc56Vy2LQmKSeO8OuLF9UwO9afWGWXabUdw47pAQYvXfddFa1Z9k1Wg1TR51bxpZ0dYhueDhTkQNHVColeLOK1i/HDkWd1i1YUriYLDxBWzGwmjJxJLUQSR1qfS4eoRpZV5qdoQRT1nhycsX8yR7bKrfKjw9b1ELFi5t1666UHUlN1U2ju9MOwrs2chgJ+kL1wqpXJqtkrhokUvR1LE0nS8BdNGVI+eT8erm5K8awpW0J7o+M7RFHUp6mb9IbIqG0sWzbs4Z5LwLpMiiJcx0iV9f31BJRqS+dfOXWEKXMLUZV9lcbTLGLRWYBrxZWgsa0Cf6wHvK/BfnGoqbeW64m7FYVd8H7LFpSnXioxXFqc4sLU53CPAPlBvcMQuTuUpTlN0tb6Q4UwDhGu0Fii+CCXcQIOF5uxSPQGa4YQ6lvSyJipLU1qRvZhjT7vtHsazeISzR+4RyZFif3xrtrWddawaiOSFLyIphktxgPGJEU5ORsJDlSvvTDIvjzKeaQCnWsSm2im+NNsOjGycbpU3YXA7kvhD7Yq+l5TyDEIa8nmxOmfup+dw1vYtuRD1Z+u4c+ckNmMIYZ88PO16l03yY9wP1n71zazWCd54BO4QrA7FyK/mTeZhzAeTarlANLNdutc5qBbpNZ6i0jtxazK9/wDza686BwP+9N64iyvPQXdPKX//ADfLRCMwKXg2yPVHUuGcnjkev8FC/wBHRQvyWft/7en+Ev8AIMP6PH/0i++uPOMda9zMen4wXqe2KnXyrneLS0hEkkcGF8Yx1XdcVoNddFujtDlTVpDR3DiGLi/WpZsntkqKyZxOntEgThQMFvujqgo9d2Jwp1xnAOweFIFhqEhuWJyDMCneUAShNl9eTXJJRc8z2B+QqiSn2j6WRScI7O/TKdI4VVbU5VXPjm+nQuIc4Q4PBhDdCEIXQTHOnSdWH+zWj3jWvczHp+ME5t26DZFNs13JJjjTU01Y8k+0d+/4IkyoTzIx18Z5r17Jnd9ywTp3jvwglY7I+lr7hur7TklsbWxwHNGJJKFxsBAoXQ4XV8U+SQhXSjJLQwUS+mVe1ETnuo6h/N1wb743xv5b9WroWgQcjMzJjnyrujUpfIt2tCJOfnPgFtYs97bPBZzwYH5+NH13Rhf1x+Kgkq3n6kb0YUKochs+Jz1J3UpStKU30wrXjXqpurjuJ3FdYi8TlJ9c+Qc3kIQrzH42gQhCAB4Qkwe/s/FKUBOBCEIAG9CEJwEoAhCEAAlCTpQgA8k74dcfkvV5J3w64/JeoABCEIAFCEL2Tuh1R+aA7Iohessrf2wWKV5mHfmShJw5IdYF7O8zHqgvF7O8zHqggKFvmwlneej1wRJ3w64/JE7z0euCUoDhGpdQEIQgSACUIQgKALPJ3w64/JYFnk74dcfkk6/UHVLiFKEIScKx8Td/bFZJO6HVH5rHN39sVkk7odUfmgLUuIzrPJ3w64/JYEtlb+2C+FeIckeI+0IQuK3EOKHWHBZfMLElIe7t/FIA8Dz1LvzrHO87+7+Cyepd+dY53nf3fwQBL0wxrLK39sESt/bBfaA4AQhCAD4m7+2K+0nWWVv7YIEgQ6x9oQhAUAShCEBSjwCwHz0E6LX04yeJx6vwTev1Dmsj3BMlC+JW/tgvtKA5gQhCAAQhCABwQhCbxIAIQhKAoChCEIHZFHX7qAQhCThyAhCEBvAhCEBwAhCUSvPQ78yAAleeh35knQvr9j+6gKBm/a9+dJ17O3R6ofNO6AoAhCEnCcCEIQACEIScKB7mZPR8V4hCAAQhCAAQhCAAQhCAD6lZmRO2jVr1XrFNkyZ83lTjOzMZ3mLrvtWbMyR+Lbo70a/1D62yuq2cNa+v2s7tXyhKB8jp9kLWtZ6U+WU1BskYlT3qkYx1X+2C/b9qv85B83bevzxU5UjnSryDUFPnFCPjS541od4w9YXZiwzKipa1uVIZ3i6n66u2sI30e4fVVjDTRo+kYiZUuuITztVK51foH7/ZX7+Ixvpk0fO4uRPcjAnm5+l9A4si2f43fnUG28OU4GkDiB5GLc7tYn9YDKf81Hp/3VW621nMdG29vHhDr3Kn7XoivcKO0V7QrvRxVJe7Wev8Q4qvAcMZP8RhPmsQc7MYEiH9aKU7TaVm067z4wkX81/KormyZI8kHVxvMQh8e/xX6HRjxB/GEcd4/Ut4szewflZDwiXrLZPgflH0fT7ucVoPwmkPcA99xPqSkjKEd7axso79XztEkl58GkIcsR8JthQqjKuzINOUG1DU/IFqB0MKAY2eD56O9lXRq1N+ECtZoEcmnMWM1QvMqOOu7UqTuWWoxuNhL1alXquxPmKem6n54d4/M7SlXX3OzlUD585c5iit9YWzWs2EMOl6vk+EAxZWBxZt18FBEn8o1UkgzDD0c1lw3RMO9IxVxcsyg5tf0JJaG87auPCCLjc22b1syP09oIocqJXHgsa4CN6cNG8DYN3wW3TzZPac3KJ0NwrBml5b1OobFw7Zsmcd5smm0+pLVKVkVBUAIgmLK2PWrLVJQdNu2YIcGoV2wnE79S5f2A2/TGJiApFgoJzhCn2vG1c733U4wYCF/HFeSzy36kLYm11GoF0J060+l2h8B0e4N/XBZ5vq2pWLnXL1i3Mi3Ibsdjuxw4Y9Q4y8O7YyC1dTzebkiPq8yabOLTRMwNdTzmLn8IWyci4t241TIfLcTm4cEppEs+dP0cicukdEGaK+9dvKqc62o8ue8jbWKL6nfdE9czMuKz0MCqWS2dnjhRrSxccW0csSBxNRSt/QrLuW1zIMJZxrElEzkQr4D1wrh376b/cO0atLOMjfXc3mzirJjlmG2RxXiuCikbO5TpHFp/SkcmTOdqP7Bzb02tn+N351rpFFHUqDS0PPSPlZs/r6M6JTlEhNueInbNiiyi+hXKsMi40tUeAdgiWokSF5Yhsbz4ql9NvBjW5Au7fOwhIpWOEv1K0FAVa+VNWfBfXwyBDiTwYQKJ4N3B4MIQ5IKur3Zv12KzehCbJkr7cd2GHV347+4WzL18qWwfo6vKOutYtvhTZXWLPIj6VpieCH8oL8/wB/4dfoNs3cpDswhQjuiLdGHJFcN7XqQhQVo9U0jCRhINT7PiHduiN6mqG/R9e7PKysA49JXIf8K/h8RU36PDzUyEjBCPjfx+9bJS1UvtEu+l2i4Qm67XC+C3mnLP6ddKLen+fUAozk1C47hNP50IQ4PXBQ7Ond960YivGzuvYdNNPkH/PX7hq3j5tkz9gw2Ko6pd6pfZ1Tnwuc4QxsIQ3QSuqKtcKumTjn3g8F0e+BC7gu3B1cGAy0vP8AR9iWyZOfnSBx/akr8lsW9UDaspKp7ieqm7+VPhQcqIo4kxJ0OiEWZz+rP336kZjp+1bTV1Lu9FPk5hfsLpMaF+xHRcI3LXPP8Z3bktbPUHSCbpqpikoPESpakjhA/NjD4nx/3rNGVOn6x4x7IXqcqXYqdtDp6QwjwpyjXOjGSa8l1CWbwYwqvnG5NXLHeoHj+37PvTZFzaMgsu2yatVDpF+6vdvpv+/Co4IvEF1jt+goQb9TlmtQVNT1TVY1CB6FpiMYOhUTruFw7oXxu6oLHF4pb9H0WeNOw8MNOY3S/Lh1rsJ10J4w88kQYreHd5OTbOnR35/ZknoweuFq+UVOa1hDkyYkw3U3V31x3493VT115IILLrYuD9rOTIKkoQhW+Px/AhCEADwhJg9/Z+KUoCcCb04ISgd0VtnqG9CcEIHZFbX8Q3rN9Z517Ok99ywJQHNFZFwBCEICgKEIQgAEoSdKEBSjwHxK39sFkk7odUfmsedj0/7yySd0OqPzQBHgM/iu9yUJPn+j7Fnk74dcfkgPCPAKUoSdfE3f2xScd1kdoWGGd56PXBKU3pwQJJG9QTpQheyd0OqPzQHNHiPEoSdKEBSCRy9+ZZ5O+HXH5LAhA9R4BbK39sETd/bFErf2wX2m8P4+Ju/tiskndDqj814vZO6HVH5oC1LiM6Wyt/bBIktlb+2C+FeIckeI+0IXs7dHqh81xW4h5C9CEqE86kAcB8+pd+dY53nf3fwWT1LvzpOgCHWFCEIQHAfX+B719i+UIQAfE3f2xX2vibv7Yolb+2CA8s/1cgVw8yQk6UQ8yQk6AuR4hQhCEBUjwAnGTxOPV+CxA+egnRN6/UOay3cEE7dHqh817yTu35L5X1np3e5KB9j5QhCA4D3Mw6PjFZ5HL35knSiRy9+ZA6I+l9wzyd8OuPyXqEJOHNHiBCEJOFITrPJ3w64/JYFnk74dcfklAUBShCEnDwBCEIABCEIABKJXnod+ZJ0IAFEnM6/uTgm+V56HfmTgky3EC/UBCEnXAcUUQLJ+z786xoSgLgJUJ51JUIABZP8AZ3b96xoQAKEIQk4UAQhCAAQhCAASiRy9+ZJ04IAE/iu9yUIQk4Anz/R9iEoQgAb0L61f5n7IL5TgAdPsg+tqqqOdW7Q7vbm7NlPjD6IDOOx+j1f6cFJ3fYqG/k8qcmjt9pjsRI2UxzBCEh9XuXQp48RJ/CK/PfSrVmjpEkG0cQpE6VJTk/UpX8fiMAaTKNGOkN23icuqHKPK6ktwLjIhGQViuhUnNzxE6nBuTYFaHKtqSDrUY48Ix2TsUMM9N4+tKJHcNkFFYZD0X0YcTFLVtlG8lWg127jkOf4DdVtu1Weixtt/hzhord4k05lCU44EA6Vi0ugEL7tcF07pOg3dkrS1GTUEIlNdbOY9VBmBQ1w5Fzcskkh1VbKc8OAIrsVAqe+U4IfHj5GL2NdgLSHjMMIAA8cI51DC6HuA6q/Sy5WaPouEQJzmpyHN76KU9mGH5wGFdLKSzeXbIZ+mImryqQ6Oop8qFnY9m9cd/pFwXK95rBndXI5wIo9hxRdy7L17JEdqJIZ9FQdSSxNTQuKL9TblTjkczuGFEJFK2wOB196fNCfk54i8o4J5zm8fEn593cLN/RsiLYlY5xt6JdpzDqTkf1swPjR4Pj0s2NRInsW5XAk2YUo11JPrBvasK+mC4EszoXL7I1qujKbf3nTs5yFfDBv1e/OjdE4YeHFYLpQ22kyKjYmp/ZwSimJ2439HuLB9aDVK6Uol1FXc5JFkUTbn3b8cK492IiGmm22lu3k58lEMRI+QaJW7kwnTYt9UbIMI6Xw1Lkr+UAeHL9L7HTETf1Oa6OkeCAQOpujn43GFfJdP7cpMKdo91eSGvFtWF2yAMfKGHVCMpyRTlVWBslUOEgWnqmanyQDSBe6oTxyPVe/Mp5ocqlF3LFzOTOlm1PVyDnw5Xu4e+oreNh1l4g8qKL2e5g6To+HFihdB9KaG2Tooye3keqFYEy/WstKzsDUgI+fK2sqQDAy9bfaOwzWOqTiISCRYOsMdf7wtmLL0pMHYeMotSIWq3jmbj5xsbIYa5JnKYKPcp0gsH5R5VD4fJ2rdqbMzE6Rv50kmEdeioL9ttVFdpqB2wsBfs+zyR+xV6y8LMYkRp21YCRq9B1J/9GkmT3WGHnSB7+q+7Uug5zM0VzTbpTD/ACIFtlQtmCMDjrv51heVePNHekNOfb+joblesh/z8RmR3JO9HekPys38Q/O9pIyRs2fK3KRbNKLcK8dj6aYWUR0e3Rq/OaeFE/R8G+HWlFrVmL9ZLVJ1L1SOVDCFeSHeEb4OA/qZS0ml6ofaRdpL9TLoS1uI0IwFLDhfDhQjvhGHKtgLq1nYDb7ZOXFQudI/Yx6scMK+0beSl6zUTt8QcuJy8gwy1PTrhSL2ZTTrJgM4tZMAyhYa4cKEd0Ux5nx3NhPsTw7uTi9uRrueaUW+lQ2sy7cmuT6wnlltOxJbX6XLTPhwx9Xq7gsZLLapPaPS5eUPZ3tHGoQ3Y7f3/BJI+PnyB/nHUt4o6jXquHWVTlKCT3J5Ihj+Hw+HGHB4PBG3a4/DV0raqqk0G00fJYIhOEbSGl6nguxV0YBwk3xvjGO6665Ni00zbvk4+nOK49AnYpX5xT1bh91cIILkbekV3e72iP6ip52pFxkAO0qA0/DSDb4a4Xw3wTRJ3Q6o/NY5ueI4xPKh0LyTOk8Yw+ywKhsadUKLlQpR1gor6t341+8dgSZOfnSBx9WvkWzVxSU6k6hcmMhzHdMPwYcKDszcG4Hg367ow50or99p2oqoNd6Rp6NKtsID4Snbvzfzum6C1fBziJJBGu6Cb26r5zRvIOcUE8nLSrhjjXDrpu3b+GNPgObPa3+o7HJ6Ap6hCFbI/HMCEIQALhPNJUkwe/s/FKUBOBCEIABCEIAE07fHrh8lgWedvj1w+SwJalxD8y9EX2/gBCEoX2FQEIQgAEJQk6ABV47Pd+9y8k7odUfmscrf2wWSTuh1R+aApZ8BnShJ0oQHhHgMsrf2wStN6EnBqaBTJ3Q6o/NZ1gk7odUfmiTuh1R+aAoxrrtop2Bilft/3lkWOV+3/eWRAkcb1BQhGY6ftQgPKK3eBCFnk74dcfkk4eEVu8KUIQk4VgXsndDqj814vZO6HVH5oC1LiF0nfDrj8kpSaTvh1x+SUoDwlxAhC9nbo9UPmky3EOYXpUJ51JUqE86kK3AOCvoR8+pd+dY53nf3fwWT1LvzpOvAIdYyyt/bBfa+JW/tgvtAcAJOlCTr1HgFCHWBZc1Hp/3ViQvA4BQhCEBwAlCTpQgKUeAWSZ3icP2rJ6l351jB89BOib1+oc1eIQTt0eqHzWOVv7YLJO3R6ofNJkoHRH0IUIXxK39sF9oC8CXyd8OuPySBKJHL35l4txHRH0vuChCEJCtwDylxAhCF4PsKEIQgOjIJpO+HXH5LNK39sFhk74dcfklKB6lxAhCEDotwAhCEDuBKJXnod+ZJ0IAHBN6cEn/a9+dAWpcQ4JOlCTpMjxCJDrAhZZu/tikX7Xvzr0d0eIUIQhA9ChCEJOFAEIQgAEIQgAEITggAEIQk4ThvQsc79vDP/YsicAoAhC9nbo9UPmgAz8R6fvSttDcqjcJADMCSW6FE4IMQLb3A8hb5ZxZNVNrT9PZ6QaiSr+Nl3/q83/WjF16sTydaJsWDxA91Q1kXxyojeRVLfulSCspGrelddI9lKnVw9IKovvSjB2SiZv05HwjZMm+yudYtZkFT7hOgW+lkz3x36SCP71tdbORmjTsPIKLKhru3Ifqqkgydonw64RugquVLlE+C00ifmBYalkGNh7hueZWlqE1jlQ2c33jIsDHSt3zu35M6mbOOc1rTkZPqQ4c+RhCt+tWDtkDDo+gnskiMcSYwyKWZ4br771DLBAy1m2VpGPkQhB0fsaYGF7MOpZyqJPhfaDRFk7PtbmSTji4/1fCf3itVSKqPl2GinPN6tLWq+ohcK/DdgNgaQJ1JvIQ9tochQiecw0TJkoOtp9UsdqADI2FMQhU/RETtTdifav4Vde5zaG6sMkkmQKW+ilcb5udUOrasWFqrWyzJgo8zRLFDMA1G7g74jQU/W4m1XUdm724UQ6+DzY0izwjDDgOP+9fNUlfTiRu+eYPX9Cttf6L6COfBPHvx7viMc6QJKQu+WbP5YhSZy5C/UEqQlTmRgOJcMKWTuj0LlRanazVQ9XnYenWIT2OMWLWui1lfhIdR+j3iRhChBb8aub+Ue2O49U6QIdRSheI3A8qkOidjH/KhwwkCFUr/AKdQsj9H2NjvlQ5YPiFPyRJGTraQ8PlYA0+8U41uohZPHdA8QXW1tpVtInT3gaRtRYuBM1XrgxYrWplBWgslXENb66DNUCMYGDC+7m1LslZ3a442gNrpPIo9zpUYTbWmL59IdPRypm04W87YzRHsUjkbVLyq49fdhx7qiSfpG25VlItpZgjkb6v++G+2ZykghSNINQpbDhcEZ0rl9lr0i+uhDXbdTD34QWdiCyAzAwrtH0iRzrsfUjCHUdNkDZ8Xa+XcqrUtZU2WV2ZWiMFczvCGji2I/wAIzI8g934XqNaPLpbWuZKXafrKBsmqr20z7q+/u9e4UnGvI2lun5eR6j0S+MhxwanSZPfcpynXVxZ7Iw/pSnt/8OoTkzs/O8/v7VKdljwG1VVIAPnXsVQ+Qy9V633PpYM9pb+kR5YtlFVpqcW/6usXIYRwHO7/ACW1M87MTtUenmTxaDR5dHVG6DwhspZWCL5sRFatI81wuv70tQXSlGZHDb0RxPLWklq8RaeyusNFOUiEYdV66oWS1tJdW2RGH2rh6wuU6HX8Vcyxm0gwKdIHIvh81nvSzYnlRodwh6QNuk2yvLcTt7f0hB0etosfpu3Wj4sJ8/COYn9HHeG8AjoXFC0ez6qbMqjn0xUwJIrmGTqhD0c4e9CruHR9YyXUORzc9yV2kWVUTbCw6Iq9qxUY8Ud4wucAOlURo/0iymjl75LlCGUjc28nWSvfT8ae/wBtQaPtJshYT/YH+Y7PtFH59cZDp+Cz8Y2gdTtbXk7VhYuZ5Y8q0zifJFXggwjd1qu+evz+3LZ8LNRFyR5JaIWKdI42lDy8TNx3laKPnTD40vj5T5UTWFycmxx4ULuEUHDA8HhQ5ow5lslO0jNrYOpz59QtgpLU2aZvezr3A7VGN8eaGq74KOf23fnUgTp1Og0iaDPa3ISuNN3Yo6F8QJHWviVRVb6usfTI6UMSmehKcPXj1U6xJFtdqcaelPkEf52dz/aiTO8d+MFmk+InXkRhdzLMZmSMxh5GF5VJsa44YDqMWej0/CCcmyaGDO2mRi44X4pwkeDvg7EnPOUakg5wvEvjo+A8Y7kxTvHziLk3FrRzn6VMN2/3cPUOyXm9doFQ0IQrKH4wgQhCABw9S786UIQgJwJvTgm9d0eIdo3onDgm9LZu/tisM7fHrh8l6ODPiMCFnnb49cPksCUBxRVq4RAlCTpQgKAIQhAAIQhAAoXsndDqj814vqT57vzRScOqK2v4j5Tgm9KP2XfmQFCXEKEoSdKZO6HVH5oCseL2Tuh1R+a8XsndDqj80AV9CEyEJQgStFGqFdwU57ETo9W7nXiTpQgOSXECEIScOSKwWyt/bBfa+JW/tgvtJw4j4m7+2KySd0OqPzWObv7Yolb+2C+vmfcO6PEK0tlb+2CRLPJ3w64/JfIeEeIUoQhN4eR7J3Q6o/NZ1gk7odUfms6ApR4Bw9S786xzvO/u/gsnqXfnWOd53938EnHdL0wyIQhAcAnQlCToC9FYCyyt/bBE3f2xX2gOKHWFEPMkJOlEPMkJOgd0eIEoSdCApChbAtfQkyyI+1kar13hxnbo9UPmkyUzt0eqHzSZej5R9CMsrf2wX2hCAvAlEjl78yToQFAeEnXknfDrj8l6k4cAIQhAcAIQvJO+HXH5IACTvh1x+SzSt/bBYZO+HXH5LNK39sEDuj6YfaEIScOIEIQgAToQhAUBwleeh35k4JnX1+x/dXwsj3BPqPWFyF4Hv7PxSlcga/1BP6735koQkwe/s/FKA4BShCE3j4S4gQhCB9gQlCToABCEokcvfmQAKE3pRI5e/MiRy9+ZJwBOhCE4AC7PZjMRh8UjnGTt3Igzz10J4uFVmrGsl+vLW4xd4RhSlM7/AAiewYfnH82FUdmbhgbajvKEwsVNL8/aGSXuOJt6O8qyxykTFcZLcY6ljgDyCiyi47GGCBj3E9XtsayI3h8zD/atPKp9sjt0KRC11Aerv2cWL2Y2MS76YaxYvpXHKiPhc4n9KY7QrcmGjuMT8VyQWa7k0vXLdi3kixUTJJeP5yvs7vfv9gy7dOmS57oV8hWYiYlf74lgKRTdDsUhop8EZqbGkXYw4w1QUB15b8zscmfh5+q/Wqf2nZTjkds4HxjyKotSVg8PkMQ4T9fxXWzdCjp4pttxj2ytCDt9Qktcp8ifhFl68t+0rOn3boKsTlUhh07vqWqzZ0nx+I7VhElGOjjIaGmSVAkonBCCdS0hEWvDwSGKJMKUGiIyOt60EtnYkF/MkCm5IAVV2ovGyDCbCz3pxsInCGvFpmU/U+yNbTGeDTmr1ZbrXtOTmlho/Jgs4jhH2qxNsd/6vb/XHUpMWVA8MVmVidK2P0QP5MqKEAhAwbtIYfjWKh9a+9ZvWlK3VNHIhWtFZM5Cl+gzJXj+9hu9lRkySuNa6Jw7ivpJI2T6iJBzlfqqeHSpXOrz53l0pz03q5OZd6w6wlOdBUq7uAI1PkurDIOdwzvR7eQR7UuXdk1gL9JcWqp3+liagfTNtpyhTfR0OQMp+V77bLMbWnyx8GkaYdRSqwdYfrHUfo+7s+C+9LUpbFwTMTEtlSESQrkz40wpTr3d1MONevh1ht0mTEdcLtmxYZSJojftMuJLacA8SGt2jCEg1ogD6OPGVfLYMpCVQBshnb6cF1832rDk6s9odAzoUxXNYi1WUJsOsG64ZNuVdZ6G+M8+oG8HamrjeBiotAQ9ut7xRipjKs2P0Tk6HUHHRwjb764mcTchM6Zw/WMZWnhU8D0+8MmEK5F0aDkyTpMI5iEPuX59KDNLoepQX8hjfXbBwvDgADx9dbWHKcZ+DR8KmIo+soYQSRAsOLDr7IJPpesFFjIoOLUbc2fj7d1MBPdMmjKOi1Wy9qM/Njl5WXxixjkwzmoPDj/jeorcnjAuWh3gcoprdhSATDPo7aPVVvbdWMmqW0d4b5/kt3bMbr1rQ5T+ZGqYjEU6ThhIajN6qGOSd4Ho5JvoM0oQ+v8A3ByzyhMlKzmjX79UK28H3SoIY5ppuqddPfVcYqOvrE4064zmh/aimokUrVH6P+tCrsxlO2GtttEmnYn1u10TFpKn3lGgb8QqVP1P+CjSDZFlHAiurFEW+y615k8oYH+a1/o40kuzwrVq+cnduO2l85SmOGKdd1FfXTjhv31wpWwoGdW1REHHnLkR9pkO0Simt+qD1SHgtaKXDVAAn1N+786g99YnKl3d1pl/kYVzaicEXr3j+1KWOEz1Tk+2hNZ1TNkKrsyrUWexu93o99b+T+J1qWKpsyjW4fgi3miutYMDFpyy6o7742m097Lf7SpkyuhhbT8moPjFr8op6b8N+/f1Za7q0rThh4TCZRlx+S3Sez/q6IqIHOUn02/TpE7Z71FMnPSLhyLtWwmBna05hmQz2r5K0HjNF8jiNAxr2q6OzuB0UsltOmyJ0jd08qvtR9eBvkneuHlNv05q3q49B2nTuS/7lmPSPo4Re1O/QIKl0jaM0V1Tv2I6nxnNrqHPb3CSKUMWLgTAzd8FzwtsyFpU6TPqCxi/VD+iJp17dD6qrMUfaFKI2cifu7LlNja8YhZ+iZW6NHkhtMOpq69ovYP7hREPMXPYUvr2J8ig/O65U45MbvPYHgEppfRCcCWG9+T70jd5U2QXOHhPxZN3HIL9BFoVlVBWtM8W+rmqEL+Ju4Pk9xb1yjtmyQa8sznEO9P4qtaP9rBB8ot/1oNaksTTZCXOum3mfNXX0ugevqr+Fd42BYenW3riSJFSvmz3+4cVpYminDW6oiHd60US1C3NIkQbsddD7V7UdIONLRCx89r8qtmNEwR3KtQR46fzRvj1K5KMn1Hu07RzXg93Vw69+/H4C4NdzuvzjNns/v8A5p4Dbsbn/Hi7JtqaMzO6dXPFSHQJtGSahlkV1KcS2UQX/BEEv4R0Cem6KJNwq2ZncIEMfJ1E6/cHGqyJUTuXBDHFBUIQrRH4tgQhKJHL35kADghCEBOBCEIABCE3pQO6KO0VGedvj1w+SwLN47/SWFdUuIc2XoKgShJ0L7C4KEIQgAEIShAB8St/bBfaEICpp6UCcE3pwleZh35knDmlxAlCTpQgOSPEeyd0OqPzWdJ17J3Q6o/NA4LIhuSwD9v350G/j96RoCxFboOKBwXxK39sF9oQJXqdRQgEoSdKEDxFLUI7PQCzyd8OuPyWBZ5O+HXH5IC1H0hBmm7+2K+18Td/bFfabxJEeIUJwQhJw/Io94EIQgOY9k7odUfms6EJOHAOHqXfnWOd53938Fk9S786TpOBDrGWVv7YIlb+2C+0IDgBfE3f2xWX9j+6vlAUI8wBfErf2wXn7Pvzr2Vv7YIDkisFcPMkJOlEPMkIh5khAXBOlCTpQgKALYFr6zfVudJluI+lkQq9S786TpR6l350nQjxHyj2/wA9wyyt/bBfa+JW/tgvtehwAlH7LvzJOhAUBfJ3w64/JeryTvh1x+S9ScOCXoQIQhJwoAvJO+HXH5L1CABQhJ0oQHtFaq9dwEIQgdQIQhAAIQhAAISiV56HfmXuufHvr73oCgL0IQm8N4EJMHv7PxSlKA8BOlQnnVh8n971mE86gJwB+dkJYJ5pAnml9bEk4A3oTghJwoDehOCEAAsuaj0/7qJW/tgl7IyOtTOEprY20l+cSCY8IUZm4UDj+DCHLGMdUFyXXRbIncuT6ulONQ3rrIt/1kIPPqRrMrFK7tTMw9INWLF9ceIbBTzeru2S5CDcFGQ8WvmilQu10KDrbm/60Yr1wmsNKN0gBvkCtTWJsIYgUdaz5eGnho0qdhZCeuU8deh7qdf3esZwvTTskw8wszlqeIVuseyS7PrK4yHh+hCtawhqxh0Lm4BTpVVeNrGHtM++/tUJ15bwzsckjDc3Uue9p1s06o8/h5/Wq6hLIuy+pastcihq/SP+ArWHsq7NIct5VuU5tX4jiztp2UV58ce6PaqEVXaEY+Qn+P39K0RyeJx8dpn3JgnOXatV2ro+ibcSJqCc4NI23a1sWgl5v6QLJxnwSOcZ8fim2cZzd+1Ge8/dP+1WEiiFklci27ljNOMkjyeS6/XFdPskXJ1cmOdG0euGolpKwn6uBnb28f3r3lK8kvJFnNQbVahaw1XP12OpukDv8n/eiveVseVTOf3tsn0+/VSJRNmF3lcME+6sav5Nq92WXr+0kpXfIHsa01ikSPyFV/8A46U4jMd3aQHl0reQYLkZxrNUWm05UdVOjBZRDw1cqrcxwbRbRQvR2HH+gGtJa8qSg7HTB64r8BrqC0SAuCZ2gL1D6qq+wyj6cs5C0PZRRwrS1ii4GkP6wP8AeilT6pHh4ql4n1BVLqS7OZeoww0/f9VTraWi127OmV+QyDLLvxPzy3Du3Upw3U9gao6CeOKk/wDD5RaGfli2mkVgFUMiAojG1OeMDpzAekPrS602e2/MVY2bMdo7uyOjA21ATPBDhHVeuA9LMLnVTwx0y0anOoH6Qx3/AEc34hd0mX9GUgKGTePOJEbafYZAIl0boKNacLatCKpHsI5lgqXE58mPIQ66+3Gu7H1hPfaVvMmbNBBtk+oJvbA2fjAxrYUUVG7YuVaHXr8/MYhxFPgteKE45jtSzUrYm20dJOw5u+HHAdTievawr2lackg+EDoKIKXsW3Q0es9stUvKkoxzOk/YK2jVo9lLE5GcUHcssy0GfOkYdkaxL+n0gugdldYOVYsILw4Awjihd1yoG8We0eQbAhvuLKg6+ogK09jVUuQIcRiKPdBBcVdB3OOE0ef1K1L8j7YVg0622zKip+e8ad0mf7N0LSRcW02KioQ3KFu5IfiZ5GBFEWh1VJcszPw89b5pgJ1bcPnxRMXuTwHTcnRt5FxevlWfkHmxK65xQZceUVX/AFcVR/R6HUUL3GRcTDXEyHk9U9yrLYLJo0I6WXt7oNVdTlumOMLZIaRb6QJ51cbK6quTQFkD20M8SoVhVn6rU4IxgaQcHAgj2UNc5LLMhyMkOFUW7VETT4rtHHB0LSx9zh/FK9dHakDVMl23Y5ORJBTmESdNQ5cK+3D4U79wf4FZKLWRnZU+fIYaLZBbKzkBnWb2jxFf7OnYXUIdrcW/r+K3gQKTZZgqQq81zqGxPFY2y611kucHGzIjdD+9bFXmSLYE6sT672b1U+tLnT23PAkLz47ky2HttstHmHMBNOtlq1nTrmAHYUJ+g4OMFa8u/teYZuZeBOZP9q3W5muf9onju1u/2VpuNuqJvSTjpNLyq3RKRT6P/wDMPOVbYEYPJkWz0thXYUoXHVgWx+jof61+xURkyfMEcsOfeuylLUQZR10bOXRzaWHB7HZHVAEG5vP9sVBbcbK22nIkV/QAJQlMFk/rHSBwN7jQJHsv1ZLtFN/4VJa0irnpu1SvQ/8ALUp1eqtMaV4cRO9E19NEHXyblT/VMK/SZ3fcpHpR+zE7s7UyUPVDdT73KdXZgHqcfhB6mouEI8Lgx59epaxJMnSJ32c6uF2mZ84UauEOay0wPuwr3+vdu+O4ateJM3uduL+UTXkkfMePuvV0mG06Qa2hAEyRgyuIh6/SC45tFSTgf2+6PXcrOUrXgd90Z+6HUqDvbR6i4pRxk3jOt66Ptf5w3HURteJM/wCPXetwlGX6o6/sVeaDq+lqjnMg7BIKEjhfKxZsLltbxWLQ0vshoHdNmu2yHsCzM7iVdq2fVmop7PzxGdlrVebXsNCG1gj22DJFs4tTxDgz/qTVHI7scPJ7gT70GuXVpmTjaZZY5Rb3djKdhfoio2MDHt5/XBdxAniT/n4Fi/G5bHJLkEycOTCHXcpfaGlS7rIwbkU1zXwH/CvH3b6ewTuytLNz2GrsDgmub+Ew/N/OzwMo1ocJERChCbjIHR8oAJpm7+2K7BW15FtO17NdKnoc7wfqgqFxYt/k5wIXM+06hDaAfZLAeE+tRIgsjF6b5SPdfdlqiyNKFu3hq0GRsHNemT4fnGg2PZWky3r2SI3YLZHGXlFHPBCELSo/JYCXh7+z8UgTrK39sEAH2hCEBOBCEIABN6cEmnb49cPku6PELo1Xnt4wIQhKQ9AQhCADPJ3w64/JeryTvh1x+S9QAEn1hCEIAFXif9FfKEICpFZECcE3pwScO6PACUJOlCAuR4hQhJ0JOEOpoMZv4/egD9v350jS2Vv7YJQH+NS6h9oQhAkAEoSdKEDqlxAlsrf2wWGTvh1x+SzSt/bBN4ewTd/bFfa+Ju/tivtAXo8QoRI5e/Mib5mPfnRn+j7EBUjwGeTvh1x+SUoSdJw6Ird4cFgk7odUfmiduj1Q+aJO6HVH5pOHeq1V9WF6EnShJwsChC9zMOj4xXiAtS4j6/wPevsSVKEIDkisE6yyt/bBYkoQHEe5mHR8YrPDzJCSSt/bBK4eZIQFATpQk6UICgCEJYD56CTLcQDJ6l3518Td/bFffqXfnQhHiPUeA+JW/tgvtCF6F4EokcvfmSdCAoC+Tvh1x+S9QlCThwCdKEIScL1katw3pQheSd8OuPySgegk74dcfklKTSd8OuPyWaVv7YJOO6PEfaEIQHECEIQACEIQAKJXnod+ZOCZ08JMtxAv1BnTwmdPC7K8Q4rcAIQhch4HRs80N35IIbf8VZEJvDOGdCUeK73JQgPA+ePdf2L3PdfwgvApU46do8aQU7FexhAaQU403kyW11lOkEM1mboINvxlUx0Am2SuCHhKU8ruU0frnyCOyM9BwlP6WWKQQfOkyYR7b/inhhYXeo3KQz0+CW6uZXqbIDpBxXR6z38n6GDPkH1/WES4euU4xx0f/wBsV5KVoij7OW2DPSDG1tQ3IqRunT7b7KlW9sE2lXx9An+f494pO49PluxSOz24TafpGHOSyrIQd3bMPFq50afFjqjTgXlBx1e+LofSlH0fZyzyGakGQVpa4dlyc3N/kyJO0z+Tcq615bY2tMmfh9r+xURIzl8aSXlNvUMdPskJ0Cfn14jPkjPXvpDd6hwcx/o9gS1VdeNrHJn4if13QVG7Tsou+TPHb5+ywUP2hWtGHZ/x/L2RVUX54nHzp927qV6aPtEDRDI4liC8tH2iBo38+lhtNYVtpybPIz/VfFRkYZ59JJ07vvSGduj1Q+a0jGxqLBHZ24utZZFijs7cY507m3970im+Zj3508Bhub45AtDeC6OzoXsQgYIOkHA9W3bsnai7JKckVxlK1TCn74Y4Oy1jP28/v96b7hu6GtkqbeQPncn6CRKZ1D+78eFOsVNdN3NIxbzgVroOz6r7THfRFEU651C6R5Y+jW/60YupOT3ki03ZLNn2kWrurW6vrVt0cbH9XqR6lEFC1hWlpbeaTT3BbMmrJvorbXd3CBg3OJ40PVReaBS261II21RiBkVhJfaUsxFa5BtIWQhaqyfx9W0v8Fm++Lyuu5X1bWOqVm2NuVITE6lP7OteGatMMaUxy03mNhWmNH3HOzc2rRi4yth7a1l4P9RuU+iMmijiq2c+I+EeB8mw7VD9NZHVtlppmn7d7TBGkqoCsbofg3OB6VsVqpc1xdqBsAY6ZYBQ2qJzvV0ODgaOpEf2okxZIWsHNk45ps6dSnYkUUjwjtne7nBwP9sw0fVh/s+a+WcXJW4SkbZTZNorl5ap+WthXrUrwS9lKVrXqpgHG0NGVw3EttEStqUxJb9kjZNVmTbF4tXr504XJtp+j9IfwchRMbV+SlTkZ49IWBP1Viib3c4Ar/8AjqvblaQ26RxAAJVQuhZPHKpiI/uB/atcMtTrQGdiMbAPn1KwoywrrfI4z8k4XUr2ddqSf9Mn8/cLHpo/aI537iVMsp2zE5AstOyoZQMZEafsJYaeKEKuDLBYfKACsnQdoVn2UG2ydMxc7M7VhIbI7RhgInkXfbBc7ZNu9psjxGNar4+qaPhet2pu32Ubs9f0dDCx9cpbYE13BouqaOximWpUJvoci1Tn99D4Y0r3Y4e/eIJO2UjK+bsGhiKdkdSaUtPrCzp+kURae1umFhDyRaNGGPp4/wCtmKaKlo+g7Rw5A9QU4xVALx4PGg6Q0eSqtWP1SFUlOTmhgPGtAs8xOBNxx+kHFgU0UrPn2cu8lnuxlCFi7E7nR9H+6lLLs1HLMn6lE+Zek8HJx93GlfUKGko13FSOz5wjMskfh3iRPkWmktLWITcJTYLCJo+KxP2TSz1jJH0xWJbtHFc25WEfpMo6dIiPCGF+MU5NzPCHF0zFu2ba0I4brZFPokIOrOYkWTvXtxohllcl1bdDkQ0Tst4hgJ/EPqqkIKROpvZj55TtD5LYw22dInc6zuWZzMMReosrIqvq6hwfOmO2uWX4CEq3g5ETZBDQcI1Ella9g0g4RUDBmyZBhzPT8h0qysI67zo+Tm/60rO1Wz58MjDx3Q2Qxcd8orKzk0tE6ymxF1GFK4jV9owPpA8j3RWjo8gZK6FqREMnnV3fQISm70leunq41r6saj1kzpgeo3S1i1SzKyeU6Ui34WtbRKghfXLsEfdEDVxWJnbuUEURaRSLXGTGNOvormLqDdmOqse4t/2qhmkvP+1KQmFyzBgJDfPc/wBgtrMNFcdEwJmDpQ6ix95z41pjX2Urhh6t/v67yst7by6tGD4mdM/S5XLHdGyy1AKqA5DewVs2VWRhtspyqfJ9QLfXhtYaqLkRkSIMFT4WeEW0PcMBp8b2VcgK10jp0FwGBKanMtsAOMwIOj9HkK39ktrJtrVOT7MK3xWk8Lc01d9IYjWs2XLoxcxTclyRCmKVel408fhQ1PVur7a4CY31+jk6io/5WW2fOn2vGQVHtysZfrK3453HZChKOLJ2MzlbyfZVGFOTmLTwU93kFFMghG1hhQvXRqyW3KdWGlbL7b2TS4zUVoTwjwPrHvSrflFZODjZIbPqemJEHazssrjgXlCLAR7KUrjta91aufkVd1dW9qXBJUh+Qt3YV7w8aPtIDtlI/Iy7OQ57JvGIBfDGmD65kMQRIrIWTA5pEN1OAI/LGEPinJifg2p3ayCJGlRhCZBxgnt60qRy9+ZSix0NNrVwp9hs8iQ6PRLDe8CnxwEG+fzxViSdY2NY0ayShtVl5R648KU669XtGgtSjVntK5+ay9IWqcrWY2mV2EBRNPCtWKhIBEaY6setvC4T5S9cwpo4KHCfIkyIwaYeUODGHPBc/pLi5U45SIjTyml0p8rXgo+jyLlb/JfcX2uLTZ5zxVGFfGprxkSnu5w0heqjui1iW5BHfMMuwpoV441Uqfqrj3d+6tfxgc9arS3oM7hDLsREej284uyFaQ4n1HPkHhCNWF2Itovv+Cm0N+kz5MjD7ofauawddYe0o82dJ06UI44x2E4MPJ77quhd1KbeDaZPnProfIkxaxiiYQiLwoXN/C6VSE3Yq9NRRunu1WOPr7u/7BR106OK4k2EmTmxeANyz9ywVXSlOVwHoep2QV1F9+hfDeoxpq0htfG6REefv38ikMNynT9o3374qrV2LuNd4VzEUIKSVjXcU8wpmRVH5D0IQv18FMgQhCAAQhOHqXfnQAKEIQgJwJNmY9PxglKED6RWWbhvQs87fHrh8lgTgJIitVdHACEIQPoKEIQgAEIQgAyyt/bBZf2vn/xuXyhAUs+AE4JvTgk4eEeAUISdKZO6HVH5oHcZ0jN/H71kTegCKIWbMkaWG/j96Dfx+9A6o8SDIlCb0oQJkjxAvZO6HVH5rxKEBSFsrf2wX2k0nfDrj8lmkea4XX96bw8D7QhCAvR4j2Tuh1R+azrBJ3Q6o/NZ0BSHBCEJOHlHgBeyd0OqPzXi9k7odUfmk4dEuIXSd8OuPyXq8k74dcfkvUnCsZZW/tgvtY53nf3fwWRAWpcQIQk6A5IrBQvibv7YrEsk7PdnQgK/nSD2Vv7YJXDzJCSSt/bBfaAuAlCTpQgKAIWedvj1w+SwIHqPALJ3nf3fwWb9rO7Vmm+Zj351inbp/Um8eorD4QviVv7YL7SgdkOse56HR8IrxCUSOXvzIDgCfyd+dOMndDqj803SOXvzJwTeHqNX1DzaAvnZnp+9M87fHrh8lmz2Iv5LoLEvpFEO8vJIyiu0UChCToXYJgJQk6yyt/bBA6pcR9oQhJwrAhCEACdKhPOpKlQnnUBQM37LvzJOlH7LvzLBO3R6ofNAUo8A6St/bBfaEJOPAIX1+2/dTsyU861MfKa2NtIfnAiH5wrUzBY4/gw5YxjuhBIF10GyG1OT0TSoEyyyLdHaHIavEz53R9sFsVK05UlUl6IphrdKgJL14RkA0guhtkuQULIlSHa2dzgVC7+iLJHV/FGLoEwU/SlDto7RTLG1sDYJDiYcIfJUFd/6QELG1PHWwntSnjruT/nX3bvWM93fp2g4umw22TafpG6A5kUVkCVi+SZE+t6ibKU1eiAQMe4QVrqcyLLDachiHhrKqtz9sfDi1Ysx+h2LVTKk5Yz+hUJJaRNIlxrV170xE/ClyPuwr9ooGY0m37Nenfm/d5I2lsbKbpyTh2dkbGkXdsQFyWzn+PaoBd7SZ2dwDfHFk+5eUEzhzrSH2dszGUJ74cBfemGluKbl3xyk+uI35Bd6raH6xSCwk5+5IdUUwuT9mEzB0g5T5MNMPeE5wwtUE5fo9Yp/GXVzL/j/AM5JNXEoVwqb7PYGbUxyHA4r5XteTp8nDjT9/wAVRW0ipHIjHct25dXDbGbOHWG3ySio/Xi43rSH7JisOfLiHAIrFc+nS1ato6QrTtypKLoKV/dp/MXPZWkCzbXoTaEjDig8T53jr4dOvVFapnodHwiuujzkRWNnSbm6qn1q1e3iHqHnjIEj4/QFrLYV0HMUL1fcPptsFdKhXCp0frkU++mNBeSGnbR64S/WTE+uUc4Z0nMZ/isetSxZNYRVVsJmIb5Eaeo5qh+sddPkbm8DqVwaJyIZTW5T3iv3xrqsUSGx04yQvx62h2DyoHV4kgUq00LSja1QwTRSAb6K/t7D70XGQk1w6XGr4lY60XSdFal5ThauQhPZTrr9lPXwFcXRpYjnq2w22cpOT0jBXJl0dk50IQfZuO10+W6iYEy120T0i/8ALsofGyu1Vv8AByjwpsbZspV8fHZiddsaGiqf6ZV59VC9VGW11hJaLK36QO7nE5RmUoUNgg2jAaQp6kPwTC+02ZZY5G2kWwGiWmW7F7aHTYO307QN/MoBAIOam1yC5juXm7W4YLrU/s6n3pJ9626nDKWm6oquHWkHudjHkzuXnaFlKorFsY6dZbRbXotlK0yIJjrO7IroeT48hXvRX4qgVYWn15lCVe1UxTIRQjW6ueCaGjH3OLjz4oxR5WrjV9otRz6nq97JdSfUoGwu0eMumGRbY2HS1LO1r9X4RqxIpANOmGxgBo5m3mOnwUpcRcJogtk1xyFSryVeQkSmOQh6/bXvrWu+u+vqpNkrRVstmednSZOx9cV0qFnbqfCkWGWYSOHBgYODA+rqhEN/N4VWON19xZe/D86ZKboma1SajhaA6C0SNULXPBEhywUiWtZUDOyiOdMZOdD8EyRCODda7NA8nHxu5OyKoDVWmKjMnuFcVwVUOLKvgGE/aQT1Z8bOS8bqF09lTPvzH5a5z7q5606se6uOFN27qtJDSzWEt75NW5FZPr5CB4LbWynZs8hwqpiMwhO5kOEglmMsyO2jwpff7BeoymymynA8eNSuLbCo3iGPmtK5No7lIm3D0hTG+/iF16t+rOTcFpUpzVr6t38xViGkd2xyN1yJk5PRKVc4mbwbs4nybmevdp5IvYGpPrlYVaMAw6YaJ9HVALv/AFXqyJzgf2xgoQlWqBDv0gioKHpcsUQrbAwQMBHmXTum7N7CLcKVY6vYHt9s0dCxdkMgf5OxHssYKv7yuObs6jVw9qps5+kbIRans3YV+yo4q6R2eq2dic30hp9H15WuTPZZZN4L0sMGxVWLPe6kgaBrPIuvwpS6t01TdK1lTUHhowjsx1UJjohm+UG+HOqiWe2V2mtTa6WX2rzxbS7PKhhPNaK6C1OVITyOJ6lIlmFN1rYfgaZJdBXWhGoTAtGCBvcVki8ncdchjuGBykkSKHPU5P6ymeuNPfTdurgIHcd029NQbOiDPZnpP75BN1YPzFQ7ZIcKgPjT7WJsWM+jkw0Ha3RNYynXwXtFa3bwe1O+B+j1INSBNtZNE9veGoUtsdRcCYIdFRjQdldllnE47wXo4WnynYbAl4HVpBQNp5LWiT7cRTbMeT0Kk9/X8PaIsyVt7yefaCKbb2fAIkYMt6w2pKw8CGeoandi8VreAWIuLdDtVqWGpW2qmjSDe6tdQNZfEywYLSKKswsfomE/wQo1ip6BRV5hYIF2vkW8MNK03Tmf0PIwgpZWOwYKJte2scINFYlKYbzmIbHv4Uph+d1B0kkY3XeYEEd5S7xVdOZPlfOFINb671PFhiC0BUsBpByiQRsmKEh33LjPYbkLVhXMqRU9s850s+o7jobP6PrI/rXcmt6pNBbZ5IwJRV+4NV2c6brypIOrgzupWKEdMC0Y7U3N6nej+7J21oR0wiV0221G5StenSm7dT89dQkp2BqVlVHWStTwTRFP2QUw0tYjZthj4BA6oX4fVtX96oVbDRNitEW+O2jZBBTGK5yDiqcpaF/BbibtUVZy0i05iydZU+lmg0Wq7YnVsuqN3hG/wRGI5SlzhcncNqjIcPWolY2Jn0jifeld+i22pZ9IOZ4qyuyrp1IXE9cVq9am/fSndXu4bsBovQ5aCuB77uQ5SRxOjn/xjoBwrZbIqwLkNx9EWiX4nlbxXCEEqZ6KsLqNxx9JVdClHO7W0PQWgYfCMILm40WpvoJlzQ6Ei4srVfC+CsfRGVBh5E9ur5ra6qhDcXCF8IJ+m9GlwwqWNvqK4eHPj9hqYfaJ27u9FlU3yNeKbN9b/wDMGUC5udH2xvbxT1PudGYqEgCIxoF2kY+1i+1KwtgWVpIhouh7RxxcMXDBB1Id6O+qlKS2ygqJtwpCTIFeiaqpkwbBNBkIQPqGgibrtmiucVqdktYWO1tPZ3C+GEJxrRUf0c/jJugvknfsX8iJ4mrkUCYErvz8jdjTHfj7d/t4iEvPk9pDZkgshjvSF/fILrW/ZGYgIc+t7GZH5wsNZlC3XcGPvQqoAG8Tgb4DzihCRCdZgPpL4K69gWVdVNOaKpeuACndiEhgY1EF6gr3OllVH1I7HV/R7TTEK7dWKeDjDQonU84YiOrFXJoRvq6NHFD21fKO1J/NK1P9la793r4+0drW0pXFou/3bvpEx69kw49V070xVD6y+DTN4FtcZEkN3uNgdjp8Y6ieznWoOIcQnI0dvNFdffAYa3BWJ/4I1so8q5wamwQqJN+EOfRblbmz7JFs5peZE+r3Xw0GLG1NBwGBbsQpq70k2XaccnRo9qvgWuUhOc37uNa8K92NfuF7yGliwrWjte3f67wFKfOKvZNdX1hIcnpvp6kY1oSUPfqu2H3lWLs4sUeHuqTh6vnFNQoo083VH1giOsVWpoNhoOh4n+C88UTl6AB0+ybQ6QnmRjIOFKJKKwV4OvaFn+5L/dycm8cQLPV6wpOX2932UGdbj0sO5WRcuLbYZM+TMbtiBzGFys02c+IpcHX0QXuW8MFoUkjDj5jl3qa3KSznzsO8Ai/BeCWeU4RcSM1ih9UN6halxtHiGaWRxV8Yr5a6mj7/AIq2zqD8iCEIX6sDOgEokcvfmSdCABeHv7PxSlJg9/Z+KUoCcCEIQACEIQAJp2+PXD5LAs87fHrh8lgS1LiH5l6Ivt/ACEIX2FQWeM73LGvJO+HXH5L1AAIQhAAoQviVv7YL7QFTT0oE4JvSiRy9+ZJw5pcQoShJ0oQHJHiBCUIQEOuoEZv4/ekaWG/j96RoC1p6IOC+JHmuF1/eiVv7YIzEr/nR+EUCV0qs4yOB9pQk6UICxLiBZ5O+HXH5LAhA+w4L4m7+2K+0nTeJAFCUJOlCA4o8A4ISaTvh1x+SUpOHcC9k7odUfmvF7J3Q6o/NJw6pcQSd0OqPzS9J0oScKxkned/d/BZFjned/d/BZEBQl6ECEIQFAF7O8zHqgkyEB0RZahYZZW/tglcPMkLBnodHwis8PMkIDoCHmSEnQhAAoR/3VCEBQBKF5J3w64/JZs1Hp/3UnCgYkoSdKEAAhCEBQFEjl78yUJPI5e/MlCThwZ+h/PqAhCEnDgBCEIHqPAeSd8OuPySlJpO+HXH5JSvVuAc2QEIQvAsAhCEACdOEmcm9CAoDh+y78yWyt/bBNc7dHqh80tk3/wCf+5A6fNj2dO771gTmGHOOjIHGkFFlYrA7F5Qcf4VdOsnrIpbgwwawtlBxhF2OaKG3wb7/AGlQG8b+gbFjqPpY/O9glOmf8/AQm7r7ibJabc/9J2Sir9h2SlVVsWYdyIFUrR//AJRGg63D6quulnlm1C2RsEWikWqAntZnBhj3E8hbiY4hAScPCEAxfsUPv1pzaDnx8/dfy86xldN5XbpKe6hzXI2p0EicP8/fu9gxpdN7XbpDd6in6t2SkEnOTxGRH7471FlS2hBgw2efy/BVora2ydmLs/rjrVXaktbnT+a74KU2romdvv1ggfbW0TyspXXvxcx+tUkg57x5XVyKQbFGeTaaG61M/wAYFNkSsEGFy4gdcnn+04x1U4ZO+VbPslxzDUzWU60eWTjcYHDygwdam906LZltap3Nvp4vd26nHDrw4bxPbo0TSrG2dfBkzvR2OkyW0Hi8gUTmis38T/7yhGmraLILQJUgimLRGIrF68Jj8AfFSVJkybvSovXvisvuo900V1D0hiKeE5K/iMrrIvEFtncIjNV4c7R2kAIYokTdrgtObTXHB3YKEI9etONQVhRITYc3u9cUy0lFjeuvokFyqc7Fbd8zh6ftbYqrF3bDXWj+lTK0IBnMpHbv3pWuQ3Jqcp8D0+zgJJbdrNJqh6v35WY6SmcK0GdG4cJrEF/2hqUS1VRdrzrJw454t8OULCQXPhysCym4wvIpyqSoe5V3j/8A6tDDYplROs3Djg13T8BNeMe67Lb25v8AtVsMrFjIulHDafYbvVjhw+kLCZWTBxddehcDITnXmTrbuRtFPREj/H33qpVVWe5SrXJOIcKcrEQb1ssGBepdILE7BzmSMhwqi1SvLQnP1tnCfiwKNAVwZOezO0nC3fakRdL8jbLurBBNu8SJ2qonJj+Ih8lpAdsP6JzleJ+LLkHE6z3JptNew/DC1eonSx2zlp20wx7P/WJw61Mkm1usK2bJNmOSVSBdPUbdgTLUnsC+Dh1LotaRUlnFN01PqC1E5raaXFjxuqdx5Puoa5C2tZXNU1xOnsFn4AtE2YR4kznAXOLh9aTzbshdOlmRM5WYlOmnwz8hqn68Kb1VPVWuHsqPYDy5eEjg/PnCZxtApawttOoiyE7wgrp22Ku7aYw0h9cFa/wVYZzw/wAIz4Y50uxXr2LgniTV5keMNbDCMehTrYq2yaplPdb1ux0w02Y0XDHO5mA8oPxHsoqv1BuysKMWl3SOsVUwznP6RQ/V8a8C0wpTqwF2bJb1vx+v2w3/AEhBNOCVJUbw1xz7pFhgVI0u7m+TwABvritnb5lftNYjzqOaWvGMbTC5oaAf6PYcffilBFr9r4dos7Ds9OjU+wicUaGT0fFQ0Ezt0i4geeKJH32HlFKi2o0uRdrcNzttW5RpzSXgxw44ca7uPVvDOszkJTUrNz85085+Xk+oET9WtSPc270ULD1Rkjo9uWuQZ3G+JBMjCcmMOWyGPzbI9Dg4vmMOTDNMnOsNoOKK+vQVjoIbOjRu2RyUEId+T3DvZ3DwzlwHjMyJ7PIHINdC8LHY4/RycqQZ5Jrjhxp7YLcL9N7070s5M4LbIn5jFOkSeJmg+T3AdaVOneUjyYbJiyuJpFTXuNe2pzYm3k6Oi/Js641Z8/SKQSEI205IDOHIkFYr1QwKF6newK0J3o54n0y0OrUKM/lXwEfIaQbj/YxVXBipCo3Rue3doaiS2ynxca7GX648qlKyyw6q6wfWx5fqiEpShcTji3eB92AH91ioXdlYBeHeoS7ktU6e/CtMK03U6+FaU4hzdzsevHIt3ELzR+QbkjvCwvM6RSsh3IBFpR0EEj5IOj5Pglgb/KdXLRDw1FNRHHQ3e7H098VVF+tgpSFofhBUFYE09RzTHwWEaDtTe/kc5SsrUlfUrTpdO0/PCKLKqAbGiYLdqWCJCCdt1SFM3NrVi56fQ6+vj6+Izp8lpd87IgwbdMubKJEfn4OnGcGGfvxe9aFTlWTKwbTj5AWEwu2wLUh4OdoeI12L54Kq1SUG+OjY60hQ55VJvpRV5fCji2+7pF9qSCFasF0ToLnoRTNTl17uvH3B+tuNg10tglj6lxyOV2CCf2GpWE6TIJbzhC4l7lLbaZJnh69apXQdjNbMZjo4PFRjMHO0YCCs7Tc5t0PIIHdtLC+2JLcTCNRWwinOu+P+gRTyLVirqGK2dMbgY25+T3vVDMq7KEc7JYybOKAkXV0/tkTTKj9IeCA0/lXRGS5eJBw8jlv7/Bc18pzJ1tItNtTdXemAaEamstrkX1I9neUsQOLq7Es0b+QnF0J/K2paMky1Py++mGGPf7PiHrR6zt59cWN2HyNso5VO8mSdJBhT8h9dX4rMQdzDdv2ghaU5We2j8YcKVKaefHQ0cupzNYDZbYTKCrCuHyp7S34QW7Bg7BTzeR64nFhtrbLZ61k0A4WMMbuwuuYDjfHiLd7VFa7ppXeFKo4ttkZZigXE6p+R/Bn3/Z8RbN63RHXStt8CRTycQvKymIQcjZNmVps/Pwb6dKdo/wCpD9IRWEylrWWSESXegaxahfXImsRejlvtoJodK2m1xT9nE9+LbGl+ngiGAqWKEyjrb6WCnjRGfTOUMx8hBWU4mLrcMkZeHIidNQpT5D82f8fuFb+TdesTyC8cazMLdWMNwlmdOUE8UQ9+EBVasUh8dxI69ouhsqk7LGpWRW9jQ9bjw2qiipD7fyYchMVB281I1Spw1X2IFYa7UYx4SLiB2Kd3i06xqqqDdWeoJ7pSjXUDZPBMhVDEWBcsjyby4mN2M51w2MosmrnMcpqHzkxxrTm/Vu/mG3yxIxdzIyzhPoG+vnIOV1i0qxWBj2Ra6aTGIsf1cwZ5cFP+TXaVaO9V1OZ6fkiugpZUDHfHeT8APyEp9MyaTGRmNd6AkUxatGJOyGAAiah+YoRaLJbGegKvHPcJDpTxXOyAaP0grZkZa3rxSkTx6lV1FyUyEPytXk7kt1aY9eNeNOrAacjvkxpEjnbFA+uUOXkl8GT+zHVGS5tr5Jns5GsoXdy3qodqlH1qxSnSpyK2a9A0/wATMeztHw7fit2b6kpG2JnBaBZznT7oJ6HdmOOjtHkdEVA1bPFqdBGSW+2AEZ1Yo8H/APKNgcfRz/8A7UDVH2zCPWMvstDlTW7SR+kf/l+3hu307qjPbK0Ja0Li1DjKTJ0im6YjlntsbgWKL/UDoU7ElE4IykWPdfuUjWT5TlOwqIMEylGul2QkiMSnX86BziDIhuKv5L4ph/Q1SNUZ6DPObLP33DTwtEaj6ef/AKqYqyVrZjUVnLjIkVME5tJUd8Yejo/VTFdLKJsK66rR1THTcn6JK7q09nVXDv3+saQiGWiy72azFh6Q/Z6I7TM1qlHurxPb2910rHfjOZSTOcpI8mQRjo7X2LljZ9VdnINmZs93eyfDgtyiFEU2Oj3K/mxiUmW/SajvxDqSIM08TiCfeqac6L3bl2dCPopq0zZDVOT2cPV6xTElomdOJFakUQ2rIbJmMOIKEIX6VDIoEIQgAeEJMHv7PxSlATgQhCAAQhCABNO3x64fJYEITgJMijVBHECEIQPoCUSfWEnSiT6wgAEIQgAyyt/bBfaTpQgKWfACUSOXvzJOnBJw6JcQJQk6Uyd0OqPzQFY8XsndDqj814vZO6HVH5oAr6EYjfx+9Ys9Hp+EFlN/H70Bfh9yArZI69IgyIQhAlSHMIkAvZO6HVH5rxKEBWBEjl78yEIAM8nfDrj8kSd8OuPySlCQa6gXoohRI5e/MhEjl78yJvmY9+deB4R4gQsEndDqj80uk74dcfkgOIUoQvZO6HVH5pOH9HiF0nfDrj8l6vJO+HXH5L1N4cQIQlCAD0Pd2/is83zMe/OlCEBOG9fE3f2xX2vibv7YoEnZ8QSt/bBfa+JW/tglcPMkIDyE6Eoh5khJ0AChLAfPQSNCTLcQoGeTO77llm+P4t+FyRyOXvzJZJ87+7+KFuI+kURkQhC9C4CEIQAKJHL35koTenBJw4MwJQk6EnDgBCEIHqPACEISgdwoQhCTh4AhCEACdKhPOpKlQnnUBQMy2NnYnJ8cZDQzglOrm6lYJoaAtvcMQmHNSYRhvjdDBYQKK7OZK2TrJsnYfDGp5MI2h1CLfg98KRH9lVZaSr+YWFE0fK846U9ETv4fZTrr/oK2v/SAzsmJ2ivLcH6JQ8ZN2TQ0WLN0h/f4COtobqLcYZCF7ewe6iqfKkqoNqk4gif2pFVVVBtQZBBCorbBa/NOhPHHnw361jyKipvSDNnlJU5jqH6Ru71U9VPzvGPo2OnNIk5r3xzHzm5RhIVoVuYY8nZ58L1RStrYDD8/AdRxVNYTnUyf0c8FGJhnjp5Gf+1a3s/RnEwiJK1JvGu7Q0cW9a6WvcDap1SGbR4/s5UwznKdP5NyYZxnx+KkGz6xq021Sd+pFOOhYvI7m+QG4D+MVgrmiIJn5RkDlQS8Zw/S93xMXg4rlEfaSzH8lh0n/oq9zbkLOX+V9qVMNWriYO3x+1OU7IWpwiTPzFtjYV04GChv+1/RzRelNsr7iKVp8aUFYu9McHXg5HP+cbO3EdnySPG9/wA5WyrfIvtqpptOcGCNL2gCiQxsNCOF1Q/gqduOMajJ7Q8AlU86C68I9gaPcYqYW9dFt3KlhAOiL1p1dfw4hs/2jNF8NQ7C7Oyef7Un0n/opE0NFU1SXPApmnX2qycLxSlwMfBSFQVnFdyXKqo1dRNTtRLVTE84IR7Yim+HfenmTm4WKqdsuuXW4dDHeGFG+XcpLNmLfNyzdLJyCBH4VVJTkqRP0rWNPYqF+L2tvb4RVhKQyirX2kOQQNbCwlf6oqnb7lVidUk+QZPHIBa/YcHuWE1hDdZM4in541/sf0jH6qmaStmHlkSVmGydfpZCH/mPZFbypQ9cibzJ2TlyLDo7S2UhXhpkgmv7bbMGBiuvwbHd80813l+U4xiHN9mDITWr6IJd4RPnk+nW/t+O5ck75IM6eOQDhChN2weUUskuUndy9/wUTpoJtJZ4Ry+LnS8BMCJ/ZhWvxFTeT7efO/P0U0RMteWm1ram7+EFbvTo7Fex3XNwH1UNR9OndW7qWtzn6Tf3vWeS8Z+HnlbLGGQiWZG0egUiROiQgsyNumDQ8yYHGxyQ508wFvb+NOxUgEOH1hX6t8slqqkKbs5sqpCQUW1itdzvq1nkeuFKhdKuU0F+pyoAJH9H38d8hfr0ho8vcv0K0pXdFWt0mA/0wcIWMUJvh6RAVBaZrjl7Sm4h+gjnbJ5/+pu4+7ERC5LjdxbptK5M7IfnwthYZ1nLxIpi/CFYXbFGIdSYHMRxGvl6F0Zy0rE5x1YG1O0NZOjMLuXOBypUwHPkYErfv5Fb1h3MzuO12r7Pzpy8sRWdeXOu8JdkT+rZSZcvYG+GSQ6xk4hvniiPogurmcP/ALlImiiq7e4SJAFHvpUOnVBR8HOcmMwEjag7ylOLlUlSVVTml2Z0Kg5iQwJjRj9WH9qTi92xjkbx5y6uvj/lQPEa8jbv1z5+RRGRRLnMVIvphIYdhxrSbIhX9otL0o1w44GA/aQcYKRYWY5JEZ0gh4tZq+oCi+Nwv0f9iqdNZ6qIeGpvrA4qn4lZg6Omz79nh60neo26zinXaeAO9lVAPdeIWFHSEYKJOIeRfrpt15dXWZf6sQhSdXXhX7KjsrqnqJ9oTKjk6RnB/wD2z6wXGpClcj+Rnxxq3fRBvZDqt0fj1d5+tssCpWlKWZ8/i2x1FuZw2Pyg4RH6Fyes3tTDoh+HaGejqXdoupUgEyD4xeUFOFquU28UvUYLPQNK0wI1iNevGsUYKpLr0fT8pcKLFU66yfTIY6+HV7K4VHjyNqvTHP5uQ3Y5BM4shaQHYha1OgO/z66p7FxxwhkQRD9o7/NWPgFJdLMqWpimK3Fdqxp9hwTP4U+T3F/j0wVBaDyyqqnuTG0PFHUwWK6ugAOxBRb26KsrWuVpZwE7zmgam/CDRQuO0uyHiRjAhV1PWdebdy1iatlMScsnLIpSnV3U7+GPrp14ckbcvdd0ihFEzpk6PLFtbMa3fnabIaKuanNqdIi7ZjQLoKYDJ0ked9utaTZtW9K2jWbslcM0/SrW6i6jLvKEU8zsydJkEX7LBUJIVxkT69LU5DZDFFYyLxWrveQpAsnGST5NxMjF6+ZYKJomjmJt0BT4OiGvE47B33QTRJf2eROkN+OFxV/KtqEnScZIvhH43LgsVRFI6FMxExwRePNVs42mdsMnZ+TcqN5VFeP1OU3IHHnkilFlSMGYDrieryuU6drv+Ch+0mzynKqDkk1PhcM1bcWbE/R7a3jjpZZkjHRc22fyyedIhhZ2j6SiYS4Wz6WJnTIblFFIq+qFwt1n8Ftktgtn1HMQ0g2uKsfDrog6r9kM5dW+KqbXlvdFWVttU2c5NLW6CFP94VR2pPZ5cXA//ZS1C2W32TX9eYdnAwdndPufkloBui3n4f1pVgrB+DqM2QQPhRBfcVtayNGesRbIzZDEY5aHo1zcjqrznWrWlaY4cKevDEWHciVsUtj+iXOTIb9TGCiZzwROCHInwi16UkbWDuUtVUGEDCRo97jisLI9f3LW6bcqbHYHXET/AGjB6lpMZzlUbxJZ2AEookoq++MblcS2Dh4dxjkSIH6HmIm0bIRY7TtjlbLlLnzHIL/2TNptpYdIUxZVJwrlSbFA2uaiezb+Efq4oNHrvX021I/NbydT9YVxhGsSOCMx3IsNg7c8UPO8EKInQdaxdmEg54EZN/f8Vp7y2yqcEn1xafPGLKasQbTlOGxucX9xVD0SRXm3rLWFUS+ap0185617+qteHClKU7hFZGeWlJw+vQT5BRu1SWvh0s/+D9MAughImt3qNkO0Bs6jGc5Wg2qGz3d3Oc6gKE2HGQ1Q6VCjPaDNOmz3Z3BiS5luk83bdvuVp8nBsq51rvEUxOahoEjTwjPzoQi33w9VE78ilj2GZ2bGqTGoLtRCdM9ffWmPd+cBorR9S0rdtg9yQWXaCFz5jDZbLHOcO7hAZ7CXa9S6h0o/NtRM0G9wkDFwhsJgfpBuVXqVslbZ5kglnni3+udClRzaJ1NlyG9gxJd2YxmCBug3kdKzlfklEXO8IghXIoKl0j3Jb1+yBG7emRQRRaDkoG023HOFiOENYyobZZ09nY9u1Q9VUDhWpGMcqFnFQgktMYQuLoW0TVgIcwpi6a0rUs51h5nab9UI8q2OpGCmnUTMVOxtZYsYa8cBqios0vuQY1pH3IhtWHRN85w4+uvr3V9Yp9a5HcXTYJdHPkHEORZKLUVRjswIL7SpRcLhBcBjm7+2K0VE5Dhh5cgmt3uAjWLHiYMLr1diS+0dS0kFgpgBrFvhgQwgobltcJzlnsOPIxZUdeMj6O7VIJvS7dq6GzMK7Ml1ddfjX8cRJJLS9fD5pqED5Ex+RtCEL9IBlACEIQACEIQAPCEIQE4Emnb49cPklKED6RW1C28Jp2+PXD5LAs87fHrh8lgS1LiHxl6Ivt/ACEIX2FQEIWeTvh1x+SAD1CEIAFCEnShAUs+AE4JvQk4dEVu8OCUJOhAVhQvZO6HVH5ok7odUfmiTuh1R+aB4t6I4xG/j969m7+2K89p7USv2/wC8gObKnQbjIhCECRoc+iQKEJOlCArAhZ5O+HXH5Ik74dcfkgAUr2Tuh1R+aJO6HVH5ok7odUfmm8SBDrHiEIQO6PEL5O+HXH5JSm9OCA/IeiqBeyd0OqPzXiEnDkjxChKF5O3x64fJepvCtFYZP2ffnWNCEDsHhCTh+Z79CUICcN6+J/muD1/evtCBIEVgIQviVv7YIDwisFcPMkJOlEPMkJOgd0eIEoSdKF8K8QqR4BYD56Cyzt0eqHzWIHz0Fk9S786RfO/nvHL5wJ1llb+2CxLLK39sEBYPte56HR8IrxCUBQBOCb04LxbiFLPgBKEnQuAdwIQhJx6jwAhCEoHcKEIQk4eAIQhAB9SfPd+aKWf5gjv3/BYVKVkFlbvbDXjVSDfPJFxcMc7lwhdEBv6E2ykmziY5aWfnyJELnMEcxJNISOPKvvRkKLpZDlhml536Z6oBjBrEj+oohu8//Wq6LVU/SWoOeQTPv+2CeJITbTbOC0M8gURrahRwgwwlTO3i0nRUo9vz+7esBOJCX0oXmpIOOvol8CfV/n6xgl48l9JV2a9x6Q4jK2e1qTIkz/H9VyoFVVYT3yfP33IrCqp75P8AP6r1G86dmO+9bQsqymlutCYk5wbHtS1o60GBMfSD2dO5t/e9Nk4yHj47VEXkjduWLPSszy89ynTJrolori02B7//AEYolr8N6jj9HYmPEhfmplOSiNtQy8w43ppl4fnr7hG7pu/UNaL0Ek0VZXSFnTE2WnW3BRdC3W46nLOvzfztn1RxTqmG0HKaruqdgHOFp9jD4m0smtvio4tgtNcbR6vdX9wIvFxWxh33wAUTTc9qII4ruUNhrSo/MS4bu5994fm0foJ04Ur316w3RsO0Q8+liFO9J0s3QINqnVe5XT4QNJh1LW51bzh53HiuvlUevFVyfHjt/wBq0Sc5Tp86f4/s5lZqMbG09OKkvXTVqHmoils4tbROUfXdEGSCWd0KFGEK1atIrokzyLM8uCitH1vJFaa7EFjFnq4GHlFvvu3Lh/Jcp2+PX+Cstk91e5U5aE1kjnFCat3Mq5v6wY2QZ+XoLzWWR5ZDk/P2fYK3QuRa8Fjt35C6zsmF48l3TGS+52pURaQ1lNL7pSRg3iOpuPG9qFM9mV5aVtmCrBykDt8jFi8SMTjb+2SHyxSqahzECymlhnm3btnX59mK02sLJaknuFLurmJtV+DOhfs6oC2bUT0yoSE6vyJPHKfwZ8KU92P2esRTyczXaHfOMxEuiUdlsoPInoq1QOfVFASBaUrvfeFqb38jpXGmqaWrWzOqjqYrhkdKfc2onVywj9VXR+zf8plTewt9b0c6Ce1lsal60i3LI5tvpaQ31vUImsW8QzAFwcQE72Xcmk/R8v5CuSNWdMOzlxOoT2cfhXv3V6g5w8lK1yVr2O2QccIV42nSsPUAI31z6RRGlWd89DvgrULDX5cPVgjbDrAnWE8ij7dWIUrdHTbho9ahNyXq1Ih+r1VUdUN3sT6tDIXnbZ9zZ0ZCv0yKE+8TV48nZRb+lkUXifiz5TiJp1BuUjVIdWEu/l5ENrO/Z6GI4rdfjDvRyfXKy22SnJ1w7I+l4SHHAYluKYpwdrI+ohjqjVzalIEZpBxuQeFP7xy1sSyWI4pGvSf3if8Apjb5FLBSddQVE2aMxXE2Q/WtwomtTLMzIn2Uz30Um/AmX+UW25V8naeB2lwBdMVcjw2c8zho7JH3GKHkL5VQ2ZyfXpn7PYDx/tBthDe4ZmRU+mXOf++Oijdl1VVIk4asKVFKK50wueUtZLUc3P1BZYKVHnuhr51z9084nayUskuTaP8AWub7lF0tE1pI8+3bZFPoHOQRSNuSD11F26JSfX5H+AWIrVxszqOTiGmj4U/040TgqOWF+pylXfSAw8dF3YF3DjC/Hj861XScmfJjq6UkMk5+TcPPjd0wUtY2+g2Y7JQ5tV661r9td4mzyeaVWRfxLdPWE6BsnLDtXc6bpeQRjcU2FteOaAzfo8f2VatJkp9MkmOtKsbhmCiyRXTQew+kU+03YhbVVM6RBgs7qYoaPrZ4Oj6dijy1DQ7GnlFcqdPWK4nXqzicWfURMdNbKr/GTOHqzZt05XjW4EQvGaeS/wBnWxm0U/VTKqmrx9ra2oq8wv5rpJk4ZN1VUtQtVURa+fZ2VRzrDGwixnR8MQHGPviiydYlQdHSSGkjKCfdBupXlZopYDye4Kjv9rsY9nXXk+nOJ1IQmQp1E1E+vhTGlfVwxwFnWtcdpVaKsZbNrM2c4qZRNEmSG2oqnjI2Rqa58GfGgeUnAhLKKsgtftFqmRoCjytRO2Bvh+j4wgR6quhxn/BYszpWnAKgeyXVsv2OEcXHctqs3t9sHrC1pkb6X0np0uEQmio8BfT0Nk4qmSS0nXJVk8kIiKVOllPyzpcgmTDq3f5escXl9/1FizWJqeWXscsombJosyfrEKUqOmKpdGx10s6Y3BMsLorSqpytLLKbqM6hxxyr/wCuN7diVG7BlC1rHKJe6YeNFCMLUTPCM6cP3gri1rTVmFUiSXGqKVYnYoXiZZwQkXBZ8lmVWNwlf3m3MtV4UqvMnydPrDlJW4zZXESWvtttKjwucuT6QrJaRZZUciINfEVu1tOEatkDu1a1vdETizpEgdntGYn99aBrsGEddtC0iv7eaJGCCaCaKKrRhdCp7LFpCO0gfAjXfsceiCiij7JrKLVnId5oZ0riwq0JghfAUuN198ObXCMO3sTzVOQVhP8AeahkiE6B6IpnJ+/hyvsCyXtG4ELZ18qQxEydE2UnQHTfSU0gNqhmIYrm3w7/AIrVKqpky0azKt6YIxTT4bUuex6/UMQJEVb62sMnMyNuxeDF1rC7uWCh58aAosNsvVJpqFMtgy45hRkZtmuH5jm6xqROmxAkUrXbq5Q1miBAlw+KtLROT9YbTEwcm2R1JbCYiSI8Ghb9IVB/8D7lIVvlr8+0Q0w9nqByaGxqdPBenmlhjce/x9651GlIWK2j2i3ns7HCn2NqF2uoqpxdPt8felu93c81LQZH9wPfJyZ+nkNy8d1eNae7hX27htlpomshlbxJadbJMM/SL0z/APUONitbyZLDqppd0tOsIqkoRqpR0kA1e0w8oRb2/lgLBaJIpyy2zN3wFEmvtoD8WLjhC4BaAcafGUv13adZNZ1Zu9WU2QuYtQRdYfrfVx0YRb37nvjBVfcrfqpaaRn2bN9HsBbFtDIZDBbofXEjthve8pH6oyrhZrrOQRY1CHOhWlOWpuxxpXHCmNN1eVvFDu4eIildubnWI31mQvjyfuDY6JqOlrF34Kp2h7hVddFi6sCde3AEEe+KK7Xnmoz6vnuNbvYtQPpe3BmA8HHt+HI9VFTSwhhz9KPDgC1tQwq2Ris+pW0bTjgS6uggzUNPezDN1ysZBhGxEl8oJCudTLkObJv9VOrdT87xKvk6svBkfRKKPlE/LKT6BBAMnPDmRI5BFZWlKvMpx+ZHcCfAUkXMfzTDTlhFSV9F1Pod0ay9FFbYJGHlD4pofmF4o5ynsDxIgI6CccDhrgpE8koadXPEVOU6uXlkCzR8tIWs8fMX+XVnL48+cdDrPbWmEh40gO64QXlhyN6vswWhU5PkyCCXxrxUVwZpVnfqxfpDQ0SStrJv1aldwrJlpZrKngSa9dH+Md/BjHARgs26QbHtNB6k1fPDEVqXHkkz7t3Xwp+O/DhUM992hZq6qL9w/MjyfDnF37QcpCzKzKTiIPYpboWNcGIEq903bNaplFuRzPSFLFU+xRjtbwcdc3wUnUHZJY1PaQXAenRSyBOJwO9nVhabkhNIeAaARWkb2MFUztls2+0OhFMDLPafOrcCf+X/ADFVo3HaUIz2dg2MeR8SvYCKg7PWihxPPlOrmXxws7fFRVbvlCtFlsnRA0/FvheqGBhfoGHeKsdNhfIjDnhd81yaynLJn6DlUVTtEknRgpUcYZA9eWBGRN0XRSlzON331rwpj+HX97xo3aRN03kRvchxxsQhC/T0ZoAhCEADwhM6Xh7+z8UBOFKEIQACEIQAJp2+PXD5LAhCcBJkUaoI4gQs87fHrh8lgQPUeIEok+sJOhA9Dgk6EIABCFllb+2CAoH2hCEnDgl6EKJHL35koSeRy9+ZOCA4IdYEoWCTuh1R+azoHB5wCdYzfx+9ZF8Td/bFA7/O/nvGJKZO6HVH5rxCBN0eITpwTenBAEeIWSdo6LkfWP3U5ByZKDJPGOK9KbNbUO9EnepI4+bGFCwSd0OqPzRJ3Q6o/NfYehnQhCAoD9mc/u/mlk5tzEn7oLCHOkyO+9PBpgZEmP8AemNbW64TiNRaLtDuHB+cGt/te/Os8nfDrj8lm8+sUrzMO/MlgZ6+b5wnWeTvh1x+SJ2+PXD5Ik74dcfkk4ckltekPUIQgdgoQhCA4DHJ87+7+KyIQgA+Ju/tivtfE3f2xRK39sECQM/Q/n1D7QhCAoAlCTpQgdUuIE4epd+dN6cZPE49X4JMtxH2t82Eyyyt/bBYkL0KAoQhCAoAlEjl78yToQFAcEJQk6bw6pcQIQhAEuI+f237yVJOhAVodYUIQhAeAIQhAUAXaTIhskk0RZyZXLgFhH20C84QO/yiA3+pXrmFYpZv+lO06nKIzBWELdMa8GXfRwH46l3+cISQARxR5OFFDEvjHnWVP0irvqm3a2UwP6Xlq/Ux3fb93rGXNPd1ehtVv9Ywji0KpJLU2nEEbvkuP9s1baWMnjXfBXYykLQtFBnN40/f8VyjfnKccZPI3cqcdB1o6hp5WXIFeg61UmMce5HwZ507q3dSYTJ3f5rCYZ8VrZjl8FqhmzEqu+9dRnpQ4zYzxM+7t5lZ+yCbOa7ArWagA1aUfvBeBnu4+r71Sqc5XSbt/wByvfZjmTsi98w8dqarRT9Mc/jxI/iojpKVo0ZsW1abjukSV+/7xQUDeHlS7WdcegXP/fSFWJxnjuMetb0Pzl5Hn+y4Xv8Aeo3i/wDjp5HvV+pemv06MmeNz9imuqqOEjpYaLx7lvn9MUxBpuek9HwRJ3Q6o/Nezp3jvdiyviiTJ34jmTYjJLOHhBnELJMnXI3X/ap3sPol+rC0GnWdo3QhHkW15O2TU+23vEL7g2Fq9Lu/LFdWm2ythoCcDSFlI4rTiisFUdRwhrgq/v7ShEW7RS34/lvcv7ie7r/O/wC0S+H1MIsRw/8AScg5SiztYyYRsZr9uIuj+oh8ef1T+9flyMcscG1Rz/qq/SNbDVWg7E7Yag17JRx4Ier2gS9fmhjJzDaP1qrf0dUXbI0s++b3fxhtWWWQjqIU7YzYzD/LmW102/Tp87R5EFoiVBzp2e57ufdFaYQerLvAijZh5COyPs5huD+z5idEgePSkba/OQPF3R0F5tvWyBuWlQ8MRAbFCC8sdcFrc5tw84jl69yd60pWmFRNpKOR1qM9bXozjaW2u61nzpA49QvuJxV8duW4fpltBpwOc0abKLxXG8drjBagwt0kBhnuBMi8otM7lJw8me4EyCobUmxaKjHCuDlAoeaVuJhBkcOHJtacufpHyEINw/SyZPm58+nKXK6DopHPqOj3ybtAIov1EBRKZOnHTvtv5UlTEq6RYu8KIiN/Lu4XFD685Vk/AqTOJYNpVndc/od85OJnHrSnJncgdozGL5U2SZJn1Tq1XpZJd50jdPKv608s3eGC7jMj9YMzySg5T+p6lz9A3I/6ZwZ6dIj16o80U8trl7Rd8Frc5znEQ/kvP8xGE9OSDzX+g5YRs5h3FvMG4uZY/a0ZY5RL24U/IFxJb9dAzA6Qg3psfrd67qSaQR4VObtd0blDTbOkSKJiORI0vhH6fDCLxxqOpIBTxm+jxmn6iBeokrARCEktLOGRTuTm6eT2C7EZ6OZRyDhwQpM6Jc2RLOcT60VRVDXZ9WEgeDoIVVRYARZhx+4fnSNibpRExraHeqGIUYsnaywj8e5RUcvzk7j0TTje8HE4p1K05u1rLSAeOqNriPIxXlORG8Lk2tJk2NCsnDkmVPWGz1w48KUx37t2As+MnUfKNNQQ2sOVLMY5/GQSFaFOo+fV8Gcee/OpTSLskAgIRbtnTbTloVB0TUY88hqfRHOnypBrRCLDo/AEDw40UogeDHI6058g3nYTyoQDjFsYdIFvbvPIeNO1AUIXqMCjcvpKMRXjSNpE5qo5d+OG/h94iiExcNxLLMYFmmfzgxeUQmTIO+NlNp1mNsU6Q3Nzow1q/NNMSDnerwgcBfv/AL1EltlilYtc4irrKXNzdoR420GxvgDD3Xmiq75CwbdTlvDoBBkcxChaEnhO98NQG1w3q+1bZS9ktHmOreS6eU2nMYxnBB0g4xWLpGLl7Ovc0baZDOUqFIbLhQ9K0P1Vwp92HwDpA/KeyboIwgiFeKZeUUnOkHPS0CsGOn3Gz06i6u4JVSicKQ81E7BXcKHDnXQhfGENWvXqXQOn28eq3Ol69qd2Y3YpzbIANIYcBYt18deKv5Vzbt3sxm05Wzq70vIKMo1/a59VBmcnJjBVEtK1U7slU068aVJF0TmODG87AQw/sitV3ZKV4W61fQTnnCJnzGOXnOX831Yb9w01I2rHXrbDB/EuciuU3LOTOfl9gfoqbfMyBx774w6lrbw2yZ87niteZaraaq0VUFMOgrqxF+uARvvW/TfMx786yAokszVobAYQeIqsXZ9o9IKMWk2e2WWOSKptmPa7mxpFxwdOR2HSDz+O5cdbTcoO0e2d+IcHioihGH1RnhDR7cAOuuX5QducyLFacAZwC3Yku0QfFiA8u9cfA6PbWMM5vfwXMVz8fojYFsvQUixfxdbmneffUNkJn5erITdu/n1+vcLIaMryvXUv11jasheWqb/BrAM87wcYbrnQXnM+seqlJXSziZi5/kvSpRUZ4WEN8oXDdKxXzXXAwICwrHisEWWDEuDf9bxi2R4cm2nIQIaB8XixcFg/rH/oFe6yqBi1LQmKpxfEPqUNTKt3+SKYF/fGkv05tap2HPkFCbLtly2qTOkvjbI0fPiJqwOM9HrQjA5tRuQJDxq8vYLdpBvw3uqm+0AOztkoukfBp04JTlBthpSMI3xjPIhDf23ri9fpN1mkfkNrVO72dYZ7VnlX0jLyuQpIrL2y8sRdJcXJrcowYHsoQkX1tkPLjHELagzZ0Zs+QSDpZ0doYLGPnpGJFy0qz6ibR6/qoFnpBrKdiS4XYyPo1v8AesYrHs9EyWm32lqGeThXaECRzXgzmISKekohiss3zlO5ImY5il6eQnf+fYGa0L7g0EX75chiKEN0ReRgsxYrD6EjEeSLCsagE2wy65VwnWhSZ5l5Ed3MnLKPtgMn1JPZ2+fDDCbDqiqfyXjx3J2qrbNs+Rk4487OHzuF+XvHKyrEkJtn5cuX0i3LHSyzatpN0gYePXDlVu6bNnT8/wDWtXQuWlkjyZpiRxXDFrqqyt2imdquwornEXbBIbrlTOk2JRiZKha8VBSWlK3ErdltwkOTH1e/ovUe16ztDqxOrPUEiBbW7C4LrWyBmeO1filj8HJODVNs6UZuyYistso3eEft+wPyKoQhfr0IEBCEIABCEIAHhCEICcCEIQAC+Ju/tivtfE3f2xQFSHpSDDO3x64fJYFnnb49cPksCcA+IeiIBCEIH0M8nfDrj8l6k6UIABZZW/tgsSEBQFCEJRJ/9P07knC9HiFCTyOXvzIkcvfmShAUgShJ0pk7odUfmgKBnTOnGTuh1R+axG/j96AI+brbPULEkm7+2KVpvSdDrEpR4ATgm9OCUBcjxDkEZOH7fsQYZOOnd9axSZPPv73IzUen/dSHmfUHfXLbISlD82FaEnXsndDqj818hyRWHiEIQFAcEqz06fuTanBAVIrASiV56HfmSdCTh+C+Tvh1x+SJ2+PXD5JSk07fHrh8k3gS9MCTvh1x+S9XknfDrj8l6gPAE8JnSkPd2/igcFuAA93b+K9nee780F8+u9+ZKJvmY9+dA9R9LX3BOhCECVMgIQhAdAoh5khJ0IQAKE4epd+dJr4/56Cyg+egky3EdPmwjShJ0oXoWBQhfErf2wSv9l35kBQFCE3pwScOKK20UAheSd8OuPyXqB3AhCEnCgKEIQgOjICFKlkNnsbVLQWSiIOmi9KwnnFO0IXR2dbJb5ZBGxatPBiQ9xfxS2rGxMjyXKPq3RDoXAS18/nxy58uFcMOHHh7scQ3UuOJQnCQVT+cnLnyiB0IQpAH3XagdVvyeNCRBaK2tIcJHpYnQbRq9XH1d+pXUrZ+ktTbPIJn696Q2JUR+jGyCiaRjshTWxQ0xy7SRcUYq+5R9e6Dbp42f1fBfnq9WX0h6SHL9H0ainI/5ZN1PjSmI/P55rr2v5XZ/nlBQO3isIOrlhxp/wDJVRcjfP3dXf8ABbU/uWIMnkEci0M2d4nVPhet6W1EJRccg3bjYExqbXt0jBDsFDO5GfHo1rQ3Iz4fBLHIz49GtahOnd96sJFGiCIxZpBvai7s7ducYJ07vFW5ye3Ev9DVurRE7Z4CgGwE61UCdOk99yuXYbKjIyfLb3f2xzBCD7LvxVaXw8KvRNA1N2dH/wBRIRbRsst8rGzigqkHOk+PWuTp3Nv73pWm6dvj1w+SkM6tqGh9QIoq8WXRI38AbA53f5KR6EYfDd+Y6f8AWSysF/DKLJMnx0iCvJkWWYmVjaa1uEJHktqhcYZyKnoOXeRUQ6lnx+bIUwGVUtrJr/Rk5Rh03qqqm3Jzo+lrJ6AahSnx3F2OF10PipgsypsyQzSCCQStJl8TSO0OzGkIVHItYq90Yqfa6TEuhUdU6m5v7VRS2z8omG1yfA+wACBd3piu3zYIH/VVndJJa4WCMfAJmUdHNmcK18ft/Cnw6wspRFdmnWp8niDl+UHtnbWtha7AaPdtoiVjq6MB5vZe37lyTNhn531TYehTAZUlB1/OnkZ8qk6yduOav1dWhv1HvFOQnkESMW1x+mAfRy1VYMBFW1bhIhifPXtn8Zw5T0OsgltEQcqzIhekX/vGrSt/bBPEmTz7+9yRJykmfBWuz1IjcR5NcLecDCEZOBnYgb7eVPBk7Su07Lq6Nyw5mSRHV9qR5md6vP3xTsH5DyixSO36bc4klynTgQ2rE3ei+VaE5OefnHeP42n4NykurPo8nF4oQW/etVMk4GdPTezEkuKS26OIugfzbKQI5zaGROxA08UTkuOSSTJkyL+K8mvcsmej7z8IJune8T9cPtTO8SiWKp3yCJdZ4xWKy1dcTmxmnTp0+OG5vgjmxE/ogsM5y9Xw/wCKPE+9KN0mEXyp6oLZ/r8gfQWZ6T6tIv8A7kefz8IpHJv/AM/9yfg20w+dh2/ayufcn5msE9EVdaTZ835wG7B+Ps3dRr9zpjuZaqz6SOMAbxzyolGFDhXqSKapV4OpV1HInitO1evLbqEo+z4Go5HhNUZN4m3QwThFwgvF3qLFB1Wub8RczO0Jab8j09CnqshjHPk7YYq1qqEHFrbzwcXBpbJDIH/DqWrCLP32vXF7HokJ9gVFhnwxp8dV6aH6sKDHcYEU/TguGxW2abAW9M9stUsTDUUGieNSjYULgoCMgGAjiedReYVmV4ajaFalTUP4+Hw/PtFzUgZBeRcyzF4ifJmOUuXoBHSGS/VTq4nSHAJsFc/H3GVufe3R96XYyx+nKPsrsyaqXIqJiLKE9cwOj8eQuFrbVT/UZmHg+1Q7FQ45jolxbm9Wfs+syoSeWFGt7dRhYtLnjnYOljynCAA6rDSfbkjMtiI3BJVImTl6pFFQ++nxFfTtuROyE2d4mRt9EubOcdFrFLAbN7LHh0d2B7fahc6hFwOLfD/R43soqHPJFsyi5GvEHSpxXR2a8EYWEfuWazdysfaq2CApCsXSoHR26b25ONs7hbLJqOPggbFpaxY3hmYHHt7hes3UeXO4uHCj5RFVYuJjK8jP3dX4DlZTyclJ07djJalQ/aNyRp/Bsff42MPdmLRV+JZI8HAi1caDfGA/rux/FVVlZHr5U7kZCkqxph1ZG3YdLGn3uOrfrhqV57T7caUp2g3snP7UWLgoBrjybUpsDMSOc6B4R0xzOGD6Obx1amjNtfUkg8ctnGy5z8TpUPnPuxrWm7f7MKdeA1Bomjr4lI5+4QW2POp20umcdKsmIOpKKbptFVM2wiHwnPyQYCdfACEfaY/er2GSnicHIHb4whf03KmOTk00KyPAWgqoJdCqrpuQ9uoZvC/O/On6rox6746lfmdmcz+ConSE719yqOMm9Tf0Kk38OFeHDh/MUBpYrtN2LOP+zIIetCs9YayoQ6hnl1dPbdMBH+UQCB1SByswyUrHp2Grc8qqn3d5bPLf7/WuJSFam2wSpPAl0cKXexhChCtRhy5OF0haPaY5z6mHp7CjxzEXd3jHwfb8QP60UrB0XQyr+PWWcTBmzLNyykPkrn3YfEWTobtakpErP5aXMjHENyikNlPnFg261OkK4qNks/FpamGqzp1Ln0SHTYQAjhwfc3T7PtXLe1mz8xkrusGCn3UqoBqUqeex4u++Pk+CvDKrCibLGae3UDPFtArBqJINDrmIEPB5gIiJ6r/LnVJQg6qdjCCHg4rCl580wwHFxcXD2wvGLRujmLrFPnMhHFMgx1eQtD8Tn46zfvpu799evgG7SnbcTNqsYmCbKbEfo5P8esOI3Z6brae4wH0U6RgIVgP9nkKwTbSFFNMqefavV+LJad9OBR0g4H9nKmGk7XYWeVbwn2QC2lQGhgImGRx3CP8AesHD5wTSHVVKvjxPb4guheL2Fo2Dyi4EcqsBxWVMc7ZwcyaNC05dOnXfvphWm6nDf692GAr2AgbHY1Og3lc7k5smU+cSlVVvj9P/AFQoEFroCmCobG0skNHwh9aMTzYO5YK18FxPNxeEYSImmcfioyd6PorPSCMw54nCyNx/rCcaDDk05VU8gefi7xdswMNIetpE6hYEsEuwiENXRQvvr661rjj7xNvktcLKWPBPtXqzrdgw3ar34N1q+4meTozE791w6YKilMYL4bIpo0l0ZIw2UszXCEU5WgUg+0u/SB38LRWlGyQ9CXRvhh4R1rUZM5KItBo4aoO49XOlk4dVeG/20ww99RpaB1SEcRu4W5sdC7DYWdPdDU7TFMNnBLtW/N2t2O4P+Ffr13q586c5NWAb3g7yp4jsXIuxm0Fyo5zkEN92JxXHORdAqbqRyrFykEkEXFF8c2/SCzRpEtN3Hy6i9FM7auc/LrifOeu+m/hT1DImliIkV5bX587bp8sW6Z8HmZ5I8+EIJyDnSTp0/vemFynSGNn1EeqqGLPrSfCM2qR/6p3BwVFpRDt4iq+b+jIKGRjln6R10Cc2QfmgQsn9jWNfrGIUBCEIABCEIABCEIAHD13vzJQviR5rhdf3r7QE4EIQgA+Ju/tikScEmnb49cPku6PEOkb1DAhCEpDoFEn1heSd8OuPyXqEAAhCEAChCTpQgOCKwUJQk/u32fzRI5e/Mk4WMg4L2Tuh1R+a8XsndDqj80BYPF7J3Q6o/NeL6k5nou+xAcmnpRmTenBN68R4h3R4DJJ87+7+KWT+TvzpJK39sEr8V3uXo7gWeTvh1x+SwLPJ3w64/JAcASd8OuPySlJpO+HXH5JSkC3AOCHpyewCEJfOzPT968DuisEC9k7odUfmvEoQFIcEJNJ3w64/JKUnDwFErz0O/Ms87fHrh8lgleeh35lnnb49cPkk6vpg4IenJ7ASd8OuPyXqToScOAUIQhAA8ITOlIe7t/FASaqo8QhCBJEuBPd+Ax/s+/Osi+JW/tgvtAd0Uqt0QIQhAcAoTh6735kzp0B89BJluIBjQk6UL0KAqE86niTmei77Eyr3PQ6PhFJ1kQ8RrzYVgu8dqw925eoSfxXe5A93oVGeTvh1x+SJO+HXH5JAl37ef35YIHBFYfSEIQHYKEJOhAXIrajfQOEkycFNiQPPKEJ9TMBStxd3FzLnHu5pTq5lQuxZh10IJkShIdQhrqOdXv7x31RgblKtkFISq+tToKmJ8iBcXWppGLhyxHH2sxRZ4n/RV48gmlpDtbMdUBEjVSlL6vrDhsqhukSX8h2hIStK4VImfJ9c/wDnUQ7SBL1i7Tdv/ojsC8zsxI1Q+/lXJLKuqrEOU9vz/SupNYOWHbTiflFcN7eH7StYT/H6t13Kst6BILbZzaK8CDN+gmH225zvq+jRKK9uU6/P/wB2tRu5GfHo1rcHKdO8d1/FRu5Tvt+K3tGoiVaWbk1Gca25Tvs+CZp26PVD5rPP5O/Okk3f2xXaSW2dEYtkVll1vrjErk0FOnMeSPGffg/Cu048L+GbxI/gqUmTsxJn6+nmXQS16Q3Udk8ZOtIj8ZMYTq2L6Mff+MfgqIkDVe3TDx+bon3l9WFVPvToJ7ZSuwu3L/5siZvwFEE3rPO3x64fJXzyWMi8yuMzaPaNdT9DBwxwcPb+mKdb9udvD0I5dZdX2jd/qp31EIjWdV0Tr/N+IRZk95LFYW3uchwiCUJS921u5y75WM2J0TYvSshnYJAsIYXHPDvui4KmbblK0odWzHYxYu1CiNd2BDeAtbdBSZlyWqTbJcndzb2+4t+tLh4LBw93J44Us2X44umbkWUU5T2ZNzXNQnbw/aKe7GuH+okCrJ4hgxyZExx7ys8pV9yhLR3WAxxX6OWorBUez/R0Rx/W4qrBk74/ajPSR46vtSOdOiREe7n6lOm6DeIjaR0ebCga1VVl1toDnnY9P+8tkpqtninL8PPgW1+uM53o49achOaM9It1vNzgQdqMVSLsT5FRM04NhrgOeRS+yP3HjKbjD/uq0rMzgZ08ciRhCcV/1jBaQG5GNRkhwb55WKE4mZuU8s7kz2mhyRyZ4rTWQgv/AFc4f/cqyLVvVGUW2d/lI4D9RFncVfN8pHvh6JFhoUmdmNcIdUVtTOzzXaTpBxxQjWljDRJmkp5NQSChGtpJ2sOGuESPZU/v0c/eONz4HoVp0Xo4W3B/ty0HdGflaWIYiebIVLxnDA5TgwZMR28f1VafNz0OMT7+pPxk6SDJ2jayvY+VvWnmGTp87oXrx4ixRwEauqSSXW1H90nYGGcZJz2uPUsP+f8AH60SQ50/i0jrWacHJH4xP3qE4Sz6n9IIl1f8AiOqRGKMmdP4tJThJZzPWdk5cYdugsWMzHF7udNs6dOI+KR4RLLevmOp/cCgPOZZwYefKLKWWS8GSOLyBRL+WKZ5Ic7+aWZkOOsnFF6+xOaK0igjigiVsn/AOeu1C+0txuwbk7nNr5Ag50LuUs2WUsG6QIHcHRhp8YvPhRqN79H4hRxTeMntrqOztQsdl9h3re26T4KmnN9TnQdiuPNAf0c4EEcye32vqzOwbKYK19/cL+0eo6iSjZ1+cx09WYutPyCEOfWDapVITjZ06GBJdmwUofS5jGBpDADqQS51LAtoDRTI0HVtLrGEIl1QxX6/asGoIbaqLn5gdoOdAxnV01CArfOE3VRONAAYJJTs2MDDPraozAo72+R60o9Js6lrnkXGCXupTq319ePDq9ouCk9bC6J3zcnN8kvJLnz5zhurur6kap2hxmOmBGsvbg9BgaPbvrSfqEtTpalTP1vY9mLFxocIsQl0VErlJqmvjcQzgvrsNEbcdqg3jrew6VnOhbUO/uhVQE+piMZ1zhibl3WYxlI3ye5/fycaCvkWby6Zx5W2iGOzzcxtGTUjuPTYtklf2ctb+Mewl0w7MN2MB8gRVngpQQTMDGEbxRBeRfm5z3g4zz2fMFNLX7Hj12EyetPV/kgUSPSD5g32A0AYGx93deKrG2kzRovbUeg+M/Mo1UcZOVToZt+/fXqpxw7gz3fo4+RSTNuvJFO57SXgGq2/2KwtYhJebKT2EskOM/wkDidqXPxuLcbJ6pknjSaaqAmDFdebe+t/j48keZdUaJo+1SRUUSK1iLFijCeaGKEd6P8AdVy8tOpxuoC0yqaYz5IrW0lY5ohgcfCF+9TvRXKVfbTaL9yVdqRPEpePGu+mNO72cBpvQJdHlVqtZk65KtkT5InLI/pUt1rwGr48VpTbefjAi7AmToTw8RfHqj+C5O5NNqbPSrPVWJY4CjQjICLMBA8mn8i6I0PUpbu+1U0n3YXxL00mcsB58bow7Iwiq00yJST26Vn65MhEi0IT2bvxqIVp7SlZS7VZZwTm0SlIQJa9bHKpKci0jj7M7Odxcd65i5aFrLYDOjZ00VSIJTNPCxBd6dB1x0hyQKXTqTa3Qh1VtdEAOopb664g4KAPLh+VcCLa6VDdbbLVHAcFzdioV27GmQ93Ui0HQxH910NLkyJoJ1WLSvfjSlK/yFe26jc6C2zsWZdo7Ot+l2w2Uq/NNRyHQg/CtVzZP4komqqpDGp4njNE8WGE2GJgPpGA/tSRyXKSxyZEBqc2X1ww7kSylTdOPGtqYYjF+uGga1syiGoWX37u4cLjvWWvaJirT139I5uWqTOI9kmOTqYPiI4sniIeOWySW14BMnk4EoTZdjMB5E8VfOeAXLQ7fovdgfIe9wHUemTnKfO2ie6ca4mcnNFdbZKYcsUbIoo25IrN3B1DuSG6XQEvuTkwkYHT745u2E4ngj9IOLesVlc4PTB2GxWG8RqO+trVaJZ2d1eMO4T+tS1IZ2Fjfpw7RArDGCbHjvraQrU2ep4+hPz+ai7NH0bOXFLRt9uDokTIsQnJ5Zw5Pxc2fOn4k0kr1EMw32dMMmd1butZnLz0/wCsJHJ87+7+K+kEdnZ4UGo5J3tEvgNwpsycC5SCNeuC6NWSuQZEAbuTd0LmwHxyT1q9dj86TPbp+kJ+EiJHXrVV6TmevjtoqIRpSgqeTtuFg7YbR5DIxGjj67lTPJ8tHbgbQSCH7SejXaG1/nH33LFb8/u50mTCEgrRhXFC4Rvi4LTbCovo9ayQGiSLiXUXB7aDj9HqLQdrMWOj91VbDWKF31xw+3q/DANtiWJFMbSV2jtpmzDnKhCFrMfn6BCEIABCEIAF4e/s/FKUIQE4b5HL35k4JnTrI81wuv70D1bgPtCEIHgEmz3ju1KV8ZqPT/urujxChmsigsESEISkSAKEJOlErzMO/MgAEIQgAEoSdKF8K8QqaelAnBN6FyC1FaupDglMndDqj814hAcR7J3Q6o/NYjfx+9ZF7J3Q6o/NAPntpDcnBCxyv2/7yA/I4IZPpjGhZJ3nf3fwWNAcg4ZnMdF3L/JLMzO4wRrhu6UsDzJBkL+vWrIM9lkl8pWe740XFYX4KMzE8ziqp0fh+RZpLpHca7ImQwrGF+H3LLO3R6ofNLXMOSCZs/274LCnLXfPhyogtVFZu47AEIQugUASdKEnQFAUJwTenBfCvEL2fECEIXIPIXzt8euHyWBOCTTt8euHyTePlkrXAjegwJQk6EoDkFk7zv7v4L2Vv7YLEssrf2wScd0eI+0IQgLEfSEHxN39sV9r4m7+2KJW/tggOzP9XIPtCEok+sIC8J0oQhAUo8Bnk74dcfkvV5J3w64/JepOO4UISiTJw86d80f2hea6ocdjoE6USOXvzJOhejmlxC+VfftN2/WvUIScLEUdnoBCEoQF4ToShJ0BQFCEIScLdbUfErf2wXVT8nKw5inLS6o9rfpAQn8P/euVy7YZETRoqwJscNeKqFzOfI/aqM/SFeqIWEZtWvpliE+G/wDAUbp1WqhZiKFe2Ybxbw8SQKUOxE/VuhrXD2sHLHuRzjd13b11WytHiEim54++HyXIV+nef1fbekGgOI1EGd94zDhoOZ7DaTmV8ZhpLxO5+1RW5TvHT/wUgu/nuz8FohknxOretUM6ooIijdKTx4usfZ+AYU3pTO3R6ofNZw22cRiMP1qNy+2PlTt2Az3870AzhSZp2Ybx7iySysCr/wCXDwpNPWmUbQLfDFNdn1nQFKhwv37Iqv5PlOTnu32x5ggPfi67kRL6RxtrMV+2CyUvKYyoa1q1wjDwDp98uLL3RjhocyoBOTTty7Sv56vJjED5/bWtKF/GnvE3h2eEOs+r6Pk5jeAaJko5HMmv4yLV7V5EBKEE24MM7yfpBarlW5XzlX7kbZ/Zxc1UIJsV90NvUwZdOU5Jkf8AERZubg2FpFwVSlg8nui5VNsjEGSB7k1w5ZC5J1C4JjKRwsbmifsSbucrT9ooGZZZJuijs5B0U/J8UHOfLTpNQEYrDNIs/VctC/KA2wRtGt9OaGifHQVlH6jifWfXVd3JYbv0LWKWiWvkcWa6OxwYe+OkYCLiWY5GOufeHDaynYrHFmci8doqXLpBfv25+bYp5Cm9ZcKqfYFkkz8lo7Ph08pTBOm/NSeb7E4JRmOn7VKFbb1+Fcgj+u/swwzpPVu61hwXf81P06T1butJVG5KBogtiuFAQhyfh9i3CS2mbDh5BWKL4pgfSK11bpZ8/SWqtqOcHg7ZWl0kbk824s0i1T1XRNrD9EdkUdoWI3cHyJ5ukO2loeS80NNhtPNEYw8OxBZBzvUe/SDjDR2MKKXLaqs9Tk7R5EjCOhYuO27kXZPLAtCnU5R89nb+NOzXPgGZzLjyGG8OrPmK/CwhWKxobv8A5ROCW6GJCddQm2ypzHSUUMcn4+71dQ0Xay85KwewIZtpWzHSNk5BCE/tPmxAM7GnTp/GiysX1Xr2cHJkekJ+LKv5NcFvj9JktWzDbJq1FgrQs1Jz271pX75NRcU17jligZ2OVhHZ2Dg/nHaCOdO6t3UkfjiOL4rXzJYZJbQZ0+6emec8Tp/F5GD61Ap2dZsVvP3P7pAwc8gM2DkyI7RPWHGSfV5H3r5QoTtiyFaeSUSo/X6YEdSFEJ04j9uV9yEnS+TJnfb2p+jVnb5UnSOPUuIlOj5OBbXwnP8A0XfsMLk/PFVSajbgfJXlPFRhjLvR6baQpuqnVndR2hjdCyi9h1qWaWsgMaZs/T9bUcwYXbTMbHSDj9VU6cScRH0rV0fnKd2OPwoLsgKTriDbRLAhiMzp87yfp/TEKUrHP1ICPHjWKkY3XqUy2gvFCDvsHiQCUYVovAhiekG5v91U4hWB0VPpWtbVmiry6siwE7gQMBjyIe6KCc1jajw4zULHFlEbY96v7UmptNxlyuzum9TcxyD8SdVK8K4b8MOrGgsG3LQkW8SdvnTO5Ovyc5c4bZL+/PbCOz0+1ugmEjgMYEBdFT4NZNVtRuMlxsypyuRBRWSRCoTK1jFgcNIetlC3+rKA3J/fmow0fMQEFEKwUMDrblOFllvtoNHGQHnvb6WxuuBCqJ2wOPcW8e7v8U2XOxndlpJW+VPPTHkGxwPjh1U49eAf6SKsUkdgyOos9IXtl1WTIfsCSKbyLbWaxZzX9wrejoasEYZCGPh1Lpzk9WYsFhFkrHT5FVaWxfls14v1pHSjawNdHujAPaoKWNdjjMDhPJyzW1UqbUVEU6PT8/CMTUXIiZgY6oDDrHN0XrPXssSClneRjrt3IydW739wqVnJK3tdCMS+c5G5zdIbJVTPXrtGSRTFYFYUsqF14OoAZadaHXlFUpIagKhe6FanWENs02DpDA/VILd6qtmomnKVifjtfEo/WFxnqp4DqN/qmoHie5luhRRGDLjDycluj+yHd01PSVIZFsj1kJTOf/QXZos0Qq3esdxLZmzZHwl5ZxYSnnanbNacrVpOd6FtIZKqjjy6cog2AJ4POSNC/Xf2a4Q1q9WT3aTC0RnZCQJBJYorZgTORxA+tLjDhIYOQ7j8W4lt27ELuPkxyG0KxSiXBoBFFxjDA4uAXIQpDpehI6Bt4jhapl3S6nTr7O7+VO4TvTfbbK3bZI4cZlnB1Ol+4I2rV4nWL1Y6E0NZaLop226r66NPhCHbyqsdetuTLaNMhWE97cqLfnUWedUfgxwvzdI4/wBrz0I94q49tz9VMiiqi0CPAsgpsnh4XA4+6O6C46SmiozWh0PAIKhFgKjB3Cx/ELoRj+K90YQZZpnWWcOjNnJKlJnKryz4+PHH3U4dw7aIbSaXRE+XX5zIOSGyZyH5Z/r5xNjaHkv07JCHcAYVAXCMjFmR1xjvS63/ACYqepugHGpabDJbJ1LuX5zrwoYQDSDaTffhVCFLULXNRRnDNDI5Ye+OKdz4lN9PRHh7UYna3XKEb6Jssa7IWCsI2lvpZUg2oqhifBxp/wD2WLHpViyZHkVcLJWHkFFKlU84KY1T8imHHqpux3ddcO4cdLEPZtvNSOKrFwzc6U/H1Cqsh+ooGdPHz78Jr2PYfKOJWrGNvhI5TyB3xrugVjtuP3Lzw8DOZ54/g7in2BOO0vDygnilZzC9uQLfgNqduOQOA8nt6vpBZLUnXqcZQpJI3Qqztqr9E6ZzF7Bycs/YDPOo+pWr0PPFdvewVsjNOqme8SNPyHQT1IPG8qkGu7PW2lqjnt7PVMShRYDxuCftcFHz8ZOanhqw74SW2cdDEx/o9DJ75WRTct9+sEsVtB5Ybvb3GsIyIolydaQ5D/TG4GBzuMb7+yKaJO+HXH5JxMMxEnz6bd06eTzlcsEuR12pGiZ5dpSRIuwEpU4xSXRienYioW1r0WLjYtJp8NIP2reN0ci32FoOAYPMXuZcMbAtQo2TfE79XwUqt1GU6dZ451aRWbcK9CuMQxKVhwuDjzh4R1cGML79fwUKmUmbZfPMKZ01FCUJyOGOFMN3V7eHsFhLR7SVjmzh/wCImUaEa+uLpJBHINKLGFK2P/V6liin79HNFulTXeXaghoSnOnmUKhBziDJA0PXCsDC+K2qtXgOe4nM48gWArSUOyCGe7t67yjJF9VOGoTmumf3Vp99eISy+pXjthcdsUlQhCt4fkmBCEJOPUeAEIQlA7gQhCAASjjE6f378iToQAOsjzXC6/vX2viR5rhdf3r7QE4Emnb49cPklKEDuits9Q3oQhOAkIEoSdKJPrCAAQhCAAWWVv7YIlb+2CJW/tggdNT6MfaEIScOiXoQokcvfmTgk6UIDgh1j2Tuh1R+aJO6HVH5ok7odUfmiTuh1R+aB4t6I48Xs7zMeqCJO6HVH5rOk4kCPEN6Fkned/d/BY0oDiHeTO8dyrafClxHkwb4Tyr79+5afJ2ed3vSySZ4n5pAsig440DkyeLMc+K2QZjXLP7RvWKVv7YJrk7odUfmnSR5rhdf3r61OoruCxmqsutr3AVoSdKF8ByS9CE6EokcvfmSib5mPfnQO6PEJ5vmY9+dYJO6HVH5rPN8zHvzrBJ3Q6o/NAVI8A7oQhJw8I8AIQheLcQvChCzzt8euHyWBcAqSW16QUIQhJx2CkPd2/il07fHrh8l6k83zMe/OgI/nAnXxN39sVl1kR73wWKbv7YoEqRW19E8ASt/bBfa+JW/tglcPMkID0E6EIQFAXyd8OuPyXqTpQk4UB3k8bk/W/uVqa/d7Kp1nTcPTQjUK9xjDEQ/NhBx4PP0qn2Z6/jBOM6dOjy790VHJmA8qvGrrXmJqDd/H294fo2RSRRpXIblmz8gJ0JOlCkYaQokcvfmShN6USOXvzICpFYKEIQk4dgoSdCED1HgFCUZ7z/3wTelCThzZDH+z786/QFk8tuhLArLW+H/AJHjmx/iIL8/v7Cd9Vj8l+i2gfEWYUOPz0wDf07Ksw/pKLVqxi239oev4fiM0/pBK8zGofWFEMroyOZnrmC5ePXRrK0neOOv3RXN9y3w78sVZehtHUWm2xE20fI6jRuSojd+k+OUem/j96kJ+nTiP58ij038fvV/o4anzgZL0m/8QPs4Rzp3eK2Sm6q8HMdsJRfPq1xWqTt0eqHzUqWW2pybLPCknwPYqr8IGOey+WwbsBiPWo9GtQ24Xr1igerZPWV7u8V9asitF3Ci9bvNmUJ86QmcTbkUSdK2+utQDSNqpOjXZ7D9wvFwi6J12/h5GuTJGI88Uq0Wq9UNV+kXFwioT/JX2bhz51rdfkX7gKVDhdrVXsvu2b9JttjtS7Odi2Kz4vQgf1nVjFk6fdq3JpBWiX3oyZDHJ4+2mn/9wOKrxbY0aOPrm+mcUVNczXxznuDhPxZRa3yz1txz8CPrhcUo9Dk+J7xVrsl6lYVVabSzfmNRbny67lZllrqoUXuV8fPq0znMYcYymvl0df4s5v3B0ZynNGUdk7WdWfuE8oRrtBqfG1H/AFi4DD7X90Fx0rCSzyHh1Hp+fAtrxWx9CvF+UxqmS6W5MlDjz/Jdn1HyAsH7wRtXyXP8Lz8e/Kk+ihBwtAnScI8665ZjePW1z0+zALZKSaLxLaBbs0yanla3t/UHsmT33p3DCnT+i9YZMlS1TbPmJMjxH3q/GcOzi2gV2VaEjd8iRh0ExFbkzzwZ3b8Fq06Tzb+96sHWzbmGz62JjtSYabpthPbTiHiftWFTBPW60uJEjlcPM7o+dxd3LW2xy9HPyxB06TAi7X1atacW0PEbP7XvWadJk/eupuQtkxzWxojb5aQ14sq7/i5pszXdCR9K9qoSWctLTc+UHyesrXhThjXqp+eG8Qpky8q1G41dV7wDYDZ1+k+nMJaIKw6EgG+a3GA4HFCivefxVEXN4MInX6uvkU72v1g8VTV7rdPxeK1QgoBlV5QdKuJze7ySnV18eCa7hN+PbQCPahfalaNpoR1lwJF5UxSKLGz4ZshOXXHd7Brl5qbJt9nEuHmpTP0jHHsltlRbZ49T7JDjwYd9zjiVErvngZ2jyJAoly3ZyfqPqqdGA9YucCb/AKcA0eh4puVPEiPGqmF2dBIbHt98fqqnbGYaPUaLslinz/5Ck71RRlEtnY6vkF5KpFSHOf64ivV/mfsgm3Pe7j/FPE4Mzx+vim65Gh8wHpdwgVoviMDAfaExy6LzXcwTm/EYUylxDbmXIgPSGirhcVgcYlklhcZ+8HCe+HLPp4MH0QCL/HJsnOTkdrInlXJgVRidanr1jOVcvRIQmQK+a/OAeNGsIPpA/Fle48qWyX6TIk4dvahYx+S0nOx6f95PoYZfQJz8yc4GXaOHewRSPNk8BQbYs39ByBuEqr32QGcOO6FR2rfFSbZw5B1EYcPVz25iChjbJAI66GIUcNobDIZztMOv0p6j5RUhMM2lWMwjDgcU9uAvUtXbqOGiiFOPeLa0fJTi8s1fv36ezZeWU584mRntGqKnqQqiiWCaVFkqqEcVGIGvg5jfcogMnGQnnEOB0BScTqicf5RU1ybX2xkpWotAUQxNOKjPuvjdHUqpzqk0rOOIcGprLKK24wzcmW3kK65y52HV6w2NeGKlcKU3/DD3Czr1vuOYqkb+hUOXOXwf3BuAZtno76D4UT3R2GxXljBbsMrKONu9FNTtACyIESimOEL9sgIfB/Hu9aVUw22iXuA7eBPfhHQsrYxDtW0qaWeyykB6GdHYhyjGpRSJAUR4AlfmnDwFhcSLC+/XfHk5FwmmUO4eIOZjWHr0Mm+pOXWm/D29deAbbQgbyu9U7iJRbHbbsxh0oycLQ8n01niARUbW1PpYs84zgvb7dH5q1lj0idOk1xW59fMVbMNVFyDmfQmtup8YcRfn4/R62zy5A4/kqBZW2RNPXXLIbbRP0Z2iUxT50CnMV0jCIZ52Pp4DEQWatLmj5CCjnFwN35lM5iUMUxeGNadfHDHDd6qBouLRndFutH9ySrYpOjy8+fPmG61vXeT7XEnDVK1+EBJTpoMPBAX1CB70ufFr1nBdmdbOtEQNJKbRYyDWgw6GtwHn6ro9StlZjZjlLWV0JBpZ7NKYLrqoK6keEdWnVYKfe3Yvjf8AJRNlb4wi3s4aQOVimpiab4BdN6U6OnKcXeR4GIea5jkPhz1D05GXBSmHDHGtPXxqLz/R3uKW+Vjm2kXJjx2ozZcwrLJnXhz2hwxOGEKxsROcjii63ZHFVObrZxIphwZCmkSn2yRoh3j6/q5O/KuQ0mTOhOnkEYq7Fbb/AKwXXHJ0tNmvUaLYBWuIrZwqZn8LhGb7o3Qhd8IJ505tFFrYoiiiU9M2fNTdkw37u/EXV+kE0q4silG7Yp+cz5vAJ/rGa7szK6nM8mJRIwhF0TI/mgLmjFuZLF6Mqi361ZrILIdKmnh0lTkY4AE/ERh+bdDp16+hdYKkDz8m7VqhuXPb8pAHh8nCnRxpGL/XEDfHVyqjtHUhVxJNbbxyJvViEVPTp5O4Y+g70kLet14wiCc4sUxzn+oToDmbV+Uq419On+F1UvxQt+BDaGKGj25VYqSpQ3WdPIHYxRNq1rM2s+OMkD5j1X1HoSytqVDpydIx8h+asWLsYZ2tboUjG9to0LEERJTu/kKzuO474ui3iP36JdiRN0il6GYafnmeOY9KiFfJPIYc4HygO6il84YJ/lBIm1ykgx2eQ1u2LG5Uz5kwgzDjyCsVDiQfIuXlGjJEj5Dl/UFYI4t6E/ajcH6o351zA7gPhMILf1ptZ50cZIu+aJLk5NRmHcJEC4CbDAN9in5ucqWPnEEO4ODhAb1GF+0pyiJJEqpEF3JvqG9weKLKyksR+/c+c5ictUSpqnyeTiqwrM0bc2SMPI1b9e5ezt8euHyUgG5IdGr2IbS1D9kbg0aOz0nHYrDYra/6xw6wOU4TPT8PisLitf8AWGHWrSZM/i+pbGYwmA4HERhHFC46KalkUEHHpOInsNMSL2J2Bg2FpslmzGdXD64VQRCGi6ehqv8AaSP71UKfntJPuI4zpSfjP7Wu1uSxR4dEWPU9n5EBHSoPLjvy61x7raGfrCsSAPRfh47YPV72qhsG8VrjvucRp6IlCEJ+5Wv4ijYi6Vrpvd/j6NHkFFQ0IQtJjCqXECEIQPsCEISgKAIQhAAIQlEjl78yADNJzM+THn3b70SYYfWvJMnMb4dEUrQE4EIQgAS/tv3lhWfMx6fjBYEtS4iQM1kV0QJRJ9YSdKJPrC+woCdKEnQgAUIQhAAJQk6EBQHBYJO6HVH5pMlMndDqj80BdrtoVJiF0nfDrj8kpSdeSd8OuPyScPKPEKpO6HVH5oneZj1QXiUIDuzWCdY8zN/0Vlk7odUfms6AsSW16Qb0pk7odUfmkyEDsFMndDqj80uk74dcfkkMndDqj80uzMen4wQFqXEEnfDrj8kpSaTvh1x+SUpAtwDwlxAlCToXgVhwXk7fHrh8lgQgOKPAOCEmk74dcfklKTh6RxX3gX1+x/dXyhA+WfAL5O+HXH5JShCbx4E6EIQJAFEn1hKJvmY9+dKEgD3dv4oCceIQhAk7PiPibv7YrEss3f2xXkr9v+8gCPELJHL35kIn8nfnRP5O/OgPCPECEIQHEKEJOlCTgAlCTpQgKAnW2Us++DlRsj+Q2DOozSTjYNJ2tvgtTShJl26Egidu5pzSgVrI1XqN2rqqZVYVQ6Pw7K2sArqRjdEh3YCPTFaxJ3w64/JIZO6HVH5pbJjiNS4oMkY9mnHtvRJl/wBB1jaooIkxH0lWYnezlfBfKtu8VrY9Pye2ykQG3g/pA/MuKJ/N/wAOHCvvjGMeboUfn5l3EqtdnamX1ymQ2TseuvqDjw2XZ2xj5zZDfQFSEIQn8PCPAY/2E76rH5L9E1ms3P2V0CRffHwOAj1bIvzu83Sv0C2LmSjrE7NCB7v6HAdmqCzF+kolgyiXH0j0+ylRmf8ASI9DG/vfgOdmV16Rn9ioG8/tvrUFerK0neWP5Kirlvh35Yq3tFv/ANJMxZNof/t21/PUI9ev23ao9cvOw786kJ48f93QtDc/PYi/4alc6XoRkfSYlXaxr6x+zdizTpM5LJzaZInSIkNTptYux8sdo4mozMI6iu0Ck0UVsT9Id0skeaFYXkNVXaa43whURTtXEY8/qocFwVqQyc6vxxG4ksqfFd08sVx/Qrkl2dWPjT9q0EBSxZnJ5PEhf8lwPz2Icuzcsm2kpr4p7cBqb5N7yf8AlkrXD7w/POBNn4ZQslb+2C6efk7KQ03a0PUEf8n2ueaZ0LmQ2ytskXe1atS65ZO7bPslyX7e7XyNldDKYiyU4Zy4ieHhPncphLrrN9H7zL6V0YjdL9+tKfiFkMjis5f17CeX+Iczraqvk19bLaZWA0/Fi1DWJ5oZkPZ/UlqMmTz7+9yZg5OYw/XydqeZW/tgrA0YxaEfQzahMlDBgkdc9WO4+l/IbfTYeIuv+CsJQbDOe36nW8fcW6SAelQnSsmM+/r5OVWtsICxFo9H4jeI6SDlYF1vV2UO5cU4kTONYaG2WwxPlavYKY4ccrOlZNL2p1Swjj7MIKBGGvXrVBTc9PnetXrqpl0MJY9uLsfDUJUNMAnBmc2HFXM9yYZ8gyeOo/oyeVm7EjHJj79WTH27hXmk6NkJuDipZvmPnT5RhKdh1h0m2Gu6BpAY3+kL75XDB1aPZh9rMX6JrSKQztJyKQpoIVqFgLIZBBAtgbm8dcb/AMmbJkz8op8I1bLZ0edr+uNy6EZftpFVURY2Q30OEViarJ0G7u4P+T7fz/cstaVdtlNK7OCiSFJUlCUp3UrXrr7uHwx3ivmTzUbM4YEyKdM37g452+2nMITudQ9l52KFEjgqkq8GHpAj1zC+7Kny2wKmzHUyQz0+1FOzpCNwQYOu9TwFYQFR0rSFo52MdCxLw6QBub6ib/rSsh3BSy8inHuD51MviD7qrt0oyO0dP6R+gQVvYKbfqqnTx2cAovBw2z/V6lQOg2Gjp2IeHzSrp6loM/R963CpHgz0eNIFaReIxaGOGj1HGez+YHhxrerPtTRnHReR/LH1znxDk7jYm3aHQya5x4jdAOLlJkvgc9wb5EBChPTAf/1a1ubVTlPpaRSGehozSmNiJdrxHMt7Z2J9a50lwnxFaWuH9eeT25wGTfVTawtWYeKfxTs1l8l/k4Aj2RO86zK5VpXXZEspswZ3bSRQabfk1KmXnS9DP9MRvJDMIvIHBKgLvilejW0H0gdq9xWGcaZr3iJ4qqiakpbRY7+1lCEurZIfBMb9IDkKFLViGNT7C31yhO0r/wBiYiiCKy6O0V7HSCOU8SeLt4IuF3Yw/U4rDJMMnzpGkJ/WkeD6P/eW10qG2z3gIcjiuK596kkP5cWVJt3IT8I9RR252m3b9swVmxnSGeQPxTSxWnOlPzbUmIYYNGBjxrjf0j9UTlWzlSEHiA7RIJLGaGvBB43XBZqbcpOe9Bil3c3Ipsj5yjRxqxZsMzoyuI8SxflJ80bJywskhmfo9njDz+Nkj3Xpt/RvJapMgh4dRS8UNjth1/atwqXSXgqDhwRRBS3OQdg96YZzazyISSKgqLFxwuBwYR6RUrVdbafpCYS8FFIO0W75trtS3SymObVE8Y2mz5ikwhPAZ4MMbuOO72drUqSZLRPYnSLuc/FvohWBaAwQPJ60+lZTOaG6ODRPbMM1C479aTogODh/4pP4cZzowuruOa1iitOvCHH6PcXDD69ajsialVz11mryGJ7aV3feNaaMvIkXbDZBu8KTOU+UqXQDbJDc3x4a29wOFFFxQ+qGLXSr8nuwltRtsBA73ihdOyAVzVDbXh1neTwXR22W/Yl1ayKLPavpyzmsCHefFqKqF9kHCGX+UOTf8FUmm9ZJCx3EfRcvLqmTJ76CIaXYyPQt47jOodTNyVTmFqK9tEk0azz3DSrXF9jxNoNO1OCqjW85hthpt1rCnjWwWJYsWSo3fj7hD6qphrDJRs9r+TIIcHup4kiNeCDLgfdcq82+yZGT1RbVRFANcBWx+K2wt7hj8dmNetUBZaMG4eNmUCc55I6naJkJk6/b303CK6OI63l3bFjaaynlU6na6GQULixsM6ZEAeooiul1+LfIX0//AGxX6yLQy4mPQzhOiVoDMRaL9vb44j1oUxc7pzxJOlRH0Uw69hxgIF93e5X+yRbSKSg5stBNLY+6RLFnmlOz2brhh94o0eX+XKr+0qoylbNc4lMenu5HXX3VpuGj9LKMgvY79BiTP/2ZBd62N+kDtkhocKgFowd/2Iqor4aRv5BRb/mqRZaVHvj5kvU5Gh3zwgHot9HfHh2if/hOA8P74KweVk5WdMgVLVNWrY5Pz80lkRpEUPgx4UYEdG5c1RLTqp0G9jjvQojaW5xNhTr4d5Ph/B9KpfRlakg+ZM59hyNQtQxs/oz8aVw68cN3d3dYzrZOi15e9pkcMDmInmNnz/wcgc4aaMcmt4BIzBRhQhXE71KlsEqsKqbWM8kLFtlPtchjgWDyq7lLWgWWSJU8et7GaYfycLP2tkgJwl81fZ9Y5bPZ7WJ9EtjnZrU9KNc+qC6dg+RPp9wHHEjv5FpKTulIqabG4ItWjUnI1249OX78fs9obnmhu57Qs2YtrOqs3OYhkjEyEJn/ALT0g5TtrC/EX4YErVuW4M4b9jPMC9GnN6eKbs3qqsXEFoaDhYYqGszH+TlqrwzuTG5Orc4RjimorAmGfRylcPGs4R7sDc6n1c4yVsbxkzI/fNlNXm5JugJCNoNtOkz3AioxRH0srHGY5+ETO20hOOhmB8MWVpSRtgJ/o8daqz0rUj3Onjs4JReEjtkUBSZzVOxGOwhXuJ6fY30x6aopKhYstEL1RfuIoxG31z8v+MXEruxWbYjoQYZ1FdhXUW7GYDXiFFpk7P5/qv502h1s8VHOiO4Oro7REFwNx0VmnZ4jqSuLZybdkSkyvrHPj4DWllzEe4tgjGJ9GBtk/Z8FY+wiz021O0FsaDsUW2tInlf/AFePyKCAw4z52HGkFauZdhMmGyVtomicwRPF05UP9I8FD/sv2qvNLd1Fti3TqoV85U5BP5+4OVx3GtZNnHcV9IfkFEnWxWkNtnVBPtTRwuyiYFoDvui4EeprhPJz2skj68rT5WVR2gutpBFMVeDoprp6P6uCb25wH9qVXE2aF7USt+3vKJjlOq6yG3d1OG/3/aGjRba1IuI275w4rehCFoYYSAhCEoCgCEIQACEIQACEIQALw9/Z+KUpvleeh35k4ICcCEIQACb0tzUen/dWGdvj1w+SWpcQ6RvUMCJHL35kIX2HQCWyt/bBIkIHiPpgoQhCB6BCEICgCUyd0OqPzSZKZO6HVH5oH006JPz3BehIJO6HVH5rOk4eEVqakOCEmk74dcfkvUBcFMndDqj81nSdKEB2ZrAWGTcPOu7VmSOd53938EBWjwGWTuh1R+azpvTggOiXEZ5O+HXH5Lz9j+8sKEDojwDghfGdj0/7y+03h6RWqvXcFCFgk7odUfms+anc32IHRFZdx2A4IX17vqXyk4kyXEC9k7odUfmvEIHVFEPCEzpeHv7PxSfUesdtR6xgSheSd8OuPyXqTh4Dwk83zMe/Om9KQ93b+KBy1OoruGeb5mPfnTenedvj1w+SQ56T0fBA6pehHiUR/b9n3rD+x/dXygSlHgBKEnShA7odYEIQgOKPACUJOlCTjuBKEnQk4AoSdbBo4vR2lsE56NxN+lsDDR2I9lxn3pnXiC6DnHALUVa9YULPJ3w64/JYEL0PYWeM73LIt7d6iYzqSZWIemR2p8ayYQKqCMIY827lhy6+laBOnSd93ZypqYOF3KB6uUNXyvVwx3V3Y8eP+YdeaZI+brZB7N39sViWWVv7YL7S0cNTr+AF3CyRHKB2TjQV0eKCnBXc2HLXD1dk8hudiLCZI/IJU533qgP0ikNos9u48Dgv3V/mKN09o/7sN8fF/IV6t0bbOp8qvCauciRanFG/VMSPCuidPujHt13Lnm5SZ0A4kZgqH2XLoFldN2YMnkcvNHXcqSu9dVEdRbXRRE4XQbU5QehIhAXuOIhfdD7YqRaMdtLbzZy2rrNYYmchz+jJh83hTvpwr11qJjZK2v0epr58+fxm6Ahtyk3Z/wDv1qN3KTdn/wC/WpOcv8ZR65SfP/3aloRnxGYtJaPTGt8XncuyfarE0G8TrU7drCaPGp0YT9aAQjIx5Bx+OKu7jxiPUrxfk7WCU7ZQb3U7hIhhbPqNPfMX7AQRskVU2lyRSirUXkCnyLYcgVLDz05F7ZBMVjbMfIdUvj1XLE5flULSKKOjStn45BRdZNJWOhr8nN45C40SYesXdNynHKPrudaNabUVTkT+NOd0IQ3KAs/0fYs4lZ1tZVrbbk+9FP8Avn5YSSfptn8HIEkUSHjn5qHjq2qR2rrZlizZ1meRHZ1QAE6GKrZ9HMdg90cOPtcfuXMmxRhMfKwYxx5HrUj8Fdb8p3Vc0m1mzqzkaEdFUVQl+D5yHDVD5KT3YlR/S37erU2rPnWN7sCJ/CtaBYhihB7R4zGHNvMdP2rZGdtNdZ0gAaPamiTJ59/e5bGzmTmozEDcau1364LR1qxqyCO0UDBDotF5ZFu/zavNysokINsnSDMPmPjBWVsUz3h3S27jXYq1MBk443EET8XDEq09lckNrrujyBpwpeq7rvXl4rLeR1m9f2Z/uG6tHDNFe2H79h6PVmyjpZlsUU2VHZLIqcgLypT+YwZcYa9ouXEp+bfEz/EfBd4MrqdO/Qcby6pEO/wXOmvKVsParG6ecGmouCXaGVCESxL74x574dn2rPOg+6/JFsIsHBFFNY4MQmQmfJux391MRFdGUc0mtHmwPiGPnWMUuUmbJyBof5Ppz0FlKESCYYUqoaYOYt/TAtdP7c6cLe5JshwdYCMfHXf+r8OudWS9k41VWNY07auecVSlHUk6Y9nM3ONXkD+qi+7KVcrm2w2qnGfR7QRhWIOG/ck90xCNyaXqfJhQvRprz4bk1KV37+/f7sBWVoWg7e3iRgw5GpMY+b6Aher7RqEpzPs9jVKtdKDR1G1fAASFQH9+lVUeHOG0ePxcMUtqCbnF8nT4N8grdxyPk9ub1vb9ZW50O2yXglpKqBzLEx2wg6Qp6KvqLQgbTyMKH50/jNic/tqLseIpMY/yTBcht4je4QQHSxbrtDhP0S1whsZhvk+J6YXKcwg7NT7q1ie2PB3lBx/hUsqSTUZ06MXcFzjfrDDhrbgFoehn/wBhcvgpOri4R84WGYrpkthVOwiWHOftz9ME1tmvlxDvW4pZXv0S0NuZBnz2ch1FdWEsrAmB/wD1Yq2ptnBtVCOrP4LeXS3T0wa3+jxlFYbDn50gcjCiQu9e3qBqIqsnaK7FmbaT9LlnEQeeY6lfOXWHLnGyPzboozED7WLHiZiHJ+cXzA6QOgXhBZEQ7uUZSPS06iQZEhnqd8g7CuzZsYbGBpBxbyFqzlTbPInTyB3wWAuK4l6QcsMpIjXFY7dun9b6AcXkCtRptES5Lqz9JLWk5A0mTJMzOIzBWFxXHFIVEsJk+SdUBGsUQUjBme8pGHUjPTjCc3t7UKW6FlccO8obOmec/uUhh0OScVtZXE7ta5a3yWkfE/oS8oI43yJFu0Xzg5llMubKTsHG7YOiQc+TULqU7FYrG3hHp4bK1DkRwDOxtd3th3k9xUDtoc48yQ3jSLiiyr1JDOwvEipJDeRJ2riV967QUjSVR2hwXmxJIG5JxlIo+QmxUeUUucpc5/8AqHG62tPDvIDpVvIOK2trkG8e9oUTScxmo38Vv1c6l+r2cupKkkNDvPFafB9rwV5u5xw5a3ClqboocN7HnnQ2Rsn3mRiI4Q0ivtF9Rg3zV+wTCRtCWva83b5ByXV5shTKn8AjhmMcjtpHB2b2w6Clpt2dnnkADvpftZgIPk/sUTaYfsZPw8gVo6VIE6dUjUxgkD1gUXErMYxoBO1xh1pbKVXwTpTDEWHYk7IxdVl0NcdRHpKmyE/gTEvBs9VNVIT34k4qn2som8MQHW4uA/8A6hdIcjSm3g6wGqoyJxTUTUD8dgyzt8I4XeuXdI5QVr0mbIgDinbCcc8g49dnsly2Au1Kzc2cfOYfCdphtYjH5R0fiOJ3rMWnD5SMYDI6bJZdcQxjkrvp3Uww+2teIcr10mzlxWwi31PNkULmMJIp+qZ1L0g1yKwIhFzFEgE7Gw3YhcyMqe1ltr+qpIDPCMBmAWeHEuOvH6oQ+5bFwrfLTpdTtdLVLRRboKcRIAKGeWLR7jC8q6EYcnSoLtYpt3pF+qilT20cvg8KrZ5wTqCDttxOvDXc+u5NWjyy0YK6CPX+Wrk5c6WQ/IqTr+H4i8NE9itLeuk76Wy7aoUx0sh+RkESByJufiRgSi2wQnHGR+j4K3OSAbIn2mgtEiRdCJc966W+MgS5VuaJr42SXNiiaI2Cv4sYkxe4FARhvhqip6yOpslrt4ahtd2FOB3cytW+1qObRl8OwmbJ6/zUW3faStbNla5PmTCyuXsFDRtGkbVqJnwhDdcuakZE6eZPHGkYuMBSMJdDSC63ZaTbOOs9nkDyNYmuEIKqFmFKCUTZ852yEMsapq4rg6Fs+p2IUTuE4H3RuhAWRz8seaG/Wq30aXUjA6NEXNeWprDEKTxnPw91Kce6grzRde0dauh9F++3qEUMQhBCrlYLXVLBxdqwn0zQAxXFI1TVQrefHt3LRTbTKDoKirRGiiIPtbVk/sWhS3fAYCnm8e6MNXxiq42y2m2g19WE8+v3R0KfRPU97dT5PsooSgic8PGZ1HEq2FIl9WOTXvBfP0D5G5ORxx31rvr9gyzen6SlwyaK0C3RKTs5ih4DmvzI2z3Ad1KEKxWBwcfJ7itwbbVH4JnOZyJDW7aV9cO9I9q0ptqQwfZyWoV1+va0G6HIiPo+JQhXvykDNWj5IlWKxj5C9E3TzjNzOXkItHXxLkxPoh+bXKlfH4g5+aSvcYrL4Hzp8mQSznNbtr1xB9IrWzWdyapO0glYUuHG4R8nOCmax+inKsTJ8WeTCBWFxsORSJKSdt6Hcy2XkB/tWB+VFwo22/bfwcg4Z2GlXhjneWJBQmLFujjYrdg5MmMMPmFm0zNkTcO4SL8IVyA/9lUg0tSMK2kED0gcLpzFa2h82CLgur2Uo1Q2uR4d/UNdWTD2za7TZ2CudMnKMU3TGKlakaKAeAXh3C0rhI8TChfo9dmLJHNtqSmwXdnOFdmwuHG1w2fmKo6dcZ7RUzWS1OceU2N8IqYMna3FzsQqmI8+JJVH1AV+sbPGG6PtQv2KqNJtiq3fAeUoY+scEpw/aE9Xr+/r9UJ0jRq13tCLoE+qUdPcrSx8O0yyY55HkX1PZ+LPe2gz6Rh7YKuK8JufDxA/2r9KDdODdWyUQ3ECuzY6tMcGXCOOb3AfevzeTm3AmOrf7I6EA/8Aa1Cf0dJ52uxkYFc+KSJiHJ6s/Gnxpj7xx0EvHfncUKtIQhbER4DGKPACEIXcCPACEIQO4EIQgAEIQgAEoD8936EnSgPz3foQBfqGcPf2filKb5Xnod+ZOCAnAvjNR6f91Hn19oHuuoE06T33LAnBN6WpcRIGS2vRAlCTpRJ9YX2O4EIQgAyzd/bFfa+Ju/tisSB1V4gQhCB9gSmTuh1R+aTJTJ3Q6o/NAUJemC9CToScPAcEoSdCA5oraioULBO8zHqgiTuh1R+aJ3mY9UEnDiitrx7JndW7rXkndDqj81jm7+2KxJQFgfZW/tgiVv7YJrk7odUfms6T6j1hxR4BwQm9Z5O+HXH5IWRHceSY4jUs8rf2wWWcH8F5mYdHxiuKyw47Gsgti4GeTOkkfBOU6T1butDPJ+WvlW4SW3sTc8eIoC1LPtx3OR5xpWaj0/7q+0vnb49cPkmz2ntXcNqrPYeIfE3pOnhcN6FQ5IrajfQN6ULydvj1w+SJO+HXH5JMFu9dEepSHu7fxSZCB1CqTJ6t3UvlL89Hp+EEgQH5VCNQ3ASi+d7Ok6ToAzRChCF8St/bBAVBWhCEBejxAhKEnScOKHWFCEIQAbN4R1D4OeDOlXPwagTprCfR8CL77kwpOlCSt27drrKNU6Ux31w3e/2hailXrAl37b95e5mPT8YL1fQcUWexcAnShJ0ICoOCEnShJw4BQHJnT50gce+7feus+QQ5Q8A69aOVqrGPLfzLkbnY9P8AvLph+TycfH2sgatUWk74wVL6emplrAcOeoh0zfGtBWGmlFo+0eOXHgMUN2WA2ziJ08n4LnIZu7fwXbfKXsyg+UG+O+f4oKuKrv56f/5y+NB0+jK2wVs34o/5Djohl/KljnYfOIjSTOXsUeuW+HflipBM8zO61qDz5md2LQjPgKq0hM6DQ8FOwe7oXTzI0uoDJayirV8xtTsVFkDhf6Q0eH/NczzHOdmZ4/qvj11UtOi22Tfk/rMqIhxm0BskPcOsjy/FVDppXUf+SLYx3ulyZi/QpWilfuGaUPJ217Qw9GQpRyvtks/rqzur57TaMyeD74aJp2EYHCOGzz4/9Aookyeff3uWx1U/VJVTxiKofHSoXTiOLOP0hd3vTP8Ate/OqicbQ8k1Vpk9KmOamNabqY4dVK1rhT1Y1w76htV1Ou3ZsBenIWpaFRW70RHXsZJB+qKiXKnrYy0XKJtbfyJ+ywqjQTNd7M37Iri5DEfA5htZtWJkbLZ9Z2ecHCPKRAS/7ly9DnTjs+SRPxZRfSpDI12/SQohTNzCJCe/pqfZgHN4jsMaihTw5w5SPV+xbUzzlqEnjEjqWxtvnY9+ZaVgefaYBFDLLISJHFPEUScweIk9MFZCxmTOn13SuH3QK13qEqE0RIcGsh+kOZbHpOOlwwoXuGHVp7CKpbaWtdkP7C2eQowPgII96tn6FC74frljnrZugY6uqPX1V9WP+Q3XYaqyFnLIIEz82YdV7fmycdYo9jDycWVHMaudc2MnKwGVa3aM7QfpJMKGpUmMKiEjC+B5P9VxhzQvXVivG2dVNmBzePdiS4SL+Ra1kxUFOoezLME3aULc55rxcsTW/ejy17BftI9TI5UWyF76Y9ePVw3esUZat6vLe0ePmLA/OHUKN3qoMOQz4ceRgxRBeJheT1xmt5aGilX46oKuOg06WzEA6QB/pCfFdLMq635nsIpW4aArtXdQw/Vto3X+9FLgDVL8/Vu/OlUVO6+ELmXxsw6F131VWf8Ao+2vOukjztObY8M/j9n8/gI3aExOW6is+iiZ1FijPJrDTjxPGcJ/g/TBcNrZ2Tye3rW360isWpynwp+t6o0X6njT7loc6TOH+KYZ0oyfOw+osoxaBu6iLFp5u2NgIGres4slqHCxtpzZjK5z5/qCZnJ4qTwVk1B4YillQKwOh/pFac/WtO7rS7XTMAWsSLUTPgYYFHygfvSxtslfjsaRVBw1J4QXG4N8he4n/VVKtOUqzjzjh6GahdkYp5xhlVYRw4v7Io0t8pZytHDI+xt6F6Z/YJshEXxNZKc4jnLkyHMc5ziE2xttIqOTiPKmgSyr8Ycfo+nVhnsFK04ZPHeHzwh9zY/R39tTlUjk5OsmeOQ6+S8VsYfo9uUemZkfMDt/PuvTfOwLS3vOJY+0qE7Tg+b+BMVw8WjkFTt2xDHU8RxuAblOkThxm/C0975GHlHDpHJNDBnSCG8ffxww7UtVDbX51uIHBKLj8blssphkNQeIeHXZuVn3uKIGelpTzhuwMRPp60/IIQgRc96wOTu5T508gbZBcVxwFeB028OsnEYEv65zLfKErukKPeIkEUeNVTXheKvmuMFmqRyf6jkz6gHA0SwwKwIcQfJ7bFPrOIa3E9Os/V1yfhIfkZ+4gctjZrtKONcY6hOyUow03TbFTk6Q4VA+Cl3R4mx+kYkqZpLxJnzgdDtXkvFemDgNH3KDaKbW45+BHeI3jFlbX0qweZYmoKovSZY2jD8IYDr/ALUpekzaRTVFBujk5PRF86JvKPkl5LIatFmQ3K8fIEPuU6bW1dusCHsUQUoqfqNP0epVpalWE4M4dwOjihBp5we3YBu/+Oqu/tp5HMt8YA358jic+UILfxyMfJzfvSzUKrobNrsmQQnR9d7RCcM4fxW2OFs398Zi3OS1OU8eMgSEMVuCUm0gIHILi71uCKW2REkXNBx97geP7qvW5nbAYEEN4XhC6CC7Xd5Qb9a094cjMZP8eViulLFqeV8WqHD7f8hO0YhWEaeV50+dvm5KROgJCZ5MmE7yedolhLdB+Tyjhl3dsAsls+sJo1zk0+6YoZ2JxxjsdFcCaEper6wzA7fJKEF3GO/EKdAH9qgYu8GSvSoTTYbTuKO8IWp124NZl/SIwSjEG1He6h8h0qdvhWla+zCvqrjvHt0yMfKW6z1BDETFipBsHSA54BDW6tZfrgcVzYy2DKRkVvIAGCco1gW146BYPJvEDvitUt+t4qmtjIUDRLY+08xCaoCsgJTc4Hj9CQ5RjXUFQVRT1XSA9LjC021huwl4kboSeFwol/P7FANH1mPrenmEpLnyUWKryOunDDHfhv8AhuFy6J9H8jZV0sJadPk1xT8kVcmuE00sAh+nElEwzGLLNhdDD/8Ar1ItlTiGy2rUWc0TihReFPk8E3gm74wjDcpBygaboWDx+pNm1S0sSKLIPdYw4H5rfEgj1XB36+xV/pudh6qp0kiQVDCOgEdyvti9Quu1TroJmTodM1Mm78Nw1PDyXyxtdZfU6lNRM/IHXPLAniD2TOhBE8WJESZEQxYboKptL2g1G1ZKr3U1MQFaqns3eiDWguIWkIXTo3mav3oqz2UY8tbo90jRB7Jp7SsInR4RvBvb4dN3QuXs6pKqCcnZm2WDYJiAXenAcX4PYfFbZ36FSOjuANMWejGmJ0FiOOVhhUmOStN/fSlab+8ZwsS1Vbo0W/JynIU1muzf3Bz+d61MqN9dH9wAFLc3YrGlw5kwznKaR+wwlyv+bYdZNalI4UaYO/R9WDtDib0+R4VHx7OVVftSsJruxhxAjVEgZ2YTCtjrxkOidTx9/PBXU2uiU16NvruDJ17vz+Axbfei2+LQdncTrfWfSIInnSTOMESCtWpLAzJ0idfC6ELvirA2gzrLp9k9ID0xETwl1eEULrow51WXBTh+9ylhH0gk6I6YoKGTxrTl+quHwrxp6hBJKMSg1SbOsU/Jz5iCQptePB2Y4rhvZO/fWt8pB3zGf0O6lNJOF2yEfJ6gGRy9+ZOEn1hSaNeeVUdmcpiRwOkGcg5wkq4WMt9Y4sBJkzpE6fpAcrmMxwCcm0yaPO1EFCdi1umzKwOk4dwpx0dhfbMB5Rb1LH6Pqjntul29kc9GcxwOj3JdFnzNv5u5UKNYWJccfKpEfN830inLkFoqDq+Rao0TqItPa/CtiE4m7na3FgI91MUe1rksWjUc+hAUwxulbMVQE4KkncEDVwdXrfsvKonpV4cWpzBHGNJEGLK2vUu4VkDlNIpsGA86GrkiqDvqUl9Gbzyhb2XZ1ukl83j3+qvfhx69++nDSYulZLxtOwRCkzj6szpX9B9i7KwVA9YyNFMM814d7t/rK4MTvKs6eSTqxZU87f7QuqmXhac5U7SzXZ+zjkii1tn9LvF3k+A65SBfh9y80Cwj+jB7d76vOvD5vhWu/wB9a1+wcdB8atqXk4//AKyYVbQhC1mMFAQhCAAQhCAAQhCUBUisBOocnSpmHTXJ3Q6o/NLQp05qnSCPgk47MtTtaOv9EH5yYZwMnEfatTWzOT9OODkDd4ph4vtG7l3r4S4hymPJ+1k2Hwgleeh35k4JnTwlYZQnW3M9EuL4HPIb5GtaTn+j7FNlE2mwo4OfIHhxoX4JtklniDT+jyc6JNAsmi2u1+Xo8kpxErkHOajPwSVOz8ZJdXKfhp/4QSFK0eARy+yISKyCB86eYN6EITuPEeAFnk74dcfksCEB3G1yZWYk3Z9IjJPx+1YZLl7R9qwzjYz0mRRWEgeyUTWJ2cJUJQk6UiPgQhCABwQsPjv9FLknDqlxHknfDrj8kpQhAcwoWCTuh1R+a8XsndDqj80Bx120LEGdN6cE3rxHiHBHgBOCb0pk7odUfmvQuR4jOs8nfDrj8lgRJz2v7l4txCpHgHBCSieaSpIA5sg6SfEbV9m9PEly/vTbrIj3vgvdGj+0QSXmfWJvGvJBj+oD4WP2ntWRC+hwegSdKvHf6K+UDmHWbv7YpEswnml7O3x64fJN4d2a39XHqF5J3w64/JeoDiBPCZ0IHFZEZZW/tgvtJ0oQHYfE3f2xWSTuh1R+aTLLK39sEB4GSTuh1R+azrBJ3Q6o/NZ0BQh1gWeTvh1x+SwIScPAcEJOhAAJQk6cBJRZs6RIkSSiifhBeVrSlMa8A4BOvZO6HVH5rNNkzQps+QRJKFJj6mdrgsCKVpWmNOAUIdYUSZyW+fTZ+2/dUjUB4LyKhbSKrkklskZ8cSJwoX8G+MNSa3zjZWSjnIZTCnDrr6qUDkzS16ymA0dC3eufB6fULmRTckkVlxEIix4MNUY8ty1BeMHG1NknerrTHqrxp7QreI0QyNwK+X5PidCNp1YD+1Ubfq+tqhU3f2xV6Pyfv/5Yai//AFEh9yr3TFX/APTaS+qX/wBSgrDSzX/cl57xevKKhOIoo4DPwiMXC4sS7WuJ7/JhINn33/O9d5rW2fSrCd4iHMuJ9pDbAd4OjmP5KrP0fJBGkcsxpQRH9H2SR8nOWH0hBpknP4jr5exaS8ScxJn/AN16k+TJxBkgbigxZWBiZ/V6QWltDcyuBjS0uQtUtosLxHULXE5ahZPUaPU43rrv6+rCnHh103Y9+HCoWaR4f+jzv8giFhYfDGqqco/P3lVZVIDEH/EFroZ+UprcMmo6Ns4AnQgPSrVfG7X2KAcimhJNYZTVEknyNmpOBFVQjzckFH+VnW06t7X63dyJ+LudMAF/Dqo7kWq/0qUccnVR7c5/+pyKfdX4jFup2eNO48ZhUudtBl3anhtDxBkjXdy702yZKnKhKDnnBNdYEHNeG0pgdEXJktCOReypHDjxZgQEDLXDIEiYlHOoLkxztkuQzXzx61atU7TSwcOtc0JOoPD3x611my9INFn9iFhdkA92JiLOeywwdfFofzXL2g9AxeJBFQYoxsTPZ7t5cc24mTUwI9Osf4cmlffSlA5yeplJBFs3WKRI+Tp9AgRj+eG786fm2OfnXa+e9IzJIZBh2j+K4rY/qy3CiZIZDjJ0vxa6RjIb3DD+6rS8R5hG41DZbcaq9uJCJ5PLUG7M8nxMMQrN2HSsRV7XiJEL7tSg0ySHIcjdEamzE7JE30jh1PFh/wDTRs6vviozda1XEA5c4dkb8gY6kXbzttn6CZh29fjS2Og3VwHBxZTSLjcJvvWtWA1VNqqzKS4ET8WVFzPxnJ63ct9nSJJ9KHDEasWJdfdeuVtmdvscnOr3ykH4GBdHluccWGEf5Qp/3oVYGt21nl3QciziU9Y9SUIcpKdsnqGWLbtxa6bdft4oudyTIb9wbhlUZLFa2i1s62kUvUbW6kuokiPg4dsEIXLnmbYnWA8motINQong/qMEN1uDh9VXccyu6PtUps8izesWF2KEgub1eWkSaXMPZ2g3wgqf/wAo4xvbm/6qr40WXtepWdLaoTejkLQhyZDkJT193ux9osjRbDzd4Z4KWaZ8gp0ZY3NjJa3d/upRsu2wN7/pC4fVVmkhs9OSZzfS7GLfidZhoOkKhT+Y5Fmzp5DhPJLJK1YyELk4ttIPr4xGv8iIogzSVeYYd5PwFyvrGram3zShfw6sPtFzK6OLStBI71uiXbP2oiE2ROOMH0xPK41djDj142ycQ8T9DyHQtsg6ccuvhh1mc6qpWnOLfrC6C+2+UG5aS8TrWXuds7U6U8KWVdgwgLm6CXSc6qxSxQRMenZKUozdO3HBspHzfnlCGzZUuX/GoNwtTZ6JHnDkE4pqFEFwOiMdpGocT70oT08wgyZ47ex6W2rYzDopieG13nuRBBE8p2dDNf8AtBO8nR1KyZBDh5WdPUw4ejofWlXC0vNt3bjXtitk0eQZc/LFTXHPNLinFpZg2TRzmD8E5OQG0uHkkUvibOCtDNcjJ7lPIP2t0xW2JHOMcnxyxBO1k3/BOTazvBDxIHzBZbpiuVRV3OyN0KooMddq0VvS/wDecRpZZXVajObV9koKbYXio3LyfIxfthn0c3qfX+nDJ4YDdjmHyTygnCeUFHM5ycgZ0KGpfFaeLKwTwYB6RxPsidzKJwUk7EOvg81Cepvn9IVPLQRaQlXDdserlQhudN9MTGH1LdodBuzMtnLkVNmyEIAOmzM9IIHkYvoBUhyW1+kNs8ccEqHkv170c3qE/CRtajP1fnlF3+uHb4p3bbSKrz0+JDqUXixsDgzoqYfKmPcLEYtzlOocONtXJbEJn2hFYmfkGyGIJIbbMZODOcB8LUBTVtxkI+jojjqN9MORGzZ/CC+xhQwDcpSpZitYrdiqEiiGt9KbBhp5rtgo3NwA/LctXbbN3gGTBwrCf4PiiasG+a3E9L2L9ki9UbaxOuGG6nVw4+0ezqEc9qzQstmoinl505+gHFhqQsHPN7RGJeKjgvW3Bxw6nCirGmdwMkn2jScWTdjmehQjsA4n/WjPVlqNIVSztckiFEMbmJBqG2uo4gaQcQNXGvdUsaK7stY3I5wf6dfarKL9cfIX7k0yisy5SUbx5DEP15PSV+7D4492Fd4niCzTyGj5dcpuWROiXsC7lmFjUajcoU/aBWFGtVHFucgEOzqhzsfp/wDjJCvKbW5VJ2p0PZSztWFo4Ri+oN4A4GqH3Kq1g9tjbV9OED2U2FuhfgUMObwYBREhd0Q1q09X2eudorZRFr0mL7ST9FikHO1OfSNxEL8LFY6u1w7UuHYbu5BMpyFLWtOQoclKUPUhK1wx3YVrWte+vAFrS7WWuJZC6jl2fKbJ9c3oz8gSjarmfBB0IGheVGEVwyfnJyg5HYg4rEwKIxm3+UYbWrV2yW6WjOAfCZnanoNWlC48FqLB4UHGJo/NFU8eJ22HX78VzK3NDtrO7fjlDP6lrRT8/eNx6FbKkbYgltuOXWLGDiG5SiIydufsTd7ffFWYYMnhwtBAp+qqSnkCtzrPhwjeCdDyiDPjqvu7IwVUA7sZI8QLicVvV18k2vH4GpKibyXTFteg550A48ilN/Ky8VEHloI5SKI8aV66dwmt+K3FF28eWgTl1iInHLplTo0tSEAIbSGVdr9IXLmm0zRAnsOe6hFOjaK5RNKFChpDHR57uhStbNa0+2mVJPxPFRNhDEWSex0tZBYudbJaI28F/IqcqQDRQRkNIA3kQh+aSVyQ5Yxj0Q51H7YRpo/sVtHTFcVVTVpQpOPL37q+qnwpTERW3astE+jFFvdZ/ENErZ+n1xV853Hp0trbMSOCGIEBdgRx+dNdoQcz/g5Os6pwnPQZddARpEu/X0ff8FGk7KorwEyJDfTlGmFCbaIbgY+T1oNU5QVd1sZIn1dOg6CCC8T4MLm5TGsLMuNniKNiptk6k8Z67ur39e8ZwvT9IiwZS3j2mwzas5cmbLnyCJ2w2iZEnygC6RTxJcqDHnf0cdOpYXFypWqZs8ggHwfK5wvR8VhcqKdwpxxA4+lWsTXphjh5OUwR3YOMiZ0+yYox+l5Qb56MNSskTtaoh/8AGNwDrxoB4tRDFC9PEm0LP3YelqX+F16hSRv4X1tSCwhuU7i7UUXdq1x1KRooRi++od7WuS4XzsiGf+BIhBYpsravBxMQMCKIKJsOMBYfR6d2G02tSHgcbSkDMXzw1JgaKhqgKkXSiomtTSxuhMg0sU70jr3rXA6wbqPMxA8kV2cxIf7Qb1F6Rqa9F6GapazseumFOO6mG/2/aNarfJ6KjtoXPk+uLyMFHtp2YeKwBFpN0hud4710UsxbsEzBDQnjFjFcTLB9HwXAh+tCrCsdncHXZfYwlbPJAt4eLOKqa6Bd58XajqrdJAIeNP8AQBBCpLSTo3uN1bh5DXlOdHl6r1er1/YKguiIlrjgiag5jpkF+8t6hJVR2KOj/wDSVEkyHsTVfr73rjI2+PnSPEC/C5foCt5hK/Q1aLiJECxfA0+N3ZFcFKbk4idd3gk36Osistaj5i59EipyP3qU/wBfeLH/AEeHqtYh8hTsClKUJOlC2OPz/AhCEAAhCEAAhCEDqit3gQhCUBWBCEIABPCZ0oD8936EDgtwCdKJOe3Qn9qToQO4eF8Td/bFfaEBOE07fHrh8lgWedvj1w+SwLujxD2jwIBCzzt8euHyWBKQtAnBN6Wyt/bBA6I+l9wxLLN39sV9oQOgEnQhAAoQk6UICjX+oOCEnShJw8IdYUL2Tuh1R+aJO6HVH5ok7odUfmgObP0hATvMx6oLxKJ/J350jned/d/BeI8Q7I8BkXsndDqj817Ok9W7rXyvQuR4gShYJO6HVH5rOgdkuIcF7J3Q6o/NeITeHhFbvG2BvGYz/iPsvTO5Gc3bekcn1hCSooooLbxKVpmRetNgGeTvh1x+SUpNJ3w64/JKV6txCJHgE6EIXoXh2E80sKJXnod+ZOCTh2RW1G+gTZmPT8YIk74dcfkidvj1w+SJ2+PXD5JOOyGu5seoQhAdA8IQhJwzhv8AXe/Mt1qyjKhoV8kNVSh6Lcym2Q9BiY+J9w8/UH5jvqWtZ2Tz/ashjlNNnYg84p2K9rOP0hs6SOKSFX6dWtS6jCuemFca13YYVx3deNK0rju30w3qkcNZX3Bolb+2CVpJK39sF9pzE2+d/PeFCEIScOAFutFyKQn1EF4bT3ISmbvKxbJqPv6VqM7fHrh8l7J9YSZ632lmdtU5iZ+2TiPj06IdjNHYs3AYrRmKn4TG+kcN6ncpAsctGnWT1y2VtIaxnWDZwY8GIkNUYX6oqKVllb+2CRvIxo/jDw8hTOkcuQ46rMkXCJ0PGN6tMrUy0WtKhq4gEVp0oTAyAkY3x1c61BN6F2YRiLBmnHttyRC0IQOSKNW6JNn7AE+yPNcLr+9Nn7b91Zv2vfnXcOTNbUbwtzsen/eWGTvh1x+SUpvScK1uAzzvPR64LoL+TzbZpFp1bPHIJR2BMvh7QXGK59rrf+TxpTRVF19U/K/1PgQ48kdH/wByqPTrJIsdGzulfSKZCF+NPwxFTaZHlG9mrIC5NbzpMhtPIJ5eVcYbbJMie8T8P8V2AtUnTpFNupA+KhEOK422pynYJ3iQeE5xxW2iY0HR9w6pbQGmWi5lqn3iB6A47nVn+cV2ceMR6kzVI5SR22HiOxWBstrttomon0giihq+i7Nk9kDaYXXw51WCtpM6RxiQSJ8lriGcLP5lSNcIatIlCZD56cvH1cd2HX3+3CwtI8vIRUJJVQJ2ekOiX5OdgEa2e2i09w1YUWQxiRuv1LlLaEZPnvDqRxza12EsqbZtmeQBWdQET46UrUR2e4xjujiNl/Bcb5wcXV4kN2fwgpbpxw70cqltfWzkxd0y3+cVIiT/AMvd9+IxDJLLURTYZOmYg0kJtnHPA7eNxosrAhqx9mdIOMLUqPpAc/FklPoIUcDqgoIqpnktTvPbxjhS8ITxwLVcrsZC1K+Fdu9KkOE8qI1Pwnvkb/d17FLVtiLnHCxOdRIc+Yd42mxSNOR56Q2fpdDIFX5ROqpFR5RM9oGOu/R9S4FLRhu37WospvJYtNdbOf0nM7WKWxXXwD+kVEFrVSRrG2C0Wp8/AvS1TzzgzFYmyvKbtNogORR48/FsUWrY2g30ek9oQ0/HwDekM2T2lqpTHP3dBT3hJRFFd4dCuU6nQKK4OVNvDG5Rb3EEoQrpWySabeGouRB4AKaScLjg8cpStkpu00YulbTq3YxRBbQBNNU5go64cqR1baXVFrFRj1NVs4WDnAWQDsN7fs6vGMlHEg0YuGFEjo5T6w5D8FCYUwpTDCu/HGuNMMOFcd0pgoGJpOHrytbm5ofDbJjnpG9WUsUbpsiu6WidimtsKJkeVjQfV+ZV2bZOYnD3c/VFWcsNbS6irBrAInFYbiQkf6vUYvdWvkJzgpgnqz4jeECiiys1/VxyOSYdzg5MNDzx+aHPrXJWoLG3K2C3aq2BvHKa2wTDmu1RGbwR+aC64BybmfDrWmij5LVOOw8LynYrGu5iwPal2uLQUeLx1cFTlyFr3esY4sq6VbWeuXDcnOHTyFHPG2yyZssdoufOodsgK17zai3uLgQqTU5SzxUZc6QADihi8/GLu+bA3gcxS651JTTvWPhE1VPwSRKGaiJ/BMFjCB/CcYe7dCoJlT0q8Uc2wHph8a6foXxEBBMfo9xf+W4VX9o2vFdwkSBcLFO9UN6U2NadWGNe/fwpXD3DTtq6Xkrdt48U4PrpHpZhEDR+ianXKcNV9cNRTmLDAiB4DH0+tIraTTlR1fJHd7WWvwE9cCZN7eP7sGq7s7OG61Ho94kFbW6YE3+sYrdqvoltBnSB2eApey+on6QvV+/J9FCSxcvT605d3IT3ewVVJTF8X7HvJ1ciezENky5hHr6wsIL6cQ0ToFsQjnsmnNcD1b21PKbrBrbbNKmaKpo4tzgxXPDQyMd+Bh7LBVatC8Gz21qIpfFCYQYcEwM2HpD3pa1SFE+FOnMRPLDwjXjROZwIXKfi6S1Gkg6bZ9QU/Twrjju3+31YCmZKIWQuZa24FsmdRbKdIxDcjxjVoPBlUvzrofCtMXYmftnOtDM45PGIIxZUCuORU/ybPpLJTc/S5zWISZDk9IgKPDJ1KMZmJp6QU7+2adUHnICQlWbZedeF7R1c3Y+gRMRuetyWhMi8sTIofl5T9P8AfTG1WYszk1lyK4H0FAWnyscGJVOpvcCB+Zb3Ss6VUdVVFhpBVa2n1YWffoLyc2gYj1oQ1V8kvBjrOw+sRrhDiakKx+1SbZnaDIqhvkYsW7XGG9fLSWiGLRtWJJ0zGIkY3Iz8j/0xxjJJFBZs38HSMcYawcqqo1ykN+gxaSJafXAVFc5ynOrlpCoJ5RcC+OGKa8oi1n9LNXz6mgDhYEwuhfyqD5LaYdtHq3tm9Qq55K438+mxRT1ypCkOdLpkCSSWprjt263NjLKMjmZ448njf2LZGGm3iftBHkoX+uDtbd31LabP66bbLC554ATZUDpEXAwEegdIU9DtWoVI8P1R7Q4axcVxP6Ob04sqrxZivZahnLhEtMibfoE+ucn53jhRGO2Mi+fOp4cosHROUG+2Ohzm6zA0owoobBGO5wH/AHVR88WhVVXE44iqDiy3QorUYdqW32HyrPapd6doGr8LT4pb7tlXwhvT9b5TlFSLRnNgswnafGDJvEgDyKxrbMRa4CPKplosonnPkR5GHg1v4CSPFpJ8z29g5L0SE1RM/wDANbop9cgg5zePOvu44GDyD+ypbJZw4Tp7g8T8IN7GDrcYfVU/U2wSQW2e4DhaWdIjbXytwHKtDnTp094n8aLJvVlo016y+zcgXBSMeRVsRTCd5amXkl7BBdbJkyj42LxegIUuK6i1WVIvgCfgMCuiVqeU6JLpsMiymrqafnS67ROBKf8AhOBHRdG+C5QWEWSvte12x0wBxp227bvZh/Wil2JoXJupey4Oe7tMgSoK5iJsjtEC9vC5LhehZP0wt9H8XdRH6xanfV5dU6byH4UpVTHhTd1YdfGomEbG2dC0JO3YQ3lHsJeMn0xW6talrKNhVXs1o0+mC6kKhIOaKdZIwAcGIfmJ139u7Uufk7PXR+/erL0ZY/XVYWgVsE4BYx7a6ZnvcRno+/gnEEQjEMWMebVvUIuLC/RmnY9kKaig9tMEwOAU/sasPCGcxzZdNRWpiLHy8khM+HD1YfniNgWEjEwqTmJYrl1ubWmKTocsa5JneOkX78UrN5MkmT+llqbyL8M60xPv+arhJkyZBkgiFxY0duMiD7OrV5KmaNtYZJBAV36tOoUdXTC+CdNIDihbVfG/sz/cJHeqyzeyZL/kmEE2gU3JpyqXMcc2LqKZCfeVGMI3dCmK32Mm27JnpUWgZXBqCqbKypB9Qs193C4Q88SMY/ZrUisOS+81+a5v7sboASJdwgl4kNPkXX3qsdVNtR2T2lnCxxLWQ1PmMEwWv84bF3faogZ3HXYq0YxrzGTY8v1Y4YV+yvur7MBXF6s7Y0sQnyS2/O9bF5WT6fIHM+S5Th78PP3pygY2ncYkYT3wFXmtasVZ7YW57tOspA0TWLVttdWdRjqiP/WjX7sufkrf2wT9CXC/IrVvTjTcdI/V+ftH5m3raE5YUseJliB9nM5kiRAjjYvtYO9PDA/OTHO8nnFCLY6VZ36Q2z3hv2tr9jO9HOCbzGCS6yZ7hT0d/HGfXpFvVos47Uc/T94oRoR0tFIs5VvrCOMuYvYPk8ZBvcmqmF8kyByJERXO7AhmHAeToEe9GrC5Sq1ZM/o8jyZ/W7J6OgolDk/DFdcFO9HuXiZA+fvFu9e9HxT5VGqCX/aLIsl460huyMJZYyKvZVS5H8YjKa/uTpJuIdSiyuY4/UnIOdz4rFKYDaVZ3SdiNlaXT2v0fTqZpVBu8J2HAa3R2KK4pEEC6B69RmY2iHK5sTCmia+LdkTrv+eTzelLyw0Nv+KukmRdk9uNSVKFa9U4OEo2n4Y6kMdDyi/uHtffnTlYDkdN0XKQ/wBr04UskUrY6EBP0g3bvpRdP4ZoeRIHGkCiCiC34ML71lHS/pgaO2qls2l0T8lVXq6t1O/28Kfc0XdeqLCOJBMOIr1lgv0WqwKrx46iqgzDKH/EF3feuW1krbOnv0iPRugpUym7bBLYqpAaKZnk+B1KcTLh9PkalvGTfR8mfOkEYf4JRZscrYmjZY8pTIqubPkrx4U4+sW1ZUarYejFw4l+Qoty8o4oIQssrf2wWyR+fw+0JOlCAAQhCAAQhCAAQhZP7GlAUo8BjQhCB3AhCUSOXvzIAE6EIQAPCEIQE4b0LN+x/eWFOAkqK2v4gQhCB9gS2Vv7YJElsrf2wQOqXEYkJQvibv7YoH2MSEIQPhLiMmZm/wCissndDqj819Tp2fjvSRAV8zrg4SvMw78yWfs+/OkaEnDijwGeTvh1x+ScU3Sd8OuPySlAc2a2oCib5mPfnTelMndDqj81nQHlFbvDehZJ3nf3fwWNAVhwQm9OCAtRW7wLPJ3w64/JYFnk74dcfkk6/UOiPAOMjl78yEnQk4f0Vg4JQk6EB4RWChCEJOFutqBfUnz3fmivlCArQ6x6Hu7fxS6dvj1w+SwJbAOdI4zi0nAjXoOKBElC+f237y9nb49cPkk4W0W54mAUoQhAcx9SZ3Vu60Byfh9izNoeOcpA/Jcpdq6zQ+nmNtdp/CFiM5jfmjQ5oxhfD5pueSbNgsm2cqc6oJFD25ISjRWWRP0OgIXzsen/AHk5SZ3fcnJybcPtGfFLxaYM947pu+xd+ZcIjsqjIxbzYX4eAxJr2ZGQAC5lE3axAgVsjCaG0mSNISOmPJemBjfXCl3eS7NJsBSBYbIXwtXMksTM/nyYa9qSJZJdcyjeuGpy0w78evH1cMPf3BbDyXkt5tH9dDi8TpJE7Z74fYm6Vv7YJEhLKI7PTCoVqvNud7eNkcmea1SZBF/GhcbemiVv7YLLOcuxZgw5ppkiQPIxZJe/mXLnm6OLoLFqM13nmAb0qk5nou+xZiwy2sueORIwhMYYLUk68pWlaY04Dj+rhQtjfqpMqKQx4gFsE0S2YIPBAaP0hetUQuOxIOFk3LmnOphWjwDrnY9P+8ss4KT/ADTbJkqQQ6uzFIulIkNjYVinPG6WhHygB1rg+XXb0T2VPWVqanXhu66h/RoivvcEGicXk9K/Qdk80TOs5sToGmCJERCRWLGu/wBYn7UZ964rWHUVJtLtToGkCdYzq+3mdI7feUZBfoEd4YaRCENV0LtSyp+kpP7S6j7ZLXhzx/up+PvGZNPclr3TOK8BcwhO2A2T4LHXnbSXrwl64824VzUVa1Hjn40QrCjRCEgDyjx3q9duVbTs6dH1UTljFcx6kcs/Onk3XdqkOhW0yM0qSTgmKvVXdwr3Cd6Ibc8lx537gnOBmZzHhqnRqBoHKjokvjf/AIpR9Wz9OdZxxBHGSoT/APrAhb14XVGFTrpTQ5sBGN1JxruJ7xFarRdOT6ptMs0YCNsGqCsQQsHGG4fFXrQ+v8noupiSITmy9W+tU8Me7jx3b+/EQ/SbPSFYnyQ37ZuV+/yB1KytKcLszyR6Ho3PiwjTrU0shf1gcVcJ50nETvvXXPL8eXGq61Ao9vn4sWn2sg4wP2BctnKlndqEkODgDhBi+TlVK6NLbeK2MjtKlK64x1TFGY5eIlqx7Z9RE2ry5s2UafJDz86RfDs3Lp3kmxnURYpb3ac3nYUqn6EnhU3dvg4niX/guazDJknYePIuo9oP/FnkDMYDfIFDdbVqmAgXza43x+S+rrRa/JBo1bE3yK6NPdurWnwpUN8NTDaXFPDlHKBtk4eESPsU+2TyqQn1fTo9fT6nqFjhDYw6Xht+JI9Vim5ypVhamc5vz+LfQyrsYD6Ow60MJ+dwZM9vHO9akHdZKsBhAJR0CWHbnNTEuHr9ocVWatny6NZ3Kft5C8v9wWMaGKr5z7V+n6uGYCbIY45op2pzSnBwcMxC/DDLX21ynHaUcCJAsNLF8+vEe6qH5LkY7OWkHCfpYovjeO8oOKmxhbYZmQReVhcUpQ2j1o/FxIKF6uFKUw9nXvrjXfjx4i59ENVbpkD0Y5tWQxs2Y/jDmHJnfYrl5KM6cDXgI5ARMMXtwcb1Wdpp11cpTlAEPglRYW2Dy7QjwoQiDIujG6HwV98i2m8w/GvDh621yMIGd36lXOk6ZZI2m/KWvZwqQasvVKNt3R7Ja/wjpnOnZgMHvyJYZJ/6fm1qO7R6qk0rwqWxGKwpZUIFxv3qSTDLoQIu5FgM6aqKSK/jx+/AfnvRBVvQj75tYcy8oSTlQV/Wr3RFBMblT9GwGwQZkToN7c/+9QMUQWkZHdeNVN06Q0VUKXFga5HhHGqarjo/SHrmFV97VHlxInSB4EEtQ0OVUhylqrf32QFZ+MCU7FCcbNu0hs60XYkrcS3k1jD1RbJk6XI49WsU379271C27QSue4pBgwicpE8vKFCHixtxClT3afUVM4UvMcSfcfBeu9nso6RI8GDiRBsLthb1EvjH/qFOIgdO0rJdG93axagfC3S8UMGPk9vIUfvz8ZPnT/EaJj7GD5PitPR8xMP1i5j8O3upSuOHrrwGkI3Qta6EQ5QnUTcvtEGkhUHSrXmPCg4qoChBdjgEdHR6WPz9OBbMS3giicxgQGj0jz2IknEY69RwY8OT35HHBKL2rXr0gn1BlVdXaHKgry5J617DiTxNpttSosXkmJyjnEeOTlOOnbRPKLK51rcmSY7GSBh5BZZRkdjDhBSROo8weTPIeDmxpwnqZ3pJEZzPR8lrqBvkOghPHWgM7/vSjd0s/KvnDhYpGROWYYzSjZGi1F5bMTxePIIxcs6B5H14r1xbhQdVTqO0qQSC1lili4HBnLSXJ+LdZxBMNkiWVdBYYSXIdtxGH2WPrm65UotcbRedO+giKLakvI7BCEAyeO4p2R+wPkUIYZs8HnvI8jF8yHKU5xnT2/EFFjCe4aPTaGZOBnDkDcaE3pbOeDDp08gjayopuZXHHPo5ZCWOZFTWdFLkEyBGHej5LPPfmoZ4n3iwK2zoU724MVlrHOZB7OXMl1Gg2SNL40G+8jkUHUSwmVG8SG8fFe+GAgaRg3qZqlnUfSpnk+R4QlCa8G+eUW5WXYrJJzC0rjVPDPuJ6M/Dj1+zDv3iVRkcqvbrl8uRMieYhNafp/uCPWClXLMxeHD9XmH2z+sPqqfTX7z49P4oRrhsJhh3pFwWuGPDk+cY5tjD/wDCBp9pthcqjM2bivrhd3k5v+tK0IeIpFNN5+aDYzVousRjBENrD9rtnG+03V7jmZzO0QKjpUW8zlWx+DclrEifcM7OfHg2cLyhgPrS1Cc5h05J0PTHGsLtjxvu+q+7JZTclyIneT55WKL45fvw/vXxThqMc7ltzafX6+oaFtaXq4VbQT/zlyTkFy9BH6g6DZArO71Ja1VFXk7KK00fOChrujDPxv8AuXYij5OHpuRAmeUXyxx2u9cqMgpzaBrSHWn2gfCE+B3lcyH0gSOX6qr92q2qzaMClNUgOHBqZ/hfTofCjdwTiIQvjGMeRYL0vJP5rSKuzQJ2SZfZ+caj25IiVlLhTgUD65TL0xFWUlXJ9l0yL4wyGvhEuwt0b43RXKYx+cjnIhwcH2qL4cm5bfaPabV9YmX1fPJ2WN4gmAvwHWomnGZ/V2b1ozR3YxLdiCJPaEO6r0j07qcPbxG5NH1rR1oQZEHGU73tGINjDzRziONE4ksYvYcYd6Rb1bjJMbg5FpVOncJ6G04ISaEW1HRwDjmItUdV3ZCPaqYN10g3Eb9r7F1RdLIrNqGfwLc3iqimkQngyC8H9HxIgJd8k1aUJNqyYUhVzmwdJHKXIXNy6YUw9+P2DhpHuNohBmgl8xNsTVIlkLn/AHBU/KWrao3WsTpETnMRiacOaHGELtoUDVFU75WrlId34corCNkgPGAgeryIxjH4xjGK3Z/qqTXFa1FWDuDApiamwg4sO70hFv1hqi1SW11qa5TyWafBpa4FQwbQD5ObwO1PMAzZwsW3bLNSkVRT492PV7ev4CB3rpGtjQ1HRTGWbG2nV9FIo6FMVZ1G61HZufTVIOjXUlLYAI2ohAMA3PzdxW4ro5ehUGt2bW6RbJaIPTQ/kTwnn4WENcIR5blsrbbvVL43aIIrCp2gvC4EPAvuj26Kiw2dVVKmaQxGlxd2mPSDclcHBR7U9ZfOXZstSc1Wp+NcecrXux3U6sa0puGS9L+kC3b8jmDaBbGI3IblK9I5BhbX5+ag9HjwdML7GsMmDxjJBDeC6CEx6Ej0+Znp5PxT8FW1SSP2+/sVto6n+oHFHIySK9UUH7xbVk6PIG4TmCdUc7EDsZTS++uB4DycnKS2vDHs58koTCe2phDrypLvSupSaG/B1TCRp+HUZuXRXyi3SxyF1Qv6xWdvPXevYLG23xdDOG5t87HvzKfbMqveWRykDDSYurXHjbSdH/upi1VssyeDdvAwrqL6ngj1aOx+xmTFykaQH2r4qvLwnoFONWK5UzjRPyqhLdt09ZY5fqDoNZuzsM9t0zTBxJbYVtxYhvpFvVD8pXKh8Koz7OLOTiRGKBeCqOpAden+TCirpDRTZBrDkjSJEI88FzMyv7ExKHrWRVDRIwjFVcMcIHuwBI6yxozpbspf+zz1DKH4oZ++nf317vZv34DOGjFK2Ju/v6VzH/ZCr9Es845xkfDXuXVaxOlcwHiFSexmlccZIIiP1dC6rUezyQW2QPBTLTVdX9QQE7063T0IpuPyboQhbcGCwoQk6EAChCEIABCEIABKPFd7kkm7+2KV5/o+xAUo8ATtnnd70InSZ33rD+x/dQO6HWPJ26PVD5onbo9UPmvEIABCEJQACXh7+z8UgSiV56HfmQAOCEL4m7+2KAnGGdvj1w+SwLPO3x64fJYEtS4iQM/Q/n1AQhC+woDgk6UL4lb+2CApW4DEhKEIHgToQhAA4IQhJw8BQlCb0oQF6PEKZO6HVH5rxCUSOXvzIDiyW/q9RgneZj1QSZOCw/tv3UnDijwGZJ0oQgdwnSiV56HfmSdKJXnod+ZAcA4ISUTzSBPNJOF6KwckLBJ3Q6o/NZ0B+S4jPno9PwgvOMdalOqqEDaqda38d7bSynX1QI/ygB1KLZO+HXH5JnYvmUwhtLbq3fDcH2XjpGEkNhkB6hCE4BIjxDgHs+BI9kKx29Trbfa9TtrM6lYUzSItKjNTbIDLjGEIRPI5lArbOz8mfH7Yda8DnQz0/wDFMT2EZP5VvMuSV1qGfJvrhy8ONOFffTd1Dgs0aLqtl6dsZkJwQlokHlKv7MPFL0641e+BUy0zxRHN0hgxMadgG+CSuQc5qNngEXllNLpyeUG1e5mPT8YJtm7+2KR5F6vq1qpzOSnIw349e/Huw3YbsK7647nZZnsPAK21y/GMILajK1cTZUgYg0ksUTilx+9aVnY9P+8smeh0fCK+lmSLhbaHKYfo245yKabA3chdOnd96bZu/tivtKEqHFGu0bgnS+Tmen71mzMPe/jFIkDv6APraHOdXIFvGuxRRUgEO+G9bdXFAu1C1M5Uo+kDRcW3gQ4ZUQjonN8YRhfDVHXDtWOumim6deJA9IVTGq2vRkg3S8QdH3keypFTtauVPVeFVxIY1QEjE43856jjgD+qPOolReSfEJJR3odUfmjkqRQ6m7Djw68aYdYcWjtqhk2gg1VKA52HnYgbr1qTqUr6mG20I+tKroZuqZud+DPM4NKQ4MAgeCRPu169X96jc2dJjOIJhJFEvJx2Ehye6rs2fP3DjZXLSqaWQlc+NMK1rjjSm/Hk4U31pSm+mGO/BayebOsQYTJufz88jFYn7EraHKUE5BEHhQLGiTjixOZNH1f95PrOzuTqXIHAkFFkwhxQHUl65UUEFKOd1A4s6rPnmLcJHgyTPLnkDyBRBSiuJxgkcmd1butZpwc7708yQ5ODnkwni6itceRfXMoIp0CxGNkXro4cDJzHBvCwE9z039LY3W3/AMKmPz6RT+Tvzp4kh5/VDdhe1cG6FGyFaY4+0OWLtdfYEB0G/J5UTj62re0Am6AtPtngqH/Ea10irB4kghz77vsUSZJVBwoCwilpBEiAjpUIs+qHi7XxjX9/2JotzqSc1SZA+/k1cqwNcz35b6TXTpCuKebIT6hN32jF0x/vdfrijftmFc6qaKWqmlqpPeKvi1OYuYg0tN/HlzWqTjk7qircNErwpqkJpxozViycHAs07yeAowyiKjaHt4a2hnp0drFpQbQhZgf0+R7VBaasQy0LMeR6ZlKKcvqwQph9uNaev4YC/o12tCOzwXKPnLn+oKsuU7+asrkOU34RZTbUeRI/o9S51U7t18VU1+3Q6/vXS/8AJtU3JINtgr8m7FCNgFLCdGpTLTFJ+SdGj9xTioWhP+phQZ70jSSy7xVvXsGzir2WLacwvlrVRk0eCU0lCFYJ3dwj/SBA6qw5PzxXDm1M48gUS8rAhiKx+WjRVHslbSano+vWKqtPxxpbQDG9wYOmCqYztz9Pz7wzyCvJJW2GBb29e2OuyraDKsSQ2CZC9PHq3de8V68nZfazwNTqeTlMnNE7ZCDdm2g3hqfpDPG8vF8TgD9bXQvLirsOj3ewKx8cHF6AYdOGQ5vVAvvVSLAnNyqO1+jh3mQU7DOrpgjE75aNpsqvspWqZ4E+4az0SRSrQZfyjqJXWg7c6Q4OIrlJRAhz+/dT7sQ7u5KJhKJTtp6wiZFDZdaIfqSm5PhTpmp5BTU2VAVjt92zkKOHGS2yHE4dnxWFxWx/V1uDxW0mo3IHTDVhBWkX6DipXtLfsnh8pyzxosqp6pmp8p+MI1bUT3wbonQu5Yqw6mTbPWjarI9VFDHpnJwTw341xrjv4de/D11CS6UbYlJBz8kzl1eszlMfkLHERU22uQ8mQ8aKKwuJ9g8nKwkmm6qBYR3h4p10EbC9hDLiD5OiR3+S6F0raPk4Wc0eyWVN9QNdV0hBqkGFvEYwviQt7pa3Gyqv7P6is5HnExKwpAIjTgSz3E9VdJaV7lqhRw3g1NmIenKNm9HXrww3V76V4U41FqaJpG57Pd7QxjVDs+0cUiopnk17V9FUSxBFMBBQ0gOozOCbo+J0IQ/vXY6iKEZ6HkyGhvvL97OjrXGGiQ3JqtHZGg908FSolaEMd/YB/al3OYAwwZAI4E7Fi4XWZBVFpyVWbLs2rdeuzHTz5d9evv8Aup3Czv0k1lUFmaCC3N5c+UMNrU9oCZpBLvIcymwQmRAvBR8oqk7zldOVDPD4zgUsLUDXCOOpvb9HuOGV07ZpJs+lXTR0jFk9S512s2fVHaVOsyb2AFmEIdOFhBBGfWeB/gw2pz6IfOKhujaOt12gT5Slzt61PTHPhkwpnx+z1bhD9FkFaUnHn+UpM6eY/byZBINm+U5W1tD9IpdoseiWLirqkMifo9vbx0iyoaxEo6bBoYGkXg4sTbDMDftCtSwWbM9itnM+mKYjhcIJcW7+3kKhNqln9X1I/tZFTySRWyoNtFdwXC+MI3XqV2oracrd23skioRpMaEJnPnU9f40p8fVJNFvyNpc3lVvQpGaPZ8YppOnOJxk8geQTErj2wxSttnMU9uqmD+xvrq+li4JoM9Ht4EPailYI2v6OyfHKtKYaZ3ha61SPhODgfKGjpF0YXlGdqrLPcX57kyXCEICMQpWBDpwKPKtLRr1xO0x1Bk2vI1SuepKn4V+/dhjv+wXM7vtW75Y8TFEMdsNDfo0sxyZ2mDinZzLGuEEZPKDd/FJhz1SVUznOFPgtdPCiYjiXpFww6aK2MlYwjxGE2rigKZqVbHd1nT2dvdcI1lCeV4Y/R7f/FKdKs1qR205xiy455Ve7VYHJnT5RMrfkHOf/mHCRgk6Vkm1xU5xZTUJquO8oaQI9kUYvzxOfTJ7gR/BiLcLQX6SdOkM9P6mFp2EP/WHvajlZrv+eWWwgqHMdInSN4zisZJVFv5i3PnyG5RvGcJ0tnTjMzIH3ix36k402zmOzxIHb2sp29zB5FuE6j2enMCTWDrrM/yaB8oOKh0PAyz2PO+YnyNj8g3KyEyDii0XXS1+TmydoR6G2mHTsONIKLKv4mtwk0q2tUmQ4Vgdg/8AU4PpBE6r50gOQNTwItPe+A+kVpM6dOnxhAjkS3XWlbtOY88c/TLkRHGmpx8Y30ysDMHIZ2cEWnhfcfSLjzYtNkkxNraE5PhkgdvBKLK+SlRnk03R02QSRhahqjFc36ut31pWfary4ZVUj9A/N+I/IIO+p8qVwfHyJeIZmem5MgOQ8VPPKaWvkD+kXD6qhyqScfmG8YEVpaxPodM7uYZPeDiCHXS0PbOf6qszC2mPhkgdv41/8v8AeileLRGlN7lQdkZJba/IMCTpmyG8awcmGnHJ0M5lPrQ3Bjtzo3t5zYLooXGmGGn+UD/dRVq0Z0lkkRaG/k2Ex4B3uHuoqwsQePnaQ2nRYm3GL4ea5+jtGOSm4acsSNjbPWJEtya56fpG8A6Pfk7KKknPFotb3QEJGa5DGIJzKVqqtjtRZLSZNllJHN1ZvYTiFwhnc9vxoDaLDfEsvs61IGTRR79S1gWPZwRRKntBhPfA79eAH9TVHbUYC2Wz32zqnKgc3R0dOFIjW9R33uZ0LrsMNzRj9kIrHlU2t8aRJZelCqY1yJFPy6UoTAlVK19W/CnXWuHDfSdWBa0fNXFIsKHKtk5Jc5P4zjbstZj4IVqkmphZUOE2vzFIhwioRvbziR9cIRh1RVQMGZ7ET8VILjVvBdKXp5idx7h6WFngtMf/AE+5ajOneNn7DfDFewK+rMjXsFAoQ7rA6qHIzerHd9mA07atrLwkGziZA/oS5fuGFt8ROBj70uyFvFLacyapw+Y2pqYgTROnX/JcdZPntokFC+vRXaC1GovDXJmcnWkJJJcX+lrg9V1+qML1V+mJd63nbdcN+BFun7y/fTEV7piq8YzdquEOw56QozZRTUt2ydMpOTCSNAgNq4WFK5I4AOBUI9i43TpwZEnaJG7iRgO6K7t0IUZk3WVvZDu1xqBzqBxkGO1OQh6vG4UsaHVr+K5e2s2NRBx1cWc4moLOy8QdcCBpBxpHEbxXRPdmS6qdwS9TZTsnCtKpHP6M9cClw+ymHeMx/pDW5OXHOOb0iSZ2RFDcr4CqZoc4Ho6E8M9SOTJs421td+2M53o49I5M6cDmPWxeRZpwck7PkN/GvY4wvU5Rh6a468EsYinh/wDwGUEXarFbXoH50SpOpuj3yaBoY7CFF8m9uWtuVKzmqdtJ0Nr4mtJkmTpE77OdTAz1fJnh6PqGMSxfbDvSP8KrCjVd+0IEziw4xW0rpqdu/RTZueyqToBhCbWcfjDri+TrUkNrlTYN0dqLju4hpBMLlRMmRc4NG1tnHr4ekW9DRSrudCRohqdC8Xy4C5OCqzRdDFwtuFkW3GXFa7vYKMEyKfxia2G1qqqVm/qxESA0NURDQbld6yXKXol0Li0VPIJolzLh6WO9HfFQlQmRpabUcJBFTmsdFC343FmnaQcVdiz3JFsnomGJcQiq0c+V3e9gb/7Gs06SLn0YOUjtyHMo6w6SP868n3cQ6XHcdkLpnrIHzqfQFvWfzMjx/TG5U8y5HKTBos7aI4XFFumO1dV6uezycPCQONI2UNc0cqJ/k1ja1ObpERShqJFkAmQ5cQ4KgNF7Tbb4QXr6NHMc33fiIbohZ7dfCLj5smY43fJ7pWddIIw8NX2LoQzhw1f3KB7GGDANA5CssHJkyJM8j7Ypq0gzNJSbWqG3SBL0m7hWcD8cayyt/bBYkL9SBn0KEJOssrf2wQAfaEIQACEIQAfErf2wWSTuh1R+aJO6HVH5rxAVb29QoWDMw6PjFZ507vFJ0AWWChJ0JQgd0VtooE6EISgeAQhCABeHv7PxSlCEBOBN6cEmnb49cPku6PELmawwIQhKQ9AS2Vv7YLDJ89Dris0rf2wQOiPpfcCbv7Yr7XxN39sV9oHqvECTpQhA+woWCTuh1R+aJO6HVH5rOgOlK6/I5ChCToScLEVhnk74dcfklKEICgKJ/J350sDbX86F44OLim2SHOaupWCoStmFrZ3tvPCxRJbZPC1a4Ab9Sj0k8WYs9oYIa4WZo/tyOumc2GeeGZ8kQeZJ7/NAX4fcnh4m58yeRD1srHBh360xSd8OuPyS1FXXs94YXjNFi6PUIZ26PVD5rxCEsH0FErz0O/MswnmkhWeTOw9+r7dSB1S4hxQhCThWNhMM3+PK+pnak3Jskzuff3uTmkup1HEPHlJaU3UAhCF9BYh82BKEnT5Jkzp/F5BXWk63MBzjY2j+m8NmZh0fGKd1uLk0MY9OhHt71i3wsmATu0+wD8pV3wWiQnZiTJjC/r5dyQt39JGla0pXjWm+lacN3X1evhXqDw9ZajiFSTpQk67BxAhCEoCgKQ93b+KkGqG1iZncMZgehn4WIsg3F368R7Ko6lb+2CkakadaKpnVRper2ylYNbHPMEibHjxEfVlG5ZWjDCRdKH1KfGmGOOOHdStd3q79/qcWUl5LaYUGJ9fgzgwRxwRhMIKOCZEGC0FfXjp+qMjoXynFkzRYo7MJFMTrubebQuBSdS1nT7VLFUL+3kNgbXSwuNLxxvNr2VZqolWXSLP6QIpA18Lrkr+lohsY4ADnwqw2fhsdRPkloq2qCqVYyoEHFO1/5sI9Cjj2VWcwqki2IdDVm7ada1wTrvwSpvrjSlcK076VwrwDRGqpLO8RoGZj0/GCfW1ykjyTh8wKXEv1z+r0rqOc0HOMMADhRsL1QWoJ4p5+hSrhPASRbzGR8wG3tElonyXUh3NwpIg2yYGN2PISQN4MCm4geBQpMd8AdaY0pk7odUfmvnYcdbjvpXqCxm9VQ1ewBdno9PwgiTvh1x+S2KSI0+DsCNKE6cEdNkZ7/J+HWvLig4o51m77A8V5j9ZG2tzbpSS6kwObBNEtmN205ZqRpwur6jZGEHUS/vshljHfxgu/5LS507bFeHIeo6FS2y6ejrFoprnmxhyRII2WPyUSvKYPa1tv54qm8ifI7ser7R7cdxpRdvO51x6RsUdfHKdJBbZA/qoguu/kVIba39o0lPHAnwdYw6b1caqs7PDnjj8a69cFyvtmnOLHOnxcNkK9jvWNtE8Ok9mOnv8A9BkPRPA0lJDaM4cTbPbOaxpB0gfOKp+0UwnA040g/SCoJWDC8UrUjqz1APhHQNXdYbYKEpWnKicD2oku0XX4O3+juxUXrCqX2sKkOqeoJ4rs6Fla+has0bI3EhJPdfn2H6fjwp6P+y9u/ET5n8oUJBbaM2rzdsayIwyp8JHGhGuBV8OSEV2AyEKVbqcydnx5IdRRWuq6xdnzS53s4+yxXKOS5ztAnDkSMWLdP18q6SPpcKIyBKIYcxi/C2jpB13sGP8AKia9Nu0SrCOtop8ijp4Qnu76eyuHEQnSXAwn9FRLHLrHJeUYcpq1o+adUdRuIxuKxlTz8YWCB5OP96TO/SXKgNnb3vFi1CLtl/Qt1cq2DkNGiBmuJZRZOyQwGj4RUKSjZzU8SIvIOLKEKwODOVsN6Vboptq9XsEUvtKzbdeY2ocx1FsnOZzk1IvFkeNrnC0akShpwwrY08E97LdzQNYA/J81XGcGYdUj5aePI0q1l1RPODDO1Y/3stdI8n2pC7NLH63r6qKeGKpkSmGmIUeDHyk/qiNprwG1Np2j5GEa3fbQxLvKLfEhV5FPVZ2+JR9RHcTIiQ27jvrX1476Y47uHXWonCVuRK8c7fP1jETjUS5cnT1wg5oEDfKjB0gQKKK6um14H1BSF4Hto4Zo8RyixRHSfg3f6OPHTDgzDnKQ8N7ULq27Bg7sOrEUW+sTJIkzyKei/ucdi0SYD+r0MQIrJfPXjFErltmU+h+fgOGiexIibkHLeWIXtHKbxkOIno5nw+fIIUplxcGUvEEAubA+RJkGiCQBwGAH3RSJ+px2o99nAOwRIrlx6AkI3w2hLZ0qoqilT3ciS+ugzVxsva3CIKbHz0r5ZORqcuyn/HDD4jWmj6IaW7BkiWPpCBcwhznWpGuDhPKKFgUOcZDH6od9S712V4yFKsmkB/VdfSuJFhLc3nWjNQ79OwrZAaeeWXEHH37l3ho6TJ0ZCHMsr/pEPS0XZx2HDfw/H3fd30FG/pMvOdYMtX9L7hrVpLC41IwHNDecU0kl88NSiDJwsxDo7wqqDMRxRZWg7zT9IX4dWFqDzPZH7lmo8OS1U2APz8qoJGcdIW8tEoH5s5iDPTK6ZFjaa1t5+bObMGupbpwc4eRdqhrjHkXEO322yJDidS9nB1zYJsRdRxP9IfVVePLktlnUfS8iiKfn+Xarh5XLB9IgN3OuNJkmEOLyCr1p7QFYlXLCtyy9OaP6Infh1/y+PdhYWj+BWbxJ5ZwcxM/RG60XGlnV94Q9TGktTbCF5ZYfCx8OFHrXrlmZEk4ceeVxrY9Sj0OSbPm4keQVfx6GB13KTZslpBg1kAToOpRY0g0uJutuiR7KtJvEat320ZzVxpuJ1Uw+7H116qYDRVkzC0pHHQcEyfSFdqkZ3I542eQUWUWUnKqn6SxhyKYb/Kw0SsdUhvvK2qvKwkjzjhm/C4orjhgUfJzf7qKsEqiqbOokB/cASqebBSpGl3d8hHSLh7q1r2YfOlmaGpJq1OyMjT0bHIXFMRNpvCnUPy1TG7BPAIIkuU58qSRodjxeLK2NnVhHhyaJE6e8VyCwtJTsw4EOm6V9It/1paG71gIxhzmegAdEtYhOyPH+UV6g4yaYRPnuBHMqgl5iXtih3Djzl4c31CEEIZzDS3anbscrlTNys/oc5BJ36VMCzkNFPMbW0YsXA6Y+klEiFtUmm3KfJxLh5JFh64cqmWWuy9ndMOeyeDoEDCq8duMjdwfodEaqt3CpXA+UKoI0SNirjA97isE54Z2nPj0/Ixf+uDty1ucZOnmT3AidiyuXlSyiNsW7+sHK8e+EnoSf/IEo3AysIjh6IpeRolr9r16RcPrSYQ53ide9M/jpEOlb5StH6WD0w8TxWliE9cO+kPdRU/W5PTlxPP7Tw9ghB0oi8frbMHKm2dyqozDt8i/2wz+r/eilLUX1hpyTIp9njeLxJ3qP6QcPdRfdlpLxUkrB+DFMAlNFLiFdbi4fW1hpVhMqMzZ5+EFDFuMMhG7R60TBoUqim4ljiVQLysVIkYWkQqz0/IMr/wBhBvja3Tnxyn4fZGz2v6Obx1JdLiSanq6j6KaNla3R9BZIGbtIEYvC4q9Re8VIHPzDPT8goRrEV6MhazYJ8tN0u8zryaVa9NiBR3XR4nekF8y3ydtZ1Or8ipE+QXjv6heUDJJIa7YeXkLmXV/7CDoblLWtTrGGimKdpkCBjkXDAB8wA4G9V6CyU32uWKdX9bz4MD47ixxjUADfCEZ+rFK7VSUfSto9SNbw8NcdO0pn7sbqboYhMtu9pEijaDe+Aa1kwgSLgfzYc3QsO23cr2Kasom00skgobn1d2Nd+6lPVh7/AHh9sq+3bFpGwVmI5JE5vOVfGOOlXUiZSEIRcHQYrFvt/kSF0VosnCbR48r4pbnoz8/9VIWtcXnav5rb0YgtRCjdypnVG63jt3FoooL5TiWTKQ/U+navhisOU56DM7d3yiutmSrNgdk10iPviHIPDj0Yd0cILn5QrkI+ZOdq7ARC8in4AvTTHlhqhGH2w+1Tdk916/Wc5NdfOxIOLi1Of51N87hnxYfis66TvKFxwB2Nf1lu+IQnrKcv/wDL7BRml5KRui1zxNSecovSkJ9POT/+wUQqmpH013qKBDoSTAtznwhA0+65YabfX2nXKeQ3zxRMUL5XaTgPJx4912FKD+K1u0d48ATJ8HiQUW6F7c8Bgw8nN+I2rCrSRLVLPjpEjHz30SN/qTFqV7I0jV4xNjVMuqOXu9gmMvpZ0WRTv5NyzxMipC9HsB3t3smpWDFItloAKLVTLq+aEqWnMbj3CkHmMbsKLyYZVNkhySOLnYRW0ra0FnqqyafQFn8gp3xj7Iql4MOVRcDO5lytiNMVHyfII506GNkP29X6+8fnBpkZ26hdp39p5Tsjlz5idAbho3SsJA5E9rEdL+N8/wBaRODeKcnbTJhv371JrQ5Ur4FaHJBJ07ieqKaJVSBw8j1AOUW18pkfSLerJZVrUx6oNh2raESyaNn3lIpHJykOVUnY+gcPNNmT5Em/+2Bnam6Cllnmu5Ekh3YDiheUxnChv96FUV6NMavexuPYz6PW7Ug7uLI7hHgcZjvvgm2ab7Qgdw2y/n89w1DZW11iaQT4nNi+1hDnUbrJayNqLir9yTW2nA8fU76K1DetmGn3rlTayJV9ASpFS0efhKFqCGCjgQPKVPkc6rWY8PL5OxLw6ujsTywOPvWcnWjWl/q+V2roqLbHCvIxPj1049QhS2iz/aHIUfoP8if1R0wtgy0W2QHPZrIJJTsUZsHhecD5NAUEWDs851Nn/WoHGGcjgqx0qzznWdh8xr+a6i2BUHJam2R4jou5l3uKGt3RpbKzKJLzp+kc3TOJfckDbGiezVm8T6Q/aFuabbcxKkKJMse0GTQNhFRNw5sBX2tv1XaI7rokccVhWcPd/euOGXdab4b2qRpACf5Ds/GwUf8AaJHHIKgNG1uVvG/mjVxTFJE2uP7Cfzrh7sRmqxIhaaudshXsGzjkIhCF+nYz4FCE9M7bJO4x/JYngOSDOjh+q5JtdzwdvI7vZPK3zYakIQlIQgQhCAnAhLoSZ0jm+5IUBUqzVQp5wBCTpQgJQJRJkpOnBercA4I6nXDBrkR76u9yTJwTehHgACEIXcAcNtShM6eEBOBfE3f2xX2vibv7YoH0j6WvuCJCEJwD8h1gWeTvh1x+SwLPJ3w64/JAcASd8OuPySlJ15J3w64/JA+EVu8bCmdCUB+e79CS/q4+w3pwTgtfXiK2v4j6RWDghYM9Do+EVnX2FwzyfPQ64pVJ8zDqiksnz0OuKVSfMw6opOv1B2jeISyd8OuPySlJszHp+ME45n1m/wCzsvQv1DtGoreAJ06Bye/yWKdvj1w+SnWkbG5VU2K1ta8RXrE0+ChUQg6d1Y85R6am4yAQTdSJ8iShyE4Vry1MKdXrr7O8P6KySLvX5M6mUQGsE7dHqh81nSdSEdUOsbAk6UJOk47s+IEIQgOIUTpPeKFuFSaNzUjR/wDJaeHmf70lRW16O0CSz0b5LltgbHD+2hmZmeQNIKw2+OvWmwOTHGTyLlsdN1c7NbQ5tI84SLY7cbjyrEzTpOMxBF9yRFWeoVX2lPd1fZ8PtD9HMo59WNcZwxeYW3s9VGNUk4ceHG+NxTO8QkkTtm7U0SZPPv73L2qCL9HzkK0XkjCS2MSPtCELsEI2Vod8FOiRmRStlwODNjvSQyd8PsQ2ts02dGRIxJevfuuROk+On3bvsSPBDX1r1iTIqyPkhP8AZ5hilb+2CyZ6HR8Ir2TJmz52HHiUXy646lmkhzs9IHJ2QnFXxDivvGmOA4hvShSrazYrV9jxjINU+FxVQDSOCGGEeo9cWJ9ZZMiLu2ObUKVtomNjfdFNrGai5Zom+j1ynSU6Hu7hxZyKT3cwDYhfXu+1df8ANfKcw77ZQCXzpPfcsEjl78y3BtneTTh8DiysUki6+z03CTQLPbv1gatJ3w64/JO+DnT+r7UjkyfHd4rZQ8/mZ+w8v3pIssJTAxrTHZ3A1rBSOf5LZMHJHDkEZ8X6ndcvG0OUbOdMQcK1eTJ5oeu7H+6ppnZ6/wBavxXE1wovr1qt8/AOTJZoxrtGzB2nB+KuHnjayr9XpFN0kPn79izSZ0MzuWZdKY9YeFUWa/n4TrrpkB0rOarOKprAiR/Sp92P6uBqguSUmVn89DZRNXYv0UWYUpJoCzGj6YGkYXRTDIxl+uCzp+kVO0Z2w1gacXKn9wm/78BR2nuXeMbYRia/1k3+AaVa1UjjSzZEgc6AhMBcbGEVyRtTqkt7cZ88g3FElbdjF1JtnqloZKWem93a8VB2GwIl+u9cbqlkuOknQgiQThWrUWYDHU3ph0HRyNWqjpwnkrTdQ+7fw4deGO72hs0IRqPk5V8uT94Rw8Tp3F8R1LYanpHwXcQQCHpjfxSxZBuLZTvzW9ajOm5gzEQ2vXjowOWxUs0CVTOqlwPehWDCtk97DE9vI9lF78q0s/qswTTd1UyJELy6YY764YesTejxF9OEb5M/0Q3Tm1xdZQ9Ht/8AlC6SAA9g8o7RsmyK8eXcbTVOUdZxZwO93eCbXIBiz337OOLsexqJsnoObazlB2ZRcJIuEp6OOMwYOAcYaIETdl6VJTlR2tOo7edAt0p7DsbvBVhIqrS2lGJiXBN7VE6x6E8Z8CfgM96U5FKl2I7D4TZBT5xDaK+nU6PSAWisIwyAnfHN92PI9qW+UhZK0aSneFwD7UGLbMaIZS4BfGPes8tP09pVyZCKPp10aihGEcIvA6serT2E27VHZ2+HOzRTgtQkuwuC27VtEFNppWeYwCnk0mdXDoVPkr8d4crDjbBm6rSz9ErmRzcnkZGywsVbvoilsmSgbP6QxRYtoJQ4OLe9gccOPte1fBc7H6kC6pf50gi7CsDZtgZ2vAfVVbr8oFay7tVptmdPDj7U1MHhSa0Q9oIVCgrQaknVUafC64sqfAtnUJ0UIKUtfbq71HJjnNWvHj/IMMbdWjtCPJBXIisdVZ0QyuTwB9panHEF9qKQAdcKILPxmO1xcB5CSGVIYdmMP/ckVUuWijJBDQ9lF6Va8c7695BClSyao7OWuowRnenRaqGMbMCWIdsGjyOpXEquZgzUkdQZf6HX9uH24DjDyOoz2ZBOdTkMbMXP08/oyECQIua6Qnnu7oSWSIN66fj3FSlTlcuzLTtQU1J4MI8KqYxi7RO3wvhGH3pG0FsVnVqMTmiQ2Vo2MBGN226IB3TCK+nEybUNRnPA4IosHUnigW9vUZd1Rla7Ou080ykOQ/r7sONO/fwGubF8oVRJRyTm8ufN9MT9k4WemPlVaYz+yicTiu2DNxKHflgqQZNFEyacbMO8SPKgmxf6uV8ZMnDh8vXyrEmmO5PlFcOHzZOQUZR01XUrcV2Hx9EiXIUa28TpODn8/SmeiXKc6sOIIkFCFYqfqv1pyeJPPHr7/FQlG0efStXkRqeeIIxF7FDXxBV9Hxyz1kdBsTnKcsV6yZqvY47dAggDKhyUX20uo51bs1QtghJQlxgZsFzhrax/wAk+WHTFlR5QfR0V34fpM51bdnIu1rlHb9Z68PjkdhwCvrh2uC0doZv6cLRGBlHJaNU+FMOFBZGjK5Hb535CfnLqyF5OcUgbTNGO4REAhShRXSQaY0Q9H/VSkz2mVfJnFGnN7Y2tbo6k3CNLIDsAHWlrlmWrye3+VnQvYdh8oXEq6FldgLbY80SLSLV5IrtXbsLjmenHz0dSHvRXvPStBXLckRbdU5BwTWO1KZEids/D3e8WTfV0vEGnyTgvSH5JzE7AqKzWKSqPbgautWneXXUrG05Zz9IH+9OnStXtCeHKQznN5EjjbnjQ/o/R43uoa3Ctak0o/HP5E8otzKhcYYafc4YhRu/uWnJskDMFFFYXAiBg6nHEJ3hWL2hSSEyprFeJuqlOGFKf58d/VuojeREFZOj15bTBbI9WLyjePOK6meZ79KzU3R77VU7ZpGEYcVgTHg70c3qSDGelaO2iuCCi3QsXHM9Ng9vGjVHFVVg71VOhGOyNfqbOD6Ob1Vd9rwSEidwusY/9kl0z/XGSqRqMX/xb0n7IOIbxTdHmeRwRasK9sO9HLT3h4cnydPIcJ/GykzrNxjrVVyV1SE2lsLDmW37IgRrLa/zenoxhSwIIw4yQ3jyCiyiuJhrZGClXKqp0j1RrxW2PBsPJwCeDX5npsOI9D8ZLF2ypDtTj/CrjG24jRLyvPH1LL++f6g7amup2hf0YzaHYaVzBFQT4lukRdkpsH6PJ96SNyqRyqqdiXDWLDibOD6Nb/qq0mdnp85SQ2s4bGHpCsJ5QnMz/AEirOtZ4s+VOxYtiosicv/8A7UHtNavnbN+QmHem6bnPkme4OE/CMInHDDtV/uonvKc3KpIZmQzs4OEYRIXQ/wBYe9FLW3J+NfNnI2QUTibOD6PTvStNzqjcojwhhGsTjhnOOr+jdSh5w4CyNeLUVJA2mQ2sW6Ru2f8A+NMbZRLPsc+qHDiohWx3/SBK6R5HRsWqzm2at550BCSypDGJzwuh/Nc+TDPCpyHp+n5BJTWHDAh4H1/3tdraHsCfaOsCp2mYSRWqp4lDvdRiQjfCOI7/AGKn9NFwM0YNvHyp+ddKE5P9mStK1+PCvdiL+tX5PQlWcTrvNsxMyvYWP84cQDZVbNWlYPoNnNQT3R/Idyb2mo6WOucqe6/dlaK2sIs6yVzsp8KSqrrwRhxpZl2j4uGYuVVHW0Szmws5zHs5piAloP5uB4TqbDH4GRzxjfu6EwsNuX6+Mjw4Q0UK7Nk+LuXGHrJ9yqd/aj2WkyXNBstS2T5ZC9Z1C9eFMcKezjXHcL+eaP6ylzkvO2mGpTJyyl7ZziqPjpE44b6wkf7Xvzp9cWJ9kODpIngun5sXOfGEYbuxYosTj4/xBXFcbdgPV1plB6hqcaKDUP68iLQZIQcqfbIxZ+cLEUtjOBh7/ssNl+atNlSMzm6Wg2RU0GNAakRXHHFcHA3N8YjQ1QVPMl5zmgWqUFDaoYqp54WEv3bJFdJ7d63punX6jxnj6Vz8A+e/vcsuaQzuWmlFs5QJnztzYerpUxp694zFpHWkWWlhg9bo51Nk/wDkH57rX354nV491ffExrqt9nm4OOtv+q/Yoams8l1kzyGjf64zq39sFHzXsOsfACfi2sVznvhdOHanFv8AbCvq34qkcmdOCnSCB5+rFfFaKbO2a8ajH0T5qhej2yDHWl6BkbduxZCWRNq1udL+/wCkyDA2uRrVO0g3kbUt8nSZNVSSHBvwrS6euM//AIVarOmyXX3QqH2LDJxgJd+1CFR1c16+IdmsxyN2587I4qtGR1CJ27gmduFnlIGdh3AHCLamd4nZ67MCl/JZg6qkzw547w1NhYpfHTPpGP1VOLkwyWqVId2+fi2EvWIZHU4t5HspSsaOcKN8G7g5jiSRrNVDz6JcmOkTpl6ByCT6bqQOf5HqBqFEay9ew/R/vSk0KzipImAjj4UtrdRsa0O4MOPjqvjbuj35IK2Vh1r8mlZ3gxV8CTKEL3f1iwc/8MoxdaMvEtDSMOTP4yfy9Y1TATs2iz29jzyg6E2HNjc7URPoer5Ijq2OwuBLEjC9c5bU7MniyWrzqPcOKiFY5oeN8XBuXXSjqQDBnAvFPmjOzEW17GYo2yr7MZNb2fSKnGHjp2iisdzaQH5VlW0L7Rib6OpQ9didGpn+gfqr6u7h3Y8BD7D0gpRekM9P6s8NyhRex+m8+5z9nuF3dC63WesGBZ5F/VzKh9gNKSfEYf5XrpYwh5iTIh03QvTPpkndfIbPnHDTVPeVJGiFTgreqm2zmg6prh4jcLT7FPNL+a/Nw5OLk+TjnB4nwLc3ZznvZhe6ECHBdbPyh1oMWqgGSzACMMTWpOMd7tccOBdf8oLj5JndW7rVofo32vVnAOrncU5xybAn1Cf54+7ASXQrBVQjjyzj54VlQhC14MLB2DcpwPR0INcpx3T0JChJ9T/aBwo8d0R2fPzfhCdCEJQG8OGf6PsQk6EBTrqB0MeJx0n7OZNaEIHeRknb9baH4+JW/tgvtfErf2wWJAbwoQhCAAQhCUBSjwAhCEDuPqTO6t3Wloe/s/FIEIAHhCT+pd+dKEBOBJp2+PXD5JSk07fHrh8kBQz9N+fUMCFnzMen4wXqcA8IrIuB5J89Dris0rf2wSJLZW/tggLEfS+4ZZNw867tUtOUA9A4gefeUol8wZ0fBLDJ04iTf8U1PEKrrICbWrPeS4+RQyZ85QhTwmdPC6r9Qhy3AN6JM6T9yTr2Tuh1R+acB31/qC6T56HXFKpPmYdUU3LLJ3yOtN6/UHNkrqFiBzz/AEfYidJ7xWCTuh1R+a8QH3Xa8LzN/Z+Cy56fmcPtfUsaEnHbbV+4J1nxkej4Inb49cPkn2m2HSs7DjbvhcvpZZFBLaHAeWbORlJEkTEkDDJnZjXCHVFKluVU0eZTs7DnyShSY8u9aTJ87+7+KRsnqL5HaG4d5iHkbdkdhlxkQhCVDih1gQhCB3R4hQa2h57n+SWTszIk89/SkeDnHTrvtipf/RzN0Fpe+GHxWC/N5buNX/FNDySZMNRtCgsG27WnJvbPILMRjJ4nHq/BSbZ+z0JPZ6weLR5FTiFaC/VEwIC5vcHD3n7FHIfme/Qp7nW9uJ1jkmxrRbZAYXg/mxMwXlCEEyXRSacIptoYhuWqTOch8h00+/hXHuw3e0NCiNPM/wA9wihtMkSA5/iIa1sVOUA+VEx1RVoE9sEbKLvNdtuwDjqhrwsU0sLPNdcftwouEFnnbcfo+5MOenSJ08ceehzRw5Ks2jVKJq4k40x3Y0xphjTjTGmPVxwrwE2kUZHYGG0+jGGSZOBvIGhrv517Omzp8d6a526PVD5pzpxifavqNrYGCRinN1KwQgae1jINkFHLmurp2z9QYHcjsORvQLG14Map0ggfjQm+7fFDk5Tp86eT61DbutZajpx3o+ozaYfwfKbSTtfTCKbsFn+Xdy7lxQqzdUTkG2+ihemHKNeSL2O8nsRI78/Tqjbmoh4fH52fRCZF+O9HYdFa2mVpaXPZPC90EK8H2zBNF0N6jjz87Dj3Qjctkcgw5GYgPPKv2e6EY6ky+RYtiugaqZdannyf2ecPNIhKUp5WQbF82Cul3aTTs5zIIZWt10qx6E22PEPeorXJM5YM9Do+EU5hNs6fy6+dLaN0Wy6jmnzgVxrOuuI3YBGn4OdDi/LHm3xSttaM+IaRn2uMBd0eRL1yWXRqLItuHd/r+cLzGFukTmvDugxeLbJBpl2qDeSn1urOr6XoWr6Jb5LZ4M1oTHS5ZoN0PEXcWMWja7+jFp8Md3c5ikUzn/IYjnpzCbo3JifMNrQQbuaFXSoch+X6q40r7q4YBzl41pKR+KDYaJJj6vf0Xp435/xAt0PuTYHu7fxT+n1bgGyHRrqlMRnD39n4pXNbZ0gucB7K54Izo7E2hbPOvIj089ycpxsmM7zG7pvSRbX67GnATaORaPmlNecWDslsZeK/rGlcMCKXTPhPICqTbv4oz5Lue7whCRGG+7g3a+pczMgqLs6P72MThS2OlRBzAuSIBJ8IxXShynYfdvWEtM8tIP70JFuVMdlLgX1Z8K/Gu6ox1+kPPLSl7kifmmxeSKQZUMqQez4AgjCE3cioWValQNNzW0+mqRIMjGmosjq0VOZ+Y3nT9VxMb7/j0rphlIUrJqKiSDxxyrrsDCIXs64bv2enmHYeQVAYTPw4irl0LxcbclvahyobmzYZM+FN/wCfd1CX6OJZH5Dnq3ObkGCuU0Y3Gwnm4S8XGB43Xj0jbXKdPlA0TFkGKhB9uxl+kD+eIqWh4N7lTsRPFEwg2xhw3LNOYcxtDOdhHTRenMZE+5aDXVoataL8acPaJtLtFV9TK23+rdvldMmfoC9+QrRMljrW1u0gieNdT7DIpW8yGrnVA7SG2o6qnvlYE3aMdqnPvM+j8Rf/ACXQGx9yNssyL6rrh/klO7naC5zzolg+kcPHZVzD8PJLVJdG8ie/FsO0QDu5SFVdjrLSF4z1y0y7jkR/cRJzmG/v/EZwWl7Tey0u/XIZFk56JfAcbJTcmSDTchwZ5+1F7EYH9IxU8ZIFByajtUa8RIKvExBxl/IqW2e56LxIg3z9p5r12RyOm6TQFmNplqFQSMLGnhTzjYe7M4ietJNyUibMeOUD84tyC/vhs8vVe2OSWojkURLqilJ0M5/nBzZt9d3G2HKPtUeBjrhqSc8Cz/V2/ZVGUmcHR1VNTgM1lbITIxgb57SniS/Pw7C+VhjmsrwsKnxMj9IN+IUb6RbXww4kme6FuniND/8A3SkltQ6MJGowC591Nwh7xePi2jNxEkMSWza3l+D5sLKpeJNRvxzuODhcWVxMFOVKtvPisV9qzSaWMz2zg4rFi3dC3thd5ILROZyGsXFQK1l4C+CnFK7OzpRtv/kJLatrKvro8rXYfJnMc/743ilngMJxBIcGsUoUXjYm+J6nCyxiaK3rSeAROFp9ruxocIb4quDZmdn41icVyq6WTTR+lX4HXf1qvL4VSi4h1IawyauT87uA2L8pFoO0ln7g/wA30h1npRnboZghoHFgLAWR0wUzztnkyOhRVOfmeh6Ve6wf58BGuk2Ke+PBfuw4ik+QbJfG2Q4Dz8WKWLju/wAV+bEsuqstRavoxgNVZZ8qdwNVc/8AF78yoTlLzm3Rs9vIkR7V0Ccp381zxyqfMHXcZL3qxdFvnFzo1/PULC0WI6+7W2ApNSuUTanZlKkNFL1FDQX9UPnlCK1avLbLVLTc+PVD4Lht2wg6PjHqTBoGDo21EfB6YhNFepmn+UD+tS/kvWSyrW7QJ3Bdw4E0NSkMa7x36QjdsYq2NJJWTbaDq7F2ietQ6ZsnLxrh199eoa7umJsi1s92S6JSK+IWiyS8mQOlhArX7QGoWFZFC46nGg7V4Pj+1Fe8rHlaP0khtOHvxdwu2a1bqvK3ktUmf4+GJjxNUmr0MOog3yqKodWynqNao454eIarvqvvKzxbcnLTN11vW4K47+SX37k06fZ66jJVrPFn9wkuyV9GQc6w6ceKhMnjgSOKC3GGa29uAH9qKMUY1TWDPSuOZ6Pn6WfuIvFSQh/8qW4WwWy6cnG0/Q7UTRNHXbYJdo9xqD60qyzpPfctXHpcb9ntJiamng/mG7SDpNq+eUbxNOc/b/8A4BmcjJxE6eQRPKxPxTCnEzdI6vvXra2GOhkhnbwSi3QviYfOswXTrXrwnS1hxTyKK2u2cNqmCm2BtpxtnvFYHFCCuwux02D6RcP/ALZYZOgbOZNxGFqGsolf7Rp1vUbGmGHGz3Bwn4skvjicmaTSw6a9c+ukcvRIfkI/XDijqmS3P5TqeEP79WBr5JkN40gVpYd+hwfRqYm0Mw6dh2+RddqSttbZx0nEET8I1w9c3rMY8eJ0Oz3CNcOW/wBIfW0YLPaeXrsWNqzlyFL21vqBuWW16weM8z0rs42Fdn71wz6Ob0242efOnkuBGLKLK2wxaqt8bWGT6QqCfhGv2P6RUrtt5LXFkQYolIyR6JSdAn1wLa5fzcOTCzmPk6HqjX648Gx8nN6lRoiZUU4GiKAB8l4q4x4/8VD1UZa22huVcQ0e3YWnqXE44Z6PbvrRXvKWPFVBgh+C9D4oRr9ceIeT3JwVyR6KyCJGzc+dXxCVQ6yUW02hdYxGx+321voE/sxbOweLPStstllMUPPFdXQuqAfCR3+jvfBRV35qOpG1pCnkPE8QQa7Xevz65EQkmfbXRw+rFCQnnLrxbDXlnz2xOtIVPUcaUJLFu0vgdWzrMmnGJWeXyzY1zKZE6ZzdM/T47vYJLLs5aVSZuIlHs9EvYEP2g5MdCWqVW6VOwWjC0+SXDBGNOA0hr6lSK3BhaKArWRRFPz4lwpRrACLd4+vkDq6FllljEc+Nlfi2tE1XSDTwdqLjHydiQO8VRi2VhMY7SKxbz5P08QcH0jkF4pSjRq9dOLk8kryZ12yCPJKcuT1equ717/sGs9B8vdEo8WYS7/XbMXIkXJkEe6Xc779KOl/PjdasDYxalwKXcIs9WCRfqQqAXQhQh8PzoAR5ow5lXLMzp/7DX07k8Nv8VivcuZXNcELGy8YpHOCcfdUacrDtZxmdhL15s4uLRzO22IZQhrS8GjFNgn61NBkd8MQWrxZQFkrZamzg1QQ5jNfgsPpsQs30dDr+1UPdafn2zxoN/HdBRHyn2SQHUQcI3uHiIQiH9t8e1TD+UlrB+o6wej6XZzcJ4VvsAXc0Hfh5CzHPIy0hdkAVithLnxSU3cMnH40x+IyLpdnnluyEVcmuN5WRTNrf3BT+hHmhKdrR1qepqiFvFxEBKcCP0hp8giHFVQu0ilTGMwioBsNoswriYP8Ak9iPVUw6SkusmQ3uGEDK9TeOX+KQG8OTUZ5Qji/USwzty1QW2ksx3SDk2tOUhPqZPzj3igtI+lNppKU1882yfsjEN0BpGZh0fGKepM6Txdw593ItvfqVDwfhRT3oEsrbA4+kW9acHu7fxXeBjXaLs+ApOSjVYtXUOOHTKYOcnxE4fVi+vkU2U2ZJkcYkYsUvjgfu/wD4lQ025nPYdwxOF+SllhlTR9nI+z0c4qYvUUdiwqLa0QoreUaB3cab0HOkTwJ+LYi/RBkP+6le8r2R6v2KR6X0cdOkMD/OwjG7Q2suMbsAR7UKmeqaRdqXfTWF2kQiSJyw1QcB/alHG8rTaPJjqvPZcaeulMPu4V93eNURttIwkgRBh6I5c5Si2eSjbkXZ0++CFQG4qhHYmMIY7/J/oXYGDdIcJBoBELxTBb748i/OuwToDmx5Y4bVyLvbYm/Tqjs4pY8jjWEngmfw94qyV+kDbTSJfI3IwLk1/T9vHH+fuFV6e7QaRbttcjEmTXcgwjGxmg/BUMhvIuxIhW666Ktc2yf5LTww4Yyf+C03KFtCnWV2N1hUzfDCvuF0JTkb9cCCNlVHyi8hc82RBv8ArCxiE+P5+ApN29eXVLEX+cWMOM+VNaRG1u2qqKhAnkwY2qHgtTl0NWHH3qv03zMnqSfPQ6PhFZ4+ZHX6RW9DNLbh2sOw9EgXINowMQ0hI4jBAVpk+e780Utcg5IJmHHn4pNCFYQ/M3W80o3yBQk6UJOkzPiPHnACy52PT/vKWKWszk1TTlQv/hSxtWgI3aIMO8oH/VVFeZh0fGK+EJRk5WUbNj70+PwpUObuBlotFs4cE5tYuco8SdT3XdE0Wx041nsBpJbnAUeJQcIqDEMXyMghtLenxph+f5BZeFny1lS3kmWy6zLn5AToQhLBFxllb+2C+0IQOuqqBCEIH2BCEIHwit3gQhCUBWBCEIAF4e/s/FKUmD39n4rzjHWgJwqQhCABvQs87fHrh8lgTgHpFYZ5O+HXH5Ik74dcfksCWyt/bBJx3S4E934D7QviVv7YL7QHBHgFAfnu/Qvc1J/z0EmQgdwo9S786b1sC19eI8QnDgs8nfDrj8lgj5kdZ5O+HXH5LgHRj2Pz3BSlEjl78ybpO+HXH5JxkcvfmQv1ByZra9EKEIQk4VBOpIpaqprJOBcNlxIpUjVfuUca58e+vvevJMmdnsQP9kb1zeM0HyKjdyJZas9JQcl5WY0E4WlWin124TXR14MOBPID/N4PBhqhC5Q5K39sFhz0en4QWUL8PuSKMjWkWzIwbkyJkDvcVxSFwyFHz3gFiTpQk6cQ0MgIQhAWBcH4jq6FJsmu52iND3bNdd03KLMx0/ajB4j586b3jJm+/WRPLVu+4beR/on0YcZ26PVD5r0OT8PsXk7dHqh81srPxuO7d69vXFVbUJByjUdulwz+OH/blc1yP237ycnKTJz2zT703rxHgFiyNWI2iS2ts9oOcCHSIjniuKbrlrTc4uLWXJd2icSK5iwxohYe6Kzzg5w8mBOHKwvRFNq4It8aKFrziVfYOMvXX5MSZA5Q089yZ7wQO5ut0NsdzdyRyZuu/l590VPlK21vgNk73ZiPTmLHKFugaCDpDR6gVNkU8eLqumz9qVHVm5GQ/TT3ezD2Buh1laokcLnCoMzAzpHx3py49On4iemjz639ipdoNY6odnCqGxqJp8WJzQ0m+kH672VKJVyhHN9pdd9KcK141w6vXX3ca7hNYxWqG5xy2XhDG0aNxgOl8VhcVtmBu0is06EkefPiPxbFdTjhlu1n1k1a2jY7wQZNLQE1xvjcmCpKbfqOeIU/UDUU0umK9dTZ5TjV5M7BByXaaF5aWcStlzDTYG+XWdPL2wlDMwPF7trFwRnJFeaSiPOjdEq8QqO/WpTtlsanWOyqW/WkV18KxsbC/lUKSZOr1rC3LhFScZPMyTEefOkf8Nw6wN30m2ZF4IORjliJxHqnInhoeJ0mdEgcEUqOFuLxoOkG5M7xo0edHR/FlhDcogzpBG/k386XVRQXZYasSVGSkW8v565GYuTn5277Vv1mzRS7nUwoNaORLDTkODtBIfC/Mhwo3aoRjyLWizJz4ZOcCMKGUWVdet6facYmqm2x3Ae8U5uwsiBbPfC4HEcqZJVWhmRI9wcyaq/IxJTHD18MKe8PsdDouKbdnNyw2VZ4Mabmj0mORoS7AjYuO339HKteDzEiTPgTC7Zd8L0SSJMYQxEIQJw3Jyp9pxo0oYaSTJ2Vqa9OPAe7Zx719UpSJY0o4UNgSmGNfcJUiiigjgOpOQG3Yez6uHfMDXu1T4ETk2ccT+9W1qqdOkBz4Ddq1OwCj2ih7G6QAb5GEg7NkHsuHvDhC/8AFN1qjzPBbXQgd6GaRGobG4w67b/dRe/Kvz6mX3yivt7IIejOrX78PtH5y3St8r9Ibxdv21BywtmtfqOo5w4AxzpBsE1at6qk8QMHxBEd8NhMgCpetM0F4UziKZxIjHs/HYXQxPUo+qTQ/iBmfFYXxGMx3tC3nabSOi45s3j0NWmoX4cK7/WNvq25BsbS/oomRPKIlzM6RP2eEI85nKpTDDiQJPGHBKMcy33AhmBAeT8OR6rjO+5Zn6lXFqZ2N4wMMM6l44Qw718lS1kpP9SHWysdAM8hs0YW6EPdSGX6QuHkCJxuae2eCWnm1SnogXxeDiKNkf8A9O1lnD4/T6Ishbxbiw2LWfNVhEKQbHbRVCQZDMZdo1vuEXIwN4bR2E5vcMLhS9u2H0i3roXl61VZnVcqTIYAoGWiU+6YGone66MOdcuczNnh4jZVAtFrNCLtYkg3anTcrUzGz9s+PH2V409XcMlvJJ3CVbLtyF55Ex/+ryBt9KvGHnSSG+RtQhWxmYBdZq9d59kmQjPi8SIhulbQkA3fSOJJ2oz71yxoKm3ggxqhoorayl0H/KMV3JNkWV2LkRFaYCUvPrio4/8AcxEj0iKu3723IfIXWKH1x/8Ay99PtHVF5IMYhGq+YiZzGMX9wUcqSiWGeHI0OdonRTXIOLxp/pD6qol0aZInyByNk+aYZLyYdmMTPv2XAxvTnjZxGY+rbHfvVmQEvETVNegoG26ZeJlJHbmEbsyfhIYTi3BPFHYE+P8AJPzPKCdZM8gieVilocmqjajk6PJkcUFW7Ns7DmSPEa/EKRrIKcXHpRqnR88t56si3iTm8leFXxhybQt0Y+1ci6wZOlJ0iQ20i4U02EiuYrZ+sRZkPzcdPu5em+9c/qbbPDCqoQbwRRRS94gWtvAXZOw2jpNN0sCBh4x1XRWctONw0Sg0EKnMRTwe7Df3/moftMki0t23vITE5tYcRrlvVsFR9h/gvDjVoDpIY4/V5G1mff8AFSFkWV54b2BUsNn+CW50mLPpUzn8n6lzry7rQptSWvxpcefc12ftkiPWQRtRn2XKSfyc1bSWqsK+oAiP9IR9OB/w6rKR0fajQSSTqn5zrNp/cPShN/uwFQPbW1GjFFf/AP2B1dMk/D7FWK2xhpae2yCKmOgI2ePuwV8HBWjc8z3+5VXt4bJztTezyMX9kVTVl0zTSNNZk5Qidh77ibYnycocVX6TJkOJ0JE8mImK16r712RyXLN/0ZWNMg5Ei59qvP1TUfPiSP71ywqltmxcpEXDZIRGwV8F3pPDhPAGGh7Jr5ILRunefWrDxURT0R6nOf15MKU9tN+PwGhf0k5fXx8axY9vMKC271IG1yHR4eNjbBIdePXLa1O3Fyr+nAqYwOEa2p0nmic3uWKUsZVtrU602tZ7RT9xVC0q6YEUP28kfjhXYqUuee7/AHK59FVkpM4FrIzCfO9MhfB/ngKZl5KRhbe8ktyZOSNWnTu+9M86T33Jxn8nfnW+WbyXifVWGbwRS9ln4wx79HN4/tZas26kU12fn3oxRkZGqyksix5XLMIrbWBzqNy0e3x+uGfRzetwNcmelW2ez0vxqHpipd39l92W01G5NrG2zqYpjUL648X3uJ//ANsotneej1wVYFtZGFaHf/1w/a8H1A5vFkYRbYEDlOp2jf8AtkGqG/j96fmdn2PwheJ+Ea+j0i4fVU/SW1tag5DxVF+1+h6bWrPDyY+OU8hxkXeyB7ot6p+Sjo63XZ5aW5bk/okP+9cItTqEcXIROTljp3sgvqYawyZM46dhx5GMKL6daJIc4jdxX2xLJzlh5OGb/wCaYapO3qx5a7FjETP/ABn+oOYeJMG1j2jZXZ0hyfRyfmGmzKqz1Q1BPg0sLTxww36Q91F96Qz0eGOH4QVhPKEYfUw/pCoPqqYaqrYyo8w3jSNEsIkNjZwfRyshaYRjI8m3I6lt0kmZemf6a4cEWaKKW0PuX4CjcHiqpLrJ8H6fkaJpcTiX+sPeiktDDktQcHhwuxRfocSP/ek2UHObQXcF4d5F7WIVrWyWkPDadUc8hnkCiC4XfuVtW4tqGhHz/wBIcufOHPml4la5F1i7SRQqRUv+8Xd/J20S8VHaxUdXzgoFMVPsNxRl1+0kd4qaq9bmGTaBLAtNwdP0M08GJsGgI+MH+MZ/OGrj5HFm7PQOTtRPCZ+M1swj1s7mX7yXgTFx79CppbDY/akbaae4jtcH+BZIBuNOjd1irO8ddTO6r+k3bh1qUsuQhu3u3Y06qV31392A07+j9IwaFHES/eZOZ6fbzjY8rOqZBtb0rRFMACiUdRLXIe4hgx0fqIvuXzaa3Ntf2CstqrRTxESqeInsrsUdG7hwG1wiV1filOVcwPAM6Q4AA4QZ2jjXiIXKRhds+5QBQ2UBXNmrEawME5rLYiY3lCPQcTow7YRTtAwz55aES/telNa2NjhU+GfH0mOGO+u+vtF+QUasvYUUvaZykVbcvp/9QROE+3fQjXz34BP0rGT4aX0UU1YTVsQGAbltodqM040fD2d2UYooq6H6jRu7V2XHpLh1hZXEGrW9qgU7sf8AhRB4N2B59ffcni9dIbiz1Wq7+MpTXG/bb+rqw+Icrk0mu9HaTN9LNtcmf6Y5DsxdOsVptLXHC4Wnmza9d0D3HvBLcpy0gvKEbZNEOE4VpjTxWNDN3N0SfXBVv7pZBVDJbrZq3jMopY1VCyDXm7b2/gj3Qi8FfCMFU+06pKEoivHxvJrAUobTs88MulvKPxXVira83JtpVY+dZNChymPvwznqSoYZGY0YXSsdxeaxfR9I58nIMKZ1HSr9S07DVA1FNP17WkYZmOnSW9w5eJmb1aypbcbLCKEdWhoZHOt6ndRdTvVIAmwfVVUGRy9+ZTWFlF3EhVwyph/gOPz3vqCt63Zw7C05LaW4lSj3c2nHKQORIxbWXHbBPSDceOs1YUh4OTpDw37XS7txMz0hBv8AdSk2sLwHmdH1BtbZ7YF5QcW9WhstZ2isTCLMKvnimNdQC7G7+wEeplCKbTL7yTTyvRP0fT+p+feJLbcMzum2HLCp+cR5aXjR+h/yxUYOV5jEfGKlphnSYZhvcOK7wzI7m8hInekHakHw1gfwihXJqKwUIw5Uokyeff3uUkVeISDJMzWvNV30r+Im2j621mPEmTIJNbQzcZIHv+5XEf7N51qVlkghvkYqu6JFxwcLtR7f7L2qDrDzWiqX6RQD/srmXsVNu5vL7qV35F0/s+o9xpxygSTC/wBRMDWbNJ11LQ7xEtObdIYHJ9P/ACrwFtX3pB8lUbbPyFCcouccorN2dyPqQEcDEmFcggPr67z0Ewwo6lWqn4fRLX1dSq3ZhYyxWcWm1efGOLKLKx1Ohx14DEK22e14feV650qjtLl7p3i9RQY0wbELQ/59nD/QVLpfvpG75FFvE15shQ8Nsnm7Vy5/KJ2kYipqPswb59/g+LPqh2jv2iffg/muq7dHDD8In/Rv1b1+cW1muzLTLR6wrcieV+sD8Rg/9nD7KGumgC3PLt71lFyc20Lj++fdT3YZg3aLYir24du/8NyxGC9z0Oj4RSZKFvga2Fb0IQlA/L8J0JQhKNf6gn1HrAk6EoTgE4ToQhATgQhCADJnpv8Aor3Ox6f95YkIAFCEnShAAJQhCA4oo7PQJ0IQlA8AhCUeN73oAE6EIQAKJHL35kfsu/Mk6EA13MhQhH7LvzISgOAEoSdCADPno9PwglKx+M73LGlAXIrLBQhCEnDkHVnkhujk1DuBGEFLdJAJhitjlNWfWB0B4EfoZqkSoHQsbytAE/SN+5VTDbc/J7wTOHJzE7t1Q3KISUK8fzzWRbyByJIZ86XzamfDj7A8ooqsUUeZKdRbonC2dvj1w+SJO+HXH5LAhScI0uIWyt/bBOa19OCFkQ4s1h957MSYd+VI8ZI/zEftSqduj1Q+akKkKEMqicaMPPGhooaeaZjvZx0jevWUehtTrgHiNgZyVkSRMTQaJfO9nShfM7Z50MT7Vy8iWYKRz/JdB6iz54NqPFd7knS7VIM60B4R4jDI5e/MnBN5hvrEexSxaBZm8WW+Cw7xUNH1B4VsUh6DDZX3H4C7lJ6EheyzJq9QjnKnOr9Ans4/AeIqtEVToN/REEcyTPgly+ZzcXIzBBEkoQXk17ulI/HSNUJHQu1K0rwDlqlh5J3Q6o/NLpO+HXH5JAl8nfDrj8l1V4hxR4Cx2TtYdJtvrCe0PD54PCiC7uWK0m1miYWZ2jvdEN7r4QitRN+MUcBPxmexDee6CFXbwT08GvE2fOkEk7sLgbweRQtGNnkLkUkHDrOxOnkK3ydA/fiJBGo02s76jvzb6gcjG2TEPED4rjXUtVz/AEfYngN3Mwk8e6GFxXbzrYn2m2IFip49oehXVydRbndovvwCc6uCtVk2znHnDbuPdjv3buHX99RMJFZJ8lt8ETshzku9YV8G10OztWlvB8WeaIICD5Rh9aTPRUmlQakn+H7U5lte0Q0QEdgHHELLQtoFXWXVHPqakTYNbmW2Tw9YF8MPP3LV89OInTyCOTlTXRi9zOo7AqbQ5eQYh66zOevO92Hx37w2o1VfO9olvSB+DqRyZIOg7RPwgrqLoQyEdcXAdNwbbPzM8jA6r0inBzt/ItkbqjcQQzgG82AozqLgi0uVQq3odwwIXWnw/PwEjRR2iR8/HjFTmMcYyNKNjXdtuLM1t8VnnZmfO2nsvTi5NrdIaAXBvNxbn62JzptDnN0gQ7EYrEx4pr1pFRddxWrrHdwwww94nkaizhMjDkicbDsomo7CXk0lvkCuzE6cbaYa4wSS3G2CdbHVXhOQ1aJ2XAiBx3Ku06d478ILMZ4+Tff8U2ls23G9x/Kdsh59UuSpu/8ANPsDOiu08oOZZAhdpy5MwmynGgOiW2mbQ61a2KvqZf4Tgg6S03efC/1vmioxkzvHT4t8jjfqfu6RtuajO2if6pelmZjInT929fTWOXarrunKmsVU3ddKYUrWpaULjWlK0pXCtaUpU2FMd1KUo525ELIUTfU4f6DCZnpG0RkXbV1pHJMnZ7mv1R6U/TpM7M4bX1LNJbZOZxGu7n5U6a9LuEv+Tciu88wCwOE4ed5gXqOjerGUrk6V3XFBQrJnNHxeeiKHTp0NvhC+7XFRFRNC2m1u4gj0hSz466pERDI8LRzcro0hkmW2zpoLhV1ogtFYMrVAA8p+cFUd/wB5M4ShEW0mkg4pvrmprK4d2FN/4+oJLq0gxVvR1G/lIrZT6Zc4oLObYSDIAEketYExWlsyybrfXfSbSM0wophfhsFUTw9xhxe67V8ftV62Ggsmmyt4kPDfJGdqnL20N4NOLqBxip5pV5fqjMBP0G5tLZDkN3qp7v01SLlplhGWRLL03BOvdhq0/UKHu/8ASCkdkI3tNhzfiVG+ucnDhyB+8FR+2OrqLZX0k+tWUl/YxWufcLGH50Ia+ZXaf53tM/CCwhyLkhlH1hCop8lnACwhN8+8wLc/KrNFMP5dlstc2HbOTdh68d1fhw4iB6FLbVuK4u1q+0YVPc7RXwKl3ukgJwng06vmMhE6PlGF9160eTt04cbUmt4zI87acVhcVtkPpGC1CTVRgJkjDz92w8f9XW/WEK3aoqeTk8Md9fXXh+A0HdV6xNrzh27/ANGfpFD8Y/PE/MRInuhbW08UDhviMrr5AjOGDJtptwcPols8FWgs2OtUJnV5Oap1R7OK7ef2z6O2j1pXSrt+bbAclKgbL28EppfbQhZ9U1HCGuO0b71AtJyTt7EN7RYJ5NtUIT9wnOKfd9ozHekuldGpQQfm1fKzZ+wcV10w5OtR1ETeLEp2dJ7Hg4xujHEF+qqJn5oMsztIAi8Ai6KiVfg1H0l+eJ7xPeBp5WlBCsdjN1y8d6kqquHjHvBxLsTD4KTKK7PVs3YbkluQI3PaQYmUg0UG6Km2s1s6BuxkFtMmkydVVqlHN5E/CNhb7PfcHzqKste0H9JuUTW+H1tdPFeCrR06P3q5eQiwMLXJqKv3dru8FGEg4MzdFct62qTw4rB8qeLUM0+ELoQ+YMH3hU7fSqMreyyDfkahMhPr5z56/gItPPFV0SbQcx1MpP73LDCHJ+P2p5k74dcfkt6rAOipEmnfBCeSWTovyvjvaOlN1NyQ9Lg6YkYtrxO2CfSOHVrWrbi0VQjnAMEjDq+VyQOuT6ROUU2cgcg5M6RqhDo6VJzP5mKRwkiT3E4kCRDRkCccIH7upYbaExxbIAA6NhRTq143j/o/3VTaTlUGyKdXW4a70WWSsi717c5dWTtixmTGzwOqSQP7YuwsoxnoCjnWoHifhGKnmGecWZui3jjiKiuTHZ6I1RHIPOwj5dIg0tEfR54+rGKR8uutYUrZABRA8dptBc5AG/1cdYd0iOPltpBbwLA3TMQlfxr8Pt3CKaS9deF+oRKHbyFHJcx3n1FUdQv7/IJKJqso43XykHrdrBKpMoe3WzuoLtl07IpYzl2dw2VRO0PBbI4hHjwvJaipBwcLr9oSt2d3GoXY1/4OpzJJg9lwBA1QIhqWtJOE21kvb1CFTaqIZPZ1Uwpw+0aLl4lo+tLyE3H6ZTOXsWtuU4McOf4iPNdzpZTb+21VSFOVQzz8W11CwyHwPmwxCYql8zP61+aTKtDK6hcYCSwQWwHKK2ylZILydr3q+lnlvNB1RQYMH+qGynXwQXQjuIYf6PIkbLFURyjzMwZs2+PPBUnfp2fnXk3dS2Klo8R0i2ywq+WMRVPomGulbK+XtmsF3y2TIGYtobouLmPF0FKFFhPCEL5T/elDT8Hq6Ou+KkIyctDeJ3n4x+2K1HGIL0pSla4iCaUlonySfZyZFPEG1opt4rB9BYGiTi3N1J1xjDcpZqNyYaVaPAmmJ+KGEhjajqO/yjUDj/4ZThStm86yawrw/cJGFru1UXA05fr0ez//AHP3qpzkGZPMw48goskvWGIEBu51FoV8yu2SXkdZ5ogbIT11pur8K7vbSvqFYw8OrB26aW/rLn+4QaHOkzp87X63zLZHJtbaAwLg8yBXaqL8aHTf0c3/AFtbg/zm6yqTo+8V2rwvnhpBup8f/wASq0uRhhxk9wcJ+LdCytsN3qEaQL7aYbAxIU9fF4BCFmTSEr5xy3v9xELHNycXwwhweDsWV64YpNDsndzrP/0nuB4ughHPQmCuvcYwgog/bfvLcA36tnUKRR47o6Fi4rAh02qHtyRY1kDPptEzlTN7c4SM1o6izmssQx86ZsmQ3bGq4yd6vrUqBsDbZzIkPFYg4uqPU6O5W/8A2qtwms7PYeFDH4WorTy9eE+jqP8ArX+s1AJrkYcZPcHAjFuhfHDN1ycll0YVUjhfnnvZL2Egr1KUJ+sEzufD4AsfqkeKjNxDhP8Aqgd3o8a9EltkyJOkHDivKsOZkteYJIvxXsfKsOenETokLui01Mj5WuXnnp+XqvB9cRpZargOUkydPnYi+5SPZzTgdX2gUTSDubEVrqusAaWML5QMRsqjOTvh1x+SkGyuUY62m0A0N92lHWqAAhI+8KwWrxasMpty+Cp6dM/V/oO8Yj/SCOHiKP0t1uz0fZVQbXTLc9E2fMbVDA0i734+IBGu75ql5loVvw7O9ks9plBlFFC8cN1Q/hVeS3IOm3ag3Vgq8gUTFjbIYd6gQuWpmRz4VOQLgz1HimLW+O7vHU3N46o7RuWCeMFnNyLlJyukqlraccfbjXrxqJxa0ctK61ducu05u2Ll2S+Els+TE+U/U7qMW+wFPBDqOHlBcuJ0mcPOnjkaryt3IrY2N24vFAwjRzfJFhR2JnsgYn0ieSqsvEmcO5HeIK2sog66N+pXnYERIwk9Kt1iFI1WPRVIvxx/D84j9CNH1q3DaCzthLZdnObOXIM1N+mASL/Wh/8Ava6OZOmURUL/AGgyrOKlmiQa3ZinhtF3KSPvXONhk+f+q671sbE/eCtU0hVGZ9FVOAd0w2pPF/2qzuiNcoLEzq0JzVeuhxOb0tWOm7Dd1fk5zKbIbwDqhlvV48WO5NVRVBTEjyoULIpWBd3o8c/lX5nczmA5Fy/YTatZuw2t2V1FRD/ra6hbMDi+UAj1MpflCtZsmq+x6tnuz+uJF7m0k3hmfR1QDepFCqgtA8nGrN3sdk8+5VS+vgPyluTWropuPmydIRl47/RS5J5HL35kskyc/wBnxWpoJHvEO9AiFkmcpasyreVTjiCO7jklsUfYvSLf70KolkcvfmW4NknEZjmv138qshdki/jdmfiYWUtIspwj+KWyKDoVlcB0e+EWeV9T1TtlQVM/jYF2ix7uEPI1hld+dVEkwv1R54/JMLbJw+/etpDk/D7FEbdt35JwyMNVcy+THKfhuxrWlPZSm72U3jXdiRGLTcHgOT8PsXbPJ0tHmWpUGO6n3QqdpJ0JUcOpcS5PJ1feuimQeYXIqusG+/ZXZikHGw37RdFU/pzhkXtpmkN2tbcovsrWmNPf99KB3002sk9sLb6ekRF2LQ3Z3ZHljGaZAsdKiz9r3uDet4pUOdg5ESJ8CyoJsrxtz7zTm6GFFI3LdmGTmJMOf+Sx27dI0hEq1pvGRllkqxyDfII7yka2/RzYRaI/jz8KVoHBBx94I2RfnmnePkyOkVda/wAo/UpkikbO6PH+lX2e9mR3XaP1rkdK39sFrf8ARugqM7OUmfnHKv8AcJu/mNCaHI2iEGq+/bDEhCFosXOK7oQhKB+Y4EIQgAFuNUUXVFBTmQepmskXT7HIemi6O4efxMrrWnJ6d6kfqjnSNMHFOuE2IPHH+roW26jhDZ1Cant7vZhh3faOv9H7I52jNtPI1WToDXUIQngMQEIQgAUIWwOVNmAtzU4EnDF6W9UC1OMVq65orUccAqeM3jFbZ3BMimUhwJTJ3Q6o/NJkoXQfI9k7odUfmvEoSdeo8Ao1OoApnsPshMtnrtsokd1FaSSiiI4w3eogSxtc3JqMxLfPJEK3pnuBk9eslKRymrVqXkH6eRTvC1kszQdkq4JnTE45Sln1FWWWjm0RRDoU6C0+JgjC774YhQEsxhhjrOxDjPK73pCvLeZPWEYhHyC+sVTKTl/tPWPJJZF89Ou3IBCUJOpAOS3ECEIQOAUISdKEoC3W1AhCED7GeTvh1x+SzSt/bBYZO+HXH5LAgd0VtnqFsrf2wX2hCA5I8Auz2Y3fzR7xrSPCTe8Etk7RJxCThajJLV83yAnb49cPksCzzt8euHyWBA+gIQhABnDz3Tu7VsYblOBnTyB5xQvZqSOdHlzBXUsK4recbqiXRGDGose0UUGaxGn41sjAUbihp17gf1qD3JtktTlP168Vzpxba2cgA8Pn9XzTC5BuTrOxBEgravXDt8EwRbN22eLeUF+b/wBBc99XJZs3brD5NMPPfqhKk6UJOn0U8y9F+e4OWZnT96mTw7peRYhPsxIoIbwm07jfDm6GPjr3qIWzPETvxW1OTFJCZ5DxpUUvauJx3N6j82wZSKrVtIY82oQ5MK1py/Xhxp6q7vUJiyg1nrNaWoTsmzB8ca6ql6aKXph4nYtsooXBNOBA3xuS5zeA3Wa1EaLFFwcR8YtJZ5+lZ0/iusX17Wt7kzWIenCG/A3Puk9Zn0fh03qMmUfROjVDdjjyPp1xrWvt4i1LRRW8nnQQU/o4/j+gNcfp8mfOxGZhrWk/te/Ot7i4h6OOHIB2rFXYuG6K0udJnfb2p6ZVrqat6hhu+qz155WbjY6QbW6e44d3Ni1DYXjl6WPzEWFOj4lzFFKFxrRA2N+PH9qWnyTPj8FsmmDDsziDSi+X+HXBZB7tu00U3dwIF3B+SPJOTnRnkyYD36+vVrT6HNkwk6PzAuJxPHIblrKUTvET5A8cLC+HHAd64rUo4E2ZvNhp0ABts4j8EsDk4cyRiJGy4rtT8zhZgOe4bL186d5OjTXHb5BRd39SA3wSNd7Wms3bhL421Wfk5m+z5FQkeJIc+dP0fisLhdWOQ201NOz/AI/1XHqRmGyG1msNVI2d1g6jFw2Qs4HR8P8A46n+nMifKDP2hwnUbSkOY59j/wDwFBpK/wC1oRCqD2TRJWn08x/5hbI3do9YvKPpZyXWil8lsnxknYfFQ5NawT2eM+dPxE+7rXUJoyCm0fxDvbPfG/bA2Nhgt3bcmnJNpwMgh5iTVZQnHDHx+vu/9goS809WkhXBhRVb6iX/AMmFBAp3S9oxQaEbsMzkcYpMkMe+H4LdmFneHyTDR7G/O31FhLcL11hbX7JjpXXQ9iwrq+wJwODBpLyjBFU28Wy044jj09YSK1tfOafqcFyW0wzj5fZmEPkr2doXTSEQh76nNaTyVDl/e5AoHS2S9bjVM7yPQLm03euPn6vx+CtPTmQhWM8OR4XVvTFKR5IAsWn1JrzXmUJV7JGoR3uhrKxoQ2wN6Og4cIFQpJqazmomPS1pFur+7PgkCMZTwESvzT48wsL71EHl46RJ3EqDlJDJWhDFboncKUx+JffwDxGzGl17U3koibblZD6outOLCtGSLYDQ8mQ8VQ+OlQaJ45pw+9u1rWg68yOqOnyR6ApUSoXzFTzQ4gsRb/HEKHqwt9syfJNL0wLRL4/jU/sQePNEAhDP9q0ep7Zq5pkkFiZafpmlp7EJjixAQhTr4dG5MsdaN4ThqFuRw4OqfGuQ61ESYU9VMa16urdjQOMPou0pXDXC7XinL7OtydwvM3WjW013nvBuz0SkWsUW6Bj84Qhf2Kn59SASKulk2p20EVW3xco4lnpj0ZGRyfnXciht+qWpD2iLu8Vu/ur7UEbjGiljvJwA3vQS+6FsWqOvWp/qRu4HDGa2EmIRg3B4N9YG3XcWE6b9Xan+HsuJt5Fd/MuE0EehTISuPdjrT41rv4YUoJhbuhC3rPRPLTzwpEuh0fZ84cTJaRblZ7TlagkWQU41litQuxvB0fWFdXJctUtHtZk1fVtXyRhWGGYBpsQIHARuhDbCox77lViyzI7qqowwXB/Y4sA2lNshVMBNI4f3UORqXSFgZQrP6WCYc8Lh2oXXgQNHt6rTSPJWMnFpwNv12l7Tk1VMfOfDdXjw34b6dwrfSw8sFjbxLbtvKs9JyNb0g22hvzQBTbppc2Amyz8J0LhbaQ/GEPE/boRwnwgrlZR1tjcfnmhpnYkpqI2V2vwEIdq5wPBt+f8A/wCZW9oNsp3DRx5F/jy+8TbRNbjuybdWlX/pDjDP0bPxw5871XXt+twIUDv8mdi8Pf60pUkzpx07DjyCsV7ICBrWn1rJcdJT3CfuxW2fR7itLsq6hc6FBSemR4jcUH5Wbk6BhI+T7ZMZa1bLTlMOBwoo1PC6cqOGA14cdbHlK2g03azaRW7v4ROZYrSToOkQ4Aerjb1OQWksmfJlnvDhPwlrFu8dZh3pBgb/AOWtcxHKdxgnPlF9MFSrGRpIzzm91/1JDOil9mtU+O73Ch3jxKKR2ZAhT583SGxycYxtshxb3wXysLPBMDC9I4ZZqJnGDvEjR8/CYvYetRtjIdPwV0rArIG2uLQqcHZ6xa8K1NfhU8QNhfGKVQd1M1kTy1eQ2RKEkOk8XkUdnPkyGIfpjpjaQzMVgWRzWIwF210dIpaEIR9YeC8IuBIYcmeFy711zy8K2ku2TVQI+1CE1XXUHzdrw7euSWocPkjfFVRZaKm2OpGbJnUrVU2f63N/+2EbxZb+seL+Q3yiXINjfgXBwkYsbduW9mSvDh9n6Ik4QUuF4aicOTiJ0PnuW9sDlOYzNnn4X7b1rKNjtQiTZ/S5RI7Jl9eiSClif0SdbObxjdgw50idhiN3MpUo9nMdTJA7fiuxaHJz3jyCMViS9RnIra5OtK6dfpA+YhGPTrTDdMx5LiVn1ewUbMgdVb0QtLU9GQo6b5N9NmMdBNQ7jPxcBOKRvXNHK/tU8OLbDhwNrYrPv1WEh9H6R9c79C6uWq1UHY7ZBWFXjcap9hjonpIu/uX55fGwkxjGeUXdDXH3hZq0HxFbjup/ejkm4vILj4z9fupux9oprRxRaUud5ddPEYweMZ/3vm5VsbtOYpE6RoAhzMFLbNqxu/ELQFk4viOXnWq12PPpm1n59Y04zuR5iO++RbUkKjydqIGJhcTSmfpY3+A1KdH6T1/NUO/Jv1HOOpC0ZgIjC9oqeQ9h/wDWAivs/wDL2/cvzfviN8k6Q5KP6tcY38fLGD7pZ7FNuEPpDlzbdSVUVQ7ENVMtjm/uUIY8UYSP5sIQ574rnm5Z2Rn8TuxS6hW21PUNIlHO1IuUGtyiLgYlRhfD4LmG5Z6fiMRrKL24xbG0SrPnEXg5y7LgTJ48ev3cMBtHR8s7cWnivl1eXk+MaSZJ8+sFIU3Jri0ej6I2qPhXVADJz7Pi9tWcyd59YLOa1jZ1anRNf5kosWlKmkPZcYevj+uK35fynS33VYamLrVnye3AURpAeNNci3r6PMO8Nu9hjbW7OCABIwmimyQE0f1cAOOuRNtYcjJ1mT2+E8Uu1l3G2LmpBu1/9pXW21vK5smpCzE+v6YrCma1JMFvpxpBcIR0gQQvznVI/VJWL86VhU5xTs+1AVjjDDtVyynodaXlIxSzd6cyMenXDfSuNa+/q792+tfVUVL8qZyDg/JOfmz+i+gNKcjDDTJ7gRPxZJZW2GHLWk/zt8euHyTAkV6dr6wrxDrCwNtMdTJDe3yIFlFlXCB7lcVyaG3JnYcOREUy212F1Xa4WZDxh/8AMlDNild03Z1UZ9TvAOKdBWsjwbM5AHD1MpatUj9JfHKe8EzynZ0dSsdjDt6VWuzi2jE8o4eJ4ff6vZ9+Ptxf0XiMU02hD9ZP0foDT504x2MnkEz4mFFlXmGLNnpQMYwHTdno9PwgsCiflfUK7Q3/AFj9qcNAFnkzu+5YFnz0en4QXaIea/iE6/UHiTvh1x+Su5+T+s+jaLlN0s4ka2uzzP1SXq18ypF+3n9+WC7g/kr2Ft/RzXzwPcI6F1jICM+rj3fzUgu6S8lWs9bl68324J4+7iFsN6faPALpZSNeWZUcz3Vvc7FFw8j0fv0+oEqM2trdrJ2Xg2U0IKwNb+5T2V44MTbowG1wv1dS2jKcsBeLTn5qqhndcJhBcDr1xgtoebR2fJrsws0piA5JkTBB2KJl18QCYQ1FRUAhE49jCxSlt1q5ljqdA9a6sm7upWlK+rHH7hqfRx8mGMJG/JMm0zx1M+U/QIOcgNMSZNRVq0t87hOngWwHRiVGFwBxIBXLDnWivFLVFCdnyAicMULjsXtbg3fBb00vlU2X1y+HyB4lXlHB3HRxwD9n43w3a4LXW4xorGrztLOtTtIxZU/S4YR90G9aiYrTLZY7itdY21ZD58N/r3dW/wDkNdSN1JQqOzzqxdXyMpxL2TvTtnxri+Rr6oWJhH4izwgfo6MSCOvvrWi2s2WGUAwupThCJTELU8AhHeJ90Yc18F0NyZbDLLCaDjU0Kei6FllT4417ucOFBUVtlpS0VzeWyxokdzdGIWsp4dPcK7Xhoc8ehV5A3hWU0gPEWToxEUzE1pVsMMhMcap/jj3+oVj/ALR63Q8l0LaW5ohfRK9Dkfsx0BcrfngeTYvTGYH/AOMAXBGGX+UALxLw/mq7WgsFE27ZOB1T2ztTmXU9mbmRS8avB8nVEfhy+RSRac5WHZNglGVjac+Oek6fapANOUgx+UYuEcJhNkCVYnH8oPYe6Uf4Dj2dvtP0xH1QFvEcIfBVFDxiTkyDiAZHwoYhzK05HbU1mHfjStKbsabq9Yxci9iUMnNF6RM2c45/PFhDjClnuv6AfBa2pin8xpcP0fUTAORvxSg/x3+iroU3abYTZnJr5/oio6nrZ0rdiPpYOkDaTiBTrfj/AGpUuD3dv4rXdjPnz+SXzZjsewc/40r6+v8AliITdLOJ2pFdhl5fTKQ+cOYPnoLdm2T9nwWntt5GY5ueC3xtk/b8Vb6/oqCa6N43XqkqH4L8PuWyNsnm7U0B+Zn9S2MHzMEwvOI2lZLP0YeG2TnzN25dN8i5ogOa6P5MbxmpiwENXxXOGmw8ROkao/NdAbK5MAfar92DCVFaYKVfW4ePKp0waXq7bbB4oXvg4iVG4znCRxaGwiXKQ2eT379q0Omw8OHI3XKTm6N0Ixj31QWHJelCl2ZvwGD3npvNxxHy7qwnPlvr6zjR2alKYAY+naPKqpVnY9P+8t1tBfvCqu63qfMQ/WGsjzuhaJJ89Driv0qsCH+Tlox8VVPeRMmf6/X9o2ZaDTyXbzZuPUIQpeJYK7oWyyackkMJzxpRrFKEK4p9IrXJM7q3da+3i20D8v5GNdsUibQTp8so+UJ0bQ5zq7tbfjhWnFFSAcYd6O2j1spO9aUv4IVQ6MA72xVXoom/S9Ln4+nj+iPMke3RvlOkb113/DD+dAUjVqR23ZObzZBqiEITiFAToQhPAZwoQvvMw/zEF8L41tR11VR8Z2PT/vIlb+2CxIX2PsKEIX1+x/dQE4zJOlCEB4CdCEJQE4UIShJ0nCgCwSd0OqPzWdTUYZYr+hsEdvCff0r6S2ov6Pw6bZSa8k1SwTOprD5OR1e31BUyZVXS3LFJkLn5fbEGoQhPQbQJQk6EDsisFCEfsu/MhKAqCydnp/P+Cn2zKg6dqGQaRUDmMKUIMcaJjXDXAgf8FX5Oza5PAMLxp5QiapRu8fs9nYL6kT7R/ckTCXDt1yMNsSDvVMnMOTrIHhEsUQrBBwjyLUZPnodcV5OnZ/XGHXFYUsQ83Q2avERuXkqPZE75DxckomuyyhGKvpr54QVSMwYRsnmiY27Uoy4iZPHG9UK45dcm2TJ/6cv71lwcOn4psQYrbau5qvnSPhkJ4P8AULaPEV2bardtkUJ0lfGM63Znpt+Ok4huBKLu+1aJJvkatfOrYWZ2gUu2U48gHNoxBJLbPCFLhCEfzoXR1fauVwPXbCNo4j0NYLS0Q25b10XCdhOudm5PQJyBXKczzQc/4j3FNK3SqnjPmHED74lX3rTw/Hydf2pzZLLOENpcBjnY2JYzh4qJG91JV86om5sA0W1i6KFwOLCjo9wh9aWizpPNv73rEhcGLJBgjszYcJGXVm1tonvSB3z0en4QTi5P052kyByMKtbz3jsPf9i3xupsM5nnuBBo2Ku33r1fUIV2hwHKBWlpSi0TE+HOYasEZsfTy361e6xTI7bbTLMp1fuFR4S/WGHEG65VSoSj5tRzgW8ecKKVib8Wb6PW6tFpFoNASTqHZ6jKEYi3TbIKDXl5elUdgtJ6VByQxDn+p1/EP1LQuFvbDaWcEL9Exi5xFjwHoN4OGH9q6k2z+TvzqWbazLODn4H9HMgnRmG8rmGe0KHlJoV6q/jUH66ZiKHL2x2WWprlm/zfZCgMzRUIb7r/AIqSG2VOqOTiW+SLDCC7Zz/WloclnnHSdIXi4bFcuq5LJDx4OYgfP/ZvQ9R2j9X9IJLa0l5EyUnuRE5Q5BhQ0mPib7yysCXepBtHpWlmqAQzBUXhBi2yQcZrv2jnSOlrMrU7RHKTIpCgn11KK1xvB0c2/wBtnq4tN5CNoU+TIcLVq9piimuHG7vL7h9qri5b5tq3HyLiWlikqnT0JOXX4YVr8PtC2l6WzFR7ti/J0xQptpvSpkgceOEKXslnMIcSG9uBKdihCsCXggNILqPZXZBkRtT6Q0Rqn9Jr8I1zzjCqpOvATzHKPqIkg6nrALCINQsCsFB2PA0eocrpkkHTo6FvxKh0yFpmM4MRsQmPt/kGDy7rkvMI0xFCdI3RIKX0fki25VVJiSz2cltIvtlVH+D7irEh5ETFSocXi3C29hpMaHHA6W3dph3fUp9oiblZhSHt2r98o8OBY2xwOwh+A/8AYKoz9StloLmcfaRanU9oL5itsECj5O6NShHyxvS6ZFZjWSTImT/wKWuOfv5w9N2HfuBDrXDcEjsDBbof+C5Qlk1uyHbK5UgciS52sOfHtcNIKU7K7fXivjZ9MWIWIsVKQEbMdi3zCN7bh1Db88ZMhFISRrN7MiXapxGu53CBALhFM0i061+zpokkihUxShJTbdGF/lCA/Wo+tbPl2OPVZNZR9jlLty3d16oleAsdlonl7oide4Ibyj4Xp8gkM23nKme3ieOwU6wtDWLxu8Dyf4hNlpBlpFYPsh4qC2Fss0FEFuwYJ5Tg3OBHyVR3isKwqOE8dwdcWL63gfR/1pK6cs+qmsQ3QgCQVCI2wl48/R+5TVKwYmLqR/WrdrQngJnr1ftN1fgLUQ/Ryt1jkfyyyaP1SizdE27sNDyZ88id4bEuuqrjAWLVFbmx2sUZNoapTKSs1FdGWjiomyyjj8BHhXQvjd1QVLxXt6p9qqam5Lm1RkOV4Trwo+kTr4XRu618BtuYZyHBxqPZb9QYJ+kL/dSl9vLBhV1Tr8M5yYco/Lpu4pp4YV40pv8AXXHgJUtoOsStTuKNsnKJ2unTdj0NX6/v9QmUvKztIHMnk08FTFP6t+gr3FarW2UHanX82TpioxRMKLeJoQDAqMW1tbXudh2ZqrGoSo6xBAgdIK3FBZMlrNUhz4n2WUfSsMNsbtVN0b+sOQlkkno5s3VvXDVEipPHkz+7Hj6w/SSOiaycj9ds2Ip+5nFKoTnEjjE9zMJLKxqcjGJ3CaJDuQCSI2OpUARIHAXuR66X03kCAQ8fVtek8KGKx2Ephk0dd261bZhsSsmpaQ1cGRTophTVqEMer31xb/8A2+uCiU5p+tlkoRCBTMtX2VpT7f8AMQi4/wBJSzYupEILM5/uDkEwZPFf1hSVO1pR7I+1BF2Ihwi4QOEb4QhuxQuf1K0lE5HVYHNo/hA1UfT/AAixbzPCm+r6hXRY19CaZM+6EICw5brlXqr8q6z6lc+OS93dt96q9XSXpGu/zWEb9rsUznpTu/NPcKgV0yaTrwzsLcZ5OV2S5zhbZtkl2V2cuU94hinZ9xXHDlYoKSwscnDN4Ioi57v2XUwyG0gin2qBbpuhjj010TlC2pWwxe/BmnisMwDY0qAURNfLq+F6ZJKxNIcmgeXuY5iJ+NY+HcIhO2JpNm0jzt1rZPpKmHRac8dXVyKGbYH4NjpV8JJn7tXStCye6vfbRpLrW7xCGFE8hhw3cXUWZXVYSAabns408TE77k3W/ay1bxRga+kIblivbbttZ9fqME49IRTljmqQNPq+NTHkVAyNmgm7FiBmGwjA3VGOGbOjVdfzxgoRcjIRna1KZhYmggQItflIR0xul4Q9ID9agh+M8d/JfoPbqC9FlKG9FjyCez+fEa60pSXkSJJ9b+QxB1VCnHiQ4D3F4QrlU72HWYv1tNsDG8VACU00HT5XhTUZp3o7Dj+qqq+jDHUyQ3t8jFlOxWxhrpfa/Xk2x6w5jsKGdBXWsS2uf+kaIJ10QL/VRUy6RX6xaoW9b5PP3fIzeBOnFT3ffWlOsY5pOzc20PFLrGI21hD/AEM/jEFZbtvDPa3WEgdokYNrp8XBCRhqVLaQpttrGpJDQ8OozSKXrxhqbZzxJnv0h3IkYvCFY/Bncqw1U/SXt40gO1CtPJsKYS0g4OCJANvRNjZCF6ecVgs8jl5Ej6pC6shicwfPyyBtqVnksdVHM4BwjsKIVgQzI/SCtDZNOCo6zisa3I2Qp2/VdoM3qqQbbOOMkDjx2osrAhqylr8rwXkUrZyNrJahRzqjDBjr0gmq3WlKrKkcFyEUNj7qYfn3hZDLJIKuZ7oZC8kv1xvuUtWD9aM25OlADyI3i0Jf/tAgjV9ygilaDbQqqntFTnbKLuiDuW3W+T73KyaG/B2YtMIxjycv3qFc9OnzvPlYpPFjQMaZyetOQoQ3NfQKfl1+0eyLyDhJYmzsM6RDE5ObkZMnQG1VG2iAv04cDamvFXhl+78qkGlqPcXQtraJEjFubsTgmj1DaOVRkzzokGD9fLBWsd61bp9OUiAwU8MwPtK8bqIKHlB+IuuugrTlF5OPQQaxyeNVN2fdze7jXhjv3bu/uFqaK4KDuJ2/lnBMnK5JfAEdUULUVnlUm0zUwIgr41CSDyxIH6Q5V0oyOaP2OQ4Zj+S57s2nrRqqxDucU7OjtC4ss30g4Lt3ZMwB0DRET3eeKKK0i413M5sOs4aaLjexVqoRMictXy3TycMevv8AxFtaUZKkJZzaB+cW6QpP+UNtIk5+iLKG+fDZI+FVRh8vua5eKRrQa7MtNrusK/d4xxNVFzzQwzo3xAH3B3qOZPj+nn+5Wxo0tWtn2i1iTU53LnV/5h+P57gWHG0i4ls3CwKdJkGRiRI14rkTvUbiI9uM8gBrGahcLxQJYXdhLBk4ggIq+7nWuSZ3Vu61M9Sg5XTd09n5+AnjtKRiqeSX46P/AJNp+nA2nV7T5P8AlBTEh8/s5UYLre+wvhdzwjBcQshBz0XlIMY2q91ph2B+UV3JeJOfu+xYI09MqMtKCjinziaR/wAPwoMlX2z2K51hzNyl5OHknffG9czX39t3511WyqBJzIG6xInxiUWNcHgtXWuUTxvn9UPktI6Gl6OLcTrQaw0WrV+RG8aU6eZUbuU7z9/VFSQ5f4yjFynfb8VoBmM86WFukG0ydh50/l5tSkKtq8YXWmwW9nBvKvkYuMQNHx2eKiozd2/gm5RW5XiKCKYpONumRi2klHsf1d4XIryA3Tt8euHyTAn+dvj1w+SYFlG+lsHf7wZ0OsCEIVfhQBCEIABCEKRQK2Cx0B4txGyNfmV+hX8nXStOU5kxhP4xxTt4WPp77UcfYCRy8J+C/PVJneJjd2r9E+RPTjjQGSZTsMxiynXS1VRDv51ItJ2CFhRjFGuFMxffur/r7h2R9As4+j/ISpUtOUpVMk+NMWm7TisaGGc/agFHlK2HBWgvtU0fW1fsNWC6CxobOFDygwEEetKsmes9t2qORT7fSr80vxRW2NDJ9HkLdKJqemslK0uTZzR1ODur7UNTghV3UZ50T+FHH7hcZv5tSYT2/NxcedhFulKSNCZypZCUqQlPnNZj+HXxFq6PbcvJGcW8hHyKNi9EVltTomqqBMnMLxivJJI9xn9YEb1WQNycoVho9wnwwxbouqGWY502fVOgMc1iOmK2zpUD2G5NE6sa7a6n04KW1iuZHEVe9rX2zb2NSeuSmWp0/iNB6UbvWm7NirkXPkekNmy+MdB6DrBtsdoNqHdwXQQYvMXCcrep+qWiW19faWqe/wBE6tWvZyFq1pFnsl8YZDeRiv2Gu5ScHmQGKREiF0afFuvWJpOQRXqSWZHrtChj5/fuGUIe43bFZbDkKD8vmVlaC/Wi5R9qZ7vP2Sk6nn0q0f6vGby8Kq4fte/Oug2Xfk4TrOaqOtvpDa6Erd9IOqT/APR95I5Vz5DnZ/fP5VsLRnJxj2KZR7U+6n5wEKk9drlHAWyt/bBK5HL35kklb+2CVrQUP2fz3BtS9Mb3/gH5t81HvzKSQ9/Z+K0Jtk+Y/v1LfG3fHvywTu84jSujFnTUkxD6F54fr/BP0ndDqj80xyt/bBbUHv7PxUZW4DYFqo8yJMs9bZxBnKultkjN4ke+R0XfaqK2VtsnGDrplZiHJkB3/wA1mTS9MUqkduKZ01TGKOz0E5Nsn7PgnepXiNN0fVVQEatEsU874a/uSUPf2fitNt4nYGw21oiHqlBu/wD3SKyVXzh+i3r4iffQZSQ84eIj8437HaL+hY0LzPR6fhBfq+Nzsv1Mv1R6hJ0IDgIB1jx73xW1M8qnJ7Q6QcJ5IjnfsgYUfJx61NCUVQxH5is1kWKu0akp+T0TgUssNrE5ksVqGxnwJpkoV/fZD54RGg3VAB9VgomQo3KW9GT6ia0lTnE60r76YVoOTOSeMc+z5eWN9rv9HBDkyfo4kPobXoKQC7mvcPWPXL1pXmJ3RiupZm1txxkhvz8RIGFf9XLdK/s/crPHyDEe5trqTGF8C2U3Ht/bBK2SbKIapxdVOewrWnfWlMMfvoHh2zkZRFaeqiXZiGyGycggj1CEKQPPTJhiN6NP638goSdfUnPdF/2JyNDMBM2gcoSPHdu8nwXtN6xG+QdPmdoyBjQsuaj0/wC6sScAnChfeufJ6F8LZqVnByDLyL46t65orVXR2gLoeN8qyKbDPkTONb1jx73xWZLXjNYyfhrr7tfMmuTuh1R+a6AWRoxkTsKDOk6EoQOSK20UCdTBYtV9F0RXUl/r2iha/Y8LPgVTpsPzruxROhNs1FITEYpGueChOqtaV4b8K0wrSvrpWle4K4xZVuum5Dk7mSXR4OcAAsIMU6bIHdrTKlCtNQlIWFHWE1tU9X1fhLTRb/BynYx1w6LkimppG2UU61IZTOYifIJVTp1pT17u+vVTfULWTNWVWWxOXWcs4qihCFJwzAShSFO8FoUthx5BPhPiu2EVHq4IL1cVU5sSqSiPJVEK0WKfOUpuQD9l35kIR+y78yXhlG0uNIVE1tDW/ntZIja68ULhyLVk8GO7wcGC3kHFFiicTDTOmpjtuq86/PcFz3yfrf6JzavKXpgQhCdQhGeTJ77046GnZn7f5pnT9JeZ2Yw/qv2JOtrg9RHkjXU8q5hhkcvfmQkkrf2wStAGa2v3jZGdyDHcsQ4YrDet4FDwZJInHYfivKmKdvj1w+ScW0Ms7i8jiu28yRahBBbaRMEJGcXR8hIECSVv7YIm7+2Kd2FykguUggiTivdOZD9OkkGHEyJGEFLJ1rtrq6/DV9Q76ln8ndfruczdEM8mT5iKeHJtmtU68+QVHq3LCzyZ0Noz+5OTu7zjp0iB84osrC67oLiusvr6dwWIxiSEGdw4Jzp8mqGFsfnIediW/lTlpjETdonFYbdfFOLQ/UgCwug7hIdC3MuM/CXxUj2ZZP1slsMZ8+l6d0Sx/wDlFVPk+n/go/JzcNEoqP5mpUEids/X7A/Ul1ouPRQo/wBd2zF8AhudmR+WPRy3LcKKs4rW0UySBRFHPtQElwvvCB8nQ/jVbdts9yTbEMwRWFRFW7ViJrjTjJsFPt5HfnTy75blbQbtA2X0sxWfMYkLgohA6QcYQ6ORV+7v+5ZdPCyIsx0v/EOeZT+HGvwpSvVUCKEtKLEXYtik+h8BsdCZAFV6yLRqwa6JFK4o0McdP1Af2ra6VLyPLJXJ1b2iloVs+tPE6jreGkYuDh1xWj2OjZTFolTh11TY5JhHDDjweFVtVA6Ob+FCOrk1qzFKZHNCSHI5wtAe3S0t9LKxpYYPC0BTreQqIuicOm/WbX9OGXplpzTPGm/rpXDhuw4m3413UElkWdmwn/1m/K58DZqKi1tlcW+1i4z2ehwtFC4rAhh0Qw6RcVgYMna2quDJFQWvVfClGsvXDGn4+of7GulrfR8ym3eLTSTGwUmw8HgxPiIy6nA+HL8lz/trtIj4Rz2do9U44Y+bk4WrcVZZekRYkeiywLylemph91N/tDlYlrSN3zh/koTY2QmqkLN7CaAnSNDtZNoD8J/lIdrvIUzmWwOQ7a6HkaLacJC4MQKGvtXKmTUbjIDnDjz8KM6wwJceIN8O963J8r2oXmjaaox2nsYrJTP5pjXEIOIJ7h+bCMIXQjqhv5E5SWjBw7fIrvljOcTcs561xpTDfu3047sKUpu3i6q/o5xS6ya752Z5TNyzH/O8Wptbtcs1tGo4F1cH4oR5F4OD4VKMkzSF0b935u9UlnaI8wzguhd5Wx46Gvv+KYZrkHIuHHkX/wAB5RQGbOz0jETyhBYZhWNbNpI2szOgxUNVPHHKfq9W78cRddqRtv2Q0PEwRzasbfjH2lomt+O0Vi4SMWIDydS2aphaRCmt0ZNWv1UEkt8ng8HA8KDk4hz/AGfVuv5oramCyKorRX83g2VUXUjrTZbXgg3WqOFo9vj71Aufrirb0hkFHSIAkV/aJhcJDUHS4P5sIqITt/2lDKpun7zVucvKSJTE561pTjSmNaYBHO6UrOt2pHD57qVMu8hOmKT0XaY7UEG5t9MMg+lH+P50DTQon+T+n8Nyn02xzKanyAZNMMZeFf2IA0zAHCMMaf8AdYZ8tdLaKsYsZsznSSKRo9rFc7rou92PcI/xk9SI5v4bUHPcCJ4ogwnYqJmNMZXMjtFtxpaZ+kZbl569WPqp7fgM7XH+kCq4l9otONT5fS2gufOOYlKfk/62dps4mva2bKfh7HS8NOXQ6b4K3lBZKNkFDsM9ni1k1WMYVtnhT5Qx6eaktypVqz/j+KC3KHGTK2banfGamhh4sMXRyiHB1LujwuFdC+6HTFNEjIaWrtZncuVFNmJ0qE5FKfj9tRG5GT0yXqiddwdTZk/3Ba+V4NUK0QGbwWynmsT1MEEVvb49ibm60Kn3yS5zwHUTDNMdrhHluXNLKat5cnd2NokCaO6DNZGDMduF6PO6Iqq1OWo1zS7e5NTS5OQza+3xJ4UYQjwjb4XRujyJ+gNB0nOQJJZVahHCmG6vdjT7ev8AOIkluaA3c3bxJZ64yOT8shR2ycbVWaS5As47qKXpaMiAZm/jGpa/aTKrQia1g0w6QiU67/zoX3LmTR1mVozXPZanOCfWoZ0jjhODD0edGML9a6N0g21IRAEgnZChOdNE9asVaaiLiOepL03+vfw+wV7erO2NHbxFxBvCuRUm0OurarNfCimYzoGaVjfwY4DcqdMVCVtX7lOkM4RVQE4bHYMI/SF/vS7SPFnsKpLnuDxIgWSXzr2lrK22jpxxFPyMIUWLeZ0KTQGlWOtyIUqwbJUfKcT06HcJVAfpDwcJEH2FgXyifpGyZCHHEak3ASmKhlOpzAPU7aNAgCDWXwYR4RvTCEYRh8Uoaaoq6kJz14MzXNgi/mYMqIcIRceDI9lh8Yrsm0WA001vwLu3giikxKxselO0qxOlZFVAv+HF8lE43epC/wBN9rrrqGcMtZnTp0z8cnq4dfH48A5S/wCklbryp9nijHTOXtnDxZvR7bZjZvT1IyZ8LxBdrMv/AG8/ajPvXGnKErCdUdePo+OgW1ilEREMB+9dAcqK2ZoZG16o+DoUG5mNmy4LVFcf3IzHTp+I1cic9BdqSFFnN5yvTW9XfvrX7fcDQhbjyKaK3nK/rLnohzz046TPxHqgt6j54YZzrJnkj6sIL69FbfmfEzyB8V75yLerFbODbU61nz3aeS02d0oLp2r3aOqMY7wxVox9NIwDFeYcnyJJ/nClPX1CY6XpeDcW9hOkNyw8WBUVJsspY7KGr9r2rRd9lrQadfjyPau1RtJyiKcn05awNV1Lxqqr619E1bDgwjgeaF/Ityt9trd7YX3R9IMhIjZT7XgminQtUQB1QR4MnAzp45EdqVcqNNXErXNeRK7WpUlTEpWtNXQlaVSTxpX1UzdRt9K403DHUjPyNntEW8QTIocp85hqs6dH/P67u1Zm2TnzJCRpYHO8dd8LlSsO8pKzpKr+jIYVeLZWK0q0RtBdX948q0xZ8Lpss0H0c4Ej971qEporu2a00iRSDU51A+cEqecGGFq4MMOtknOUizOyWRT40+90raMXx458OtJsztGq+y2qAquol0g1Pkd8IwvhEYhaEXZSjhBw6aZSusNxK8N3DH38cKcBJZFdFiijBOOQn0zF+v6MbLlFMLjTlSUczn8ZFoMG+MPhFQ+HJ+H2KzeVOXOqmo7OavhAm6oaEkGlmQ9o3quAcmdnufnTho8aLLuDSzgnO/iQga7jotSc1FfojZGeTCGY3fNSo2yb8x/drWksIfmb+3v8FKjDJz87zCsmTWGo9DNt9CovVki2Y6cfpFQEyNlE3Q5FZnLqtO8ArJ5FDN5GFdLSisDHnAb48c79K37JeoqdTdHhEkSBcUVC/dr5VyiyprU4Ww2tPlQDz4F0w1fqvTl0PVx98VjKLZq6TNMVVXFc7Fny6+6u6nvr9wjkuqte1+rOCn5ttyCiuE7zMeqCeRJ2YzOvXErfdqTKhbLrTGmFRb8atsLwj8TjXNqBVTsbOxT5DaJFiHwguCDjGF90Iar92qEFB+eh0fCK8QmiMjGUSz2aPT/NeIcZ2cVmVefTyJCyGSm46Eyh7JZ/tboQDu9oaV+gd+3Q6/vX5uLGZ0ZFtVlnOLag08mvjcV+kZ8jfwYdl6xr+kmiX5ZsXFeNUKfYev8AMZr0jo4zdBzryoZ07MziCJ+L+1cr3idCGf3fNdJsq6dOzM9c2XidJz3R1bleOhtL/dhHAaQ0cV2ew8BHrj5n4/co9ct8O/LFb45ft/8AzVHrn/i9+ZX+z4jN2kxWlFjtwwTt0eqHzTdP5O/OnKdO6t3Umaduj1Q+ara73mziiEfTn+t/IM5m7t/BNyWG/j96RrK90rUXWJiHMCEIURABCEIABCFnk+eh1xTtD61d5g3OPFuI3aj6JqquDJDPS4JZZW4y/Vo9fqem1JQdldmFOAHz4Ra6fpeQxhhsgGkOLiLhjYZShlU2NUQDR7WU7Ppdok/wkwIHlCGvY4/Vty6rWg2TWgg2byJDfIKqB0amqAWiAuy5OV1x9uyqUVtLrV0PjmL192ItpnatvMo6NcPnP6zyjBVk4WqUJVDhVbjTFnQtK4UXGluxhuPcT1zspJznOlq9L1Q7bVGoK6xxUd0IYh1iXBWusPca2stoe0B/qClrhYtWm2lo94u1qiMp3hJd5J+ZiJhXTGhiXcQvLxSsazbZa+WJ+kfTmjlIkQ9T6yteRXHfWuPd+A2Nooh7fcKTbhi31LY9CkLys4tZb/Z/aBV9oT2QPRBWixXSfc7mv2j1ZfJwrGyWh2IFneLWqEEJxWBDaNPQh96pNabbhOtgkso1bT3TFtUfzsZS8RQIXx3rSLKWaxFjrIMhzp6pX+YY5SPzROHwROFwIR5L4QjBJJK1puUscsTM5iakvRRJn6Hrrx+FBXc9oQnJONbILmT5BeVkP4B+h/MhPgQLg3zxSxcLr51DFkj8ZVPh+3OE8UuAdTkAwu7Fu7bBnpVs8H2eeI04z0QHHVCK0GebQdh1KVvWDu9tdKNZboQ+VHUZ0bm7EEdKyG0SypLM0aGOocxNV3/n2DHUilqHZCiPKrFo6o6VtZoip6d0rRwosgEsM6GA4LiRxtfn4quVTdOOR0B6AF2R09e8oNyvdbZlo2B2jtBFEM8i1kNi0njXd3YwBWBwf+Xv1Kk84zJxzE8eH6YhIwj7AIetj6GGhrbbLuplJbnzE5OHu7+NfZ3Byh9Ui0PtB2+s7OfIfIMT9RVIVHZB+lamACWpzaqmkMlSU59HbR60KoCDkqaq1tSps6igrMLOGp+FpeLn4Uu7w+H3VHV7goVk+I6Of7loLR/tKyDpyanNnPU5PZ+d/Xu9YYp5ZmvIk2fL0eVk5BM43Bs/xu/Ot3D39n4rSGz/ABu/Ot8C/D7lL3nEX7oq+bGxh7/4b8Vsrb/irWw+TtT+3cYh1KKq8Rr+3P1X4i3NknngexdMrOPRw/Z965m2SzvHD3dmtdLKDM2ORvu6r1jfS76U357hlzTT+tU/PUJgC/D7lGGU7HMZPdsEP/0EPjD4RUkhzvj9q0jKGkzjrCLWh/8A9BD+X3SKoVlzE22/5qf30FFR3/EkB+chJ0s/8GvZMnn397l+qo3EgtTUkCJCEIHcQaGzuLrnyW8AouAguOLv1JCnpteHJqknaPOwmLF2y+HqyZUn3j8wXmyVaI6g5tZyswELeH6idFNATvpVrLxfqgMPKK0ddqVR1W0t1Atl4GRhFdRLEMRQCUZ6cRxnWk6F9BmRWAhCEoD0FAc6dInSCOXruitwq+rzKwMBIJBFEwguBDwWvvvUfrLJk8+/vclyzJDXpuq0HVnMSKEctEtz+bHMQ5ifUH2pJcqEMaqckVAQcLHapGv6Qb8RqUZzd/bFPhjw4kByACDisMJDYw/o9eLor1qnsqg7Q60Ggi/byyJjqZeaMQ3QONeQhCViOAQhCADLN39sVNVkM6lpD7P8NsRo3C6sHhNIf/HUILLnY9P+8m6UY7eyUbVUw9nESi1bk+Ts6Sd1JT5DdE43Wr5zaQ/Omh+LYrY+VaqsGeh0fCKUSdw/XH713RR2dFNuOMjJUlJdWWyF5Zs+UvQCw1tMBnbTIKE7EiUg1rWs6sJzWTghmnRI0gKOBAwHF1HyG6zxwiTaCZFQsl2cGyllkIhbXNuybogWbM5/MQh8F9KY/BWlqibWwekZDmW+4WBzvd968XlEWGro4oHK27Wd3Ussgwy6wmTkm6Z/qCGjQpw85YZHL35lm8d/pLZH2lZzJgSSDhi8WLduSzXUxI3DcgzWfJLSrEnNk6Q1zMx6fjBbTSFLeFLjEDSgzVdDjZuwN8VrmDnZ7dyXJyZ8ZPM8nyCSiefch7rnCCmzqYDrAIpIziPlZsY6ebo+MOLxSzvTmfIzBRbZip4Wl/o9aetwfqjfp4ng+4HE6LEK4odvW1We0HOqPPkcbv3ptK9qxaa+QyiVI2srd92EtuxSm/eGkmM7+1BjkEtRQopfEzDvR38KvA2Go3VtOeG9jcy2tp9LlhAeTm/60rK2gvbtUNFtlI1M5iiNtADTwqdEBB5oXQUEU3alXVLUhUNENDnAVjqr0sJGGvg3pjYydxP4zaGKSVFs/fXDV48ccOOXfhhx3Y9Y73rZVLInCMZZRTVHTDEYzvA4YLwQA6CNZfEzDgPJq1tS9Udq1Z1RQ1L2dOxosGOlrjmmPPcoozMen4wUgil5WqB/LSRKVz14VrXdjurwpvrTCtaYVwruxrxrD3lUaLJ7Acx08vbG6Us204cXhqgxV/St3Ms4CjgYQObMK6xx0YROug3jkKGZwc6QtqbH4yQuayLyq20MFxZ1oSVpoZIm7Iov1u2EeDzE6R63tScg36c1Z/R92FMF+CZ5UkyfJIw8knC7jE3ZnMR1c/KnPU0cbnAiqMutBrbRE8j6Qyzpxk/aMwlgcnv8k8TtG6Iw+YK0niuNrY6EoStbRXjwYoinXN2dMV6l6Ob/AK0Z6qkT2TjmDJRzIHKmkTtHHVFHYnZF1z51DlCR4ZwmrMEEnXFFi+oqV7G8nG2W2CbiKRaxGml/W6uqmGBp6PVzq3bPYnYHYFEB3t4dGq0yuoC7HQoUf1eA6oLcMqfKJoqqg6QpiziqIEsMRv1jDBjgG/hQ1bKqGlNJc9PO0Yex2ZjEW3baonXV8jrTpu91caUr1YixIy21bvuIiEUTY2R/6yNPDpXJZyZs9j5/6d7ThBd5sP1eAI6lEtV28OdtMaoJtHrdzpRiEYv1RpGlo+TjyPZVrlH2S15bE5T2+z9jKM8pxxjud5Pp1v8A4xXRpWw6xSwiaPF4kF2w2i8t4F1PU+R1ciikopa1ura+QcrP7g3b9xzk4dXokqfniJVLwMHaEiSJifOXooTZNk42s2qbQzsmiWLf4R1TsDf/AAkFfWz6w6wqzN3a8VirYLRCiuOGg30+3EdfItltOtHg6Ns8h+qIRpFiLslOAn6PVHHOvHKe5Y9vk4QZqzGEDCB8n4gf2pC7u9dI6J9rX2Vt4Cf+4rxr7sPeHez9E83dzPaHyxmzYdVqwtI/RzOBhaO6iiDeI8kMmuDgPzKAq8yzG2Q8SBqQBK0WILxwFUbq+q6qrd30/WE8rFFw58BHD+6psdw2EGS14cjFlFtkg0wy4Rw2hJ4DRDbrHUOJ7nnNS9j0frFtWr+jxabJIjid5bnLyvAJvZrfrYWh6PquUW1DTnVqheU9gxhE+7duUCuRhrqWRUBGKdiSyscYWdrvITO4v04iRIH9VE54Lb6FoWurS3DQFEsjk6Ew1/ncKP5ra3/FWejDQ1toqS+RNDdShz9DmycBbCLuzLcqoZsQpK5en7PX7xqGem83yWYOQ81JOkDs4L9UBXEQwwQC3BdO7OMhAWRKkH2nVDtJTVgTKdpb/k/2zerO4GyuwJinD0zTrXSgxW6N10FVUxp4hEltgtdqZ057Na7ifz+GIqy6dMkcu82C1MzlQ452WfZDlrVVQBn1+c12fsXNdpCovir02b5J9ilmcJDhBk8K30WGN8I6phj4w7U0UjXs+sX2fF2eyRW0QafC6MboQIv1pncpNqdYY6e3VTqFjgg7tXWqjuS4r5uNc7CYkqIpbsxCcgn+fr34eoU1OvZx862eelSoi1LxW7axSZGJnwFFKKwInJGCr1a1lO05R7RJ8HjWx2fYccaIx1ALDNsYd6jbggahenN1bBBdlaN9/WtrorJ6Z2R4OcCJAxYpYuCwZoNyhrJpZMXTaZVYyypOwXcQ/wAfziI1GvNG8J58/Oo5ydknJIcVkru0K0+ua6Zabs1cSHRtcxZJsDTQdB7eP6ru5YQ3J2o+zitgqjvf5BReinOGlxIn6Qv5leUOzFnap0lwG5tV6fsyzgyef7UqUv8AatWpY+Cbl1WXLXdzla9+NMPuBI6ZFm8dSJgmKaKeXpH6YjsynzKjcpDvghhMILPCiIcDrUfCZLtnxzdOx4JJeE24OHsBCnmdWzC1SZ/jxRBYLVf0tUTCUcR4VNgkROXmUXZStzN0sYnWE4dAVvG3rcLHfEuTE+qIlbskuz2ROnkkAlFQwt2Dx5ejoqX2azCiWpukjjtYomE4nDkUHPGVHTcicOO34p2+o6/ikIlpNptRzz9D0QVhIcTMOP0epI9aX5Jo55h0YlPpnw/kOMvcd2S2Tys5UP8AXMLPZltHzA/G8Ilkkxtkc/bqUMtrw5U3JkO9Xuovvl0NUFEtbZQlB0r5Qg6YsksmfFMbO15GUd7OxIZb6gjkaznJvmGLbOLsSX6T/mBU8SXIIiTd9y5IvGXgGPOnjANX80wzsvB4nycOPTuq7jcH3UpUjoKvhemOxiwo3RNfr1Xc2L/EQdaDHgKRO8/dDlWn1vVUmnKbPeISPVeJqnVmNs0/KXtCp5paGUpgYaKH03UUDTuPER1Qh0p3yzK20HR+hxp+ssVNMfYLxO52ltP6YOjdMm6uTf6u+lMR4y0fyCF2MLaf5dYt/kOY9qVUuVb1cceROxXqAcLtygdynYedP+9bVp6TIxxGY2rF7GZyqMTS5pzl6rDFudxmr1hfovARlGDOjYpMiSZRqnSBdUfFxLBjE/UKUPrbVRciRo4eQKWU7FYEP+I9lVjrQKqYrELFArGKYu8J3aOm66M9gI51G9kNFhNVSVDaPU8gUumbNRp5sIX49vPcR+Jx7FpVVCUtUdlB1rzxXgn6RKhrCeEZQwQXq/tN3VyqGz7iFf3Cg3XzbEmoQ26la51603UrhSuFKU31xwpvoMx3Hcc4uiVvLU5xsU2q+gQg0+hraqjsnq8irmEcWLlHPgbbHHtyi1ybaqtGeHuqG9jKKxhU854wMPJzetVcjIRna05MNeVJTgZw7McUIKXxz8VBbjm7clLjXTWNTLXClTk44U4Ux9WNcPaKwZzCz7UsJ5ZTYiGMfkZM41DMx6fjBb3Zuz6VqQEkj0Y0wxzxy3jrRJ2+PXD5KfcHNoehJ5+IvfXbV1DuCiFixDReXM+z+Zti5zDyBZ1fLHXXJzaJc5g5SWd3taqR1HbyBbmgXbb4/wDdcwtDnNs5jeIDuELyhCtr5k20hV79ThhDg3z4CElw1p+DnG1G8QIcJ+1FlbYYtCWo8Rk867j0Rx3drQktHNqNyKeWjqcrwZBZW1qRNdLE7HnD/wAny8DG+PtCrI2yc/cQr6NU6yiRk98GNpoLkXrwVOaFhGLjFw6LlS9sk+J1fZqSixnpaGes6JHpRNY2/qrjv3fiJvL24kvOIuPGmTMNkZ5Pif5q0NgVKzqiq8GN18blXxtk/b8V0xyM6Ez87wgJkdNya9KE9WEtZy+pXCvCg0Ggsja9hLP/AKOQgstlMWgwsYsBfJ4E/CPtQ/qtTd/tDhu79C4xU2wuLoGdgAcXopsxpfSOOrl/lB67nOtodO0A3z9mops02X9ZP1fiqIBPxg86fhjioYsXkP1fBV/oTtZ5G2PWXphR09Nrfdjux93wxEX0TamE/pZ/88PfPztnkcmrWtoeKDq+nWcJ3eKdcxWt14oWdHX2poaAy57jIiACU6kibdEQLyhdh1YC13KRe7UKXp+mnVpFD4TFG/hx54whdBWfJvZ5GYZNohAiiPzxs+8lOrd17xZquuwI4+tmFWUIQpkGHW1Eh2WTp36U7M+i1lh/72v0lvnmOD2fJfm0shlZ+1myUf2u09h17vW1+kepOJfuw+axL+knWnyujaf2X4ihtIX/ABWg5O5VzvcZh4Rv6FQNy/xlbrKccsc/Xc8FTlync/YtD6MWeothtQantzzKwW1RobxO5+1R68cn/mrfHidGOf3/ACUeunnldCHoqjH+kdZFdUI50eUeRiyYFpnfm1yBMnt7wCU0unKGdDWtpZ3KcxvwNQN+1lNLrjg4/Ryd7ZLUaitYq42tquHFDciYSIcGAQF9ypC+132c1F6eYddevHdhuw69/Xuwpurjuqdkiz2TX1PzubklENm/j96Ron8nfnQszTy2vdhYjxAhCExD0CzzvPR64LAt2pyz2r6wDdT6fZCnZrp8XGu5n0cB0JwRaKvVaMGJM46sklnyuzoEMdTwl9w0lCELiits6ybgchOVgVpr9ZXanR9Xt5zoIKLVAB1Ss7HC9xqBuHL20VfpttUtaoQCmZ55Nek0TGAnG8DdgF+Z7JepCdX1v1llMjyMXpap5ETPq4+1Grt3lrsD6NQU45vB8lh8chfrilr6MibkuSKYPlDJuT1wPXd14YcceO8PsMlR6q2YOD82dTKGeyvKvnVzbK1WX0gCVWtMXEAvFSPewOMNSiXKbsTEaLTXSFIBCitZcBzTRAtUQVo9n2aye6WAqhoaofpEtML9LnejqQb8X8leu1yLe4Vo6RKxN4rAOdwjIKWHOjZ95IPLcJUjM6RyY/tjp1pSqmHDjXdu6q9QvKNWuzRQzZz1CF85KYmXx5Rx1eGedInYcmRhIYq9SDZzSTtV1RBsLDJgU5EwjwuFGO6EIQ1rO5V5JddKNzhIFhis/dzK4uQizNhNU1GfHgwiSLqjCOuCu68LlfQdpOZZdHnSF3d3qGg4K6ncXBP7zfI5FSdkdDabprPNlHAVvc7PtJkyMG7x+kCfarlQT8qeYZIsUo+I2JEbDLRYQM+1Wpylq2m2cyqVq/P4QUSp5AJi3O3ihKDtAseqlotHkE+B5bWQ+GmBRucWDDwvxQvvIqw/ELniJONuRfekcxt3dhur9+IxrdLNbkS1cvnOYflMQpvt2yfapye34Ed3OFqGjXYbG0hV4Wpvfh+ZQd+x/eW7LeudlLsqOmqhSnyir1kdn83cJjPI81wuv70rWGT5nz/3LMrbiPz9gRse37xuDZ/jd+db41+ZnrQ2f8fvW7h7+z8V3ecRpzRX2fz3DaQ+TtT8HO+P2phD5O1PEjl78yjK3Aa6gVkdULCWbuWBnT/iuilm1SSczI/vvXJdnePWPuVxrN6w8dI5O/f4qgtI9q7akdcVvpMtakqkZcdRG0zP8qyVuz+FVB1hT+vyswng/wBoEjD71H9HvOOk9SmYPx8nX9qxvJoLM3dMRi1VFZk7xqPy4yc8RKkXfUb71mk3z5y2mtGiay1TVLAR/wAlqrE5kLhdyLV5HmuF1/ev1FbvUX7JNy29EoX7BthktWjQlArSPBd/zUjTwu63MDvrqis6ELa6cpB+qnSugJECotTZPNLhzjj8iF6otvOXI/NKOjXc27ogwRMdTwkGqIQtlYWFxqJ+BaANRJRV968WrSiO0gZxshKuyMWBDHUOYa0troqijK3eJDO3zxQyS/btcV7V9IOVHO85ocONCFYHmWttrkY1TsQ3nFCFX6tSW69Z8yxbH7PIOH+jJGEnNguRsbkG51LoHDk7tE1kcTWjPxLJaicFr9HJlSidOxE7EbUk6+6Y0pv4hGssjrT1bkyJ5uSUJ0JQhOCKwbFkRMVB1VTjWzure8A7SXxS8HSG0KH/ANt+6vlCRalFiqdx4xJJK6ncrFMIl9l1bPMQvJyH5YE9BsLk6yTiG8EovCR2szcmVbM21S7sck0dvOgJF22Eu/evOe1Pm+UNsajE7b/S2bV8roDUUJQk6dwxhV+2/dWZYf237ql6u6jot1pyl29gZMM6NQ2Bdi4w49BNyz1Zusg21eOs9m7d17/duxEojY5J9HP366xSKE6JPGHMOz5nBksju8PgpYxZUjFiBHeUcOQo4qoNhkPpw9Pz/Jl2tMOenEesFc1/OsWufHvr73rxBB2gvtLhfWCVz1xxMpEEiYmKTR5RD5s3LCZKF5JnYe/V9upe+N73pyEDRWrqQJ3aHdxa508hoNJFJiLgdiOTQs37bD+1/Fc60o5phXgFiK6zdYi7A5tYHdoYXJ8cgmceO1FE6+he1I3OLI7nNB8+8lqKwXSt2ca2D0a1Dt7XFpdGrMXGBci0PbKjcvPkllFlbvpFIUVnuv2hzzaQlMvG28g0JEwSxlnpzF5XYyZOgG2TOnSOZb5RVYTqVM0wPIFLh79FeNDDJBd5A9TgkiDRK1X+kMOmir5LMO8T/B+EMNitjgu6tWb42wLkzpnKHOMZ3DaEcS7NcUihFMpUu2ET8+znxyOcN+LKu3ra6PrVyY4c/wCC0TPYi/kugn0PMj34iSXeu6rJoszwybgWrPXEhc/l1g/yOc3KMMNS1IY+TsQRycy1uRy9+ZLMDO5kScz6wu2pRQR2duIo7eS03LbdLHzqH7QWSZUnaNSbs9Hp+EE457xM8Yi6PQiTmcZIGJ5CtRi+QLarkN24w/tv3VKZj8H4LSANFDayeN6tSc5zPTY7wPh8Vhb7utM9bNskfPkN8dlxSaKqovlkW9SGF2RtoTlowcpKoLJ+AxQws9SGMYRw2y7Xn77ta1swz4qZbP7IK0tTqkFoohj8ISY7cYYd6Pb/AK0YrktrFk/ZIs/SFQzxbVbaxBdYf+R7AT9yiFw33GQLjybHomdzChfQp8ff3U9dfdjURB2ynHyJIpwt5sQR1Yrka1JW7P4f23ml2U2dCC466/R1ROC3u0e3xtoBun0Bk406LRNHeuVHgNHn1f71jPxVfbWspyqraXLEVAfc1ieiGf6Oj0rbrOLLLWcoqAMKXBa2ml6fzARlXPd2jwMPvuVeOICRpUl0aVXSdUicEuCCfd/zVPu6qYiVQLO00IlZ/Ku870V9M09UT7hxh36q30onYggYY9xcFeGz7JGlNgYNX2+uuiBSttZ7LWPWefH3rnVwLJrDKKslbHWNmUBXZ9aoXPFqNUw/Ocb/AGUVVjqB6Mr1yrU5gem0vwWY8XCo6oOvcDtUY648kNV1/Pcou+0lSN4qnYW0fYWCOGdXfRTfup9X7/ZxEktCBlb8kVq67ZmXaE1CWwMU3gBUifOYrIaPCIiEFTQEYQiEPduK5IfzVVbTa8kkO7oBT+Fg2aT2R33wcB/alB85ynHTp/GiyejUicZh8PiJ8S4Cd9alVvaOY6Bd69vXdl6Hr7+uuPtqNXWtoztS16nfxP8A/AbZVYE5udYBRq1uqcUVskeVWc6HBB1RjDCxujHrWvQeMC2z2jMClixKnwxaYjHjz42fu+S8bZOOnEf9kD+kcQpy2jKtmKdJCuNaca8PeJpSdjm6pI9ifOqMru5mEZgcmfi8JsQcI6m9vHTzStOVJW86RTFMMb7UD7pPXgvR0OuKupZXkPVHWYoTvabP8CmuEdkpwGPl8761FdOqIs2o+zhtgz0hTjXT42/BhekT/rSpS89OduwCXk+1ya9xjx+bJh9/sp7xny/9LEdFuzoMFtcoKEWP5B7eFAF3tdO0qTDbvAVk9HQ+tGLos1tjDRrYOzNDW2MDWJxNoZAMA3gLE5aRkbONIvu51mDpsw7aCedZUuK65y6F/KNwOqqV7Beqnsp+PH1jLE9eshOO9ofrDCaZGfxdaTOoOdUc6RpieUXy7lNgbDIHkx6+yKWzn5hao3a1GUZdVCv9FJ7wweWHbfdVbIIjCsUYAtzXq3LfQ6bZweMYXo6VpFYWnSWNhdag9Vab7w+pVXrC1W1l8l6Po+iX4QnCY3S52Eb276qpBHRVxXBhtK2RPxGP/Oo5M6LTS25b945hd+c8NrTJ5OnVqUYv1s1HtU7DEVI1iFb1RJ9Z8oO1RipagagOYqfvhjY3R0g4OGH9qW4tmSNZ+eZHhPM+p6gdL44wM08tvbnBw9cUjRs62YsmuuR/ipv5KPL+3hv7hMHdqwbKO2hxKlWU8KRc4z2kZbFK05jh2jFOxQmvVyKsjlldWtVi2zm9nod9xJfEzIgaPblacym6PpadPAp+gWuBIpW1mQAx60+taqbKHkguFTQg0ilC41oDBjx/vqVnW2nabaqaDGH1ylejnPvr7qfnvDlAw8c9qRixjTHUP4zZziujlQlp9ftDHpB0FomOG/WSBr7j8etqpqxmyVqhPIqesX1/iJxvHHlgN0edQtUlv1SOkMMwA6JGh0Y9Q67iPscy4O8XMUZ1jjRTDY4CJw/SrmZWzcLhLZ3LkrJOvQIl/Pj8Ki+I7RPcL1E679bY/opDonTFrljrMXKYbOWUR0cihZ+FiFqhBRZ/w2K2kPsgganGvCh8cD5VRySb46+E8rVv1LaXh3aDqcZAAKdwrm1FXOzvuievUtFltoOPP0DOiqbsxjcOONa1x4V3UphTGle+nCRxuhywm+ZdwiZz9Y42S1O3itrU36c7vBEWrFQuDaGSPk9RBOMMu8+s8md33LZzJQb24tYFItb46klRkXiQAx7geQrJZtIyARTYMESkapl49VMO8SRGAiYyJ2hA+RMnZEf56cRxjFKWaJpCqbTDJFM0RTpbq54m+JmA8nN/1oxXXsZyBH91lDv9s7nGnxYbbGhWQ+Fx/wBaMXTOiaIo+gG2QwUgyNdPsQkOJhalSF96foONzsLXT2lxTt/N/wCfu3eugoiX0vIwedhBn1yh+0K02J2YN2SfZW6kVO64uqKgJxtSO8I3QXKS2y04y0apDncifCAuL2K7fFW/y17ZourwRQ7RPuGavS8ILls5uWfnT93SnvQvZ7pei193Jy3rnl/uez4BZbjJW14n5WTv/EXhea+gQNzw8SZ+f33qPJxnGOboQYZ59btZBR8a/tCa6fhIFi1iFY54M3+Th1oaTko6DZ7S4GdbkuORu+WI38Zhdo6ywxqyXrLaZHhooW1WppD3V7vygN4+uJXyXPu0F+DNeDtH3CNQmws/1cddZsri1SnHywKiD7OJ8NBCOk+lzIwA4gOOJFcb3j/08C4R+1UFZzuXcWk/mXNTEVUUW5GHr/lhT3bg2TzylWhG+TJn/wABPRjT520dFylpyslcmqlZFXkOrWXi/oe7yi3qPcF3/NTxOeHieHIZyDiimsTiYfOmGNgmtXZ/LzcM8a8j0EnO3ImOpq8iWQ2TIcP1nFLSaiqQHE3aLadteIX7x08WnPE18qTDjXYVp2HYU/f0HomPiMI6O23a/Z1rdCOTCDUgLhU8gopsxWNM51Y8bBNGUdsdOxy1BJFUUkEmdtVOUijkxTqnN2BocmSt9prM57afs604VSG0T3c0hgklCNnHhIw3LVg506RO/FWTDRyLNClW9N4bUkVbdnCIODlPkN0idA4s3Wz9JOsOkM/rNP1Pdv3KJm2T4nXv+CfmDPOrC+t+/CMRB129FNBzp4fmCi+eEI61wjEEYlFy3Q8Wf+MXyyZpTVzovkCc2sj/AN42RnDgRO1fiu7OTHTcljolq8RBcUKEDknPAI/zXd9nNk0DZU6vJ/8Ak9S5D6ZfD2cVZp/SIk1aR7aJQ7ZhJNLyuotiMYU7Zs44P2s1JOri1i0WqIz9ZlYz8H0DjlYUNRsscnzOr68ZBZIRv3LSsXGJRMchHt/RolIQn2B3h+ZjiNxI9nVo1T2X1ERUtJ8GA7lEWeDwuDwm++GGWjTjM/OIxF21lfBNsmbr6d2/fzI/ad+ZeoRTJu8UkkE6a1QpM5+vAnClfZjX4hYi83j2Vv7YL7QhOI+hPOSxTc6osoiywD2R9i+mf9Xrv/V5kB22cR2Xb1xl/J/sOlrfYOEf8nqPON18uJiur1szngKQdSOeCw9p0X8qaUm8V4EyE+Naihbp89udFh4zEHGe3IzEVgcPyb996rS5ft//ADlLVpBuOfjiOfWofd/261xaqNWMc2b/AERrqdwZWwih4CjSXid8tXKtEncYn9S2l4nd+/YtPn8nfnU9+bGCL7e6+RPWoSTd/bFao5bod+SKfpvmY9+da2d56KzfpHmO8RBmiEaEIWawuAhCEAAtqaK2qqnA3UBnfHRpGdRsC8Bg/SC1XMdP2oTgk7dsVeYOYg+0Vlm620IHyDPOnd96lihLDrU6+kBONMUc6FtRUNjeDsI3tzh9VMnqLQsHjZGPuwt+1rszlAWBWq2jV00v9kM8T9GTVRwIVnOgn7ydh8L6rmOxPNvIR7yWSO+cFRxpWuc5t1NXhu9tcd1O6lQuZIor0PVfMG/ISyb68sXtw8OLVmprp9iamI7BGGv4jhtHFd/Uut9bOVm1UydEOBzU7bTrDgdrgRBfndcrMspWnHLD1QDWQguKvjr0g3OHStrpCdVVOOYJ5Eh0EwhW7a71Knmh9G4ly3C3kylqQlKEKl6sf7VSvX3i/tFujha6VUebXRTJ0THKJ9yiLSDKpq85nGBFDpik3SQEzhhA37OPsq2/Kbruo3Ou4N9IYrCutHAHQwYG9V2ruo3esH6c7O4MRCSYXcRwEblcOFd2FPtnwY73UJDVXb/Qo9LP7wCDfEDV9mu9S15GUtpGFcN48y1UynTMUmJ8M9Eq564U9Xx3dY1DcduRKHkraGxjpolyZScvJn+cFEg20MEy54PKL2r1LW4wXU/IhYaDHDOqhgfHzSZZWBd2h81XdioU4M9ioM1zHk1hU7rIjDZS+CEJwzz49EbupTjYbZLS1qmOb7OK4qelKnp8qQbpe6+PUvjScujOWgqm4WWbJ8jMbVcj30DbpMWiULCWQbnMinyOxn/jF6st2lTHayB7JBu/OEhjdepPtX14xNWSBCuXGQUIKXZNIOgGbHyjDECfNbjaewNtVWSutMWkHFCtkWvywYyR8onjKAJzBPt2ZZDdV4UKVsTpOMiIlOf19gPavdllKJ1byDZtpA1dmauDnMenWQ2GCZO+tcPdTjh14dVnlnsGiwcejRNn/jHPitrQ3JkyNrJaerCjhasc3V9n+DenPZx1SPw2bZ8iRP8A0c0uJEP10IC5dEspusKPtMnSGeh7TLJxGJqFwTQJFwK/FURnWemyPH+FVnPWC/LbmjJaE8jncSCNUXKyx1jF5ynTrjhv7qcfXvDkizkaIkXpl5fSKYpD/wCMKn6z6nK3scdLZqHafB50pR9kMlX04FGGj8PPjxr7VXGT4/p5/uVoDbTGyzOxuqLIWh1Fqx+tAdIm1GYD5Rp5vHj/APUqr0mdh79X26lMtH+37W+of0Wt5vvwwpx9+PuECuSiKEiTo6zKTW5Btbb+w/8ANW+h7+z8VoTPy/VVvoe/s/FWC84i8tFnoyfnuD9K39sE5Z6PT8IJoWTz85MA1DGvat8g2qSZOH2iPbqUtUHUeBMkfCKhSTO59/e5PraZOHndaYZJmi+SO3qJhTUyrTUDr1ZLVUiM6QPzbo8yuMzzvlr5FyXsZrCdnpHe9dPqPcpJ4cgj+Sw1pSgVYuQxGG9KVueRJalaDi1lr0tKpbKDrEm7CDVCwgVSJd6/HWIqiyd0OqPzXVX8pLSEmEuzy0YeTC+Ofpd4M6ONBrljOneO/CC17oVmTTmjlgvj6OmT/p7haliPNdbqK4EIz/R9iFawng1Oi7P22oqdqh/PrZjYCWAa4OnDf6Qv31VY3ipKjaw2rDgwpTFNl9wP0+P72tPdw5DG8HN488Uu/fBM84ycRh/HlYUTYQ8duUfZMaoGrV0prKVrTCmHDdTd8d+/7hhDyz5LZrRLdEyL0nIMYhunkOE6eg3cxqLHIb55QhQmpMP7TvzLInAQJF47YrJroHyKeIOjw7uLqZpBwOJLJTWlHjp/NG+PUj/vSUUpSlMKAdqunquvcZjqHCdCF9eJz0j61yrzU1HqKPePlfGaj0/7q2+ow6cHcf1ZOgW2eIvxsb3CBKzaBbYUsQ/6b8piv2Bg0Q3QX2i+ohSlcOIklIhajtZhTKfU5jmyGGmr4kyeff3uX2tyooNon1G16Xn+TMTIxa9SX2dFSobLbjfKsuiwzl5ZsnLGmr3PQ6PhFTxbuHSAL61eCOJKbMNu4OEjD/4CgZDKTRcxpJDJq8/eH677cVtC4loJc5T5DdgC+sz47pu+xJUJ9ETEgVhSs6ltFD44V2xYuN2LUtoqOx2tKWs6pe013kii01WpM8JphA7SDjC/cotMMnHayJ5Rd/TuSyc8ORwY7eS6uhbWJqDDx+9RRekrV432VwWlMecxJjjTCu6m+mFccK41x3UrTDfjSWu3luvpBzqGxiJ5eaLn6Acf1cgxTyM+TpyJOsSMfJ+H61riwyZ3Vu61mUqpTDHeG1d4i91PIKTIXJyAnU2WZWROVpjdUTuPUVM0+1UrGQa8abfYgOEB/deZRDJneYj70pAlVHTh1aMju/07+rOJkQdqcZdg0gPdqjFRm4lpVdA/k0+RWm/qrww3YY031pjhXHcFkOjG64jh/l6ReSfOQai+hhgvzo3t52lmwVz2R3348bUhhZzHUzDj4qHZuSuo5zFPqN0IpkEpqYi3Oec0NB3pEAflTyFF9oExreCJA2FdRpBod2/Dpe3fLbEnj6WpeB+P8sfYFcayjl7iI4lyG2IinOmS5eQmca28M7u1ZiLgCUJdza4IZ3Kc1GSHAefxQvWpHqS0FtdG04bBXOZbpuu3dqbaVpYR1lTz3cJ9i2QFvELB36R6l2q9wZ7RIIibO7Vjl7yRYaPZLbKdMpvAJNbm6gKwpGtn+pq18H6mpQWR4I06CFj/AAu5tXLeoDeJMkecOOOQKXsvLqWEwPDzv4pYZ2ekSe3mXGLi6sF1HDlc6ialcSE3c3upTCmFKbuvfjXGtd+GFKMVxzDubXceVUPOO0cezgzGPMEcU7Llt9SVJOqNtBIwQwmEjgth5Fqpji5PkZA5F14kNjE5U8P1NuVN5gcmPGxcdg0u5nXoY+lHaMeSKEfJN4HWHijlJreSNVnTp0/mUmWf2aeGzRWzvGqGNq8FmPTeFe4XuD/q9VUc4KdI4wP9ieJLaZmZBBEgva43CXejl8SpXrllRs0catXdy+PXw99N3qEbjUtc78/bZ0vCN0suszcrUa0k0kO9tlPEwhfEt6heABh+Zai/Z6Q5T28ifi9ElYHGfR0U2ypE47qEjxy9brQtlld2p1TIpikGQl1cy95sdTd9bKMSJ6saIcLzMy7KRpkpyPBhjjXH10rTd1YesLMFqxqbdg2NyzdLxh/zzC6sGGJxWlFaCyDJId6jbp9X1+6/ozsnEhE4sw7+kL/9VDUs05ZjYfkoypDxafOa7VrYihseJToOsBgIu5Ifiq+215WVoNpc45nnjwDpcsq7Q91yppa5rkvVTyfYOZBjjy3Z/wD2k/urWmHdjQW0tOqyaLZ+4bFR5OXaSCWrQcq2m6cYf0cZOLV4E0xuMePpA9UunMJjrO0g4nFF4srA4O7yinKkA/DF/kNFPguZb46lbGzhA3Nzeuu9imT5R1ktRMhLxOGrasPERjdDyfSJHLFJpOZtbRHHHbRxDHfKcvxKKYYb1FO71/5B+jUbeYxO3yx9pU7JSdv64ppZ7kpYJpBtHt/HKEYtnNaKEB9IP/1r2bqVlajtmm5mnm4ZshRNmQewtFNhAYCJ9+7UseUta2HpioaYhfp1q1hl3XN/8KqZNTnLqKohJFW1CU1tsODICJdPzsfALfdr5L91/SonGxcle7Yl3XdXGtC1MUm/kJ4U9Gn+O+vHDDhS5dHGhyOkmZLmvknOHKLfH5QTlSLW2GjCNr8xltc9k0TwY7Dwdf8A2ndFUfnZ0gwgjEQaRituDD9HpynScxInkRO3uexhnH36Q96Wtzps6fPH9UjBWBbNsxsJVY7EnOH6Zvz7Ropna1u26kfYUcmfpfTGKc5SZHIsEkM11j09SzTg5Wkp+AkFF3ldS6MZNORo/O06TXFqsYNLEWLcHSO9wP8ArSUXVe8FY8T5Wlj5PCTtnEDum9Y611touw/m3ZKUV0sxyQbUbTmpkfW/DNTI/kz+EaY+Gx1QjfcVg93JFdY7E8l2z6xZtxLfI0rU5Yu2VedC9xcO1T1JzIMmQ3M4Oyhp+khzsziXAhYdvnS5dt4Z0HK2pZ5vRE3burHv+71DE90aR5G4s7diTZmXhIGfMySL8NI6zFnksE7P4jpStyfm0GTybvioxk2qyKikuo9Lx0qU06ruRVsklILUxRIKxVVrXBdwJInTggdoIu6buTlWk1Jac2sYYBG03Fk4EO6G9Rg8M789mBafqIoRs/qdkjG6KeYSm0GTIp8efdq2OJvIn1CJaIVJtB84aNrW+Y5AwmVhVT4w+T/1edDCfXoX4BadNo+bPMBcKoqpzqAoWPJ5Pbu1EXOE9ywDfHynDXEPkTbIqvBPGiD5N5Prgl/wUkRZqIGPsJMlaDxHbF6CVZWZhmG8eQJ+CYZzljm10HzBWK5rr02mTousPIEnCC+p47WsrnWNN2csRxFQOgogt22xjvgkaTNaurqgTOpu5I6s412+W2duNEbaVw9SNTzmCoYPjl56bLZrbKIo+c1DOFRktRPPCN8FTS1/K6cqjz7PZ/Ig0tcPXFVaUKI6ND07PFQlRfBSZAQjTq0gdddv61flu6KHj3UzF3HMnToFSJvP7xrDR9+j7cEpUj67PNm/ZSJ0xaeTliPALdVA49LYpzf95Zp/ERlXR1cKtp+VT55x4xek6Q/MacadpBxb5F0I/fyLUTCw57cE3jtYohInHC/pFwSSTJmmzsPGJRd2xB67oK8IyzYOJX2pg2KnQ9eXjy8cKYUwrju6q/yGubb0ZW9a6JvJLYpM/TDSt9qiuKnq1pplidTBCh6OboM1PihA3fnRhwYcGEY9kIQ7FnrOy6rrPHGQ0Va2cFrci22JokeBwvzuDCMORaLOkybu90VIUVYaYohMN8i+r6B927dhu924PDJozlUk5BDKfwGCPXvH507vzCGE4wkDugzrGIl+LChdGHWpasysVrS1SdhqYZCoDR1Fu53k9vXT2yvJFs4s6kyHeoRxa1qj200G8BvUAvfStb1nmoVdbWOafMk93GvV+IrG/wDSNZFhI6h+cqz39gUc7LIMka0e1uMh3P8A1Jo4vXpg2HlE/wCqhrrRZXYlZxYs24emGvyoX6XqM3b6hPW+GP0keTqhC7mhrUZP1eSQZM7x90L+xZZui+Lu0iL6p0pkb9hIm7/X37vUMLXrpNl71V8DbwiTjH6Sm2qn5tpylZ7hUDqLTw2G2ww3e3qutldbmWmV4dhv6L08LjjDN/8ACqB8uq07PyQaHb91+19iTQViu5W7G1s9BTpK/QHWxLJdzd2Nolwfp9L6BBzNrB+nHGHOBE/VilATw5eOn9H2qSH83xM/EqGDJ2fuX6WwyCLBngJtp2uPXy2xNzhtMnfD7FeHJSpdoHs+tZtPdzsK1xYiKVjHo5VUKpKPeGswFn426O2YweBXQSsKcDslsPsYofMf01c59bV5r1OA4Al5v3Kn9IUms8dt4ZtXAi56fZvr9lKijrfh3bGRW8rEMRQnI5YrwwP0KWbajb7QCMJTFq8caz03ffFv2v0r7qoafrN3OnS55I84WoGvFel2Tyg3rQ62q+bWFSOjvte1lbH/AKvGSJhruqqdh5Ie3MQXkCCPvgo8hekAwlj1X45ul8Pz+AVyUlHPvMXBDasnRMXpi0NFZNT9UbDPr+p3RhpShBIXmVEbvUhWNUrQkX6FTj2dlOlBtQuOd6ktE9HfwoaaKbtlrW0anAWisB2stip8rGiBnAa3AnWtpq+pH2ezyR3eeLhoi44QMHyc3ADECR2VSVdvcMsbZpGpSUU3FoTdkT++ta+2lKdVK4b750faFYybtdW7NcXYspuxy8hBqFuVuVFV/WukAKPFFa2kXQYYkYY/+KUcSabs3qPP6PxQjpuDN2RvblAJsmbIM9r5o3qR3h4pVq0J4HzytrG8r432jUljIscwQpD0JUiTY2Quff8AeKkty5I7E9J5s3WZE7Ji8v8AcUDm+0GZTsIR1u0Pa2RaHIz2eH+77laJhkyako87TG14QUg4y72cdRWH+jLO4gh0dCxbrwwwQYwcVPWU8lRE6Dj0hBK7u0fQaDxm/tpym2ZLFzZVVSFyCQbPmiaPSFROxEi5si14K66+MSD961ym3Ixqxww5HGxcCb0DLddPSXWQ1tDQDommBCscGHDU4/WilqEJPld1jzuk/p9bTe2zOKrmkSek4U9W7/X84i2o2O2FGHXiD9ApiFMQTbY+Hjqwpwfo3rrvlJOUGTJqtSIjDjdHaE1bo5/ZVyxyb23HWkU4P8vtV6fygVSTmOwIFoHn4QqrKnHBWcdKqHlbSbAw/wBMn/qYhg0x0/pyKY+BHOONMjfwvqy9SCTuh1R+aXSd8OuPyWtw/I8wiMCUJPI5e/MiRy9+ZAWBQhJ0oQDXagdX/wAmpTcmQJa1WEPW3QClQzPq/wDerO5RVSaKps4fkju6U15E1H+B2TvR5BEdpquE+qTf4hQJldVhh4T2fp6lgQ/++OmV05py09dh+4TBP8BTVrM1bpv0mPizmHNh4n5/Pk3XKPXKd5+/qitqeJy0NynfZ8FumNRGidI8lqM40N4nRjn9/wAlrU7dHqh80/uU7x34LWzfx+9LJ55qGeIwROrbdIn+sG0yd8PsWuTp3fenEycmdY5vueq9dnbjkiiBCEKswoAhCEAAhCEAChboz2nV5TgUhvpeqn6nhROJhgnrQ0oSpF4qhTmDmIOiKyyHnCBzEHXz8nlUltdRVLUdYP8AUddVZQtPtWoSO3t7g4kK19p2ULVdKv0gZ4sXdDGwveZgC3BUUyEMrKlbF6Lq+gaviUGK6vsiqGh4BhfffcKZ8lYKdbVaxa25yWCzHKJpcR0dXPBNDSfZrBhcIp6aQb5/KKS71iU7IhC86c6lKYYUrWusTpXfjjxw4Cew0u7RVIvqddye2YSjW1mVFW72NA2kUO1eDz7TxU8F3ENA0e4ww/HRFz4tPs2nUOHPxE+GFL24OFy6sszbbBY5k32pH2r1611tWEHMg8Mtjhdo4YjkXP7KDqph/RNSwDxJJFqeI2CU60RXLObWdggfXMtoMQvb6qV49dN+Akvy5uddHz/9W5WXP2BTWm2edUj/AIdv41AreuxWTJYw4Mja11NTM7DPrXC4ws2F9/ukVz/yXqkpBqd8O78aMdd5y72WYBtEhhkaH1DYW7ffclGn29ZJm08j5Ob+NK+oeM51aLR2BAnOLdIwazXkSsabPgNhMWJsLs0ekMAqQ2qttoLVkaWstDiOL4UNRZF2C9fbvCCP3fNOLhaDGxfK5kNHCuEo60DhNVLOwmAux7g4RjAEr+16leB/ZmImcczv4IzsxVCNPY3hoN1tzgOQqEpVe0XTA1EynbH1LsnsJv1e/hXjT4bwwaQIdG15YiEUt5kcqTj6ZM5B+Q3MSv8AnR+EUs1yI99Xe5dBsqjIKqqw+LrW9DuvhvZiLC/Bx/pHSH1qPbBc/pJkmfJ3rU9mv4G5WZJCHdZFPqCq3iLxiFS9k+Zh1RWOVv7YJXI5e/Mr6huoNyXnCpxsjBydn3qSAvEdPP2rQ2j9gt8C/D7k5vOI03oyRVq0I4p4Q6ISHPeJ6Lu25E4z4JALzeSWzhylTvHSMPen4Kd4n58y0+TO6t3Wn5u898PvTesiJTasxzxBP1m9STgHIcf7V1osZfpJzPI39q4oMBk4EyRD+S6n5Or/AIgMHd2x1LNOmqB18dt1BCNOsRReDI+biTctOlZVY5ONe+I2mnxZFUh/w/8Ad9q4KzvMx+rQX6aKmYpNX0FVdMEw2WoGGeyGat+IEX5kJMZ2DkYi/wBi7/Bcv0ZJJVWHk4itfRKEPT9+n86VqKn0WyXMuGPjKPlCELVYuVF4IPjOkz4z+NGdB2pPE6mn7M4/AlYXqW9UVTlIz5VUEP72VElqjjqdiDHjxCkRyqqmwWf3nr1wTOg4VqarbV58PV+cRmSytGUTNxLmduWVTZpkLyBXuTo2eGdiJ5WlfU05Ui5NzU+tbg7yMW2CQ1RWn/mzv8x9iWyZweZn+I5PgltVtops1RTEPJKspFs/b1LrERO9V1IGC5SH9np3FtkRcDtoOj26Cix+bXj0w4NRQgzqVjr/AKOgsE6qXchikUwRPF0ZisbzLdapcm57gyMFIaSLF4lEQ7U44j3VIUcW1SIV+Pq/AWpOy7S9UXjjXeA6SWUhOeV8CYiCTJz8nkRP9Y7U5OTYY1mT29wkFCFCFbWkK948BTKqKqC2ocEyKeEOjdJDHnSCHDFFteKvMwPIOneqvBye7mkUzIJFbLtkDN3QivZNSGSGKfT+YFwpZXG/pCCd2Ku4MjG6MPg8xFFOt52lzQbnAD6qllde3rR02pj1ceqtab/d+eImEZWD1RIlw5KRM5c5jarOchydggjxeyd0OqPzWedOnTzJ5Oy8ZxqeHKczkSQdDjlCbLgTOglfaPERVBn03FVgxTr5+rXzrLxidHDf3pOpzoqiW7wWn1eS9CtT4KVE5oaDYwuP1eqr7XlEGyO0OfVT8/z6g/WrbcjdMjsDYnZzmN9AghQyTOkTp45OLEK9+SdPTw8TnxxOdyJG0llXb0zSd0OqPzXdDHDeG15saEiejA+dPNyDBRmcROh1b+dSNVNn06lmYJw0qKXihpEMH9YUfTg5wM7aJBWvUnJ4fnd1lSB3A4osYSGxhnLstRdddCrY/NB+jVrdYxMk3nmBjyPI1R83QDOhCzByZx02Rh5GLJjv2DSCUhtGFCWSQzJ+ew0grVrvv1InSvMXdur4IBSqtEvOCBGlk4wufJkYieUXhBedOQYc86EhvGwuK49femf9ttMj1q6K+f1gCqKyCRP2RxI9ltFMVYOT2PUFUD0UKI2TzgyzY6zyOUVb63V42wZ5FLwwwuDJ45/2VazWodlEihaQd6RqJ8LrkvPxq6mzY3t7fz4VRPJkzu+5RtgzrLmUkXFT0pmwIQ5MmFU61pjTdjXHjTHGlaYVpuFlWvd7vR28RbwJEzqHLkVMQ+fOQ+AmtyrBhCkm4Da4l7DtwN6hpyconTsTmBRIe5cieJ1NuUM+QPtey44zA8q11SNkizb0wb1DVpAu657heE8rEKRPskAto8MHLPDkOGKKKE1XJZWs6i9IyPAgF+EYsLtkXvU4YhafJk5/s+K8brbegm6XTyfX4iOpPJC3ZE7eJcl/d5ZDjZDDHKuHiRu34EMPepTruVKaggGeRIfYxLzGDDN1OP8ACrZLLLG6wtMqoBvsgpxzLv1l1I+RwDcwEe9GLpU5WSWfZKVOA1/WI7pbBXeGkAtDucDfTzB+Cqa8dJkRbsk1iGhNe+7LcnToeuHHqp7/AHYi7IZXYomSYv8Azmdfm6Qp1ZZkjV3VLbPq+1d0/RTZjdE4yBvk+s3Dt5Ft9a5VtF2ZU5Ps4yaaXa6ea/XKuhDygeoctrtrtOtaZp7vVD4LBrDdJ+DZ916q62sM87P7fhI8qbYuy3t1OPLOkZcp8huQ3TxogT2+Kvt+AjklETbF2SKXRzuTlzh+kvD9VLkdiMUWUXiDtijpCCmaxvJwtIthcYE0+1FtLELmIVHUb35Pb4je6K0GTjk0z6xNnVfX0jwfpgQbAh05EEtvcKuVkHe2WTZ/oxnbgRaepASGBaKcBAwGj/rfwTddWlF9rz2zYSZTuCdM/YJ7O+v2evdgJ2zsqRuJ35DiljPJEhs5s4Z2dss4yX6cn0/SGFLfbrjK5NA8oHqJq8yhBHynY0+3hExfLv6R/miaPcI+13qLLWq7hVVRz3AafixYQwIfRzrV6RYvDySdTQDZPJq6EMc1GcI65ugP7Lf8UwRFnRzZmnctyUOo5xznOav21303d9Ke6g1nZeiG17Pjm0vPE1rzp/UGjz5xh04+A8iF+0cQ17OnfRslrktZA89sdsWLxSEce44gj3NWStBBpyiWKmXVpaqbp1yqAacFBqNZMdGI++MCbtfNv51BVn49SODm5gNFLsbqUSNeIW9BfmwB6BlL2lwmkI08g2TyJE7+vfhX2YceNcRPELkaf8WcLCM3OE6eZP5oE46AasfYdk415bCWETgI0/RxULzKiNj/AIUVcGxTImZxy57vafIFqAm+6AkYXt0F0TYGaQ1ByWhmBFEGFVOaQtPjdkgeItDlKftf5f5jJd66fGjJ05b2by3J/nRBtleTFZlY8bIcG8LStT+P/WR78oOKsZODnes8V379y8g5NoGoifcVzc6hisLZmFiEdCCHQbEtV94l/lE9ZaVVn7mkdocHMsrXtGxr+afZQZdkpiWm3evlljLKCYTH5tBvw93NvUePFbzzhMS33u2LKwODB9QVT6flWg2qlnu1o8pyomjoOfkdnYz/ACi4D+9qwAYTdSt3g/IwgvKInc9vtI5WjdY+dx8aezERx4tqK7zjQ5rC8PblPeKwdSojF8UpAL0eB/GLd22cztQchvZ5AogvqYYSNG59tOcCJ4ogvLyqC51sNigMQm+RUTnWz4XDHaIZAdIRb0+pNXMjSjdApj5OyQld3t6qe2o8ZQ8tOU8wIY4nTPTh8wQRv48vHIMx03tYkMXy7lSp1ynraK9mTmizOyginCBRcZpmrAsdwb+a/nVd6pqW0Kosb+k+2fCQF+h6VcLoQU0iNG06uti9WTRU8OfWKfBP+Yu21f0fbrldy58lf4jjoc/is1PPs54d6/a2CAsPbvKAChmpMoqwhqnAu49ROdbPuJugYCCqiNMmxAFvc3B2kVLUL3EryUGeeK4Obh1ci1GdCc6zpw7PRDY1XFbjQLoRVgwujdi4XrSXWWrq8KcCI0r99cPeLsh9BUHGZ/lI8U5H7pBbUzLehmYjs9mT90GHHXqplb14/V+5TyfBW6HUnEOz2tnXyeO1tV32qxNlmT1POfcRW7qSIxYXibIdqxKl6KVhWCipIMEy636xznEqhltEOjvO/YvC6z6HLFb6WsrrysM+3tFIC7XqxZ/k/ALap2TJayDGfCDUxQ5ePRcL10noOz0xqmnEY4otSdJbTPs38qryX03TDeRPRgRPVf6deP4Ctrj/AEpZVlJaiCRLqxypk5JdqhHGZ7CJ75jlvdN5H7/INkHkV8K0lCFY3YQL710tk0rJIk4kjFYnrTDWDxR9mVNz6nq84RpbGnjhkY3KNL6ZLylKbCgoXWH5GUhBA5H9JPSdKYahYpP3RElSWAMNpjjIf6+e32oCIC4EPA+T274KQqOydbJWOVHR9ENgvMYbt7itwo814e22DvUDV4KDFw8j05HU4x+tLZXJ45O/Yqwc3DcSyNIkrk1Eidgp+RT8BWby+7tolRiu/NqydkpshA5TjA2qThh7oxitDfqwDB4xP/ktPrapJ1OSZGIkLnXa3lCeOnjDz4btakdlaPnl0OybOQcIG1pa6HfgTForVLZsDThx7fEnC/1wub9YW5Pz5OPIGnFCLWTbaq5dqXdKSIdIRpp0JiYWLywhHkvUkZLNjMbYrU5Dc7Sf1PpSGm6vjzYfiTUtOw9qQujOBdTFwoFwQ30wrjWtN3s314YezeNFM7Wt6w7dOu+IU6g6WWG03PsQyfJR9QAF+E7sJ4U1GH9IxxHExfkuSdbV5ONrB7qcgcUvFlaoHeUG5dK8sy2txpdtHo+mJwohNQDTwne+G4dcaKkMx86eNu5epNuhG33kmk8uyeJzjw337/dSnV6sAssR66te0nl5uD+evzc0I9qR3x5k/o1XQWkZ6T0fBORvniOv8UkYW2dVT8Cz8VF+mDP6vG9rWg7il6RSKKDcmdQ4x9LyUhdM4fl51DmFrsleiZ1cVtIrFw8rXFYKm4m728j2pWPys3PEWkn0wz6hbNLGyAYdBDhDUoqDqptpWNktmDNiWl0tMJA8I797dTvT7yUtJrW2Wc1VHXtYSIC1C62g1jPuDfAfJx7M3w2NUYkk4kbppK0NnogmYv758N/wxw/zE9QjkUFSOHB+bRKbWn+mYURnZ6fORJk+YipycqPomsTM/S7qLSbp64zvno6H1VNDPZ65SDLyJGy78Z6QbnBNCOjmce3Dz5/NsxOUI0jbkivkbsSa7P0TE5ZBY+lW2UPoNnHkbL4jXuWatjA/HjkT9mE2Hf7On2hGLPyapcCIbK0sU/8AtAxarJa3VU7GYAefr+xW87k49mus+fH5tAbwu670rC0TIN8hT5+aKX6BAzzqVkz5OkB3VrL9zif5RSxtoN3kQ28HC9MI3wUPyXIzdn7/AJK4FmJhlRNgQ7hI41sQabrcvWEuhZZw3bZFCeMZA0Z2tb17XOSJf5kVDl5OToCU7N6WnRs3tgqEgjZWqmCGS7dHEEQiqdU1Jz86R0di6F5RNOfoRyeKcswPnwErq0ysfCioxAo+rj64/cqbUrTc2EIxzF8IQvjfyJbYj/y6o+unHmTqHIlX1UpSmPsxpX3CRz8cpdF2s4GJJnTbF6RBI9LB7GcRq2Vrnm69a1Fn8fJgQR9e61NNUtE6iKFDb588UR9qsm43k0e3SNl79aiFtk/b8VJop75Qou6b+izYfD/MXzXVeVmbBD5kv984u9kfs+IryQ4RjHZI3cy3T8pNVUqJtltH5nFlCin1QX0cv3rbMidhmz5xzh9Xuiqk5aFYSaxyiapHHn4sWlGuRS8bo33ZjWYqGj29J3Tymt2GaZj/AIfiKx0gLbdpCWb07CZCCqKEIWqQ7orAShJ0IHbWohRI5e/Mn1oaC3uo2xgA1Ob++j0sIIDD2gvCppk+eh1xVvcgWzaVaBbvIf3GRi2Kz8Se9/xBPE7vtUPvS4E7atWQn1eKCfxr1U+IaJx55LaE1Hb/AMh24g2ttK0210+zyMI10+2SAgw+YcdcZ8pyqtOVVPGju3rrFbC/aKps4jP7/guEteP2lXI4jVq+Kyb+j5AKLSKs4v8AnrDj+j9A4rObk8Bcgjd4nc/ao3eJ3P2rdnKd9nwUYv5vjta21GfzDbpemOnQMM6drn7r/tWtTt0eqHzTzOzPRd9iYTJ3f5qvdIMlqGgyXTFdbaQzmTu/zSNZ52+PXD5LKGGadxeRr5+ZZFea2VkD1YEMcOgRoWacHOkX4mR1LCm1Vo7qts65MigAIQhJQAQhCAAQrQWH2NsFb2f2v2i1RB0LbLKmwHBU4x+kXAh3KiL/AGZatTb9ZwQZP0vZZivdAqsLAg3qbwFnObkzFarFKrWuFCevCimHwrSocUY1JdHaHDlMn18//YmLx/kw7Dm201+tMf6na8UxsDEACEIbC9vPIcIXxV56ssNobJl4FpNsw35oz4WJFks9aY+j2CEIaoQh0xuj1QVGLActZosJibSNnFmYwjG6vuNMia/Y9w61u9vuVC/W7Qax9CRp9sao3iCekIxIStpYWkE901jznOnCVqQqnL6qZd1aY8a1xpXdXd1i8tE9tqzUs217nPHE9L4Ampuupw9kGUbSEJBXBIdISKoDK4J35p+zlc3Rcqeh14+1TOBgNTglQugbXI48DpCHSp9puARE+5wjENsqBi8CDDP6vII9aU31rkg15Za2gE0jwRqpbMLE0yoRLtJAEc6tsslbdsya7B+cqKzs2cla9eCdE/Xhwpu6+qgvjSPZLV9fjNd8/wBmZPOWbxnOK80qw0qQZpeuDhRBi+N03S0NHuHUuvGT1aRZLIaGumKIqIl2KDhqaDdbiuW1K2QWm1XONb2iiHOBIsbi9Ng3X8v7dWJs+yYsomkK1p2rmlqYhCBiYwNhjhYX88FDdJrO2JuOMyfTJSKkLyCa0mT1fniHfSBaNheQ9gcSSaLghc5S60SHli0JUj5adZY8Uw1YzF1k03xjdC8gcu9Xpq0ySc4cEYeN8RIf9pWuW8v1a0fR89woCnBahrGGq47VCKqtaDbXlCSKKBjTFj9MUo+1Br0u91ZpDAe9LPzNGWu2Ni0UaJ6tDOmTMsQnGtK1xxr6vX1jEVxzCtxUbsOTrERPzyWJWNpsaHnEaVYo0Gey1ez727yh7V8FxVfvyfVrFOOZ4pFV2dU8xCFXh1HVL4KA3YddgMnZneWuzeFYVQQK7Vi7Czwnh4BhpDSBA6pTbxk01VabUk94HqN+qEksrYw4wx8IKYWTSkXcTmLTkCoJkLkOrUmOJyd2FaYcePd1BtjWbNdY8U5y8gVIYckeijix6f8A+E9Z4Y++xgsRLg3RJ+uXqvFX0S/UDWr5RD/HCP1PueBLwOrV7WIr2kZONI5PRgNo1utUilxEhjqbs6COvrGrSPvVJKvrV3tFruoq/qDU6VW542Ad9+j+QIRac0dPnC8nVtEPTu4hNPec5KUprO5PClPfx6sK44jjJRsRR2js5Mmc3jzhtZ5PiZC3AL8PuWttvmZCfv2P7yuJfqF+2SjRCNwHukpx3PzrxtbTHxy0OztbpULpdsYbIBpBxirHWHZONSWwxnvx86NFWdiE7XUZwPlJw91aw10IZ6osTyew4U/RTGI1Rwu2vHpCoT/rRip+6dKDSGeHh7XamevuspPRp+rH8KerHDEN8jOy0mrsESQzlwKW0VkR2/VGJInuDFTNKDF7w6qfb3D+xgqSZuQVa0DKub3uzp1K+vFgQirCh5S0p1MjxpSyw2zBnSZGIxYnTuVKzF86YkV9oXMmT6BSbv5jhr9JsJkpREw5PVVZzWtljxIb63pwqn3QviZkI3tzh9VMVtMnp9x06T378i6DGgUpabTk9gqdqFqFjLhdhDlTRysynWH1TJHHn4tjdf6OF/8AiveVwLpITvWJWgJpHJJdWHQP+e77+qbM9JiV7Qh4KVJkkR0aYp2fBj1ddy/NFaEzwpyvK4YIRv0VXjsDr+tr9I1Hzb20GEPsXAbKVZ5rHb9a0ND1up8fDm8oJL+jYrVteEkyrwOnm/gU/wAxWOjhaiEqs3oIGQhC2mL1Ff1k/bYf7ftW4T6VMHMBb8+LcXxPA+UFtVX0GGPPkE0w1P2F0ZjjMamNaqqCyYxSjZM4vHuX9UfQmyGL2xqsloz9Kz3gl14oV6I3uOJ9qTPJkmDts8/AiljcRTPJz3Z0pyDDcjsQM3yCi8Jt2DQit3hGsqkvkbsW3Z7HbDlSrDpxyBbyIa1IVVMPgdOBPZ55WrVHBH+sKHw3KcCbIIHn4XCFcy2R4qRye4j4j1RdmayK9EV0D80JVATtpsbNeMHzQ3lrMQ6SpA2muRhxh09wn7SVDbMdC5wSOVs88EkiRi8GVI+xJ0p/z3Fd3LvXbhwFcLPFV1deucw3S0yqadrCrzXemaPFopsKhcI0xhj7+xaEtyksLaa5Nbe3nXiliSMYXDe3kqTabpVtZBDn94nNjsKWToTCekHBv96vSBkihDNkiF6sKd9fjXGtfbWuIsmIsS4rwkTueSRPNy1ewIC8T/or5UiPAbvR7kQRmIC+EIs/B472cheWfTqF0vPIr4F9dmLC3wDpbye44hOb1euoUctk9Z9AnGv59ohtLbVQlvIL8+oc5shs/IIQZbQH6l3vwW8EGXwf0VTEgJ21XY5w9qXrDV+HEwDvAksYQXAtAkYcQI1rRPq315IVxbtkGDGjWnV31rWvx4hzSuqdRuHy8xykU+ryB9Tp3Vu6lutEyaWnmSSanuw0dwYW5aVO2idicxuW+MVnrk9zsPn9E4QXXjda7VorgptJ8g8smOl17hR8ksCvFCG6J+gcbq8SW2qsC3tBxN4hOow30e3jqGjA4AmT2+M/imw7Et2DfnGiNNtA8gUu7yJAz/wq0OdOxE6fyr6LRWlP7IP99z0dcWpfrp5JHoK9ghMnIyDb5NOYilp9T6VGjtOC0Rd5Qj711rFStSGU45TyB5ApcY7CZjlquf6PsQlZcV0VG7mojaUxsLthLQBDNnKJSZjZu34xI9OWguNOmuhERxS/CAaeEXjfZyFhrVyYzjASKYxWGw22Y3ctWnM7wOFIIJBhhePBmJtkxxGpeIxSNT7U23Kh+Vuq4XEH8mpUmdPpkzl5ZPqBZJnTQcCQNP3+w+kYKwIVCWT1VbHSFD0FXpItMVDmIGVFVAH52BcO1QI5MLw1ZjHhFCYv4qU6EtSbaJoSvqQhRLHUDpVQuC8IzI3ODD9VTJc6EnqKOrfUPrehgTDt4U1m/jquNA2MqUYuzsZYmRPkH5ZRqldU54FVpUNIaUbHUVqc8Hpdlhc3n6luU2mw3VxkAUuCVxXAl432hQpOnTvt7VNdE14G1M7oA4NWLxef2w4DSEIpQ6LJsIxOlVDKKk6+GPDqE90ZSdsPpZaJuTmWRzZ83TOTJ2A+tsmlgWiqGCvovhdYRGICp3Ba6e3ciixnZ3I6dPIpiRi8IL7B6PW60hZlanbfUk8ej6cfagKLK45GPk1v+tGLoPQeSPQlizR4T5Q1orYJ68ZQlLHXcH8VBp++bcsyqiDl0Zd8ph5uTl793ClOFNwWUdxMrLtkJZEyLJHNlMT9cP8AsxQSlbFLQq+fWukKYBKKJK33gF6Op+BHtSufR+SxZNk3u8mqMpavqZf4iC7FSLLAtwhD8UltTy6JwIfghYgxtVFMYuwtBl3lCKoubUjxXDlPJqCe6OxRe3Yy/SEE2JsdI19If0wpWLjMteQTlLn9/V7viEa0dbtJbFjzLns8vOLY2m5bdRwDn0hZC1tdmtHwF2NpZG/XDs3KCWyta7qNoawHB7fXYYV0xwYhsNIRiQo4cqQktQemMcKXq4nD0jFXFycLDq8r8xrf28fwfo4QmRjKifI77tr2UNObuJsLR7BHftk0yJk7Z+Na4Yca41rX176iwrJaLW9dp/lWfYE8ubKQRK3WbVVaM5wYKfY3N1fS3P0Rubm/3opXvs+yaaEsCbgqvtgwtV1g7Q2OkMDpCnm/q9qJUwVtWjNZLJnD2QNbW1NmKn6XeLrnE+P/AK/jSpFXlp9VV+4ydIz4OpWi9ZmA8o9uYVX+Vru0joEbon2SI7W/nj+3u91feLmtvRnI6SZzy63Js0V2jH/WROdrWUI21i2+T78UX6n/AFeqiOU9yBDiRDScRSttEx3o+He9MTk5dsY8nMlc6c7GiBEHz3MpsG2MTjcG8FWPBW3H261TYsCU1Wbfjx9w0tAQMHaMd8m7LIMbdJMOMkYiOzceuW8h1c2sk6JFIgktT5ozQkNQmj4cutYaQoSo6/d5DBSAJJRJQ15kdQFw66B2b5K7RSsqfpDEu1TmZiMQ4/R6j97XjbkBXUSymdXdzXt76dwgekfSxbGjtnsEgfO88IhOxnJjrCqqjkO9r45IjXAW4Ms0/SDi4Lp9RNnrPSrDoAaR5LhqDx0fKK2VtZ5o+YgRPxboILuT9OMCauMca3rGt6X/ADd3usF6832EidD3D88bw0gXFezzb5w5SJk6JewFclsvkQIKuF90jDetcf6qktMmePqDhu1qutsGUsw2cTpA+I0u6Fl4ENnB9pUFl2fWhZQ06NT2nnulEsRQuyUIyH7vrZkFwh7MVUSTlZ5TUs68Dd/DoJ441/ONRGqMq1abeufIn4hJ9oNpFV1HKpb9D4HhXB2jc7mfRzePyrfKao8JjLnuBJ3hBU7tdjHfAeUD05GPFK2Y0SCTUDo10mw0+1yAhIX7lQisMrWqqxcpA1iDIU1NohW2VG+A4/SHYpdAQUxcyVGEE2yNyY0Mqfhv4Z1MPhh78Q/w9rS17uyRVqM8ifiOL4v9pNH2fs8+NbubWwQ9+iqt8DKTqip3Nzb7GqRJf2zhD3FVHVfC0e3gx5oQ5exVErWqaXz0l+q+oYWq2h/m3Ot0dIU/BREZV9SVFIizjTxWlsxN2EZPJ7erWtvREzOyq5W5SnjUpUqGNO6mFK14bt9PYNH2j+j9brJElJU+0vRNdRVgGRKCJtIr10tAdNKY2FI0sfACngfdVEsTJxz5PIzHgUxOpMhlLwIJd4A63GkCrN6Ffoz6pAjaJMGa58YSAioTKf4BHL/gx1X3ata0qdJnVE5OrvsrQIW6TzTOTR/UrWhmTduss2RIYiWXHWVwISuO/m0qd3fWndvrXEacta0msYudtVAxEstN/f8Abju+G/djvwme0S03hPHDamChamqV04TA2aFOqEzY4HD3f867XHpuUL5mVg4js8gl2ffXDDteA+qqfrPrOG2sZM8/Pi+ArUTIxYnEKhq9T4NY9Ts2rTZ7XT5TC2uvB8lU9djvzo8sblFCXTblrG8joEPze+pt1OGG43CuNcccKUw9nAVtd2mS07BRPA23XO9IUV9s3s2qmQ7sj/noaTEhjRC4QugrjBWVOL0XPPfziS3MorGllw1buRTPR9m8lqnT8R7NsfSpabW0Npk7RhdfYqNunSS4lHu1NqUxwwxw6v5fiMRXRpClrvkNuxKQQbStjwYPRcpUlUfJBh5gVVitUy9rDrMoQGZjSrQXSG4Oltbd/FGKhNpv5RO2Cvpxw9DhMVnzYWLffGOkKjRDaO9KF7mo+o1MRt41uR/n9gjnk2RfLefrZ1R2fMNpulW3EPB7W0jCccMOPUGPGWPk4U5mB/DcV1KKKwMNCeUFwNcqkqutzIeF9VVPVjmWVdgzjtIR/sSmYOiDJza1EVRPbafFFzGD1lgVCfh/71ZiP6PMXFVJW5ZIx1D9hL81FqWJom+VFT7Ocw6nZUOWLGiJ9O0xYQO2Wl1hUIu4GGn29hH5Y+IWawywequE8fpgyj6hKqy0PhbdTlOXXU7QN/si0rJYpCj6WZ4VuOx4XSv9HHd8b/1icPevEerKz1V1tJBk4gifCH2xVQSyTSHS+SdqpfRVdV9Mp6vVTqrhv7/XFr2jWlqy57bgueG1Pz9mI4iN3Ndcqu2hW5B05unwvEjco9tatgkyAzvH3Q+a511hXk58Mn/NWLo30TVlPOH5ObDhYej7yr5+/EtWwZS1U2mzgSScIJhGyeEH9XIVZJ06cdOnkcnXevJ20dFyyLWkBARFuMyMYhEpExqOGiGjJGmzkyJjHG7Mz/Zb8eWu1+SjQcmx2wORULzIuqe0GHhU79PsYq5g5PtkDlbDabTrQRI/VgR+kPlRmHR3jj7Wuk2WXaDOpulR6eZ50Nrhdv8AZ1QWmCQUuWfjNGjA/SNQ6v4fbv8AcKrvRZa77mYWmx5Gcczbca1MrCr3s8ieVdAnk3RVZKkcuzv3+K3Z4Nz8Z5N3wUPvxmfndMOWMFo+AjEYmOTatvREKOul+5EouJ8lMfRk5I1ZynYeTPv51Ndm9KtrVNi8VfJuaxGrw4q+MNcINw/Emr+KWh0rJbZ7lPeKhn+QaTFxxgf9YkepiJ+taeJ0htkUfnxS36oXTwqrwyMfR5BHEmr+FUJvGYzKrL+AuRIZvgWiLKOVnl/SdkIqVq93rG02o63nwF0nASe9w6lntlZ5NOTrK8PdhnWzoB854d9ywWPzpIQVqjwTI4pQmCCj7wRsq3zKbZzATLLG9wkRxTTZM0hR/FVqi8kaQCDVtuUznN9fIehx316q8Gerj0h8x/4z5BVPSU7P4jMQ3b7lY6zdyk4Pz+u6/Bqsn7H95WJsUpya9u4Ucxxp0kBG/wBXQX3ozuR29dvKvz5+TnMH3RMs6b38w8lEzqHNkF1HVr4dIWJNEyfHa6xfZz4L0DyRMLd8Lo9q57aB8MaqOHcHUVp98Oir85TFUMPBdosDBNI4NNUWxD0U1whHlHhCG/luhCEL+hc1nLx5mI/vT0kUy1rEfzKND1dKZ8pjZOnw99KYC2P0hZ1Jd3FMTE6Gc5ihnzM+QZh/5K9VjNLGOjjR9Ps8jyoU5yOTWqiszDjngEe71rXqXXLJ1DaLHqPq/KBrbC6KpRr0JTocd7g4JGRqtYFuPl6E51dTIklx5Z8KJk/mIXoZeJW7V9ei5M+pTyJ/XOGLKoo6o7Wrf3UhuBKKbKUbJDIH09Ky05QlnFi7b4b2rmtZbqKL5HpEE/H1CeR7KqIVJbxaFXzuc7n1U6CYonibGmLGznWbIcHEgp2K5Yna1KYmyJ1xazCIrIFTYkTIWup6Z+/f+PH7w5wN6xy8eeKtpHnD5NaqcSFWtavFotUulTvEjjcMAzh8oA/sqGeTO6r4a+hacHu7fxUnUq26UeAW/McbVjKoIRDKjVsTVoplFv2KitriLr/XHXPJTbg6boKLwfsgwrXjSy/q64xVJUk2sakqKp7tVVvx74Z0DOBepdnrZ3gOyXJYr0gmeKIS6sXgsHyXEuG75rh9J8QHvuwguBv5IqitCjfyrMzN217ahESff+P2UFSsnvlu4X8r4zHOMWdj0/7yyZ6HR8IrxC0sJVrtRwCjP9H2IxnT/wC6kkrf2wX2k+o9Y7IrUXRCgOcu2f5PChJ9LWOOtbuEiAhNoD7POE59HyFxMkyZ09un4bayi9h3esEL9MVDU4PZzZfRtIjT9VK0cAyQM/8AQCb1mP8ASdnlkoJjbzev6ypj7k8PxrQV9esjzLdj4yirOVpVWBYZ48J932rkK8G35/8A/mV2MqiqZxrxOG961qjblvh35YqVaGoHyZbCP0xpXR7G/J6wiftD8saq5ePUYvFwPNrVlKLsnru2CpJFMUC14pz3Fmej6NYB/aijOVXLNoKxDJZbp5Dg1i2q2nR9bqn0AAR7qHyKYXBpHZQa5IaNTMvJn6KJMN3rU7vx6sRQV6MlpuX8lMP13xihdn+SnbVantDBR5LQxboVHVX6vt8exTVIyNbGqBDxFu9uoxToJvpyy3/B/wC2T032v5TVptfY8d4qIkRrhvaQYaPiqmOVVGT/ANuoorZNz3WsR/c7tNrTwIk3+9VT+VBW8jBW7a3m8sY20+Hpi0E+u8n2zrPN9DWJMTrH+t7RasKqFw/scmCwycsqtAYxHZ6csxp4USH0HQwv4qlM6dO3Z8q9I8/0fYlC1t2RGJkQdNTKVJ4zqKfCleHuEbd3U8X5hg2TRT8PSF0J2WLaEdI8sMlnTt7m+Uo1QWGVbVZPWEjR9o+TrZgYNuxdnZ5dmLh+KpTOeOX7USTJ3L13phW/2cLr6luy1f1DqJ/cG3yzJL0JtBSi4X6Fcmy0yTfZja+6WaP3/k5a+D5OcP8ArgLivYoQtfycbWLGJ0Savp2JdMQ4pXbJCLhRp/WZI3KOMb/032fyU7WZZQNo9ncmczt7rCoaYdthd6FqgHT9HHjdAaiUlo2ayFdpthxmp4FMPsrSn30rj304j2kmzcfrCOT6gqyhXtqOxuhMoJtda/yepJLTWLSLjawsKO29wj70wKj06TOBnTxyJGEKE44HuvVVPYtzHKnbrkNSqZt9K8aff8eFeodHrKrcS/YpbjUdiL66u7QC11Ew1C16Dq+kHz0e/txHqpX2qygbFkkWpmziKXtEqaxR9LK105VDFp6nv4R4kavt5VQhJ04RVxyEMvtMcqdI3bqnh91aVp9mPdUeovcEaN1yFOkOuNFZDIT0HPqBotns8rdiFK2t3Ynz87AdsNXxSj/g013PaJLvS7WLVbEXn8GYyH6QvVHMmR4f59rVHWbjTyvA20Ksmljq9nCPv0gPi1+oeaY0UczGjANYrUxUowzzdQF2jxx04yOl+64IyJdq2lQ/ZOTJkp3ceNa91MBdllaUmdhwf9ExxTqHNkNmKPz1YJ4HnT2+EgnYyrruTELY6KtftHBcQaXb6pc2r1GMLobAuh8i0iiJ7NPq93BFDJqDy5CF6qZVTlZLUbzPeB5zW0un0PgVb8ddPyjKdtMQ/wC90+WJ3O6aZa76s4qjYzb63KEpsLjaaCZCBNoroXi92rcunFimmJ7A1EOBxJZJYvMuMIdetk9ykRaAXN2JDdNUQl04ye7WjHVhamchrwhWE2O+OpUxpZtyQpEEXKiUle1yCFEJnY2/X0SjLTzZMn1Ra54f2GDw1MDxPFFdHX0Pr1n4dafW9m4dRtpw5G/cqw5Uhr49Wm5N1NMMoiD5C06RVUYx1QgM38c1q/06OfD5ehZ/ctV7ebRz5E/pimPh9U+T4Vw+8V9LxCKDRg+/bCiRDzPsjs8Ip+j6XcrS3ylBNVIhH6PcXDD/AGLlvad+UYtlfC3Wn6JpZrspFhsMYxh4QVn8Ny7RW20g4yWB0qCl58GupmsXGhmb/iuJOWTRLZWFB2dZUrMELT5VawhS1o7OF6P0hG+4r7Fcuj2ttysii+n2+soqfAx8a+k48unCuNOFadwjexLbGercmRQgo871G+1SZpep3tzqBzhC7FvZ+PcYIbP8bvzpnW6sLE7uknENDW6O31IHycv0AjUUImHTb15ugRW3rV5faOUdQPIfiOroViLGrMRLTH04+p/JNndJk42ozAtzgT/VQqg+SzuR5khnHvxRZWCvOA8ot6nytKpDpymwrMaRnwEbGob9YzAYXRf3D1wpRa7V3jhJOGhz5FV+3+zT3Y19vVT48KDSEZGyMo01HQbE6YkO1PKJeKihIp+l5A1KUe0i4KnGgGFzfEdQczmOR07DknFF4zXGKj1tMnHGz4fFdFMm/J7muocisKgkbLx4NRmVLbmjK3cCkKT/ABnP7e8WHGz1u27CHfoZSNyGyFCuj7PZzUHJcHaOEGTnGdn3KRqwg3WrFVIwtuZw2O2UTVg0ws9BhzzNn1c8LlQPypTfZ3z+ohKN37dnfvxu1m79OHnRHu5VPD8zyaqYTmcmO1X44P6wo3k02HTcmR4/7dS3Cj3LETvs3Kmp6iK63lZiKZl1kl3dJdgN2pTzI/fmXDvLVkyB8pSv9+1jtP8A8riu6ocnDmT/AJwXE/L1DzGUSfH2ujgTteqOqMVY36P7vHSPWte23U++geNHy2ouHcKZJOlCFusX+LLVJ+TuylWqTAhndaNrYYQrHB6DfdHuJ8f/AF60msGa2dpYQgLT7OX6lPB9s0GIYGxxjA8b3oxNNH2/ZQlHSZA4FcOjtcVxPH6RcetdBLK8st3n0VW7/aO9MLs50/8A0bpA0DR9Qv8Ad3+1ZufraUbVonISJUZBNM1OFD0U5e7106+OGFKCkrPZ3PbtVn7Bsofk8pI2cmccrqw0PPYZBEJ7CISJmDg8D6RXlnD9JB0o36KGdbozwcZADSDj9aXRGFteQxbReNaPZcLRToXsMCw4aPj8ZCXU3kW5MlfxnwsQtwKEc8LrEgeJUFydVdKrRm31F3xbhr9LJnJ8aY/gCl3O2N5I3W3qm2yFyGylHKSITDPaDsNIGEwpXMXpGCWNzDR8+TPxE9z4tsd8L9oV9DPydtrTGXsHgdWzXisdsT7o9yPWk2gWH2mUqGcM8WaViJGMeNsbFpBvgP8AXAVMkdIFhSqyZYp8ifH17+r3jta1nsJuPWlnyrQihC8lLN0xSMOlXKfOBxMgoSJZQ+DM+jlZtgo9ma5OHIkcbFiaJju3/PqJi4vEl4YpBDW6NWE2G97xYEACFKk0OdFtnDnupRZQjXsZbJqboYdSV6tiins9clK/5CwtBMRb0GtKv6xu2KI9ExxXurw5ILwcO3zysNdsdx8UzsMltIMvInlCbLseB+kCF65mTjtf96RM7looyQ4Zj37B/RykFeYps/0RlySeRS927dqikbHUzZRmqR+cnwyQQ4TysUGLgYrNodykByHGIJWGjyb1mi846pNMESI8axxl3o+CnKa5MMhhw5E/FlFpGhrWOfmemYTC1rXj7+Wkn8tK9DNlMftiMaEc2JqMOJeMVHZtj2DSG0JY/Bhvk45xjPFE1bk/M9Bh+IxPFfXeRYLTWdipyc1eDJxJYpY0cXjdwBCKuEaPaUzm1inq9n53ieK2rc9u6Nj/ACrYJ+TkVM+ToHznGd3lPoM5kHgxlNJRcZGExwGj8f8AVVqtSTqk0xPIzGEiGLcZgV5UloLvVMlrIPxUNFDaFEu9nW4M9Xts+MgcCeTp12jgXbHLg3q9QRTXc0Lj9gbVZK3bikHMU3lViJ8g6Wfk5xB0mct8Z35nBaHUYgGJZRYvxW+RsxbISZ/j8JhWzHB9Cg2dn5E6f3vTmk8QcI5RCZ61rt0XLI1l0Skqcpik7Yl8xhpZjExE8gV2xbZsl53lFvI6FDWanc32LZKVZ5VRmTxyHUQTV69ripZbhHbglxApmliqrgWLgb2RiLPh1JOZ8ya0q5MvnUpv7qfyDmrDtLwaElaIlYMiGyFycs4fwzMc3YdwwohOi/goHMxjIZHXxvbg1dayXJkyiKqEnt/6LY08KUVPj4RVvHR/2KVJP5Nu0khxxFf2o2d0+xbwy2TFvzjH/u6rpfSno+g3mpfyCfsJzn2Ux+HETW+pxO4rdinDc5vKKJfqHIKXlzakqqSC3uOGEFwsiMeVarPoOEgzD5h0dii+JhggFrqpIsayMLJZWIrC0t9tMcxNfg5pDSN/8ECs07K4s3oiScz2MWSsIwsBdjMgeJCCYC6VpGVps9nwyyyXiPzKf27/ALA/vIdW9kSYxS7mW8TgwqBSGQ5bLaMGCePSotnzZdfi648nuX9iU7NlgOSzk6uESbV6/KtKqgRr2ukQgMA3XdW5RO/5YtuJ0XQZxqNsuLbMDAMFiEhdFQm2GTj26c0ERjxnHQMOcLnBd14XSbO1y3bJ7K08DTdX3qHpjTDqwwqGeH0fozUsfbnJUXOXkmbk7ZBYOu8u9+BZpFLWMU412aUuILghBAgBLvgqFPFbVS+GTyXh1JdoF8bxx/H1u/g146RDjZWK/wBooeKEeAJ2HiCUVi9YkQgNSnNtWxalmFwiUSkofrr0z++v4iNvLKu3VHcNyZG5OnkGk6HnHTpDgRilcuwiwmbaZVzXTLfCMbhMe7lQOj+cAOneyDJGry0yQ11RXzp+j+zsTkNjdUcfqq6oWPyrG6Hol7GoA0VqbGqOCeKkN9IPxHWqu0n6XmbGPUjrZrrn3QMclObJ1U38MfVQTC0HbS1kX7iPjTOXvIynN2DinNSZMlmVA1rPeKudIVCwiiyINFIMgF7gf9aWy2p2m0UazUs3N8lsp8VqF2OnGTYG4Bb06WXPlQguz0AFCFTOgoJzw7ve/VyQgucTxPw5h2JnFQwhWB3qK2dGI3g9I/l35l3TX1/hT/X3DTejmxbdm3Z7jnXmdy26eTkCSqotXqJ0phrpPEDCMjZwYFiQiFGJ58IX6rt0N8VFM54nglz9ET3MW8TbDPpFYQw3J7cgWdnBKLKLKwIYYPr6tm25IFoUl4HAcDmu4sW/YoaQirLdvbRs5KjZ8omjU+c+Tv4Y1Fmz13Wvbi3kmiqbJI4qYzs845yBGuwmLK9e1K+7Rk/urJQpjXGoGsuh3SEXp1eI/wDLujdfd8IfBOpFgDTQErgtJ8RhCihLg6ifAIHuH1ZWuo+iY1xQbIw19QUKf2nGwZ9PXwVM3/pOTdJtncSr5vQ3q9W+mNeNK+3DjXqFE6R9LscyaNl7bc83m5QjCwyz1uIotscLMIvtPEFuc/whqKqQLow58Mrn00waKDuJnw18cdzY8fTlKCCaQ46ruXBquttmUVR9nLCc4ODoLitwYazq6czt6S9UGJDKVOb65+P59QxnOzEhdEud8vmOocTBWNobBRzEceQQKIMLuLXOrKJttqqpA6PpCyh0Y6gfq126OhDtIQYBucpQA+0JlK5Rj6x1M8SiqVsxrSGNFDBP16OjuV05FN2HZMtKDuBU5qpUaItxhh2qoXBWVG2/CWYq1clOV5I5q80TA5MadVa0r1V44d3qDcz1LFYjhflqdko1Sw3J1lU2bPqiuTXJ/tDgTPvidt7e3jp5tCynKVohyn0vSzU6Wg1jisFhAfR7eR9cVfuFlTWm2q1GEz2cgFUUwiQ2yoog6QcIj8y2uk6jpezliOpKgWSL++4ifjK3OjCMIR364qQPLXmVpPyneSeucV6CBD5CE379ZXhSlN2FKVxrvFmxFia//eW+yZ0/2WbKJCtbs8bq2bKXtItWnktZjUw3wo9ljj27Ej8cKv8AWlzyra02a6zpzRTAAtKUwGTcIID5PiugVI5SDu6TIxHpaFoDmJDyRwon6AcMPuMiqWS6LDrZ4qi05/n8Ki6Fi6TzYxhGGkTiPZmvo1KcaPdpgjrtrsR5tClNVTPj0615CaXHGvfXurh1jSGjLyu3RWZP2+pbE6PK8fgTEQ0jQhlUzdInwi1sYhEYu1RGxhAAHohetu4U6jAXBtADkOWhRJ8dKvAcRdPOEi7Vhui9bdagw10xh0+3VNT5FLshI0/g0rToMYX5iEIai4Q3cmpbdZZYC8VG2eGFQAkwF48z04D6QqD60rFeXKzPG1npZzkbH5CRUz+7j3/ZT3C6kXls2xEHnn7kuq6GsINRqRgYXp0cqmp1mc6DpK6RopgMLxb+4+9Q4N8bvjHdvW80fRLnVOYz8jC0wJxRo5lPMLPXF0qOe7u88oomHE2f+r1bVhpqEGEEcgEXCtOrpVSTWkLyTGN2reuswphxrWtN2HGu+tfXXfxGTNI2nt2tEEiLT5aeXpZ840+yWzeS1SQCSNcRcwpfqqpaJocOfU9YOrFSjX7Waeqx5UWVE0WAsUmn6XwpVorqLsYfsA/tRa4iVtW1YWiuZrxXFRudQOZRWOj/AFc3qPWVonuPSat8pJRbZWXi7Z/Z/MZ2pGu5NXbp4+dQdaLa/wAodStOMGHsfkC1W+4vA4x8j5OiuXVpGUTa1bE5T/DmsHPDXf0bYoaPp74qJp0mdPnYcfjMOJhggKZaVsfLIDHPqg4Wn2uO24M7ye4w+qrTtuaNtHOjpIjmqOdz4z8s/uEktuybhumW8k222NqyeD/3FBDQUk04yQOODtV12DBAU+03ZA44SQ8VPPa6Ua+PRxvk9xP+qrfJLjTdOSZ49LteKJh9L1Tt7gtQcqknEZ/SBxRZRcd26CfnkxMS3m8eTUJf3xqi0NBMHa6RH16PM6nhINpxdN04JPb6fa8WV62Y+ACHqR7JrNzbTDDauf5xUKNaStruh5QfiIblHFltmVR20VhIphvn6JYRIY2o6jv4gP0Lr1TVBM7SG1SGcGAlM0+LAGnWiEP+1Km9I96tLST8jRx874/TP1kp/OvV3ce4MOlLTS0t1p8m7V82GnyajcR50XB3ugULxQPe3N46gi1q1OTIz/eKlq1t+DY5OH5YcnMuWFoVYznUyePq7FFtG9qI3C7TfLJ82KAsqCSuJ3SWcejIMFV1gY+TuVaTNnSZ8dybTDPgrH2D5OFSWxT/AAnfzxaUoQQnbC/pFw+qrR0pKQNmw+3yKmRsQXa7umDt1oIypCiaqrFy0RR7UUVC/XfqbuZT7NsOYbOoQcbRnuESRRbzWcKOPbleNyqmzyzKlZ7RSMgWn2MMW6Grd1KoloY0HycE8VxPwZDqVICoWy0GNz+/uE8vChqmk7/m593mUIZqx+Kh+Hw9fVSm/ERxldFw3Sti38zjvEcXTyOG3RVljpW5LWLT41QE304Jf9HN/Eyo/NULyqLQvCqsJ+H4qHHmXSbKEqQOzKzeQzt8jCDCNeBDDC93XD2pHLHGT3AjnUf0MRa9wXA8vpyTpm5Ps7vgFWjKN1+13ov9Qg0N+neJ2aHwiorNjOjOww0MWVArA/7QJW7ORmfkz9UflckdKhwBnT6vIkFYZpKvZ4f1g9EeqrVckuq3jsG4pLSCr8opwjfPzR+kNwbZzZR8naDisLRHlx4uA4/URHExf4VV1nGmPjke8OE/FOhZW2GblJFoTxOBDBofHFFwEKx1YY6P0yQolnTurd1LNN0yaKDwmPokekURe43fPJxLfkJkFp7K2GSdZNIGhhcVaFay00rHVqw463XL6zINss9gH+iqYaQt3s4i9sgYZQ9X5NtHz+LFvpFcu/3KOMpupAq3tyqlwGxWp0ng8165qxkjtKMUgemsI3y/vnOkT8B2keYjvqFIT+PliFKJok2sXLD8UFF44YrdMMJLGYC3t8jCNdPFY7F/V02SWdtoimwG8fjJeYNMM+kdoE/kszPO2M4j3WeD/Z1Zdr240hYjUIdvpGGrdFliM7JWR28+SVOXOr9AnTyCK7X6kxBZw+fJv0pP6lBzbNz86PIstYPE51eDiL+25YaVDxDlu1qHqT3lO/W0S39GiYZRvaed3hcTmWcfPKckW0sNoPwqqRiHzGLuVscu60IOng6dsKp+fhBaUYSHyo/rBHEhU8ZMAjPZlStU2u1h/RigGuQ+X38fInibIL9sPiublVVe8WjTairiqJ9z7W1UaceIQhcljtx8rNJWUteZYJmOX/mVpTCnupv99O4Sa41UYqNJEofMp8r65xqrb+wH7862STmSI+fjuTAHun9X3rZW2TCfO2fVq+C0KyRRYsyN6hltBFYbUzye/ftVrsnClo1HWoUczuhffugq3tofx6da6oZGdB+J0vv8x1qpNKtx+RbXdL44DTtMbWshZ/Xw5CjWvyjNYSQWKzOgB5+1FOnhS7h8sYLlLJ89DrirTZX9oQlf5QdbkAQgW2UpmKIDhuuw+s1VSleeh35kq0LQPkPR+yQXJzihdcb9/eKlttFJBJsvUKEJOhWlqaiRo+cBQssrf2wWJZZW/tguA7NPSiQbMRNK2j2dNBPFXa0VpBiHCPva/R1aQ5RamE0iMeJi79y/PRk7ScdlB2Lj3f5dyDutd7bfjMDQb2RyLG36QPnGkGHj6cNX/jP/AJCCTCNHs22Y/wBoQg4rWtvEDqkdderl13xXxZBYpUdtFVaHp+eSI1ibbUVRm+jmDd/aiV6xUS+2p2gg0fTFxbnUBXHOVvHhxwpX2rur6bybKParOaRujETUWXf5Rf3H2oqKsW5blewrVraFs8uTWLyf7Mn7T+XfX1UqNOX1LqobNalpkzyOUaTaDabR9hFIRsxsgBiK2Cai3f6RfyPaivxXOZ+fjHwyeS4TytafX19Mey509wjfqu1x1xWoGSZI+7+5TSxrNZ2o34Z3J951a7znr7fz6twco2xEbXidQh6Q/pTjQzG0w7P7OUkfgfn+Mkfat2nTpI8eTfq6FrZr9Jkd74KyuecCkbptu0mXnE6fONQMomF/n9V3PzLWjWHMRn9e5bhOqqdP38namGa8TiOe7oXFWCjn1fP0SiiJ1GyOESdQaSYzzrubWtbnSZ0jmUqRnBz90OxJDG2SRJ5Ydt96qu49E8c984iT5FCCK6lbg35YjhOAblO/z/OlhjPyJh4v1qn0Wlw2jLEQccQj5ldESdS1UvtOuQL/AEw6EtT61FY4R3CPvcIq6lUMFLZZDCdV9Lgi0/lE08JjqupALU32nDD/AEo1+8rn22zsxJjyrqZSlLNuR9Z9JcbxP+ERW7XINeDDoX+ATeReUG1fWfaVILldlueMiESkzzJ+RT2U44/R7/dhvwEltpF2uoswr+rDmi8WWWjsYcSHiiKoahRNxhzDo+MVoq7zcKtaqymacg8WRVQRZ/avTw17tSMToRp2vBx/WhfxVUnG0ajzX2dTGUtk60wWSW54F2qRkiXQVQgfWog6/tUEbW69fmUasWxiPUPSpZyazq34V1dK09dK1+ONKLVoCmB9nIYihOycaX+TOoqTVOUq1PBHFrPWI6qYduyL9Bb/ADgnuU6sGf8ASrXPB/tH98VWHI4sHsOs6bqyqixh7fnYa0HDx8txvgBh1omWPW1a2Vv1lg1EQgU5luZ52EjqhHn1KqEY9a6rtShEK5HBS5KZ6ZN9OXjX89Q8RgZZ68RiWCPOiitRvLvJZ3SgH5qwtYNRJ9LFtMAb3GJEVHtSMLdZzJgRaO6EiPsYSIh0gDHSDh/FQXY+sbKZrhT9R2vs4LDT1tZdC4EN3N8oU63kD+tdS4gTsm+sKjeDqnqC0xrqF0KKxzuYbi3Bw/8AjrRNmX6pPbmiOrTJWmvrSvFTjXDdw7q4419WG+1LWkrhbxP+7bMp3HbMc3QEYvFs1VHbNT44tKC8zJ+CxNto9dhFySB6pqfFCFbIYCdferjUrkQtD5NkDuFpmu7a4BA3RirNsP5MezkiEglwtFqe/kgEEI3fcpo90maObepVvIKmU/8AL/yEJlpjSGvI6+5JUxFPrf8A4CAKJ/KPWv02HIHf2NiraAv0ud5PcMOut1j2UJG1uiacr9gkYtrqASfEynDj/KIBA/qov2qnRn5LuzKfhx2e0WsRRb+JvkRHBWscbGKDsrslZKIaHV0p9rpSGNDqKEdH1DAlZv0hSOiC4U2tLJanTeHNy+RWlMMO7d14cN/d1jijrnqyLdyuU6v0CCZ6krynHZiPhE0UQnC34SGpwiuSGVwJwg7D7O8niz9pdK3rCBY72UGxgaQiAONffFO9o9bzbTLP3utxqLaxX5rIkMtWupoF7jEaAsL4wjy74fFT3kyTptmdkr5aRXAUI6fL/VuG9xw68jbVNZUeWZxzrEWKQrfGm9bDdTHupSuPf1i4J3RcztC01pyceGIp0DthVCw78nOZe1VPlHuolPsXiDRKECj5QP8AdSzPguuwTAGxs47PR7Iw0+wicTDBA0e3Lk40ZSD9bRlT2Zt7hPwlMCuZGDZ12elB44yN3FhIaoc6a9Ky16N5Joa9l9Y5OnnydglO711/PAUa8R8l+Yt/3hUrKosApF1szqq0AZkEEtEp9hIfGiowoYBy2eH8lwVcnLHB4jlX6kq/iI6Mrg0EaxihMDBflbcg5zVOdB4fRLoQArn/AEXJZ1JMZGOfKVrUhiVLj1Y9VPhXd1CwrQuR2jEO4qhzasWEyV7MZ9qlpGHIB8gh8c5F2ZrcySxs8hoZ7hI71Rn8nMHJ8HLRHjMb3SQFrVnbQnLEGfzTLpRlHVx6SlGDj0TXkFL8A2a5SUkWbD5shc/8fLDROcpxE7Dx57oqcaVZ8PJk6vuiq301OxxnQrgM8nyaq4ulXYUSNx2unFlkbjSakMjmJ5G4UTkTbZi5Y4yf8Ny0m2CpJDVJkM45G1FxW7WJhzsziSN2FxqRrM9RbB39eB+iEazPUWxr/GbkifpM6OMIuXJb8pMwltdodA1h6s60uQx6vaG8vFrqWwGY7Pkb8WUqcflGqJnPlibVWDfIJxNE1QOcZ/q8chc9EkjWE0nRdV+Bzar+OmT78AxQDvyXIkcDjRyTu35JKsme8T07ulY1+jg02h1jrHKydbDrQJwNbWAWisQhIrpjRGkyOnqecCJHqu/V2Kl9u+TJbLR5jq7u9LCu4zoVPwhdDgaQb4diqNOkv9NmYhnnujSVzAn6PvVmrPsuC3WzqcD4QuZFWDQ44I+QheePz3qh0bS0j2mv5Rhn5XyeXorekw6qaz+eIo5G9pXyd5CuU5lmYqbUkl4apzS3vDVokoMW8P6PcfraG1yruj50X8Ce/U+U7cUdwtekF1TcrR7AsphxgNafQ8KIfS4yGRoqNkiJpLX0rPaPkIP0ZA4Nl9pbXVcRYa2h8PwDkl/+1CNRWTh72QMyUU45+Wnh/wAzh8cByWsmkW8O/cPFGymXmBS6kMo+0GzlyZHil62qcsUQqRB4aHzyg34hWcZ/yilu853OdyKPYTKXgLxQIHW3qmda2B2jUg4yGh/o+sGoXC6zYA6R0gR1qJvCp4pzHU+PPKEEvuuO9IxTpI2do4upLyiVsivj2wyvXjxi7192NjESOXkZCdM/746qx/KD0hUkmI9oFhLY6iiFXRuOEqBPrNaPkd1+xGu7hYw508LeRpiATfc3gf8AsFx6pWnC3wyficThRBfUgVJDbBxpwN0aB6qKEbChNsv9HOKjyeiG26kzQBXDNX/mKE+z/IOdk1kdTt2pWIyOU5M5F8n+MdB2GyX8nzaM/SG+j6xrFpdHYqQC0Bgnlw2lYHPI7ySB385n/wCEg6NboKTgTGh7cRNI4lc6KWqmRS7k1v7QcUI+tT7jWmH0c3wSJ+d51YPp1QOE8p2fagKx2M5iF2ro7uVlI/0fcDxNtl7WBz5/eXgI3RGJ2Qi/N7T4OQOp7b+T5ssNDnwpjKDgUKXu2IQ9Nxn5MJtCk4hut+FExcNjx1JhxXM5tzwJmj8+6COmK45fe4gKYJMmfo2eOQ+OhZQkZ/r6FbO0goVTq3uY1afTapieW3o4kLvRwz5NSX6mQdDXj8njUg7DFvHt2GDJxXHDqT3KJf8A8Nox2nHEPGUkw4oSO14Gk4QwBH9rVVnK1mqq+ktTRXtYVhUDYwNkAadjHU4xJUEvzxVcgzDkVG6F4T20/WucVaGljVYObhKRX6DclafHCnV8PWEd6+Vl4lF/Ou1HKfQLy+hkHR5uyC6JY4SW+p8qBiFGKJ2MPR4jd8NrT7TmQXYS61HIaG/KKiU6cegEyREv2dc86QZ5JzbPcKn06XdGfhIX3qT6beGJqnTh3CQVDFtfgsJfDyjzL7k7U0hVSUy3Gqf2Ip4Y9+/f9omFlaLUZuPYPp1ymzbHLyc/LyfxjoLOsCyOmuE8d/t8fnbaoMl0arEv+q+IEgtjs4sC/J/VSY5xpoIWoCaf1GFvj7UGr/265l1JVUlquuahBIxdJ5waRsBk51kzz8/hPXuPpn/2WXG5jj1WuN4Su7t7vhTD7xZMvott64pskC+l1nMiTo5x0NqC1PIPs5Mw7dY8w1AUJ/8AojBwcG//ANutPM/KPzgAyB6PszY2kUTWHrVFXGLdPz4488qDnitRhx/k/DrS3emzB8xsHG+jenyN0L2WauaY1zlX+2Vr92Ira4tHNIrO4ifOUydrpC4lSZd9vtpgWGaJAtKQEGxxhjKBfeoNtTruu3uTId3+sH11fChZEDMadc3JobcI0yYYeQUGNfrx3KtbrwyTo2To+Q6f/wDOUvhrMtuCeJ1gY9NPu/1/PUJgta7S0dG7mWXc/wBI6vs8nIJIpZykjsDUfT5BTq+li4EwQ7b27DrQ6bDMkVG6kn4oTGFbWGDrUbsNSGNU6Ro+OFKL2ExS/KY6vep0iNIMr7UDmWTIviyAwhDEkJ0WRLEILGdHpgft1/PAeQN6x9xR0bKrkMdSN6RSBjqrB6SkxI4qJrvv1raJzQ2zw5E/PCllFkyAg2gGOPcMOR7mrCU5kN1Wd+sFu9bMNnzEJDbAwdvqFwVn7NqkycLHi5DPY1QBFVugotxldGg/nQ7YqupvStG0TI1tJA7xUnTybk6f+bXd8Ma+ocmVxzlxS0k/goTXNjitdjOS9afWENMVC0i2f0fAnHaWqgDylEf6nHrV7mGlrMahfuDT9B0uwOr9SrZIL4NRvno8EePIL8IqVrMS61qSZj69bBYYoW4Nohr0emh4sfpujpz3V7edFq0sTjjBPo6MeVZ3uS+ZS45JVGYc1TUphqiJb08fXvpWvv3eoLUJKbXSPbc6/Mjk9FquhnN4xSin6Cq+0x4jUFo7oS7R9UChC5uAVhqdoakaUpJ/OIBhCDXfERpC8obvWYQ77k/ulY01SrsG30VAV0cqg2IUQLhQuz918Y/NRMwWcvr7MrdpdruFweFdF1jCOoCEdeFgnleXcyiGVZTZG1MlSk4bsd+77MRZjyeS2XXvj7Ay5BykDyPXLnaqUFINqdwYaUdA9OENLRC6ocxdxW+Gu7qSyj8lehHV4dHCuAXMtrxc89oD+kP4pWjpCzCiqVM0/T4PlSDZgcYduwyhO1rKKpqzjPwJwhbpuDDx/pBRllNy0m9PFWIVQlDlpTkck/59eIoae0oy0mtWD0akMimcocaJye7PLP6j8IQowjdDZI7nBvTBW2UJJnvsij7Fx42gWiOhPE/6vh7UUZPUAsMq3fKucsQzEfo/syuvMqM4DX/Cw9ZXRqySxOirHabg0UwDhY8ed3c3+kD9v1pHcjhpCLUcXS622Wpu1XEhP+ZXr6t1N+PHdUQaeo8ZK7fejwzmR8PgGt2U2YPw8keqLT3SFV2iFwvLu1NzB7qKrAGuQQMmN/Gt/QmByeJHBHnyAIxuDFjG/kXG2qsqO1vKLqQ6z+w9rdGliLJwJlX4HiA6iVvWtN3+/We6wqbdHCpzH5BEydW7u3YUw7hAVni0q82gXKtPyubK2qNX0fwXp8MrERs8kNDIAW4OJ5HQqm2TZI1V2jO8iubcSIFC8eDpsLdH60rK2QWBWb2E0SdXFYHCxfhYY6o66qrfHnVYq8yra8tAxFIWIsjpSjXeQylu8QLnA7k/hVbNrpOG9XURo1qYqe4qrpXClKbt+Tu7+uu/qpvD/DxEhOZ4mCJ9YwtJbla022I0mOz2fMgtQktWswQE+9uo+HvSoFJsyrW1SdG0a26qSRBobaIHCF0IKyNmNBybJW17HcTvCyqKhF/WTGnaQp2G9Nz8ZNhNx58+BZPRqgn+1KEt+p0IHluM3612z9+FOr7ffxEwaJW7a+fUE2l74vGNakVI0MQchvpBrGp+mI8gOpwP+tJqOHe38Spp7VwmsMdiH0y6lnHYBvBjdGMfshH4KNawqrRU6e3s8j6UWMQObRhQb9aIwuZQzte9M9JF3AxMJ5cVyYeHT8FPSRFWrfbE601x+hjyzqcMeNab8OvHdx9QvGxbQWuJX5Sy2XVn9EXpnOFVGUwIyN8a7rt1c2mm4cGfFnaQzMDV1WbtQ2uGzXa7oRv6lpFU1q5Vg5SMNIwgosZATQ0B628Dk+6Cbaoq6o7RHw5/d5+LJKhdgwvR4A/sovT0rZW2mw5EkKDfPGdn0vcHf/R9StuxMxVpMXBXO6U4E7Cf5669Y0TSRaQkeeflj6kn9wgsDSdGFObjIqW0Zy4NUVNEXBBs5cIHNwF+/creUq/PrUXOdx541xgt2Mj5QbgB4KqQdSs9HTp9QVQ96/ZN2kFEtYW2VVXGzjyNENfscPpBVM8tWUu9XJkLs3DN82T1JjLElA3jpklqNo/L5N8X/wCA6AuNpFKtc00kAcV2dSytcAdUVD9rWUXJsepWDg/nCF12Z/RynP6v37UV7sq2iPzTY7Tkh+qfDOr6Xt1OU7q0jHftRPuyr6bQlX2tOM+sKvO8HhS+OVHVPo6HurUvuI0dQmv179TzBM28/wC0r+zT/HCn4jlL6OGlr54K0ybZIivdR1HUdb1HOd6gNKdnN1KxsIQ/7oKpOpCxpyOkSHCp541KMWJ429+T3GH1VTJJhQlE41vYGvwqc7r/AAifPKDd/CrTHiqp0+dPIPnYsrdx5aFLJycggSPhUNna9W7q9VOr3/ASS1tAkRFZ57SS8MdU/ZGxSZtI0s3SR6Za4FkX7U7PcRT4/wAKGtdcnidPnYgifiycVctbNc52ZxO7k3LTzHKddelMXCFIt6/tFwTF9wdox+wRRMg3BzeJxE+ffsl27BJnbtJVE8AtDPI0s5upWgwwwd3StVnOUnMkEkT7vkuqeRDk9zWxnk2vVRI/WeoBcDSIcIf0fb+SCYb9uuNsC3Dyq3pa8ghPXh+cfUM3X1pSVx2jOLMWD2MM9ldIyaQaMIWVdjq7eIQux7iptf50lqDn36lsk6IbGHAe+7oXOvKQt+ktUiezs5HasOwsZOaQbiwpmOoc2Jzfn84DMbONkbwl94gHKLtO0rOIbx5+7eqTuRkqRJnkkT9ScqkqQw6dPIInlbXzQvU7WNWHBkmNdTV9JxUS4Y2m6Fhrx31pbjbEjrAtwlXHHqp11/P+o0KrIo2xHeQmGXWE6RvAM9hthEq0efIr+0eBTVRohWNaKcv8oVf/APbK/VVWktLFSPBZm8ciNcQIkBUjZ0yBXgNzfzFQ+K0qpZz63yJ7gAc1tMRRYxd6iO8n0/SI919yoHaDbWHGLpTFnOJEGLjgqjq87XUL/wD/AGyp00bJ6TJkjxY1chDUykp6NOndX2/GvqoIujGxFKeVrtWz8ro9s5xJta2tN1EmzyIGiWgWmw4ngdvo6gPqvtJP2rHkXMBtsOUq1O9Xzyag8ExZ9cFw3aOJH4mqUh75/X9y6/fkzaPCCoq0a0ciRtVQP2hBC+TDD3qZ6TI5lYGjqQXb1zulykRz/X7u6lOqlPbvrvDXLz0s+RxrTmunlDnly1LiJwLfn+znXLCpJ05XQyuKwaXy0A0dhnkltogusszdBUiePMkdqftD0d5Msxkjq69HPvF71R8iaN20VTw5xG7ljSJ0jD3llYrA4P8ArAlb5OnNtOZhvHOKwtnomOMDu9IPJCZ2fBAmHVQTskKeFuDhyOLjqWt1hOnDs7XT5E/SxTsV4VPBnLiSFK7jd4139goy6sssy2mW+cP0fqEEYvxhjo5T3Bw40WVtnLeljO2TqkeGqnx+MuzpgQ1hN/H71ZDI0oltrG2VqId4laLpQTwqWc5JJVu/Wqvy0zmzm+oQQhCtF1ybR+8J8bZzc05Qc/P+jLB7JsCXH6u1Ko9mUmdXFps93IkbNpOQ+O+pSy81qa10jbRXDfPgWTaZWXgtx/6OH1fitDyb+O1gR7I2SNfLxqKk6G2N7hYsa5eqhsPqKZK+3H7hbllQ6NxX7DxL755bOcSFapJxDwCOP6piAenjaYqpeNB0rhx7sUXmIXcqWVU5QPracTuFaSiDy/7Wq615Uk58csOPxUTiYe6CsG4p5K1rdo/X9J2frid6QL7Sbu51difnHKmqL9T5waT+2/eVg7GrOH2t6jCaGAHFEFQ1xUTU3TZj4ZEceN0d1ytW8Wmh2MUVPpCiLhbRKrFwNRPAML40+P7N9ZVWWc0k7VjXN1O6ZVlNyXd7a+qn28N2OIoKMZb/ACu59Ej/AHzjcMr619iOnNmTjZxhYUzRRMPCR39ueeSCqQ5TvHAj+yC6rlqra2+UY+P+1bVOnSZ86eRdxsojduwyn2iiFUTjFVViGIprPiUu+tffXeGZ7Ja8ZQ93b+K31nkrVWcPP5j7VJzOHu/vV3vVtnRFwaLIFV6si4qN2ohnnOxgLePDk+K7gSnOTYvYzUVTkSP6K0uQcGFujEj1Nc28leg/COtmogiRsoisR+UHryVTtn9H2Xjz4YmtnPGu4nLo4C6MflBZG0r43hfEZZTbrPQx/wAfspX3iw9K7xHyjG2p1IlzmHICa4zjZs44jjBJM80vkuII1JJJndW7rWGf6x2rItf0Ry0oUvD2CHRuu94EoSdKF0DwBZ5O+HXH5JAl2fk8xXwQO+uqJ3yX/wD84eyX/wDWchd57c5MSKUfNXJu5lwGyd52Yt2sXhu/4xZGpfoQtObdKsDq3+1wv18qxB+kCaqGkuLcV4asn/qCBSKv9OIuK9hQv+BIVbsNs2lWS2fvdXuEiHhNWpM+MTP6vb+SC5uWwVJOfKqdR92pdnrYNho+eON6oKPdrXDGsfT7p35076EnKs/IyFyv/SqfmlPdT87xorQUstcUs/uR/wCkGppK5ft//OSpfE/zXB6/vWmBfExz6I0J48zBRi5TvHdHxUqv0nr+aipyk+O6PgpM09EME6WklUFQzZ6HR8IrHnY9P+8sk7dHqh80mTFJLLICh68+ts4U56HR8IrOm9ZJPnf3fxSKHmFddTeOyyWoyOBshgcmeFEi7tWiGBqQWecm1yDzEOnci6bcZzbTGnpA/O2aXk4kq3/eE1ZIVFN1U24Nbw/xhBjs+E/SI7Bx3YcDVBbjV1auNpdRvdXVNDFOVQOe1whyLDk1NE4GkMpGp9Wy2dyGMPX7QVFajSuenycNr1RwOvkVb2FC0Rl5OTcE5xOtE/Z85X440x78KC9NDcck9dNm+T05TDdaWqSqqBfpFQUw6FNTm08ThHcujDlTlFZa9mUh/jI8H7TqVFudr9/BXPTMyb7vzo9GrWpBsrrB3sytCZKob55QgpZUgF4Dvv0gOQvb9tpWVSJPxFdXLIctM/j/ALOvq/HeLx0jaD1X0ceVgeQ5IJTsBt3YcnRyHoDMFOxTs+/rg7/RzfeuieUjZYZbjRLG40OQIJV9Pucg4Qu7eP64L81xEt8omdQ9qVYAXYvCPs+OMhyLork322VHPpUEYifixhMwDzKttIFnZiMNJVpKec15Z/p58Or8BTMY8VZPPKrDKRRHJl+mQxB09cmFtPo/wfeLoC6LwS5gOWSAIRVU93p99KqqhRIag2Q/yj9VV5jK2MdW3EN3rfFMduTlStKyQc+4N8jCFF8cMBWfrdm56yknBmzrJn7H530r+d4gbLSC7hNpbsD9PpFHNh2t+k2SGSWgex6srPcKVgduYtSsJZjlItNVSghj6pa9KF7mgKPlGKukbM4MiTPg4miF82Ngqr2kZQlNWbvrUNCm2EvypgTHfHiN0W9SdCXbXcjsCERnecc+txrX/qU/ENvlhG6FaIUZ51PFmFkW1+cs9IH0U6cVvgZgL71ltPzMij3Ug9kjUBOFkR8HNXlBbXQdbhVWxSHdvniltZfocwH6QHT9PzJELojx6VURneyPy69HJkN+d/V3BFD6ljIoruBRnJXgztYdQ0xU8kUp9dfTEOdSJlOUrNqqg59Pt+KwwYu8HUpChZiwsZk9wZ5GEKL1b9aeNJerk8nPuU2dXCitc5Ltj+ObPl6v8hJL6vxGbuc86xJ2sw/NnZvOeAbfqH0eOTiRKykA3R+tr9UoV4LYPHqvvXPcvI/oU62ej7V6YhonRD7jndp510JcZ0N3NDWn3Tbfkdf7yKdRKeGRHA9K9+IiyyyK+uXbnz5zZxXS0SsMDNk8H1aLnIB6F+fu1lo8HbX7RWjMR2Wpz4hfxC7M1tJMdHKe35+/F1lq/ta5T5U1w+URaX0kj/JW/wDo+pJMJszJDgogcxvjTD76ibW2zSZKtqZ+moLwZBMrMWP1UR/W1ZLZHiTn3KO7f1pyyPw5LVZLIb/WcVjjNXtCfn9t8se9KMyLz/f6YcV7agcodXYbheIOfSEKQn8BA50qHOOMvVp5OZBZ+i5V1s3k4gweEObVBTLaSboqiXTmwu9VvdVavZZFj+eoRu6ufliMaClE558OK8xEfa+RXYk5qjqPOIvwpF2BaI8sFWOwKzedpHSPskOOJPa1bY3Or5FoZ9bHT5WBDM5HAn1xS64I+twTqFtRFOaRLy/d+fvE1l435QzhIKB9GiUW2o+dJnhyI6/uWx2k0RJtHs4rahyOK1XTBDHycsIwUNWYvGIDHHz+/tVkG2dzdqqC4G542V1yHpCGp9mFfvoKrkUdgljj8uJkkwCdPbyONNRWBMv3YkfZFhkzsx2/FWgy1rPYWcW+VTwW6RhWutRPDYOP0fAkjjirGv0ytOaaXHbbOfQp6ZMhxf1rPNtaHoh2B0irfJ1pU6TDR88WOrUqZ1VYa8BTp8cDDffDmipx8PJ3GDmt+EjCPqQAjfyLYA7SGefxg6InLt0FUsO4vKFSxz64WoroJvhilqF/PEvpCnE9sd2qRPHHHKuFJxsSwfSESPrid7M2i1KsbRmVnol1c/DCENlMPP0e4N8FeJppyhawi9Du1Ttg4wrHcKWCFCGOI169fyUTt1EV3R7vIq+gAICvrVDACOzIfCMAIcqdDXgi/ZO2BUykdZeRrqV1fL4e2nfQRB3Ys2v5v6FQheiY2QgR/wDDptxsyqTwYqd1pithmorAvGNBuvW6h245HduETm+0ix8WlHR2hdGo2SEG+/tUPMdllF1U+vbhan4cixw2OiWysUTnBwcOXFXQURPFjU5jkjkjtTnEn1wM0G/R6ZSWhYck+ytqHZPUykrrUcUaVx9dMKV9f28RW8loyu5CWWQ2NMjbN9TkHF0WHJSsIqOU6/oPt8iKUWLgsI9xg4XfFaE/5C+UGxzp5DfIo60KN+N2J90coBpd3p2j6drYA+goOr5UAsY07Ud0APBLUlFK25ZQdHSZEafqqqMNirv6wvXreB0kRbhXyRJ0OknXkbSSlaKbqV3KJ76d2/fj6sK1RLNLng2aaGc3I7OXkEEY1VYFa/SrzP0hZXWTS1xKvxmALcW5v/jE5Gs7DTrbIHJxWlIi44MwFWnbvyg2UqyTo6Zpyl6hGEhcZjmLR/wU1WY5VtjVulRnN9utn9nbAKG140N2ewYOEYkey6++pd3F5aR4JptFwRBVkU+J2yta1+GH3CL25Ix1vbe3pHZ3K3RMfsfUIOTTbW06QZEjjmy7Ytkcn5+dc/FnxVwguOeMD6OXUFxbPyfVfQnjuDKJSpWKwIjuEcW3JtpWxrIpamyqWikLdHRojUI2B8t8ISOj/qufEXn+1+jdWnlGFXTr2uZrXu8ONBwjVby5cS+Wc7Mc3KMQvLHNCdVQeeBIb9WE20wM6Oj9o73rZGCiX2sW10qceRcM1C7XfHSEYroa0fk+LDqjnSPBe3wZ2j7jERwvUgN2QdVLGxOtJUxbMxaDdScaXE1h16+1d3GnOyNRSrN3kVxp6RJSm7Hf1ccOFOsOVtTCL6R/3sclO2y9jxjmgGY5HNujxpHqurnUehvLk1PE8giQK7dflBuXX5oyDqvZJM+AFplMC6UYtCO9zFfrWt//AIcLnnzYk2zMeFLjskI0JDUhLTdo8oZajl2XV9WBFa/Hdu/EWFdFxQa6Ma4YTZjuSDljUjxOdQ8QRPGhATYcJ9IuC09tqSc1Z/x+Ev1bCuszl+TUpeEmQRUFvn1wzwUEb71h/wCBbkYU5Kj4UW0OZJPrf63CAL1bTrYuqwiaKrfRKmp/LAVLJSVxSk55WYuec8XLHNWkGg18NnkaUFjhNuNMO9IuCk6pG2pDW0GLeOVUJWFkA4NjgW4XrpJQknIXsRCId6Gpwp/JE1Y3Al1BH/46tDY/b5ZtWAhoDAxeBbY1QuaRTm+ENIfVVE5jTPciCflZtbqmqT6z8j8K1+z2+u6IFWct3Rs8YeSHOsP01cxyjlVZ9k427WmTpA4FHFU+2CCyPK9VQ8EG/wCC3wPIEtHnxutHrCmaJYsTeYGCdpBw2fpXQ6lKvtSqGqjnDgnCB0cI58Tu14dP1oNj4drT6CfUQeEHaRZ4LQJGGkL4+1FKvJHTBeyMjszldFq3y9gmc5PVv6/cEMlMXDKLEip5bUtsvKy8s4pM3ZOuT7Y8w+G5FO1PbWVErAiY4D86nlPNnFp9pE2YPGmLGGwSlihZ+iGnHaAwHYrLs9lTM1MTXTE/EFsjWT+aIJdsEbr7lIQLa2gQkDDyRBey69VtL3k2fJK1lSmeq1rXlrHUwydW6lab+/DDuxDQgtbDdodu4ZlcqZukfk//AGyChAeR/OrAye/19VLo7ElE9UIKy9B2MUHZzKjFoaxYEw9buW5VJaEwUrOkDOE/sUdxtCZ6xMntze+CtQ2iyDsYuDudvGZZf0gcxGVO7oYerASmRui8pWO84OZGO+hySCW5z82wMkN+NFxUNd0IfaoqfW0Ot3IjEbWM0lTwohheUNIblXwOqpU9ynkOB2L58clVoWUWw2SzgogOgtVuZYt2DCjfeQlrS0JZB6m3iiGO5OXd/qIqr5SYy5GEDmO9OJbYrOKUpVtnP8fStP8A+DjPR7h1RUNVTlK0TSkIY+cTAqO3GBnQVG7U8pytaxz7fgfB7FlY68H0jiFJlkuSlaFaqzNZNXSCaLYuR3fAf1ycB/qatH5Ds4Fr5f0lvMms4Ezb8KezfX3U6x3d2U7cLLONIMlqVSdkPVVZXNX1iWdS9mzSUWS7C4EOAPlBxUu2J5C04mdIqi244p/dI3G+CIZ3k4D60Z+KupY/k9UFYu3QkU+1YXZby3g7+kLgn60m2CjrK2Ge71A6itLULv5lW8npGMbPbei9uZBE/SV+fU9/VT7fYI07umOhGnkmy0dT/b9s43yQGzU42jyB5AwmF4mGDqhBUWykMtKj7Ms+zs84Woqx4jogGOtVLtUyu7TrdnjwPyeKdc4DetvB2qC3WzLJApuhgiLQLTqiGMLEFxzxUb3qbm/6rFOcPo5iLVySuktTnT9Fr2/3+PuFe0ozXWpR+fnPCNJbWa2zKnq+FQVTPdLM6Xg2YIOnKWgW3uJ4/vSneqrVLGskphn0vSwItQ1ld/QRj5SPejFEFoWWKWfOkUvYQASIwibEZV5wGkHJwH91Ue/okiyTTqnqFrFdi6hGnmiU5dj8ASR7UYrG+Tiz1JGl1p7HG/NMyekPh+0x30+/1067atrRmpKx3lW5HmxsuyXxjTmcO1PKKqmFT2n1TFqo6JO6Hk9vA91FDVo2yFOUQFOYKBZNEthXpgw2HlBwUHGPxjVs7hsgwvExAfRzeoxfrePHT8PteE5Lrr1M1LdkbgqRBiQpGJOgiT0f+dfsp1d46vHiuJIG2z544g6JzqWMarOJFXkHC6LEhfzOOGVL68tUDz0+DPP+ELlDzlbXaDVTdogioitBbjGe65uxH1NZGJsbqchp+r2uJV8Maz0ibvP97K92/BewNiuLcoo4uY5V1Tm5CRP8xMNHGhZZ8qeWuw+ubdkpRsTbT7aysgVa1rCAornttJ0jucKtJjCEYElezD64auSGuPJCOuVLW9QV+6mmVHwOC5OJJUgEIouH5rbT4/uq112fXeqHc052OKKJKJuhCENUPdBV7OnaK2dvwpRWF1mcqnMfEm13lGSrrHfY/s+G6n2Y16/ZuprNkxRQT2lxTzdHh9m4TJVNmYlLWZstfN9TtrqTUBMAi2oK7HhX36oa+TpuWh0tWFFA0hUZBLG+utoYmpoM9IU8APyYpNtYS6dn2f06/t9ohTtV7sQcE70N+dDyCPzXLV6bbHeIbpFv0pEXC+V+VcIuOo7hz+VXRj119eNKo9BT0fVjTurwNTr6xSqLOb0kSGwOFv6OzeDKMIYbibOxJGKKJLJ3R5FJlLB5ibIw7VF1dC+JtEAdIN/1soz1UZfVIUfPqMyOInjCtgkNrLThavUkaOcTqRaGbwWFFFvLjCEIODh1JRKPqvntIWPpztf8v59X2bhfzx3btkx3krP5xlzHCx4cqWZHKe4O8BbQK6LhteOhpCjqf91FUW1JWpb3OxB8/fDAh6lFZtVSf5LWzHidP77lIIW0kY7fWuKvj/PD84ih5jSzBxaJ/IXLU8Q3Ax/k8/QtbMflp842eRycqb1M0Y1EUDO6UpabWPs5xKRtpE6ezz2jRYvNi/pBR7Od5xE5JMcH/mIf7y2Klmhxq99CpimZGKfagdMEJruhCHtaMWUCgo6MXClOmIpPXpcVxPCUfv8AOp0CizmSZYROtvryB7/IK/R1RJUg13v16QI9Ta13/CCktMiBENfJ0KI7ALGWGx2hGSkGja9Ei3GO8PJ+n3D1wpavb9bY22cMM8iE/avVNd8V+ed83RJaUrzqlFfq/QSJ6v8APj8KCuFtrm3ZG7HlqHEY5SFvDbRzac3jkQ0pzw1wXHmqqwNqNynkETyiyS9hDDB1J4rysHiuHieeREososrZA1mDlSKNzBBOFdqyL4oHH/J9assSyo+wogjehM704v23LWWt1HYGPpD9NUbRSFNyqQcgHd/bBagrsv8Ao5TsIeT6f96dFdmlWdns/YDrR7V6jgIVdjXh49fP91FUJ0HOpuySm59p9pE8ot0duJif5Q1AqjWnWwVVbE8T3eoNkaxPQ9NwjfToA6aHUXI3tLqMW6mRuX0q/wD7adA0XGsjCLHb/OHG3W427P1rRmYkSPB+hGkm5opAGHlFw96dFXfCTe8Fmbc8dO19ilOirJqvrAyQO0NRMOXFnR8nK4mLKAsuMo3b5U0Sd/41EVZtFpxHaMhj/wDYIsM8Q2z4atkX6J7JKVk2V5MlE0zmMISJR2my+eBJG1fNcnLPbIaDhaFQVD1RVLXULpUFYyAi6cpaOkIRw/tS605U9SQpygTcNOuu3w3rMumqfpdk/DW3H+iMbP8AhT8fswCxaH104ziW5y61YxCfUHFau3LGvB0/mhcoZeJ0Y5/f8lIT9OvnT8Rqu+1MIbbJdXgEfMbNiscXHkWnYyiLBnuF7aRklpNYkSw+iQowGNuixKcp9wkCltZX671LzKD3hynOzke4EcaLK61KdUmysHUbw3z4YZ2dNBtHQOOoZUUkKa6hK1GTL21VZHYGHo+z9ToJhtlTsOH08iulYbnrObGbRawcJGiSnZi8kGX+UuN4QJU/bWedUb81U+PPwhTsVgQ1a2vDW51pVjocafiyq3rG9nMB/qZn8lBqsEklXFTU3atEpEi+7A44wLNGiKz7+D64gKvYGMdK0PT+O2Ytr04YH7wQpHye4yQW6tiIby2Kfr+Kia06diK2fBs/DDNJWBD5sOOp3yZKKnVSz2mPDhPwjFSlL6bd3i72fX9yRpLxre8HL9yfzYhaEL9DLgQT3R9LpRek5muutzaOYhTfURUImIsqpz0Ez7TIwj9UO3at+GUSs7bAicnipHjwxqQ8geRdiytjD3J4nZqnGeRHZSyi/U+dOlFkbwuFWdlj/wBDMBXkuttzw+o9ETkl+oNk8JA6IbZ4zOOLp4sXV/q9RLnjHUye4OE+BhRe3GGb71hMnTjs+SROxZRfLyJyZw8cYONvF9cUVWl1rvlkW6HIb5siSQbXjxVxUiFfRk6JRuLPJwLPiCeNcR68QvG39h/5yzOU7x0hvGu2QXfvTk2h/Hp1rUVtxyLFoRu39GiXVAZpbdLkbtxtTQH5i/7IqSGcOM+EjxEFrjaH4mN34Kzdg9BzqqqQHxELow13pHckwjFRyz5z6Mg2Xo+h0bej6P1/RkKOlWSxZ8XSlKSeE4yYQxUMd0QuXJLKgtNnWtWy1i/jyL2JqL8FqcjDVeOBvXXTKdtHDsJsCqIhvnYR+qEbwWpvmgS4L8+3F5MjvDvvVB6CItW47mktIchTgbIl78K1/D4VFCKzC01Ku5Zft8swWbSvZW/tgsGZk+0cL4L621aqDiit3hQhJeL9aMXK7xQFaLwKl7nodHwisWOk86yICxF7r1hKFjc7D2v2Pbo/8bLDyb9rX6XqqlYiTP6da/MpZNO/42bJf/7ssP8A82X6fHeTn5EOX/B5N3QsNfpQeb3lGr/2H4iv5laq6m76H+AaJXjbJdWeePr4quGVrbPOaqqO5IrvKHHHtuHvvKE2ExctcrqhNFOXhAPI3Jp0ET/kydPFOO2Lq/R9uTYrhPEuPRrFFD53nsP3ivJO6HVH5onbo9UPmiTuh1R+a2WNXUxQW2YMRknv81GL8F5/+9TC5a8+RqjBaE/Bef1fcnRmsM+aXrb16R1xEs/k786bdUid0p5nSe+5Ns/zXB6/vRJIjBy3m6wRJQheSfPQ64qKs0ee3hxW4B4kzu+5PBkmSRJxPT2JgT8HO8Tr3qeI4ro4BzgOf1zBfwi4lhDw0SLCsoFoh6TLLk38nIohpT1jsWnWZVJKpyqTxz5/kKrP1WdzORvHcPWlJ4bbOap2H6OxV8wY+SX0jX9uYin2Up+A1f8Ao7o7co2XQ9I2MYiofvFd7k5YPEBe9CFbvq6R/sf3k+tE7jw9/G2vY9frBBcV8uN1NpwH6GIo01JKVE5W+0tJtGeGSt2cGBfhBTEg0y72i5TzkrUHJas+NmIYW9RJYFKcaiz9MOEgrCC7cGZ7BzK2lNVLTlOSXQ8c4XDCZ8HfuWeLtfSDCDPZKFc9U+j+A/OzTjZLu11vIUV6MgW15acz0dUkhvcMKILFb48WnaDZ4uA+1i9Wtcea7c3isrSJ7gRPKFxZUjBiHRXSuzBo0tSjpTBBBRYzSVgizI7++tR66bAiLdiY9++PnVr6QvwFb3TorWtC2GFyvj832iitVqeUtUhBk8Ac6AnMHzKq9VGPFYycRn8YLz7rl0+nZK1Hus7EHz1sjDYPY/Thk8bMQxRcdcVJIfSPY9uNCeQWxtYT6A7xt92lCI/0UiYTjZ4zh0dRNH0+3yLxWliHB+SlttnfZ8Vp7bmZ7OAQPPxcOIp+DnZicsryNKLqHXp6TMKkprtb5wHipG2A8nt7YqN5IefnRxH2alMDmbn2zXJ6Y8qpCbW7u1GEP5EcWxFud/H9belduR7qTRO3R/P+oPJu3K+bi0VKtuYeJG+6Pat8cpPlKP2qK7Paqbajctnn7odSmByk7ZI/FMUvrUJLUuOIWIo7Olv8X8hDBDEGMUQSRI2YMnHc0Fw3o+m222i1q0W193/ox4Yz8IJ/WG7BxXWfLCrA2jrMnun2cj9ZrQCo0u0czeORxwr5rkk5V620tSo9H0xfAYQXjkY+kPelp3QdHTDmMdSzDGijnBEhvATipX38PdUWto4teRfU8rU9GQwuDkvVv4RV5XDONxURruUtVVO8pHX/AMlX/IEZ4T+FaXVxN+vMMmvXuVkqkm59yv2XXvX1c6bRlpEet0Pm6EJ9lP5jpJPEV7yVcIE5vKQSdZuHfIHIhv8Amt2r2m5tVN0gCN2FxVxkedNtByZw7PiSdRSqDlzWzvFKs9O2VUxPKEKqkWL3UZgUbnDR3LH7lWEZFSNy3gjFRPpDm6deqnXX3fnvEJQYvJW6NnYH7Qj+3jKhkkBm2c2Uz/IXEnerwrtIP5PuqrLRL9NzwI/FBRPgoUD39n4rb2GdIHndP2rZ0XY0RasH5JYE+uftnONv2haEHCW9sLEm446iWSvG2SO8Fd9nMiRJ1fiuYFlblHPSIb/vXRSjzMQHI1dHSsj6TYiqDvEZQ0mxtGMjtAp7+UmoOc92XUrX44MSyaJfb3fk8nn7/uXGMPZ50/kX6brVqQkWl2YVxRBO5/YSAhL+1fmd8dIDkwJHgKSJxy/2gdXz+jHclHlqOrfX31bKY/uKf54jvo+eV3V8BR0C/SdSrtrcGpq7Uj0dZi6zziM81i9UVG1X2K2vWdzrqnoknRftgMdPt6Q2Y2jUlRVT8J2rRhLe20RinhQa4cCHCjwSIR1wujzwTz5PjjRh5C11jL8noonpXH1dw32jclpliFH9tPDKV7OQ4laNCUScHpcZ1Gwpm4THf4MO1OzrYK9sze2ncB+J4XCfOFixoQO49GML4QUDuDVU7WxNlaHMxA1NVQ+QOp0o3hQiCdfuvh03LfqEqu0GtXGQ0NDoxR0U2zzQ9NGRBi3jx1Q1Q5FwdpyyTPyjHyBTtkzGz59/u9tK8Q7rSTzUpuYiVKdImfPnBJZ61Y3KQ4DuvFIabwZx3ap4HeHx5pl5enZwpguoSjvQWhf1eOkQjCECMXvjqvjeq7CWvuMZuIJuiTHfywin6TbD5iF5X4rlMW7LSBiGXRLRQnXTD4b6V3V+PcCYtt5OUJr0i6wnaJ9wyuTu0T36B7xZa1mDexse+KtNlEv9ij7ZlS7a0NAxb6FCEGdpZLtIMN8Nd0FWD9LYZBkgcgEXDcsdyc2+0xjDJnkVZTQz7eNAOFPmQgyRBhHrTPKW08WeMpCiKhFGvKKQivT+P37hG5jR+lJv42WozU1jPokIfpjQKnZ7KKpnNhDTS9T0qLFtkBFCAcH83HT+Qnlv61hbbArLXXyfpp9E2nWGdSlzj8k8MVUsTWYERIHuIGc8aJE2MYU+pPCtibAK1LrgbgCxeHISABXBjGOjofm7tadnilysEqNYbXYJlrv1nXjTCm+la+/7BxntHzGnMNY3PkTPlMfIbu9Vd35wEZPGSXQYIYJ5FfDCXQwN/IvP+Bc25mMB6xbMKXr47FSE31JThwZ2n7sMXHnugproVvpqoZs4CPBYxcK2Y0P82EQo6/uTVJ3Xd0Unr3D9TCn0CCuZjRlbsUidw4Z7u1zQr1Z1ZJalZO+kVNQNU0eKSW1z2PGPcInwiPffDX2JvDyaXfMyD418KJD1zBPxcYRV132vLLZDe2SJDXwYkC3Ym7UA38961yVW1nsbsQDEQWHTco2jdF0LrqSNG1SKqYUObVJ5z0Jw+8J46N1CWDGKMT9wVpCyY3IibAeNphZcfcsVfBbiHkilul+frGp9W9WDDtsoNr2iSOLieXXet7Z7dAHUSBjc1kFNohGDg7QjCHCjPhy3dqZ5G8NISG9Ahvfkp+ASydbsY8+gw/iKQRk5ZE9nBpgRIEkpqFEFkBFhwPLPx5HtSc27ItoORyYtWInWlMobiO0nRg1k4WRi8ZwocKEeqKaKktmYadmmxJhcPHihd8AG4+Kr1vdWkhahGzZyt6uvu6/8xWyExpC5DduooNJZ8kuyxq4wyCF8l9ymZgs3omnJEkdvZGwXC674Kuz/AJVDC1ybvWo68IbvWoVHlMskaUZ3wGq20lxdCZwZNKhcLgxPDjG++EIX3wuu5V0cQWkGYMnSQOpzhsOvjh8KcONQ5vILSTNVT8rLKcs3a/O4XjhPbQZOrCi8/KtUcrQaaa4T7zhrt+9c67ZbSawsdfpFPvDqMX5LkHXA+zz4qtTxlFP0/i/apFbehWQnEE36C2sSP0TBGy0fNF0iP9pKsmcdUH7KDZwYTsPGPTFRLVWVcFo6QONhRChM/wBi5X1Jao8Ouf27sx+5Ri5VtOnx8+rhhtAURTVrvuoePEbBhEde/wCWOodC2h03VNXyWir6vGYBioXwKOuboxVV7UrbA2OtqiAp908IGxqKngtDuDG/SA/eKp0ZW2I+tYrA/wCsuZWasryTLcLaW6fAalvAlsxP9Lq3xYEcP7qEpK4tu1rGcnn7gfF1OroTU7uPf3414fgIG7vVF9ILLwLnPzfRy8gaW5W5VSRKw5FRiiDdG9SzY1YRbLbQ46Yp+nNFMWJx3h3VMNAN8fehQ+xdILFPye9ltnM6DvVEkq0x99sqqHk9v+qBq+4TY2NMmQPCEIYWGsSGu9U3eH6QMUzSUj7Dalp/anL+H88PeGJG9ZBitt6BykUP4BVuxjJKoWzKILvmYVXWAn+V75DX04UO9Wp8nNUd8SyYb+lVXtsyzLILHA54zvUQpb9d/RxjjpCoYrnLVNtuUrlNuUhus/CJszo8srZDDY+UT1UjG0L1vxY85OLZG3aVV+6n8qbhFZedkZqQ18u5zqeI4tplZ5bE2xCox6HbWTwhqctrxwcYHb1SCm7GbYMpl+Bre250JDYituDpsG/SDgrU2NZJbE0uRFY1SQVW1YlwxxlR1SdpBvb/AKql9YZUlOUqXJpGxKQ1V/V/BJkBGVJGP6ut8OXDRkKyYJwzg2nkHR8yKs/y866w3Up1131rQtPtr1YjlAQ05dEl5JguXQP5rbY1klU3Ge/SLnR19EUMya3F/wDrUO1U0qV/tkypnKfif1eoNq1Bs8IaPp8AdbVWFNU40126WjW3OotQ1O6k6qRCucI6lHtVZR0DZEhnGBFaRhHTAB0jS2tv7VNrUgH1Vyy7JPbJM/TdH9Gn6kqbsfb9vVS346CjrQpty/njzxH6AmxiDpWyUOcPSGi3WqChcCZV53o7+FUB1tbBNkGOvj8YUXHjh32qHrQbSKvCMnsDuEVTxIsNUTY6PcAFCk5yMdp0PHlQ1/FWrbFhFWW8ryp9eopvz44/n7gjkpdaceHrLHzuRtTxXhjrOnjjz7xVnDbTCNo3IYKb8f61tZW+5TfJlNFEhyT3DRjpUxcbg2jj7ew/WfeelTeUlGcRq27AmNa8Bb+j7Rk8Xwnbk9H4QNrQ3UgLIdqnkClubqLjadp2MOi/FOnxWuz5jlVDjPPcJ0SiiibiyzYXN0Fh2x1nT3Bwn/xh0F4Y8RzGHkeSWwTfriA4Hj+9KPN2yxVtorXWOq/ZT1fneNC18nMkvOPRhJOM0ViBxo368CYYmGcZjtnGxWF590VhnZ52uw/bCCmyyywiqq2MjECREQWGvGHbBFOD55GwTPyhIrZBFJKSdyudd+cpI4nSMIrZ2GdPnetFq0wdkxlHUhOqeuHQqn2Lfg7/AE+pDfzLIMlhtn6YOFqqssLfAOEdcSFz3tTtxqq2F3nHu52ywhsQYXo5vUMaSU9f66dIhPURnbVOXp+pOn4/D1VxcemWOhKEibb5H+M/1BIVo9u7i9ztHgRFamITijQFqvVfH19caiMnnnzyiiStxZq1uT57aZ/2LCYZmJOHH1whr3K3Yu34yJSo3j09/wCev7xm+dvV5NpbQ/PqW/hBOM+CR4zP9W9ezt8euHyTPOnd96kiPAVg8mFtb0w4pwTRjIdPwWfGdP8A7q8HZGYRDlJnSQZPNH5rtH+T9yaY0fTkLV6nB/XKthfJH+r25U4yHcmSVbTVUK3q8GBdndKlXwDjrg/uPsv1Zd9HIsKm2yEIaroXLGP6QWk7Ob5BW+fdTDW1/D+fqwp17m5V5gzJWvh5Ij21SvGezmlTncmfrFFXBm1S0h9tTqQ4iGKhiyua9WiynLX5NYuU9ox0C9q2Omwtapy5OQdKh3xkC6dLF1YFSHQrYqVvR/lZwjnerC69GdttGTRWdlj5ATpzDQDbs0BXasjP/wDXp8Yo05RDbG0e0fDOxRcP1bpHHXONQEe9eyjLUGhhMn/rfUAJTttXkhoj6RPI/wDDL1+YZJrlPq+1CqWuP+qAfSLeP7IKGrXfapz5trzYH6Z+3/y0+72/jwmMutIINNoYo5M/osx8hESeM4j2tHeqrTH6e/u/lYm7AhiBA3t9Pj+yip3pyzJ+nyce8HDU814rjb4dgIoc7TabZMw30PR4uEE+mKp29xUZOVSO9R5jTBzm7Qv9ePublKmSMnsZG0cjsqX56hRjyStJirt+uUcvf4CCWdPWcURn9DscKrffftdO9vItbqS1mtapuHIdNEtkIeiWTYG+KiZbVTbbJOnTxiTxRIc+9LaW9GIV2lzzivx/PuDd8pJy4pAkUwOVs28KXIHQD8m3SE2ord3ur8zimyiaOugZHlIcNcfvVtssasZMiTPb4T9q2iPWkP5NOm9F2QVvWMf8oKowQf1YBV3yqKq0tWBw/shevXvWVyFreGnh85r6NtyPh/nWos7QrD7dc6FF+wnnFOXjzJHahhnYFtfHe/WZn2QPljAghI3KdEeTHd9ycs9NkSWkAna44rwpMitPPaeabPQWpMa1e4lnCHpCF/vn5AiCsISB5zU3jfRLWo8n8nfnT8/OOlXI5wIhHFFlY5aqZO7/ADVfXrJVRadMYyl1kXsus4b+j7P1BIVnzaZpI6qBwcWTEqQxU39Hwg4uHEyv4VSo8TpLpaQ6N8NkFsnpfQYf+sMOIsFEhSacMaoaU2azJhItGMhu8ouHoYVRY3GOUiiaqqgggnFVCUOxGGf1gmBJbYlktoy8gpl1e10RKo2tYPIgh6Qhs3/SJnEb42bPctIEcahuV+6JnTbOfyf1b1RfhHW2G0+RSoZcY63BuA5fsiufBkmGeIv7V1rtGs8NdMjDJiomQQKJAx+OfNerHkHlOP4qm6JvHkkjH6/Kervf6sKVUx+KVAxRiKu9w3IOblE03nw59QuHFWlaG8Oc18cZ5F+y+ph7rlYO3ExnogIGyimJ4peituqR3jDj7iq1SZ06RzKUTknHIxqNqsP1ZHlrm8Y8kqJIVIxQ/f8Arj6UgMIeBZzngneXsIfImFtaMa5SJEb8L66t1eJ0SJ2HGkCiDCQwO9T3RvauoV8rOCc6TkJBu/V0tf8AwhvunT+McykFhD8zf29/gtVbQ/j061JDOHh++uKv5auoZ4CzdGVrLPZEjjINqZ23zEYxXXrJQsl0G2yHcjjRf2qhNhFCTqwqQEeMjdBdNrc7Tg8nSw5zqcbU+FC+C1IdLiR3+xZU023M7eKo2ZEU51Y1Pt/OPsoLt0oz1IuKRtNh2+WqOXeXnbXNtNtT8Emc26jrNbmSMfo9wcPW1TbOx6f95eXzs9PJJxRZJev6+QQkeezHRdyfzWkLLtlpadttbfY+jQL8a9dfbWu8UlHa1Cq1XHb7IToQhS0OgUJOvczDo+MUSd0OqPzQPEeIdM/K/wCbH4xX2m8Pz3foTgk4d2atV6CVbAw5r5bXYg3j8Z/SKAdg4ao+Ty8Wv04O+7g9a4S/k2qIhVdvE+p4yIYWz5inm4vkiS4bKu57xO+XWsBfpJSKT3SClFocGyJM37/L/kK4drbdQn0xCbxVc6jnPS/G2uOxPHLekdqlEttoFN4gYjFili7Hrviq65RVYTmOSdh/74qBbCMqfhUA/eDFbzii6FqArUZHV4Ike6+7JrirGnlYIl3QFMXKPEnWenq76/fwFqxmj6ccQhL0gvSEFR6qYTKccjmc+RhOpatn5X/Nj8Yro/laWWSIyY1e3XahcaIXf5OPGXOSduj1Q+a1lZFyI3VBIyDevOdoanta40bvgkZZD94E7zMeqC1B4k/LVyLblr7x5mCm7MNmkFlVaOxoIRct0O/JFNs/k786fniStanbo9UPmn536IfnLcaOodrIBMk6EKLaqoaQ8SOXvzJyDnfD7EzyZ3Vu60skzsxrhDqipTG+iCqHWWb5HAwmSVZCgqklVEzwb3Cf5daReOe3jqu6VMLxOY3gF4HhHZCkzSbLaFTrlFhaLNIDvR3eTad/qx+QqX6At1ODw+vVtYuOStovkO7X0kyLudYuMdei1mkycxJxHvW6CitabQhhUfs8jVF80I4b9sdZ7GKWbWSiiD26ENqYrt98d1/3qE7MaQbajbg294N/pBWM8KMToXRjv79q3HJdqqJzDogi/wBA6lEde11Js5nUgQMQLApgrCe9hM8NWn9+v7VlIrOYpOSUU0Ni6OYuU3urh9owTpGWlWU5JRNT84cxDZhXDKDtgsUBtB0RREgosqiCsEYXgNINp5A/IrT5FuVwZbfV9UWXVdToobpwWGe9s7uDrvgq613kUTrb6rdbT7AK3o4phqx0nnO9OVueWwODA44viois3kvZLzRkoz3W0e0esGGoLRS2ohjEaaW1U63jEckIJTdM1Z76xE4iih1Jcm4hT46wlfX3Ux49WHqGa7j0gXFcSZIOWWL5NRz5fGHtytmcqOcntvqCfsjSVgt11yjFtyhGGQ/4mE8uMYquttlYNtY1Ie4N8/XisdcorDzMi7k5NataA0bxS8QRxIEyKHLyyjU+iHQVEyrMk9Kk5s5R1ByLrTTaiOtEpF3NhfH9Z6dE5biL8Z9sftV85Mnx3e65cm8iJtcZ9p9U1cBGGg6fpeexl88YnlYsOK6ySZ3ju91yzJpZjWbC+HiMeTdWhK4d1cKY09XVX34igdOyMS30ju9hIILytLWqpscsNdK2pgeBZLU+gYyF2rDEF3feqCWKWmuVu7bVNMN+GLJf9QbOCB6P1XYrvzLrFUzYz1IzutP1A1CurG7C4F3aDfR546rQwU/ZLk5s5rRZhRLWwEl6zLsWe4OH1oyevLLnWjG31ohvHayROpQxFe7hx6+IgkDJqoKmYN0Snziu9BwfrArZmNveD8W11CLIY/iuts02UeIERGGq7m3r84FVV5Uh1az3El80rHT2PXeazaqtOUqxOHtYsjUnzTTarxklGzz/ACncHTynMUWzpjiNh8myrg5TqrJ5DGJ4yDm9l62qSJNYT6ZHu0m1NeCDM9g0hxxcws8Y6uUhnA9qwMLlvWUbWzvUlt9rESONCV07Ml/Lhm+CnPI/s9bn2u2twcIQwrTC7mhFaftFFno80WNZLDlFQof8+8LYKXRQt87dkc2zIlzLi+zPTYdh9jNOUNGf5UK44tWpudF1eYfbr3J4yijJ09+kYeN7W0tm2dCYbGY7HPqAni0YXrP7LW/Jw8845blYxjm+ucR+NR2e0jzrj0hxbSS5SYzpA+f6uSC5T5fez28U975Z2Dru97cVfKlKq0q/ap+/n3KmX5QeTmK8syd4biqOngxu5V20TslorSSyQcdtNX/AI3AxqsJc7b9wUWkzurd1rag52YvWnyPV+xbJJnLY7zgNvWq816JG4uBY+5eYu6ofiumdnpmfbZHNyrkJZW5TpDx0x7V1KsrMxAevnWRtMkbzxnAz3pwh9QtRcWcbZ3idcNf2r87mU1RULOba6/pi7yZ4UeFLRH3d32r8V+hFtnfyXJv8pLR8kGvbOq/Hkf0hYj6Wd9W/D6w/tvUX/R+l/JWkYrGvonSZye/DP/MUpZ7ujKQIh4xogeVblE2czcPV+KdsLsODe2HR162+GVbYpaNPn/pfsea+bTAUIRXRt4fgjZUR6gpVrdheXpUEP1mOTHVUZ5FQUCK0k8pfo/nTkjdFlymC7+AUQV/atD4fyEwjLqt5xXaEGxiKeJIwq+80TYDaW2tbTQ9ujnSo7TDyRSFTnQPp8Do1/iobqPJmtkpaVPPbpItWDR1wLpY7HcKPZHWrjvOQfZbPDnuFP19U9J8u9aSJkl270fOx1AWtMJmF4oEecWBCKk8LpAiI5HLDTnN/snaNf/VJSnHvriLTh71hEUqGbvzfvihejX6SZIb3AF0aSiysF5c8n6PSpxnSadqKSA/m4psFJkRLLZTtIQgPi9WGV3KqbMqAaVIHtIskYrQWuG4sIEV/cPgoCqhnshfJ0gep6ItEs0KgTeXHR9zcB36IKyI2+KyBqFckKdPL/VjkWw9fVWnwFwxt0yz2IxgnJTvPrZyCCS6qDxc4gAgrRmK2OJx9zhh1hm1fA6GfnnYv3s4/yjCC3+obD6GPPmgUVai2ESI8G8UiqnAoGJsea/dHsWpuWTTaQ1Z8jD6WF5dB4twUzj5+1jUT162RTCnTpUld/t3+37RGpHSDpejFiYMy4DeS6vLrwOTjjWOnxqWprBiBgxwGPjIhxXXuhqgtG8JJP+dh8YJlbKRd2QySPUzZU9P6r4Y0DR6jKpHLRTweOPP2W/fenGJjYylDto0+KPYw4B5eaY5G17XZyrhtkTzZBPEmpJ3+f1fX0s8K5vtEfiqveGBftEfjBeeGM5PHkBIRRH9LGJ8AtF4STvbSvgtrdalpuRTNNkNT28l1YXdp4Qw+MQo6v8L87k5rrlTjw3/6crv2LDOrCSkC9pouFkq6zCiZserfu4V9QWLfpPRLiqdaiy86sJsZMMRP/wC9reKWtWqFjanpsb6tcWlvhwSHkNrCbw3AE6fffdCN1+/kVQgn+c7boLaZtVuNLZ8Bwa7ynYbYsbHyg3j+6r5lbZYukaNakKeu6tOHq378eA7JaeoiUaUfzqP9HePLnE8VTbJVNbPk9/qd7gU5wa8DCEIfmwhr/vTjVOURWdUBszO7vcMMwj4NpwIGA/OjdCH3QVKZz85f5/sWHT04jP8AjxRIL6+Q9uoanFBPmOh9AVW8/SOjtUgg3Zp8z0OT0BP06sJJ3bzpZJnGT5OJH1Qh2qDaVjUj5Ow9MMb86leqCMYBbgrl2b5PuU3XEmeO32WudPNUP/Kk8tgSOfmrctuvnT1Mn1ziV2hp7SlabRch1Po5CCrFSV4WaZPgQcUXC7jZu3uPwWFnqMPbiHh0wuyY0TAn+sLrXY/+TlqtlbapHtHr1iM8LBcCXGlmLHODf9VMn/fBWesy/J+5PlnUM/Cj/DYv22tz9I3fFVFO/pFWNFonbRCZlO7J3e/Cn2ijFrpm/KJJZw/8WZI/YHAilbPbQrRtdAUdWVWFFR9RA8nK+tm/5M2098Mx9p9YNdEtf9TsflCoY9q7bNtPsFNiyAG8cRpbBNQbQEBo9vglsHdtkQw4/Lv5oKmrp/SOvCd83gUitU/Vyz/Gu77K+2oiCzxnhhQ5jirdj+RZYzY9mHBnpbSz6JD+klU+UKiVqsy2g8Yn61zwtr/KK2Y2dPrpSDdJfqrqdqKnsZgTIBfo8hUnqPKPym7d9Kt7PI/R7S5XT5RUai9HOkG98JicWyJV+dWP/Pf7twRIvVXtNnbkHVC2bK6slsdkHDvFRixcxBNkpwK6LhFczaryxco+2kyc3WXsULMqXL/ykPjrTxZZkXackwripzSjI7PfB88oOMCFd5nsZpylG2Q8Ve6NVKUw07cYYdqcY3KUpMtF1hUrqPPXtOOemJM+7gnhv+0erbG3VptB84pdYnkosI7xpiqAXSt6nL45E7yho8lXtNY6Nsdpd8rauI3NrUJE4ymmPb4+54r7FDVs9vrjTtE0sRk4yGswSrCiAjav9I6PVA3GpmKj5DpUFb1gXaBWNQ8cDifj6exHvSdk4S6tIh6SkouZFtmyFSLvUrhXf3US9v2bt9n2roslptn5WuQ2xxwmy0i1q03KEDwpUn9Glk995gV+j4uA/vRnrK1ag5VBnVe1Wb0BUTXT7o7CT4mWjPf3X99Sq7aPbjV9cTp8XidhWyMNkaWOHk8BQFOeDDobRPJ3csNS0BDaNF0IGscgcrKnZITlkz/tFMcdbX87xNZe+4O3oryVaiOzKCWbUqwMCq6qACKijUBQj7PCMdgoeT373q5Q1pgyJkggeftXHg/9XponSYz461vbCz9MerkVsMGSUTGJtsca5fuFMs1rnvaW2eh8ifZDw7vtX2i1TOqarjoOrnDjhZuqCkFhpWcbPHkDBElEFlRBET7SVGOFQOElqYguCQ5FcsY6m8f2opSu7PzHZ4HOpmiTRnN9LFwTtXF+v6q2dKhclcFGOrhoZPncvJJ2Eyfy+/qGytH+jRna7XXPuW5OGk2Sz2dycOPPEda5ugCYX6QbqR+qw9p3dfzjqdOz87EuE8rayv8ArJwSOcZ46Rxt3dC4aw79IX/Wks8xNw8cM7Pt3qMPJwHuoq5MmVG2NXB9YqfpG/PULDVnkV1jsWPLydLwEBOneJ8o3R2TY2cHl+tLMwUe/Vw5SBm4Eooov4K0Vk2SLW1f+WKonFUo1xhxv0g4wVs62tHsTySmKcztAApdUFC3+DgPpFwVfzOk5mxd+QrST22RP2SdAgqW79JsJFLbBk2x74f/AM1BEtB5IzDQ4kip7T3wa/jpjQdC+Ch+2bLdiFKPo+yHZYCbD4R8kPqqqZbZlK2hW0mT293dIaL9TEB9HKuuZnA3/wB9yd4DRfJSypJbSMvr3PZS+bJ/MZwnr7lpunnxyrJk/gIH54fXd7LnnnnFFEl6iyzdUD02zjJPKmGc5Z/p6orDnpv+ir1QZINqZaUwoK2WuRGq285jqhZOcokc6bs9Hp+EFgQlYiq0lIrq4OAJQhfMmTn53ZuQOSNVnAM9n9/81YTJ2sCqS32tpFLt8CxWJp22sHfkAH5BBfeVodk1k1bWw1sDQ9Hg3Elk7Y8Hej2Af2opfpWsMsSpCwGhAWBnkX37cW7/AEi/ke1FLPOmbS01tCO8jQ9f6TP9nr/l/ILGSW8jgbjQVEUtZJRDVTFMAitDFT4uBDD3XLmplZ5XV86fQ9n50C3XFYEvluXmWBlpYIw6zCy87FvsIYIx3C3QXNRtZ5wM+c8PG2PxcMdjFUuiTRMs8V+WV2E6fKIU/X6xY9iWg7umW5j0ZOkbsEDkGZOBhPeCJ8C3MzkW0U43NE/P1fVxBXgw0k/9Yv7j7KmmSHKnzZ5DhPwjWH6YLv8A+yiqK67radUZkjDyMI1tMcCzhwWozILP/NW9dX4z/wAvzuF83rckTZMQTHl/sieP6Zxt1bW+VJUUMM0Ai0oxCFYBpEC1xAHUKmGGHGTiCJ5JZXv3lBxSTPTun4Iz0en4QUsjIWMiUKNmyYxxMXVO3GqTyssY4wIQhPI4gTlJncY58LPTapHsypeTW1oNEUjruqCsQGSKbJN8gwZryLr0SZTnAiis4dkbt+2YfoDsYYJVmWSxZ2zxjhSY0aO9lw3XEnwxXzvXI21V40rUjq4Z+PGl2Syln6Qx0T/NcMX+dn8+RDm7FkrQCwWd0f3Iv6VZT76jY2hxmkyt59PV+oNJcvHm6PHu4zgQ7+VPzw+4eScSTC7CMOhEwhzsRUjVy+VMdzotBcoQZjrvW6on3Xa1pd3SlV0W4jcxO7DByssIBTlR7bJdaqBxAOLaxNueIboYYdNpnL2LZKDYZzropnZ5+Efa3dNBh9A6qae1T24Udo9GTnT/ALgzHGo12wmCY3aqnKS1WS+UJGEqm1iqNOGXf1c3rSaqnaJo6nKfu/17uW1WpvEmuLVIU+zz8XS9PZih6c6B29R7Xk6E93njj8VadhUao8xiJed+q3+n/aB+eLU1S2o9HlIl/wB6gZ6VpsysKkp2l2f0pULpIYw+gghdp7dqrYrMgoSG+fDQNhFHA2d0HE2PpB5wmr7LlzayQmFuOtea6geI3DWfCz63M6MAJivvW75UNSPzTSFktAPM8op9qJrn2p1eZCN20PBf84qsY9mkk8pJr1LuobKX28j/ALa0/eHJksixQI4qTnOVkFNHJyMdTJ7g4T8W6FlY4wzlRJndW7rSPVPndK3alW7PztMQjhBRIbHDkT1Z8RITkgRDxm6f0PGGbnV1RtQYfg5TeJJ9KO0btSZ20P49OtLHIzSpmIjEqIomxBh+7JybfELXEDGooIk1BObIXIUOaOplJAjdv+rkD8ztu7l79/ipUpttz87D5i7o3phbW38IxgrmZN9lnhU/yCSR/WtSZ7wuRnFRy8g44EGv7Jh2doQh5V+ToFF3slGyabSjNJcXGTc5lQv1xuXOPLutx/SZap4MsB2Lo+zQrQgm689x9cK7F0+yo7X5OT5YocczxgJWFQ/qvSF+u8kj1pfnlzPrEMV76YdvcCVQWg6AWvK7HOkuXpySmyI+3rr7qbqe2ozhOzzu4JA8q49Kt0vqDN+1786M/wBH2LD+2/dXytgBYit3hOhOCwZmT0fFKB011BnTwtfQkKyI8Dob+P3rD4n/AElmN/H707iNxbmYE0SI7S6lYISO7aCC8KuNV0GyGY1dwXo8R3B/J12ezqVshdavcJGEJtAfZ5weu+MG4fd8lbuqniSDJn/BOVKUo22f0VS9EM8IQbKTYpDGHdqvw4nf4qtVtlYYHPj9urv3uX5bmVeX5ermVPxXUz+7q+z7QzxEarOS+ziitvNVQnzp43SqcunmVIVbPE51cp8FG7lO+34rfVnxHkuORb4Dd6MbW3rSI3oLt5L9sElzkkWE1ubCLY7bdZy7neokeyqv1qdEuVEVg9tE8EoTar4XdKgAwwseMgpvjHEiFD4M2/yhiF0MqhxlZRdkrJacPdCpwxdCV0JCPrA/Jd7yoY/ja2LdhJZtTzB8bKr/AGa/f+91+unfUU1a0wjbF4rN6+jWFIkyG+ZI6vxTwZJnSM/0pmn+sdqt1AWzd69dk1FBFbx+H3LT5/J351uDn/i9+Zaf+y78ykCvoR+dV6oo+UFsPzwCSbv7YrEvJ2+PXD5L1Q54tXXJiIM0eZ3jLK39sErSSTO59/e5K5HL35k+w63cPUPTH2kE3zMe/Okc6d47vdcnKfJnbR4gpNs6TmO34rjJa79YHiqPPecCy1krxpRtnsHrImoO+HtClrPeYHvK41joxVJ6beDGRyBd2/WSIV8Fe9hbdOYEiPFi2uIRsIa9oIFxSicpWjauvNwH6cfotaU0Zux1rblT+cMOj9NEWisBeJtH029vBEdcBcEHC9UctyrZyOq+fe6/zVhK8fm0FnPp9vn7Lu57lQmqnKM+pJ5GIxe1XQTDYcCivOObmcE9IKT0pzyy84ed6CixiC6OTI8RY3E53qZjdHYXC44TBQ5Fu2UfabUlcSp4DRTpTU13Xa1veTVVbO05NdolYDtYrs60Sw8T5VV2icuGrwHOQTaNR7FVVMF5iJgegogOAA8fZYKCLGevr1k59rHlUUZVoStDnydVK7qcMd/Xh7RU/liJYyxHzj6hTZhDjO5Th508cjFXYrnT6Y/SR9WfK7VcTKbsIoSh5LJV9MTytB1X5cEDhy4gRc26rcpM8zyfxbnVv2nPxF8sk5hhm1Z+oXVHaaZGEtPBifOOsH5Ox9DIbrZ2j1rRjSb8V0Wk1JJ0vo/P7SuXWQewzWtyrJwv9K2YQ17uZT/TdoX/ABqSRiJ+LiW1yFkrSLblJS/5lw34FKQ//wBulPwGe51mtOSD985PziZc4vtPkzjpGz3Qu38yqTazZk+OzjPqAWMDOo/0et2ymLTn2zPJ1rir6Yn4V+Ea5AQRm+Dfn7vxXOb8n8515VNp1YODhVT870uIxeV4Ph+kIOBKjNl29MoW+/vtusQiLU2TKffU/D2YdXfiGiHerRfnzc/OHKYQrXk6c1OWGIB5da6V5ItpE50pwFoJ3qlmVmwtoNUz3douvLKuVnchtn8gz3gm7Wrw0jLR03oqQlnBMMfvF73q8SlNHpH6/wBHKOb2URJDkZR1sF2q+sYH69+5WdyNJ0Z9oQLfC6+7UqQVQ++F9ple1cPG/wAIaxOe79145Bexfer+fk/meE+0KoniP+T7XcpzeaRoPQ3RBzuVI3IT37twaIF7sFkStPHmFzLZm3AyZA24uoHTdFV3tCrdnpUMel2/jXOkFoVo7wO71HX9QH7Nip4NONHsCoK5VU5VG8HOBE/alXGjuxXj9oj5QPzZP8fd7hKrFtBGqTbysfmx0msNfs+5g9GtOGWPY1WFs86zRoogEUtzEFPOLMOP1KIbE3LERBIG5PgutDC2TotoJBMiGK5NV8VXt8Sy9lXijPR1edTz5O7HDrpjTEQPSMjSDuzaMg/PTa/ZibY7aC6UgSbpUYQQc5nMO9fHUfSZ3fcutmXJYyZWFLA1xT8jFulFRnmwhf6QbiFyMkzp33LSGi+7/ltaSL1wfF0nyFfzTv4i8tE1x+VI8jjwCbLPTPKQPXzLpxZK5+Yhd2rlTR/G29dJrK53jgft1KA6X2XMg01s6LtBeRnnd+/aqTflJqbnOtgYNQDyP6EViA+a/Z5+y/erjsM7zH43qO8qNnhUWTfbAP7JQh750wIAvKWWLckvId7RsvX5tZP76Ur9mIyAh6Ug2eTNbTuMQTM8UGG6yY/akc54D/z4u7dyIkv0mR+21710QSkUNzfMGRHakP1fME8lgNdXfEVvhSmsRrwQYgQEQetN05mcgS55DRPKFGLKvwmP1gDra5NSSb933Ii8SZ/Vvjevuh3xa46vdwydXwC5WTkl6ecBnkv1RhbRcV9TuWaTWzlPk4dwkDGfwHwSycZJ5Ukxwf8AmIf7y+qFQWriugOCLx3j5uNHc6UsrqPaKgsspcrlxgLeHFJ2yx2xpqm4hha3xgxfsL4Xo6K3/Ms8+dtAPRuQa2ts+d5PnlCJUi+eoJ6lBZYif164fDgJWyvy6EEdn29QifhzBmk2bMMYEDSK4KdRYccEqgIV/vTbOyZ7K3TUTR9CmClw3AgYD7k/z5Ll6vPF3pn0lUoO0EU7i/fAT14i5mi0xbvDEr/B/ILGeke6OOuyU+vkGnVJkH2B1HJ2iiMJ0sZt8VFRn5MGwn1Yi0QTngC/ia1ZabbY2tbPBvPa34VzjfizIAF61rsnKQpuR591dBPrwFycWMhpSy4tnK2HtrX+YRrLLPt2wZ/3CGFaJ35LWz67Z6+rsSO/ej/8K+jf/wCpdT/2FW1Dylqbn7nwXXzLfKWtyYapcZDQO9tkSsLjo3b0se3zpnYpYuXitKfVp/IcVa1Q/WIz/wC0QUmbPyXlCtU3ED2mVjDt1raXj8mPZbUcZPhDW9p5ZIkP8HyiK3/HUrGVJlRUFTk44ciqmzZScD0wTPSuWDZLUcXTEV81tWEFujjT9yRvLj01vWe3OF1tX9T+VA4+U5asGdg3bG2I/S5rkCKqb/Jg5O7VOxB4VY1B0vtWfnR+fUp9Z8jLJ3Y/MWW0dH683wf/AP8Abqu7/wDlCLN2ri090dY84OtYLPsvGiq3fTmh/nRs+GEa4HBu72fCEda+ZC39M67Q7uRO51dPXX7qcfhUcqNLhQ3N2eT6hSEF/GCiKPo4OQ30+1MVPDcgbGCI3p5nOLcP+K4tOf5ROtnXHD0/Z0VqKwId3L1qPZ1vuVzWUgjR4Pg/CO2+wOHf8EqR0FXmtz02smj9c4R6mWXpTXnKQdvX606m6bhP0icK1Xb1VC0jLxsgo7Pjk1FpUn2Nj3rmW0WNV5bOZVz/AGrWiltTm1jY0QM314i7ioqdJ2T3Z9IpaliKfg+lvpg369Bvm9v1a8KpZD6JLAjHhGk48VWVphQ+qJXVk3Y8a8aevvrhxCv5NJUp5wsN8rz8o1XtVSZ49l9DxE98fI6QhBQndlE2tvGmKgrd9E58CcXT6vVSmSw2tVONZ444xRJQo8NEBXaR/ijVYRosgEYmzTFQGtdKNei7jMafpBPa17aObWQOhacenrOhmPyz/wA6hIi7iYup6N8xxQSyXJLYh5MCH9pEiUXvxv6wODgr303YqwU2JIdnCIlPNgou2Oz5rjFabbNb80WISmJos2pCNavtQNmNDqM2Hk4Bc57QrTqwtFn6XtYr7FCiwx3g4D5PhD6qGkzNhfekau3qq7KxPXjxPX2J0/H4CbW3oyue/EaSzhYrCK/gIL3V3lm0LROIp+xenPDRzxO2O8Ngp/4qgloVb1JXJs+qLYK3i7FYrY6cBP0e3AdQc9QG82wNo+fHp8AUQXfjMAW3uKhl4rAx8nYgieT/AB3lBXpZ2iOJt3BwySqRz+1Py1q/y92Am3yq0QaNcPk35498QsHOtZHkhvgADmTT7FDdEKGj4nkKu5lSGT52I+HOmJJ1b0ZDMY/WVbU4ikrv0qXPeCxNvP0Ddjki3lltUUC10XVwFTM8HSpiRiAmt2ib+dg4RhGF0I8mu6PYq2zg8Q5bPeIL9qRtraZnt13TBS0z0rJHjIJIxSQt2DOJeupDWGPVf119XDu4cKfeLOjY24tKMSwidgybH2gwsFN4jjCsRQFnLjVBk+QBhhWwQbGu1RPewN4PVBLKRoSUbJId39zFYKPE1GO50bnH6qLHv1Jwqiv5Jzd4NUkESwUiJqwno9wfb4QhElz6FEpqbfSqx42Gpv7Z/m0/8/V8fXq6ytH8faEfg3J5721Q9VTWjOxtE+iLOZEBmu/B1FUUYQ0hVuqPL8dahoSLi9uOgGCRAsmJW2O8YeTgP4yQs7OG5VVO8nz9EsIhW2VId5Pg4fVVeiyTJdkvgbXF/BIp6joahGe/R9RVd3+5RWTnoOxmR6LH316Rq7znP+Ps6vVSgjd0X008neYrGRju2r21vqCstldjNSVxOns9EAkma/1jqQ7k7610loTJ2swsObZ1X1w6ClFtQuNLqR7RarbNZNkoMQDfCQKU/YW6nLOWM/XH3opcc7cspW0G29yj4QG+SxNbQzg+jm9VxGpX3phW/o/MyhfH2z+zv+yntwGdrk0pO5SOJFQXm0KTkFSJ0zi8lvGXrOPkHU/ZVc1DcRLqO7ygf1LnjaPWrRUbkCQ0SXQUbDSMXF7Ox+kCFE2kvMEZ/Wmec5TjuxaGtTR3a1kVTRiSZK06R8a8v29/4Ct1r72KJOwYkKRM/ZD8Y8cqYZ06dP5ke8a1hU7ECeS7t8t5+cCEIkcvfmSfWrBrAlC2elaEqmsC5A7AxlFQv57lL86hLMrLMwTaPVIrq6YrBeDdE+UEyydwxkUajatd/gpxEgjICQlEtocZUUvEfkEEHs7C5VHrbwSi+XmVjrNsmrwxqpro8l8G0m7C36IChj3CMEziWg13XDlIsvsRocSnynXYg9Cw/WE4fkiUYu22Sjkr03k203PqiqDhqgtFqEb9Y6j3Rj7qKqW0j6XHFrMMuTVyPRSJxP7a91PvDlqrdYpcyTaf7U/QEn2DWA0Hk80fFvZwoXced3g70jUCoJll5aU7PT7L7H5+MfsVgXgsGG7oTNlaZbDxWDlPsnsPiUW6Fk4Ex4B1Kosqj26yWRB4fyBXWsixYHGROhrbyFWej7Ru7eSHys0g5lHq3LSSP/jUxDzatuPLikenkbE6RhHzPTcmnJMXB4n4t+LFx3Ms0qM51MnjjbJhI7YZ/V6Z5xjvUZk/D8VLKv5kw1hVUlqkz6fp6du9MGLVaKSteY+dF7PLkg7Pt07hjmJHE/jcnDbWFYSXWGj2fY2ITo9IE+1KN0IUqRZoMUdnbjJk9OyNxSB5aWU5w4ToQhOQYQuE80lSZ08IHBbgE6vl+ThpCTUWUSO8Eybo0TTB71u59lVBV2u/JkUrKBs4tMrjMwuqCqNBh/V2/Uqc09TpoXR+8KU/Or8z/Hxr8BLIxnVaR2jwFG2ZaVXwIlSGgefC+PQuV7xOhDP7vmraZS1Sabql0hH2q6Mb96py8Ttj/km7RJA+S7WbI8K1G441pS3dHiLevhzhtpuVCe5HX+ptZBu69a3XknMBsQ8PWxcdHXctkpWdHGVTd6pTFy0O0k3ETmP3RhHU3lnmwrHXGe7kl8bCWYeNT/v/AP6xHuZnHGAt4/GiyupWDpAwOjw63tHIk7LSbD4D0GYDC+95cPWlBEm+RJOeCJGyibCHz4hSFaeZJpWlaVsvZ58CxsLpypP9okKpZRVVnGuX3zh+X/2J/wDUFWQCSSCSz9x2C8n65hpNEyfHz3gnXhBZ5wev0gStDMnTjjJ5G/t1rcHLyW0As8dxe29K0NRC6VfJUSwtv5whc5vrnCJWnQQF3MlJucQactutGHki3i0IPSoWN13kv5cRfwUZZU9beGFrL5h9TXT40hkE/hxL1LVjRklqsCgBqiNaDbG0sTxfuwwG1/cqvWj558tUqoZvkYsouqJ8A4fcmJ8gshDUdsiG1ixikp+8nQ+H/WxD8sz2GDT/AGhzEGnhts51Mw3YYYt8cp/mGcaP125I5WZag5A421lc8VhDD+CvG0LW8mJbAh6Rb05/B9ARVVaqCJ27f0gWByfj9qkhhbeyC1tnbcROkR7VLTO283X/ACVwSa2oRFzaIbJWfOyOMg32z2lZ1SPEhnHxUdS7X2DWVh0AwyPEYQrfzKn+SXZLOxg9TuEjXfy71MmXVbjLsdsnnUxT0+IdYWgQixh6/KLA3x44V2a/isU6VLhkb0udCxYA2NVDUpu/PVTeJtpYulWq3yTYn82R6Q5a5YluMbcLX57gBD9RKJK8FqcDhrbj8Pxwr+K+5Vfz0LsNqvv3JH4n/SSyTnSJ3R1b1si2LZjbTgWsPH+iQL+ff11FMs1lnFVqoekOMyEkkzuff3uX2nnU0CxFVFcCUIWDPQ6PhFeDsM6Tr3PQ6PhFeIAisiHUzPZ6O7t3q1eRTQkqv8oighyIYtrpMWfW5cYa/Mago/aqfrrd+S2okPP2pWjkca8RSwZkOW7++Cq/TVL/ACc0ZyS+POKFyE/8zClB3dPdQv0B1ffjMPJn39i5mZQlV+OO38yv5aE8RBZ55HSuRdsFS4gyfDvBY90KQW2yO0izdCkDR9LHfCtLlO8dP+3X36Vqhm7t/BP5k5a2b+P3rcbPgNRXU8ogjgNbnTvPx5OXWrBZLNr4dn9oM9gqecTGhLQfIbtf6OAJ9TKVdzZ3iflzLWzMzmcNy8i6XDbzO5oZeHf1wTU6+7urT10409dBlG73i1FiNxdi3ehJ1EVS6AEa4KrrxOzEmf0q2Va1hKtGsUs0qiM+Bb6IL4LO5kPXyR1Ud48fn46+1RuwF3jmGIhL+lIbIf8Acrhj7Ki2nk67lLCbL/OHTEevPL351rc/k786cnKd9nwTPOndW7qU/kltnRGILpW2iQNiEqEnQqxknnngbt7eoWByc/er95NeSPUdrMJDySPolh9cd+WO9U6sxbZLq/AwIvvEKkb4Ltzl01hOsDyUQKYoCQK0l1s5yKIvu1t7dhNs+ShWkS/pK3YmNhrf5t094H8BNwlUAz8lM/Lq6OfOYxC5uXkyCn9oTRkSUq5eB59sDlB1E45UdLUqWe3N/bIgoNtNyfdFMJtfWc1E12l0KKTfComThcQ/2qGqDKZbJrZKpseeIH0/tjWXHBO9NnQ8nVAOoDa1/XEwW2lV4dRPdyFqUPRT4UpXH7PVUOi1yISquzzqZdX48vQDROkzgJyuNZZV84Gz5897xGDM+rrWbUqKpaqabAtesgiUZQtQk4Exo3ONIuPstyhuTUk6nKW8H4x2ot0Ih/DEXrRrdxG3nDIOGNObzb6V40r3V9ePu9wlOj6XS0aXO5lnGY7I6Zv3/wBmNkm1hOInT7ztyjFyMz7l0de5M86d478ILBnodHwipTRVmgK9uK+5G4kfOPRkMOimRTaExMb6dZxV+F8DrQmEhjd8dq9UuVabWbFTLJrU3ugHefeKJt1NvH9YN3qZSiGmnidIMBcB9f2rq8IzWTZTFlbJVNsz2+0+/WUsZGMq+luF+b5PI3ilfBU9cy9bMuMl/ROZRg8KQixCb6/2alKU317sOPAPDHUzjQj5dEvMmIQxQ0W+1XNqvJYsfq8h0401jg4MLe44fZVzJcp02ffz8kLlbm3a2uhKwoSnbOLMGp0Fo2yguexhlvn0/wC9KoGe8T07ulSbRDDrsbbPtSOpqdQ5yE8CZlN32YBykniOybPn6ZTH5H1x1DyEXJt8KjQPWiqOOBjzx73qFKqfnFqqSnXjPlCQjECO6+Cw5IFVCMdtdEQn8WdhCGOGv2hbtadROlTDm8f0nT7ncoeqzZxekt7R96NZFH/3SCwYdFJC4T/TTILc251jJtTyUrRiG/jLULIO6FBuQJo2nLJrU64Ij/SGqIsgd/JhxFlyaqvMk46jiGoWoWskXwWqNnNA0g3uA/sqT2yWmUXQDxJsYswp6FKUxRTnjajDhwcfA4ghVWnByiB3mjJgliiuoRxnphuTphXfvx317qV4hiQspF7c5IIQ7a1VUmsXGQO3T8XhN6ujZxdSuR9aY7jwiIUJZ07HdWyLmRJeA/CTEeqlrpW/uUpqyOrRSCIi3FtcQg79XGFMdKEbs0NFQLf0Z3CP30E20gM0UIltEoftByMbW2TPCkYb2XkXUn8n9GSC0WpO92rDSI3wXLalZ2Yk4f8AkusNhEmTZzkpWi1gRG6JbEed9kVL9Oa1PkieJ+cWVRIX40Da71VbBI4QJkUPlKKIWqWkG1VO4x5LEUVU43P1UvEhophqfagJLKwIgjGAW4XLSn8ycR8+a9dBcmnLPYbJG6RSLhZa2CtkeN1HS0bzz/eilKrirM2ra9PkhH7Ur4c2TD1/5UCydulVeW2eKRyJk6JBdrJXyWH6gcxVFo88UR9v2OnQdeA+tGq/hvC8VwuDdHrUfWe2k0haMxA1BSDqK7NZXrgO6KkZfm/d07PXDOKv7kN5z4ehkp3CpJiXkZuROvLHzqBjnScRJiPGGroXNi2zIbkuph1T2XzhWkosrHGUh6Pp3+FXStQra3lC2b2LSZHhQ6ElvpYl4lOMnlCoT05WPPXZCSxDWnmO5P2S8vP7vx6h3taSuGKlyL216QcbJtkteUc44esKVdKf5o+kKdirjWQGYHMX3XcsFEloWWLWto+eAaGNholhLjgjBP6QOJ6kSyQzx2r8VqO4V7pkLc193NSouPAU/wB/+tfaNNzq1zydp7RciJSKDoTTXmZHWtvc20Oo2F1Z3CRixnVrnhF/xC0qn/M9kPvUjhfh9yyFJ01DsZFVxQW2gch/0qf9Aj9Kn/QKqs546urkWEypeXqgt1/Ipr+zGifIDQXYk2nTvxuSz9J87n+1Uh8JL55HR2rNJqT1i7svTYro/aU31IEnybZi8n6Tun7EfpO6fsVIPDCdzwXvh3O9nKXH/Z8j4Kj35Io+AXl/SUZzR+CV/pUnRzHN+Coh4ew6PgvJtb4H9v8AcuP+zlHwDh8izeAX8k2qG57d96zSbYJ0jkviqBeHs7/PR+KwfpC73rj/ALLkv2I5/IRL9iUdEJ1s07dmOhMM60JtPM2kFrL5Oe5Ubk1tf+w/FLJNbGdiEdGSKNOYIE9LKRQpjUguXpinCOMU62Q7IRTQ5NtBus7aWMW/f2KscmsJ3tyeA6w7fkuFLPdob25zDjW21kBKhlntmOMn3U4KszxYzZv48kelWsS+PwWGkG93renKhq9vOF0Ywa4XbtWuN6wyawz4ezxv5OpIimlDL1bNnRtanyD8v2V/EcnkbLIKs3CC2dQhshgsbbMbPQZMSPBxhwt1+sBbIFR9Fer0419WAWkvFVM4IeueNio61I1m9LVrWFOSD2inH3SZRN9xoPg+B/bEjlDumzSj+RdGTxrhyzDiWAWfRLmVXW6ZsoXSabpuRxYH+xa4LPg9FQkEYcX+O1qXhLFJ1OSZ7vaRaI2U8wiC6hAYYCHXjJ6jFyyqbCLP4YezClXO01zF9chyKHIyruaV2aBRUeePL0P+ocQ9FGRm5DYIFntg2pns4qmop0+DfThOrXAx88gNy2l+p2yuyyVIqC1+vhhYf1QFqh1Kk9a5VttdcbPGo2qzNiu4oF6S/tk9VMeK2s+YzJ5BJD9ULn7YbDSDfiOtSyN0b3jLGpSbdagvgR5anvUrup7qVFhI6LXbFHyrpBlCsB0fq/LpOjJntFkNnWDFjxOo6ohdD+xyFSeu7SHiqp2mLXq+c6qKxPE2Q4SDdq6FXdyt+fiG2e0DtbW0i4W64FQyYYY6zp5BELyt952pxiritPRRB25gug2oip48c6/V19XuHFXSDoxspInyEYbS9/aKibHi2Xz7fS7UK1C3XxMji29xioZeHia+TsQScUWTyQOPuWvqSLM2ikXyqQmitnQmn2O7aywo3QirLSrGQLdR0hThT2193XX2CpJ69by0iS6bCdeZ85vqEII/Qn53DbpDu6jtE+BbZip+EM+kcOswbPOn/sPxTmgvjTERWNgZF+82duTPkMGeVJnT+LrdmCm5x3x1ci2pgpXMb+tTjRVmdR1sXgKYao3XXlu5sMAAB1Q5U3TE8zYIncODlIn4hp3RvoKVeoeVrk5CYj5tYYRv8QprDpZtpCSE71vqK8Qa0UjC7SJ8feltpblRVlsjD0hOErWuuEJcXV0dvp9gv9m/l/JQU5uTi6mRvkulQPpXNt/2qvknz24y40zIsvGbcc/8qeviNcxiMJa8Vr8mRt/fOH6qq2MfLiHDCtLWJqDpxkh5P/saxU3Z88VwWDEgErRZZOBZ6b+kKgUv2S2EO9Uu8NMRFqB+FjqD/wAnafHV/wCkKKpyjmF0eB3QVqbLsdV1rp0IQx/+yw+/aoBdekWItNv5JiCYqfd3euuPVhjWvVjvFEaQNIyNWmwSxOa7LX/5xp9lmT43U5OkODw1tTpUzTrDpyEcBT1I+9FKM8oPLjaLOYnUhZOQLVldw2F4q+G3tzf7qKGqyZR+WubWMmfQFjBDpT9CeuPF3lCryPejFz+kzpwMmeQ4c27eklm6J5K63Hyn0i1r9Bv/APJh1er41rUZYnrqd3DI7RLHz/4CB4fapfapcTnd3NJdSCiroFmnY9wh1LVZxsn1ftvhuWGcZCfrvh96JMnP6oR6oLTiFEGxaNWtN1BB3kkq+V6Zjq+II/HETuj4pyj4jjMjXzrNOzQEmG8sqEObcm2TJnEfFeBtWrqFqN68tUZ52eInf+BRmYf5gtSBQllla18ZAZgZCShY8bd/R7eB/GKTXKVZDZLO8sPf6S67wt+DZNdHYj3oxMsndEZBL7KstrFvBTf3ceqnvD/GW2s9ptEufUpn7RxGVF2WVfX06RIaWsqEIbzDtbcpBMpyyCzOA/he6fpAqiP+TlLej/4oxaJV9r9d1T5PIO8HmITUHTlK+T6ej1qJ5Mnn397kwqluWWr51XUJd1P5/wAsMO+o7LTFuwiPmDbXKftVf/jE4VVbxWtRh6Ip4ESz2mBCtjaKW8n/ANqWk2b0HV9rVag0fQ7UVUNTuxN8Y/1fzlFmrPZjZjXtsVYA2f0A1Qdn4vjl/o2nxvail+hqx+xmybIfssdX+oXsXSeFxtYVgdFVXfmkKN0cIkh7Z5clX3++oR0Wdznn8ssEeTrk0WfZJVIHVhWLq1O1dFteNqSrzvUfdRfdVRbKWyrqwyi6jn2L2HgFFsJZWBeHjdA9atapblbDls1fPs3soBKaaDE44Yd/9UlT/aDQeSHSrpZvZh+sNrLqL+sdXX34AndrVdW3bcgSc8u3GnV7cilc5Uq9BH6anVSlO6n3h4ZNEUEtfn6HaGtz22hMlphOHIPFqu04vjpkN4RFyp25P79XDliCCIca4mtVnPDlUjkc4PBxTsUX7dH0f9VW+Sp0mjm3TBMjai/Q7Pv/AIpast6E8hJVcyBzLvlOJ/zwp+eO8TaHkvKqWorzMKiXlfTyDM/uUmlW3R7frfi9d/IobWU02cdOnkkbWUWVuSJS1mjqMMRXl3XStdMjr8mRsTkJFCdCEJ4EJAhCEAAlGf6PsSdCAB1j5qd1/ev0h2I03JskyXqCaCJOEK8GB3t3h7w4fzXA6wihJNplstnVAZjFi1BWMiLwJ/q4fajF3yyraqhTdET+CNyQWTdPr5acuWGspvXpG1x/fup+Is+xIdaafosf2yhCDjnaC8Y53dZ+fvuK574qGnid5+77ILdn4zPzp+/V9qitynef/v1LREAy2dBNuNUaWJhJFpsH0RmZ52HDrG/2XA371HtYGeUp/N1XLapMmT4HVGR/r6RyLXDA8RXj4RqwtPFEG9Sit3KvKopt2HpFlMoyhLvNfBs0P3/76g2mz5hD8JASNlLYaIa/CqpI/wBYe6rSYOU2saqdavd7hMWTpwyEVuFSRhTlnwLeRIwj9W5WnMZHkHWhuXkNtHZs/wAb27UoG72Ty4R+/wD1JmUqpvr9BuQN0ilsUciw+c9Kr++NbcjccaQQRqTek63ClW3HuMgnVhRNuVSxiMje8thrumYM25dYWJNcpNK0rYtS7fI4o6H1w83e0kKDpU7MaVcHCG1O3G+RTC8ByR5zU4O+KvaaDxwf1kjiSgadOnO0n5q/qIowipG7AmdTlnQKJJeFUUFiN+V+/wDUSCyVOnT50SCE/Nocc9fHC9abZIfmPs1fepCYWfph1cqsiHZqxcb5wfOqfpBttCCWmpYnI5shg/M7bdJ3q1tgVmM+sajChCRs12qPLFQpSrBOdZ0gceReu1WTrZLJo5gHJIB2qOu+5VJpavpG2IQ5UD+cqdEa1mHiOjuzSbP+sn5JRNVOhsVmNGkOLtPFamOn2vGuxcLoXRHX50rcbXnG3a011tHPkbNxKm2j+r24ficftXQf8ozlExkcKTYBSE4q6+QbaKWDdG72Nr7VyTnTsDmPwUV/R0sJ2kmpf0wn5w53I4/s8d9ff92HDeMurLY0PRwf6ZgjWedO771gQtYj4GDPQ6PhFJkoQlAZw8L4zsen/eWJCTh52ygUL4kzuff3uWGT56HXFYEDvtgchOI9+Zd8fyctITaWycJDuRrKreqD6qjy+6/cuBE64cOfz4Vfp1yemHwWye7JGgiRhCRKEAOLjvjiJ4n43rJn6U8lRC2o6O6lls/uJT+eA7rarUooZOgmNRt4fsCwz7vxXH6vHOSc5nfiuimUtUkMyeNycvPBcu3id47k1JBoOh9RE7QNf6CYfYYM78MJ3mYpiM39n4JxcfPfH7kwm+Yh35FpFHiJJd7ygYTfx+9aqZO+H2J+MnLW506F0/mwvYn5LiMo3fJc6deotC2SZzVYHSzeRI2uoKnPew4boYfWoaeDPEz/ALPuU71tD/i+szHGn/QWO+SrU/zvP/WuZQW0+ebnX8apz/aLDuR4jCWQwY0P0ERoZk74/amjPR6fhBOM3zMe/OmedO7xX3dMlRBLAZEW552o4CSdO5t/e9Emdz7+9yRZ/o+xGf6PsVDvJhZZ4m4CzmvzgJIoNywNSNRGrWV1LrB+UTqWTWOTHY9Ww0dlKqeENa4303O8cCRzlLqbaTCbaL+T6nD34suyisWl8hC+7Z5+y/8A1/2JJf6S0lCw8yhy1E1TI/8AWJq/vwErh6f0G55fQN/cMQcgkIQqUEcFj8ny1MOjn46j6v2uzqtxdCVHff5P/wBapttNpZyoeqnVnP8AVCtjMv1uA3tSgJWtpYyTbFREimHGfAq0Wkhf1cMjqhV7d/VUfeVeeji7lmz06a+bBTj/AD/P4B9ZJKzcT5B+cIbMl/7hBBS+fHf6SzGhzpE6eMRG+/VFI5/J351b0k8WbiKb29Rnkzu+5XtyZXmNR0Hb3ZvDbH2oLMZ75TYYMbnFwIAhErC/GMFRKTvh1x+SlmyatX6ga7ZKnpg7RTm1E3Rhzr6kGK89ai8O2PzvIOl/zCYKU/z9QebbebPLpoVPkz8gZbPsy62bvY+Y8piFzzdfs61AKdJkTsPmPt3LpHUrDknWdBOts1TMtThv1bteO/QsE+iRp48giGK2SHGxRu9y56VJOkkZhwGBFExUcdHlXxouudWXYKN126tDolIUxz4cvvpTfXHDDfXDDfurXfhNnmtbtEUNZkcsy5cvjIY43Cm3iaDVTU4Dz4YoR1xwfKrrZRsnwVq8et28jZrQGuBol8eZUFbTc+5A8u1K8M+0hhfWFqswreeL4MOlGgmBu992gCF7ebVZtPR8w2JrCEKcipP7Pdj76cfX1CyIJZaURO/Y9g3+MOuSjpI20KR9akcRSetrIKrdbYMp494BLaWJgz72G7m+j9ohepwyZIttltE23VhUDXi6nspa575APHf6pv8AuVPH7KUtZtaZzvCB7hoJ22EsTR+AblVyRp6f0iv3Fu1TImmmRI5z1441opzfu+8dqLul79OgxPzhOWURDJ4xI6ldy3h5MY8kelh/Wq2rFUdnZ4edI73K2NvBgjpYdk7NI+4sqeeZ2Kx7yaVeztv1/wD8jPX9xOp/vwDxfSO2xxGDevOZjE/uUFWbMabcqqfmpob5G0mFD/zXRfLFquTZLYpR9jDfPF066jY12D935U25KdnzDZlRL3b9W9wrZT4pBzRzQhyrn1bva072qVg91e8caditiD/q8b2RR5Y1dIGkghSf8MizZzm8a/d7uv3CE3I72FDZ+tmX/wC8YQbONjPT82+0cm9atJk99629nDhq/uWg1uAra1au3siniLQ2HWyVHY9VQL+0T8W1lleV6cj6OPH6F+iiiKrbaxYGqoWefs7qJA4S5fmQYW3PmDj+tRjrXX2yS2KirCWcKympnTCObVS8+t3fmAGv4t9ZWM/0ibQZSJ2r+JR8+rj0O2nTr9274+wXdpAtWtYhs+r/AMRP0iic8p23gOxGiiDh4Yup6hz4NIhc5HMuELjUjvUbudUD+6FOr66lY0suELoQ7FMmVZbBKtbtZNIaHQkqmafFwNOQ+jffClAcmTEiJF/P1KfaF9HyFoWwSSfo+fLlzm9nVT/LvEp0QwaTFGi9P1wbgxednq71j87Y/l3+Co0z+e4PWrp2Pztj57+xOWkZH+jzi39IHnEHSo6T0fOz8mN3bzqU2z/G786gez0zPhyNXZzKbG3/ABVg6dR2d2fAYPmEaoOztxwRDf8AJxqmOIb6wfaUKhuDNjdH4J4m0VZNP2hnt0bI8whsYRuXNttbXJ1neT2op3+ogrYw7GrUzZ2wWc1iX0hMNy2pJndxWSqDlaiXu/Gn4iVxuk24l91Gef6gvvPsyYJ829vtbs5do+/HiRSedY3V5sJ+AfKEdb4bwToqo7bk4ZR520N9jFovVEEtvU1sOR3loz9ob6Ofmn67XjS3xXL5Ys0K7ppL98hC/wAg5IaTFkMm0Q5sRZR4Ya7jZPIs4HstbC3QVy014chOELue+77FXFys9rVquxFHP1/1BS+25FGWZGF/hUM1fXqsvW4B5FGVzD0hbRQgvNfVjtG5NDHSFBQKp0G8gjqzmMc3b5df/NV+wSpHSZHuM9XyKhM5sxspyf8AyCqc4N+kTv6OPwmrlATZeZ/VTn8FfaTkr2m+I0/lQUaJ/wBXlnx/74lMrJSlDx8sZX4keYQKk4Qv/wC1qQp6V7SJTGrilfqEXr9yIWI3rbyHm9CLk/gFAYGGEZ/DAFQ/gESZ07Mx2Erf/V66OhZOtjY87EVBbpXT/wBAIWj/ALlJLPZjk7McjZ2Su6q7Fwc6aoNKmLdisev1K0++lAPL6t5l88t/D7ByfkuXjcR2dCm/wKp39HYVbAVcUXV5TlAIuksFCLgAPfrJu+/pXRDSVjLJJuZ7FoXw/rzyfGCR/wDCKktWIb6YssYhYCc8Nyjr3SZOy+r8gRSierNnPmVTJnJ3VxpX7N/rCJC9ZF7QmwxxnOQw55NtntoTrJkD0/Q9ZGRK9wLipfaMmq302dIJb6AiL75VL6IBH7FZablK2zT5JGHpamKe9j3KJqqyorQeLyLTaYDu9hwkf/24i8rcmkuUUo3btmqdfWZQ/wDgHeiOkOVr5u2RIn9MwfGLIntYzM+Q42i0tRLW6+lxGTFVBHpTnNslyZLK5Uge1e2l0qBzhqMaAjtHt0f4IFUJrW30Sqozxqvr6sKgJh6neJFvUKTrZggZ2HZ6Uay+TGvnpFOKFk3xKpYzkuanDEjdIhMf/M416g2vFo9jT/ey8M6nhb8v/wC4QdTY5U9hNnN41j9iRTphYbHUZkIN8FHFV5aNuVScGMGh1piz8X3HCOEY/wDt1ztZ7WjDngHHwwjWWTtYbHuTZanUrDUjvAikdJ6C/wAbG64RT9DaKLRouR7VtV1jTNrVj1Wp1d+77AJT+iGMt5adQRM8ks2XKubIc/0xOVU2mU+a4zp9XVFWNVvkOQ07T7biOhRY42zOc/Pjs7G1tXWoIzsen/eRnsRfyXQVpMIWGao0o1NmSp8Ph3CBS+nG+HCR2MUsVg38KRcg2h3qN3e4XO7o5u31065MWf6PsSde56HR8IqS0eIN6bM1puFQKyTuVWo4cVMdTxHHiUIk57X9ycpLbOn3/fuXJFFYeMo2RfUDNmYdHxinmS2TiL/EfJbs20ryx7fnqUnM9LQuw7eASWTHpuRV4zY0xF8WToJuGb59x6MR620ryR+z71LTPTc6fmB2+QUUUWVdgwgLlLrTZdKADkHV68jUs3FwvgF/yX8/rE/C9OBdfNzWHJaLO6egxQiLgS6hP4P5r+fCHMXIv16t6r97dq75bZ4VPWVp2+CdPz3UGy7J0Twdu1JRgjnUDxGy2l7OpUhwtUeoaSz8k4Oz2l46Qfz4w3YovfH7N29NFXWrPlRNMKab5DXRVDBkT4Qp9l8gcKI3vX8rlGpk6fn4XxKdnMvmvcEZltHvPqCfpXCFbHTgJ3k+H1rPplLCc6R/MH2pz2fAT/lp/jXGvrE8kaIxaxEDE217/AQgbQxDHyVcP5JbN/hGcBo+KsbZNZmG6tppw07wVo9qh+slor4DdUTh9V+xZrM7JpT42yK/tNNg1UL9EU2FHyjV3uowf3K1tdVfR1h9Kg2kWvBCClCxususjBO/wgP5/JV5fd9mq4pCQ2Y7nNk5Hj7qUrxr316JeNccMK5+0i3y0t1XGp9dK9pXwfQINoi50hZjQk9/q4CFmtlInoikOFD9cK9+trkhlE5Wda27OWjx/wBXqEaofq5TgW+K0m3G3e0K3ao57vU51wofE2gH0cAOoChOzGzjKa6OdErS2z1uG6alUlsd1OnRP8a17zV319VNwxxMTyuuO9of65xmnGZ/jHGvmkawTt0eqHzTmGHOn7TiMILuV3VWRXEU88fLAkhzjlmnZqRszf2Gb05Z4x0nSGdnBL6vpFwUxttjcmnWaRWFrrrCimLC44Onb/1xP91FD/BIH05GQ6NPKKm+vDvr7KdYf2cPt1f6J9F2lz9AQ5S1FP1YOUgCn2sl2JL5Qo6lOEaWshsekyT7TnXw1qfEkYKkaW1t8PrRaYqqt2MHbjqQsvYxbPqY5DAv6ZVAPzlGKvnieMdO5QdV1MzCtW1fMkfVXf8AHq92/wBY7KyVu27VNuwJtLnxn6Al+treK7rgSRT4+EoijhNQdIUr5PblEMjzXC6/vXmd/wCg/wDcXuflf82PxinGGh2cHTzY4h0lMSMottD8fan+wLJ2tCyin3RFEA4RrD1VJWButvAH/wDEqWsl7IirvKFNkO7xPKoizG7bHc4DylUH1VdTrX8omxTImosGzizljEMfhIbHTYJ138U6Kpb50ovEJGlk2CntUlXdjTfSntDmyiEUEdof8j6A2YNssI/J+WTERHIxbqXxsuP9IqvcVzNf3i2vLtraFQVAcTZ7YmwFbtzeCPctbNZ6rtaL/TflT1UU00cGTczU5GOj3CoPqofaoxtayg3e0aTIpChwf0e2YCQuEaAoXRiMo3Z+j14i7O9an2mX+de16CPDkJ+v7vsrMNSi3ptEtyKdhLtnEgWgW40jZnTk+yCwFrwjXhMDUdcw9IP0VSudOnHTp5JE/FlceMM+kUikyVKlB0TpXPvDvP0TS7Ttzw8f1h7qL7ytJxdvQ1lxh1+uvTPXeopX8+6nCm7cG1HyteEiRi39H2S9ggw0rTYcW3wnqfY2ITifLj1p78/GVG5TyCOsQPlAu9VFWyV3Ws6ojIjt8gpqYmn0Qz3XX+9Fe8qNpO6HVH5p0jEVn3nMhT3BFccu0QRJbcEfzYnTN+2OM6EIUjEXAhCEACdCUJOlATgQhKEAHUL8mHZuYdaTWFp7hdhqJYtBhx94P19+tSVlpVtOn1JPaB56sFkQUHOsryZQnhwn+VLQHOfW5kbvaeJ/cuattlVeFVVPjhn9WKvWNLSrS8tMEnP09EjXIT3bvvxGqNCEPs8iq9cejbI/3ziE3gzmUSvBkc92cmpbtUpnP9kFGRpuf/lyrWbPmEsRFdLFyLPZHZ25xvcqTn6DNj7XWN13LFLG1nDOciG8iQVHwhqiec8Gf1e3DopWd5BpxvzGLuf574Z9WHW0yXGSCzVHWDRrjUJU+lWdn9gHIUIeLVWak15N4YYGHZ6pF8/9GinyvqF5an/qaoRk/PMmo6qOcM+VoGnhfI+rVhlFbyZOOnTyN3RBbtUmZag5FPjz9XHjL/aVGPn8/G9VNekisyR8hfOdM31xCZdZVeRPt3pM2c31x7J89DripfoNtbZ5jGzuA/8ASJ+HiXru2cdaGwh6VnYeHFfXIKbW2bNY6bqquR8KWK7fqrTYcUWJE+So7yt4+j/7hwsgUde72hx6MnLN9QgbK8fsc2naPn63d0wLP/s5vUbyQ+fv2J+rCdKnvALeP/k81aDSQOTOI3fyVzQMbR9ILP1/Rk5BQ2zCzyVlj1Du2tnbf/7qmBnDhq/uWttrZ2Xf+8rCWS0TOql+BH7elPE7JosWZ13HoiDVGi20EYNnt7/0ZCiy2SvZBOqN4kPDgPsonYugGUJbM25PVlrnV3BkYt+LhoOkGf8ArBxI3d+hbLZZQjdZ/TUYwhhRhBccYZzrhJlZZRJtvlpuJBnkxoSni9CUg0f1h71/FLGcfHPdNukWhFv+Gtt56+ru99fsx9QqbSBd/wAoZU7/APqxOQgQVwcXZxqFwNdnafApzf3Oe9u5d/HyCNyaESOXvzIW70EEGyFGrVPdQQQCE4JLJjiNS76/1BPr/UEKF8St/bBfacBxR1K6QUIWfMx6fjBYEnC4CJHL35kIQFA2pgYZ1VOTGzj7qhfpDGHzbQv1YuOwtY4/sgkNS/NPkv0tNrDKDseZx7tkrKQ+Rvjqw7f5Vgv0g2gmYBnOu/FYW/SZd7ddcVB1+bTOb+M/+QUsq7dkp84c2QcvMpCpMRJn8mvcqKuU6Oen71ZW3gycRO+9VenXyNevmV36Po7YreR7x+g9ltEmVmEDKZu7fwWuOW+Hflin+dO5t/e9a05/4vfmVnMhW96PKao+AZzJy1s38fvTwZO7/NaoZu7fwT4Mx3QsjTOLRBPvhHZBS0SLsTT7pPZPuVfKk898FNdhDC+1HCo6fwRRVMFiz/LG+nm8lYqrsguMw5FU0xEqPMcoDGScbESLqIqftG+0T16zkb30esEIlHO4IXIYv1O2Kxzv/T9m5MU3f2xU1vFlb9Ikx0fhXb6jqUVvDO5AzsO4AlCFCcu5Mt3I0fIn2AZ6eW5O26t/SzYyI0838fvSNLDfx+9I1ntb0vuCMP7bOjnpG9dZckCE60ayC3yyka4p9quzv9XPrIAn9y5Jh+e79CulkmWp/oltTpyoCI7NErAl3cg5G5TNvFyM7o+esGHpU+eJ/wAwlaKU+0P9q/8AEjsP2xcgoqhXXy47ATbFbWXR3aJEI2dWhZ+qaQLhHVCPskFShUSouialHTH0Z+WU34BsWR2dbZwJyZ3ExqcgXBvnlCFCcTMTahd0XiyCybgdBa3PNtt7dpcfCtVrIcPLDPubqv8AehfeVB5kmdIMnjuEiIhQmwmB861ptnOTUaC4M88oR0FKxwZin4KqqbtUlSGer/1erziIdRx9HP8AzaU9598V+2rdSzxoRhKnyJeLsGD1qI64kscckj/cWEMyOXvzJykzp0idiNqTk8U25MZkBz9kv3R5kjkcvfmVuW3GvW6HnAhKqKzJ2m3cEMRQgu3lBU3OrGTktV+46U0XaDR8hiqQwH2gCEBvvWrWo2f0fZO61RROei/ujWTeG7hAbtkXlnOWHaxZbRPgM0yGJ2at7QW+BRcHBg+q3KC5zk5Osqe8PBxRZWK44cotYts3REvnLCQWomzTNXJkP6TGtKpdW7LTdhjXHHfhhQW3ETMdrDuMhTqnL2y9AmQYGeOYMu19EVvk6dOn5jjUEzt2Z77k5Z6TmMP9qtFbgLas+OWi44+KxdWcXVsPtlpdqpWsKAtGn6J8K6OIpVoq7j7cAOQJ60GnIqyanLOrD6PpCDoxVA+6d028VGyQx7eAOfGOu7tUISrMoA2YnWoEEeS2lzkBBwx97biFvbBTdX1lZw6njhE4Z/JwNOB36Ox6z9JQkMWbPcES+qmnrilVpju1hKYfdvw4dffi/JQcV5WJK0dlI5J0i5hXZ3nSTqknkN8jZcVvu1rpIz5ODnW4dj3hTPFEpelKOnm1Gq60VZjQlmTxB3tudRMUKLjhKFCu8IXAj2VdDrZarfQrE44iQ2U/p+I4GEBjqAb+ZR3STeTpzJRsPbKlcc2Si/VWp6ZOb78Kb8eHViGK45dZd2wYwfBZTpCluUVWtHWmTwWgavYU/R7ALgWmnQQIHxjd60q0uNllgcZOkJFeujqVdqEN4WAUQvzl46fEef06lFbk5To/tytXxgrotrR/5JYIMY16omkSuOFMMK47647sfXXfxDBdK9pW9kYVZ7TqfGLWttN0eDOkDDeB38ccKerI0JZlQT3AeJINBu31E7d0rmDJeJ3iNodPipIpt+nR/blLpPWfJvkPNn9SV/PrDlbd0xN0rEYMSFbfUKO1FOWbWNUBJCqefS7DB+iVcHgYa1Q7KcsJd6ccz7VWd1dK1o+oHPHuxW6oafI5EyU3a0/tTPIaHCfi8Vt23K3Vkto7Y7TzaYqGAlQsTqLgqjEO9HnjqjiRV3WDInuUixnNe2Su/On14d1e77fU5y9lzcVQ8susZYcqZPJxTl6k+yd0OqPzUs262QGWMWgzmeROxVMuvlukXffcPy/2VRRJk5+O5aJippnPRiEvHnzpKF/O4WDYj3bktobjamXz07qVobKzP+nv+5VeZfPTupWPsx5FEbuS18efEWndKNV4gdLbNp2fkxu5vgp9bd8e/LBVdsxM8SrLNu6PfkgsHXSjs8gbEYCupHZ5Y45KyrfsqGF448LE6e6AQIptnW4ZUMfSFs9CNXJsLCJC9cw59bVP/WpGvpTAZVVQS/NuhMvk/wADhXcq2mTRdb7ZLXUbIf8ASob76jo5lLfZ0wO1Mb30/mOpU21m0ifNnaZypyoc8AWERgWaFr7aDO8oZRdojrfrjc/Ca1yeJeHPh3fnHT/95StQ1Mh1HJn8B1NdZ/BxP+KdHg/cuNLJtpZI1VSUpWngRRL3d1AipOxj4pGTVphT6Rq1+4XhNt+sakayKxrqq/rz8WB+C1UzKcsmkZ/D0c+mFcuNqy5JaZsEoAvg4ufwHnhT/wDnaUjD/wDdTW6cBup6fI4ALFT0zg3+tsg87/8AdgubaAhE8UmlFMad56lp/dw+4XbbeiC6ZwuY79Ipe7BQ330oH8PKEcjcx4P2IYsUvVfGOPWWdbNbMd6Hsya2oW+7GHAa4qKHS0V4FEjwG8Fna+DzNsieJz801V1ItctGMmwz9VunC13apsIQ+SdGkBFL116bNOtM1OmY5vvEelYm07TU1Lxy9WU9qeX4Y4joiZbDbNmY6QtGs6aRRIfFR48W1toM3D1Pa1U7/H2SlYCN9y5/OZhppf55xhBvC37Tw85DfdzJMuTCChjqnQ1RSfUISn4CHq6TY5vTUW1Doo0+nyxcN/t9ooGM8hoo8uoCi/XK3Ox961ydlU1sRJw4DUwtPQDDR8FV9J5/J3505rR0S1rTmc+XxVxEeeaT9IDmtKbfk+qX2CTjLU67dc+SfVL7DlwgJ1yj2dOnT52IIxRfPckaFJ27QjemBBAJCZkZg+1PVjnP9M1TfeHBfGdj0/7ywftv3l9J2z1DJspB5no9PwgjPR6fhBYEL4H3qEu4Czyc90/evU5SRpP50eB+bH83Vy867pJa6u+oVpI0WpvHyGHOIk862QOmzZ/Zu5Yrd2dsC1+Jhq4N63luEk8C/wDN4Md1+/oSgilWnRGiNHmh5jO1171bEaK20TfHEbr1JDPSs2fOkDgAlFw334C65SFS1PAH34nhE8P/ANbdz9Cy6bIljRHEFAb+HH1tvHwpn+/CP3KLvrgeKKagbWsjQpadvp69uQeh0q2gysfUD4Lhf6oB/pF1J8k13KY5U4CiGQYSOEwMXc3b6hj/ABkhaKNnHjgyC3EieRP/AOdwpmr5JbKkS+Bdw4Qu4XPem1aK2mmaQPrO4vY+AudnANMurp0RgMmlnTcQ4Gklw9sOO1LDOnSdREZ+imsXVjDvJ7h/CpzCkSyQnZ3ncH86e3RuFH9T4GqMf+R/NRU5ORj24T5zlOiRw8Vd/hQugljMuuVo2pup+eoVred7OoVmdjDE1dT9YfoOWfz47RI/jDvSKtLZxZNTdEU5JtGtdlFFDlaqRoWF0XGrSd91yMkWz2lqrrDhm1C3wdYtUNiFK4X54cvr4F2v4qy2TTP4dpNd2qWi1f8AmulR2cD8KTR/C4fB/NCaODCEY3cCX/NVbpKvBzH0eQ0fmImiQiipqVwOeh60pQhK9mmPE3GlOFK14UrdM67t2IUdZzZ0iFUNk5O43EpO73hXV1dyLCGiVava7hXWvDBsFZdZcBCGj6RHXHG1S1OtrYqwdqoqh1xRXQnW2WvastJtEfDateSXAiEc1DhQ4Wbhd1a1D7xwYauu5TvRho8Z24x8vr5VJJQuObCuRNP9mnTjSnt4131GO5aRcSCHlBWvOU4+sJjDd8B+u5I0oSgLgw4ZcI8LoVrCEmOd27rU1emYYw5UmRtBESvwUgUjRVX2lPkkBokDCClE6izdgp4D60tOYRpTuZI4J3BjMhzQj+atyr+rHsTRVHNxWimCcVPgaG28HCaR/wDTxhH/AAvsUbuCWcRjOpWm6vf3e4SeBjWdI5eQcVNsiFSUqQvTMbvxruEvONoVnNiE6LRZVOEtBrsTUZXJoGAbqfI/1X/JVleKjqSqXKe8Vg6ulQuZXrZsNy1xtkS+B/yYLPN39sVHYiAo3jflK9Uqo78Vf9PsphQMExPO5Q9Uq82in0SlCJCcZ3Cj9t3SkykStaIkUWpxEWSVqtXeFQYWInSGdnBLLdCy8Czhg/SBK685Lv5OCcTgbQMoYjCC8dZ7OeSH+1VM35POwWzNjpEe0qWxaSq40W7guLxNx+C/9BwYwh+Z8YqPPyk1tto1LFs1nlPPvDaadqRpzrxwBJf5hZcemZfd9iyvcd5zl6XSno6trKzJm3n3/Zhj+e4TYkcjDlI6W5Z/9BsmU5l0+C86Nj+TwAK7PsRcDpcKF7c3+6irn7K8D7LJ3hxauRG0y08vUJThx+kG8Aj/AFokrx+bZ5Z0HUNN8Dgyn2qxM64u5UMQcPG71fhavzO2EVV4ybPnTJx5RE8ww3jE8rh53h8Pf1K1LK0axES1PGxahiEryVT/ADinvpwp6hK5BJpbCCZsmd0feSvYIXuw4/YNztAtGq+1J9nv1XOhJUIFagvo5vWjrMPwYcOTP/Ohy36kvCDkEnSOBN4P53Bu59avmMiWkQxTbNaYFoIMerp25qq7UzHObjUbtSFIabhiCJ+FYmrbTHj/AOlF95TbXdd6bhJZ2eRBpo4TiYnK4X+tFe8p8tVJmtJTdSgHCgOxhU/IdOEHwYajSNfjSI/4/C+ChpMzFuaXUrJuTclPol6qCSXY8LaRPkRG0wqamKynWp9D6nq4j4lb+2Cy/tv3UlSr9j+6pQK4Q6wSZ3Vu61mTenBAEOsCEIQFAEIQgAFutn1IF19WtLUOBPLDKqt9kMcf4haUr/fk3mNtdcpIQ00eEwhhoo53beFfdCTPjKhK/Ojz/wCDHcoXpCnHFvWhITDWnOETPgHJo3TVkEUa8B1Oyln5ts5sqkU80A4VsEa5AIYd3q7euHr8Z58jl+G9dMMup5cPz2oLPxw+0f4N2v4rlq9cKPAkz/zft61TugCJRaWem7p01z5jDXtoV8i6Oqu2/TWMY1RGb+biN0VreuGz7VEosrkTiZu7fwS+mRpPDfZ8zhcH/CCBnvA/+hP/AOctCybhRokRBHtjKD5RS4JghHNeUc2XESkwtpjUFPGbwYcV8Fg4f6xI46sNUmSQTJBJEjCC0Q16DhGP0g4jpfSnCmlDyOHOIn8LhRbyH7/l+s3R/wALq6FFVfEz+AK0icGZwsw5SpDyXwI6/wA+f/zlBHatWaZl6cSFFxyTo0TaiKzfiIvnTp0+dBYUJa2SJfDNBlxh/gxhf0qiaFXlHxCrn5RzcfrChBIIYc7Ro9Pt+K09VhUjB6tWGWyOWDBqMBvZ9lFohrxzwH/WDiPxxOVACDmPdeOE+XDhE0+1ETWjhw1QDjd/iwUTySZ5NMzzZ0zhcIg5z2jh7vz1cpSppSh0qU5OBqfup8KCbnOdpCIrFrvqcydPUVPh8R8+Onzp7iRDajClvlNtvZ37/FaZJ4MIRu6fmpfpvgwj/JWOwT8nRKeXeFejODQlJ0iy9d425nbc/D7F1oyXbGNFSQXhwkdG7Uuf1jjYEZUjVwJ8mHC4PNDUu5lDCyA6ZB4ciXDgcKW2RhweW5Ze0/XY9YsSxaPA/WND6WZZa3IZrDMuiv0qjnh+UNykIUhTcixGkDr32oBcdXRgP0e3XaxftXFtbFVj25Ve/wBT1a/T4mPrs+ETTTIw/Njw43ckORa6r30T2MysG1UWSFc6y3LUP319X4eoZReq1XfKNOwnyS+wCUYzp/8AdSdJpO+HXH5K0B4v6Uns/EKUJNO3x64fJZf2ffnQOWtrVZQLMZ0/+6k6F8TvNSOv74oHaitUahx8T/pJUmdKIeeISfUesdQ4JNO3x64fJKUlk+ZI/wDOSccEeAvf+TgaJLrlKyHDlp+jjnsyPXG7712mtaMw9Nuu+F32rlL+SvGlfpFtMOujiJdMAQ4PCv1borprbpOmcClTruFyrAWmFdWQ02alau4mpL+fiJNbnOumFDdo3/eOM9pxmOeDtcL+VRK6eZUhVx6Rnd+dRwZvkdf3LW0ClRGORwH6JK8zBESoGedvj1w+S1py3Q78kU/TfMx7861ty/xlMGfAUJei2KZ6BhcpMZEFYOyzJ8DqNuItHtHnlU/QgmsMP0e4Vfq3xTBY7SrTWtsDHStQ8Ceax6RzuDzv5vB/O67lN2UBUzwdXVQ03icGw01J0QzNLfwcIEJI1f4MODD8VCbouCTeTKNmxB9SY1MxlOvLu3Up3/cK3tqz466Zsxn/AKJLDAv1RoVd2g6UDkMFPgjUpTAnE2hkUBOdSTpEmf48rs1LYHL9v9aUYGb+z8FKYaJYxzLZ2xNwcNIM+7jzHbRnIIQO8mvH4eds5xQnZuTxNrZhqOTIArAG/V6XB1OMVGfC4EODdCHKsWFlRjPhdHVG7eh42bLb6kFApXtcLctWSi2sRN0yH5RTe6oU1JSs5qnYgYjFtZnrm6K0nM5/pv5f5KTqNnzTniexFcLPNczhXcIbhQ/wYpkdG8UQ46XI4EeDwcVyxviq4mrNYyFSvWddXU3S9YSvaNaJEfMiZEjmy5Rpgclb42uU1qmyCR/s3LXgRpPDnD38Hfwb96zzuFGF3SvqwWVY6PUWJQtamMGgzgzZQjtI5tZ0sR2YsItNs3ymbK5FgNu+1lf5OO8dTgAR6kW1G+0qhduWQfblY65T9DsZVoVGx4lUlK6/7UEoSpp6cWZy/Pbp8R+F/owXboW0SsapyXOFUzg9FSKgbRM6K7t0cGbwI9PCgql0p2EnaU+i9hjlKzenwMjWm4hjdZK4bvX8cBY+oa3FGN5DJkOplob2m6/YPzzOLQ5NRk9veAChChONhm6klXXOx61R2t1qVxoa1inaKrRub2mfODdHem5c6oR4/wCiX+dfD4KkWVRZhSdlFpBjFSQ5cptm8HO8OS4GcI6N+7fG5Q11EKVcrILH5afGvSpXMenDGlO/uDRKwFY7PkUFYUoSdCjCCtUeAYBJDPaQ5SG2ezu4I1QtfqYZ30f9VW4aTsfIk+fqhp1f7QvUDpYF+H3K2oC87uZkM12kpyF6OYvAOVJZcxE2qxCqEL4iibKcZ2esXgGn6YfCi3R2dMEGGcBvUhPzCFQM42kD5ENOtMPK8YQ8n4jkVYQTjaezT80lThXQFyzo5PB4V/C4EVfS0Pg8Gsqcs8rF4h+Y/wBQsMo12MA2OJczgQ/wY8KEFaFsXrJTUkmxfkLlqWvR3dITqxkmaqDhyzRKRwTtCC2wOdnoePwmL+MU5cXnA+I9aSYPgcHPw4H+LHUn8Hgw4c4f87XtSt1ZWuOAuC34baI7BufJyhb9p0Q05JNXk1vOvE8MAXunWj0fjyNVwqru2ZaFu406fhp7UI18REpwEC9vYPqq3C3hyM/4NdlUvOx/NOeeE8Ec/Dn8CH+Dwvt3KrlJNwpZt0/gR4Wc/wCVruv3KnbWsuMnDPZKXTKoTaVeTXq4F3bvVj7aiuLsWl5G7iQzRWiZc2bHCv1RcGw61liOtBpyoK3oHSj8W6YGBsDr7iF1KyqG6cRQU6I8m/CNfFI+8LmjQ9IMPDdKIhwguDGHDcx48LXvXVrKB4HB4VJmwjuhCF3wVN6SCNWl+QqzPNTjSuNe6tKbqY4U6/sE1uqOdwlywZ3S2scVNvP3j89FUyZ323atSiadvj1w+SnOqeDCOI6FC7l52HfnW0o5WtEcaiDaamBUJw9KVGEOTn5ymxhCkgh6QI5eKfWFFDALJxv5n5v+Ddz61K7jPmcPhBS48L/BljXcGHMuMnXW0IhXgO+h9s3ROvJULvTNlLQOUkycROnkR7eS9SdSrwYC5AEZ+/71D4n7Zbo28KOdjHeo3JMklkDoG4DXMA5cOY06Ls2bOOhtpTNKtuyfXQqGt9omPhRTnRH1wVc0A9oDvXUfJX2uQeJP/wAKRMaZ8eFwYar1zHn8GApztLkw/N4Mp0IjwL9cYXFqq9FqlWMpMW2XekioQ5fVn40+NMfbWorCx0E2t4vYmnoyG/kHtr88rFWbf8mSq6tvHeD35FP9m/nu1SO6v+Hn/PWLquP/AISf89w6B2Y+dkK0zb/iqqNm3G5KtE3eZ+H3rEF7f8QoMNXx/wAXH//Z"
-CONTAINER_BG_B64 = "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/4gHYSUNDX1BST0ZJTEUAAQEAAAHIAAAAAAQwAABtbnRyUkdCIFhZWiAH4AABAAEAAAAAAABhY3NwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAA9tYAAQAAAADTLQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAlkZXNjAAAA8AAAACRyWFlaAAABFAAAABRnWFlaAAABKAAAABRiWFlaAAABPAAAABR3dHB0AAABUAAAABRyVFJDAAABZAAAAChnVFJDAAABZAAAAChiVFJDAAABZAAAAChjcHJ0AAABjAAAADxtbHVjAAAAAAAAAAEAAAAMZW5VUwAAAAgAAAAcAHMAUgBHAEJYWVogAAAAAAAAb6IAADj1AAADkFhZWiAAAAAAAABimQAAt4UAABjaWFlaIAAAAAAAACSgAAAPhAAAts9YWVogAAAAAAAA9tYAAQAAAADTLXBhcmEAAAAAAAQAAAACZmYAAPKnAAANWQAAE9AAAApbAAAAAAAAAABtbHVjAAAAAAAAAAEAAAAMZW5VUwAAACAAAAAcAEcAbwBvAGcAbABlACAASQBuAGMALgAgADIAMAAxADb/2wBDAAEBAQEBAQEBAQEBAQEBAQIBAQEBAQIBAQECAgICAgICAgIDAwQDAwMDAwICAwQDAwQEBAQEAgMFBQQEBQQEBAT/2wBDAQEBAQEBAQIBAQIEAwIDBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAT/wAARCAMcBAADASIAAhEBAxEB/8QAHwAAAQMFAQEBAAAAAAAAAAAAAAQHCAMFBgkKAgEL/8QAcRAAAAQFAQQGBQcFCgoGBQEZAQQFBgACAwcRIQgUMUESFVFhcYEJExYkkSIlMqGxwfAXNDVE0SMmNkJFUlRVZOEKM2JlcnR1gpLxGCdDRoSiU1aFssI3lJWks7QZOGNmc3eDhpPE5EdXo6a1w9LU1f/EAB0BAAEFAQEBAQAAAAAAAAAAAAQABQYHCAMBAgn/xABbEQAABQICBQYHDAYHBgUEAgMAAgMEBQEGERIHExQiMhUhIzFCUiQzQVFicvAWNENhcYGCkaGxwdEIJVOSsuFEY3ODotPxNVSTwsPSFyajs+M2ZHTiGPKUpLT/2gAMAwEAAhEDEQA/AOOJyPakNFJ3Y986lf0urndRiNKupGzA6iIAPZyispLxs9V3cwY3ouA5AAhFVo+v1AO7XnD7aFiu9adu3E7eSTNBnVu3Fqq+tCrVEc8de2FIV8cBD4R9rVNQAQ48YqgAiOAjS9qwKzFY9UFhXEk88gThoID2RcQEQHIQmgizmaSrLthpxpXqoFEEUZZekPcHGK0PzPXDiCCCFEGpdYHCeFEJ4I+whVpcfMI9x4pcfMI9wc08UECFEJ4UQ5IeUIEEEEdilyggEV6PEPEfsihFejxDxH7I7pdY8R6x9hRCeFEOSPWPQogjzP8ARGPUdUfG/MHAJ4UQQQ5o9YGw58QoggggkEgggghBBTke0fjHyCCEHAEKITwQggohRS/i+f3wnhSEkwBjH1wRXHyDujj5AoyPaPxj5BBHelK066hxBCiKFHgHgP2xXj0eo9Q9SfSCFEn0gjzHqT6QQgcj1hdCiPlHiHiP2QUeIeI/ZDeJCFMEEEIOA9SfSCK0UZPpBFaED0q5aYgggghAkXCCE1HiHiP2QphAlHqFwggggcO4IUQQohB1RR84IIIIQ+woirS4+YRSirS4+YQQD0ese4IIIIDiFEKIIrSyhL94wQDEUcOeoowQQohDoE8KIIIIHyUuUEKITwohD6BBBBCBAUQogghBwBBBBCDgCCCCEECFEJ4UQQh5R55QQQQQQPQoggghAgJ4IIIHCBBBBCCBBBBCCBBBBCCBBBCiEEKpTNAoOePOOqL0RDjKOn0dq80KFboqtvn4rTmw7AmDpB9QhHKxXmGjWAOPhz5Rt79DVtIErO7SJ2y7oriUZu0IU9lgGbPV5BQ5D8MRDtJrNKUg6a/xaIqDS9AIylqGX/3be+4ZDt+I5ygpbyYH8z8odq8xOiuejfsR1OeKm/Z5B3Fyd8OF6SZh/NqqBah703jXx7YhbsurFZ47E+0ozzHvZpjmuvQiuLa6a12bkV9bfhtjxs9X4FYQI2F7uqVv9pMqkhWmBLcYV0Q6U/i68MfAY6cbVuSs6rSvFr+9mzRT58JxyFMfLd2gWGrUPdQrOcvPLnhL8oAH7Y6JNhW9ia4ySTvNcd6SVSu1ljvhmvmIer0q/Q7xkjfTDBpFgnmpWlXHwKh0jBhtqlH3BBrqH6qMai1jNA5X+rMb2tsxqnCKauJ/60PYEaPlekIUa6QY1NFB0CJXoxeLViFmK/jSGFuaCZLaIhZvTvBnVoMUsBEcnWGaw9w5iTS9Rrep58dIjg6qQBMI8ecPEkjxjhpkRwRDG1Es3ObpEi9ETFevoGgzCOYFZOT0z3ca+8n+l8rAD0QjPEw3QTU1SPBSEVEzLuiYOPo8ph+GAjAE5tqyxXmnp0Zpi4D+7mQ1lDx/ujGt6wNGKxEIFntO08HbIiT25+cZmQR6MlPhziwFClY9WwXDELjNaoFAwXKdLq/pB0ul9Lzi9rKgQJFaKSkdKvQD5Rs1gQA7W7fAIw8ataqOBzp2DFRSSbSFoZggtncH8aYvB6g9pUeK3AfAPtjxSAQEB7RCPUABnQIjaSVF1sajlju5R7pS64AOUXOjRmAM6690KyYURHFcBHszxjJgIFc/uA9IA+MXXaGj6r1HX64o5VWN5PvFrpUR5+OOEXIpSEdez8fshXWJ/t/ZF1Ty+v4ABjSMPD0Yq6io4Is1V18BkSQSGtNnUBAcw6qMkD62j38Ys7dTaQzDnjwhzkwpitnEWrGsxoqw7WpWia7jvDNWonCqKJErpqOvlG3/AGb7Y+orJWIgJs7sSsur5Iz6jiOQGN2tt00m3EdcdBgcFUkrv2oRCb7l6UaEYgTS9cWooSCQGvd+E6z/ANqd5dX6FUlU6jCN6mzIg7ipJSwY/NUn58Oc4057K7VOOpyqjwUCPvThVN+OAA5CNxl23h/0eti2+F2DAboa9l67Vben8oqEMN3pYS0bBMPgSiEX308vG2nE/AlyjlX2jn5+VPaKvPcD185oq4rjHwStP1YhkqTx5YhljkwhKGOWmvlBRojQEcQoklGcR4xo+NQ2dpqBrSNjaMI4jFAeITwohPHUOivWCCCCBluscgQQQRwCGv8ArVh/ujxWrTVR44HGkK64fuue0YRerHuCMTM7WWQVO3qcYBeSQ8R6CcQxzAI+jKAcZvqjxEwRRWQ7YYamKbmwCiCCCHkcwQQRXo8Q8R+yOySOvWCBR4h4j9kfY+UeIeI/ZH2HJn4n2+IDgggirS457wg1JGq6wIBS4+YR7ggh3RRogiBwQohPCiOrPqBAIIIIPCBCqT6QQlhVJ9II6pdY+ydYrQQQQ5I9Y+AQQQQUj1AgKIIIIPCCqT6QR5ggggEAggghAgVaXHzCPcJ4UQggQohPCiECAqk+kEeqfOKcKIPrTHmB6NefAEEEEegkKIIIIQIFwhVJ9IISwvo8Q8R+yB60xpgJKl1go8Q8R+yPsfKPEPEfshTA4LQ8oI9SfSCPMepPpBCBqXWK0eZPohHqCFhz4hyrTGtKhRBBCiEOyKOHPUfQpYHIY+Ix6k4j4QScR8IrSyjMP2jCB6KWPPiPkKITwohA1HqCiFEEEDh3BFaT6IRRhRBAIQ8oq0uPmEe4TwohA1LrBFaT6IRRhTR4B4D9sdzUzUwBSVM1MBXggggkOIUQnhRBA+o+MIEVKfOKcVKfOPk/DUHo9YpwQQooc/x2R9D0EEKIIN1VQQFEEEEfYcAQQQQggQQoggjUfGPOcEEEEIEgggghBAggghBAggghBBRCeCFECePCCeCFEEFhD1J9IIOhN2fXHmCCAh8o8Q8R+yPsKII6Io9DzBAi/MdaONR+Mpzp4iCmgO8gtlBxzLmwmAPiEY9TAQmwPHIRWKD6k6SH+1awGsjTZPpfkOa6OI6z9vCjvBOuof0tLIHg/wDmSNcuxnbGs3Efaib/AKj967rtzQXEdY7I2lbYybvCahmP1U21yA8f7JEG9iGspEW3eJOUK+9pZM0fxjhGUYeS5LhHNRhu0JJVhZrxCveIObqcqIPhkHC4e8ljIZHsEJgGJ6bAryrp20A+mUJjHWCWJ8kA6D1gWHGfPX4RGNnW/WHhde2qcWpiULLC+AE1XGQEAN5z9nxh+tllmK7I261+qZomiyYxiq91vp+eFi5WYqId+cgMXHciLSkeswp3/wABoC+kE0I9+xoTxiuc/qavAbl75UaL4RyCwY/Ww98jSS/GfWInFxQ/qn34I2RbOG2KhX9V3va90NxKZK6W3g82igHxwf7vKIk7RVEUp1PFPL+6FVYeekQC1dri7hPFL9sVpoyrN2tcJ4pcQAdNClRq1q5b81M6hyxDEqsxagNascGbpZ+SAaDNmHz/APTlzGmdO+GddCONWWtXo0RAAmwI54RY8kj/ALt1i99ISCq7Pbm5Aya86q4VfUlyZYMjgB7fOGyVV9XUsUDByYaEo6AOksZkpI6l/j/UaBGIVkk7WDTSMx6R2V0SjQ7dhrtX3SDHTp68Xdn2g5qjEYIyOm3q83/bSh4aZjzWTaVDGmfPWM+UsS6Kpa9w2yJ+kBqqeaox8AyOMxdKJMRzn7Puj3VTapSYMiPhGUo6dVrz49Tr2dkSiyrFWfS+wP0cig+Va1pXCgrpaZNPNgRHI8g4w6iS16tcArV9ACLu12VVGYZgoDgfiEXC4qkLcKUW8Q/Oa8wCbxzHOgRsaHh0rWgqOnJOAWBHWulFRJ56fJ0f8YaVXqUBO1qNAeEw8O+LwgJtGvUEfhpFNAZ62q4yTmx3Sw+TdtuaL0qJg6O6y50EQ1GO0Mi7eLbcuj7cw42pa0tNPCPtn6P5ArSKQCOeHjr+OcOo0GuYXVcinEKIjvQ6ffFgTkikNcaCQIiPMRHOY2P7OFpayUcImPUb26DfYMSZ5LowiO0OBot5JM7XiKLucusElrM2Z9nKyUn+oNe6h8IdraodQNVkpdoG/X+fnv785OfV6dD8LC81bHsM88HDuu6pKX/88DMQusy2167b8PPl4YNqjhVN+Od0VLG4vpHl2eGcIFZWalj3ZO+LIJu7Ltsa1CilCYoaQ2Xpr7tUWfb2y2y8j1x3o5/1jPAnxja3YdhoLcJ+0Dg90QWmV68WDh3+ro5Ctr6+5vah2j7p3pMVzRxMcC6JFoZ13BHIaShj6/OHKy43lS5jv1/GIhx0ZxPunv08q4/owjJBBBGiBsUEEEEDhD7u44zriKNWjkMdvLjEvG3cWyxHZ2eLAWGBvl2VZeoHm4+/6vLhjId2PviJFfl3/wB8FKpaipKZ8+co7u2aKFOaoTwQoggTU1HAa7a1YREA5iONOUeo8UuPmEK4yJGIrPs67g4/NxXrBBFGkIjx7IrQ/Ira9Ee0pz5gQQQR2HEEKITwohyZ8J/bzD5V6gQohPCiHhp40cQnirS4+YRSirS4+YQmnjQQPcEEEOwHCiCCCHAIEEEEIEAi4Rb4uEEo9Q6pdYIIIIOR6x9gggggkIKIIIIcAgohRCeCCA4BRBBBCCCeFEEEIIEKITwohAgKIURRk+kEVocMOfEHo058QRWk+iEUYqhOGNR18I8rhSuNQQnhhStQrgggj0OIWU+cLKX8Xz++E8KKX8Xz++BqUwrWokCFMOcKIIII4A9HrBHqWQR14dnPMEsoCOvLl2xWhAtFEeZPohCqE8EKlMKYA0tMtMAol9Vr0el3wohNR4h4j9kKYQKR6h7k4j4RVgghA4tMtMBXo8Q8R+yFMJqPEPEfshTA4eEese5OI+EVYpScR8IqwgQXqoFEEEEEBxFWlx8wj3BBCBKPUPUn0ghdCGT6QQpk4j4R3x3sAYjXAw9ScB8Y9wQQTSmFMAUWmWmAIUQQQOh5R6CCCFFDn+OyEHAJ4Uf9l+OyChz/AB2QQQEFEEEEOAICiCCCBw4AgghRCCBBBBBAIBBBBCCBBBCiEEE8KI+UeIeI/ZCmOyKOv5qBBPBBCiEijr+agQTwQQRxCBBBCiOyKOv5qBBPSAQEM9v3Qoggg1FGqFeYIEEEEfK3UECPFXj5jHuCPAh2Z3m9S+LP2keCf72LiteQO/8A0JEGtldBopSDfBPLkA3k2VP8ecPxsWuT8rfo8bDqBj86ZCWfY5wR/wAzw31jfmp+P9vmfzVWK1yI98Y1VW2GrlD/AHYowY7RWitvie+OfPZ9LLC5tVW2t0B4ShZLujQOCHIBLG4nlbK6luHTtFXwUSC2mN1dca6rtYkUPB84OHXGfqiA96yR+xe147FhGrmSoUnAePI5vGodIR+8Q+MRFdxGsnvFIpYyZqlpT2nL12v3xd8tHctNDvlu/k9vkGjJ1Ktwxqj5c+KZzkIX6f8AISgupZS4Ng7jEXukAupBU0p782nKADmYvkOPlE7bt1k27dq0O7DXIlN6cX6YR+HzjDW7Pm1y422nEWPedKK3YtfuvURxGPfpEE/siWbvDZYoMRbc9pn8Ipg6G2EdDqBxkM8MQ3u4eVXkSOEI0HKWVcz1VFxSN6QhuInAcaRFEobLq9AtQrZHlrjHfGIKxUQHea1ITBbeMZzjMSMNOu1xRx0Eh+oZlKbAKYibVmr+kyAcxAOflGUXUsCtJzLTLjtBUK3At2A74VVkQMTSlz48BDlwh3dvWSKvjiiU3HVCMVUiHqxdbm6hq1ddervNevqI5zMPZDZVa1QRzqGvPhD93CQvUVa9flns7YYKrRxNryHsij9JCMi3dkpTxYxrc7NZjLrIOBSGrWlAdQmAe/UIWFCBg7VyOcDpkOUXpAQDS6oFCBaiImDRnQMaiIxsZttblBYaecroFszN9rhlMSiVT5DR9ut6v2jgNRiJQ9oO10eUJU5tmCiIN3LJHcFp0ZOswi7b7Z3ug/S1E0is9cVk0BwE0gYl8olkGzI0LSoVZwXJcqCaVCuhO3KI7iguI+Y74QvQp6Qm7KceT/Zq4zYaw8W2ykA43WaHkA/eMR5DYR2qzACoJ9uF5ULCY6O9kQ6WRzx46Q8u7jkYRUnJLBRZMnaEiZNJCLVIu3jTfTIJNtZlN90J5dzue5zDsq3zRvciZImAr7xmLjxHj9cOsz/R6vd80Tzvta/rc3gJiudGc1IojKoEe83mGHo+jwuQnIVN0XCeNumKEwjKCS6XcVTVIa/YIRNSk3Fm1uymrJGyw8zT4NoBz2rfx1D/AJPTxHOYc5CeuGuR+gTtbvbIHiReXa41csimXi3c++QM+/dlO89rKRgVloCVLleIkhzmGBpMlxmDYFj4GgEB1KZHX7olcyNrS51BhtxQMV1S4XskqeytyCZ4Me0KcsQ7PXDVfG4mG8RBJ+qH+Nu+4vETqJRJYG9bhcI/rVsXVd4gj5bG1h0/WoUC5H3vv1jdfYG0tFjptBQMfpM32/yfEerJ29TS/qFgv498V9tjaEOsFrJVpmcqbo83al/O5shr7IJ0NyryWu+c5IYCLS0lOaQ7hJbbDxYYfaQvBRv9dpKa7PP75bljqm4lNx/g6oKP9ahG1zZRsnWIpqGjlqA68cRqv2LLYb8p0FgwR88x0IflBYeyVs7PjaHuPWEqXaZbDaJBxUVHuh2uldGlPcmw8UjxAy+1UUMliQXvZHjEVPTBbWaZs97P1XZOY6oM9xbxl/3+ShnKEjdgY7eHnHKL0R9UHaIZ+qHXvJdd7X9um8Lwv9UmVHQ9VSueNDn8woCI4KgHYAfZDXVufiEW1ZFrI2tE7DWg0TYlre5e3iMKD7CeFEETFZES8J4IUQR5qaAgJ4III8A4IIeNwsJoJNrmi9km46CrudwKRgi47dSkhlX2p0fozDniA47uMM5H0rWqPOPim/TnGveCCCMuj82gQQQQggQQQQggogggiQAcEEEEIIEKITxVpcfMIKZrAge4IIIdgOPtHgHgP2xXihR4B4D9sV4IS8SECCCCCAQK9HiHiP2R9j5R4h4j9kfYJR6h3L1UCiCCCDkescAQQQohx1HxjtQ1DdQIIIIIH0FEEEEEAgEEEEIEBRH2XiHjHyCO9aY1pUeVpjWlQogggjuUuUEi4R9l4h4wS8Q8Y9ScR8IHpXNWlQ8DxFaT6IRRi4QVhz4hJUxpQEEEKAARHAQg6oo+cKIr0eIeI/ZH2PlHiHiP2QOHsKYIIIHB6PWKsghjHZxitLNjQeH2QkARAchCqkOde0IQcUFcKCtBCeK9HiHiP2R6j1AgfQ/xs3+kEKITh/jZv9IIr0eIeH7Y8BKPUFMEEEIO4r0eIeI/ZCmE1HiHiP2QpgcHo9YII+y8Q8YrwQCKVxpiFEEEEIOIUQQQQQHAKIURSk4j4R9p847+Udkq4GHmT6QRWijJ9IIXQSElTHmCeK1P1f8AG48sxRirS4+YQOCgrggj1/H/AN7745krhiHgeYUQnhRHQIEEEEOAQUQQQQOHAKIqf9p+OyKcVP8AtPx2Qet1jon5RTggggAdAoj10Juz64P4n+990eYcAh6/j/733wdCbs+uK0EddVUIJ4IIUQECAnghRHilx8whBClBCiCEEE8EEVaXHzCEEKUEKI8UuPmEIIe4IIIQQIUQQR3R6wh0YehWdNF42Zv7aAzk0ZZLmLupGzz6w0EfiAxnTqJ1mrcKu4A90KnDXxiA/oTLqU2Dto0GSoHBJpd4mxXQh7N4I5ml+/4Rsu29mepNxHfBYt7puho+EZhvqO1F8LIN+tzuDFl8wOxX64QQ/phhztbZT3RrmXyV1hArFpihQxuO+AOE/t+6IuvVKEblmDgZwZm30qPLXh9gxd3QU3WvXoB9IOHPEWdNUqzhpUjB4REwU+SA44hmLgRZpINDsBpZKAYMqsIJv2Mhy/QEi7aMBZWFMkXokhHfJxJ69/H7oksZZwtgwcKKFEN6mRKwABMfk5HQBh79iiz5xyrCIol65Q2lm9R33QAiad+NmpiWqrPK6N1z6oTa5QOomIzyA/OLhWYlaNyRO1cgt/GDYuiG7rTbyB4F94zvDm/VEFUcSgalJFp64mJhENMTa65hAl3HutZM4EzLchooWpUqB6o3hyeb65rkSymTzgeOoD2cs5iRL1MKajOcoSFuo0jPSLJJQB6EnYABz8Yia8Rp0TakFER6PVwjrx5ZiDTsMmjQ+BzUUP2xn3SzbaUMzMvnUop3+ATrTdndD27tnlK2hGgSQbUXFFynGYrNzPV7LcNclJLPL1XjgOJgyHIYg3cLYg2g2vMXoVbcL57eg0BAIGVv7AjZ3sDLtwbs7ISYzmMzmsrKlkXQf3MHSv8AUCcvdccs93Dyh0rm3N9IRaxkgziGyGuygVHV5EnaLwTT3elY1jL6F6SutVYvyFWT1ZN8fnGtOujP1WL8hT7pOMw1sNfZOuXZq0Ze6K0zlSRbdS51GVOiRGci06GoiIj2zD8NOyBG9pkJOJ0WyeBBAByJwiPQUZs/0k3x+yJV3AVdr+0uzMq7SxcmptMo4nQJB325dJ/rBQQR5Ku5jjGRxqPDOe6NMDj2j7kOCeqImCZCUeMpEiXpgP1ZidRuk20rdjUV50ii2cu4RL2/EaJ0Z6TLNtW3tnlWJiPfQ/P+YntPM5zFOvRVnYtmtfepalY0Eue/MXVGbaep1tyoOKuIDpj3kfq/HGNe9u9od/N5RmKnFmc2iqY7orFDYjPJUl7RAdQxp9cZxZatdm8Fy0ZrM5MOOBVV1ugSLEiWmRGbT6giU21pks2VZttn1h1DmMTIfjFnRv6QNnUXRpWHUPXqr7Y1GxFnWzTDzjoJB9xphIuaNYE6cmwnkc51+yJZ7Tp4psxWbo2gtC5UpwKjtUiPtIURPnBwuAsrk/fAAOXAAAOWkNpe7Yru8cvOWb1iyqnQUDbOBcbpEiOCCgsJ46hLNyz28om+yNi23uzPaBgXY2t3vbm01+G+bIHgRbiXLKICjry7Y+Lp0pW89hNgQTMftATSN+kNZE3ahGMEwM23s2PGc41j2lei8zbmbQjBR26UH2fbBhb6mPEPaAesQxy84uNvbwXUXF7q8zblK3Upn3zqGHdcF0NnLZxcN4ruk3ik3NTbnLhFExbtRJu1MPmCoDMIiIjjgAjr2RHg56QpRqieLWktqgI5g4H6ZcxEK6kn/AcfEYgVuNZCbWPRCOLrTlLxGGWIdaiy1KIIl1pyk4hsUUrqErSMmhcC6FArvRv35tsPGOsFGNanXzlu3chVfDor/PzsVN+DT9HxHtSdTpf6xXdD4WzbhXTf64fHIxKGwKdv7lIj9UXfbdrJW7HHGhbPtVpa8Gs/+EOUbvNj+29GhRIp+488DyiKfpkNoX2pu41NmhvVx6gsklUZXKOMgoLIhgftjbnsio9FDpe1CgICltNBPrm+RyTXUfJy6tzbi3RP/nT3eB5cm14CIjj6sRH7FZqylwmfv/GImEC0XR1LhuY8648Y2GAwRki22XI3Oruv0VaQgVU7fknrghMnifLj/GlzjIRjcXUWuamI1gWuamITwQogjgOATwQQQggnhRBC4mSrHa3qC9ATJgeQawq1HBFEIYIUQnhDwa74+0c4DwivBGVUmWoW4x+b3XzgggghyHAEV6PEPEfsihFejxDxH7I7MvH1CBR4h4j9kfYIIeEUaoI4gcEEEEfQQq0uPmEe4IIfEUaIIhAgggjoCAogilJxHwirB6FccKgcEEEEeggKIUQQQ4AgEEEe5OI+Ed0eseY8+A+T/SGK0UZ/pDFaHBv1D5V6wQopfxfP74TwopfxfP74cR0R6gQQQQh3BBBBCBAuEevl/wCV9cU5PohFXpj2BCpXGmINoaleeo8QQQQ4DkLjLxDxhRR4B4D9sJoU0eAeA/bA1KYUwEgQ8oTQvo1h/ZyhBFaT6IQTjz4AdKuFKC9QQQQGn5RLE/KFEfKPEPEfsihFwjoOgI9SfSCPMepPpBA4dUusVo9ycR8I8QQg54c+IIr0eIeI/ZFCFEeo9QQ9h9PzGFEnEfCKNLj5hHuPAcnXCmIUQQQQgUPUn0ghbT4S+P3wik+kELafCXx++ED2fWPsKITwooc/x2Qg4hRFWlx8wilCiEHVLrBBBBBALCiFEUpOI+EVYHBbemFcfkBBHyjxDxH7I+wQh5R1pXGmIUQQQQg4AhRCeFEEBD3JxHwirCeFEKlMKYAgEEEKIQQIIIIIBCHlCiCCFEEBwBBBHyjxDxH7IQQ+wQQQh6j1AhRHilx8wgpcfMIQ7gpcfMI9wR6/dv8AJhBDzBBBCCHirx8xj3BBCCBBBBCCBBBBCCBCiCCHAIEEEEIIOJZq55yy94LZ3ZICImmO+iC2a11EsA4OZ8o7CttgnRf6ARfCeO9pb3QevCedY4rfUUq9CtNy7g1jqq9HldqttJ7AaIz1CvvbysMqfk5OZ4infqUUdpeh9c0RncRnrTRA8zaWxHMteVCrpLxVS1fiMNKjk6wHa1AP1rGNMxsZ23bVnEN7HVcaGnPuiDCEnB1lQDiO8BrjhEqtz9aR7Z9QXPZS3uoiWcoOgj0WyBVPJ1Awfob4ZJmyIEkjhD5+kqUHIilEM/6hTAqDxoEiY/8Ad3QBH8eMZF6NphnEpBbnuH7Y++lJrElViIYl96E0UfpffMhp+aKMMURSi9+uW9f2glWieu3aem2/2zZfoEHO0s1h9vlmgYo5MmRGXHYI6xjDAsocujcU0TrSmijWabSMvi4Z4iGTycipw5Omgz2AMvxCFDuOm0p9iql9N2N6D2YjNSNx7i20Mrzstsv0ECm4kKu13FgCqgRPJp8yIiUNBX0EB0146B3xOpJKj3Og48UioY4ufSFHctR8rqffiKxz/cIhvZYneDhpIFulyezuzEy3MJ9nHQJqhIRodIPe5g4qangB7x8I2Ht30ht4XhSVS1mLfqhq09skHqMorifEFI9qPvQxA2/d+lO46PQJLKSzycpMa4AWQUzqOUKA8ALfgR7o3c7ADZU0jY2UUVIZlp1QtexiinnXcvn8Ty4HGB7wjIt5xDOLaE1+/wCiPyfvmBZ26sXb8p8nZ9vb5BrBJekYMGDqpK7yxZxMVxFdxcbaOhkR8AhkXtaPYPdlA45rfXmPW+196Z51vHHBN/4TnE9bo+hdt9ZDZjft/DG0AYu++m/NQBIt0yW+IgezgBEcAI6B2dkaomymKJan6kLWrdHd6/ypurjuQ7hAQjha8FH3FVF9qStkz9nnOHK17diriMmu3clRTP3KVOF1vtmm0rmchIioXKoIqVMPvZ88nzSiHgMdFOwjazYXta8UlAYLyLKy+VNb643IePb+oaaaByDwjRc0EW5Z4qJ4rZt4G5Sn52XJN86fDzDAjD6WlPXuaNxGtQt1YtWMXEAOu5JXqlmSCAJYOGQrYDxHj4xbbu0NHjCOxq4TbdvcJUguySsrRjS3qSLl5s1cvmUIO4pN2b6LOQXxfBrkfaxeJlTB625wSH8oxzmel5TNke7jCdTxvA6mIkekVSZgQpmLaxdFRPO/Ocb4TDz+uHP9KB6QC5dtPRv24R7VuKVLct4VyZtOZ8op+ZPcBROpyzT9ARl1DpdHo5AdM5jkn2flEh+XViqDxVMI6qv0ZXCdPBv8ol64gE28548QzFDwMfVCR21wsY6jnIc3cIQ4zKzRaspw67cnvnJuh8bvMsqyrIWrnmmL74615WXSZYNZgT8gEo57tIZBK1pUcAI/JiVu3moIAPe2DMbFYsbLNG3cqeaEjoAiIiP2SjEY0el+40P2RpCyXleTlMBNYbB9O1y+QpKfcHfbX4+uNjWx8m+vdXu3h2xrnbkoAIY58uyNnmxb/CWh/pRJ53/6eW+b8BoC4q6ix1fVHQUpLFa1exPtGXAL1wKGkm158ijxxqplLCbQHTh4x1c7eivVRfRhXEDUPaJfSE+OVj1P7jQx54hq0ZM0axx3DfukEb0Ho4waz6gd66V7LnXiFqflHchtwiyUH2WbYnZdU9P7PshoqvHzGPcEWJRXDq/AaAGelGJU6orK3rcyhNjtEYwgc0jQhoPRDHjFwoLJ6tR9SAjrpx4xmVvLVPa6ax1S0URUcBsddyIy9KYc/VDvVFVamoQ8YH9VGPlFmaFtszZw29X+N5fdCeMgX0dSbigYSFYmJRSKzYmlHj+P2Rj8BrVxoI8p40ETo2JLm3Msu43/AHWt/a9KuCVaTGMHHz11KIJiAmmOMwjy+vhEFqwce4QGFxJTOEKdYvQOGSwGtDkvAJvvjgamY+Ht1DrHPKsXibkLl5UrLSodVa9IQ3s0MwgHAM8otVGjUr1f8rv5fjSKFbiPiH2QqIG6pOrSr0REJg1AeyFhSig+dbrXXhI1zQQQRmUfmMCCCCEEFEEEESgDhRCeCFEfaOK/OEE8EKITx8AgVaXHzCPceKXHzCPcHNPFAcEEEEFAge5OI+EVYIIPQphhQDggggj0EC4QRRk+kEeYcB3pXGmIUR7k4j4R4j3JxHwjuj1heUeIUQnhRDih5R6CFEJ4UUv4vn98OA9R6gohPCiCEDwQQQQgQCLhFvhRHwl1j1HqCiPUn0gjzHqT6QR9hzT8orQRRk+kEVocKVxpiOdK40xFwirS4+YRSirS4+YQ3iQD3CiE8VKfOO9a4UxByVcOcLIUQngjwpcocgogggjiHAepPpBFaKMn0gitHwr1ghDygirLLjUeP2QSy41Hj9kK4+waijhz1Hilx8wgpcfMIKXHzCClx8wgcdfIQVpOI+EV5PpBHmPUn0gggOKVMtK0FaFEJ4UR8JdYdEesKIIII+wUj1BRFWlx8wilFWlx8whB0S6x7ggghD7CuTiPhFWKUnEfCKsIOiHk+YKIITwoghDyjoCCCCECEPKCFEJ4UQQCAQogghAgEEEKIQQUQQQQQHgEEEKIQQII+UeIeI/ZH2CAgQQQQgQFEeKXHzCClx8wj3CCHilx8wj3BBCCBBBBCCBBBBCCBBBBCCCiCCCHAIEEEEIIEEEEIIfRDA4jaj6Hu+n5LNq4va9Zr7ozdoNK9hlg4H6iYyIkx+v641aVuI+IfZF1TVlYbishuhvVxJrreVC7nbx0B/MTBAekA/V9QQ23JEe6GJcRQYLqh0ZuEcMe+UdJ23jYE4q11xP9QG8lOUaMmrbc4ReJFPUaP8qfCOrFYcqDtX2BtXtENbdTZZ7s0h7Sf7Z/XI1jqVjU322rqBkjxVOMZ80fXV7nUtgfE6M++UUromvr3IPDxUr4s++UbStjlB6qooY/5r1iIXpHHVQQ7dPxHEvuymrHUfJr+drwiemzqTAd+9xEf3r/ABjW/wCkmJqR5HW08SIgVNiQXSY8wg2ykFn15JN/KLr0EvFn+lJGWb+l/AOaF1Vqx42FcxW4DnIxbTVHfEGjQ/ml6wxm6+m1fW1u3XMWMoPqSaaPMK9YR7eQRYySPTKouO2X8hcc9Gq8pOKuO2X8aCD60jHzR8EkjSNKSiqGKBNKKyhkTw1+GA7xwHnHQJtUttxbF+x5Ymy7MWzam+moX/60ga49JOTVgyIm1goI45eEa79lJlqBW5SrdYslFVdXtoaLErcJJ4RAD77cBvqtnBjnux0QO93qw7Y2m+k1bb+t1aEja+2VGa5jwOJVH8qizKn+0DjTy+B3vyzjMZpvRbCRYsXBM+c3t7VH5j3mi0iriKi4JzHUGlJnbet5mqTrp591GzhXiTjDH3to3lePri5l1myxY1xll0EPOMdt1su3TezLVHsmslccRVIVQRDrdTyQkl+YeOcCH2wzqzb18kV5STq9vXalGyRkQOpMyYb38h3ay5+MNiRkm6GvoinrPV3w3LOHlcK5C6z1N8bDNii/rqrvwgn3AfBv2NEPfd+PR1P7HLqt7dv2cUbfnkt2ISSvfyH849YRyDW72Q9oO6acCGymAqoTZAr12bcLrHqBNPgAYDUch5d0T89HKr3UtXtFV2ujuv2JZrINb8sEzx/q/fzG6aRznIhq9V27MXWIlJmHsg0SceH1N0iJd4bmvSs7JBS69irzuK2zQOSpZtBoOluNtPHAp6wQNiaPB5hkI4mWNVmlUzEgh9H646ent6VxHarwdSOYRFQ2zW68jB9HOEh9oG6f6wjRftWNtsN7aYXli3xIUlqXJKA+m4j/ANXFlgrvQFfjMPxjtBRshFS7OQfEyZFCEN6ZDhyXSWLJbRqcmRT+MYVc2Ss43qlz8wRi8v1DF8TUBTSZQGeSYJc/JHGgxaFJQokF1BNBR0MJwaZ1HjiNoFmEAttQIyBaQlXt4wAaacfWzjvXB6sBQxjO9T9vLhGlLcaNFlnjfg7ZfTGmdFuj+Pva4n+zvP1rm3Cd/m9usQQSKPqBERDGfKNm2xbW/fUR/wBajXSZJdVKBskOBEuaEkI+Yh90Ta2S1LcXglbt/WnnH3cXOwP7eWgdbuaai11mA3Yekg/d/RqKg9jzICHf87Ry/V/8VL4/fHUHtuGusPRt3Fl9SVNdVuBIOZxnGRjl9MBilL4/s/bAejPp7dOvXukEW0G4e5hb1h6EBAcDBHirx8xjNWQwXC/lcugtlLNKyobHBQiSlzMMTtKuv5he6TR28d6hh1DDYk1s4bUD52bV0+vskSu8qyZuJwD0vSlx3Qx7laiu1lc4kLJIwUUyhnonCZyXAhjt/bFmOpZsjgDxM0UEe0BDEGV11eYOLRWWt+Q2hDcUIMjuO91K4bsXHesCAqbgOCfN8wyIAH3RgsoZHu4jHwREdRgAcDmOKytV6VwDYooZZ3r1x8EREcjCsnR9fWoAPGEggIDgYr0Jhlm84+kuvmHNLHXdOJJ3SskSZaIiK5dWKmzCsV30ChUdZA5RglEkTVbfUUBv28XDj6b6mec7ld5Id8TxR+jgMh/kjzHjiMMqOZTMSUhMV5jQDxlEeESKUtri8x1dfDo9oSyWqXMZoMd5CQTyoAvJw8QHTjyg55Ro4z1YkE5ul3ac3L0fwSRmafc4xo5gggjKg/JEEEEEIIKII+UeIeI/ZH2H5Faq6OAHBBBBH0EFEEEESAIEEeKXHzCPcc0VqLohAj3JxHwjxCiDEKc+Pt5AhSk4j4RVilJxHwirHZDqoECCCCPoIV6PEPEfsj7BCiHBDyggEEEEOAIBCiE8KIIQ8oQIUUv4vn98J4UQ4D1HqBBBBCHcEEEEIEBRBBBCBAUQQQQQCAqk+kEVooyfSCK0EDuj1gitJ9EIoxcIWHPiCUqY0oPUn0gitFGT6QRWhB5R6gvo8Q8R+yFMJqPEPEfshTDeH9Dygj1J9II8x6k+kEIGpdY8gAiOAitJ9EI+SAGM9vGK0sudR4fbCBSKOPPQeIr0eIeI/ZFCCECQtpcfMIVwnj3JxHwhA9GuAqx6k+kEeY9SfSCEDU/KFEn0givLxDxihJ9IIrQg5o9YIUQnhRQ5/jshAkKIUR4pcfMI9wg6pdYIIIIIHRHqBBBBCHcXiCCCEh5Q4AggghBwCuTiPhHiPcnEfCKsdy9VAQCCCCPQgQQQohwCBBBBA4IBBBCihz/HZHqPUO5qZqYD3JxHwjxBHr+J/vfdB4VObCgrQQoggcOIIIIIQQIIIIQQIIUQQbqqhCh6kO74jFeCCPsIJ4IUQR8aqoQIIII+wgQQQoj6RRCCtNrUqFXBkNMwVvU1+Y47Px5QkihRERznXl9kdtsHfbKanZhXgggjvqaj0dAfoPto5O69dWxxcA6O6XCNV1u0Ang+bQUR/OynnjMbMbnWlONtyKu8kfdklU0jjkQl9cbi+lPBrqhpJc7eU6C0jrBIcTJ5gB4j9kdVWyN6U+0u1cmodr9ohWKW9vuV1ByHsJ7NeGv6r2cOEZz0i2g7YzZLkiT/AKuGc9KNlLIYTzDxhBNGwO+0KzjLdqDw5RDTbSXvUMk8oJ5FLNugp8x9T8PaBOjZWjsP2coqqwXPFTaWbS/mc4R4xqL2om05HwcrmE8jp2wxWSvTlFm/cd4P36MzzlTSGzifSGgl1I9KubP4oYAB5Dz5Q1Z+iCYRSTIj+aqIzfYP3RNB+W+UkNSVCxkiJUznOAH8dkRNuKQ3JJQxyJcK41w6XbqAZjREyjzrL5Oz+Q/RbSTblGMUadydnN/6lBYLSDKydq60qMvqRoo2yF0U9dEsGob/AEB9zEe/Iyhnvi8bYrv2jq+2s5VmgqqyS6VVTrgwTsobhL1fn86S/LMYpdFRKktoBOR2umll9RNLpBrN2Va1T5xEQSgAQzwzjwjZ9taPZNStp2zqeoMBLNlWmVLoblfaHqO8GIyvei2olkl2+/naG3PqH5GaUUEXF2pLtz594273OoQWXb+7SWzOhb+7y5ZxFlf3EkrLYCIjzhmifpR7qkDY9Xs1im+w4eT8n/jE9vSP24F7MptkG8qlTaoTAVz2bQ/nDiGPvjRKStq8UxXEipNUxTNCOlM2cLEfr/vivo5o0uGPbLoNikofiyEziuGlaXAkiug2Lgfi3B00ej+vW/L4FCKvcBKShS1V00CGQIaD3xu82uvR+2ZapxDWPZxLe6F/I7k49XqMcn2yztZOO3Dbothi20UpjLdLmHQ+nJ9Egglk/nvfLl8ecb0rZekHSdrxhrbftA6l8nc9AChMbaDrTxDcQ1DTzAQ8obZe3HbKQcSrBH1Q0y8Q7ZyCzjU9H2DFEPnf6P2ye0INZvteuVt68kg1XJE1hDPfNrg8o519oRxCpX3cqKCZKlpdtlELVlQkEZuiWbI9RAYHv/cgHzCOgS5CxeGyzkMPBP3U3unvxMmR19oI1YekhYBCa4Lb2lEcjMgJO0IU9qDSKH8nKFEtKA48YlFsqyKCiDF8t4tQHMFZarLULrZ0qCHakvbkjJo+7CO7VyfDPdr8YubQcVVPCWagYEt0tc5wEYSUo1VVjTGB/VBoh28cxQQczTUJc8sB2RoZm8RwJXvlJlFuR09LITjZ/TqOmTKJCIY1T1YAABMmTQ6ZHI5iWVmRUmc/SSe4CJpJMlB98JnQwofCIesldOpJwirkK+6m0s3vhQR4yj+PtiS6a9nI8X4LodCqaVlRWNfPCxD/AEr+rjoLjQjLUykGf0yjpSciCFzdie+7HT/ezSrbo+fRwzjEco9GrvBKh3ce2OrjYhdSa40dKRzB73VwpfUXHMc0t6rZG7OXbuXa4/QNFjDIeR5ELAIabuAjuf1RGtHEnrkVkO5uCs9C1at1X8UGuARCjkOUsOJbC57otM6iLobB4SK4SERJnADIhwh7WFYlrue1Treyi90tJU2+W6RNtTBlRUO+IlmZBkrTyjxk0i1FkVUKkX741Y8iLgtDYJWu5nLnIM4ddwnC93SfdyyZmOLqqaE6cN9ox6er7Xn+pGHC6D5pwLxv88Vj2swxgHQHH3QopANYfDSONFld+nfDCq8dL8y9QkgjN34yF23TjOtZz0CpVWSx6JwCR0D0oeeYwiBqATVUQ5qj70REM4ivEnmE1mvdhuV2xKfYds1237PVnUcd7pXjSeNwMYEEvsAdR+uIwwSsjVCqdKdQ8VS1NOcOQ1rTvZ4s15P9vosxtrW/9QLmVgHEqdvHCKfXTN/Jz1N7Oj7c+02/e0m/adX9HG648Yb2jVrB68v68NQx3R5jzW0HqSmI1zwQQRl8fmUCCCCEEFEEEEP6PWBwQohPBBiK2oqECCCFEfAIBBBBDoitrwOCCCCOgQUQRSk4j4RVhwpXGmIQIUQnivR4h4j9kdUusED7BBBBaHlCCiCCCHAIEKITwoghDyggEKITwog1LrHqPUCCCCPsdwoghPBCBAUQQQQQEFEKKX8Xz++E8VpPohHhq5aYg5KuWmIqSfSCK0EEE0phTAFUphTAEL6PEPEfshBFwhAlHqBCiE8KIbw7hfR4h4j9kKYQyfSCF0ISBDygj1J9II8x6k+kEIGpdYrQohPBCDiUuUVv3H/KijBBA4+gtpcfMI9x4pcfMIrScR8IIBydMaYCrHqT6QR5j1J9IIQOT8oUSfSCK8vEPGKEn0givLxDxhBzR6x8hRQ5/jshPCiECQohRCeFEIHo9YIIIIQcQQooc/x2QnhRQ5/jshBCvR4h4j9kKYTwQej1g+tcpQogggj0EhRBBBBAQUQQQQOHAEKITwoggeo9QIIIIQPBCmjwDwH7YTQoghDyjzDexB+5fjEKIT0Of47IUQgqdQIIIIQJBBBBCCCiPtHgHgP2wmhRHdHrCBBBBBIQUQQQQgQCCCCEECCCCEECFEJ4UQggQQQQQECCCCEECE8EKI9516ggb2fQo3Ouoeufc5gKD3eKqzUq3JgSbaOr2/pif5RuR6hR+rVVQWEo1/Y8xrW/wdq2dV2XC2kHQYoYLE0BJQipzvGYRDHxCN6O1dRTbftuune6711XpGRLudo+7iSQQOMyy09WF0j7PFdeXMOZfbWXW4mOarKnUTIDNMAAIjgA5RqbuqPWp5uUKFLUREc8OkIzaxL3a2e1R1XAUQo8CkwZ5DEalxF6L9ZlNQlAoVoJYLpzlguBXe8/XGlE0nnueI3fd0n30H6D3Ld0jOaM0W8r2Co/eI8XFcsjH2l24rmCftBIyHMn9KXko7hNL+wPhG1Vq2ldTOvNf5HfFDe0G5y77cI5wlGte05NNd98Kq+oEyysqiqb80UU9oDgUBNyliRX6/8Ayxvi2nH5RIsNuN9HSjbeftwiu5HNx/7vov8A+tRljSu7VQdosqH8cYw/LbSgi75XSrn98qGyiJdyHgmse27jcDOamUtW/PHgeD5xUI1ZzF09SP1DRlrpe8T5HACIAEb0LnHW447M0GeWaqorOg2lfwcOkPm5Q5xpHNoamiqB1LWJeqzZI1uRopxEPCJJohZxz2OO4bk6TMLO/R5jYR9BrUcI9JmG8T0Xa8yVVfI2vWLSs0oaVvcVhY3DVQLRuMXfRhW3tY/FW/KMlglLyq1z4duI59PR4XgsdbN+qzjuxWeIOcqmgeYnUJLpSqAkNd1z3/dG5lS9Io/LxWlbroR0pUVrcuIqfQnIkEQ6vUmAZ/zqjf0aOOlKIbMpGjiPJzeUHadLWt611jv4EhtpWyDXLfh4NVxuM837gUCqSlpLyyT6j/o0aXfSnKBsltIkmSiqW+2xaLESQtcJEPm46mmSgGjJuXvEelnwjbxtjM85bhhqzoUGr8wuEr75uOij1dGrzanotF57KTPeiulJzffDVeNBrMg2cEfbFfRa5QTW7nA/yc5yMMFsRrxBRtL4iimsEq9txaWbnGu23A01OlWSTI4oGi+55zqHOLQ3vcj1chX/AFcznAceMfGoo9SuIlQGuJUsaMhveR0DWMwuCkV0R1VVD1AlSyoO+yh4/wB8WqywXeIodzcMH9nz262f0p0jVTIf1Di+I9bOM47OPCHfbZyr66hgc9/bDHI1bUADtwEOohGxCtQyHPly7Ym6K3TC+rJea9mQb69hu4W4kyBYe2Lf6YqxFEursHawa5L5ie6UXa1xh6WMKWm5/YP1RDHZWuF1GvUC3lHRGzijD2krPuqyFx8mkJ7IO4kxzgU4z3RUq6qVr3Ms/cfDb5RUsxI0sO/FpZx4s45DBUqo0vk1xx2cfOHWspbN1Xhd8luWO1vap4r5YeqCe/7hjGBEfrijf6xNwtmi7TptDc5LNE11vmhEobAMSLyeOdzU5deAhjs+rMYI1Hu8LcONNdzIcKk3l5JHJJYRR6M8vnF+NJLaGe3txrJGT1/hA+PFqrrBci2z3QRFKXW8pbgrk/5ohy/HbGKwrV1lScSkdWFg4ZOKZ0zvhw4I5z3wkhdQ56/4h6reuMeEfaNIQ17tIdi1NpnpeB1kGHbtDNOFzKo5KEiXGYADI+XCM+epG0TdtgRbQJboJ7QCS8jxF2nBnAWeKcAjLKABxzpyCO1UqY67OHxGJWojtzjq9uYMu9mcushW6oXyQk1MC9A6Eo8AyGn2fVGHQpOnatcf3fPwiiVHI0R7REfqjhTGgbneyLu8W4+lKH7rQochHHjzjOrkMuswXSrNCsuILhFJNbmKw1j/AFigHsa5CaF903Sz3g9lxfYzPlt81zZmj1O0ZT/WAJ+nb+OMYmTTax6jXMYzgc+MEIoo1zjqihtFNnQGsaCCCMsD8vwQQQQggogj5R4h4j9kfYeEvEgcEEEEEBAggghBCrS4+YR7jxS4+YR7h2aeKCBBBHuTiPhBQQqwQQQ4BAgggjql1hBRBBBBaHlBAIUQnhRDgECFEJ4II1/xBBRBCeKlPnHdHrHUxstcAsggggkfYIIIIQcAoggghAgKIIIr0eIeI/ZBA9R6gpgggggO49ycR8IWwik4j4Qpp84FxwLiDkOqgqQohPCiOIKFwhRCGT6QQuhCQIeUEepPpBHmPUn0ghA1LrFST6IRWp84oyfRCK1PnCDih1UFOFEJ4UR6j1D6CiCCCPAQPcnEfCK8n0gjzHqT6QQg5pUy0rQVor0+Evj98UIr0+Evj98IGoeUVadTo+HIYqUOf47ITwohBwpj5QoirS4+YRSghA9HrCiCCCCAUj1D1J9IIW0eIeI/ZCKT6QQpk4j4R5jvYAxGuBhVhRCeFEeoeUGI9QIIIIIHcK5OI+EVYpScR8Iqx4XqoHAJ4VSfSCEsKIJHwl1ggggj1HqH2FEEEEeBwBCmjwDwH7YTRWk+iEEIeUfBq5TYhVBBBCBYIIIIQ+EusEEKIIQ+wnhRBBHdHrCCiCCCCQQCCCCEECCCCEECCCFEIIEEEEEBAgggggEAgggjzXVCCf1Pr+/PP+6FKXRUjqmSR0ZMNKy6rGgIpKQRJb+oqJgeXbDuWV2erw7RT1osezLNVHYuzCExs2Moyt5BAc/KUzuMAGkdLWyjsaWH2Ed3eLprpV2NoMA0ch0MJzOMf5qitLpu9pb9Obcef6Cv7ovaJtmmDg/hAmL6KuxtP0eGyYd/KTXKk723MU/bdykv/VDkSKeUR72nLwOp/wDtGYT6CmrGjf8AQRht72bSxyvXPGFBVD3vTMa8aO34vWrch5RR6CWrGs/r0Unb8LISU7V+2zVe14zV9ur/AF84o+xGbu8LyI+lieDEGvO6Jw6CmqzK4bqZM/KmyOQjKtoIkTZ7XVFAwAzGTTWSWS3ADjgNR+oBjFuv1G+190UFgv0hdzw35XKktOiXyA6fDELNrb19xLzsezTergbXlI2ExskPAgZUB0D7/KLtuqSwlm7FsNW6Wb1acot4KKGGbLTSuLM7mdedrMpJcCa312r1PM6s+zx4zKEwTGv/AGbnpD3x0LVmHb1/7OpFYMNzrbaDKPw+e9pD3ze3VBG/zVGm65Dpa1G59kNiBjuos1LcmlRBaz9eJDXrAtnj9cSt20li4V1bNOp4WfPGmRaW3vr2OcOHv++H9qjLt9IO7idxq77KRM4wpf7yQueQbLvspKn3A+VFHOsC2yqoLFdBVl78+3Mj84dXlv6JGle49yHIqvY8oi1mukBn3Qn7JFAjZJs0k7hKttz7fcG9N40USvfDn8nxruvsTXKDxP1xXEtW3Udx6SGIgEvlEq0Qs45vIOWK/jCC1dAkQ0byz5gvlOoQSn2SHerKj3RGsrMlrOQo4VX3uY80SqhuHxjq8s1sFWrubRrXoTz3s8qG0LcXITIh83KBb+qo4zdlO8FWyV2WRcc+lLS+VaS4B02kENJpuXx/ZHSRav0lj2v9bd/s4tYj8iRVJD2qZ6wf0T3D/rf9Fid6aavawbCkSTD4xan6RcPE8hNrlQJ0hC5MoYf0gSnRblZDLqDVKq9r0lB9ldzXf3wdXxz6eketguLxpL2lWA6QuFZ4U1PaxmciPzdbAz+ppAh9mOf1dZl+LPoNzdldKcBd/M12OhWVPnjqL5wTm/GmxhWHOWAsRtGN+6FE24bTKrDVj77WCJDGC5eIJETtvVjVm7CptW2GdkpGDfWkswz/AKxRyfuGHMPuQ0i0ojxlHMPaYnB9sKhVoiPXaSIZmDnLQwICHf8AfDI0T0hqtu+oh3aw6Nt1EqmuaikH62Epy+4HR4YCYdPr+2LNW1VEaajxbbcqCoFdpRYyBvezkuQ/t9gxlKqjKI1s/R5w5SOpbv8A8ox17Ng40XKpU5gyXqmxJmh3PAEq44EZcRWJh8mUeWgYh4Yr7f4QgJtab5ZiqdvXrIJK24dNZJUyNfUewcxvB2S75evokN2r/tjnpSDg5odmcZ4xLSyd1FJqKVGG+44jltEjhv4wgk1+Wr7qYPaEPGEHUptLbLFsfSL2ZIJBlUKN6+7S0tw8B/8AqRVjkhuzay49jrguG1F1mspNR5NU1uR0mcz1ef5byWHhgeOkdD+z3fn9xSjBdV3Q1nzieF5rD2B9IGySLfvBQKt55JJX959yEP8ASKfFbWtdzu13h2D7cTFSWXpFkbYecky+UjYg4pfVD3/8Me4lztc7Dl8ti141kC56UKqzTRsSTPukhEcNx38wxrpEQq1b9xDPlF8Rj1pKs9vYDVLN4zfM9oQGdtV2OFqqNBZbC0pICoVHJRWRjwp6hLx5gOYzNq2/r3CKvVYMuhCSDTdQhdE0i6d3E+v66gVAeI8/hDMUAHpAHP8Avh3KtdnpbEMJBlGVJLl+0oDMcNj0U4inhKGmO0R7fGJSkth4/wAWQTJorr0vCOcNBBFSl/jJfP7Bisa9V+5bvjo417eUNoaslcMQmCUR4BGWoB0oRriJ6gJrX+dF2JUGsLWq1/XqXtMKloVCXCcJbHb2xiBytiv98PNGfJlSL1OUOKFas6kfjWlBBBGRh+WYIIIIQQUQQQQ/oogcEKITwohxadr5/wAAgnggghvBAUQR4pcfMI9w+IrUXRA4I9ycR8I8Qojqj1BAgggg8IEEEEIIKIUQmo8Q8R+yFMOCHlBATwohPCiO6PWECCCCCQQCCCCPUeoIXCCCCHcEAggghAgKIII+y8Q8YQIFeCCCCAgqk+kEVooyfSCK0EA9HrBC+jxDxH7IQRWk+iELHnwBKVcKUCmjxDxH7IUwmo8Q8R+yFMDh5R6gRUp84pxUp84+T8NQYTqF0j1J9II8x6k+kEcRIEusVoIIIHDmK37j/lQqi3wqk+kEEDql1itHuTiPhFGlx8whXCBSNMQR6k+kEeY9SfSCEDU/KK0EEEDgwKIUQngggOAuEEEEIHo9YUQQQQgUj1AhRQ5/jshPBCHcXCCPlHiHiP2R9ghDyhwpXGmIUQQQQg4BRBBBDgECK9HiHiP2RQivR4h4j9kIeI9Y+wohPCiECkeoEEEEIHhRBBBCBAKHP8dkKITwf9l+OyCANTmwoFEEEEIEhRBBHilx8whAge4UQnhRBqXWECCCCPsIEEEEIIEEEV6PEPEfshBD7CeK9HiHiP2QUeIeI/ZCCH2CCCHAEAghPE1tmTYEvvtTDK4E4jLby02PfbqPcjMnN4e0Ev8ApQ+ER6TmWkU025cNUjMR8GzM/fnyJiGNGubr1qBYvQNHFM3+ZkyRET6gf78Rtq2ZPRWPZ8USVwNp9VM2eYYjvpNiiGbhu8P8kOX44axsjtBYjZe2LiQV2AllXxc8Pzu6brH5xlyP8kxGK/G2lRInK5gyqm1Y1FSy+kaVlFeSbUJrnPcIKHuPSNNza3JVmkzqCdVa4Vq9nph17fWXbiXbxmpKXuPuX6QUP9qnI1p3g20idDfi6fXA2az2Rr9udtUOt5e7Fq26lR0AMZEYimsug6dHBivw/H7IEgbE1/61uQ/0Sj21tE6y63Kt1n+iJBvy+Ky6jlfeK49nCGCOq1asOB49gcuyMPqqYgGghrz5wgoTKSuoFEpPomDakpGQJFCgaiIzYAAix0l2jGN1DEnMLqRXibdR1DEnMNhWxogUS/tvedYM9VJTeKeyqOdzpvJj8fVCbZrOk1RXvRtivADkqG0d/wDZMO2YwI407gwHxjL7jsJTS0a3exlacA9pnUW35ZcYgIAQRhEd8XlXHDgI8uAxZ9sR4tC0uz7bmxFqBLdRK2ZgHioqCfyVv/anGM6vLj5ckf8A8/8A/wCEZkk7prcchj/v/wDAUa13g8l04uqr0M15uvFVaFaE2HAZs5z8cB5R0ur18mq6rA2dUDDVS7ZLrstyQPPxHPD+8zeP6Wq/jnGi2ylgHtVcLdca5bk0+HgdMgdaNrlAAmIDjUoac4iGZSg6d4417I23bXGyBtTy7L9uGwgVvaN43BN1125D5JERTgm7SmYDv55HzTtmxoYu+YR/SI8aXA7aINze9jZ8ncJ+AcZBuo5DzbVWu+SLMcONwPNsSRD97rgToizerayOtBzA3Wux0Ep1UOo9QJQpx/4Q2WxWVuZZ9w0my/XqUc5gqO5AnnZhmCRO7Mjr8RzGabWbKTloa7wRkPdDaT+mNxDIDEjsl5EvlWETcnd3RZWj5WKm5VnBXITPu7okhsm7cakDlQ0Z3s9KOlOs8kyhBPKgH1x1eWltKz77IKqnmGO2ElLVkv8AS5Ej++JAjgHtg5K9u15Kc5hFVFYChrfiQCTxKf8ADMdNFrfTUKVpbb0XdQsPcU4qJKWQlOkyLTAZRL8OP3xK9LNkpOIg61psS63LvC69Jdi2+xt1mvAsS+kXLnE89qDYvXNma0syMimQOFl9074VcYEczSjjOB7OIRpXXn5WZz29hnxQXlZhuxLMIaxp+91RLKH8lRt0rba7p2vE11O8s4jIWbuwwyDqJs86ewo2+WUf89KRrIbdx1hD2hCCw4LSKisVaip+dnv3wNzq6M6wFrXHSORXkNwY1QsXXZMPFDQDtibGNnbSXCLJltLs9VVnYWrLbcbj2DCBKADqVlWeGePHMa5FpqGm0o9RuxNNIKmUH5Us8uJg8QjoN25tmxrbQSy3VkxdpmWzKJS8fCY0ukRBQED4hMAbmAgPII1nuRnqTHSCdi9qNKLr7XNJn/UnfZjj7QEE0BHTdDum9leHuemvKLltaXryfs659pUH1HLK0SI3X6Zx9n8g0lFTJv1jJTpXPkikiXZNxDkvyhDP5kvd/HA6cu+GlrE1ZrOBVaDmLbotoBsSJyQR4Y1x9cOZUTXVs43GSFR6pftXZ+4BcCK+aIgMyC9EeYQyADwAwGBHXmPeMO65LQVHjRFgpCmXVrhoCCLqss4pcyyXsaw9LolA11Ug4694d8PzKXaILdB73IJgznXaCxPO23D+n5vbziO6ccwOOyHBR1Ld62S+dfrhoSVatQH1BiiIDxDpaCEZgTNjxxFioi9YGSoujhUT0szdo61ThfdtPONxlk9pCse9R7wa8wjm/TVL1GNYlRbe6ikhcMftiKXTaHLddoYHyKhovXRxHTfh7fcUHWu3LtMO8bPr23vA3Et7tdWS9xOI67Gm7a49CspNuiqXI2KFWZ7NbO/HLWLR/LkTvDyhPaS/H6sZP+YxshtXeZSLnEowYrmhK9vOKwjlZy3pEmo/eFDxEjcVhP8ABAg5IajVU0ddMNlwJik33OlmtyOIy2RMkFFPEB0zKP7IRuiVQSj9egFfeqxYeiM2OzEdp969l7ZX2124Be6BEo3n6BbKPcdrBuKgn+IDxjm22wPRq7QuyhWPODqua69nQ+UTuS1SOQI0M5ybJ8hi6rc0jQk0lsK/gzwaatDS9b8005JfeDPe7mEEEBBbZ5JcJlYcPVSmllwFIIiS0Uh7M8v74pulnKTRFFFV3f54RQWSW5nQmDA8MjyGMACvMHb8Y8ieq8hEInutT1Wz0ILH2tpqcMBe5a41c5DXhiMnR2t1pRMGPXAAFddQjES9KqHEB/bD62YXrYpbvJVrukXOqM4uWHfCjXmCRRGvy1HlDm0woqXGnkD/AA9Y5dUnK3ihphgggjIA/KEEEEV6PEPEfsjskjr1gh9gggh6A4IIIIQQIIIUQWijr6hDxS4+YR7gggtp4oIEe5OI+EeIIKCCiCCCHAIEEEEEBBRBCeFEeo9QIBCiE8KIOR6wgR6k+kEeY9SfSCCDdVR1S6x5hRCeFEEoeUfYIUQngggIKIIIIIBAIqU+cU4qU+cId0esVI9ycR8I8R7k4j4QgSF8n0gitFGT6QRWg8vVQHl6qAi4QnABEcBCiOAd0ksOsfKPEPEfshTCajxDxH7IUwgWj1AggghA8XiPUn0gjzHqT6QQOH1LrFST6IQSfRCPUKI8pTDAOFCYYc4Iq0uPmEeP4n+990eY4AsKI9ycR8ITh9PzGFEnEfCCB2S/EVYIIIQcgQohPCiBwgpl4h4xXhPHuTiPhBAd6Uw5hVoc/wAdkKIT0Of47IUQgSh5QoggghBxR6gQo/7L8dkJ4IQ7hfR4h4j9kfY+UeIeI/ZH2CEPKDy9VAogggggEghRCeFEEBBRBBBCDgCCCFEIIEEEEIOAIIIIQQUQR7k4j4QfKqjyERDyGHAeY8wqwQQQOPQogjxS4+YR7hBwCeFNHgHgP2x9/cf8mPlHgHgP2x3R6wOCjwDwH7YrwQfuX4xBIQIIUQQgQE8EKIIQQIIIvTUabkf7gItdlN5deTnVzWElutlOFeXz3kACP1RzevaMOeo8rXAWP838YeqxGztebahcvszZ5km3FgcKzjm+b2c3u82c4Rty2afQ37vSTHxtnuQs0yo++fkUQz2HGIdhs5Gx513at5Z1q0GPa9DQbZMMp7iTR0OKYuPSzEoI7PBH2kUddGl1JijsNt76gijYf0Z2zps2E6Dwvgqlb83aKfyPj/qqZ5n/APSocK9m1ETSk3d+tSpRLKDgm2yPzemp8QVvZtmUqHry6fX96xGq+5F4FJ4nK5gxXHHZEQZW3OXE62id6FuIrG2hcV+yPK9ydC3EqLzbWikrVj5dPxxiCC86jirXrbzXAQzr+POMKUFcOIj8PtGMZrLH4GLUjIhpCI6hiLmjWdu2gjs7AhRfzavnQB7/AIRYKyl/y4RZ6ylz+qLVUO0hp1e3OgR26ZcM8jdXpi+nVIml0fX16wBrnSNsewNsdOrrKvd657dNN+Uilito5RcEU8CCfzNmQ00GHv8AR3eiseJZqDtWbSrX6rkJIXtTbe3TpIY6fDc1VUJiAD0chkAHt7YbDb3fNyXeUP22VnMTtXYosp70qs5FXNxupc/pAMvWy9LzTtdCfIeXOKXuO6UpSQ9zjCnSHKKFuO9pK6HRIOK3M5Q09274tBUfjqY2z/XN3MdFzXOBK9l7EQPm5QTR1BltX/NkWF9K1v7FKft9dYihO28gpe5NttEP0az8cyvxiNxDada9tqNRLsiyCiMkESokmifUP4QqI/1mqds3YEQ+cKqvuJbMLzuVTKsqm5smzh44E0w+cc4Gy3jjIwlfe+UNlE1UEiUplO3yiZhLbVvF7dJL5LmypUu3lzr0o2uj0U08OeBrt8Y6WbEeklYTisFRu/de1i6lIL3NH2ojiA9YNxPUY4+mU2159OVrsdv7uK263MQayQAj7iBg+aCWUR7siEdNTcWdmpWGj6Nky6jbUbDIbBASjxEh1iKi4h5wPf8AG2/FRzZhsfR+iUCXCtbyDRog4adGTukEs2eybY0Eeg6C7/ty4XO4fffZpDP9YJyf4QxF7HU/GP7RGGehs3ekk17514g4hzWT6Lv8jjPcb49v0s2hbrvxNYtz84PNwF4Z+81/retwm3C7gXCpMqrJe4nDjr9wUt5ioYeRj0JEm5tn/OIvArQkXdZNwxxDsNu7aFMVCVFOLtZvlJRzNuKFqe1jdHsl3Oe1zUdDUXA3EFW3tL0JniEc/SlWZ/rt4R6+9mutMe4oMbAtj/a0ddsjZEwXs6qbqUVNVh1H0lPTlCNjXrO6MmNsbREnG6bvmNE0VaaLiKJk3h0mJtn008w3i8PySM23pVJS/ndyEUHq6NMO1G1X4ROKhcuYNAV/sJ+NxlHa5thtQ2IXLUOh1IFpzb3K0CCOc6+/e71jEuLP+jhtx+QoER/rZZ7ujc9zKHSK6PR7MZ7dYwnO3U8K0I4f5fQN1jCF3VdzcsnLROU6eXiHGij7Ota6lbd1BDNCaKDvxxYH5uiFW2tePZ+oWrMWQRXGl3NeRtz+1SustYd/brRM8MAc5jrwDtjoU9OOTtXsT7KVfZ+thRBV2gb3qgNQ6dawCoqB8sY/ksqSD8aRzG2f9GvRbScVfO168DVvCyrLvqTatsYnuHOP9rAQwVDhpFj2Uu1rHIXJK0zjrErrMVkZWcOU6vd7BAy9jr1tfqk/aq69X20tc4S+5m0c3nf03XQ0TH+kxnKamULMVEpjvVdVV+wAr4LVor6NXKgo2jURHIDL9WQ7cCHYGeXR2QNkhwMh0ufZ+uO6Elz27KCdd7ZdR8qugf8A9VEBAYwjZsK3tZKiptmS3yZtA2pVjdAi52yQPFHBT7sDnPlFkqrxb43KsUTpBOUniconytVHIoTtk/8A3DqbYmyo5W8lpO0o0RSna1nCm78+VlkzCfTT3HK9nOAARHXw8Ygam0hNUKFfHlnSNytt2G5LSqR4xY91LzeQd0/+xjvEQ6vTngX/AJZKRrvvIxW41hr3ItimKqQzTiruTktyuksOK1yjqIpZvtLwZYt065LkpcwmWji6GiEieLljBrKZYaGocBDUcYjJU1X3cRAc5+uLtbi4aE1XSXciw1El7FZBERbq2HzcOe37owf1wiOmdeAYCLzpightDFQaiLRovTwcS4Ydw+qq1D938o2uNba6OKtsWdbcwlJZPqlU9zO/yi4I0DpqxWL/APbw/wAz35RIj/jv74i07aqM2kdw3FaXTaqT5LaG46FrY3UreuoFi9c1oEbCWTdRRPIKWXcGeoldU3H379HKEahLGPyxt1HVZ1rs9KVG9+o3IWHUf/SEPxcm4VsWtfKgxmvc3/q5KGvnhY3/ANoPZ/8ArmKfZW5IMZbkqu+mKZpoykH1TsPoZQ5O1B6HvZp2oDis+LDqhOydz5sAJMnKAsxQMcfeifLyjnH2ithzaP2X3ULYu/bpc3U0OEZ3oSeaX2c4P9VOgGPj2x08tW8FFKOHk9vOM0rNjrTcSZw8H6QiaTbuymvFBBvvhKS3CgnEvcThNcHrCJRHS05ayVHC5yuWQd4G/wC4bKkeSn7Azlt3iDg+pnjySWOoRklupsDfvZU7Lg+RxjwjGawzDME3Ec68g5x1DbY3oWG7dkFS8Gyi5ASHOqlhXFe3C4fwnL6gP9VDy5/Hvjnbu/bpYtK6SzHdDNfTJdBRLoA5Eh7JwJw9YDxEr2luwRzFy23eETdNMGHY9uoamty9Iq7o0jhg7zpdkaYoIIIzYPzFBFejxDxH7IoQogxmiECCCCHQDgggghBAhRCeKtLj5hBTNYIe4IIIdggQQQQgh7k4j4RVilJxHwirByHVQIEEEEfQQUQQQQSj1AgEKITwog5HrCBHqT6QR5j1J9IIIN1VHVLrFaCE8EOI81nxBRCiE8KIIHVHqBBBBCHcEVKfOKcVKfOEO6PWKkKITwohAkKpPpBFaKMn0gitB5eqgPL1UBBBBHAEhRQ5/jshRFvhRCBCKwuEEEEISAKIIII+SmzDsU2YXaT6IRWp84pxUp844iUIc1cBUCamI4AZvhCiLfCikIiIZ7RCBx3RW84UR7k4j4R4hRBAOJTGuIIIpScR8Iqwh0LXNTEEKITwohApHqCiPUn0gj5LxDxj7J9IIQc0/KK1Dn+OyFEJ6HP8dkKIQMQ8oUQRRk+kEVoQNS6wQooc/wAdkJ4IIBYX0eIeI/ZH2CFEJDyhwpTCmAIIuAgIDgYt8d0QcsjqOaoUQQnhRBI4ghRCeFUn0ghA1LrFaCCCEPsEEEEIOAIIIIQQUUOf47IUQnhRBAVKYUwBCiE8KIQcAQQQojvqahChR4B4D9sFHgHgP2x8gjgBwoghRBDgCAR89SPf8QinTCqYrbuWLmzZgfolScu/CPkESutZsF7aN6K1GZgbN1xjRYf5XdCf7HJoeO/Y+qG57MR0HTF+AnjxojzrnEVKPru/74uqAjqLyXSLZaqGpuxeVdCiO1yJpRUhHuljoPsp6BBzTVSC/tQ3ia7VS8b6sMRrH8qYB4xtaYdq9m/ZDTTCBYi3KE3t019sP0i81D/xsVlPaZYlkls8T4SKZntOFsMeggvCVBon2ZfQpXcuPQIu/afcZbZ9ZmR6Lb/P7hqHlwDyjcg1Wrs37ITbrs/Z/YCWk/0xyHv3wOFQ/wDGQ3t1NoRS/dzKgq4GNY95drQmX9f1fX628BitaSFz3cudBdHpBUytxXvpD8AboiV15tqKiR61M9amuEajLv7Vyw46NdPT6/uvEMcoYC5F4Fhx1q+8HteX4+MR7UlKtX15xZVt2THRddofnzqC4LK0WRMJ4e+31AtXnHXP169evXEewA5xhRo4HS+yKJyoOOzuiwVq3Zx/GYknvcWFJSWorgKB07njqMWKrXpV9eA8IuRdMWF5RTkFAS1FWXFQxuRJJRiQnlE8I8pQDUR4/CJtUNkdibO7WI3O243cZacxsBON3Z/aygU/Kq4AzxNZ0lDh4duNIa5KUjoquvcH+UUtclzahbBxQRBtvbV93jXaLStU0VN1Koj9EjL7iRzzMm8YAPEQ7o3w7C/o5Lc2JUDO0btaOpnKSNb/AN9nkOzD7GNMyA5AZ/5wh4eABEOrUuS597kxXMJCoh7DmwpbMMPh8tQBTV86XHilljvE2qKXIMYzzEAxNdNpR5nb9ttCQHalui2Ozsx0LrCyWzMRP4uMup4Z+f3nr+c8BzxDHxpi47oln1eSaeDK9gVvJKSsqsRDPsyn2CRO1v6ba491DR6zWxM0lOqkmwAlK4hTxnrVQ/yZfLjMIB3jEB2VsAbRt4FOg6dou8CG0TbqM78bSV1RFfeygOuoEg4DFezbndz4dSjajZYbLMYiQCdvbhuDnq9qW5IAMvSXlNZrgPRAAHWaYMcgCYchD/INzybBqrSPY5VXlhw1C5iV87SznAZnsfLmNDgJf9VpucYDUdeXMK2rGlJB5r4JIrNT/wBMTTRtoYmbwrWrFcrZl1fF/PDy+TEZ27vRwbFdjEGg69pvaBXSpo8OSKImmikyqoacAKUAGblEQztxthlrSnCFr9mB4PeUsOjjdaoZ08QzpDHLF3mrOsGZ0csZdK0bN/KWXRlSPnfiOYwhSuy+kk3RmLKhtLDOPc/kgHlFno2si3r4dJZ+8YpBLJK0bdZV26klrsnEZIgkSr7WSaSoESzW2Z7Msg2kqe/I7kRGn0XCn6xLJiPvZ72ykch7YqqnYbagSdUZ+AO4N1wKP45Rqto3mvBQo7sKpRMlv6IdJBPKEZ83rwkF2qXT7lsYrRTR4qrUplk1TD6sf8oi0laUfKNd5tkUEDnbej5pbZ2JDIqdk2Qb69nvbY2hNkJ1ULP7SCGvG2arfwburuHWNu19O/tRyJpXJYezrtXk6HtBaRmuw0re/I6xuGFFPMxqG2cXyYWbfqrEQape+9iTRrcTqKvHt+clvi3HWJc7PT2/6L11G4nmaBpWsOc/Q7wPfyf/AJqVYzvPQ7tlLajOXbBQk9Au4uW8HOWvqBGvbEL1bjqSi5jaaLMhBKKnuTQ9gyic3U+Hg/8ArP5K9KPQcBbanYbs3RU9zRzzt9n+sI2KbbCM23+/Gc4GARKm2H7LkPfEMhD47NOx0rvehQUGxQ61KG9RKZxHFKelWTs69SFwJ2+AKHu6cYvKL8fqiMad6JK7NzArsBZSktjmQS8tt4NZ29YdXqP+aon5b04sbAq7+T++7ku3eJUOgQ3Md/xbyNitjdmq4TWdKUorC4aQASgzoIYGHM2uatrCLJoKNyW6hq6EIgim1YnjMnDTSIxI3U4lpdOLxplw4s3l+XHq9sRJGci7m1Trr5kVCdpXfHJ7t7O9fuNdpVuAx3GVZCo4V78zPEPaB5kE7+yHI1Ro5yiYWDzHt+lPK5t496yPtVq3W9/tWN++35s0qREn7YMjdVZiOwP3oOQhriOTrar26k22qUs7O+ycvzFKUwbpdy+hKUU5wvdRCbB0SohgQlyAgIhroIB2hZ9rRTJ6qqgxP0fY9McI6PZsKOUEPFkHzaDfNldnqg4rUI6omXYvG7dLpvxDPfNyB2pRQ5zxzxEc7bupkkfUGKCG6Ci8U/Q6w1XbhRT416UjAz1OlOPPOYdRkrVckqkqxCuY45z/ABvKL+hYhqgjRBwn0ZzC2bQuSLXkNhkEc6ZzfTHSXYO6y27kci32jdNBuaHVomzdubwCBK4MwhoOJg0HlqHdGZvxtsq5q9Q6oI/kyugUSz5E4w3yPs/+UBO/qrfP1qNZrgap9WXSauSTjKQqGidA6aAknChbgZHs+2JkNx0q1/mWYsPd73xzdWiDBurwcaeoct6WIaLo0IJMUjysF1i+L5/RElmTQ912dmx9vONU167Nuqy7nUz59qqqO0DKqJEkcOygAETHESojnjFnaii3K64lmHFvZlCLKWVQCWh8S+QyIfjtif1lNqAq9qJyxG1w2xdaAXMi1pH4fT/nFAUMiGVTzAQ8oj9tNbJri2ejhd4NrLjs24TWEdxkh6wFvGBHVLUx5DD7bd0yLdXkKdIXaP8AAcQ+yr1kYqV9ztyEKRTs9w4Y92G26Zcq5XaBJSKNgyp1zbdKHZ8nyBflkQ0H+6K7WV6KUvJKgoEetipRUoHjZL+sMcowhNrbwOPIOcSRZ9ojt0V5oNC0ZdUdLpVkzKqSGnuMpIyA64HOMd/hFtMq1WV29uL9jWS0lzN+uoke6rwf9Iq9iIXsxbIqyPaDcGq3GIh8D/nGYUUe5FrL2F2AvomX2lLyRht/wgAeca/CRtTa6xSMFqxlKVUI3mWYp9IiYoDjTzD7Y2CbC1Vy3Z2nElwrF1CrUdDeKmHT7Xvf5/FQEOIa89frgxVJJvHHQr7e3yB0ZRzNlHbOgJ3nNoR1Oq6h7rhDQbemkn5jWGeR/e/EzEC8xMwgs5PR0rqlUKe/LDk5qEaNyd2qxHaDPPhwEUu4Roo8uu3gjh/Bx4Q+KvtIV1u4Tpc5dKFppasqb8LQI6N1vxEZ20Fl64NxBbv0cM32dywG/lh3aUi5wiZL18FTf5mMO/ea1dktq4mfY992OluFUKfmZs8Q+cGf/wC2Y1VWx2lzjjt6lNdPPFSiWUVN9D/1iiSDDuop751wYPGt5579p1hFPyUZIMZJNzk2P1hQKtrJQkj4PmZ58mYfnawQQQ2jNQIIIIQQIIIUR3RRCBBBBDyBwQohPBHRFbUBBRBHilx8wj3DwitRdEIEEEEdAgogilJxHwirDhSuNMQgQQQQggoghPCiCUeoEAhRCeFEHI9YQIIIIJBAUQQnhRB6KwQIIII9CCiCCCCAQCCCCEELhBBBHYpswcB6k+kELoQyfSCF0Eo9YIQ8oIIII9DgLhHqT6QR5ggEtctcQ8BRBBBHYEIeUKIIIIHBiflFzk4j4RVijJ9IIrQhJEKYUwCqT6QQSfSCPMEeo9QcAojxS4+YR7ggYED3JxHwirFKTiPhFWCB3R6wQohPCiECkeoEKITwoj4S6wcj1hRCql9OX/SH7RhLCiPsOKHlHqnn/wBJjs7IrQQQg4IUwoPfTHsCPEEKKHP8dkIED7WDPliL8mVe3T7YsAiIjkYuQV8DnIfAY9R6g7sltnea8OUvqNKsAw21abUZu6K8yiNbQdO6EsGrLB+nZjlt3tAVycR8IJOI+EeII8LXH5gECFEJ4r0eIeI/ZH2PhLrH2CCCEPsKIIIIIBCHlCiFEJ4URz+EDgCFEJ4IMCCiCCFEd0esEAggjJGmzXVcBwEWgyGyuPFzqo7mkN5sp4rqieHuCXI/AIIMahaY1Hla4DG6AYzkB+zsjIW41V24K9Qb7Gbq87F43oUSGqnGl5Q+ARvz2WfQdKSqTRXvtrO8LfJZwrvxS1rXOgDlmDOQ3o5wl8viMbdmgNgtlFHmaGzzbJsMksV1mWRI5caiPbvsVPO6WopilqImm01FNXPpft+MR1EVlcjQ5YT0Hm1Xc5MJL94F9obPqSb4EXV7+4PhwCNjDJ9DnsOWlJ0FG5DqeV714p+eEwPezyaPlD13C2ll5VOHj5lUiKLqv96+sY3c9vf3RUru7r3uHBB882NQU9LaRbxk+Zg5zieDVrbOtjye7Wnstblvbp+udQ/OMLFja6cnqRLF1wqk/wBjI6RptdW0IpV63U6PvTiVOO5of74BiwppPaceKlhPtk8v9cXEE3HtLc13h8siUgjlbVnHHh86/wAg2cLG0UsHq3vKr5dkMa9rwVq//bms+HCMPauzS8FX3e6FxitvDWdEb+UYewnsaWHr0SAuC/y8bNfCGGi0Sh74P/iyBg2ODZc7g41a3mu0cPUd3Lno1yvBeOHq1feMR1BVtgPYJXKP74LqLxz/ANvGxCGle3o5fRpmP/2qOgoax/TzcWPbekezYRHCmX94gvO0NINhW60w/wCYg5cTnrv+UWKtNN28vvjfi6vRg7HJ714MfandCSHD99RAoH1xFh3+i9EuBgwxtqK17hArx68TzbfzEpppHtJx4hYv7wsNbTJY7j+nDUlWogWpdoBDqWO2dn/tCqp2dv0yjUt4gTCDwu255RlZjdDTAzTYDPgHxDhE0mr6PNTRDldwXRdTNfCYU/Q7Ft07Skym8McgGPjpTdt11OVBZ7IQrd2+QG8O4tG1TUdySvJ7Q/zqqCRz8ceUQ6S0jR9VjsIk5RWlyaQI18tRhBLFGWdZ2/2N7fgsbPCSmNVUcJXcTm1Ne5PwovAOImmoi/nYc+URHNNxkU6pe/u2K43S4G+4BBQbjaWphC6V3xDQJixPgVTdeI9sZE90hDsm56RFxL5jbA2y1MQIlkqbLwZjCEOAAHGabXgHDiOAyMWdbY6jZ9yV7g35W0y8G0gqiJwo0N+FeQbUfKEZZj0vSEM8ACUNAx2iMww+IeSD7wZgT352hAYeqr+uwMCdI7+z+YlE/wB206bSY15toWggW+t0lFgO2G2ZEMQllb3+dhJjoZUu0R0CNdiw87mbWNzEFislIVC8j0XizXbTcFQ6wX1wwYECpTezYh8odQDs48Ywt7J9wrmu849biOFVX1Y2OJjq0IzTFKGdNO7PKN+/ostltPtnbB5bW12DSdbIoroR5Et1cd1lNxbjBR5QEFhwdmgCIB2APfD8lbrGy4+k7LZiOO0J5BWI9jVzuJ4hkWPa9MmPxCKx5jtu2iDR2VbJiTPIzWN75dJ8oRzS7iyAhmbfOHVpXAgVAeOREYxY41CCEnOYjcFWLW/TF1DMEiIqA5yYLjnHx+2K+0z6Qu3TclVLY7BlqOpmsWASSvd9zkPWOZ4iGm9Y5Z7R+Eab3msuV/LFdfudcA2uKhsflz+tFRUZsdo6AEShK9o5jG7DHtdZkLk7iI1BMfpD2tatu+5Ow4bHsZ8+ROnz/liMulItxs1qwHLgJozAZ13AkKjnvjIQWbYHh9aYei0amHQcooAI/EYj5OUIIpCQ/I1JjRA1MMpUyeOZyIceEViT8VSNURIIKIWEOOCYB90NCNyLoLbOuinw8BSLn/IZBRvqsZkQoimRLu9Of760EjaKXbo1T6CRcCYtWz8rrlAEJPiGcRlyxZO56a3pXAgKzPc5OabBUWs6yioomwHTO58RxEXyFz/ULFE8ttFGVKBcz0ThEPm8KncOP2RtqYtmNkzaJZTedyQ/nPs+L5odwKrDpxOzOsQH9FAP3hHru9kmKWvyG9LdCVvSPcNPB6m9LVaz8Q6tnrq3S2OtmqwE7BQ00u2rlG1R53ABQTt/B5HSqoJMEs2PIJZZJQAOPyg7I6kNnX0fFmdsuwNe6NqHwhOFr3jS+vHJat1HusU5PWv7J/RY597HbOG0Gz0g7s/7R6eUvXs0XClrgxL7tQRUVG2ClXDBM2Uz+rDx8RiQWzUv7Tvo4bkpbfLvFKcVpm/7ikeyofOLhM8zUVlek5CXDEEbsD7G8IUhCf8A3YBu2+bYuC2GEeu02Z4TdJ6gnJtFHEfZ0TUNvvg+8rOILHNfk51+cG5/rUVtmnbLbiojulItxt+GiiW1Euufd51DaRtO3BO/GYlptXPZN2xLY0HBcBgfNbhS+owJrn8HI1/7OFp9jTZ8Uz802z2bS1ZXQT7WcpQm7jbhT1Ev/qdeGKNjbYcRP62Zl205RD7bkrCXj6Lvm3hvp5/+QYA1/TYbPqk+SzCJbQu1w9D869WIkHdMl0gakwCIgAhR6XrMaD8ro4742l2r2olfaLsAt7xcZrXj973FhvD+z/2v+0wyliLB+i9toFb8mNpTZYy6jG+KzkPkesXE3THYH45xIiz+yBYzZ6U1Z/22XXl7HKqpv3U6Gg9Xp3+ecwFOxsU2RQcJNHR/Nqg+y1qsF5DBmkit3shvILJ6W9duXYr0RSonW5IuZ63EcJcshN6dlEBPn2+Cx81nVUcAI4wPIB4xxC7OXozLi3ATyj/2mD6jYi1HrOlJSWE+aW4TrwI43FHmxN2azYHu5x2Sbe22k/K6PXT2elKnsaU0bbbPEP3xJ8aJVi29+Lx1nG4GuuLxtUJr3UaOcdWjdT48gW7yMinKBqmba7PlS4CdYjS6lHGx1Qy6vLkLnFo2amts7TXIL2faGyixBQiaVg2cuQhe0Lzd5YP5UCILXetNsxMTa+dUiP72wEl0lzZxpMoQllTsYE2TKzjoABjTxiUb8ebX2GJVS3TfcSbc3axcTZFOfTy37rBNtjQPgAiBntUwyGezIdoRq3V19AZNSgenp7ypmDG+mTW+5ERznH98XpYsDRB3yqudPYluyYXvoitxFH/zzcR0+TkMuUqo3Qqm1NsjOFSlLrNur2jlT6QHCBJImUfq+yMkQ1LZBuKs77bC9Jm3y9KP8HLwkgaMvkIcY58aV+3GB316eoGyQ8gJneiARINh7W9OhROp9x22mXELT6gaWwzN56RZCtyu2WHJJ+kGl0f0q5Zk7o3tRyXYs3DwB3ttgVNsbRbwVW/blUtSVUjVGoSbZ0BFPPgOMmSv9JKmcZ001h6Nl7bhptuil2vu+QSzjWVfmTrlcDf04Q5FlXniHgYLYt/tEsQiQleS9cG3IpfUSQbXD/WDysioaDvRYOYcNBjWBfPZ5uNYq6J5mrAb1KTM762XaS9xTXaQ03Q4UEeADiIRLo2/flTsF6Z1P8ZDjOl00t7SFU7dtmWUr2e2TzjZbtIejtpIrVO3w2aN4VmuTmy77Qid6xcTf1yJtL0yJXxjXe3HmbTKZedJrGE00UM751oTEZT0vZwHhEntlPbouNYg412w/aakrsxHnxK48CfU0AO3AxtmOWJtxdtxrl3rDpluil4nCzj5M4iuoj7QW6eArHDT4w0Q96zdlZIK48zlQ/CbvjhZWkya0Xqkg7yzE7qvUNJVzl9gPVwtasyGgFv04qgkERx74uCvioKAZA4qCI40HOcd0YMcnroqidIlzwKcpaYZQOEhHon+GRiRSnsY7RbcrmiDoZpRrKyYZ6MzeUV4qCnrjvxyidFrNjzZ9YKylOK7LsL3NSziVj2P6QtD5w7NeUXJS+rUg0TuF35SDRU5pLtSLRPLLvC/REUdjx9PpBdrlTre2fK3lXHCg7kCQdQOvvZ//Onl90SA2b9lGtc27Sox7wLipadLSko+e3zcOKj/AFVE5dmOtZPZ6eCq8LfvFLKKhT883HROTy39VQ6pPaiskrOSgsp/UKsqKy91Gc3EPaBRUFGILJaRpF86f+5pp84q+R01PHqBKW207W/nIINOphuTZeOUG+6K6WrGnD78z1gifh2re3yTTFYin+o91AYnhc5Ntiquqgj3YY5VvLpop1578Q+cVCHytv6Ouyd1KIqDfQipT/UQ9noizu9Y7k48tPHTOIS70gtF3Z28rG51R+afBBBDCMpgivR4h4j9kUII7JLahYIV6PEPEfsj7HyjxDxH7I+w5M/E+3xAcEEEEEBAggghBCrS4+YR7jxS4+YR7h2aeKCBBBBBQQIURSk4j4RVg9CuOFQgQQQR6ECFEEEEo9QIBCiE8VaXHzCDkesIe49SfSCPMepPpBBBuqo6pdY8woggglFEfYIIIIICCiCCCCAQCKlPnFOKlPnCHdHrFOFNHgHgP2wmhRCHoUQopfxfP74TwoggOCHlCiCCCCA4BRCiEUnEfCFNPnA1a4FzA9CuOFRWk+kEVooyfSCK0IvVQOKHlBCqT6QQlhVJ9IIRuqoNS6xcJPpBFaKMn0gitAqvWJGh5QQQQRyBAqer7/qhTS4+YR7ghAnU0HuTiPhFWCCCAcWmWmAI9SfSCPMepPpBCHVPyhRJ9IIrRRk+kEVoQc0esEfQAR4BAAZEA7YXep7h+IQODUUc/NQe5PpBFaE8KIIDil1gggghAsK5OI+EVYpScR8Iqx3L1UBiHk+YVaXHzCPceKXHzCClx8wgkdB7hRCeFEEAgEKITwohA1LrBCiE8KIQ+wRUp84pxUp84QPR6xUhRCeCECQohRCeFEEBAj0IAGmdefZFSiXrGK9EuQoGTZo2Z3MqUJhvp88I8gAI6Hdh30NSaQQky++3bMbb6UHzy0LEj+kVLAj+n9NAxjSGWduyCs9rR8/6wwXHcjW3o4z98Nbuxh6PO/O2YdoLCTRNWzsmUDLju+6SGG7L2gUD9ajp6spZXZk2E2sKBZBqlTboOJn75LqLYdYPJQUdOXLwCKF1NpBNIpiU12hQKslsN5L3Em20P5vbyfGs2521FR9ce3g9vZnlGe5aduG760q4JnbeYZmum6LrvyWOwiSZ2QmZc7aEU69auYMKpk33RA+4W0hQ/p0QPuRtLKR783MDoERLX7nKSr+cV/2xLLb0cSPj5ZYSq0dEMhXwiWOJ1Oq/35578qconJ6OXZvTdraq8bkXYr/9UrTVNxOJBE/7P9YGI571J4GzHH7NYnDsOekMXdkNSXG+vNw09rSutTA8sIxKb5wQuWQ/ZD9dNuPG9pO6wX+0RKrwsWQYWxr7by8ojq1ok7D2yo9Xs9DYaRju+chhHRWEFcrEf37oBT+xkT8azki/GxRtC+oWLcbUDNbyobHVnvk/7HOKHrQbVo5H3gvem15tLN/rnt4U0jLslD3Cy6B82LqxjmSZu6YVfIh2tuS1dH8mSJdhjrhl2PJJ9xcu4/0eNdbOUn4eQesC7VNGzX9MPH9Ribzqups3tS0tzrbOjaos4krz3Zu4o5z28KRzC1LA7QNAmBZtX4t3cFK/VCrTvuE4j4BkPth+gbLRuJmSss/4y7wmEDZSMpHbRKuSsBtmWCW0Uq1q5hPQ0EoVz/X5SI63CsNtaOOj7vXSx/1FeKYjXco7L+1EV1MWyeKv2m0V8g4f/pJsYt6BYjaeXKwp9Br3TaYJQ/nbpdCo308h4DnTyiUo2jCRX61bzDT90TuNteJiqbQxl2X0iB1X5sT7XRH3lPbm9/6ivRCt6Wk2oESkpV1e3V2kdMKzYOnSiCrdAM8BzG4rZe2WAH54d957yXWXCmhxtW5dqsQt4gf62djaQj0V7qeuXWHi1+oSvqB+fD/7zWf/AP7RmGKY0mqwkhySx8MEPuTSPIoYRLg+2epuDlxtnsg3XdKZXuNfhw19nKziQO/Kzme4CnOE+HH5rR9BEdeeOHOH8pX1ez9b4WJ2AbdrlvbYjNuDlvOuEB9pl/vNrOMAHcOunDnG8u9VTZxKMULjX+U0xq2nbxXfgd94EDrJSvCo/wBFZTZ+Mc71+NtV13ZrHmNaJLoWqsAUODK3GZSwJ88X5CqTZEJuegfGBrWSm9Ia2vfNujHzArSFwK/rU5hYqtxmdstkFu3ez0oF3XcNWk3O4W0VTlwISiHvaa1+yQch8seOPMIh1FRVohWmAwb3gR4hkAHzjLE64C6Q0MkE41/pBxiRNka8zulX7kP1OQkK0DA+cHKZOh0VB2V/4qSl9sw5zpw786XvGIx8HHYVKYmPYyC0qM7fYNKU5TUJj2NTX8/tEam+nOV4rRKhPVMg3N6oAqHTo7inEaGQ1mNDoGgj+yJ67ZvpJFm+ZJKtySJlCFtLfTF05h27asooTNT08gGQA0AamhHHPsiI96bz0rpKlaZvs5BYzYlmyTbbWl3FOAe3EMqQRkuSjv8AIYERAcDkMTBHF5GGec6yWR4ftn/D2+YBpSMxRKqEM68ZvnOf8MRYF13uNeAZa9Tdi48ChEnuBAPAAjGgbhsZN5npCXDtjJlRzJpURoopQOOho4AdL4cAjF5ap5WrCNasIiHEQ1GG9ZFmuts9WxllBX8isku78JeGcq+3lF/rerqp0lKc8YMylAwUAMzSy57M+EZNbpulnEsAQp1i6bjgaOzdEPMYyS36s1UpJExWoiaWAm+SVmlHoh2ZhrK01MFSvWoziWlEdAABAR8odqU5tfTKf0f5iR0Zx0IWKnVzprUPxJF/GofJJQ2LQLKZVWomTCiX/NDEs44AQ01h8bCvdxspSBotZUSgLOEzQAskOkkKi31IQH83HszkOHZETm4wn85EZwraEjHFVFa5QDzgO4wCeGsuRHkGkOpZiwDkfriQld4uIuybZ0DW9uV4THio9XFuIiVKZyI5ANMfsgSSVSXaLILts6fq8ZBKUJ5JdJthb2KZy93scw6mLbvw43LJ0LgF/wDqceKT7j7BrgYZih/qsZI27tNu6jk/J/eBqr7IdG678j3IQw6wt3/4uNVT72j2I5L5+2Dme6+1LTNMqLIbTaW0/Kc4Maj1rG2F7XCsax6NpLbrDAXnYvXNQS64TWGrGcqWJLvpHZ2GXhFSI6OZuckdniY7pDlz5RN6/F2qNiLBWdte13GVVkJ2Gj55Ycp4h1g3esf81RA9hr78v8z3g8Gu1QSCzTK+1Kusb/8Aydj9K/bE5CbbezOsCfa/sr7WJbhKY3wj+kGeo/5q/wDBxp5OW4uC9ya5ZCzHWdvHi4VXcllHPCrM5NcP+yv60iwbRgrXWjiRUscxJHKXL+IsOybPt5BEkRdmsYSOUonJaW7VsaCCRMN9cS3CqG/ftzHWN7GzHeC31xrNLbYcFAqUDqv5o5gPZHKTavYJvwzqz/ULgPhBtOZbxXfjjDPfpES39axtEsbWtuh2fIuhPuoaualqxrqM4cQyPV/vMNt9lZuWfJLLLs+H3Btu6TWtZJaJbnKdscuQ2cbLL5bLia6mHXfCelb2g711Gj9sc7HpOdpdX2L503ZVsSRLFL1PS3hdafr5D5wVLaUFkJh3Mn/nLEo5HlkO0I7IWftELH5OtmZBaDCQ3alqxggg3INZ0ZydunEI5FPSw7Hm0Xdj0iN83zb5Nt40beuougzFLguhx+oCfq9vBn5WBxkA1wHZEM0XyZpO5lqXnTI3OXdNloPiwYeFuK5XMrce43PkymyfdjgOZZ7EkaRDTKDQJLSi5DWRVjIzdPfa5gchKAcefPjrDALzBuuYm+cmookpQ0ATkpcj9oRvMk2dNlvZaTUd7Xkdrw2lnuWpDUka9uQBCt8lmNQNym5xDpDgB8B44i3o21Sn7TF1Em1KvsoWwVWu6xLoZIoR/hG308P1oDvdpGgJecSlWe3Ma4Nsu9qhYF6SLC6KcrMSKUjiF3tUdMpNz8frGiCna+6ChVq0ElqqKnMA8EgKChjzlAYSqjSu+zJgMOViO5CLDplaQDibL/5gCHNuybS2Td24LTtYpKKu10F2n0REV8/LUCsswya/AfhDtW32l9opnFALpyisGgH81A8bofI8Pk6/GI0qm7XW2+Lera36yfcKwLExyqmoilFtYT5/uoJoWVoDZZDs857Xun21N3CbFBccqMRDHRUf6piau3W1ki8ey0lXcTqAivWhXi5pZNgPR6Sc4RDGfMAHyiONn9rpYatE8n3Y2VwcKCU5NVBKJ6inxN5X2nNie41h3Vb9Y9vLOG7hJe4nPbhpdXpyfEd5Slou52D5wQFVnHkZcyL1dtwbhj98g08bOEmzZMqOittCqDqlLFUr97MrUARGYzmJA7IDivm4bvl2xbECqr1uaE6sb+e6uTk8uGgmvx2xcFLY6dSUnHnBY+uztpBLJ+/CsMYSjgEgX/tSNH1kJCcwH2QPumg6GmqE/wCpCHs/v8X7GIx93tHiFDlGrrJh7e0rtDwTdYp6HG5wncJq3qTTzGuB7o6G8VwjPAj/AAz/AP1qNVV8rM3aZ3tU8VC7bXNs1kfodYXF7q9RUP8A2NE3jiRZ/ahbbcYxeuvWyeRTVtvBq/vf6uUY1z33b+0ts9uMikbQ6YCu2Febok7o9Xi4LWXBzzVOX36xTcPZc3a0jjXLrBSjzQ3duh+7NnfnLs3plGCM25RBMSBczmcJpXFUUtzPMRD+bgPBjiI9msSh2cdrhiINyG4nuG3DXZDCNqmFdykgFfcKAX/pXDlEe0u37EuKNagjKyXZt1Slj5IG4ufODMd+OHVSz8Ij6+7fPa1qzRTn021Rvmy4hiY4Hzef/wBUNhxi6oh5Z0lTkrdF7Rryw5tLURWXP3eEdOSZtgWNVbkKjfT3GFwkzHubvPEP0hEv3HckWc22dcBPumVN+1hX2qJk0Ne/gfHMJbhyWBIbPjjWHC6l43fg259yR23nqD5u/wBsxaF7aWUnluPWCqqJJVvfojcVDjEcltG6M3JGbt1BX1yaOOVJZZ+gOfSCCCK4GMAQQQQggogj5R4h4j9kfYfkVqro4AcEEEEfQQIIIIQQq0uPmEe4IIfEUaIIhAgggjoECCCCPUeoIKIIIIPCCiCE8KIJR6gQCKtLj5hFKFEHI9YQIIIIJBAIUQnhRHqPUECCCK9HiHiP2QeEPsEEEEAgEEEEIEAhTR4B4D9sJoUQggQQQohAgKIKX8Xz++PM/wBEYVR3LXMriDi1zVxBBBBHoKC+jxDxH7IUwmo8Q8R+yFMIPKPUFEEEEDhzT8oIIIUQQOg9SfSCK0EEDhwpTCmAX0eIeI/ZFalx8wijR4h4j9kVqXHzCBw+pdYrScR8IqxSk4j4RVggOSPWCPUn0gjzHqT6QQh1T8oXRWlmCb7whFLMMo/aEV4Qd01M3NXrCajxDxH7IV1aWNQ0xFKlx8whbTDA4DkECrV2fmH00R16OFQugijJ9IIrQUHhLrBBBBCBYVycR8IqwnhRHYlcaYAtvXGuHyAirS4+YR7ggodQQohPCiCAQCCCCECAoggggcEBRBBBBAIQ8oUQohPBCDgK/qB1HXTvi7oCMrONXSm63Us0vuBfNdTI7eRSW/KKgYHGAAA56hFh3zTiPw0jq29GXsGpmyMwyO1LfZKLGr6PVLE6w24f0G2SePGaYMj8odM+QcojV13HH2hHUfCIXhd8fa0fR8vQZBsH+jrYexO1ku+G0QRQXDtKqyXvyO3D4dYN20HPdf8AacZVfjaXrV/XqDgVTWnEB5xje0TtC0fnRQWD0aPb/bQik4zh4uXr+7eMUfDRkvd0lt7/AJ0+8M7RrKc0lS3h5MjcPBebaurHqw9X1+HbGv11XOUlyt7x9UNwuuSsfrV8jqHPsjCTqwID2DF5xsQzt1LwcaWgbct210fByDJDq9Wrcw4eYxYaqkGddIxCqr0x1DI+cORbKxV8L6V5pbZMNcXk6SfB1xm8IjQTu8ydrYlx55jqs9pRKjivWOExe7JjXX1GD1l8e3UYttZerftjYIhejgWBHNx9ouzbH7CZE+acA/YEXU56ONkV6VcUba/tsaMhrg6hz9H/AN7MRBa9oRb+ll/fFbvNJqeFK64a1a60M3H4Bxi0+1AgP+J1CJtv/wBHNtOtdJOK7JoM69SUVEDk01rl7rVwAA89xDAhjuzGuxWPKSConUlfTTCCtpc2DaUsEBTz8o9mBDOfGOiM/HLVwqtgI880ha6tFkHOHt9QzassUBH7Ai0g4qVKeiEtARAc4xz4xj7YbL3uCpSorBbS68VuYvnqlsIU6ieHvxKAj5gEOMwrVXHQHQ6aL8YLsbKi10SuoTpTkQDqYeDGgAITSyiHHwhPLgjm7xFhkNvm48u4GeOuyWm5Js3bbmc3HlCYrcVwoFSjXpq7kbUw/rUojy7AAQiRrG2rr4IZSl1ff42ol/6mdEwqEkvkOR+uIim30f3uqWWaNAyXmH81H6GPthGptZJVqVQ80K89fIZMJs0ojPL394Q1vEttr4RlWS7h8R0eSVXpzV3XlCcSSuJD/wA/vGzxB2v72OVRS6FztqW3jTa0o++pKGRNzSh3CTIBDivr0orUZxSWhZRoql03eVLYKO+6RACLRQO0SiJQEOH+UIeMaN5qUpKoJcwVmLVwHAgIiIh5RdKCxQLjiYcAHLtiI+4S3nCvhySaYqhX3PvqEQ2RNESPupfW7N/XcZft5HsuPZdmmx0z5/3IgHAALFOAB4Y74bc4cGrS1htqrk1/HjC6iv1K/wD2ueY68YslFWOYM9nbHE3Z3SzpU7bP1jJqg1pJi6MSlyaUzdAkVlHTImOH14jYrtRWQd1tCNtLEtMgpm0pLQqJ9YCQP0+tDnfDYBGvJtK6iQW2u8CFIQnb66XXSgcQmrkDXS+4PjHVm3Ls2a2n2Slu9gVi0ps0WwtEhP4cbdHhqEV5ek67t943f/0MNju43UYsi/yZ2R9z6A5TrxN6e3SxUaU+SpwnimpAE2gCOo/VDSknHXIzUK1CtrnUPoiEbN9vuwZ0LtLjgbyWb6gNCAgbzpntjWGstZQIzAAUeiHaMLlCWWYcrRW+2qUmUN09SQWdlnmJMjc5S5cvm5g5hwkRftLf0mbdnCWL/m0vE/3gHbGOt1kPxwz0iiQ1lI4AadKQBmlm7MRgBMwoIhuiYoDMICORDnNEi153Od3tIVRKPGBMFxAFVNARAJQzxx2eMfLJdGUzuXWsRck4yE7fUHBnSJuKqz99nI9IXMYiXw3VzjNCmz7Mn1aUr9umzWUUEfeipQ8C+qS/+CLw6Ze1+xIk1SAL94biOIDOpwCTdBC6PxAYhgabqwUX05IdlY0ggblpG+keAdJR0z9sZM5U23zVVaxIg4gc5UNZTpOXoS/XBqKLNdLBwYpMn7A47dCumemylRyGym2g/wD0ziazRbuwQNerRmeFwihaXQ2J5yyIEqhrwxjEbH3VtObGbVtuwWeWSTaulmivuhNq/pEC8aSbfXUSWGtUCCDb9mrAKRmgBmR2IfWIhqHABHQNRh+bn7UZ5ou4mRt0zmUiJZJMAhLLM0Ss00/l8Ijctbjp2/1C5+j9Cm4DFUm7tHaF1S7MQxM+p3SZxJe6dfZHvcqV5nMYvexxVffSSyBBJPp28842V11lGuRsyWXtha69KAqXttmztxZxF7kPY9Qf/wDQgDOu8+MacLf7cL9Or6C3j7ItybSlJVob4SJIXUCfxxy0ibj92wrLVXHIgEWJOaBrh0pHK1lwZQnUAEQEQ7eA6xySjbxQkqIRDEvczGOPqMaXs4dp1tM/R8GfP3PXG1TYt2ln4XuElW3vw3HSkmlZL3Fyk3SQNt/q4zE3rhORIty8PmY8VVlRve/E+z/5sjFtnF67Pt7dgxvX1NF/ysL5gVAgJ3IELhNAdQHrUQ8IZN1dQuOilPDrUqrIKsV3En/WKf8A63FWS69HMjSq7MrPtFFZ3ROyK8sRgv65A46/eY7c0nXL3ISvbcsqlfzM9+kYezYu2WNkZ0to/a9vA/LelTa77VE20eXsN0hELU29jJSqJG35iu196KGt90/SShElrPrDbSr5NxY61+YTZrcSe4n/AJxjjg8RZkiVzlOG2Mnrh1KbFxv5+/8AMNulyEFYssyT6RYcd09nkvcTix/CBxRzUekUuzeAxRIll9xrySaNqZASawSHHtBgMx0obQlzl1qJpEuWrg4Sr20R9I1qbV2yK23im+1FyFxrpKXb1B9uHIcPL3s+3U9OT/0zmLV0QLWzCSxH892BtjQ2jCRcht77WatHiS7A58b+pi9teryeLGZCBZO2DIQiAXUuk6j24N5OMmMe99cd/wB0a57p7UdsbIJD0s3sbpLnAy45epXXtFuo6bIPNVLgMvyUMkEwCTAddfpacNcwk2j9tklcy6JpMbCPM3bDISl+9pjkZhTSCyFAJgFTNy8BNTBNrnhkO+IK3afRS5a/1oVoUCtIRxiThE/nYO3zJHQiT5KZsmzd8n4e3yiF6TZTR6/t4/uKW1GRTLs3n+T4vbzVFht+bcBw4XTjNWfq3eAzkcS+USZukjoCHVJez7gA4ZNfxsiAhnhDc23dLEItBwUVeqO9gGUkcfSHI/3Q1NY+ovFdoJCEUnOGDBnEnR1EQ5AEes1o+KgydMV0otw7+c5A3Rs9H2tY5GGcrly8y5e+j8Q2p2uZlLaDTmEx9nosbMPRks0+6rpOB1L4Jyee97Ad1Sw48MeOe6GOQXIvEV4813g/zJRLKe5LG+wu2fZn60FL2As/1qrXFcLXPgrEmsIzKIAHAPLIRgFJuyNpKPXFu8eLbwlGj/s+3T0ozKDsVwEMlznYAcRGA1XrR5KnrIKJ7hSDvI3U7lH5KuW6e4mXP6AfCS4FFruSigMekuo5op7i4nc1jwtBSUy+mgYDv5w5JU/dC4Nes73CqrrrNlCu5nFc78oZOzPKIP22vQcJrAqy6nynFs0bqnBOH/fekI9w8caxsY2UKd1Hjc/FslRDSFtwJR4jKVUDwJxFS01KlvPh3RbNoNI5k116Hvz/AEGj9Db6zWUZy5EHzuf3Dk6hm1mXhuLkQy2/bp4xvstXcJqXUYdC39wENLdiCb+Y1htrif7QN2NNFvbG0VVSImGuqpasax88RMutRrMBeSmuwK6o7M9U9cdRoOrfUYa557aU2qRi+D3cek22NJSpLTcHDWbUXohng1kJcuDsU1xuFbkffnLZRcUOsVJP/wBVjVSUvU5GomjZZ3phksUyIHLWXhIfoDvSlnj8Qjq9sbf54GFig3m+lGji6c/UyP8ACEYeDaKtxs9utHEdo+zjX90S/nc4uEcqMVJIrKsXp2Dg5XmQZpuhFW1vB1ycHEU/+YOKBMaBNxuqg308iut40rao5PcOsE//AObY2ZWT9E9c94qRFQvA6ku2TNEN9JjxcR+NiZ28Fh7O0SFv9ne2TNSSo+4o/wDKCjDqeuvAedSq10due1i8G4ETjkIn+sGYn/8AjI7PL7ubZP8Adg3PNI95PUf1SiPz/YIIIYRl4EEEEIIEEEEIIKIIIIkAHBFWlx8wilBHVJaqCwQq0uPmEe48UuPmEe4cWniggQQQQUECCCCEEFEEEEOAQUQQnhRBKPUCAQohPBByKwQUQQQQSECFEJ4UQQh5QQCFEJ4UQ4BAggghAgEEEEIEBRBBBCCCiK9HiHiP2QUeIeI/ZBR4h4j9kIOA+x6k+kEeY9SfSCPsnWPsnWFMnEfCKsJ4UR1pTCmAdUPKK9HiHiP2QphNR4h4j9kKYQcUeoEKpPpBCWFUn0ggcOiXWD+J/vfdHmCCCKUwpgPulMKYC4QR4pcfMI9wOHAXKT6QR7pcfMIpQQOJAFcnEfCKsJ6f+LH8c4qU+cEA1E3PSgqR6k+kEeY9SfSCEO6flFaFEJ4UR8JdYc0esEXCLfCmjwDwH7Y+wUj1CtR4h4j9kKYTUeIeI/ZCmEDkesEEEEIOI9SfSCF0IZPpBC6EOyPECKtLj5hFKCHAFCrS4+YQrhJS4+YQpk+iEEDq3rlJiPUEEEIFhRBBBA4ICiKlPnFOKlPnBAPR6xUo/u/f2/dFf1I9/wAQikUlwGugh9cPts07Pr12rb7sKxTIom5VJ2KmVZXCTpU2+jyiG+qc2eQAPfygNwvGsGe0ueqg+Xj3YWevXG2L0LuxGm3idVba/vOllRtNag1+8NIWw+bnes/3aRtL2rtoQ7XrLhgD26bp8YkTdv2PsDatj2HtuRKpLXt41yCGTJkeMc6+1new5vh9HLHozq3dSN33aWta+t8Xt7dQyY85R0iXOjTJ6wY3aEvxWXK1ct6/u74gWsuKueq5HQB0DPGKrjWap6vWEdcajiG3Onf7ovRFFGLS2dAaijo2PtaP2duFp1QwGcgIdgDGGKC36ub1tbUR7R4wk6y9fRzmH22RGK3bhXmFae9DemFa1BMXPfRTPuJ+UrqVKY7JhEPgIQC/k9n8IoK0uW7601dG3WoHctzZNg2qazdvJtKJZlYVHCO+25sUHzeoqhcP5VXtMlSnYHEfqC13R2pbj3BpUEeZQKNprEv0Q0GOAoDeT/AIaa+N2V66L8XHgtnZjRo6oiMudNyzw/5w0ZmtNQLVT52t+4COJQ45GA6Io0pguQvyjszQjostdcUp3JOI/cF+PvgwUpV641zOfHOIbU5c43Qre71+XbDcOR6UzoeoLgOM474baqsVc68NOH2REJ6/ImLV1G0ip7o0pS67rURS3RiZLC2nrj26Wi6u1XKppRoqZ6WSZ7oxteY56zvpLWmYZ95+oWNfAmW6LRvST9wkm11BXDgIaRzqUDJgmEwhjTt0iRuz69VNvXEbqokKRgmaKnADpgOOQ8vKIOtJI3SkcrLwOVOXtiKJT0hcK+zSHSKH4TDZLstqL79HrcG+VqL3IBllvsa5Aetuj0U80XLzTZMFVngJbhNkNPlBzyAbG7e7ZlG4y8lUOqvaErjcXJn5wh7Nt5qp11NglVvQWL726LepfUawc3D9II0clLcuq9rVOSoeZyyoo5yUOiM0vyel4hFWs463rgjlZauYjzgLvZhD+TomTRO+cE5uEo6Vdq30XFrL/NurdbZpIFrf3MAtvqwzc/vdXzAjr0R1wPf9sc3z1Zb7tK7jrPuI3ltlOlCMdGcgokehPIIa6Z5acsxt2sH6aaZp9WpFyWAaApKODhxknwkmHsHoj90P5tB7VPo4drtiFy9z1VfSF8mWwjOQg0jYuFAzy74fbRui52aOwlRK8T9AeRzuWqri9SyZO0Qc/wBLckot0hoONOExnTeumMs2M9sIxbqAqCNdKXpSnDQ5MMmPhEkFGxmzw7BrV2FtEtBMDP5m9yBtuzTeeBjBDuyw95p/3rPC3jylDh1C7SlXHxEItOki7xPyhlcp98h/aonjzlyUr4eim89Pt/Zz/YGuqW4c/wD2FZON98swafVHgg1XiXNAFUkIiHITYB9cXM1aW9aMIjTaa6AleJspLNMH1RiZstcqgPvKSth3jLNj7I5VmGaFSOdS6JWnojjRpHMjYuI50nh6X5pB1AYZOkNL2kc5egXEciVJAM0weQRnDCuEfs8qdc2dMLpBVGTdDRwDYBkOXDz4xFOWss0QHeKZqXGmJhHMLJX2sF6YFwrZAO0M/GHKlx26tUjhwiYih+2coNQuiJZVxQZ6n0/Gn/xjZgU9IbcYR3Z/NZCcQcMzAEo/DIxh6jtLWZdFYDTms4hBjUCpGboh45jXbMrmjg5rTCIduMYi5UVAhRl6WJpjPABHWA2iMJSlF2GUgYWlyJIKG2dIvz7n8Aku7TNqnNRGumt2ZIz9KXf8gPlDYtdfbjPXaJ8lQNTJwTZNlRHpCIdmYwuVYGuONdeQaZhKapetp9IQzgfCJWsVnuP2JC60geHl00WWRfsEEyKk7eQZLcc3Wrr28Vjk6mQr0Pm2bONOQd3hGGS6iACIgA6RdVac4eaLdUJaOa9E1XKa8dZgH7xjK2Xs/X5f8m+tC2TsVkyYQAV2VOmIocgfzhOVpQkx3dLPdEGPcqbeQPWqKh9dkPlIU59w+AYJurx7LHfIkMfWZT/v84udtU0Fp/oxgxk0nljYHDYZ06NDX7g+MOpUtM5n6UdT4IyGTKMkGqG/HBKAIZnH5OeQY0EY2vbHOyQ6mxbF6sjaKc1lSNplVKMOmcUVUKKd0mislsBL0TdAMy4AOAzTeUR6q2xthbKWu1jW18fPNBwGaHtGm27QZ1Ekf1yA/SwOO8Bh4gbpt987VMvQ2PGcntUT+0ZGz6xxoudoY9c2c9C+f6xCW3zKBLILTur0MdVF8pI64UDHIIyq01htoS89y0FGt/b1TW1dXXgTqZOU2WT9+MVx/N8jjGezvjYKco7CFrWg1S7ndTpdpeYd/Jkw1EeOYe3Zx2lNmp4bVFsvycF3QkPw2qdRtt3rpEPY7eBKaFccf+cCLXRIrtD8ktFiZPoZzjovdEajq4hBusns2/2CZzjat6O+2b22ImvtCWhvCqM5wlrmyhKLcaw+0PAAD7ojXcHbl2QWuYctm2MzlxKlMquBfYVJQQAM9vRznGvHGIwO2+2VeVJ24HgSeBhtJKElPM+hvAl0MSAWRzcwfS8vt7I2+3fa2yNfVtiru+zzEVXQIb6UVwQkn2iIGO+JK8sppytSVnGCbxNz6A0gjoht57KnlZtum5kXPCQ5Rowv9sl3Objbbl+HBdRhtMqba/72ye//AKQjJLVk149WSiDPv9bl7vJvFfcyZFe/WIkc/wC/VlJCbfZCvZKveC3K7XV2yjs9Gd2/OJAUT/IEbtHOkRCZOydslbQDkp1WPcW5WxVexlYACr4kFwJyh2DKOkweA47wjlP2vIrxNW8r2BxvvQvc8XbBFlj41IOidR2kF1729sSoH24qe3reKkEQmj+6fOCcj/nsW6jbG7W1rsT7Wpd0EFRkKl7rXrzWbZJcIfOJD3RRiUOz3sKoJ5MaqwoXoS3ugt5BIdT+yxHSLxtLXOXmb1IXt+8Wuk26ahX98hzfvnL/AMKMUZGKqyivIMRTqLwiidH0dcLhRZvLHNq9Xwl7ecmQfmvN7ZpMK6oLbR0d2Odzb1uYI6Qgmp1DOf5oAI/VE+rZ7DtgGQqUjW1afVWpTkmoAbt0gLIHbghnngAwGYm/tV38OXqejjeCe7a7MaqMpezDGbSKTBMUV4oGom1TchxnHIc+ER1TbG3Qu+W9p0dogwbdoQZWrp3EOGm6zKWo+8mjwhx/0dO+NYs7Kt5iw18sQqKu5ue34jXa36P2jy0IA8rciaaSvZL/AP31n24DAdprYT2Y120jkv8A7HT9XqCFb5eLkbjW5dY7+qJqeY0BVKDzDTh9kQwPthgW1XayfbFXX7nqamV30krihi0fZ/Oe2J6Xvv3Y21ljnDstbOTnme4rSnv13LvniHRT3iAAAAVSQ7MY14DgddBjXiY2lHw3WiYthSZ7NrIP7uTNzgmFp1LI8ffA7IrN2zjaLbS31xG/oc4ylcURaEHIkkIk6iKeb46i62wV2vZF3ojwbq37QXDIAMyRuIYT04wI8RH4BDf34OO43cQ4euQtlXSvmw3ygaKKO/p5QK49IC5YaI9EA5Y7ucWxiJiXXIrrlVUkiVLpgUcy79jHSHABLrkcxkzctS1bvdfrpFcNIRZvEqywpmxDpDKGdAl+sI6pQ7UyJHGzJnz8JODcIOlbcXloNOsGijyitXOQmfIfITz0P1+cRgTzk1AzJWzj5fbpE6Le3IUEOs3lhPMGippJNUDsu5HhDgIfdDVtvZlcFzS6oetmrF3BUSQybSpSZqRQEOXyejFrUkZx24MHWm5yEyYtpJrcTpMdBAQ7fq+MOlvmlmTwjd+To+8PjR6vL2Us82hPwc5eLjINitsb1kyDqBYFUFIKiGmn6PjcLavaEZJGslLCg+GuUVPzL3GOZ9kUVJ7K5NGSS4jMbM9EAH+LE4nVsysNtrVdBRrpGHqGdDRFP6hlDyHMCXHHRL6hHz54YgdLvg7Ylaoyy7syPtQbu7nekH2ddntSoOe064aVnkcK77viIOFH4xAMntCbWfpA3geZ7HbpkUw3765FdbPCoJ4dkXexth9l08zuuDDc9oV5J/Q6OfP/AKQLf67E6rYr3sqj12uz0oq00s3+eI6HEKWu+02SxNhYeGiFe7q0oroMhjyObthztnvZvtXYijQBzqv5Tnm7PcVg4eHKcnqP+uQw+2ltsE7BHVy07GXCqsvGzW4nDjHUMJrPiWi+m0Tzb3hP5FeIxzj7Stk3ghOx7vFPSjJtrk1T3xYE9kPhDlayPLdz6i5E+zn9cPGj+Sa3Tc528v8A/wBxodggghnGcQQQQQggoghPFejxDxH7IckXmvV5gh9gggg4DgggghBCrS4+YR7ggh8RRogiECCCCOgQIIIIQQUQQQQ4BAggivR4h4j9kEBD7BBBBAIFWlx8wj3Hilx8wj3BqHiqhAhRCeFEFoeUEAgggggIKIIIIIBAIVSfSCEsKpPpBHNPyjuj1gCrnsEPhANXHYHZzheUoU+I9nwgrUBoz1dOYgMcdcsD9kW1NB8gj5R4h4j9kFHiHiP2QUCaVxwH2FEJ4qfuf4zCHoyAKYnpgo888uEXMwh1ylLpCGNPCKCRXpk62R8IyNYWKVYpnsHhDevTqqLLjGUctHLOX5+lGB+pHv8AiEKYIIcBFAQQQQg4BRBBBBAIF4jzJ9EI9QQPhz4iT1pjWlR7k4j4R4givR4h4j9kIe0phTAVqXHzCFcJKXHzCK0nEfCED0a4CrHqT6QR5j1J9IIQNT8o8wohPCiBx1R6gohTR4B4D9sJ5eIeMKKPAPAftggPCPUPkXCLfFejxDxH7IHByPWFMEEEEBxBCihz/HZCeCCAhcIUQQQkPKHFHqH2XiHjHyPsvEPGPcv0JvP7IcMefAdS15qUFSFEJ4qU+cIEo9YqQQQQOCRcIIIIIDwDG70eznHWP6DzZfJWX2fnxtfvcjurwvEHUduCvSGZQJN/TM2uvyhAR+Ec2uzJYdS2p9oK1diEgDAC9nNKCwcAcCnp1DInJseHHxCO3LacXmrblntW17HoFUlBt6heyrbKEv6PwiktLM9qas7cbdbkURpdnkUmh4Jv3fyGrza6u1RI9eKBg98Y5v7svas5FOsYAQ48eMbCNtK8xwwcPI5evpx8I1GLqngdPiESGxIikXErP1/GLBz0QwVYqDPLP+2LMpKX7QAecN8pqQa657O6KSwrCIZxpDYKawIDgR7u2JIv5A2XrfiaGegrmFgAJ1pQENAiXuz9VONvZvvM7S1ARB1uVPZAmx5UKHvg/d8I1/1jojRzx+qNndsRT1b0bajQTpRmXm9tEmjrgyGNzLVkaWWX44iGpTKTyco3QPwIqn+4VTZcws9uhBdx2C4k+wQfOLIGDlWv67hxHjmPr1XJjTdCWUN3LiOJQAMiIw0IKNaaesYzgc5hMcXh9QNDIiAaZ4jEckrqjUI5aj4+rzlOG9W9Xa7Ryh+2KMWrHZpgxx74oF6wZAPPuijVq0hraa+esfSVEZq2M6cQ7QjK/Lsg9m0a0Uz72UQvU8wvdArmYM8RmyOvwh9rKsleflwkBEQKGTZs2Hyg4BiM32Y9ll7bSDopJqJkohlZvnlaHHuAeEbZPyMoNslhDtvYjdSm9qm4vx+HtdIt9lOxNrpajgU4x8tFk2jwlXB9/i+obVHJWrEdhvaFY6hXK70bsivHjhM9z+ae2OJ6uo1apEpWHhJMMuR7hjq6vNcKs3dlfagc6hqWFhmGMjHP7SoFN1jktqy+rJUZQH6Uw5iso547iok7hA/wav8AGlqw2xFfBNR5NZ+QU9Y1+0Iy1rr1b1/qM8e/MN3CwlMJet+Bjtbl9TiNxIuKLG1ebeDyl4PXEZuupXqanrqGcAOQHjiLcmKh4gI+pNmS/eE4hGWJqj10U3ceOfKMROEwo1qoD24HGkXZPRjNBVG5II/RLDxalKq69uMuJvh5+uo0E9dUe4QnmwH1xlP5ZLgoxQwkyuE0YkN/nYCIzfAYx1HS6ZVFrKdURmMmRGWURDh3xjqjQ3MrvpikOM4AeAd0fKvKzFpysu5MSuXP5yEIHbbZxi1JWjlTE/p16hmf5WVWqPzsnpxvlk3JgfthOYdLMWqoCYTd1AeUsw5hmThivXqjWra50yGkIZZuj9vHGIqVXTHLsXZ0MhVm/wDWkH1WclV6Uq+U1lfT3w8hppJCiOENX6Q8gqAIDGGHE1RSZh3iiOOQhxiwUKanKOQmmAO4cfVFy62MUeNYRzzxrByNxwkolt7hmpHue/2P+GcNztZovXoUcnqgom64aiA6ajkNYv5NRl/7cQyPbpGK1VSpXDHRD7Y80aQ1x+kOQHlygyHu9XayN4pYzn19wBc7cTcsjdg7ZtpOBVbZdL3w4pUPezxDrDcBDI/si2PC+j+eFWsoTO9dVDQjgJ5h6OfKGQRjFMg2KtAwT6wm6w0LAIgIhjjp2xSUnS46BepQS0GghyCPyxllEJpQ84tik/Hwkfr12ZidDwJJHOcTlCZIiwRb5ykpq97ITf8AyEmkF3PkswXXJRqqRSV1GSJE5UlOiSAS4AOAxzyIAGe+PKGmUKQoiQqOBOKSGjOZv43RDtEYZ9eV1cuwGeTUTpn1qiarnczDnQRAAEOesVWGVnOulMlmpTmg3kPk6iESqMk03DXZ0Cm1hykMfP6YnqE+klOIoUKY6pypZzHP39/qp8ocV91GcWewtv1yq4KqbQ9X0v5whrgIt7WuIwWc6yFeujqSEut5QLnkY3JPncFAuP5yaAdePLuhkFhTWFW6CofIHBLGetK4yTZEBl1HTz1jNkK36g63LW61qqSmZAxgQKfLER58Yh7OXkpt2tySiXccHLvk3DkJgGflaRm5E6EQ0TPU62UuYhOD8x117I+0ds47WjkIMd1SMS5b8SrXEDzjvuTaPs6495/Xd6J/nkWvaV2S1hndY3Y2aXi6HugpP8Ikg78pRQP9l/1nz7Y17+hgVGHbTbsq0DjXNliaZahwIz5GabO4UB6ITCPPlKHlG3Z9ekX2WbZut/J1v0lU3YqqECHsgJDfj6iXANdeHZEwtuTuiDuFs3QyuWXbyDRWiu6p3R6oSKiqpuXOY5DlJnOcg1mXIdLKYBuzCzZm4ZlWfSAlkXS+XISEeiQWdBHj5hzjaywrcULmXDtntD3weFu3Y6HUgAhttntYErHb1qAjxjSBtB2olQ7oLbmttXMq1pnsW9t2g4gITJyeTLmQmE0m9mZRHHLQQ7xhj7S3HW2ndJqLxpTNDTbxsuACE244LyjmYtkOWMxe7uNrcSbBHeJU5shT/F+X5eca/VuaKuHYHzhHImc24bsD9BezSam12olNdI6rKGWml9Rbnx+bohDf61ab19XMKCUaVjX9ME/DcJF324/nvbu99kXuLgZxot1C5Qa2ieGOIYietzqPXjVIGG+eKmypz5jz/wCsEZIozd27LHcZPfIxxcaKVu3C5rk98mHN3tTWT2cNm6lcva+cDdNK9uW8VLp7NYYj7Pyn3nn/AJj8Y5bL97Yl89qBzmVN7u1WNostQeqGsJ6b2fQS+NJCsnAA468c/COpL041plFC2GrONBolDLpVFW/83W54lLkJR3FT6JX44jldJW2b7UR1gg/qColruMoAYEAD5Q8fLEShKSuK6E0Xzg+Rvq85jcG/3NZ7fGIXpIeX9fsmgsv0KZ0c6huAm/2NZ7dYWtE9UaDNrm/WmSdQR6PRDTXMXK0i+sSrNevTQutDBn6PSAZvgARaJ1EHdVSplhNEm3pTdUpXNSy9LpCOvHu0GHdcbpblpDpZUZQ9ZyiO5lBmDAhp+z7YnjOqKCqK7g+RNPJ6/wDww/W3qq7NO8pamFjMhMe2fP1qasMS/qZVvLAJqyU3aoVn97DjMGMQ7RWqku9rpZdDoilCPupo3MdEQmz+PqiN6rVUny4JVdwgJeQyp7pMAaBjGRD7onlf1KsOwrUWzL2ocZlZXpm9vryGdONENwUKxn8117AD6obYjw1Z+43SJEL2+M4Csp5ymtclx9GSFIXhPuLH9qCJJA+rI7loGGm4TKWoJkwCVOETxohUCvn+KPIfhDvoqiYJSnqSuT60U1wQ98OjiYBEeId/7Ij9a631z7iPZMQLdoaq4lQzMA+uIkhwUDIe8CPLHbEtk1BkL7TLHte4VVNcVb2qIp7hOEh+bTw/JEfqx8YbI2RRbr7PvEUIbh9vKI3Yl3RyCTyVXoYimbdL2N/29uoT5p24buzrabeqBIsduO90v3xZmHIt/uiEFV71jxz3kNeyHW2m7sqbsfp9PK1vmxIDcsAOBiKtGt4cPGPmHh3S6W3TvjDiRWfbkgs05VnffK2+J1WZuRuW4p5ceMbPrVryieOVy/8AnTMaQrbHDpdeI6ld1N+eI3zILJJsBks7eDxUX4bS/wB8jb3D+D8QO9YfkpXaEBT+lmCaQksRdDtjYHRJ+ypNVZ6xXLKyoTK/nhE/83DEIb8Ntk12q8W++EIDaC7EvcUc5n+UYzxiLxyuvEU/ePev1ztjNtoRNR3wj9YFzxUoaSUshkl/aYhPKOxdOhuZOEVA8nUm84SWitzIYcCsEEETYNwIIIIQQIIIIQQUQQQRIAOCCCCEECFEJ4UR1b+OTCBBBBDs38SmECCCCOoQIUQnhRBCHlCBFejxDxH7IoQQ4BBRBBCiCEPKCAR4pcfMIKXHzCPcOAQIIIIQICiCCCHAIKIITwogBn1AgEKpPpBCWKlPnDmn5R2SrhzhbRrVqGOQ51GCrXrV+AZ10zCejy8PvgrfHT745eCVR28GUVearZ84XwQnivR4h4j9kEgwps1cB9j1J9IIJPpBBJ9II7441pUe441pUVoVBUqcxEPPjFthRHAForC4R8o8Q8R+yKEKIQdgoggghAgKIIIIQMT8o9SfSCF0IZPpBCiT6QQgYh5QSfSCK0Uf4/8AvffFaEO6PWF9HiHiP2RWpcfMIo0eIeI/ZCmBxIkeoKIIIIIDuCPUn0gjzCiEPhOmNcApl4h4xXoc/wAdkJ8//bfr/uj1J9IIQd0q8+I8wvo8Q8R+yEEL6PEPEfsgcFoddQpggj1/2P8Aux1S6w4hdAAiA5CEEswyj9oQvj7DoitjzVBBHyjxDxH7I+wQh5R0pXGmIU4HsH4R8j7LxDxj5BAICuTiPhFWKUnEfCKseF6qBwFWjSHGv2Qeqm046f5MO7Yi01a+932TaYuuFW4LsVAIi4Tv0CGn/KM72rtnevsr3lWrSmHUmPbdC1A6UcZAdJgHjp+OUBUkktbyTgOVHjTlHYc3SZfb7RGqCCKFXNKQA4ZH4Qd1A3nb1HSb/g+ljydJZvRtXuAnNMVb5Whbxomx4dKbHTHHwDyiTu2Zdr1HXagYr+GYlJsc23rbLHo97OsBYEskrys1vbh955GVj51jRht13U9RWPI5c9j64zWRT3XXasxQ7e8YZFdoe67SQZs2Gry8zwrONePGBreMRdXlEOfH6xjNV453/VDIOpQEZelw++L0e+Dq7PUaQumSRhYLZ0OwUY+vLHHUP2w1aicyOA488xcVg5xxn7Iwo3VER0HHfEEuSeRZInGOLjmFpR5z9QSHa4dGUOzIRMvZkXjROym0cjdaiSTDyahHZkvkoGKB3TH1xCM1VyEwcAEQ74m3s+0ZiOzRtCq40RmA4utpFA1/NEZlIyIf+UIoS0ZhaV0nJr9xJx/AHixsW80mvSvCU9f8FREGlWwFXw7Ixs3VAREOQc4uWR7RjH645x45+2ILfcx4GRCgi6PWE8melrj6QYxDhMtvzu9cSUAvkDJ0yBPQcZz+BhvhAQHHOJrbEdpVO5t6m0WoUR6rSjW/K5vOkofgYgWjnW8sE1xM7YnjAUtqqYa4bSLh3QKbG9uWfYG1KWWPPRxpnSPLQjkRER1ERiQezfb1eMNwj8xqht5K36HJnovN2NltoKL+LX1uK4WywGeyi4J8juex4SLfmEeAAAceyIT339KsnNRuV7ZbHacpkqJ2UCbhvk6CAE3svgIgG7p5POKcuvGbXh8nA5iarPGdIMi6DkqOfi75wws6oykd0B+PiME/pR73oLTQG7sfMFaLq/s2piu3bVU/IEJ1IMiUTJRD+YHyh8A7RjR3WCasOmkPwrOJjXDrHDdYRaLgMiM1fEho6TP546azS+A6Q2a20V1vTTTmKc0xUR0NlflER88YhwnYJJw1q5gT7TG17SW/k/tPMJQ6jaM64sjUO3J2i+b46ddK/MMTpS5mwHbx5RfihUcAGsWsK+BAccIu9E5D3ZSEQhzuT9IGWtca4jwUNViFYK1HQfjF9NV+s6WumNIoeppVuICAhCWYrWo6YwHjFnM0XsUidhTfbH7I+fiqM5UckyieNXOpbIB5xhpxQ9fVqj2zaxepFampJoE6wD64uOZR5eEY56n1Q68RhxdySz6iHJB/BjlDhILY85eoIKyRRqCNajWAtjiAjjHZCAKVIsOgjnnFavXERyP7YtNaYQ+4eMUFdNLYi3Z38SzKRTvAFCq9aYGqK9WvVmwAgAd4DpHn1QCIeuq+GdYob4Pd8I+gFGYR1m74r3lJF6tjn1ynp7gPFf1lPlLnwGPcucgADjMJaXP91EBDtzF4JppuvW9SXo71NnhKGYkcRV4+UJqCfQKBq08gzpOofvDW8j0fe6OvkMY2RBRrVC5MtWwJqYAAOzEOS22gqqbaWaJiYumygMoiJz5Ew9wQ4bAZVsyLmIUHe5TZiShNpOikRm6Yh2f3RfiNtvHBkNQQyKepITMc+TtiWs7ckZWrDHKROpeI5snbr84sVwXUNNYJJxwuJouhp9EiUlAchgNQD6x+EOjs723dl0l9aS7dIakdXJEOueGUBwPeGYSLrztuRVhMoTaAyG85lNLY9Oabs0zpDoEryOpDaDhrt497KJiuV3ESaGS6vlHwi1XbJ/V4s4buUz90uX8RYCERtEw5lm79E6hMx8uTgJ8owBlbKrycSyeRztFBbi3+7iJu4a/7Op+P6Tnj2x0XbLzcsdYnZ2MMhw3ItycX5tZlkSHUHWI9pWOaAs7TjqUfV11RbVDEw+9GTlU1PMHlnMSgtbbCz51eQqN1tolDbhEuqb64hbG9uLq9PDGcTaB/ziCXFbjJePpg4KRPtZS8YhctbkY9RJye5yNvQLn9qjd5sdbM+zxZi4Ckqti5y87Ft/pag1TRp0p4SgnJ443MqV7xwGo9gdkSTcvoetnxnGwPOC5t5Sqm4GxobQxSXACeXHQRVfgERo2XnJsTsDautknWfvS8rhe0KoQI4XB+bgiWu109tsYxtEnj7HVVNptdvFcM9XQ2l82uAtBtlK3CvOHou87QsrQQyVuG4VWFHxtYcxMubcDHpmyO8C2zY/rVM26RRUtyCt0iN0lsiKcmypxYd7WQBHznu4574iKn+jjurdtSXQsvca0zrZrKm3I65Dj8KJ8uge9h5ZH4xs9vvtuslLsO8UcCJX2ydiX1EsE+Ixzz1nICkb6JetXTBTFDfkgCYDmmOdMd4YD4jF+QdJd7EOW6tdmqfhGybQh1Fo9x0eza43D6Y3E7G1FdtKh17I3QZxsUJYeXSSXIhuoJAZxrn1oAaY/GI37XIbe0S/2GwGfZ9KS0lMVv4YORcD9H/wCdY0w7BTVsQ3LxWzTmzcxUdSpda2FB0vBGPaCnqPf9YR1bPA4xUO3FYuKoUSCnVW5e4khEQT+cUbpkkthnGrdtuCudL0Oi8uwnTZEspCbg097R+zHY0xso/wDRYuBfZUVnmUVPbgnchqhlRT1kBjR+d2d/Rw7OlZURbjrbxuu8SY5JrC2eA8nBn3rVHI/f294xsk2zGSsDaVbuRbh/oRtLKOjfjjkPauJPjQM6kK6N4ahl3N9igXTEsQByPKYOrm/IYDUTamdrjiLD0fWrRG3TuF5XOpm4RN9Gej9FvBmnpZ8U8cQuRJIu+H4/Krbp/PVmWgL24Yjesi/pa1n0puNVpFT6jKZNHAKEnmJLH53kf/KMc7l9LWTsi7dx2S0leV0JTMeB9rFFmUMSqPV84gMwB3Y4d0bizV8rZWRYphEtEYLXevYznKYPot0iRQSTPaVcMABlL4ia4BqOA005RpsS0Z1utWMVnIpmpROzVjgG5x348dHgOoj9Yw1aTEWcrqGKJDHcHLxpdj+8xFB/pANYWbeQ0XaiOducu7k58Oqmr1nV1hqEdtvNUURLFyZkTQ19QCXIgMSLSGiz0QpRPXTcRo2ZLGuiLdRMHFKfxOZwHAIr232iBte9CzoKtxBVjRQcCC7LKuUzue0sI93P4xj/AOUZquJbOkjCKZNlzQiCSGflS66RX0CzteEa7O3mzLuTmyZFRR0dGWag0xQflO5zZMhyHyfgHGdG0Etmf3lW9TE22bMnmEZ281g3GZRzxFTOZzMPjgIuVglmmRvonK6gYLG5UouMxs1+kJeAB/d5Rjrut7btPGhWlrqhY1xxgPjCC2acRRH383nAVS27ZN4DTHZEyUh6oLNompE9XrOwbq9vwEjLbdxRdxEiZY6erOsTgOHhNrhY+6BnUKxoSgGwDP8AZ4vjxoIFJxKpdpHTao2pTgypBs7L0Dx0vp9IPiEeLjW9dVv1ZLoOhJMoBhwoRd0pMgiOBTzACMo/UMYeXUBpAGOXnE2R8CzoV6xpGOW1CR2LmvUNjloKth3vZRkW3YzIVDm1mrPIxvbkPhhvCnf0WJpOT2wZyklM+4B7dHQU3DfPf+sI0iWsuQvMBeIrLer7oplDX55nIhE9We/HJdRYoKCwqmjaoa/PDh4/1hFT32zWXWIvQZ40pRkhKuyP8/g423WsBI3NccHWu97oV3Emcx+kIzBk1kd8LDjLKKqUKFRQa5736GxflFNtWw0osnriWrb2hb98x/yfEM7D34rOpYuNu9cfmkroT/rCKZQZrSteDoycQzSjDu5tJZ8xJ0ZByswQQRYw+gQQQQQECCCCEECCCCEEFEEEEP6PWBwQQQR6EFEEJ4UQ4MwgQQQQ4BAhRBBB6PWECCCCPQgoghPCiCkVgQCFEEeKXHzCDUesIe4IIIJBAIUQnhRCCCiCE8KIIZggEEEJ4S/kCFwggghwDgCK0n0QijFaT6IRz+ECS6vbzhfS4+YR7hNR4h4j9kfYMQ8ocKVxpiFEEEEEAgKII8yfRCFUDFrmpiHClcaYj5R4h4j9kKYTUeIeI/ZCmOAcEPKFEEEEIFFNlBBBBBA7C4QQh6c3b9UVqQiIhnt+6BwRr/iF6k+kEEn0gjzHqT6QQOJQK8vEPGK8UpOI+EVYIB6PWCFEJ49SfSCEOydcK4hdFaWYJvvCEUswyj9oRXhB2TUzc1esEXCLfFaT6IQOCkjZa1Fzo8vD74ycnNS9UA5DTt4jGLwo9bW7frglHnpziQxzzYeeo9z8Q8IqwRR+R/lfVHgIru1x84q0eIeI/ZBR4h4j9kUIrf8Abf70dimzAcpswr0uPmEe4TxVpcfMIKBQXScR8Iqwngj5JXGmAeArJmq5KtRMlqwlTMo5LmQ06IxcVNYUVw5XUFg6aVFM2OTRw6czNNFjhRHtKYDzAVavHzGHr2erZS3p2g7MWnmozGi72uEkkFYA4dX9IDJ0B/3QGGQEciI9sbdPQiWzpv7b5aCwYomd0tq0T68MoBwMnw6qAc/74wyT8lyVHLOAxXU82KDcLjph2xlgm3E1Ka6f7p1Sl7j2jHIXtfvDrx7ni/rhHuDnHSxt1vwN8cagX+zMckt4F3rt0qqj63IcMxTmjiO/Wzlx3CilNB8P+u3L/wCDRKI9ONSDXI55hzzDArxvIiGcB+OUOa6jv44wx6lW6UwZ5jpFmvVq6lTACaU5/Xu9RUY0brfV8Yx0xWzN2j2Yhedq48IsdTjxxqOsZQvud5zoik6UxqEmfkY7f2xPxnUQbew4bPgPvNwL11CP/wCIb6OAzfWvjGvyfIiAZ5eUbKr80CrK2T9j9mFxEuYXmcuXROzTcfnhWEpLp4J31RE9EC1KTrx+4+BbHJ++JVCL7GZw4rX4M34DXZX7elnIYEcRatRmwAiIjqABrCyeXpTDL24jYlsmbECtdKWlca5leVk2nTRCadRPSdGdeEMj0ZBzw7e3Hxgkkk8nHmHAQnjT9wMOZBujr1zZSBmdmvZMuPtDr1HqVKEm3QnEDrjP4IptMAzpngIx1S7JmyPabZ8YdChQERN7pXW3g5BHI7snhg4a+H2RqTKbW6Gdd7bsDs0IRZuNaY11GRWJtOlx4d0TS9IfduXZ52IazWInw9uto0xMy0gJpBmPkmtKAm1auOBAQ6cwSyZ5DOESSRjUINk2YrlKRu5Kc5z9s+Tvhll0pV6sSLy5Exof279sRx7Xl5VhfA8pFLWt83Mi2saIzzSJ6CnURGSWvumejvBgAGaaYcD8vo8hiC0EEVDISKz12dwufpDiTUHuacZuPjGVt95KjezKTrju08wb0nTTCJE4Gcay8BjEhEB4BjzzFLozS69oaCAx1jpaVhHZH0SsYipO0Qepm1VcU6h7jKagvKTem7KKet+sxXbQ5nzgeJY0PHPYOvjDcDLNQrdAQmlmlHGB0xFmoGzBOvSMl6k9ExQmyEwDgchzxDyFDaXcOkJY9Woprqzne5wwUWsjjUeADp4DFsQU40u1XDdRlv3COf8ALU+wEKIpSPNTdU/i/mMFoVwLhjiI92kZCkI1ZVH15jJYhn6WcxdG4wj6mqVJlWmJZPTBydDGOhF/XBp1qtEgVpYEAwOB1i/7VgpB+zO5lkcjYhshEu2cckYhZBpyg+JXV9kvfGNnapUnSGgRyIjqIjrmMPqhVEczjjtjIFE5SI9H14AYMCOpYchnzjBTZqscEBn0Du5wxaQbkjoqmwU31CfBF3CE9cNy2K6vmHkTdAQ+SPlrrCMcc6uM88x79TWMaBxituVKj+cVRHlkAzGe1aTkrSi7huXV97gIPaaunUEfqqwjiUB84udJMNZ/d8lw8OjFDffUfm4a8MBpCSoYr1+Y+UBoUt2K8fmXU7hN0g6C6jSTSk2REK/fr5RVpL9UuPuMwl+8B0+MWugTqzD8oRxFYaROjzzpw11h9ZSM43SovEkTZp/uHCw84zwmpqR5JVxq1DFYc0Q6XS6QDriJB2HZxNbMz9ZuFDa5WfBWZwLg9FPI68MhrrDLtrrE0nKRVKKAEv7j8rGcaiOvnDmtmgUZCipJT1rzGDJSaibKpYZEier1sZEcdgTRqyykdnVYLyBzLdHk1p+Dj84ltpUo2lm0q48V3j7hCH+UOLJbqY3XVJ6hQ4uoiUYoCrnkQl0hJF8iHZp59kZSuSNAgVT0ZtFTK6hmHGIkji4Sz0xwAbxuYcxAR+AwwZd9nzgyp6WcNFyymZDeiYTfJAcgAeIfshxqsj1UjxNHYxZRWSrXQj71cRomSGSQgQLBLk4PrcDgAx8Q46xMZKSjl2jlw3J0ZzEJ3+M9OoWa0n7Yokdw2Q5twnDnrvnp5/n6/mGOXTVnU2Fesh9XoRVONj+4dSJ5YiQOgHCbOIVMN+NJuGxMvdLpzFTRfA9FFlEfhmG3Var1ucq1TxEmpLYBxnCUZhDv0h30C3px1nUdJci2bVlIB3JKTEYRqKEtcRwABoABr5w2tNtWeOG0Pm1ZzdFruARBJo8ue43K9tImO2zdFruD8PxHRiyra7LD+sQyHvQe7OVEN1sQQOkkUPyfJ7NEvxKKxyN5DDrM9j2rtkoF96cLXKNfcVjrw/1h/wDRkcJJs6nW7STDcNI5lOoT6zFN9EBzHThsdM66u1D6HJiJFgXSVJ3Gaj0VyZsmfWgo5TSCt0gK70d0DIDnAaa6RXFxWu0hUY+lX/RkdlOdIFSGjp5ZUi1ohKeGkLnOlv7nUGj2k7Bo21A4FR5bJCow1fc9+P3GZ5FdAgCdqA/NYDxDujXq3q5vZ3eZF2F0q3lwZxReluLnIA720IGAx9HTUNfjGw2w9gdqhq3UIqF+GqaSWF7+e6nQj/s/1f8A5qjW08SzQttd99W9VlgwmobeXBBGESXXu+luQ8QD4xorR1MKvv1U/cl1ZOEw25+j/pBjZNme3bleJnkSeKVz8AmzsFozkW7lN254yiZLWwN+1E0sw6gIcY6qXs8N+tkScHWpneuq9x3SOVLZR2pGsxER/AqNU0VRFZKoI0wIZHJA8IiOQm7/ANsbvbGP1xmXrfdjuAd8a5pLSbpsRYPDkD6NXHUI66TI9FdZOdQUzptil3vPTmx+8WVpQSkJWQpLt1tYmijk1vphptpBMeFxrWULcN8gZ9l3Y/PzPftVAtHPp6UW/bPRnAGz4x3QXK26tSVLoZxop8oz76rl89KY0b54APq+HRsT2uLKOq5jdsEzziGrOZ1Kp5bKnkMPaCWUUjIhkfAB+AxxVbSFuKyrtXbQslMqbXJi94nNvAiAjKIb+o9IcB2CAj5RFUl5ti02ArMutUNl3+x+dRk+/Z+7qU2dg0zqKbhc5eDy/P8AIKVq34gPRMXiK+pg3y/VwiIFCIqAaDw0+3MRPfjjqkHJXLpJwRLk/wA2NFPk48ItQrZZNo/N6HMVGbTeQOjr5cIuDFLi6nHToVKKeVpGZsCamlz0e8RivJa6nc40RtpBbJI5vGkKfgFDTl7S17RMVbdaFO5IbJre/wCbyBvSp5TOHaXToDXEBwEogOsXsExQLnao7kZLAOpaXAhiMnfE64krdZCL1yxkS2SUpkkGQmwPIfxwhrDcxytXyYrGeOmmcRXMitW30TsHG0OXJFOI2Qgq10jsb87dx4whg8iitIR4uSBeWjKoBaXolipMcCRDOcZHTs4RfLEnKBd3gBcBAvnIiIcQjBbfNtAVXATKrpgaBXODE2B4a8ofYm1G21bjeob5gyaTQm6JM1jAiHbFnW1SbfSTKWfNkSJkUy7m+cWdZMbKvZZhdlDp6sjghDb2/wDOHVeClVMGa28HTBoQHAzZ1jCC9QRHPYOe+Kq9XEa1YO/hwzCNOHOePbr4RbiyvSnXoNCSMhV9OYDIiYfu1DsCbH1xN6xqkT6yI44c9OMQ1JUc1aQ655BwiUNnxTR37rg/um6RG7qaUfRAb7uiP1SdcSh2hLwdVINdHT/uiLGyi72027skVl8Cu+y5zRYAif1DxjCrvLCuqmCxmagZBJNj80HNfnCLzs7nnGXfiWmtYimHFNw0BRAE8g9fykN459Hyj5tC3EmLRPbqcfEPNH1lxMVH7M47Zd4aiIIIIrkYeBBFAKuRwGPgMV44orIrhAgggjsEK9HiHiP2R9ggh+RRqgjiBwQQnhRAbNYEAgggg4DghRCeFEFM1um5wgQQQQ7BBRBCeFEEa/4ggQQQQQECFEJ4UR1S6wQCFEJ4ILRWCCiCCCHAEBRBCeCCEPKPk1ctMQohRBBDgPoEEEEDggLBpyiGADHZrgIo/uko8/szFYvNRrVqGQzpD8FGKTPNYwohXK7yUL5xjhDW7l0UEtdU/MJHGQ1ZNE7jOUmQMPSrYmyIY59sLTA5APHHHPKFCmSpkj9WjQ4AIygMJa3EfEPshxQW5juBxUSWRzsXA+wR8o8Q8R+yPsFj7pXGmIIUQnhRBCHlCBFwi3wspfTD8cwjytcA4NK4D3R4h4j9kKYTUeIeI/ZBR4h4j9kcA4BTFSnzihS4+YRXp84QNJ1CpBBBH0U2UdSmyi4RWk+iEUYrSfRCPkPyPXT5KhVHqT6QR5j1J9IIHDwPdLj5hHuPFLj5hFaTiPhBA7J0xpgKsEEEIOQVSfSCK8vEPGKEn0givLxDxhA9HrHyLhFvhTR4B4D9sN4cUPKF8uchkMa8OMfQlEdQD64rx99VV7/hHdFYP2pqE0KKHP8AHZCeCCRxCuTiPhFWCCEDy0y0wCiCE8KI9R6h6CFEJ4IPDgLhBFKTiPhFWFSuNMQQKqYGKWOyOir/AAfJl1ig7U12BAA3IoktQmc5azDN98c6EdV/obW6LJ2B3I+BH3p/3FVaQd4SShIH1AEQbSA8xhaNxVeln/6Uo3r1f6BoPSBPzd0FV/d+PnHOM6Tvr61evj6XHlG4v0hzkAxW6v8Aq4RpRcpqbIhzDzgSyktnt06/fMCNFrSkXZB33fMYMW6q3YOndDNKVXI6cvhDnOqqPrdIa0+A5mHlrDPeDxFs0OYZ0vBZZ9LHGPnOPl+yLNWrfjjC45UyI/Hzj6XTah4R9VkO4OcY+uRKQm5Y7CJJnUEdS5hb6FOqZnCjS5DmbHEfxrGy70iO7ty+TJtYnTCbTrN2TbNsCkw6zZKpQa58ZgiKuyyyZXjtLWSaJwjOcJrFzEekpFgD5Ikt+kE4A/7gTxP9u2UVts/bfuU7qwzfk8LvswoLiwOgSlqA4lAPEAAfOCrFZyUJEOZVfcyOEkj+hqt8OhtVSPVcLeL7RviDe7GGwyN2KA3kvNNKgWRRx305VOHur5nAAaYkm7NYwjbG21FK8KhVYNuaQN2z6BNuKMnEwEOsJQ16Uw8g7vwL/wDpHdrNOMGKGzbZk+UJW/ZNAE5xG0QeiRVDFDpBu8umoSjLqPaOO3GnYvSmnrSzTS46XDviLS8uixdosIjceH4z9vf/AOoGlDFwkRwsTJ5ijZX6NC1qlcbaCbdUKBndSU4zZAOIj3+UKPSuX3pXm2sXMgoBuoZYljSv5ImJQEM0wpI0/qzYhjtnlqAOf/RhEw9gen/0d7IX/wBpk/XLboybdV5WYSHUTzhr6Sh5AAB5RoSPVTRyqZPGa0xkwYn96MTDmYc44/CHi/6qxSKcCgfOoiXKY3q74MojqVj4+iUWmCCPfQHtCKg2NevVUec3lHiCCCBFkQQPQzCIBLnQB05RderjYhQxSHJnhkM5i1CIjjIYxGXMxXkTHOgnz0ozF05RoVZ8cglmAfuGHeC5Oo6oi/obA+UpTU8nUFVKqyhKZ/lHQXeLY3bbH2brdpUshmS7MyZRPONwZEU06oGTSeByUyI66AOgj2Rp1fkhpsZTBoiVP1h6BvpCIgGcaRvr9Indo4htsG8j0MGjaDgmcCNGCKkrDgQfV3AL7tJnpJSnPLg7x4CGdQjd1uvJF5byDZ6mprVimyn7BCE76gsWD5Wm7eTb0obbVimOQ/YISnk+fziK1f156pVDgHENPx2QCn0qAgBirrnSHMciZSblWuSoYGXpY7R0hv5pZpxzNkfKKtnbKRi1te+6Z6fvcBBVztJZkqds44yfyFpqnOzI6ecW8PXVpsiGnHGMRczdEpQq4CtkM8ejkYtlQ3NqIcueIpO43dUXezyzng7BB6lTGo8+o749DVp5xRoiHiORhLBEK2vUYbOQpB9hSNatWHjAAZHEJoVUKNUR007YcWS7p67w3jhB32hP1WkrxuSqPSChQEAzrNqAgEZW4XtSeacRpmU6YVgJhE0pjMPyh/0eGYsDOa7oXklZTkhFNKJgz6jAySjMMuow87Os2fSgrV3C82i1xKlROGd+m34+I8ALYAOPDTMbbtZGSpEtolugYjLV7374k8clOOI8iDEhtjOXpd3c4/j/ADDBIAevXi9GeXICPbjPOHvfynbkm5JVPqsyqV5qOZi2+5TwHxAM+USgbmzM0jTNuHetHfIOsm0lYuRlAkhdXKB8yZ57mPDjEf6KZRWHbRSSSCXLGa5mrKBo2cERDiGOwMdsSyNgll47Z65TqnU3d3P8gmUTa0uyidnNq9YssTJnJn+QYinuNeWUWilN5GMp9MtNmqZpzCE4BnmPKJmKtlF1xqqCo7NbHusWTklhJ4XQVbhCUTwlX8D1ybLCA/o3IhjOug55ZiEuu13IagoJ4SiVoJswy4CbvwGmO+Hzs7tEXeZBg3RTnsu0Ep17iRdxklMM6gKeAhmUB7gHPl3wUiirkO4Y5jue9wcAdkZejIxmKCiiz0mTs6rJk/Z/nh1dYfpm+jq2gbqsNxXGpPy3IJTcOCRd52rWmU+oDH9rOFytfEdHWwFYCymyRsfNBLuDtBVzKnc9eB8HJWkGJZcBgAAO4ACIU23QLbodk3/bcvtelfZdW9euOQmh7pErtpZhUnVYGwLoteX3W3LTKECLwOEuCeXT/wCtUaKyjH5bgllYldzQjM5chj/6gDRtHstIWkNtBSp6bGfiOeqn4ijfK0u0Jc2slOCz993Q7GEKp7nvzS9n/Y9O/qqG9vLcG3DBSG21ldx2SSXmkpe4uQ2toHtiLf8A9lRPxybXViGPYIiXSDxr+ojaOdDKl1j3xzjPBRZ7jN3GX3cYUai+rqgnyirjft+ERxiYeegBF3WVa6K8ceWcjbNrfo0NJqicsusVnkTzdzfyZ8gcu1r3SLFNa6LOdJ6zd92HcsC5tZYtu3ccQFBPMlxHczaWc3PlkNA7I3Fej6vqp30VGEUSUIy4UJuMQ+xngOcqBEuPAVQeYDxAQ45jnLrs0hKziTqRawyj09znlAMDKOBGOvb0YaYzbabIzPfzHZ6WK8q25rKCybHj1jn3v6wH4Q634vWJtzdJrhLbugpa3rYJyqTXJkKRX1yDX1eZTr7F16ngYsDswFSqYqfPb6vW6s4BQyI/NXZ/fEILs292IbxKBy7bhMr1q309QPul8yW8OmlZMOqKgcEcGAMAOAERERxxzG07aVfF8CbIfyinUFNXKq6Cfa5puHUL2hlIacY57J2a4lhmqyuhmzB2shVgFwpgAJPcJciATDrrqA66cIcoGNo9aUfSB8rz6/avyYiY2Po5jZu3qS09DnK83z6sXlPtHsGM4mlF1RsO16mTIEp1c3IpDTllDHy8AGA4cQCMU22vR0tazlunI52yhOpoK9uHQFNxlHZUKinuBIWBACJtKHnwxjv7YszFtNe58ymZGw01kGzKb/fE9jwTJzBQaA65VD2N0LAHH5Q+EYftrbZaG1LKoezGwLmnbzLUyoXXLh3FnPnJm8QAsAASQULeNd1LcRmAMCOcAAaBCL/Xsu32q0pKpptUyFw4N/HzJ+X6hSummJ0axdnHXcx5WteohdVhnr6Hl/D4xq7S15nJtMzJXrqZaUB92Hcw6Uo98YEcKe0SlXr0VugACORMHcyAPZrxi4TXASzjcqkDTYCZbMnN86/34QqYzqGMRemFIhuNwpqV1WO8KQgAB25HGn2xTVJ63rwVRiUXKJ0z5MhCEOkcfntSq0qszgkVk9+vpk3z/eLEbaLkSx6RenvQyjmU0UzNLGUt1TdJ5xEJF6UznO5lZjoj4Y+uHuvJY9Kt48FNLSHelqCamD0JDqKeFQIH/wDRH9sMo6ZKqWuJlQurzKhCQcli0wiGADiAhyiTLwLuDkaanWEURUIQ6WchyCRSdsS1lPT1fkMRMihMxNbQ2f4/IH3WUyqBQa+dA0zzjDk2t6ivw54HujKzql68oIcwGMLKiPrxrB26RbAuS4lmlJdFdiJUMVlUHM1XYvi6ERJMNQrQOAkHpxkUV/15nogCYGNRDQcfthDWXRIJwy4ETZod83vGdcw3zcmm9RjOmsSpIWjaSnYRw3TM3RbJJ0pTmLopK1k2QcS6WHibDuDX4DDmikiqzM3MTpSFF0xsby/EouG5OAuf7hG6svqR4C6eYOGjRUoAgUKCOQJaw7LacI2wZqu7pOkWcrgKijN2YA6XQD+NMPd/dDKJFGqYOUaA8c8AGL++3IUOKR1ILUS5oqlhQIEzgBgRChpx79QjklTwRZwsfn4CBhWeJcnGqufnPwDXH0x7AirBFKTiPhGfOmQWwqPzqCQAyOO2FdIMB4BHmjwDwH7YrxyjUK08JHtfMCCCCHIeAggghBAhRCeCOyK2o56BBRBBBDwh4ogHBCiE8EdkVtQEFEEEEPgQIUQngj1HqCCiCCCDwgQoggggIEEEEEAgKZeIeMfIIIPpTCmA70phTAEEEEEoeUfJ+oKIUQnggNPygsKIIIIdAgpAZpRAQyAhF69qVMKIUBrDge/jFkEMcY9CbAMZzr3QM7wX5qHDkyeOmOerc5iCqbOVDlTXWYfj+OMfaHP8dkUQlEQyHl3x9ph0dOQhpBiCNG9cKdY+dcqsttC4WUeIeI/ZH2E8KI6g9GvPgCFEJ4UR2KXKPClyggggj6+C9vMChcI9SfSCPMEc8/PjgHgfKPEPEfshTCeFEcx6j1AggghA8KIIIIIBAVSfSCK0EEDg9HrF1o1u3j+MQUuPmEUaPEPEfsitS4+YQOJEj1CtJxHwirFKTiPhFWCAcj1ghRCeFEDgpHqCiFNHgHgP2wmhTR4B4D9sDh/Q8ovhCQuC8WnmDQKgTTeUbWNoB87M7j2fmcnMAiWJvkrMAKAiTNSnpgyGczDoMaj6RKfodOURCYB0DOIuNJQPmZAkGYRll+iAjpB7OQXZInb0ynzlFr2NpGWtGJlYmjMp9vLgKMEEEfKXWIAFVIekOe6K0W+FNEc8eONY+x2RW8wrwohPCiECgQQQQQHAEXiLPFwpfxfP74IHRkE/6lmOyDYkSPYn0aGz4k/rR1se1fh1wI/tjjeOBhMrd45jtPtX6kjsK7Mpcv7p/wBTZDw/NIrXSAh+qk0K90VBpf52Tavojn128FIK7q7I1Rujn5Rsg20q2XhXx+yNbK/9KDLb/wDplH28wlMBSiGjxCvo/kI+OSkPrcZyHGGxNgI5wGeEOOvVtcAEN+bq5HjgQiHXrql6H244yXO/7QPqBjtacZhGYAxL2jxjOme+DzZMVKpSgJvIaAID8mMJr4z8oR8ucPVZO91GzdZ8V6rCZz8F5tAy1wF6pwqYoAmejhSKa6GJcDgdeMZsj5daDufFw/2ZM/Erkz5P7sdoRerd+i4QWqjUvb835h5NhgscObQFR6FaM28MxkOBykxDQCRiRHPFygD5zhjwjam+jo+jv2LiqEnny4XsuxmerPJL05qdU6AzVJ8c+jLLNNjujHfQPbPZO5K9tCXDV5spTQa6WjzgOmKJo4Bg75dCnTjXz6TTaAnvptNPCkkTmPY1gKVdnNcvMOAlkkmEJhAO8ZceQ9sRdaXVYwJF3/jVs6vrnOcNbtVVw7RYUJ0ZC5jDXgePGVE1VNnKo1zFcRmnnmmzMIj2xlLJICeXiRfUMmOjkQ8P2RhXLviT2y40K7zu0xUChS6Uyu6CRPuDMw/jzhh0ZIqyd5oPn2/kNrTGDphSipKDbXtVUk+0OxLYG0qqcMoKbfN4V347jQgMyioJ6fMEso47pppRxzxiNGD2pIRdZUC7YrzV0WQyO6TTZyIctPjGzj0xz2KKu1KmWuRZBKolibZo9uZCwDgZDMpTejvxGaX4RqfoBNPWlkDA6jjlEjuS4uVXrmDQbF1hzFJre3/ZjqpIILxTdmk2KTJ2u384pUqI9Hx0xzGL0TTatfhw44hQTKZHXw8IfFltYDGMAAD8IsSw9Fib1LXvwoaNd3FIkYMPKGIU0iuSHM/PnwjGBkGUeA9w9GJSXUb9JLo0RDO8GR15eEYI22shqCapV1Q2JYyXLgJSXo56c2eEcL20NqrzmzsDlJu5t4OEnAuoqcVgq+MJ/qGUisXozmBxKA5Hs1GPFUBlmDPYH2xu99HdsoSthsS7WtzG6aNhKHSsi3wlGnOqG6PQEVsdRzJTmlxL39IeYAFBWva605OEj3B8iRPGm7hA0Ip1XNhTrFyejvcxXZ8tAWvE092vAktb2U6qWQmpn+pSBn5pVFMlN8reNZpQGbUQxkAziNdbkc6mZnGWQBEc4DtGJJXdeC693WuKRoyKoaVDWQwGREe6IrlLiM9rKp8uaS+vzMw7rKpDkCJPOnSCXn4+MfoDJTEJZ8G1YTrzUp8xMx/bnF7zyXucimcDRzqU+0ceqSQUBKGg9q8xabAiljxAR/jcOUMmsBOQMVyVWgJeQJuEwYEYcRZUmY4TFU5M9q4mxHQDSOYEZs9+vZFlV0omeKCXlcScpHi4gBeWWbPSDORDMVtdMwlcUcs3gXKJ1OyYipDnP6H5CoJxJFapKNiF1ZOE2chjn9f8A18W+LrVJm6/rsgIgV49oaxT6rEKW+V/8QM2OkA8+yMvyMRIrrYIE6Pvn3BHksMecJ/U156QGPUTCXEezUfOKtFHUK4Z9UICHLGYXdb0qFPokSYS68RHIBzi11jpw6IjXriAZxxhLI2myyUXWUcqZd4pNwmf+0OPvAXQSSUTERrmt6HsllxFagrUKGQIlAAQ07RGMY6c3YEXQuROTiIZx3DrDjDzzpd1qLaYlJ6hM5/+IcKvNTnGcFHevUChsvvpkC/MA1ARzzh17ZKyO4jRmV6rJssQLFh3XGZ5hEOAAENcmkkKROOSqJ+YJt4o/ILlOkM+gjnI45Q6jUrstDrVt4TxMgX4gdEch4gEaasmtzuHbXlV+U6dE94hz5xI7X1tZJFdZwSifpn3fnoJNJ11Hiz7cvO2TXOGJWvcGcvMsS/xT+4DkAx2RG5TOqwHq5lWOiVMBwCfQRh4/wAsvVjNcB9DZSCUA760iWmwM4ygOPjgBiJJxyzLFSubVytI4ZMzCcMVwNj8rI6hgB/GYns9dUTFK6jjUy5yl5xN70uRKuo2cxiZy5y9gn3DOCR+3VFxEqzlrKC2kb2AqhgkIkVCegGAHo5zrz1iSy5fq3JJxGSVkE8bessA3HdT5MF5RcJf/OmePgERIS0RmuLJWgpm0yvXnACxUSYngHhpnjE1Gzs022JWfcTqVHD657pqoRJkUWcoZLTHixj9ZLzaZxjgOuOWurLbjS4puSWo3SanZELnOch+r4uvEfdk2tdt3VWWgW7fIQuY5jm6vi68cfKNhmw6+djZYT1VGdjvQm49DaBXPnDdyF3q5vKJj+ixtt2G231Vbfagvw/7tsO7DDuEaIezhNjH/m5n9XlP6FHI/RsgROGidAoYEgJnQyJyboy8ePhHRL6Ji0yw7dn3astLa7pOF1VyRCc0lL6gVIs0mYPiMhSYqIjnOZBz3hDVIWlIskjzjlYpFMpt/OOalgXRC1k7qkGfZ7+b6hf3Ttd7DrwTa6O92CrPX2ic/sokLDUHDzaAD/Km5xDW+9rHTbR9KlpKFdVNIgTb40Ty0S6umX08xrLNjvwIeUOLabY/9I1Yq3Sg2EjZZRJLmuy6tAkrXIdDoSVIU8j0foiAzaAI888NccoyX0jszlL7Xa63CpbeTDCbSQhzmEQMSj0SYGzQiP8AvzfCLTsaSd1lk4lusY8eQxMpPb2xwGpv0bdIFzv5t9bj5wotFEaEIUvb3z+3N5xF9BT6sqSoMNcOmaZYoaE6BLdOlkzwyPZxjon9FfcpxnrfrFilpnmUhrN5sioNxyhoC9vIjmOdZrlDEyoZPrgzjvRrJkzxE2Oc/bkY37bG20OvLN27CW2ItsqUbAW7VyUyvNyEMfsCLAumI11mnNTfyVL9Q3VecOi90eHX2DnIoUnp6nHmEnLzm7hWeoXAczYSxcBXdT54fakRlb3xCNJjypNewezo7ttHaIYyq4TTsfBhsWutvOS6hZq6YViUx0qrmgAMhKABOOA5S8xjpW2l2qcPUVVP9QHVZuOfL06pSiX9HfYItQMFVUCl4KJDfSP6PIeoR5gx58POKsJdTtvb1EY/LrV0zm/coMwT+kaXsrR5KuYjrWRMqTOOei7W3hcC+dSaW6brXV9GlmHqpvk5xQW6h9IQ3rdiVH5Idgdsa/VlbTzh2uYLpdEvLnXoiP3jC1MR51VRokZaA+vMD4yhFyezHMNA3ToK5BRRK5gv0y5Y5KOdR45HA4GM03pL3lNR/Ljg7c9Ed0xjF/7x+ctxXTdt6MdvnamVSIbjy+f4/b4hggAnzzYDeC04hz1zF3JiJGYK1EwJmUB7MYhKnHNyqiBcvQNCY0HI8Is/Qq1640y1IQmEc4Dj8YrJnJJQaTaWb5Tuc3wWcn/xKCHddRmK6715W3WgeDQqGJQDv1hKkHa9ev8AKARENMCMIKSiopdcKJqkPuw6lTsvDy0jI05SbtatVE8U3YcZ+SGOjE3tWeWeThHD+YMRTNvJONz7R9r618ttCx+k7xhIgnXmUilINc8B074CVGtQqiMV2TV3xKxSHGB1ANIyQ0FShzEB4Y5Rsdktr0U6jR0bHbbGtpfP2Rn7BqIVFQJ0l+saBMCYAN7ngDw0B7M6R8cpxOlNm6KfMZ6tEzkqHHwzDPpcp4zXChIOMjjIfJxzhzFNkK6WBMVDQTRbIeEOPS8n4fBENxCx4edkZSD2Bgw4O0JVbKloj1znSdXfU5SmkORHOgmOWn44xAdPCvQrKQ1wHeRM1977xzr9eY6Idh1oI1s7Bt1RVyIiuXCNe1BrpDkQANAz4AARobc4Ejz0fddGz1EL5VhSteNDfJsfUIRCoed5alXaFfgRT6NxK3ReK7enwO6UQTDQQHsi4Rb4VUhzj/Riq41TBcZprStOsJY9SfSCPMKaPAPAftgMlMxqUHgrwQQRJQgQQQQggQQQohIeUIEEEESBLxIHBBBBCCCiCCCHxFboeYIEEEEdUeoIEe5OI+EeII8CHuTiPhFWCCHClMKYBAggghBBRHqT6QR5j1J9IIIBpTZqitBBBB6PWPsVpPohCqE8EdiV5sB3pTCmAUQQngjptlB6FEEEEO4QIUQnhRCBAIrSfRCKMKISVMaUBCVMaUBCiE8EEAgLfWj3/wDFHuE8KIHDgFEVKfOE0nEfCFlHiHiP2R3rTMUHoVxwqKFDn+OyFEJ4URwCR6xVpcfMI9wQQg4hRBBBBAcAqk+kEVoIoyfSCBwfTmwoLrR4h4j9kVqXHzCKNHiHiP2QpgcSJHqCel/F8/vggpfxfP74UQSj4keBXJxHwirFH+P/AL33wfx/9774GDwF8vEPGPkEEIO9KYUwBC+jxDxH7IQQvo8Q8R+yECEOuo+wohPCiCA5I9QIy1nLwNV0t9wGUtNcBZBU6J8UdZHKcfwOejMHZpx7gjEoIESV1HPQdq0xDi3Hd9F/vtxO8s3ENlFnCqVjwNxCAZUFOEdcS/GMPpcfMIt1PnCyO6nXiDmVcKVqKtL6XmEXIKIjyH4hCIvqMv45xsfcFydlUzsYNNgJDGNhtElV3fll4CHRDHMc94coKM4y561EiiI2junONc0KITwojkj1Dij1BPX/AEdW/wBEI7KrSnN+2D9l4yX0/wCqVI/+pI415pRrFMDzjru2X1YVP0c+zbWo1sTErdUE8QzwxxiCaR/9h/Rp+ApPTJWlWbbD26hz9bX/APDw74Rr7cXEfD9kTr2tK3/WEex+OyIKrsPEb/sJr6osplTGx29PREe1/n5/dDZHOPl+yHOclLA58eIw2x39v3xCbvR6M9aDHFxe/wAwxWsEwducQmlDI48xi71qIzzd/wBkJaxI3QrU6NcoYAQ4S4EBHPZGSrjjlW6uvyGOnmDajXnHWv6PZbTtj30It9r/AKhST5ly77xVjSJLUm6U0u7inoJQADkAzDMOA7Y5IVg2J5ROGf5w6B2x01elKXzGzxsJ7JeySRPjMbLW5SqjmmHUZhwMwj9UcwYiI1Zh7dRiH3RVFlHbA3+GV3v7omQJvRBwtyoh2ylFPOQAOzhG3b0RtvaLx2qWcrn6PzWxyph7rH+rF/741GlJQ9aAaaiMbx9jJN/IzsR7a20eYyTVBYYWaZ5wA13lwYCJJotjdfHyUq48UmnkBvVQ9a93+IapNou6Na9F+btXWr1Zq0z+uEruueoPGakeO1akv/lnlCGlpUuljGggHwi0iHEc51x3xkKcGniEMFn0Um7iNt/jFjZjD5dqVVodeozduE/XVpgCJaWYblZcXm+j0KWqsp0CIf5Q5DP3xGJq0fWmKQYxy01xE5dnClu9zrd+u0As8SBwfjn7gje1oIJMY9BDILZ0TM6bZSV7mb8Aq26bb/k3vbcZjlg92b5mgHDtAf2xrDOeurGptByI4DPON+HpbWYbStse5dUC5gEN7NpuOtuCIcSsyRIAB5dEfjGj46h1qB2uXEPo/EQzFe31ELXTEtNnObi3hFrzQeOEmM7WmfXJ7xvTD37KmzIc2mL32cs+RVxKmrkPHqFTmkl6ZxEI0MGTZqbOmOgFQQ04hHXHtgWq3Ftodn7XkeqUEo1yDVbhMj83pzfRY5/vQpEC9fbYqqpmkJqRq2pV10tJ/lydXlQH4VR+MbZPTJbQjnZ1hS7Xt3QUxUrmKZhrPt3EyIyghJ5YBE4kCPLI4yOQ0zrFPsdkgzl5KbalTMfN2zn2cQikis3fsasePjN9Ac5u0jclsp60fYlqlXrlFS5dxX3hLNmR1mflgcFNEByCcIyfJlHjxHTGYXD0xEAEdZhEcCOA74vSaiH15SLpKOTMqCkarhKVKFQGaace4PhEn03Z6pNIoKhcmvuit08CzSofOZH/AFnP0dPOIQrEaQ9MlxHcZOjJ2vgUSCa6qcvORO4wz49rsEp7fOIwIzdVl8yBdNJmDNcecoDNMPgEODUZaO35fnRWAwogON1JAM4h4zRljjWq0uUtPLilp3Sz1UT+iA/ePjDb1DFU0NOjkRERzqEWVEaKLZtLCksTaXnpcH0E/wAwwvF2rGp26G+p3vIPSmXoqhOseIUd2MFv0kWyIS8cZxFjBzKwIFJtzV5pk8De+iW5BNwzGdlG+4EUZVWsXEsniOA3qXMsw+EWdzJjfSpqZ1CMCpEDID0gnAZahMchoPfDVesDIVWPK1W2ZTVmIv6ZP2hEwEVF0ilr6ky/YG/oEzBib9woDju1AIVATKUB94rZHjoAjFKobrGZglAcZ59vdGQOtkOhnzplJzIyikTK6ZRXEwDsgygdLV89EzL2hNjx0inEko5FFZ9FNDOcnEofgJ/dkHzq1MecWWmoUi4ju9AAz2jn8f3x5CvWO1gExW557QhF6jhkRDMZc1SiedVydAzkC4zdGYc6hxGHi3OW7hlm8S4WyJnUJu8BP+GQc6p4U5qBWeyXTiZfUuBn3sM64DlGTkXTVqoUiFKSlHBkJ96ERyEVn0aaXXgl0eiZMky9DHytPjC5nqRMucoh1IVNhy7/ACjSkMyV90yzBg8LqiZEjZPQB6SOxyOw7SXn3M3GLsUJHK9tlST6O8mqEmvLUYtA2tBFpFjziU6BWU1kcFMTDx+HZGdu4opVWkggVKbsVEwJsC387UNfP74woUlEClSqrS8HHIlics3Tk7u6JHcduNHEii/fttcoimQhTHPkIJO7ZtW65GK6OfIiTIY58hOffD0WUaEiurTJTaKJ9dUmm0UzSwCfJN2f48QCJWJcyEdt+t1XEtOKs8CpmUq1m+SRpRQ5pRHJwyaNiP1AGe3SGBtZTb1dPcSkgmEwqCCW3ybrpQ3FSUg7CpTmMOkmuU282k41KmrJxYgheoAyUNzgSPn8jgBllDjr3xbNuJR7JoRu3SyZymykJwZPs6vnGq9Fy0HF2ki320usOVXcJwH+7q+PEYKRSXu73AnJTnUiyWWOGaIGVWbWWQB5iPPH2xv99AYyne17l7U59rvsrIErbSSAzcqv7pOPS+sA/wB2NECejOh1m69FASVFSmzpKRpjMI9+gR0BeiishddF2dL8GazqK28MPd0JBEHIEu/OFPLl+OA5BkR0hjnYxBxCnx1h+I5VT/UOcvDookpLdMdUmc+vOevyDZzfK9jwtI1Vx8Fr4M03dveso7P6/wD4QRrEuQ6UjaBRHTfBBUmukqq+WLta6rhqSivuEe5LDj/zieyr6JWwV2EFJWEa7VzVdUSkICPtJOtS1A+AgMQq2wreJmxayaFhrRJZkGu8ZqJ94LLpwtn3BNQARDlgAz2Q5WK0t1gjqIrNtneONA6P7Xj6LRzi3MxF+PNrc41OV2Xb8FIsnlrkypaiYnDJlYRzPUYY7TWREA7+jiNx/oxBUBeJ/rabfTFvzZEW2T6G+p/zwIlDhoqcDThrp2xpBPuxMUTgUlRtJ9elLp8jIfCYNY3Lejtu3Z2i9rZ2sYjcdwLx8wYUHI5FtellAhp+bJYBw8wDnxixphfXRy6KWrJTLwk9vtp9QuRV4iuxlULcOiShy8JdZ9WrU++n1DbV6SC6dYuTZ1oFh/pdkWZcJL/fJccP4Q8/mpKjRd6Uu1Ss5PRk2Pr2feE1zmXZ92UzT5WJDwTTdMzTmCmOOwJ5pc/gI2ielMXtndMWrcv26ya53o+0IrXkt0kIigKcl+vyA/KxyAQAfLhHPwlXAdMzXcKLQesxZAVl4Vo6xFY/0m/OOoh7kOnZwxoEVlb1ktJyzCN9dqNcUxc/t5RRNdGil+2ipH7SXpinIOftpnFFDXSB8qXnqGS04DKIhNKHHTjEjtpNVu9cSmhud6l5zSagp8qIWUxl/cx6OcZHnxGNtrJdOzeXrHSNz9nVnPYQLV9zOoh4U2YB4508IR3k2ZNm/aOspcVzWSbbmtBda1qYZfy00DrnBysA+jF+j0gJnJgCYJgyHHGsVtJ6IVoqx3dqbSZ1n3yEIbJnyfLjiM+uP0fr+t2zpqKYPKuWR8h8qRshDnJ30649X4DnlLJCwYmyXoGJvDT7IyJMKOHeqWS49IR0i/N22zneKlSIIW616hibogYE6XIkg8REQAIxZXRFRBUjSWdEZTJav6scDnIh+AjOMbBu7QyP6MnZE83FrSZD/wDpVGPdUpVEr1YhtX3vagzisx04wRA8ZcJYusV5h3glNoMuR7Q8AhCiss2qTVS9AN6MgYwIgcARHyjGkdnuRwz1aCQQNG/UBrLLkRCE5OkbTq4z1jAlsDgcaxKY1eNcSCT59bZkUz8Suf8A76DxWqNKIuFUjav+P7BPl2WKr2MOoZYVwq4AVUvfTJwiPyadfXQPjDdr9aqYp6admgBDfpr8WFytRoqympKgFqHRDI9IZefOMiqGK1YQHGeyNSwyzTk5Gkf4sXPATsevb3JMfQ2rFZt0xCbpDx7wiX1g7fqF7bnN5qHRNCklsHXMd/q9Pl5h9cRrQU719XSjnPHyjddsjWaR2s0DCQoqpYq6XaP75dyHIiW/qoe+Fck77noQ7728gflpZayrUM/Dz34vKm2rtu43wXAtkoV9lmGjneX9D+yOeNIo1gpUa5jh8AiWe2Q5Lsqt5TzJuelzN5NZHuDZbkuQT5SGvRMh251+ERfCkIDnA/EICsmH5Mjy0+EOG6w7cRi2hFxCePusw9ox8hTR5eH3xTSKNVlaFoMz482A+0gxoPZFaCCH9FHUIjwEEEEdggQQQQggQQQQggogggh4S8SBwQQQQQECFEEEODMIEEEEOAQIIIIQQUQQQQ4BAggghAgEKpPpBCWFUn0gjql1jolxitBFGT6QR5gsfdK40xCiCCCO+uqPRWk+iEeoII7ErzYDvSmFMAQohPCiOjPqHoIUQnhRDuCAQQQQgQCFEJ4UR6j1BBRH0BEOAwmhQFMZc4Ade0Qjnrag9GvPgFcnEfCKseBAaVQaPZHuPsO6Hm9uoFDn+OyFEJ4UQh6j1hRBCeKtLj5hCBIVwQQQg6J+UXCCLeAiA5CFNMciAwgYisK8epPpBHmPUn0ghA1LrF2j7LMMo/aEU6XHzCPcN4lKSuPWCFFDn+OyE8KIQ7pdYURVpcfMIpRVpcfMIIDkj1j3BBBCBIuEVP8AxP8A5opwQg4BRBF1poyv1P1/1Wpghb1uIq4EBBO3jGd3E3w4d/lFqgalcaYg+lcaYi4QohPBDiHkXKmRMS4EQEM8B8I+75WlAOORHUOEPU5LhNdUYDdaZRmpSWtpBmvUPO6TIn10BHQB8NIZKsco8/CDab3p7od5BFpF08Ccgih6kO74jHyLhDel1gXU7QKMunS/0cR1Nej6WetvRrMOb128+z7rc6J0f5uRHSOWuOk70TlQFPYXuKjevx1TcNUm+MoDn64il9stohFkPRP+Aq/SyjrrZo39vINaF2UazagcvioXHcK+lP0kUoTWsRyAZTl8wHMY1nuUlV3T19aiIyiIcsBGwvbMTayU/D3HTsCIZu26DpU7cJVsDJ0v7HoC7Xc5EnKT6IymTIYER8c8O+HGO1S8Gjh3RO49Zo9sdFx30xEVfo8Q/HxhsjnHy/ZDqL1Lj3/GGxPBj4DDRPI11POMg3ej4UfEYjJUEoalqS/SlmCYO3IRL+2yob2l9o/Z0txWQ5CxJWuMjNY2SIyiA1KBk6RkN6f6PTHzCIgG5BmqzYAc8o2X+icacp7afUblqU27pFiLaL9zzBweMgyE5U0qHhmv9sZOk5d1F15I3tiWWIdUvfIjvhsj5yVi492yYnrqzloY5O/qt+gk96c291srg3NaDLbNc2adjGCvKoCA/NxEuZ1lkDvEQ4d2Y5/5JgCaXwx9eYei/j9P3Nuw8nwoVxMGHEuV1CaYeGBHAfthlpAAcgMZ9ulTUyx2PkS3BzbI7IiVvTsjJm0VE4rkqIYAciGeeojG+DbK6Vj/AEWWztamQ5OWUb2P+o+lcnJoJ4gnyTBSmEQ5BOMkaVLRIZxdeiInFqIiZNqtEnLLjgIzB9wRtO9NU9qFW/Fr7HpFWkKFYqz6cgiTkHFMkqquTqjKPeA+qHyi04z9VaKlHH+8mN/2DqbxZK+kb7qDTIACI4x/dGaNpHNqxukQJUhmMmPkyhzGMSoUZhEcDqMZ8gGzaUaomaFUQM54hxDuhz0TwO0SJF1yG1YDNqdaSjjxfaDkJqYaJKYF69EZTBUcCAhqETKsrSOC9mYWLZ3kyuFwDt4jEQGhXqHlEPX1cD2jz/H3xOq3BMoiO5gqNA4WN4VAOGyvAJcBoA/jlG6Y5HoUce6NKaII6q8Q+fsBvL9LRaVCeGzfZa9Bih8+pKAQQt8Acd0cur4bE9WnX9VSEeXGOqj0kKkpV9i21Zcv+a70XjUrdu3eyqmbLbAc7Vf6ov7QS+qgLwaWcJyYXDPHsiH2W0K8tP8AWHdL/B9g9sa1Ubo0earyiOvolHHOyNtVvkTFfdJH+2T7VzjgM+4KgfVRjaztZspyuJfcVBXXDTdZxM1vyuJ1Qw3gTu3P61GsvYt2NrgXAfrZ2g11WU7a2ztytl3OlucCQivOw+jzSTgTSA5zZkABHhjt4g+u23tLKV5HZVbyf0SjNb44JlCY/J8xiBw1rLIXMog33EyKHOX1DiqrHtyRXutGqG5RHiMI2Ol+2zYVKdGsUzizVJy6GneoEip94nw7AHkEQ2cS3MaHEtaaYfDMZT84uo3WLp9Dnw7IzFYtebYiWWVjaOcXTxwuB0odJkhqN+WXOuuMjFnYNW/gLdPI2FjyaSysbsEBuMidsRwJtk2rU5jq1V6tRwm6IGzg5ll+HEYxVfmbidPQoN1QEQm/OjJsmEv7YvDpML5uqIq1I1kdB01ht6xM4P8A2JgNePRHP2RSd7SKyCR26G+4/an4xRkgq0QrsLFv9I+Of+Q8VCvWgDWPLss4jwGYBmGPhOuUIVtyE8NdOMCG8gEvRHyjJk6smFGYrJU7eAyunDVGoVWBHO40A1EA8R+2G+JptauI5AQ14cRCKHeIu4x2wXYMCnerFzmNnW/cPnDerhXmqcXxVTuqzYzFhEyWzkqblDQewYUKa+pLnqOszc5kS1HoyiI5HHZmHLaE9vSxTcHK4K5igbTxyWKJFc0cImOQAA4l07QHEYUot1JoVq1YosABcR5a58ol61tvKtDuLaWTO2WymcIFVJ0Jwao0USSouisXf7Obn+fnGEU6BgaXr5QEQl54xDjNFBUq9Ewv4GUqUL53oR+SH3whKuNJREc2RJkd6UDmm9m9QkDngMxZqyyoFksCNasYCUxNndcDjQdBxDbDVgrQd7e+cmWVRRznKTgIt8H0g4oVbUVTWGY0ijLT/W1lRSMKVfOm5DoPbkRjLUK5BMlX3dBRyxfwERH4jEfShQwcrUi1CnNNXzgdcCMOKjt5aLuCgl+o94Gboa6RK9H18zkk8RpEsE0GWsIQxikzn3/6wODKRkGCxHEUXIp1UMUn4hwLyLqvWpNpNUawiHVu+Y5h68c4+qGcpgGJcDkc6hjhDxPhOrOh7VU9Wr0EuglUAJCZOCIBpw84cFltq1NAqtUFNSmESxTJE0MogImImsjbcjN3o/fOFk2zbhSMqbuB/WhJC7rgclbuSnrmy51TZMcuAahAUlg8MtagREAAf+cScbKlQbqJXnTSykpBkBNGSZXdCAeP9+IjFUVl2icqARnolBmEMjLIHyfD4w7dSmvIrVJHiT6MGDBzQ0gyjPmn3iGcDFnREmqxzoOKKHUTLvqmyEEh0fTLuLqtIMaHOoQvFubnqYiZrSdz6aVvFVX9ozTZRVeUCIFS1QZDy9Q7gAdQ4cRje16KdgXVulsC7TSUwFQy3FVWeJ6UmrnAwGiQAe6+OAjmAYO0Re5LUqQJKubUxKh7wUPEQUJePPTMdevoo9sp2XM2Vr7NAzWbH5WWSlZlOIif1g4SBZQK7oTx26gMcbjuiVXj8aZqkJub/wA3tzeUXO30xSs03ZoN6qbOQpieUSntLtCOOzuz2zmfcmgaFeSUHqN4OQf6xjS/t6bRhW8b8qmUaQZibVTeo5VcOKl2/wDOMPobZW0C1rgoltrsWw9qi3XpAkrtx1N4UB4qO7KmcZ45zpwxnniMX2g05yW1UbnWgXG+iGZku4lc6XcgkcL2ojgsE2c4EBDICHEBi5rWiY1i8cvW/XlP7e3xDe+jmPhENsXo5NyiRMxOAQSIpwCqAsm0QVlNKmcGx9YOB842l+jW9W4r5NRIQkqfpFF4XTMJQ9gU8uW4/dEL2skP9nG3BbQ4r0miUeKYAKUp4oMlM9KX96llzjIcImF6NP1FvdsFupBmYubMHd6Q5Jh+iE03Z8PqhyLtbeKfr5ONNUh8/YPk+v6w9RsG8txNRwshkzFVIrnKQuQ+Tq8/1/MJ6+l5QqNZy2qHBoTQFT5LA8BxGjVYbShXV6BKWl0t6GsBSUJd97dA+HGOjf0raObMNZDcAkd6Aoq4GbGcRrEaNFJs1ZxY2ojjYC49wTqwFudn+3vVguNPW1iYQAThskGo9EMjgNfjDRB1Rb2CjLOOwH2Pkrei9FfK88fJkMIZuXZQuRbNAqvG6iiz7Mo5vRJKPt3Jaa4VHvKlOlkfqiL7v2mrV2jtFdJl2eWFl+v65SFTZq84TrZAggISQBxPNzAVlrCM4DNNTCXpCAAGnAMRr62ib43hvbcZXdl4nMqrzvnH1dUD080vVAAIjuxcOAAHZ9cRvqqKhr+7zDnmGgy9sZTvTTc0ZIuWLdmZNQ9DF1peP5uqlB+XF6/pN3FKorRVtsytabxdbv58K83Nz0pSv4C5EaykmlN+LGxLTCOAxnpRlyZc5dJJZ5KryF1KVSEOkaNzZnDA8hHnGEk12rQD1BiiBoOGJh1j7XAhXENy6ZXIa5yIjFFx07IINEV7TlTEyJ5DJH//AH6IZdSdumeNUT5BkBRQRDU/vBg0nTcRGUc5i5k2ZVPD69Hrl1KXOssojGFm0dQSvzqgIdmoRJXZ0tW5rpLpog1CU0x8sXE50QmEBxLxx8YsiykZa77nTgrljS7b6hyH/IOtuQK1wy7aBYomOosbscYxRvNVZRzFKZXJGiwGQ4joIhD0IqaTMDgaXRMZ464i3TvGehXAuuAJkSpnEwCOdfGHcbLaNPamBZiKRYsuGzOCaOdm6Myh4DgQjS8bGpRTLBubOmT+QvG0Ii3oyh6MVddk3zENx/kEiM40K3x4iqLZEFbsJZ6IlB7++N4WzecTXS20pwN9V62QjZswHXA/N6ioGY59nO03U01k6334gqbXXZfztJWpBknl8Q/ZD/7I20esbNT7pzKNIyrW6dFaUk+m2OAGeXOAMlh7QDHw8IZbug/dE0o3ruU7IjV9Vd3c02ChMiXZ9D+0G7b0g2ziTvPs3q9wE+gA3FsQTF0FDeRBQUU0f0yVHwEAHyCOeOipUq6bQrUB+I8I7NGH1a6mrQMI6qluJm3Ca/uawR+cE5wFt0jjMTU7c6RhP/ohiuR1/wAk1DToyWd1aLILgbRC8kPCWNBCGXiHjC+EEvEPGF8QqL7fyChBQo8A8B+2K8UKPAPAftivHZj4ont5KBAggggwIEEEEIIEEEEIIEKITwoghDx5PkCBBBBDgl4kDghRCeCDUVvOEFEEEEOaXiQgQohPBBKPUEFEEEEHhChR4B4D9sV4oUeAeA/bFeB0vEhAgggggEAhVJ9IISwqk+kEdUusfZOsVoIITwWOoUQohPBBvjwgohRCWf6IwqjxHxvzAgEEEEOgQUQR9l4h4x8ggOAIIIIQQpThqA58A7IqxVrFh8oT0uPmEMbxVaiwVEaU5qC5EhEawhy/vi81qFfvHnpxiggkvXVgDH34h5aLbo+q/AQYssigiLJs+0JC4Wh8AyQ0McQAPERiuAiA5CLxWo/gYsM4a+MGoreSoYXjOrHrF2j3LNjQeH2QkhRH2DElaVoCFEJ4IQJCiK9HiHiP2RQgggEC/wBFOEMfVANAQEQwOneEZAJmmFIQwGmv98Y/XN4HH98NvTV84m7tpGs0qUpUUIW+un7vhCKLhH0BUusEEEEDhzCuTiPhFWKUnEfCKsEA8vVQKII+y8Q8Y+Qg4UrjTEKIr0eIeI/ZFCFEIEjKPa10+yvsR14qeyBpU679nRO/Non8dHehl7fx3xj8JvUj3/EIUwPSmvqHBCmA+UpByIjpiLxRmxkO0Y8TFwAMgHDvinDgHlBKrLnqCCCCBx3CiPcnEfCPEKIQcMOfEXYmRnOmaNABEREcB3R0Keh1WBCw+1cyMYMpS4nroaZ7s/EBjnWonR9aIZ0jeB6FpTEw69pFseuxvjBST4f8c0Ml3o7bCuG+TpDlOQQTSlWPWsJ5T0RGXbjSDft7WMjqGeQxrbWpceH/ACjo92/Nj9X/ACJqt+OvEvdSn8j/AMoxzmLFER0447YDtWRaPrfJs/YDlYkktK2aRByXpCBhl6jW/uhrDoCGc9oBDzL1HTnDSrAZEY5SaNdTzjOt9s6oOjjEBo1fUiYDXs7BjbrsPUBtTsF7al8xDBt5UCtqW525mAag585xDyjUMbNVOrauRHUeHnG6K/ZilYz0U2zZaAyMwr14zQXSNdIciBU8aBUlDPcAAHlGbbuoivLs0K9tuc/7wrdDU/MNOt4bV3CtG7azYuc2DjWcwlaKxMnHjhY5OBevrJOPqBGXUeQDyHTgMM9kREBEe7PZGUOZzOR2KVZYcq0pLqlMPRE4sn5j52bxmmERjHvGMpS6yT2VVcN82rObtByp1DYB6N+34v8A2ubKoxiiIlQeJc6bAR0AC45ht9ue6096drG/dxANCeJr1xlEul1xD9SJVNzKAHcNOlTGJq+jLrzW1l2hNoAzQoTF7T7PjjOIvS1mFQryyhKAB4AARp5nnq1as1UeATYzzGLmvv8AVdpRVt9/fMPKYJJ0w6+sLqXHzCMvTf4sYaU/xvhGZJv8WJhokrtCuIb1a4q4h4WIEoV6YajgdImbaCjWPPtplywfy5QyA+cRatFVbVFyN8w76KkbbAKeXGURpuioiXAQzjln9kT92dbjJNqL9JT/AGihyq7ZJqR7qpIdA5+bx1ABHt/ZGv43maEXGpdE1Vfc+ZshlxG9TbfQTirsEtwyFE2bNFFSgRGNS+w1slU9q6+NdJc9AyTtTb0AW7jTAGJjvRxhLlHtHHHxjdtf1HO3G2Cepy/uho2vEO6HC9FTYFSt/scvFYWCPz693kfPHDn8oh1P81RTTO43ULZrhux6SRykN/gELgroUt/R2+bsfGceX6AavaETEdDavV6OlezzXSUvcUdHQv3vinp0c0O0ARSWSpnVh7ViqQbVpwOJDIJjhfOFx0A2bHgHP4R0M+lG2oLebIrXIN5JnKOnaAdZTpN1o6Cns4A4qqoGQyPYGde7jHHW8lt1PtxLDzeaycX11WNb6eVzs3SGpMI8R+wAjha68uyjzvmBCnbn/cIK8ti5ZG3UnKzYhTuVgrF5SOlX3dWPTNtrTTdOZMJZnCXwDmPeMY0r3HdaQfrFkF1rYp0k3u2aohkOWQzDdm6NaiI4yA8hzwixBTrVauMZHPyhH7ooW/LtlkM7bUqEcnNn1uc+f/QNpJp84S3lN/NxYh51RxuAw1qKsYdW8Gt43PqkS2ZgDjnPCLErXJWlRvJCBUoli8qWNcRNSFg9YbCuIZzp2BpFyRrSrR6nOdW6tFuJ2c5OAMoj3Shx5Q4TaYtA/WNlWYmkzZgqmVjZ1SV+iACEunu0tXTPjrxh+jY7Spc+r1CyzBudMhN9VQ5z+mmnjj9wfCx9wPKYUIbFYuXLxnP81ecMgXSXcv05q1OgbrJ0k3RGvjdCQD46BCOsmoqXPLvChKpY40SYCGfGYeEXVzqqupCAnD0xiiHCbpZDsjBq3qc5pdIdNelxGKzulm1t50du4IZy5/auDfwJiLUUTNToPb2+cXoocEaoUqE0qXrqZ6QiIc4+Aboka1GuR6XSAfznGBzzi00SpkxNmlSmn8gzF3BHEpQCqeNbqIzaFpQEZx17Ibo13cL5LXtm3Bva826Qn/STHOtKUp1iiaPGDJiru4TCAjy1mgJoKmoz/uJebpceyM6ZjybrSWAUVFnknWQzgCKuar0qYh4y4+yKrgUFxwUKy4XLiSRt63MuVKAMpCQeISgH44xJ423YObqd9IPlHqpN4yDf/MOOtap0bUNm3x5baKgJRmicX1KUfldLdiYZqB3Z+ESATXaWOmifUSeJVOAx7wZNjkAz2jy8oYC2qYkqDiIJ6/WnLp5mcANDLkcBywHjEpTya0GokuivQqGTJeUrhINzS458wjSWixmijbyK7BJNs37ZeI/01Dix7ERluT3Mq3OmRuTjN29zA/1CNZ1TF7vc7XPqW60TZqsI1Ds2gceX44RI+1dtGe4kNW63Vd3UShcJisk3CfA8B+uIQhU6NX18ojpqEOU2iC+vzjulWpLQEejMY1ABiNaOLuqtLLbejtLhQxjeuQ4Y7RnGjGb219FFeqHzbvx1+sVDR2onnK5WSUZ8DwDXEOWw0dKLGSy8/CImm9LNmdLlP9XHz8vMCvh8IuTcaaQXo1TCUXFbVy4DMYEZeknkgDTPf48IwhwKhyqerVfWe8dLpdLOBEYshGOkavNucHLtHZJ7dfyAhKOrb7QktK76fYLxEDuoSVVM1awpJmZBbRszRAekI6dmvxjr59HfZDZr2KrZ3NdRu4BU4hPYonnAWDoAeUDpgOAAAaB5RxoMhoPN7mKRRPpDRTZR6RpVPBuKAQo/0k0b4AAa8Y7CfRU2TQSOxaYeF0C5p7MN7Kpg8kBuHDd/mqFN4OEjuHCPqGOJ9b6zOcSZot2uTe4j8H/xpieqOpPG7jroOhnqtubm2vNqn8MCPzc3U/3uNV3pMq9rW1tMOlDT0FboXEXU1PXT7hKr3WMk2QHcwEO8AHhrpEcNsjaUudfask2Zty3Vtj23bo7g27cNciaIifL8sycRDyxCDa+Unc8rpsC4qSRMqhVKs42kRYLnwK6GU8n74GAHhw5RZNo2XL29KoruMw2/oitCQ0e3AWUlsx3J+PtiLEzwJrDoTzb8WFFTVpqlDeVQ/UMTzyl8cMj8rTMSRs4fayFtOWnVWKcNl0gy5yMp7pccTDiaUe7X64T7VrWtM93VVUrQ2HfFsTRJOIHHdTUD5eQgnKBjXdQSAAQDjyENeUN5ak2LSuCyzKiTMGgQ1wubNy/xhxNKOnhiLQjKrSiNNpprkzmIYhu3+PkGqbLkpCaR2Z8zKi2OoQxF8lc/2/F1joZ9Juuo6VZSsrKpwCqn1oQOo6Mc4gOeGI03PC6z3TvRwrN2WTWoID+sReWUGerSkN9nEutBKJwNefygjZ/t6PJJd12rEWhPNYu6i7qS6C6ArIint8OPDn2xoOezvuYjuJ0N9QoFjDOKmTCQ4WUhnhlaJ8uBuY0clAAHGOkHHj9kQtrGpvtHZmDhQxM+bKbJnyemK6n4h5cGic9trHNsy2cm4TPkP3z/ACfaOf1fe605lpSXlmoJpSUzYnVAxjIzzCOo6cIxuqpVqwhkePPOAjdIZ2JbAXrIJVK2bpks29jBsQVi70PAaYQBnQZKoy9MPAQEO6Ne20Zso3O2Y14sTesrfX26qz1pW5cBkrZV2st2gAfSJnqAiAh25wOvDGYwHfVmaVLPp+tnGuY/t0jZyc/2/WPyav8A0MX5YX61uRlmbn+HJvkrj8fXT56CMdYDWcgE2MwqJKNehVyA5xxAQxiJFv2tagxapm0GlOaF5Zrm3dLMA9AOUuPqiMYUq2RwOAzoOIY52OkbKnGziIcmWzlofMQ4qt21RSrqKnKanxBxa1x3AelolzBmYKAcJR4Q61uHWZI1qhpGU5kyv0PefldHIeMRkwIjoOdePCLoXnmp85gAZeQ9GJfZWlK4tr/WxzLphzaTb+MkSS1DmOoT0vxEmCkpwa1XfaOTGca8ZR74cZIr1+iFX1uBAfOGdaTic01KjQPoZhaTc/JAQmAA8wh+qLWcXV3W1FKVOrOlrQOkRIiH7Y1TDzCUq0qu3zfT9ucXRYcmivXXt6G5uL2/ITGZLwIXQQwtzehLNXBZwhkksDgXk0DA/wBVGx7Q5D2xgL22J72WvdSCkMJrrt3WdcFT3G3blayANTrQxkPdTIfqs3HiIB4ZhoW6rnSdalSAwYKh0tcace6OhnY5eCxQbaGXT1w0USzY++axyuiR5MRRlsvPwHD1pMUZ2wi2uSJR6XMHhs20K2x7svtdkP8AcXWpq2bYV3Y8FYB+bW9n513QpHLBQEVOhNWENTZuud7BD14xvJ9LVeRxNBJbtiG0RVklJuBL165VY4S6JBxFy+gAHmIeWY0dpwVQEQDUA59vhHKw2dKmcyjj+kmDFogjVtU5m339JMIEwQQRTYzMCCCCEECCCCEELhBCOWYRHA8+Awsh6QX2gIepdNR5cO+KpKkJ056gNM6B28opS66Dz4d0VSdWsRrhXAeI+EHI+Obf7tm3h15sa4habSRLUd4D4ZxmLZSmGbOeX90LKyiJykBfgPHXnCOiA0NR5wqbJrSbB72y7w8VwzYivBCeFEOLPqHMehmEeMXwqhGj1EDEgaAHEfx4xjQjkdfPHOHIb70mRSnRlDI88aQazWaLorN3GXV5d0dGiSNa71RgZwlWSqvqB5DqAhmPcLF03SPnKtagAgAzZ14hFrjgg0oydLt0Pe3ZHy71Wt8HBFWlx8wilFWlx8whzaeNHyPcEEEOwHF6o0fDh4RSq8fMYo0qv9whpHytW/HGHAOKqyOpFGCE8KI8RWDcCCCCPQQFEEEKIcAQCCCCO6PWEFEUpOI+EeI9ycR8II8o88oqwoggglmCQQohPBDgCAoggghAge5OI+EKOmPYEJpPpBFaBx3Rx8gvNDND937RjJiblChS9R35AOcY1So1TuejyDUR1GKwEph4AHxjpVFFfnqJXHSUtF/7JBCeKlTlCOPUusBu6484UUOf47IIP3X8ZggscRcIqU+cU4qU+cDh9J1CpBBBHYpswJKbMPUswAOvPn2Qui3x6lnENOPZyxHtaYc9B0RWFwk+kEKqfOEsn0ghVT5wAJIjTfxCmlx8wj3BBCDkh5QRcIt8KIHDij1C4QQQQg7hRQ5/jshRCGT6QQp6Y9gQq1w6wclXDnqKlHiHiP2Qpi3xcSdCsdq0aBeiJkwPCUNRGPK1BKJufAfI+0eAeA/bFSvRrEqtYuYoiXMgOoDp0YpR7SuIJpXELOmOeHlCmjQExyHSEcw5ER7YfayMjFmfTdmuNQOG2bKqB7RAQH5xmLjxx38IMaM9sVIhn4xI4hpynIbDUM7MWmLDwhPV4+Yw813JGZK83DXYVA4UZwqYiiyHv0jKX5Z7+MM5BbuupVOOsrHcmutgoKlX/G0f9GNufoUK4jtdOpIHQsrWbVgzz/O06NRVb/HfjsCNr/oVv/s3Q/8AwPL32Swwz/vM3rCvdIPNabz1RNX0hCw5PYlVZ5hdNdQ9ab8cRx/R0c96xR89fjHTJtys8VaguF/URzfu8nuKke/cNM8M9sRbR8vr4lyh3FA36FnaS9uuWPcUDBK6cNbPDhDKrxMSk455za6RJ2gRpnDtEuZrbqWMj8o0IZAO+G6ve1k1rOVUSUFwFHQmFDVYCThIyjLKohjQQ58vrh8kkVtkPgI9pItylYo8tQnAYMC3m+dejma7ITg6Sm6F0i2UzslrqBuWSQf+KcA842memPuCnmL0MyzyJW6SHZxil2rKABxEOER09HKwaL+207SFj9Ofq9nKlW4Z4P4s8qOVE6VAf9+WmMMHtc3AUrl33uY8FIxvRlQeB8QHu6WP/hGMf3ctX9ZS3+7G1RfUJuDO6KPREEXwDpTDr35hYQKiZN0qGNJhhIIiORlDAAGo41h9rd2yPrKZSdYGqG7FlKUpu0w5mzjpcOzWKYsC1nd33Q2YNiZ97Op6nNzh+aRr+UW2GLJnU8gncQIG7Wejfu65pfkGb23LQ7fFc6iJZLrisTfHoj8Y1PgPSlEZhHpS8O2N0vpICxG1ezTsd2LK1S8yjK2j1wlsqRAehvM+SgGBHvAJtP8AJHsjUQx6qHTcBGq4i8xtN6eTMoDiYQib32ujdt8tmTY5U01UyF3+AmYcaVbu9XqDZaGy9fyCxFhEZps9oYEeMZekAM02gZ/ARjleUpvlcSPS3fPuufpBw/vhymBRTq6yT68GcU7pYN9H6WNf7osjRMzVbv8AUU/fDYijtkgRDvmDjNKh0Z6VCvkA6WQmxwiZVlaIGHihlzFH9ZDjyhgKpNDoLR72cA11LvQ9Vb7gVD1GuM40zEirM/wwbmOG96fXGrmHOjSo1/YURWFjVUc46n3JRcjc2IXi4E9uFVb2eNb8cJnouXo07zLDj2OTygB7rZeSbjL2+Dx/tcZ4g0SS5sZ3Ub6h72O6+Mc72yjtmL2xPch4tBYSjSrbh2Ke4vBIJH/nFAH+lJUUfA22jcNvOW7A+SR2sUVGwKV3Wa+YxPjNWQX/ANIZsgXNvDfN7Xvb7+QXspPY2B4621yX2RcQf7o6eUag1HZ7e8tFw9cJcyAbb4AJ5KPB0VE2PhzxHThcm5trNqFqnlCw9zWwbVCnv5snj2fUU/8A2rGoxxqNFnnFRHR1UHY5yhvHthkOrk7vSg5B3xNLLQkJRosxlubIJponsiRv3OjcrU2sINe1XZwUzhVPVnRTrtJNmAPVlzoiaXVztEtLgPrwEXSVAQGfSlLNVNmL1pRz1kcm30+GnIADAeQQ7a+cOnK9cwZOGTRn+lzaj5xjFZuOBRQTywWrdXkSRsCSsbmEZNyDjrziRK2pERcitLoNi1c9pU/H+VPsFmO7Dti1mp6sEcXPe+r5qfNgI2rFCqZVMLxyaaaYcGTJzIiEIEYoYNL1YuhyGlBP3gMVxlEJpg7RDlCtWdLMblX1KdSBzqJYcBMMw9XTdvfDdqp64Tgq0KHVxuhR/VCpQn0ZQ8AAMxU1032kxeYx+ZyoQ3A3Jn/fUGcHasUi82mh86mbPub/AP6n+oce87dYJdwVzKZUrt8t6gMJQn+uz0o9gzaAHmMMLRU0stJUoUyAmekOAqTiOmItyjTOTGqm8VRM1646zdLOdeMKC8pRN6NauAGTAzY3YdfiMZ3nLodylxOXzZgiwJU3SKGJn9vmEdl5JtKPzvUEaEoc3AQXOmrHaMw164jQoBqVLBrn8dsYtXMV6xmavVmzWmmzkQwOeUFavWOVZqtYZhmEcaaBFWkTNgbpF5aI+v6WJZR4jziCS89K3Dq0KnVO2IfiPvcQbcMOaoXIyEquA5LQT6M5icBz8kc6BD0qrdUTCcST5zCYPVfGYmfKiIDnOeMNtKbUSUvs6h71682IyGpZB/PR4hp2cYudZqGys9brg8KJRLzfQOgInx7uiEWlZdWlsR7xi3ZmeHOUpHJs+REnPwfGD0qp1Rx1ZvuCsm2FMZaRihQH5Q50DQYcQukumglG0mkTH3ouHSAAyOAGGPprYJdf1qTWNSzAOAMDoIReU647uoGq1aVSM9M0XEnNrqIYDAZibR2k2xmNOT3JFNYfcNqj5yAmIVj2XvjWd3cwDrpllTNZHVFmh85GEKUDh0qGnyc/3fVDSioHZ5pCs9YfUSDjA64h42e27yP5vOiuw0JdX01HTKyy5BRyAzSJxbOozY1wHYEYGn29Vysm/OyoKFQEcgBoBA/N4S8YlDxJogszQtJgoikcucx+Ah/XUHSRRZvdn5DbnJTLvZvzF+Z79WG6FZPQK3yTIYEZeev98P6xLMNusforN1AMmzYhvhRiFD/UaioB2Gjgh7qHiGdIb1puNHRqNedkIxkrUTCwzHXAEkx5Rk1wBkNPdfxrH1Ie9vUlWOHFtsqTolMD8mQ+odHHaOgfXE3ZrK1g0OVzprKdknY/mJEzWZoNEOVnBXLcnCTNuE/MbC7IWISrgOsg0Lq3VY6Az1d0kUVJt3b1eKPBScZkcfrZHPfrnnHRJQumvM/ahsxsws9LNFLEW8bG4o6NqQIES5AB1Dwx9YRog2a77FHe0DydYnZQU3CrWy9Q6jiuhCAiHENe+N79ybMvy9NsbIbeBc88mQ/HCxCB54MQgQ/fCQ74+rVkUXs3s854vsi9v0cZiOe3i+91dc7bLn+gJl7UKa269pVRQa+6pK8A9ek/f/Z9xRyrPtxO9DcJ+ioHDm9b373MdH3/AM4njffaTvsu0ep3u2AbpVw1+sG8cJnt+39PzwDt5axr9eByQ8und4HEwGRzzAddI0HERysLB7OufI4zD9N2cQtC2vRvQ5kXms9QKW44iqlXK0MKIqcs2Cxrfvkh3AHKNiDW2X3TdJGYj9tgIChOFU6jVyp2f39AUA4+IcI1ptQpWBWonQpDvG89INOI6Rta2GXo+Wrce4qWDhOGWyVYppZqJAzZkmGXoiAh2fSxDu0dvG8UZdj4yphKLbeXDSEMuiTOpU38+f6vwEtPSgo5cihWVLpO69epBXcTef4Q7vufONIKUKQhXAR1B4JBpWQiqoBxWSs4E+X7PMIkRfi8jxvC+za04DGd19yJkw1xriElzBZ+y1suKW0JdBvSOhz3AU6LVtE3ToZTpQrSjMcVDQBzCUMAHh2wEmuja1pJoy6xSJNt85h4+RidHej0j+61tSkz3znNvk5viESrluyi6LlVHEjM+VvNegYAmkpCLp1aQlEcAHfgRjCdoxMVx2IVgw8G4cLo01yE38nqsa+SAzDLU34JB446OPMRiJVb0gd9S1aaulUmvTnlNb6VrzoCYeqER7vk6ecMo+9qq8d3FAvXuy5FN5lidDokyagemmJEgHslDT/nGerr0r2ZJov4JvrvCkzkzHb9CTP7eQfm/pI/SP0ezdrv7cgKrH2opybyRCkJn5vyEfCZlsAI7yTMgPPXARkZNWYdCbFVsGDAdorA/ZiKKooNRwnKtaUkCHXGYOjKTlE4RAeHAYtp1oKxP19crRFTTiswAKkUlzT7hyMZrqtLs6bRBNmjxuT4VJuQ376YwwjrUeZClD1J6Ob68afeHDJP9q0P8SwyACPHJ6Yfvi5lLg9KakBdsItDA/SGTj9cMXQrzAMoZ8sYhxW2mKx+r6ouWrmRH+KACMwfCLUsO75aTrqM/wC4kQv3UHZGVllViIIf4CE/IStR1x/CT3/1NDdiYbkBvcQHcc64z2xdU16OsFGkXFVNGhMjgQHiP4xFVBfr+SmKoMAweopzPVlWitKpMQx0jBcMSj257u6MBrXFSW4eAShcuuGCwiITTSDjyDjF8qro0SJtBxohR7BxUcRy4cmJ3taJjs9oJqruKg+BKsnOvtJ+PxrG6rZdQaqGTQyxg8lm0tW/M1hD/g6oRy/nH68HrKJY+pGqSd0tEsmIhTl8o2A+ju2m3HYu6jXtw56vtBad/LxBDqEzx7ANAwoTAAGyvYOZoh90QcjKR5F0DcwrK7jyN4RJGDGhtUN7npldn1BcOyO3LpJ/8J7TqZE4JztKmQwP1RzAExGvRoR2JbeCzSVNgq8NBYofmduj5IChHlHH+gE/X0S+njzg/Rki79zzZB94zKQT7QGqsvFPEO5gNas/0hitFGf6QxUk+iEZ/RrlUpUZcHqCPogIcQj5DlTBDIhQc6UzYmBBBBBI5j6A4EBhfFvj6EwhwGCEF6oVrWlAgvgggiQBAggghBAhRCePcg647fqgxmsEPEKITwRyRWCCiCCCHkDgirS4+YRSirS4+YQU08aCB7ggghzS6wOCCCCPsIKIpScR8I8QogjDnxCBBBBBAICiCE8KIJ11AgoghPCiO4IBHuTiPhHiPcnEfCD/ACjzyhbBBBBKHlBIIIIIcAgoghPCiECAoivR4h4j9kIpPpBFaEDkjZcRnCO4tx9d+5B8riAxY1o8JqrVlzw5Bwi1xXlpfKDORDwjmiijRbHyh/WnpF7HEis/R0Hmlx8wj3Hilx8wj3HQBo9QUQQnhRBA7i4QQmo8Q8R+yFMDh4Q8oI9ycR8I8QQgQFEVpPohFGK0n0QhAlHqCqCCCEDwQ5lwbYvS0q8Rb79RRQFRUQCLpJk5jgHfdlErvRMRGiI8QEPxxbOLucUTihX3k+dMmzX9KOCIjHlcfICEqY4D7Cihz/HZCePUn0ggAS1OuFcRdoI+5HtH4x8ggPVK0r1AjPbdU2JWeSEFzq66VYu+B7RmWxLLMv7vz3YJtM8OMYFBACS1EFsKgg1MaC8Ht1onDAkRM9WgYrbpkdcch+GIeDZ1vUo7Pd3mfdhPQ0xxG2md32RIWgzJN3QyAjkcxXLhkcd4x2VxXW2dwOyNMFfBw6d37jnbv3NeVyDyWmpBx3LldbNpJAMJ5HONA7obalVxoOmISwAAiOAjiqqsusHKlMOsVaXHzCL7RreHDxiywpCYQ4DHcGs1tQF8J4URRn+kMd0esOS9cOcKf+18Q+z/AJxuP9BQhVVbbQdK/wDqzcs6ob6PcoGpQD7I02VwAJgAOIZzHS16AW2syc0Nom9xquACbUCrJbWuomCQBOH/AL0RO+3exWy4X7hRWulh5RlajjziS+2NRJl6zjUPX8I5hLs0aPX53d+0BjpA2zKylXQnUoF6Brdkn88OEQ/R8c4F0SK8lrQAsJSqk7576jgtJ/UM27j2BEd0ZRtGKLyvpBv0FRtKRrmX75hHpRAPW5zrnh8Iwd/OSkCRQIhTABk1AQ4jEtLM3HR7ZvBaV1O1rYutKrNg8hFG66gGZOIGDAAG9gHcEQTuNQOUTtYtX0EB1AeETqT1qKBHDcOGkeReRkE8o3Jx7g2jeihQ0hCb21jfNYpTDK22FRa6QaHQJJjQ64Dwlk+EaSnjWnrqRivNwGuOR7PxiN8Vp0mtZj0Q9xnkYr+83tXVaUNeHrzSc3gjQtUo7+o0KA1vUAYMD70OcS68dPGMT3TrnrR8gh4xyYn759//AKgy+TEqxkMO6MbL0qhmrSoUuMw8x+MSFtWx1c1d9lskPkqiq7yCKEvIBMTAGPgP1wyK6nSI6waKFjYG5S02JTIZAJ+GRCJwejvYsz52obY72I7sgKvtcbyPJJ96+4IimjlJKFuRVB63NtCJt4xT7hCE6w4VxSrSvbIbN+4Mv9Kc9QdO1Srt0sb3xIta00e3pObUBD1RMTOn/wCe+qI+N7ZUuyrWkmvcnoYnGaCp1fmWbJ6YQ5gHfDV3kela4t2n+96s4TTul2nlubvExVmnAfMBlCHvtZtP3btyjC0E5WlOM42X6INhc9/QPhDjarSJe3G/cOSZ6IqZUuPJkJuBuVSohTZ2/ql/D7AwNZuqKIaqp6hQMlTYDwENYvRRCU0k2G/FJiojxCbOYeK7bPusQqNe5z/b0yWVuumi6m0dEOjIolx06QBy0xxii+7tPW9jw9qHyeLHFbdKBHpyEwIyiXoAIS8I0tAQUSyVYbBQ3ogpFqzq6W3zcW4Lw1aPvdHTmHPSJxWdQpRfdvpV4yKAhKi+RA6siGhEuI8Q8Yh83CYlDdKnQznOMhpEyrQElF4vBtt6vXNZA1uJQf6vi8ofCtMfRG07DQaxdsu9u7o65rbppP8A6Ltzk/8AO0sDVciTORzFo2zI6tpraadbGZ9E2kpRQ3v7jcS4OJW8n9oh9X416gLeoKl/0V66Qj1/nRWXtxJ9gw3FsdlFeZykuM5HPFkl0PdV35+OQ9/9Sxnm1Z2PhHZ9QiY/QkFE6M53UzjnEhjqnTIQaVtoXZYTtn1oF1G2CIqzM4qb6iWLjnj+igo9gRAdHTVBUUJy9AqWAubCsAKqyd6vTiXaaGbu07Y3YXTaFyHEcua0HwfVEiw9vF4+JzHz/wBf/wCyo0tbb7cXWqWPF2ispSDbnBH2aRyh8d+d2n54WDsDjF1QV0pMmfJT3fkSF4Rqt7pYibQh+Q2+Y8iiUxzEDO13jaBuKSqku98FzS4VHciQkkL2gbw9+ecMO+T7TcbsLJy7dItMyQOe9UUIkMwJ5fOcFZOAxH1vJpBXddBPVhMiXMmcmgwHSh1Lq2zQW+rUaDbGgcLeoyAgcAQHTXsiGyasrNs3Go1ezJmy5ecZdk7ovG/oN3ca6KezEUy5c6mf+dAyjmSUMmsHq6QbE0iljOCgnQHpTh4RL+7G1C+aIWndCQ8GebXijN3BUJtVrypnVxcR0SjgCGvliIz3QFlKZBHPMykaThEvuiqXNTZzN2gPYP3RijItyLwBYpVFCcmcJld8JlwJCcmOjxwA508Ypm4qzjebWibUjUzqLFzkVIcVipHK8trRDHVrKH4cnV5D9GMMqqRxbVa/qMlus5sY4BrrGMAGJvlCIZ444jD+/k0pNlDOmXdVLETJoaMxaQA3s8TDXOgcAEMQ0hyqiEzHzdRMmQz+uaB5YijrntiWom3f3Y7Ki4PmOfObfLn/AKvrAshEP4upaPU8ih+fL2/noMst6nKieoUnpRLIxqi3zQHRKLg/N53A6yjKPHl2coy5uiYeLrUJqBU28386ThiWUCfugiYrzdLeS+MZHOdBAOPKGR30wZHFeuMtABwOmsOJaO5Ry1twUh7kKG8zJRzfAKzDiWbu+uDLcue3otZixQJkbazfVV59/wDaasDpKdMStRaHJVW2upblOmzIRwr9KXUKniIxhNc7VOVgrnas1eYR1GYcCEPNfq7Na8z9V3wZSSiQaWDImjRYmHyAH/l9sMgFOfOR8uERG83iq1wLMmLgyzYhsxS9j6hzPhj18w+gNSaYJZQmmHu4h5ReiCQdqiFefJUuH0jE3CWM3t6/JLbLEq8RS0pfUZaAy7quEAPkAER1Ho5CMFWFpRWqwmD1YRHlniEJFnBxjQj585Ms8/YJcJPXU/Ie4J1Txobf9vKJA2/2gXVZGio07UqldPU1UuBI4vS5CfAj/Fz2d8N0pvxxv47WNO5VNKqmZ/XTs/SmjNbHkrdu91tVhv0wWaaSrLgFFZ8zfL6ukERABEOGOXmEZDftn29T7qLjftGqzr7dLqW5I5wAx60M4wHnmLvtxpcM2zRuRi5TWZZSEM1IXIT+zHZ3VVZnhri9yhRbGM811vklNOTjZiSgb0OlgHHT14j8YOpygz7+u1xL0BmzuoAIDMPPSM4azULkUmufLkplNYK/KNTTS5IkQAdOH/KGqUzBg8rVZp64mK5iYREMZHI8cxpalHiEeTX7/dL7fcJO8aPIuDYITu/+yLXgJ7eYbDNiPbMVdmFSeJFIZRZbTbgylyZ8oKgJAZd3HHGOje9fpE3SStvbEvs/3Ote4DKSmbidYhFhm1FScBiOY3ZB2ZH1fS9bBtczhKi53qp4KzHh+b06hQDU0a7uMdY1sdipmbLCMdVWuJW9u0maTOkjqwJ4exjBHUMpf9p14/ZCjI+3ot4eVlieG8JRqLQFasHFqGvS5OhecBRB98uq5CVsnPZrXsVGMrXNcC6nnW6xGxOTIOO2afzFUJUADADyDXHaMaglOqdlpGK9fPH4xPG12zDeK5V87qobhL11V5tlin3uqJLnPD1i4D4lMkywjrkZppg8OiERqd1unkaoKRVbZSi2VVL/AD8kcozJh6T/AMJMAD8Ai5DsFV2i0fFZtaTNudfyV+cbnKwXLGmj0CKa1HPu89fnx8gb1mnJRVKFfI1+kOg5jahsl1k4b9IaQZpZKultHyAGddOkA6h/wxrSTm8kMtaSDh0+KqnzT70qlCRISMxOjnGM8M6xs/2HBT3Hfphp5giCoAtJxkygAGih7nN9wjB0c0Wi4g6C24oQvxCz7DeumdpyrF9lI5JgfIIqu9MlbriVaBdc62Td7rgSVgDQeOfuih6QAqnbUmw7aSpaaiqrLx2aa88txkDPzhuJ8oQAyrbrw6PrJZQGYOAAPZEvUrZKWnq6FdXd9eVkIJYx1ejzCATC71DmAdmY1+XnF6bO20iolikptAONt3THEzcjmMbvNkBAefHGvfDBpDjrZuOOeW1t++TolcnGTP8ACCE6cWkLftpubLfvOZJYqSuXfOQ5/hBzpUqlYuIhQqDLjiHAQ8ougHi5vEp2ScNdDQCIDmNxW1FsitK9LTcW0Fs5oxVuvdBEwu3lsOnyB82luiJqo5m1IGcouJwAQEcyCIYEQEBHS5VlmkGaScBAac3Rmk/mj4x+Zt22/c2i+XPBSuU7c/B20Vie3X5h+LN72PNWNNGiZwnxlMXgP8dPxp10FyqJ1ejJKYph6+gPAQmHEX9tuRRblcDBE3MWm/jBwEe+MhbjfX6KYcXiReaunlfzsQ1klDlmLeeRKZ6hvqXkRAfeSo8ZYmMZaMqzRJOQOYjnLm1X+WIrVN2yOivTMQ/EX86Bw6Dvby0n7geKCWWhmASyoEw/WHlxhGoEHy3xq1ynSCgI43onwHzhsCFMREeiAhKI6dme6JIW0WDNKtSIT1x3cwAS6hqHjF5WrIvLpjdRLLGRU7JktzzCRwVPdRLEZPj5FK7pVS/84ZGuoqihP72bNGhAdQmDSL6SEAHUM6duIkur2tbThrCCfVKoquGodLMpA7nv5D8QjBy9o3cKmSSU5BUVNSNCG6FCYCemPZ7ADP1RPYyDWYq+E0z+lx/zDtI6LrzhHfOTXJ5uMm8LC2/cdewNY3V+iz2L1G7FwUTaTuelCUs9b5U3xlFTw/w/WgHSQNeAYDPaIB2AI2PZH2AGcCylufaVVk03uqoAFbLIp/f55tODgOUPzUI3xKSwNAnu6ORS2m1yhX3NHQ/m9ut8t/RSsRu47pRaNKMYvxncDfdVxe5+IpFV8Z/oI+ek3uRSQtkF4NjfComrmOggiEyRIM53ZW3uOem3yRWMKZHlpEi9szaPJ7RlzSKez65r8mFvvcW2OQ+fzGuVUYqbN7P61clD9wzzifWhHVta0zuJbsFF56N4dWw9Hp3Ev6w0DwQR7k4j4Rl3HnwGRBVgjxLNnQeP2x7h3QX19K40HOpcvPQEEEEEjmCCCCEEFNHgHgP2x7p84+f9qPgH2DFWHZlTe+QIEEEEOQQIIIISHlCBBBBCCCiCCCJABwogggh9RW84Q8UuPmEe4II8RRogiECCCCOgQUQQRSk4j4Q4Y8+AQqwQQQgQFEepPpBHmCCB6WuWuIr0voT+IR9hPBBA7UphTAKIUQngjuj1j0XCCE8EFt3GpBAUQQQQcECCCFEEAgEEEEIEC4QQik4j4Qo6Y9gQOO6NaU6wthRCeCCA5orBRHvpj2BCbpzdv1QdObt+qEDddULo+UeIeI/ZFCFEIEilJxHwhVSEcgHYIYjxSkHOmuvhC2qRM0dK9IQH4R5iO6KStOoePWd31xUhPHmmIiOo8wj0d6K4dQunTm7fqg6c3b9UePXD3/AI+w3h/wBbULatfpBgR8BxAmzVCUwjjACPDMXJESxVnEXTg13uYM/GJm3s2WFy1rUbi+qzlvUOBM34oID0tO/4hDhsjpdodw3J0ZOIWJaGji7LvipG64hHOkw4zCFdI4ICGQi+Ua3r/wAcIuzja1NMo0q4Vi451xxxGJEsgOOzAQOG9VGRhJDYJAX0gnm3YcoEEomaUVCYdCpOUZxHyCHUt4sJbSWC9dVJiZKlxyaKAPRCaGxbLkV2CskV5CPGkpUJmN7JHCY9EZcfshNWV6ypONbOdcZ4Zj6RWqxqRdHsGD3bc6jCuySla/rLMMqcp0qdM1q1DPREekAcIxcnoHn+2EFKuJnIjr56xcJRwICPDnAtB9qyPKkht9Rk6u2ayZSKGK4YA0GQAfKLAXEZBmDHj9UKzqyJj9wzrChMTa6qaoly9ITRk0PyQDXIwqf1BA5LcnryH6pFlpyjL4Y4+cXWFB5NNpZuuQP0JixssPRNFphwIcIt8eURxoONPA6c4U5HOc6xm7jdRxxUUQuZJJpQEBMBFKbgS3ITgZ4zdow33rh7/gEKY9SorXOHFF1TyC9BVzoGM+EVQTJpwzxDh3QhoUppfPlxh2U24YEbfKbDFuIZne1OguA4xkHr4jjHyQHsHh4DBaSWHjz5N0SNpVqvXB/T5A0s9fciVUe7XGkdpOwmwFLZh2AbUNtQLbkuu9EF2q8mc9EwojnGY5N9mSzJzaJ2ibM2XThm/wCsF+EU43NngXoe8nPjKAx2w7V1YmziZFnp36LbyXuOSMVJpLl0F48kDQUHpdLr1mzH28g1X7aSwkV7YV1hPf5U2vO0PnhnkdAjn/2gbsPa7rqor75VetVJISqDXSpsZ6JYtw/HfE2tqm5BxVXlUvj5rjV45Dg1hrDqHPOImNow9WVua+hOMW1ZcP7nrdPRcnOMfb6mupFQXKlbz81melKdlDWUeWfxziP9yHgeXVJUPHsiZNjnHwh2zT9dSU1Vtjp60bKthfM0DywkyzCCeoGC/AR8Iba3rEUbgXYtWyZh/cX++E5tB39M5IU+yaB7pk3TGI8Bzf8A7n6MUvpBn3byORgkDm1faG5j0hrKcFkdgHZrtjNXQZyzfTkgm5hJHekoipdVZHSObytONacRDOc65590bpfShryu+L1i0Ec+aVUJupeiRzTx/GY1FLLUVUgrQPnSYlyxofkiAdEBjFt125cD6EZr6k2zkTzGFQIov6R6K7ghsMub94YbTpZm4BqOdB4Rtm2IRq26sfteXwFU6pMtOyR9jNs2HEVlwYKE8RqqSaA1hH8co3CPYlLaf0VqIWpjQKKe0deApU+SPyhIIsk00ufMAz3ZjnZLOkXbDyX/AGyZh8JV6Q+PkoNNVIBzKGdMZDA5h+bNU7emX0gF7nU3MqNHIjUKNTogujWr4wEoDzyHiOnfCJabDVREo8S3uZQcFA1oZk6QyYDkHbDYk1FRo06xYtWHA645x8MoFbR7IM+V8p8+/lJv75Pgzg9RFWNfk2ihT1p2eKnyCWKA1HpIsP0XU70tprVj0veibSeiiIKB+aQ3KWFKTJR4iHSDQMBgQ7cxj7dUTqzOqHjFEuZFSmwIjoIDniAQxdE4dOqAmjhgTFc2OZs8RiULDbnqCVIwOpeYeI6eMaish2tJ+EVzarMbjPnEtsJuvNy5GLHNqiZjm9vkGYISYIVgzkOfhE/dlopVS7rNSYwlGTYj+agAYABiNjZZC4u0FMygpZpULICZ12sTEw6QJ5fIZmm+MbLvR/0SaVdAXAoESitujZHqgmtB8nyi3Ha7SLtR8uv3Rsl3EM7es584feL1Y30rzvUmdaWyyf8AmnWy9XXPcf8AW4eG6iP69ZVd3XDRRUVlT+n5iFu2w/E21abs2e4mihXdSHXG4xOS811EegpNx8I6V1sa9jd+JjGYNjkWKKLhv4t5qhhJntdvO20838W5yDl22w1jbgvDdt3Wptmznmy7cdPqNKklEU1vu+UMZNmjvDXI8+URqvJ6PS7zVZrYUiDpQjBFrtnfnkZcz8KEE1OWM5OSpWuoaBx7I2TbTj8cjqXqHWB9UbxU3zJH+Ma9NodYeT5PJNrqtE4qKLeDAnZT3WIny/4xE/txW4JxFjFMSdHlE+tyLue75VpVjWmznLvF/Ia0ztjlslSmOzKzZqlTXqfkpy8VUJps6hwH7Iu7jsOaUqxUsxqh03RAsAmTJyUKeB5iIdkTRT7Yt9hVlRLX0mi4HJKpBISLkjw9XBjTAzB4jDevt3H5AqlwognUCwY3MNAlGLYeWUig0wlsxMe5xjQKOgO2IWJee6tExFK+bH5evyfGI9JFkWUhT0ar0UjK7XLD+ZkckgDuyMVXy7gRkWUsgJpZKKZ91mDjCA4pVq5M6aoHs7rwyHGGFVF1Rcs1MhRo16/RHSQAHUfCIXIqxsGiekS2KiqcvrnP66gqi5Ljt2z4g8TajbUqrF3Tk4z/AN51hs1JQrmKoiYrDjiPMRixl6VY9XChSAZq1ccCAacRjN6zVNUKfr1WtRTQ4AAjgR8givKJVrUUxbT5jIKIzZK54aaZDnzjH87bklNyR5WdWKiyJvqZjb+T+zGfUkVUaYLUDeVelRzTEMgGgjzCMuaDmqtc/WO7uWNANES0xY5LkNQxw7sfXGImjdUzXqVhD6U2ufhHwaNToBX/AIoDjPbFToyFWUxSUhcxtTwghouuzUIuifKoDFMZg9VnOdelx/GsejIDJVqSDU6QBNxEcAMJ6U81Gf1nHXXtirWN1TFcDFbMw8Rhtq5a1Zmph0mYfOAuyDTImFYpRPziBUTOKgBpkBHEPffZu2oQjrbK2oWldZLdR0PaE0skBIDTP6jOEsvZj7PGGWbaSZcCtQTy2flzZEBHAgAcvsh2XhQaDRUZKCXWmW6tLQJjsgyyFcfbyi47Bjmj6w5FvIIoopnN48/H8hKBwTaq8nKuakLq8xS56/gG3R22br05T5+sKanZwJmaXMo9wBxi/Vl0ZBrFkjeixauP5yIdI8d15j4xjxtTOqtb152uOfHOkZOgtpQcdWb1GQlAfejQhgkT8R5RMLJZKt0uSbUzb/Ebtn/yw0VpVdWiDMnSBxmg/HATL12+jymQJqfyThUNM6/3xnhZnFW+TqKpioXWFmhpUTC0wzbhrxmxDT0Vwq3RqkG1UHeZh95VAEQGbuDui/stPWlhTlop81QTAy+86gPw7o0VBSLt+ijSnTKcHoEE/g5LMs2iHxDOXBNxLuI/2fnG7X0H7adtxdpa6FyCqr1TNbOyiwuzmxDhvASlA+0Y629i5ttyhs3kHO7zxk2pmzZ/Kw69BT45fPQjKqER2s1RtMdVBIMz2nUPaI10szL4b4ne6lfj9Ubs9pza6ue1EcbP+xxVvXFdhX94ZMiQ/SCjHKQjZB7cLaCotnU7xRrbR7Au3zNswbqbS56X0yHWx9qBvNth6r1hHsdezAoIJU04kICBw3N/CHljMc9p5xuEy5DqsvvNw0jhocGzx2jMePz/APm/ZGd3t2k7qKavVSbkKymcUksBJATO6bgIcQEIjEpvautCAgIAPLGkXvVRGGjkWVD85OP2xoNuzU5acazQiW6huUUfGF5+P5q0D9oZtHW3qSS67lrrKaoiBQ0bOExJCRyIYEAER4dsbFtjJEJk752eM13QmEltBVXKUWW2fESCiTT/AGemDpAI+M0adWGfMF1aiqjnHSzjOeUdFDx2erI2tfLF2xXTcZUb5R0lCDnINrcAFPBYMJYzYzjhkRHHaMdUJaq0cZByTFR5nIHGHuaPk7TVYuEelcqZPL4s/wBf2jXHty3Vep9+KEsquvJzbQVTfSKOOsqcoYHOgc+/uGIOvu7Dpu+4yjpe8ldUqJaZQRBNkie44LF+GdMBz49sSFu+8J3W6HVc53ERNNRLLAdVSskwyznCxcN1KB4j8n640gvTaauU4F46cT1WVGTZTYiUSiJOjIRKhnHyZQDAfXEB0tX3B6O6kcTusq2dcCBC5uDt8/NgKG07aUmGil4zinplNYcpOgIXufCc9cMOrmG8xrXbdrid9indbS0IN19WoKkCCm7EPeyZF3JJfq5LJTKYdmJeiM3+WGg8tGO1ijtFN2jbwELbUp52IWfB+RpaiI7gFScJA+ABiL/R2oLmr6FVbKlcRzJhYC25FaRU9NKnh3DgQ/Aww9as42of6wCtNNPMOpvIiM+e+M+aWbut2/LfbuG51HLIimdVcpE86PR5Mh0xh7TPpcidJTZizj2hkchs5jbnmw8WT8wjTl5ZTCdYhQrGALGcb0X+iA68w4R5J1FOmYpGSVIwE2cjMIgGYS+0ij63/HDnOQ10jJ0t9uIiIBQOzh4CH7Ir+BdwayyLFvKuNzh3OAZ31uuyVfHNqyDLCjfruir64gmmSyx0tCso5lHHdxjKE9JcLeqgWUShksAaAA6D9kY4QuA6ulSGVQnlkAeAjqHniHpR10m8aBcuviOf6XwEPx98ajgGUcuzo5QP0vaPwZxOrUZQb954CsoR76W6Q4Vt2YRERHUQ7fKJZ20fig21AiAlSy+n7172kHRD5Qf2Y1xAef3c4YpDZhybJhPl60z+a7iOREYk/Z+1lZdXyNAzQyI+cSWki0hUjuHBxqSAnU7QiTOH58BuMspbdnKqD+UC166qKzXNe/ORtrn6RZ8a59rjbROXNonrP2fPGEphbwJJ4OQlNgHhxDdSv+bewI28bMab7HClmS1D3X8xOD/JygXjU96SXZYR9mq/FdQZxEEm3N2Mupno/wD6v5/VYrO1lbelLsO/cCgbF9zN0X6sv8J2RAhtpu8HKHxxnjG27ZLt7+bqA/XGvez7V69WCJf1GR743zWBZNGhRShLl+XKJ3fUvyUkiwQ8YcTzTTclGMSSJQ7Y4aYIIIy6MlBRBFHpzdv1QdObt+qC9tr7VHmFPMK0EEEOo4AggghBBRHqr6r1QBLx7oS1M5+Txz90fMjWyHAecA0epIa6mTjBAV18Y07I+AIgOQilWo1fLu0CPVHHSHPlDlRZZeR4Mg+cKUphUVKI/Jx5wUw1Hz+2KQVREQDXUcfShXDiywXqTDsDzq56AggghzHIEV6PEPEfsihHuTiPhBCHjyfIEKsEEEPAHBCiE8KIcGna+f8AAIEEEEOAQIUQngj1JXDnoCAogilJxHwirByFccKgcEEEEeggKIIIIcAQFEEJ4UQgh7k4j4RVhPHuTiPhB9ObCg8pzYUC2CE8V6PEPEfsj7RWBIoQohPBHJFbzggXCCCCCwQCFEJ4IQQuEKITUeIeI/ZHuT6QQQHVOuFcRXAzOGuNPGPcobxNrwDlwiQtx7OlmqyW+66DhRDhhfGuAo5I4MymmeoEPzkOWYjrREZREQ4CIBH0rVVGvMQSe4rdlrXlixM33c4+wQQQKGsLqVLobrXHH7gYDPxAYkftE3pZV8FFgTMe1SFbEs02bQaysTQ8YXzIDqaGI4Jtb19HPHkPfFJNrBQrj2ZHnrHitEV1TuKj6pRGmzYeLOF8EJ4IcQdr/iGcMhnLL4c6K0UesWBTXzYECYnjoEE/I54jyhEpptZDUTpAxneUwyMo94hj+6LjVJ1i+a9GqPdymCMbMevGYc/WMNyKtXCOFRJ3kZyWnhkNrP8AQX9uOQwnVMjnIDnvh3HHexfcZEmQVVI0cLFNCpYRyEvhDFevpD/F+vEVJDFGcdQDHjnEda0rgelMxCH4hKoO9bihI48Swf8ARnF59cH/AKcITdCbs+uLfKIgIa8RxF3o8A8B+2BedCoFRV27nFOlx8wi40a344RS9VV7BHvEMYhJ60f3IRqjpzEfowsdfUGY7DzVGToKbWXFQmnkwyaNmqJMqHPI6fbiHgunZdx2duY6LVvCqnFnM1FUU5XEgf35O6QAA6D5gMYvcVBZ7OX6NBgvL26Q+raBwXF1Cab4kjA5GYqJSv2YDXvimyrsqzQuCiP88mJjsUklcorhoi7CPXqAuiA5wbDOufxwwJKVUcfpCTs3ESwrs8sTpMwwjoTYz0Rx2xeE6tWL1aNehWwOePAZYeG2d3mY37umrmvq1rZuEgmzJ46ct1POKG3PXnsgABjOAl10CGOrG6Nc2br0KISgI5AqOuI5U1SHhCJx3QXSQoTUn8oXKR6rXnrVq9URMCOREeOYUt9VKEFYnXUCW8lSxn30nn6WOX47Ixj13rx07ecZo2W0orpyiRIEzJo0PAoTDpCPDlCRpSipMfGA1mrIScgTYAicClQOqJ0wWoAVLGjOSpQOAZ5fjtizUagiGQAR8IuNcnkR1EYyZNQacydVO+u1AeiAAHEYIqjr6HBiMdJPZA4uB6ZuSpKXuFVT67yPW0s4S7j3bvz7IxutW9ePGElfOde3EXdHTfX1vxmPKK67qIHgtHb13sDcbtvQQWlrOPaif20AZo5QbJMOv3+8q+cfVGz3a0u3vFZV9+5/CFPoyrQ0dnz0dCI8D9ESrmvwZPOlWGb6XRDQiA+AAARr620rhHCJzd+yKTlVqTlznZN+3xDO6rNa4r8MxQELnIg2xfFvbqPB0XU9k3k39w9g2HuH8MI1jOSsPrvDyiSCam+2LwQ2v1olt3rZU3EFg8f/AHup8YPtCvBtONaQUhrs5BboMdCBqrJ1D+i8DBfOVQfGLU11WDrkkXNJvNgoeJpm/wCwRDchv1BrADwzkIlX6M1li99thhHa5IThVgp6rcY4UDQMFCY6D/xB8IhY6ak0pzGdMRuI9DU2E+uf2q7tqFHJht27JNlHl/mTKRsAm+ISSfCK20pSNWcJRvWnp/uEGT71kquXjtatODMNfu3PdhuPC/rvUGOji393Va5FfN770wcRkvNjeseQhERF10rz9OJaQOR6OCRMqA9uuIkttuMK37XuLRc9trqti5qQ9S3XwkkPIn2gI6boa5Z/ZEQU5FVzktVSI0DGCvyjJnoj7mGcZHsihXkxObYeBiiKHTPUuYhO2iQclXrqmdggc+x7u56BeoZ0Vt8vIy9RQTFIRMmcSygUHM4gOefxjbD6RJ9J1pDmyXYsqTlVS9sLWyrKtKAiBJQFREaBMQDsAKc2R7wjXxYI0pOu+1tSCxRMKhVeeBBHNyCOREBmllwHbxz5Q4HpFbyFbwbXL9VkmsZBAZ40GA2hEcjuqZ0pJR+Iz6d0PM/qbXjWbaKzIqEcEKXP8xx1qsizdEnbdzETIobLn+atBHV3MkCLqlOuYrMiJqmZE1oAjJLLnOndx+MNaqFCVNSrUUqaaYv0vdxEcjiM/d1yFF7qRKsvUZQLJxf1Ybrp0Q7Rh7r0LGyyutW1CVYNnPhvOlES643ScLzUZD0rgNCICAlZJdJQAM6YDlpHkjEWxcMis2toiPju3uLHHk7WJVeOFoM/g2bdz8YYJvETkktJTEpmSWfAzchx3RNNrIDoJNwivqjeXSiCcMiSJq9QgZkTzxjs6Q8/CJ/NC4GyRa1jN2wyQ4k251vldNLulyu4UARnIKXMO3MSDtNtEWmfuzq/7Dmi6qTNGyh4kz0cSHX6iogOoRblkqyzJIjCrFQ6veE90WK3DFy2vYMTnZn7QikwWgVvG/7XWvYiWCAquOYu1nEePLm4J6kNY3qaMjyDEwZDuDs031WZ2e2fY+4RG3yPXNOE0U/lj9IRz2t0uokbpttAPr5m2hoVwuinHJjAt6gI4Ez5cY6kbJtVnojqtyns897Qpf7gRWHJ/wCsETDSeqq3o2bt/wBoNC/pFqulmbZBv3vNgLv6Tj8m6Ussgw6CK8bZre6p9pPYb9I7tGlVS9IRcO1aw6me2GqVe1uSirv1tybrP9XKLeTv6LG5L0ltZTXPaoyz2qb3kn7jGke+VvnrtEH9mZpMBr2lSFO4CYDXbbaY49FzEcCGVR5TYHoj3+PgLFoziLee2k2XnKYqAPRnZds3DZj/AJdJnVzCjaHarvLtZvVLY7X2cEdxDvX74zSeIkE9ATvhjTvh0drhXattFqqzmOhpe6imfvkV+oglyoj3xOSnZQnsQWTVrYW/VA6+KpmX5cchweCj3RpuvU1rq1l9uOK5BEyVTLmDv6MsEjoTAoeXCJho+VhEJA76JqXYhKtDaNkW6oecb7jogigvutWLm6+75yPHshtySk2VxPdAuVvrqouGygC3ThM7uCenCPEyaDmH1Q/q7e5p7N5+6DMb9dJuCovVM6iGYnMB5NIJ4jnomDfMe4IiqmEnU4yILdWXdm4XOAHUROfoSyZ5AH3jEikpJWUd4Nz65uOc/pCUu+bPEsMy6fFUpPb2+MMg7xaCJIMykdFaUBHG6EphxL4zQ389NzudHU1htJhdNTUwAmOAS+RLLkecUnvVoV1g4BUmJagM35rqABFhQU5WWK4pZE3MTIZAVEz/ABZNeI/sjP8Ad7ySXeH2fMjn3CES3D5/7TrGNJKSq8uFZiVLOnvEwS8vz1FpRy9E7vTkcdUzuZeYR+SIjMdrjwlAfrEYwlSUKyocrnKw5mnEMiOmIyd4rxY5VopiSMwIyfMIEwEMTDniI/GMDEOeuO2Mf3hLpFp7nGC2dMhsyqv7ZXynDEpxVH0BDOuQDlrnEVxmEdBHMXBOIHT5ylQIla5qvNNmWgVARqTeGMjGR1m2WRhEV6sJcwE3RFMK6npc9udA84jcfCSMgiZdDcb04jn3SfWPaJH66UGHUaFUxV9VSCaYRHTkHmMZHKg0ydMKy5X3Uc/mn68PkP3xSrr1WhJ6lNozJ1CccjgRGYR7xiwDPMI9KYekPfqEHa2AhjYJeFqfHupfnUcqVrUZKZcdf1W5plME0tMOoBOM003iMWGjVmHQMjrnAax7JEzKgYlLlKQ16s2oBJL0h/HjDgkAQmtUo1awF1xXH5XREcpxPsER5j9USGIRuK4FeVXDjIzJuaw26QnoJk/AKtddXBcw+JqDRolKSsvVxKkBmyWLZADp3HZ+0YVqrjqKlKmml6IkE4tNom5EJe/jqI+MY0tHK9dRNmK5wVKsI/nmRHpD2xcW6lHVxQop5Cj70YxpnjmLut92htnuaYl9A/bOsB9auamxsicfN6ZvbzDI263FJeOUqFAREBm004xK9toadQQVhLTFlKTgSym+KRk7Pk8u4HASlgxw7u+GtMniLYKzIKCAmTGvWipKGQO9gB3QMxPnWVET9cZgRy2AM4HtjSERGamlG+rzqn4hbNl8n29IJsW6euen3TmzcA3wegesPTuU+doC4RqsJNTbtuaLZbenA0oj0R+qSWJTvTaL2p2ffNvbOtunozb7OVuvEgDYeB9P9oBKTZDQyc7sgIjy+EOXsJWruPbDYLcqtb1ugVuftMGq60jiA7iCAjB7oTN+A8fOIGbQxhF2dKLisZa93G3I7V2UU67T3km6MrgHOeqiocejkRyPERGJHBM2qx3lVz8FBu/Q5ZcUwttxVZbxJd83fz+YevSjsimjX+RrjJoljiddZoF10yqJ4CKeoKBEBKTiH/DIEav6CeqUTc0wUa/fkQD4RNA67SKzbZgtBxkxMkrXE1Uk3gA7jPWxwDg8uATZ4d0MybcJ+czWqyCOJh6ICIaw/q22myaVQXc8xCky5PmFhKaP2EU0Y12nCmUuQpPU5/bnFst964upEwwPHH2x1PbUFvQcWwgx1jcfnNksRBXBKBrjgEczjfpJxesYrnqA6y74UwP0u6OoLaCuAbvdsEJLltIlKxgq6mgXIUCROXE8gZxMGOOmsc5Pa2LuKXYnEtQReQfITdA+fw0u6NOjWtsRf+wh6QVIIEy5xdQGUQdaWbDGQLo8wqhwAHwAI5M6lUsNGoWrUhAZaggAgOJsgMdjbDeqjsc7P7p9r2oSdS7cRfLg72GuBgFBF0KLCUb48fvjnP2q9lYkx6ypc6y5w+8bGqBze05XnJDMpMneR+QmLuAxKZlDAcRCYMCEUVp8t255I1J1uQq2qTOVUmXPuc32f6/GMe/pkWlIXDPpXzCEzsip72T4MnyeanVX5aDX7WJVS3+Vrx+jF2SF46l/uNIJjBebUyVxiWbXt++EFGvVoaCPSDOYW7nROh64hgTHSD3YNYx5Gs3jd3t9qLGRck+C7f0P2gwZraB1qjcaK1VTgSDnVpgyPRmyI4lHI4GMfUmecQ64Fz1US3R5TBn4xghYzPTmzTmmCYOA5h5229y9YlKluQpMpJ4DkAwICHgMXjaExadwrHq4YFI57xNwgdv1VKYoOMrZWvCbsfOLIRIpXSAa6iI66fJEYdNHV2smYDBk1z10ixLFtZUqlMqI1aZRIS8REBESQ8cTftim22kuqdenKlJplTEwIhgJRmER8Yv6GMqZUjdy2KRX0N8PEY0uG15HUoNC6z9/2+YSGb10F9nqNIy25S0uBwBU3J0wH7InlZXaft8qGiyS+SRhkqZwf4RhMAt4PGXiEMda3YQvc8JaB92qjQtkhj78J51qIAfEPDH3xsqtPsO2IYPvCwlKl4lyX6KstiLfbYeBKOUtcdsuE9icHKJJIXTbThI/Kx/oFGxK2NGtuZEwXPFTSXuv55wiJfphneTVk3ZlZ/uvXyQlmDx0YmxbFNrEaxFHLpRQollPzMmRjTb6QK5FG7e1c4yyNuptBtklkGOTiF6MmVXtznfhq0KxtHt8beDZRZJxVWKBguRHSOgTZ7t7vxxKLbv/AHRrN2P2Hu6YlGPUb3HQVYFtk2O1HHcFwV90Qmm1z7rOHDv9GT47aQJ6nLm3r+LIOWlKX5buI69PFkH5a8V6PEPEfsihBFYirgogin6zu+uKlMekIDjGuPqhwo989B85Cggggg0nUPg/WCCCCPsfA+UeIeI/ZH2kGKweOY+UAyIB2zY+qK1YMD5iMNaSPghH1ScBvyHfGmOArDQlANBAR8dIp0BxP3Zj4MtUOWfDAxS1lHsEId1lqIOyL6nImQfFMKlwx5xXhRFvhRHdu41I+imzD30x7AirBBDujrvKoOIIIII7hCvR4h4j9kfYIIfkUaoI4gcEKITwR2RW1AQUQQQQ+BAggghBD7R4B4D9sV4oUeAeA/bFeCEvEhBPCiE8KI8Z9YICiPUn0ggk+kEeYcR3pz4VCiCE8KIIHoIIII7o9YQVj0RyICID2ReEtCcSrLNKmEpjcocQlARzGPgA0Jg5gI+YxPPZsvkwbcozkJOZoFHAZVUzcCgnDZmQU4c8QwOvn2R9xNUZRbBwfIn3hZui60rdu+7U4i7JUsa3ymzKiDZkMTeceKPEPEfsi9rNUDihXr0KIhRMzfRDlGOxypg4REKdpUQdnwCqT6QR5gghzA1KYUwCiCCCECQQQQQghk9ZRrD+4V62nPmIRY55ukPb39sJQq5HAY+AwvogOg8swNhTEPFHar4EVaXHzCKdOpjUM8fMIqUuPmEEUrStMaDvStK0xoPYiIjkY80gHOccwGKkkvSmAIyMmRMVv3ehSERDnKEKtcK4Axo0VfCzyFxDOdM98e4dZTb7dJNBJVya+JhzGjdcmdbnV4gFIv8AxTO95xrwxDVVJQGYQHkMd6GpXnDtIRKkXlQqLwM8wBnP1QmitP8ARGKMfQPX8gIIIIQQvCFgKtKlnHRDAc4ed1kEJvKBcugr1Bwlt1oHDZvcRIARrjnpFhz2QyBSWalMGuB01hz2C10R4+1wLr7RGSKA0Di2QBZ6UouA1KABKly/5Q68o+K4Y4iVwcxyXH7FkxUGfv8AfqWvkEwsTTC5ScoW3Q4aKjmY+PaPfDGeu9fW+yKI1TdceI6eeIBo+oo57frhOlll1TuKiT3Dc8jc8hR+/oKUvSH921+UPMNYey3dpHG+ER5uVHqpZZNZKZ1ysmDq0WITDkcABYNMj3BCZ7jZAvbS3ZhhKjyOXQNCYC5RNdIFQbpHX3QEsQ1HvzC6y6e0XS7UhBfz0MslomzdUFVxgn9fTJ+mggAYznHH9sfKSSS6pG4BtzZOViN198NaZKTUZsiOOyMhQ3BSIlDZesRLmRNAHRN69Ij4RcHibSDqiIpRESadoAS8/GMMo0e3j4RzpSiCuFT9Qf1aKxkqfYDjO0EohVaCpXV1MwUMFyvSIgTJhPv1fPAez6o+o7lPoZwDhGuYKmQ4VJdJoxDpjjH184rUqQiI9seIKY5K13MgeGkgshQmw0FzllEBARD64VUuPmEZLTKIANeY8J417SllMALJYyZICX0ERzxzn7Iw+rVmCbAcY7qpamidah0oaqHPUOsmJntFRO+/JxUEtN30d8HohMHYHfCi3TBV7hvhmsVB/Sr2eBBqpABp7woGQKy/b9UNHKYnkUaJYNAHkMbdfQ+Wmq3N23WarmC5U0hWnSTr5OAd0ADGN1J6eIj8I8kpJNu1O/qQFyNxsGUU5ln5OZtxfYOju9jkpWxtgzbT+6k0tps0uhk+cc8e2A6meYeCons9VNOxL/ph7UBjdVtRVqzjWFxPR/e1T9T5xzc7QhNyNtfPl3RQEoqf0PMVNo4h9cst+zR4BUOieH5Uzy1D8G4UWGiw7MvG2LjMH1xebt7utNxYbDIkNHhEB3cRcbQcqy13ASNElRKN9E2UOB8oB7R+PGJwMO7Vq2Ow3woLLcXla8hv/wCTdY/7ut+IGPV0uV7vBVezoMCqKysb3w8bHTMTCO5S1p9f4v8A0HCfeSyEifnNq8wxdMZNM9XJmDIiUT+kAGjWNADmMdAvowrZpybsSXNcCy8ENooD/uefNm3wuzbimJacjlE9LmAz3dIZh/3o0XyuOt7FqRCrRAzQ8cdEY2xv1erWY9FFYK2xkmKt+Vov7UnJip8SIp5ZYN9fhnTWK10pIIvk20SuT3y54u51Ctb0gYOicVFxP9JTLmN9X5DRk+2CdF1LtSmodalJlquJlYKEhAgcAZhHeA5AE2o69uYtrqIKNszdZJTVoDFBSLgJvohjOv25hzV+7ZWu2DDaLogmJzJoJgOBkBAQxiI40j1UoqU5lIlvO7jmYobyASiOvDmEV5dKtpQlf1EfI5WMXpyazoRxudvbMW71NuLZ8/a3yan+r+MbB9h9BVKt7WEepHkxGTW8brLq04V3PVyCnFwETkw+Q/XEUAS3MKkr3gkTxMkDC7XNzSnv1sa8wiID8Y227KT2q2FszdW6FxWAlL7CqNEghSkjwdXKK8YMnN0DdTgfdEAr8OUimIFQu3iExFrOaoJ5KJiOZSWugeWoRNrlgY9wq4nHC2RRmXOUnbz5OjU9sRL2duRVYJw+cuTE2BMnr5zeL/Ly/UIpNsiUXV4rQUz/AFYnqJoANGxDpATDOB+AYh2E9gkzRZRLlfXmqFA17oqSyiG+cvr4xgEhI0fN0VBKThAAHSWXURjYJY5+MNmoRA0rtAo6lsBrkjSStiY6jAK2ko4AQHMPGje22lM7d8oUleLWmIffIcB6LbPhLomDsJ05SJ5TH1h+3zeQRute1Z5jJqocpCI5xLkcYEYlyo0XBbhW9cbSVJruqQ3ROki4SCnCRDkIS8QyOIbNwtByWydVVIX0c0kKQS0DsxMQwMoGS28lNO8Jvth0TqRcO5xZXd1YsuOYs3ipf2kWBJjPKh591Kb0PAOABFzRGuQTWbZDawht326/q+cam0dQLS2IM8SwIblAhvaoRk6c6ork6582JoqJqgBsREcgGeH3R1yejlTXIuI9pPacj81lN4PEkj+UY5XbEpDbULjtyg8T/VbYzvisc3HrDogAdn44R2Qej4bZM8jnlgvQHdUlBP8AdFdaXXuojW1aiA6elvA2frGP9wbLbMR3hcwnXZ7GVTTeVFVULtXfCJ/9IRG30VWzTRY52+G0Q6G5/B5U/JW2zh4/7QZUS/57Ektpaj+fF0f3Q1/TOIEIfHY5QSbV2P24n/mhU2/DB04c4BFTJXTLMbHPE/SFQ23pHkGWjFa03HYLmEV9qJY9oybkbCPQKlN7NdeHDm/6p/8Arccju0xfCnWXzbRtMfOezyAW6jNuOQ/mZxAHPw4/XG5/0xW0hVYBSvYdkHv343CDfrkK5IcKKejckrw4RzOnZ5qQB6ikI44Z1ix7FjniLM8q+U6Q4BgkpFlEqrLnMmocO9Z+vb5ddhMhcFWUm+hTDk6qkSXXihLpxCQMZ8uyLgsDJQoqBZNqmBLgYwWzwm17+6I3oxJQPGJzROkPQEfldHWaUPxmJQVSiElFkA+lHJlVSMlt7VSpwl8mSbs7+cTpmsssiemQpMna7YurR/OupmEMwXRKTJ8L2zkPzCFjhQlAytAWqURAwYmyAAHER5BFNxL5JvEqTcSp5jFEAAFs1LnB4Qm+oA1DxhyrpPmgBw7SISl+sTY+9Gieck8DqADiMSKsZIWWqmOAyWMIidRMDKpr5ycZ+ucjoBUpzwGeA+cUje21UkVWFp5eVcuc6voe3XUZtk41o3l3zGBcFWS7/oc2P8wyQ1KyoryimkxzXM+7l5QzKAiOgQ+x84hUFI4rP9MTiVeuRAqUbKMHqvVjoEojgR6OO3OYwRXdRFLpVUplkxTS8w4mNzZ6wOBwARH46BDW1JqlScRmGYZuI9IYzXJS6VovFsVCvHpzZld3wYh/+p9lA1M3acdXoMD/AMH8/uGdUnzWT0w6lJBEumymRwJwAHfsZ4dL9kN6MwdLIiOR1mEdI+dHE3HAchxFzkT6o0vX1hGhQEcdMQyI+EQN1I3BdChG7g9T0SLgUvCUhPwDfrKUoWlRbpQEdAAe6UOXnF8oo4UglqKdWYtQEeIazTZ5YilvRcpN0SITdIByBgdB+EWurVGrOIiAjrjuCFSkVGUxX8IX7vYL8vnCpzi/V171VESSXTEqXEdcjmpNFgDUeOO+KYS8xDADwDiI+cZagN3rOnVPHDYJyaWx683NKMwy54AABz4QUkrcF3SSbem+chd0vCQhPuTTHzq6V5qBY2W+puY2BQlQmGWYQEwZmAcFg4Dry8YeIuuIjcJSoTeH9wz0VNbHOTof6PIA7OcNwsOmlUKijIFGZNb+9dIC4jg6cHOgmR5iHwhW0G+ecZutNRESxYuOTRkcjuWvGNF6MuT2UkRix6Z6fiV/y/6v4/KHFFZdmtqIQudwbtfhTzfKM9b6FXc6nPPRDdUwB6RozPL8kkHjD+2vRpLm3Ot/aNo9MsReTuINYqMwj77XMm5aYDntzOAfCGEV3UWmK0kBv9Iuk0JuIiITHRzqP44Rto9ELYik99pVKcJ4xMClbRv17pJGR+kZTsCTz54+qNIxyuqoRZD6ZxY9lN9vlyRMTv8AbXV+L9mmOjTb1vIb2Uke3VnrUUQNOdut8i1hGYMgnl2/+2IKNbYZudeZnuG/d3KXsAsLE/Xns7MnDINSVWERBVEM6AOc47cRsNexy2O01dRKc7wQyyTe5kGtxciO6vmBmPD/ADqVOxlW2jtROpEsattZftIvMkurJfURwOahvH+eYNtG4lUGrO2oPfkDm8O3fkG+dHOktGcj4SDtTfecbkmTOQc0r2ZFe1JM4B5xJhoFI+ORRZukAYyIj3BrwhrEs4xVEK+/PMCoyjksW6qMjn68BGaKhsHEiL4mJcBMAiI5z09Yh/N0C56YOhjUQx0hHGsWPPSKzGjbZiFO2OXt5/zFr35OJWxIM6xzdM7I5dwp8/5jZCQtbRKNVu3CI1TKkgTr1ZsGlMCQkZZZgwIBnXkIx0S+j/6sdfo1iZE/QHeG+acyGSNkxyIbwrj/AHfCNFto3IRdWx5fu385IfaVqKyQ+W8IDmYAzuh0fHjEu9ki+Lt2ePR77Qar1QV3k48dwY8x010QPGVdKwI47uPLOYZ7pSUmYlNuyRyalch/uoHO/wBBG5rfRbsW2QhN8/2UGq1+O53UXC8yE66qKZRXUpjpyY2dzNNgR1HXvx5RhVslRet85j0yCeLiXVy25L7cPkZj6C7C+cimKZPgICIDp2/GGPv9eCraNdqFVIpXW3GZwccIDLuJEiYMDvIlcAGvHXh3BDOpm1Yz1KQqXXExTTeiGJ56YdOT44hsndJFpM7h5JmJIqLlHhKcVTc+mnRYzuI8TLPMiqJt0h9ZgTN8HrPv/IZXto7NNvUVop20zYskbQLVOp0V2s4WKePdYmrbL/QnNCmFjUwZNEOjNKMlQcDgMDxDGs6kRpVuiEpwelw1lzjMbD7v7QqI9rCDZq25M6YTDTqovRwmzofKmMF5BkllDsDEa7qNKtr0dAzkR5doRjLShDWwwu1FaCZprNlkSHMZLPkz/CavIPzh0w0tel7LLWZUuxHKQ25wZ/hNX8QywulApzUi9esX9cI5Az09YX9WqbeqzBWozdHPEQ0HP/OHZQle3/5OhTK6WZ9sN66UpzOgBnABFmTHNRqUpUpyURMpwDoIB7+R15fsGLogbWg6pNn7b3ydMm+X/qCFqxLRkkjr3xdYoXOUxex6B/jF9YS0aTKvrqIzAAfnGA0DI8IkTSBTWigqzbOGisxYPeypMRAZQHgPfEeqTbNpdbQd5TulgDQBgBh6WEpKKIpkz9AcDJMAyhyHPGLPjUneOoX8UL90crO9k9zcsQ2rExtntSeCqpJRlP3o2P2Rt6bfU7HTaDguQ+EFkIP58cOOpejSddFAeLBIJdwGQeNk7eus4E0oEh99aShzKCPKGLrHFFcrbwsHDSqZHTpHT3SEe3iMR2RsxpcUiR+4zBundHPu2ktfR9k1foDczf8A9JSnFklUYuzGnnA3sdxPXSXE/oz44+6gPdEDLDtqstrNAByAga306bENT8MahFN4r5CgPlpG0PZRtjpQUDFDMTaka1tCD1DD6Im7uCtnRdZqtYog2ubN7P1Il/UBrDuemDvxU2X9gCW16QtAWeO0xN7LlSJMcKApoanQz3h56w72y7bY4YWEot2Rzcemz2paW0xtqOJroBgTVu7AFRty2wGXEsx8BydmzzDIaY/mjGfrcia3DOxqrgnSM/b2+QZptKOpN3M2f5+kbcP0xzRQQQRDBAh76eucfXFXPHHAYuRAnRMTDHxQKUSwh8OOILQZyDdHaaULs4+qp1qLdBBBDqBQQQQohBAj1SER+EVxpVqA8ITQT0yC2I74Y89QngjxLNnQeP2x7htQX19K40HxUuXnoK2Bo68eQBwCPUVasmmuNPrimAgHEMw5O2daeD58iY9pWvmHjWjMGdcj4RWrANcAH4x8rBSzw/ZFWPWVFcVmC/ix9VpiCCCCH4cAoghPCiHFn1BAgggg8DgirS4+YRShRBTNEEAgggh2A4IIIIQICiCE8EIIKRER4jFeE8fQDIgHbBKK20UHXmJTGgrwQQR4PsKIIIINS6wgnhRBFUKM+NePlHBFFYd0a4D3X5fjthcUp5AO7z8IQxJhi7PlF37Od0r/ABi7Vu24NvFYuiFLcrR4QebvEzr7nL3fjEGVepManWcAtKvS/MIzxXo8Q8R+yKEKIc0usfIIUQnhRH2CAQQQQghca9GWj9LMo51zpmKXS6GAkHxGHPe3s2JQmKVkDYy+9DNoADpDUBNMOcAAgHPEJbKxSouaolM7Gli5Y7BE5T+kQZWmJiiaJ1zNGkIFu0Q7O2LamFh3noj24HujLmo+l1FQFtBJGOilquhuXH08RRbNUpMphXPgIlxHgAZEY7Ur1hyZNIl9SL2dQ2sPx5xi1YJiwgOue+HIatwziBQUS1GbogpSdA2HERABEfvjF12UvVrV9yCYCwjpjTSMdo0fDh4QkOcd0ZKWtmX18SfnFaCE8KI4htGctZydS1wMCTLG9f8AtBz9cW08eGarVrDoEugZ1imgIptTMBQJyTGa8wZCUNRGPB0j6itV5dKO1MK4CVUWm+RCV+DzBPCiPZQuaO1paJeiJmvNwDGZoV0iRugbpkqwCUMZxibQZcwPmoEimr8wSCUCkOojxhV0gAAxr3Q618bDXB2fVNrI7/olaak60KiulChObpdGUdPPj9cN0otleRaZKsrJhpL3uXeym+SjL0w0jui9SW97+QfLNbXUPs5OoUPXD3/AIpy1gzpx54hHVq5qDpns1gkm6QhpjAhH15Q7bZWtRdqEw1s4wEXigREc6d0WcjRyIY7cw7KPUoUUo4XEiBgxOP53x6AfjMJFGlBNbcj+VPfAb0lR+3l9X3RlNBMq19QAZu+LfSo+oreP90OAgKFSgVq1hJ7yW/jCP0QGEklrlfCD5BMLcjmdKbO4GDiila4+fjGe0EFPKp5et6/6Q4Du/GItyCRLn6h2aup0EsCxasbKCIZCYeUoRjNYTskwhLMOAHHZmC0egS5t+pw4MuTovw3Y+c4zRRR6O6UDFCtnedMY4RjtEl6icMAOQ+EXIn0K2QHIY01HMe63yaQ92I70wwpuZA9Kos16Uf0IKNatSrVt4HOg+Qx0oehZYh1r2JvhfAwSz7bKZdqts5p1hu6RqIB5iMc3JRNqnCVesGo9o8o7abM23KbM2wrZBgUEPqpfVrdEFx4iI6iorHGK20mSSLKKVYr/ANJKcVjpddu2VmLG/bFECNsZ+Py2VXrBQVSqSqG0vrxH3E/1hHPTdN1KLqWTywoqvWqmb9+E7nhG9TaXuoz2sw7nI7oZ3tYae6D1G23Ie/k+OfZxkjnrzpgxQNbsVm988eUOliI/qI7inbMHnRwzRpbx3+QNat1as04dIeiAjrjUYvrlt6SaK4TSjbnQXRIolQOidaqj1kQHPDI4Ds7Ib04p0ixukdGjvOuoa6jDh2iayPcM28D6s8UFl9QoddcSSShIZH2hrgPyUsoFEBwI5HjD3Xp1tRlzqHDSR4lKXERlkKdU5ub8Ria2nrVUnMzEqfpTr6kSTihKYpk+fnMGeiV3fmOswZDIcYnb6Uw63WYUtHYos6DR0xaRnp7WmR8dXy7snpW6kjQk+WcRh2ygXUdpzbZsASV6MwlkJeLLR0CJTcTu6tcqB0RDvzJJrDP+k8ejWuBtTv5Rb542qGEk1RQ1eYQ+TMMoZEAHt4fEIpK+VUX10JIIHzpts1C/HQUxpKkWlbhLWKNnTymy/JQQgOFUa45tBSGWiCmHCybg2ITD0j0387Xw+uH0Ytg0Ykrm6FxSK2pljKaJpKMogh05q46gOvEOMMmWcFE2vJx1gt8whmEtO3Q4BM5MdnPj28AxnPAI2N7I23FcuxD6PvhstJBda8qplZDNyOmTrEhME3EfLxjyyY2JfZ5edIVZ7m3TEJ0J8n9WJVo4ZaPJSQPW5t5zmplyk6E5OrqDvbR5NtNDYztZaS2lFWVSd31+gqFltyiBBVPJ6OIGpRMkh0LfKGWNarutK5Hu9DqOWTxKF0Ev72U6WAIBwxEz/Sf3zcVC91rkujMVIqbeYpZzqzbIy9JPQVFY98mKy/6IdHP+lGs0hd14e1ppxlzQiYUZ5hMlgD5IgOo6eIRC2d02EumdvLEUOotqiHIT9/71AxMpayECEYzpVj53JDK5Mniaeb48RkTFaq2RcCx7PnP3BKERGb+cGRAPsj4pPNTVJishUd3En8nMocddR+qMccRqmmKFAwnLAm5ThfJocaCIcQzD0WYcdrUt1ptFwNUq9ixxOEqbInFE0hgFcdc9IPKLItusdFV5IYL5MhuHP8nAI2zdrrYW2xW1OJt7e482GroT6xkKEq1loZj6spGTBgsGMTZmHHjEurW3xdDIa75aCdNgncEoXIuLIYmHdjW9fdDJM82hW0umXWE4ihXEQmovb5KSWtW+4cdofjhGU0aNVxrp5YLkSxPrVS33ciXAhroH15i6IdV3yiSjca70WO5yKyLtlOk731CROz5b848nqWrlq2CpLQRDiOY7UtlGjW/Iy6nQYoFShool7j7iQ4RzQ7GlrE5DOmCDooKpV0CIkigkhy3hjriZDP8AZXZ8IpxevqbNfpiKH0sXJR7IqsUPFEKM8ab7jSlLnWYP/FopjXvf54Nug1XGnqCVvZo2qY3zhGH7KNwjjq2dVVPUTBooqN55Hz25niEF+Ce/VjwfrUa/WTtdKVnb/KyxdA8lpNuXx+9VYAjxT/8AOsRaHjUZuI2Fj3cgYWWtm7YOw9HIGJ9J56Nm6bpuqq7RKS92cWS7mlBdQI62odFST0/kMaGX5aGkzjlYsvqhRUNBr0iGdwHzjr+2liak/wBtkVhvur2sa3VX72zgfOCdHM9tBW4cdV2KcxhJUypUBzvZ/hE80fy0gvnipYnZ3Q76P5ak3IngnxC6shdzMImtNSLtVeS1CdKKKpRLUgOG0k/KIp57Ah7sZDyEPOML2gbpFV5fWlFKSk1BUFRU3wEZEKdBOQgznoy/3R9dKyXSJ6qQiCKisGh6ITSS9Lo9wd8TltjsxlNmhvE7u39SyqveBwpgrTNYa1nq1gBnPWi9nUFDIZCUeGe2JXPSTyqR4CJPxm3z9z+Yll1T8ku19xcDTjNvnJ1E/n/qIYtDZwoNNOSnfeYzUJrqng837Z9Kam4D9DX3pS5lZR5ZDpDjgHCMcvKvLZZJOIJsn7vXMdMr0vk7kIDkcfZ5RnD0dZisunnCoHThxdOmd9OKx47lQmr8xEYY18uoXGZKUAJ4xgOjrkdYEVho23beOwQrkz8SvbP64EmG8JaFmvLaYqZXp8M2Xt+31CLhsACbjnhw4xeUdvKC2PSoANMtIISmlI3mQkTDjmablGc1UJAawby6xEypSTYLNkroOo/rBoOHgGR8OEYOuuQ84K37tLKWK05vdiRbMhIqHYEsYLnImKhnh15c+CnZQLx/3inwfydYoqjaqPM48Z3fz9sQpA+lt87NuEpVblHUKxmQZafwjGjZ0yerT169XpTiOo579It48cBqAcBivESkJ6QepbDTcb5vFl4BxpTCnMKAgIiOeOcDCmgXq1qoUqIDMIjnGcfGLyko5lVqyhmQsVlHomjpqUQJEwEeMw/gYuVVVKJVLd0PpdPQDKkEo9ObI8A7OMd46Epqiv5Y+pb/AOM/qUCxFICBdFml60ETBqWbIJcojKMojzEeUIVJXOrVbNfpYAeiWLShkJcjwCLMM00w5ERER07xjLSKWWJ0hNrmZZQEALJgAIHDfSHAZEA0CH1g4eStDRMWSjeP4j+b4jrKe3yDyvULigtqusSVlAzU3VGKTe+KU8oiEvYAhx7NIyQ46hrlaKSlUBLI5UeY4E6PaMYadWDSmGK027FioYLFdQCXXh/zjIGc3KzjPgXmrzlE4B+cDechKGcjF52g8SbuyMYIhj5+JXtrf5aY8Ro7WMRlF+MOM8YyPRkJ13IshhPKze7lZtBPDnGI3n+i39YkWT2srp1lwylLy43kljN46HCaYZph4+Ayh/uxpEWFSZ4nE1ttoqZ3ChNuaUUzmccjkfMRjq8s1sXXUs/sOW5bCgSLN9+Ky9+UV3pC6RyIFj+gB5aRoq2lY9i9o3fnzt0S8XfP+Q0roCQt9G/49F/vsk+M3fU/LrEH2a87qXWc7fsksKzxeqkvL24s53sg+Ptm0hyAYlHmm65xpoEbWdoxrVQ2W6uxwbvQqXkvo0kOtcdyuLGsxZPHVK84gZNtD2W2TlF0yWXZysWvXvtdCJvl0qHtAnoKeIgA9GXmI6Q3zIvZToXYabyWD/s8XeJdVBzOMA03hZEQOm/jj4xZzSyo59LnlEUip4cRfl5ucbgjdGlpMbyXuqLST1naJn7/ADCESdWOkjlciOuefDMN8cTsKA1uQjnXTEOap21uKlu1RIH0hRCYDQhPLNKICGunLWL6oWkdYkDZyqmGSwlS4HDQiHRAKAiABBCsTILo+9lNwwl61u3BNtDoVYLdCY/GTzCc/o20ZBVL426TXRVKmmy4Sx4irpJ0dF8MfmmO/QcxOT0iLdUELaI2d7LJKQWZNk0tR3wgUIEui3ZB3wMj8AmDH+VGuvYYP12zeayhncjRw0XuIXKATDhrn9kbufSQXNt8yL2W5R3BQN7yqpRg+U3HiBjP98MyyrpjfTOjevtzAScoojeMIugTIoRgQcLe0m7VdzXcedzMTGU19OQytDnTpCM4iOQ/3vqiOFZPongrmEoB6QjoX6QiIeUbNNquw5epUe6jZsTSmzEtSmWzjfEPf2xL0hAdRzvBcOHSDuHHMdWNKsJWbpUpRlnCf6Q6iGB10jG+mlo7t25zsJ1HOyWqdUvoHPXpNQp+A/K3S1aM5aF7vGE2nkVOcxu8Q/P1k+LH+eA8EjplLMyGCdUZawaZlzkIzGYvQcE1Y8RECygMw7wmygOBDmIdod0YvNUpHB4buZ4AIDoMU6I1iNbAjNQrAOnEMRVECryX4A48JiTm9TIf/pqfKK0qp5Ki5BOpkqma1AcAHOMtSFiqNUB9SXGYOOQzFQg6d4kAsqJpdSoZxmYRlEPMIvSg1+q6FFVI1BUUcxoXN4GXcxzzDkMaDsrbEF9fAv1HTLun4yD5q1Nk16HY4g8DPdtI16lKXiol0c1OHvXREZyXeHbD6FWirpdYgMpfeSquW39INAPyVAv2hESULFcdMh2Z1iathLpkmuYos+49AwrW7VZsHZZRyoIQ5HWX9nfF/slnbeJo441BfFk3FIaqlK76nZMNmmysTQXSw1W19yKBVWbDsK7kcSMxrzu1aBfsRcdbtsv0hHqkyJ1uK48F9OEfczQeIAEbfbb2kopVZKdDHVUpwsNwpfubkIhqoR6247NflMsmTugn0P35WdMiB0B4qCL/AHDr5RCrcuNL3WnbgW1r0ZoaQz1+DfmGqG1aD1qsf2WN/GzSw9xTSBf1A/fGoXZiZ/WqxQ1jou2aWec3xK/snnDnpSktRszAEacZ6q6yMTQTIuBdJJ2RdlO6V/nKAlzjKYp6WWUNZlJSMjhFAA7Y/P1MHVVySHlhcrzKa24FKuuK5ybUT5gwazMPmOfjHVJ/hEl/qqDbOz2yEkmCoKjzNBda4xLjuRcuIdTBnlzHyjlPo1sB5Z7o+dHCW0NXMs4/pIG0TRuMKjKuOpYub98QVgggigxnsLiajWI6Br2wHFGseHAh3wiyMwhke6PY/IxjUR5jHztkiszpH7SbY+6PcadeApwQQR9DwXCCE8KIkA+SmzC4nFGavTAOAgOmmYt3GCE8EvHiz1bXrjyihh8o8Q8R+yPsFLl5x4mmxoHH7IYEl6t0sB9VpSvWK83ypQm4Y5RV9cHd8BhOMwjoI/VHyHNAyqNOYct2vlCn1wdofAYrxbwDIgHaOIuEPLJVZfPQeVpgCCCCHIeAivR4h4j9kUII7orBBRBBBDwisBwQQQR6EFEEEEPiK2vCBBBBHQIKS+MhnhnX4hDqqdNJ9m6FagYEDP8AN7IaQcdLpAHyc8YuNevUmlCUJhDHbwGO6T1KuGFBIoeR2Fo7QqmU+cuUWuFEJ4UQAGUKIITxXo8Q8R+yHgdSmzVwCmCE8KI8RWH2Kk0wCAgA/VFOCKksoCACIfXDj44ECpHre62PUa47OcJYIbarV8lR2qtXyVCmaYZhyPGPYVJRxkde6CoGZREA14RmDPaVdxqFEkXATRg1MABnmMSCvmpUFR0dIScgRgwJnUOMOCqHCYMDy0hbDq3LtirME/MnLpE0lqRYR3omdlxMHlDRUs5AB5CIQBSuNMahznIGRteRPEyxMipAohPBBBIbAohRCeFEErdQOR4gqNkadKv0h7ciI6Rcjfq6dMAEfOElFOMHzMtMBx0pu3jEsKGy85DVvJX2BKYUMTYEd8EeM3IIKSaY1x48hcxhYtlaP7tvXb/cmwMfIXMb4hFSlmiTEOOMDgNYd61aRaswhXDVrrUnwUNi2BltybbJEBSzqz0hx1pMOgS68h7YaiiAz0hCeXOfhEjje0evqlgiOz3MkIXUBJwdeAsAn/vgEeOMw211tVT6jqDAiijVVsuvl3C8Jg2DcXqJJNOlzFHpZD4d347Yu7Otg4Hu33s90qdMBKt8VLn1kucWgIqGDJkCwbrLzHI6/fHhntaq46B6aicLlQKlq50BEcBp3xgk9I0TO1i9KrjXTOuYN1K1a69wToxMpJGR5JjF3xc7fsCoRUzaXVEwRrCVHiHRHhCescrGK3147YQHAnkHPDIYi4NNsuN9OdHaTYJGFRcXlICCQSAflVJhHQA+A58I+kV6L0x8giq7103yMaZsO6Lk2142iHaB8sPvJUeI/VChfcBs8aE7X/x4jnI6DCV1tRet+6ltlOUkJNbb6oJBYIiORkMUMgIfX9cUyaOKjS0Djwj5W51qbQHiMeTi8ceDYd7hDpuZTF1IKQZVnCurztLD0cHczSkC4agATDr2QPm6VwLwG2p7fLsyx7EoANZuFhl6IJ5D+aENcXGrVPSFs5DPyuQa4jPHS3CpCQvMRrzGs8cBiOuoSp07hQSOjKs2ieVQbF8GyFMKTIWqLPmW6plvJbgBTS5kcN/ERAiI4Degxz04xj5Cf1cwzdo8Px5x8rVhMUvU4xr8IuiOk1K8/RAMjwzHLDDnoDYxkrRZFiw8WThCehWGuOga+OuYzdMO1qFL1IhgM6/VHtutkDpU4d9bQACmMgI/KHwjJ5i2KVIM5CXgIx3RTVqLNtaCkEUtuz84vaiyksvOj0U9VLmRNlgOGgAdCFcc5Afqi6lLhXBY9rn9bBJopwMW5qkRncJo2QzMemSBEZQKnB4aiHDPHhDblKxmuOBEc8A14xkSssuk43KDQ340KEWUxWSqUA5lAwIYEQ8hGOiSqW+53ieoJHMso6Ujz1j2eSv8g0pEBHGA/jZjLYshAMiADzxGV1Rp1vUgGnIYGEdgWdKNMQrT6Qma9GgPERz2xdVRqnaClWIjSyJY0JQfHIhFoSa0hc9Rr1qQ1y46cejnu7ocSs4U8DFGtRTgAuW4gIiPS8RhwZpM10j0cHyKUMLHiWkc9j8Hx+0JiWT2Vl28NzLPtZKSZzTQdl2UhkuE4B4Mam5ROZ7sZ+qOx7bGFCQ+o2+31Xe0tJS//wAnY53vQntd7XQ2kydI0YKnGJZRMF8FBOHOhIgqB/ABMHiIDG6raEUk1uPagoOg8VViptU31YJkVDjGfNMMu8XvhnVAmRNtkFHaf5dpKXuwbxSORNEaAdvDc69EinmT26GhjXqo33tWz67cV2TbuVUMgxPZd4tx8HesW+fUR4qgfsHTwjbh6Q9ttu4DPrvlnpRophV3HcyP9XRzTu2ca1euBf8ANy01XA510H/lFp2XMNV7cJyecPNu3rWKsvGIPwGMQZELN3sFUDNeVLEC2+FN8Effe7PfGKtx3qSqTTrZFEUsBgVrJZWAN6URAdN2xzDOsZajnk93pZ8TKqXTDCeWASxYQHM2ByIAPbrFkUmTSSgIKLZWxKrO71zk0wBjQOQD24gt4osgsRwx8Vl3t7fOTmAEjHLuEkZ61Pe2XpchyZzkOfxY2r+jVtuUt/eHaNvsoKhQoUtRbCZIyeHXeFEej9XQ+uNOVzUB3uikq3BUaAzJbgdB4RVcdFOmriaER1+EbRbSLxyzvoxX/cZ0FjSm6b7vytTKGiQ5UU1PLBucxvPjkfONO4XNrEE823jFdRUW3KNXcygjuQTDyHAZ7oodaft3lqUlpXodcXdL3Pb4hRrqSt6Um5RehDIs1/FE7h67+/8AyGWtACaI1RVUdWDrs1MJI0lagfDv8BwHfEgtiW28j4vc1U82XMmi4Gt9OAAcMD2RBe3ldT9oiMqTXnA/6zJWWUef7Y39+j6QAtzajaA2hl2h0jFsmwrLchMAK5HqdJ3sAxxjkxulF7Ya0sxRyZN0pQIpI6+AI9yZNmLqi9zOfDfGozaQW1a/O1Hd1yUFMThWi6DBJJNjpkqnzCUJ4/4Q174ZBGVC7QepRX6uMGZCRj5RM7oEwcMaBFyJrDjR0BUc1Q4XH2oNdA7KH0hEBEYb2geLKhg7UriY9fOICVAMZznnEHZUaQmxo8D1yptG/wD+mGZVVtGINnLDMR6Q2f8AyxeHs5vbByKS7QIl02RUNdICRMRCSXPIAi7NFLmM1Jqksg+uDQB5BHxOZ5wK1GWjQ3kTI+64DURAYdtoOMmgpBtJMJRQTIjmVV4zBr+PjFt2fbchSRNPTvjTj6h47lScovOqZEzmMYxsvb6w9ttnInkVNLUFBLLnE4qZDekvpCAHw55iTNp01Df79LpBtWLNVMOBoIiI+QRDhuBRArSx+cZ58ImXs1Nas5XwiFy/ERyOmYvNCRVYxx608WT+Q2NAXStB2ztLg/AXOOkuw9t0F4vxt/k/SipRMN7giE8R0jPZH9h2G3G+ZSfzRL7I0lbOb7a2zBaB/bT73SRV0OyTOPuk2ABmZREgU0DEbzqzwJ7RljG7eBv+9lXYzS74JBz6uUEnrWMU3qtI0nCSy5/1cffGIpdaWmnZ5Vv75P8AwDTZtIE1I8sHlAulGt1N/wBhjnF20qyPQ+ZzBH51KR1K3luSrpRxDMeoKG/Z5Lwjk8xy7bdXvzjVVDPvJtU5aDFzaG0knssRxnFq6IEkntzor0OIIsPahv8AWWKdTW+uAqFGwJvfTbbPfPze+EN3ca+N5bw1THtw7gqlzn54SIkSyenHMcREP74vtBmyraC6nALgRC0yBLQHczk2FFdGvn82DGuMZh19h6zFK+d6KlBwJgm7Y229S6X2Z19+l4E0wB/yhCbyDvi9ZmOZxazl8ufImftDQF1QdsW+uncc6QpM/a9v5CX2wDsVJFuGql7Vd5kcuduCqUBULUs49Lv0rfL8BcKoHLnjx7xhjtt11UlxTOhnejRsffB7O+Nht/r2US9auWLnhKGSg7iT1jVs+k2k6qTquA7ltLalum8b35XV8ZFRH/NQf1nFExqqspcJLkXJkbEGcrJoq8lfdXKkyNiFGvWogKzqr1yRAoABIVybNzHAJJxGh/SjRrhjx/uhinK8UVo1K6UzK8pxXCcZVFz9IQAMYzuoZyADnjxGMxvVeuRz1jrft8lmmXb4R1R5REFFawICEynMA/KHj3fdFeakI51EcjnXGfHMQDSnpGkD54m2/pL/AOX+Ya7pudu4kjHi/GU+F/y/z+oI69epXq+urZ45ERDjCIBEByEKIUkSRs+boEiVCYyYMzdEsWl+VNMI5HAd+AGMcKVVdrY451DiF9VAkCXpDwERH6Mow4qMlp6bRFUclUyWLGKATlE6UR3xZARxx5S5ENRjwIJTaL6gKg4ZtQEQECSTgf8AzDr4BGE169Y9Wq169WetXmmzkcj0u2JWkiztJWi72hVX9Pg+ylX+s89fiHTGqVecXFTXKp6lKXo0xLJ8o5AqE3SAcDqIjFoo0axir6mhkRzgO+PtArNVHOoUc5GbP1RXqnOjTAuXGaWgA9msNiiiz5flScUNz/vn9Qc+oXUKxRLlHd/eD46gYyIAUENMB398WStVqV6tSvWyM0w5mHtHkEJph1EA1wGR5eEZARTKMwhWVKoly/IAlERHyhxaKS1zLFj2RCkbk38vCQnpnHLLlpzhUkJ1ZSMfKES5PICbNTAISlAh4EidRddYkw2MSp7rMYDejxqYCQHcCACZMmq2hYuACA4EQAOeoxhSOmqLwr7oVEumIhafJsyIiBAl2zTTRdVl1kk8oLbZYGS5DpDKbUhAZT61geYdnHARdtroNbdj9toc2zn+F7bn0EP6sHNcUUjuFz5Ez/vn+Knmp56ibey0CQi7SmzsymGMy+qq92UAk4FQQHM2VaXeyxUOwZefPAR24bV2041SNBVT3xQSm8VSdffhjiO9HE3pFfaqs8jUa84qYq9ZZpzTAOCRguTmNFBDzl+uN/G2LfG0F6244ra3edKqyX8KZiW44IHzeo9T9kWjKIu5NRou3JkwNkMQm9kDy6Z3Y+jmkrblTETzZMpC8BOYNm6NlSxm0U6VV3sjaCbzAVHCv7kcYaggiv8AVxjnwEOMQb2tWu1bFXXktExj1ZXG26dQQ3K4JZcdeLAanRAOQa4Dwh/Nl7ZWYa3c9q3XG/vtDaZpmuvVhyD83J6eoJAaft84jhtatYwg7Rl1k85NMNGZ9KJ5ONCGh+gYOTGZRAfAfqi5bcpLVjnDddznVRMUqpsvt7YDa+iKQux7bDtxKuc9SGSSQNlyHydYYom8nPVGiWFQMiXAec4jLGxvZOvuWby3UaN3UIs/7UutOFrORGPB0zidKP0TRXvAR8w7I1uESlQKusoCIeUSFtWEx0/SIhvPrxwBXHCJ5AlVr4DU5tWf4xqjRbR29nCMZBYx01tzKJ8NhrNPZL2wD9Bzm+tG03FQi9WOcD+Ui+9gJER79RD/AHY2u7a1g6e0S2h2nyzrTG8gW1b9daKHHUf6vbohoOvwCNPF2ERRvq1rRO0uvpYvRgsUs1XEgdIZXCd3U2PU4Y55Cb8ZiQ/+EAXTdNsthfY4sU2lMC5O5VEy6n2aRJhlTV6gRKJtcgXzz6M04TY59GIRpHuR5Z8hFyqBPDW1DHED03Xcto6U5WQJ0iJdaT48f51wGqdt3dss2Lqrb1eC/KclIl6x4mySMm/zO4wYyAExm4YER59gRpluKylFCO1lijNQqEjlQZgAnN0t1yIZDPHMY1SUpFOlRonag0DQ/wCINAI9v8bt8Yp01RRTDolzvSNUxmwZKz6Z7oofSNekFpEiSN3zbVts3RKo/AnP+0TH526SdLr3ShInkJ1sUilTHOTIbgz4Y0GFdCbuAewYvBOsBgd3Mah3cozRfaUm4i4UMBMJIT4NF8jkiIiAAA/tjDClERHUA0484omMtact649gXJ/zkWIKmdkojzC7UaQl62A7eEP2wlMCIeoMURMpxkQ3ooA4z/eEMam16dOcaJgc0BmzDytWhWo1Bo9g48I1Ho/RRRR2hj193uB5svW1lyUGSLTOFsnKNchPOabylnq05jAiAcchyEOcZSl/4mh24+4IdFqFElTloIS+Y3NEU5snDg69XiH61iLUrshXZLhPtldoBIZSzQ9IA0A3y+HGLfRabPTBv4oaHjLQrEyJF2Piluz3PbyCeOw5tQnLDvYuz3wYA5ZJ7mtycxQ6I4buf5UK98dFhNhpqqTfDG91NoLhQT+5m/6wLRyAoX7uPR5hwjrU9H6vqVx7M2kWFCv70kpZ9qrH/seILfUDRBFGdYkEL032skxQQuxj4zhMNeOy7Z+s1d+T1APeiipuOsdDmyuzydD1CgsUN0QUkN+WDg8ero1423ZPWrqXCxfOOtDAZ7Pe4kx6Qa+Cjse+j5uYvoBgUh43YTPyVsSYJekMoGPdTo47giq5iSkbikGyDf8ApgqCXeyF4TiLiv8ASRyMekT2iK213tr3mvcXmNG2xMu+ytuhEBAJUVHHdCX7f96IgVNA15hn6whOVmClJRoYxkc4itkaw9oBw7vxiNNQrJJgyatmw1LExjWMaKIIdYg3QDI4zjUfshapUKROsNAvX3mUNBHH1RawmEOAwDMI8RjI2tT2TZsnSd8Y08o+R6k+kEeY9SfSCGhnxH9vMPs/WPcs82Rx+yK4VJsAA8AHs1h5WHaui8GY+XcLrREOZllaB2RLPTTAoLwVzQFuiUDmIZARz2wzc8k0ozhNgRAeXdEgVjpBk0bPl/FrFzEBazF03SSXXJgQ5cxa+fnHrGMT4yE4DgAHWWE/Zkc/J07+ESguzbi3jVazXUWi4TamtnCgzL5MSQh1fXz9EB5hrjyiMEwah0flCPDGkONx26tbzvZ3Byn3Sn3DZ+MHXBb8hbMkaKkcutpQtd01DU+wJ4IIIYAxivR4h4j9kValMaY4HjFWiAiAeGPrgrcB8A+2H1Nlqo3XuB5jStcKBNBBBH2OA+gOBAYXxb4+hMIcBghBeqFa1pQIL4Io0hzqPZFaHpFbXohAgggjsEK9HiHiP2R9j5R4h4j9kfYcUFqakgHBBBBB4QUQQnitSHOA7BCD2iuNOcED1BCeFEcUeoIEEEEHhAhRCeCCAgogggghmECFEJ4UQIl1ggEVaXHzCKUVaXHzCCwQPcEEEIIexlAJR5j3coeS2FxTDCV05VL/AJ0mGwnx2iH4GGZ1lHsEIuNLo4Dth3Zq83cUIHy3J2Rt6WJLRJ8ihP8AUSb2h9oRyX4cRl3OcwJtVOY3o124iMeePfFLTo4l1EfLMVKIDx5Z4x7Sqy6uvXPnUOHm7rvnL2nTzs6fO4PxGBBBBBAjQUQQQQ4BC8JteZOMSzhxAcgIcIkUmX5XyrekbYHTIpgD0gJ8ZchEZqPSmyOo8vsj1LRqzcc5+qB9bzc58gsK0r6ua0M9bcOYmcXc1MIZ7NIqp1IZhzxEewISVptc4jPWpPTomukGoAONY85qc9R7EM6ScuRHOMZpDWof9tjmPOPvrO764yBYKFJTVbd9C3S0jG4+0Vto5wY8ZqxiuzjPaSQj1kI8erKgF1MDOAJjKOvPMYCmqakgKhRVSDhosopk+9lDZQcTEcDoID5/XFzrJx0jRpVRHwEfx+MRZY+cuNCUqPmdUxqjTU6lQguImHI4t5XjtE4oh0snFObI69ojHgpXnnHoiGRAeHAIf1h33dCVZtx2nTmulHEpWHfTawJDfVIiH47Yj5SqS0ZxEJRznjwxHFBVWlPCBxQoUqKLiixj5+IX5IV5kI1Rr0QEOiOgc4ymnhxVfXmBznUecYeFGmojpy7NMw6bVaqfWQXcsH3ghN803ylE4SRT+esXYI5DolO/n5wYr09KU+FE2gl1m9KN3G/HBA1OrKKsT6+3oym7z77ucwb8IcBxnnCs7Xo0jdbdxmLUBHAcdA/H2w51m7A3TvOYPFrcMlUdpkkW302VTw1x2xirxY7qZC7XbLvQ1NvLpQ174SWiHV6jJ4gPiMeFw1XB0feFhMmci3iU9wI05TmSw9cSHA15RAAEM41gKuQSdbpBr9sZheqzZ6yNJjCaeSC4jL1QOvd1QzvS6uDONe79sNRQKevH+/WObJ3r0iOED9H2Aoa71pRInJIyBfdVc9Wq1/U7vzwAadmIy5kPM6lnKJ4jQoTTAH7sBsOmA5jFHBRSKJuYUzpbuH0eloIxTQV3qmtRr0MAMvPPZDik71EhtGftcZBKmklLsrh1755zimpl5q5qpNMAiAh8kecP/s3Ny3Kxctupl3FZUbrF3vouJXRSO/KBAvjXt079eMN2B+q61Q2pnvUUDJ010pwlDTI6afVEjHrbFrtViN5ypDoLKqoqh78jgGJk31wDxh2jolZyqd83rnTR3xOrRtdZ06PdSJCnTR3z5/MMAuensGd3nC9uethZpc5W9nzi2HRXjxfOgzY0zx+uMTKUSSVvW+UphnEMCHAQGPCccIyUKwGaImjPEAARjKGO2JF02sq1cuJtNbSb1wqlhmx0gyAY8Mx3pgs7JsxC6w4f0kUVne0NyF1h6/MTmHR36CJMmSbKbVtxqFBDEV9cIMYkE2qhLkpnH/mH64zTaQXl6gmrhYK4hp/QNAiQuxpbNo2E9HlZ40kzTFjdy0oLwK+/khmEDB8AAA8gAAx3RCba5WKxgm/1BHuMglEK3yD14TNrn73/AGg/zUlRkaWqrcV+Hqxr0vtQYruhmtd+k1+gy8aQpBotvVcx4vk4RImFtUFJJFdzSSecBjOIhc9iZol63iA8JsRKq4awzjznPGWOXVSiDijkkt/pAlXwOQhlLqVm4Yr4bu9boBekM2+h8rOmfujTjxpHosD7BlINS3TbsIhbS3JNcifZKIiGemWOyDTlmGQR454w+iGFAUc+kUEgypuQ4pUCaUZIzZITeuHQMdo8oyN8WrVW83Gw5zKUYTExeAwcSDh0Mynt3HGQ8xAPOM22M3S+HHtDMm1CBQTepji6DqcAHCAKEu7p5UTQiPkHxGK2uORrbqp38tuazh3e+M6cm10ayB0JY+TOWmXd75BJ/aa2p02xdpmrsnjbNsOL2UtNQay0K3KM5BvqBgpkRH+0hqMaTE1YKl2+qETmcmpqE0ohx0ER/ZGz30jtyLE3MAmDQS1WW8LVXDCI/HGOiYpUAz0cduBjUINKtWoDLL2xlKSl1oSqKyDYp6LNzGy+mcZ8RVVRaIrcGcub98Zi1VECRmgYJjMFctqAgEbsHifU7Nei6VJVYgTKGr3OdKRkfpjhfAJQE6ez3YAY0zMltK5k2U9STM5MmQCmAfxtdfqjap6VC6xpQSNnmwRkiUQDjGt3K53cnkBHcwUTPSLlaABzCUKYgOeHTCH5WRkYuwWbd+TIocpspeD0Ex6m8dIUK3+DOYxv3MPzGuR6sBAJFaYJJsSxpNTukrAcmGUQHPIPPEMbSTauRxwzkO2LbMqGzGk880wZ5zZzC6U7VrDSERwIBgIh7u47TueQK4btjIgicdtXrzXsmxUE69ktQ/6MmulgVU5eHQQERlEeeNMQ5TXJJrromzKsbMAZCUN0ANQmHvhmJXssrxegnntaFAcBpkNYeVqKpQiZGr6kQlEekH7I2LbasdqibAcx/XFr2UtCLy5GCBzcldxXvjLkJImoVwEc9w4jcjs1Mq2Tkr2kUWOlLxR0JKWY9vDh0Pz9R/ujWTTGk53INZOSiqVKcN53QkGE4hHQPsK2fOdWoaOWI+9HFSCL0naRcFqED51DmyCxdJbxpa9pLRLE/SH6vsGW+lguilWm2FbeWZTKwiu30eATnyhHhKiI8wKYD8ZpQ842aegN2jVK/ewOZtcYURMOazxU9b0zLMORAoSAJyGR8Jg+Mcwnpir41bp7V6u2UivvbO2f0MjbZs9wSgE03xzL8BiZH+DcX6K232pnraJRriVSrytaU6kDqIAZSFOWYPiA/UMVTO2hhou6D34Tp/p8woqXtdn/AOHSeNejIXbPu/mOiy+TbJmE1W3j865Ro92urS29Sk1que6LjKpLXcO//wAFf4RR0LbWiag7nXEt48Y5udthAUlxt1+ryO9leUfeidFJvIkB+ht4ihc6NRomchPdwO68I3z7GFlqdhdkFrGjSXl53jCvdNYz/RgDCL9QBGjV+Vq2u8e6ZK8Y69b5W99ez7ZIyOHzWrW5ICTOEf8AVIuDTI81EeSKQ8blF2fpMO9Q0bVYdsw5xNqJ1USIrbgWK5pJQipvAgAfwgMxqUu/tHLtx2ahMcE0omIjdVDp+QaOQmPzGRAfeR5iH3w/G3Pesvdy5hxCZBgQtSyzAojZxnK3u4CBtVm/0uPhgeca9lKX1EoTZ4jjERjUu42DOg4PkSIXeFFT1xyMbEktthuJELvfH7e3MMVPVtRAO3jyjHa1GarMASyiI54BF9N0h6WQ+Axl9tiCyectKklFCpmYA/d652TJEnqOREeABGdrvjndwziMS/zb5sm4TOK/jkaruiN2/WcwblJRjq0bkKEaM80082ufo4DjGSHzqeilhIocu8GQn95WgCYBDI8ADkEZY6lVLSCMzebQBMXARA2qyiIAs41DTkAdkNFVlGpMABrMPaPGK8l4lKxEaMGJ80ibjX7noIhwVqknXUpHzef2/EJciPfmLiVIiFLfTICBcJsCHHwi7USZQlSE8p8QHJZNyICPeI8gixnTlU6Zq164jkRyMvdwD7IgKsa1hkNold9wbhT/AOc/5DnjWoTVq3rx440ilgaogPCPgUhAeY/7sewq44Zmz5wzePWou+OPRcaY0icw6AZMZ0APohGSt5v1VmaofVjUyckUJgA0pDII4zwDADkR7oppqDRlLArrdUSxAJhmLyYAThzXGgfeMIl9xnVcaRaQRLppURlJp0oiNMoHMA0+uJ2lscWwI8nC9FxpNO/6a/xfaPtJLVdMsLyuOSmpU5UpGpTJ6TSHO7AIjOcmzxHtGFSemUEkpRPH9DJkR3UtjUdeIwkYNdKIrpA8vUBrp+cTSBpoAiAhGS3TcCMqus8ebpfdE7piJUryABwAB9QjFo2qs1bwh9INyuSne5iESS7hO+RMd1UNewPKUWLU+bJq/byDaB6Hi1jiuPtMq74BDMuBsW9ZppbcgY1CUwWErLnzGb4BE+bi24bZG6iSW2hCJtk20QVQVlXbSGdJ/lDlLKPvQFpSmePEOGgc4nH6M23TdsZsJ26NNJxpnt7eJrBdFyGxDE0oKwBKRSR8AAAjWrtAse/jivObVTSGquxVWVMueNnADIbzXEB3UfhyjS+iedim8MtHrvNc5OXWn9dbfG2P0Z7psOMtd5BOFc7nEm57eYSY28XkgLDyt5aOyCZK1tn60DMImU5JJkerwpzH+iM0xoO0MhjP86PF/ExDuJsSNfagZbNXlBdtq5fyWuZVGYcTp8oCIKk0odgjKGR4DNriLbt1JLpTy5xZSEHqBKcKYQOu8CP6OUFrA72PkOB8oivabbWvLs8MRVYrRFAONFxiIrLcdKbKvpx/PHsxnThFspq1ioRu3iVMmROh8/t7YjVa6sfCW+VhErGIko3zlPkzkIfgpq/k+8RebV23ATpBXKI5AcjgRGmIgHhEl7UqW+KQu6unmEQwWHpAJKUQISj58PjyhS1dqdUVVSkWSLCbPxQwaM/JKS2yKdXiPLTMdNgWgeF49i1cL3fS2EVVFZm9eNsm1CPUCc3t4SYFpdKVsLM379Qzltm7mTIPq1bud2i2bXI4dKPUkexkyEIco5p1xytavf8AZh8sbE2lIBWU6eLYyB8+XKiOPMQl1/yYW7fdxX7twUEG2y7XTSitbYBONEpREE8kmiZKEOtiuv8AlUxH/cGFU+z5cVubWthmrO1RVir4KJ684AAPaBPUSHSAFk0Pd0el54iHV37w2pYl3nYUTLipa+WKuY9TJHmySNHU6rQpTD0RlEcceHPgOsfN1y9jSkcsvcx0yNnKmU+tNk3DU+DziAXXfdh3clKttIChU9qX3858m4anWnz/AG+canXOynK0DsxNyJZpOMSfSCYNZYt5Q56/1VA2Iyh+rmezX7InzdradtO6bZrLRSmcoOB4OAxRmF2uYQqC3gk0EE0JREQzwzN2xrvoyiIjgMAIiID8I/Pi6WcHaNz7PY0kV4yOXe/yzj8174g7fhJs7C3H9HjbyHw9qVDutFZrt9V3YzRA2mG5g3wsOkp2FTxaU7RP0VQiMxpvqkwzJZwf43j39sY631YtQECSvRESAz5lNCHSnIiPZExLTtlvvkz+Td1VwkRHZNuKSvAA9FNUBDBM14DwEO+L9iGbS4re17CmR423kin40f6v+zA8FHVnGCsVn4N5P0K833/UIcplCYAyA6Y4Byh5GlVozSUkxVHCeYHJYwORlI1tMj+0Isa0w1637nU2u5yRkqtoJsSR0n/GlEOX1/XGSpxGXo0KVYRD5WMDxDMWrbbOiLUlHBMihArXjXiEhjUnBXeKcP0UJ1qNagX554cYmObYta9FmRrkKJs5c22aXvxQM6KDewIAW8s/jMRysVQTXm4Ey3LnOgkKisb3JouM4HyJDIiGCpnu1jbHYe2Kxbly0FBYoGt2KKu4nEfmMHTs+ziy4UGgbjvVFnHE1G4p3DjVA0Ec4dVySckFzRw5MPuhQlnpHsftjsJ2UWSTsRZ9Da6h+lGmw+vFjtT1GNOlk7HNyx+0s8VDchcKoUNb9apHz+rLHCNp5x1buTG35c9va8re/Pw3/af6JEQvudaXDTk9j2BWWl29UZtUkVE+LIUSF2dWT14c3kyX96Nmt+01jSN/hB20RRcm0PbTZhb6nMcQbJIArbsEAHEy0r4Gb4S8Q7wjpT2aqCayEA++Fk8WSUtqIIulYxoO7o8cBe0Pd9R2gr2XYvsrVjZo5ct8n14sJzUQIZ3YmPlLgMdoRGNHMckvdL575Efb2+UR+wIJN7IISvwqIZyCE8FSrkeGefGNBjQtVqUEH4IIIwuMXAgggg/bKgcEEEEEhAgggggIEKITwQggq9bPRHTIfZHj1w9/wCKEEd6O16dsIKII8SzZ0Hj9se4cEF9fSuNBzqXLz0BCiCCCR9FLlCiCCCJQOIIIIIQQIIIIQQUQQngjuitXUhBRBBBDwj1hAhRCeCOqK2oCCiCCCHNHrCBBBBHoQvSZUonjhSgerbqWEx70ax0uiA8R+qJsbadrdlu1Bq2lDZpuqaudXVWzv7wmGUcJxrsAfu7ohQSpUq1HPDIY74tRSlLMaEZhHo88jmOTxB2vqa1clOoft9wOaKlEGmoqjxj1CiE8EFJdYECiFEJ4ILBAUR5Gr2Z8c8Y9VgAQ+TxzrDr2ztSt3ENnqCXWofNaXWPGZjhwCMoFi/Hj2Z4R1RMqsqRBAmdUOMRBS0y/JExJM6pw1EEKaodIQDONM/bHyOWNMcALqagggghwBIqS0gLhjXOfxpCwAERwEIjxkZJwlDiPOHiuraZaszKyKaq52O4BfzOLvYnM014F2UgXM56JY2IBgJtOGucd0dl12bZ3s9B4kbDPSlOjIGihRCuqmmy9KjXr0RCUR0yHGEnq6nb9QR9AjVreYKI9SfSCPMepPpBB5uqoNT8oljsm7PAbSd06DFVXemtAqJXfaiufmznuhvLtMMLWXRdTAIKxZwFm6qbiCuR+jN/frDWkV+pWrBXJVDBYwA6zSzdGb4xkBxyYrUjA0Ne+BEW6216/aPBxImRWfMvtPR+qMqVkCjQTt+LjvIDoIjqAQ3oVxoetARDEo5i/kHIo7hVT5q+SojgQ4ZjJ3g0W6mNtvLKM4i6qtKpesKukARx1Z2awYtUS+TMlKpcqwRMmQu8UXSo5X3ddORmGgoppfFBo1zpMmikBmUNcjMI4DI4yEWO15Foprq6VzEZdVEKgVrSmkpFOgnKMxjA7riYeAAOkKrUXUuDYtzi9rbuE01HP1XXRwPkcBOBc9L8oA7uA+QRhxI7XMV61evnPDsGOiGtXdkW41A17Xt7tF9PHMdxzfIMnovFYQwVSyEenKFVQoJE2AaCeodgxYk5CMGpt49Tn1M2RDlximcTa9ER+6MwbDsV0goppKeeNFE5ULgUVSoTfJPYHgIR9YI6rjEgZo7bLEbztDavshUxmUKmsbkZVSiWAgJvezswykPxrGS4pmjvSqzgOOcsXJdR0CghJp8ipiZUptDZTAj0OyMaTTSbKTN0j0wiY/VZgDGNY6KpLIVJw97iFpx0czt8xIrIXvZs3WJZ7Jm27c3Y+fhh0MASpxNVi25LLdUNU1QDHOLRtabTqntPXMUbnr6KmN80fAAEkn6y474hSoHAomJQ4a+cXlQr+uKAPdgdNIEpTp06198gVG7neyPmFD9GH3ZjWT2QmMm79xUdr3MZzhOH0X2EB2iQcPu+m8mvU6gGR0yPZmGyTau716+45ADWghzi3NwpRmqgB6rjGo8/jF9pUxJVQr4544QQWmFCOGw6wEZlQI+FsOBWoDvGOPdCOicrffkQxGdGkqr6mjQrCO7mNQ7AwMXkixqZpMqqlasHSGYJQDGRzCRYO11dRkEx9zEsu7rsIu7bLnEuvRrAVAQ5a4lGJnNrY8vRceyRi8DUPoJyuDo9libFNneg8FAeYyy9ncPZEUbYWxvrdNYTEm3LDczvOCYokikqGQGYREe/h3xska+w5tQguJZ671321ZM2k6btO4DS88k4v3Sl+HxGOkxdNvQsUbbXKjYSha+7Yt6EMhLODtu7m+Yaua6DWSlMSCsc3T3oCZvXPR1D+6Jx7Omx/tfP9UVGgymkvMBAeiVuTscLqH2fSz6OI5+VnOQ45Dv4xsgR2v6L7ZfXG2upC+4L33MlHr4k4T0wqMoGfD4xL7ZpWL27Qt5rZOBQY7yt6zTa9QPHDi4Q6vTlBO4xU106V6VZkXtxgbi/pQo+49NEszye4eNMdQ4mBtCJtZjsO3Nt/X74ltNmkEP3H+0FI58Lv3HtKiXPrK94GQauE2CqYfIE24SHoh8eUdEO1RW9o3UfT3C40FvJZNL372kPfwdjlU2jnWTfp4gjozdKkzZM2fE2skf8AvdqA5hj0NwPKqp5b4MhQxaBLWkrinDy3wZCiDK5dlxEGSt25IVi4tdwL1BcnJ9HJ+UzQ4Q15MQVvVUDOm7ch5c4trwrUSVUK54B3fOR55hiy78VUo/SOETcwTgOQHOso9kWxJSWo8Ic+LEuuq+mluXFsMvvp90ZmovB0DKXlP1TRtFS5vdCojpKHHSJ6ejTJ02yl7S21CtUAwxGELZbhw6OQ3o3gTo575Qk+Ea0JbgqCWKuFLd69c5pNMIZDGc6RPS6b0L7P2xRaaxVBLOJTqugNe8L7GccieKng3QgA+EsoB4BFC6QHnKhjoInNqspzn9vrGdbjd1uJsm3242Haz9jyU/ERfQV1XXXS4gCqVKqi+oiUmKyhr7wP6t3ftCGddSCsWhubSoOdJEJyhkZpyc+gjniGQht0xwLRRRnViFeaRRLmN7EyA6Z0HXz1iq4nc7bjr/WzlUjS2o5xMbOzjUmm8f2RD5fSC0nIRmgwRW5RO4KdDucft1Du9uhg8hEW9SGo9bKZkjdjJ18/lEndmqtVeN67dIxmsBVMNvMudNlc6aRa9vG6A3T2pbprhb9Gpi6DIRx4gBdGoSpcoD/+am+IRK/0dCC2kpUeV0HOliJS2TMPLgHB48PwEauHu5va93uFygmkEkF9bMLHVJGXCcQExOM00sncAjnx5a4iJaWXjukQ2QfG6Q+X/vEWVWWWNTXn8gxARGYQyGM8NIXFJRAdQxp+2HJeyYxy5RAmZx84om5ieVyU6S9VLTMZ4ShzDAiEWRs0SVBWJCr0ZjJAJg3sA0EQ5h+OyInD2M7RmyMVzFOludKTfJvji7b0Sc7HnLiLom0K0o669ocIfdm0QocdPCMXkKJBlcNVUSgMqd6zJQvPkZgAQDjEsGrasDE7fJJKomqxtWTAOAAcCIjn3Yc89PrjeNqxOpaalAW/ossyRfTevY5T5P8AQPPs6oHtG/EpPHXe+cdVthgauz1Ye5t73R7qhWntyfXA5j+aRow2G7JoKtWoLKyum0l5daEPY9uCRynOBO/lmJ/emEuZRtLsdWs2YU850l29S5QXnNppuyOIBr3CIgHnEKu9mlNXAzil/FrJg7SyzdzV5M4L4M6Y5vibhMvN4Ol7O6mZVV14rZ9cVhzgRMH5hn89Zhx5Q6+x/cszZLbV2brjjWmLl0m5yekKkwBkN2PiCVNnynER8IYlsuVSaiymLqRNuqklmgOlJ8ZGWuAhqARUeK8sPdzKruNZ67VVSutHDhMMCFcwORx55+MWu9b7c0JH08ZmFtyTJmvaZGDbmVIb8h+ixfgn1sjoawX/AJWSt+CIE3meFn2423kjo7ONmxVkHcQ9w4mYnVZ94o9/tj+wN4G972Vdlri//wBSRqp2iqJyh1r4cYy2ykla08OIXfGMofXW6rsDfLvlKObi+TbokXIqf2uN7dk9vCyd4tmJqte8F4kG2NxmQzTFuVgme0/VN03qNIe0V6kuvbuX8u2IUK4hXrahkOOukaRkYL3RQbBxLd0a6mLbSu+2GHK3dGHKjQS6ygpkAVCppOTPXlSZwAHBwMjgyH1D8IjS4S4EzNXoj0sc4eFXUhz8kR8oaBZqjXmr9LPHIgPOGq5EMEuDziitIDuJWS8ASyKZuIWZJQFd5L6a20AnOpKaqZ3IoUlDWYR5B9Y+UPI7D6Sy0SVitStvUpYcOBwSCIAu1gHhJroWDkA8ftkmzbUGrMbNyfdVeJnCr5vxJWJNDIdASDXLh76aHjkFIR6IdwcsxC08VNHVWanS/d62cBLKGceEQe3IHoj3M49+OuH0CCM1ZLwsGm4R98OfsJzfeG5mLTyVuhIHSERzp+2L6ppBRn+prKk9A04c4mSB13IQ/pIduOUZorGCNtKIkQCkaf8ANNgwYDUo2Mcg/tIY1HUA7x4sLXr1zdWevXqDWrVhzMM2R1Ec/dGatIFxxMa7OzYkKs4/fIj/APJ9waiNCRyeC3vj+D+f3CqeUDakcqnjlaaubrzZmnEflDnuh3illXZXtVWvDUBOBpF1wEGbonqEqhMYmlCbo9H6WNf7oZYQmDUPoTaSzTS4EYyUuqL54mXbVAybNk9593SwEciI5xiKog5CF2p04uNBRwodM2rym+Gr1HP5aglodpSqtHxTGxKbLlN2/JWox2UJpxCSUBHPANIcCklEmeI1XGUGutZH1CHMIhMUEB4mg4hyxKH/ACzM2lpdpqAgeCio3HHGSn0ibKEBAMGdNTWeXCXvHiyRk2YO1qpgxUmrmK48ZuICI8YL1KNsc7jKtId3jIj6/wDWfF5Bz1Wy4Y8YUqqyeWjQmVCsM9QdAAeAeUI6dIMeur6hnOcx46M1DkOOOvEYpwyLOFquTvJXfcH734gXrFX1w1JuGBAdcw59qmgUf9zbfMtSU+pirzeKU1jKtNLkCNE+ckJzGP8AdCfOvZDVw5FrUBYddx2K2W/RrnF1yOcgiJBbGs5owbkLFZQ8xCHqDV18i2QX386hB6nSlVCDsD2sbfWy2YGIi2wSXWq2eYqAIkrKOUVD2hmImTOolVYY0/Eb+7VqUkPBQSL/AFujYG0zU4dXiieOOfs/9cbjNvas1Vu0p619366WUXiiCX6mWFz9QUY0XN/YAV7mG6J9sOEmcZpQkLocjw4N1vJ4jnPeMaMtD9aKrUyF4uEw80fw8jcKJ3DZPPI5u0N1Ow5Wd+1bsL3Gtg/j4qq83RVhbTwPH+vppRL+944xonmpVp5p6NbQN5yIdmsbU9kS8y9Zk2eYjYKFT1vagzFC6KEnv64oGBwBrPf2eEayl9AUkVYUy1aiJbBjhjHR46BGvaWs8i46la76eY4/Umll3PbFmRqE7vp5lSFMX7f9RlNpCXr30m9m9AHbG9rZo2x7pOK847Pb3XShtoXDY59it6U9LggnqIgAyzd+cCHkEaY7CIE51zyGK+pcrrMPZ3fXGTP14HrYXJtvcIiIAaY7zIOorpzKGiBoAh+Xh0HFkOa0Jxm/kLSWiNi0CvJB8TozrflQb3/S/uFw7Lno42c9WSmyor7eyOStCDxJ/pAijqxKaZXk05zCASgPbNHBOM01OXIa9IY/W42sdjy1e2R6NGW3L4VElKQ3rbouvEX1PKE0rRWT+qMqiA6CG+CEflfbRNgLgbMt3XdZy56TMku1mqkxQ3T6IiRVaGZgKKBWYcdMuYl6M0swcpgzrkA/NO9ZJe4k0JCvYLqjegfEflDf63Kj5OWb+98pSfOGAi4AAjwhPCyhLkA7/wDnETiEtcrjUV2LqUnHHS45+MPjat7U2krEiy+Boy3N7yZAjNk8SDhvJXsEPrhkk6iID9YBxDyjNSdEMcA48eMax0fRjzZEH7g+RUKJkXkZKkfxB8ipBs/22kliL/5IbqNp/Nh1vJ2IAyvCRriMvREuIAUNCHLIAIfCIfkiWaQePZmMCRaE0s2Rh202j9fdr+OEXwxZbChqPKL3shki98IMTnGRptH9sdBeyNc38vtsqCusAV9vGQp9SPAf6wzqCr9YRoORqORz8fONrfopDpwvf9yNeURFKdjEMAb5e8QNesFWVtgTLSlayMpY51qeMJwCce0e5HVbi4TH9jyKWUNOxrmP3yZ+cW/DzWBQDhjqoyYPdbGjap+eHot210261e5Fq0/9aJtcxvkSJ2e2rvCklF/Uf3xUivTokY+kM4SS2wxKLDJ6wcz0kN0Kuzj6My9jkL1xJr1xE4vbdIHGRlMKOgiAeGY4XZxGVMpUs8AwHfHUT/hHVxzZFobJezwXriNA2kH7qOCUNenMIhKHw6Qj5Ry7UQEa0sneOnjEz0ZJGRhCPq/De35C0dF0amygCLt+pZMn75useK3EfEPsj7CeCLFFoUPhWtcBCeCCCMPjGgIIIIQQqyyjMMoBnpzj0Q84cd+WwfFs6yFRe7cU29WcSCWdKACgS3CdRTzwZKGw7ptcZ/5tvLOMoyjkQmkm6QZjJ192rrqqE6y8oGlPdC+6FZjk3TGUA5a+MPjRWLpHrbRm2nc1Xc/rM46pbLRJXXUrrObL/MYpBBBHQBAggghBBfUq5+SHHv4xR1HABr2covh1vHEpPTlSvVoCXU89EOIhgcDkP2Rj0swiIBnhx7Rgp49eLLah+TIp3R9nROjXnHmT6QQok+kEJ5PpBFaPWVN7H5BzrXCmI9SfSCF0J4URJYymFMPlCwBDx7ONh1TaRuy1rWI64gt5UdZ3ciau6T+4J0o+MMvSmEQx8MRUJGj6TX3ghXmLV/50ug8YBeos13bV8/R1zInEQfSNcObyiQ21XbNgWavA47dW8cRt2pbWn3E2snJQk6RgPpYxpzCI9Vv3cfs++KZ2scPVpTJitMZMdo65jxR158Q4+cJiqqtIuW9EcjY+TKTgHjtWiyuvFeCE4Dgc9kKIema2uR5x55QQQQQYOAUQQnAcahCiHlFbaKBAgggjuEFEEEJ46orecIKIIIIcwgogih6kO74jH2kOde0IBR1wI13OK0EEEHBAhRCeCOqXWEFtLj5hF5JnDZH1u71ujpqIaxaRAQHAwohyR68QcjTUc42AW82d0V4W2dLwFVTCoN8KATEzp4AUD+8GcBpEIV5BoIatXKgI9AJsS5HQdYvqDc1fSkyqQlMTbuOg4jETwnleqJkwAhOI655jDqq7iXqSLduTJQhd/wBMXTpAumwritmHb2nFamRRL0pu+LNCiE8KIAS6xTAUDQA7Wz38w1iQE1z2hS2da1nBtY3/AGz9ugdH5XNRcgFuiEvVeMY6MMmlk6lauIUgHUMcdQjOFlt0SSAXVZVIqZmMmB6SSAD0iXEcj9UHpsuiPtwksdGvF2ir5in2TZ/kF0P3Bdywks9tLp4TaUzCgp7dp40llEc4AfIIzZec6W6TSWeKpZZLBOAMS08iA6hxhpW76xdOjQlzr8IeUkcaiU06yWKYaFy750hOgdDcN3Dl0e2Ckdkbsz1XOUWnZdHa7RZHXF5OP3/Q6hg76NFjFSnWLUcSgORARhqQnmlqCAc9Prh0RWCE6QcImE0BOTDobzrLDc16NTpDj6OdOQQRTn5qiIXmtt0hyqifjGTMJHSlBUlKq6mKWWm/OjWOkI68gjIHg1DqGZpiYJmilA2X3xLlEOXIQ+uG2kPVKdQJpRxNKOmNIymsvqK2NID1cTQFgwGeQaQPz81KBRDyErCHiVkfCM26b8xdSZOmRoUK5jODOREOQa4jMko4UrpnV4US+8TcDcw8IwmoAiIl62dNdOUVKoVaFagX+AcIXlE3jXlIqvQF6PLlClLbdRUlGjQDM3AIuaAm1iirR9fREC4zYmANMBGeMYiaLpdZVo+7gWEJcy8hGMkkqIqir7weomjHSHUoSlDPh4QckirWuFD5FD84ncRZUfWOYS1NxTm9vagpOoshnlD1qPIZEvnMonfpDHtq2rrKlI5Xo1tChfpTB3Q6TFsXtFXUqlxtVYe5zuTlMeiTMp7SOTET+OYTY6I+QxNdg+it24XHUoVVtPt1Z+TPvf5RLkyU6njupEDI+UcFrjthi62iWM11f7hBKXk/YaEjytO5q/4BrFJNNRq0jY0voFtRxyDhmMfPNMocmrVjVcNBwPON97W9FRb0lRPFrk7ddt2+JP8AhElNZqHVKpJgcgHHHxCLkQ2V/RE27IHjbwfN2r2GihTcDcppeKMuWVQ7AAOARXsjpNs9FImwra4RCcvvRmhEk2A5XPo5xzeUSjcJCIgOvHOcYh0mqmGFySqXb6MuLxkzpKVQ0Q0pDL/w5H6o3Ppt5/R5MGklF7QbFxZ8Ogoqbjua6g+0DiUIvr82tNsC3LqI+x+ygg2nS/z7qdcaRRP6wLxzZ3dLPv8AZUUY4iFtyFxVV/VMR/yjWZbvYn2oLhnd3a9mnmIhqBtzpotGUfHeMRsatr6LS6tQsQp3gu3ZyzqaaL15gzMLuURx4YH4DF7crq2773lT74L3OtLs+pRMcHUh0O4o3lEj3hn9kRrRWjah9M6u6L37Uz9VnikCeAWMSFWPSHhm4dWTDoGe0RjqirpHeo7QyIVn/wD7gsOAh9NGHgTNNn8on2kbDGwXZBLS3tdi8LvuuYb03SciOBwmgM4+PZ0vpY7swyKzfr0YTJpEBsDYlVdzpJma60jnF4Tbx94DQA/d+WNIaq4z8sGvptsbcJDBfbpSbZpJlFRj68ulkE/g9x+iAjFF0vO5dsj6W00hh26t6pNOh0TUiG30o8I8+OBAPDMdoexr2k89Jx47J6gnUDoL0w3DHre6p4XVkNkNk84k41bwbdO01Wrl7T2IQbZILTQffFhc/eeG7xAuimEzFzksxtL39VHu1xc+HIUt0oe0HzfxjLF80t0WhO51S5joVXZcgekeQEdfNASmLUBAPnQM6j2S+PfFS3Oy64rnMd+3FQVRCTUS3pndFhu74B64SgOQEQTEgAzNx5iHPGYl8do1iLe8PWWKdQTW3P0aYOyqa9ehTqZcwye7t1dnC3V6kRxbH7BK+xrSTQAoqvZP6VRQP4yM2OwNPjG5z0ZO0dtCbSLxvVfa8B8oWZrdQSCE0G4nkQQG4oKPcPOILbOXooNoy8iYh1/yOmGQlCv5WXHcRd9nlEU7+yo/ER8Y3QHG3/0ZbGodp3Q6kETTeK/PDkapD2fbqenf7GiF6QFrO5D9zcUoV+97hBEdMaMLF2atbcUcpHGXdITvhn9py51vfyb3Nb90HUVbxkmVPnm31GR9oPbBRjkfuA6qoHByc6W6/JDliNhu2Xf1uOtSPNdrHpnGWbq7lIeEsu4CoB2xqEeCn+O2JLaNtrWhE4L+MOBYiNpo2tI7fgUFmUJUk+JygqHJitDtlDpTZ8IiA46FakamCUchLNmXSHuBRrqhv1Bf84EcdgZht33RVutqp49rOM2ojETvvFeKO3yG+iMoaRpFK4WpJZuTgNxB29mOxpu9180BkKVaZMQ0L56ex8dOrU5PwNSbx4B5jF02p7oNy893bkvAHOoVCict9TW8KCRHBpOLzTSh0hD6PAB7+kESAlpKGyXseV1atMZTL07VYdCSYQ6KggtMtNnPb72IiPnGqutkR6evEOA6xlydm0reR522fXZjmIbsE8nt5xX+FUaaipS4+2Ht5xfJJ6qcRon6BwBFTlrSGS4aYANNfxyhU0Tpsir0jBGvu08w5CbPDujExGbAUxAQAOWeHfEudnCzZC51xEdPIPNDSKCWl1XQqHVubq6QN2yMxYtniI/J7A1GIjYyryTuFq4YbibbIfj/AOIcg+0kVVlCUQNz/wCg23XCbbd2aPR8v8u3zwzL7jZyQ1lnAcTKwbydjnZpZEJhHiI5x5/3xuM25rm0V7ZQs2nAWMljVxLjn3sATfREukFOqQ+sY04ZGXIdg5hsvt47rL7O+7BTfvnDcz1mqPSveMM9Y6mnorhIn1ArvRYsOZis82An46CMOKeL+3rpq+z5MCxc3NgqTlH6PYEMtQpcxEcd3CHJaqkdRTlEyQriWMAPHhiNCaJiq0aEgl0ejzZw5tJFKqZIt/XwLWZj5ePzByElGrEjg0awCFfPjjSJBtFOrGaxegX4888Ia5JpzmK1WtW6Xr865HURiYOz20Kzre6WkF6A5EdRjTqGpY9Y0pZDNpCxyr+vixvO9HKw1Ougtwuse9lihv3MI1Tekq2n5r67ZD2PJJnrNl2jMja9njMGJZpSoiBsQ8ZgmDxlCN8t0XQgbFOxtd+7qeYKKinMxQaduJpg+TIsrJXGRjjhp0qpJPoma1YTRgeAZzECtKiz6WcXHTcUWNnOKxtJ4s5uJ3dPfNnP7e3UM864GvWGuPEcahGdK6k2yZolWbJ1RNlurgE3MfJhIIGNcgHdDK0hmpDRHPHUYuFGtFh4VQF8Rt0O60+MdzHoEbjDcv0dLXZ5mrvC7al9qzXlCYciEo/Kl+oQGMf2nU392Vf3D4RC3/Bprgz+o2nLRG64B6g8nvoiIcBrnio0w/8AcGNgW1TRCgcVezMZim0UWNwOUG/d+3yjIE2lsVwOG/lyjmQvBbx+Pi4R1rtBur7rXc78URyCfkY17ruR1jaVey4T1tU/K7otu41RprxRL6j3tD5xq9cI1Ks1aYdQAc6RqSIea+3UvP8A6DZkRVZe1yV+DyhjlkmFCaqGcCAiOO/l90Wy2bEN3du/ba1ieI71cZ8pLNKCHITZ2Uln4zAMKVg6P7vzAPLELrBXXoWK2gbO3jMpYOAta+4iQ9jKMIYBRoJx2Q4aKj3iATB5xBrsVWo0JXDo8xM/qc2P4jL9zLRy0qi3zZE82/8AZj9mI6RNtjZRouPqNHa5HdCrHQSDGbe5EPm5PTk+NBV+Ej/o3HJEU1XK/leUy5c70SUwYYJGYB6OdQEFERlwI8gzzHXpU2svSNbObdswuXrYNxLeXKcC9Nvtu7bE1wVBTNmFDj1uR4lequzjHGo8XY5ny6Ft6u5VNLrkcSpVWFhYPTdM+pGK4/Kmm8+yM+XJeFzw0UaPbLdGtwm7hO+GRKYloyP5JXOWqfWl3ye3kGFm69YzUqmDFXeK9cczzZyIiIh+MRb4UQnjI7umFQ0hdQoVTVWSjQpzV6wzYAADOfKJaKyJQ2aU+lQM16Bu+BkelNTJHvl2pGXHyZujjCjp4SBw14tBaF8J9unPM5ThGY0pJybXnbpqXPzKogGShrsEJRAdO+MEXlQyrqldUMnDKkbNmBNGDBvWapNnnrE1g1Y+EgzTSKpTvT5iF86XVv8A5AtJVNqlrkfGfwjH61erXq+urZERHA8oITwRBddUCAggghI9YQU9IRx3cI2leh6s3NeXb8sUWURmlbDEcxe4TwNDL8kkTR5gqCIj/pBJ8BjVtNqIiAaCOI6SPQgMIqpse7LlJKBYspmXujIjjz+kJUalKE4gHd0p5vjE0tFH9b0W/wB26b9zAdUV6t1qPakz0INqPpBVTZyR1RVrXFVDThNm1Pfm5bhDI9GV2hoGRHgAahqOkNoJS6u0Rs8s1K2W9npLtqgvNzn2w7jSEudOnUoFsCEs+RDEvHPHh35hi9uDZuctx7ip9y26tpRUqaTS6IMqgezKQx2hE4yO1w3dlXZysTa9FSTJyc6hF0Nxq0oakTIjvRxUAOeo6BG79E6MK3iW7eDy7Yf0xtb9GFXR9FxTdvBnLyydPcGoZlseqg3Hu82G8rknBNZhGURmVSMw9XrlYqbAoaNFe4ciP+6EMq9LW3RVlYXAYRzdcopj0pDnQyRmEe8PCMyT3K+NlG6zsV0eklnaA7whzFD6f183nUWriIdHsEBDAxGypc1Ed1wDtdzqq4kljJoTqsWIS7/OHMcD58+2L1VkY6LjiRMq2NrSKcJTZPb8hpO7b1hYWCJbd1nUIqRY/RFNk9vN8g2a7F1v7Iqiu6S18n42WCUMJm4tsVBelTJ5lER+Gga4zEWNsa0CpaxJPirFwONgo8TDWSHHKdAAUMaiOPLPxjcb6K3Y+2Zrv2Of92X20DTiVEkDxEmDpAD0gYDAYANOH2xpo2n2leBwL6Js5qky+uojbfR5CYJM7kREuZN4Ka+AiPnEdRums0i5YMeshcntzCMS+liPu7RtJRUEQu4XIUvX+A2cvD0ld+XHavZK2d1BxlfZe4TMINY6JH9Ip/umEaIXXNntvtXbCNe5O0WmKZu8Wzi9As+k3DRjkqKtuROlHMvTpzAMswAORxMAhDpXUZ2zDsaJ9uX7tKPB0C/m8zCBK3NlWuoguHTpXdN03yaYcSyh3zCARDF7+lG2eHhawjY1G2dj9s7dfrZNFUijpz3h0wljKT2YtaLpszgiJKLFLmSV7g/OFGSja1Its3XlzZzdgarlSwSrOy1+4rFWCjzaDb9SLkmkHcltrSmDQlidY4UqDwnEAABlEQ+VyDWGDoy+vEOIDwEOyJ5su5WzxZcndFYZTpdlwFx+M5Xt2ltZyMeVrpxEspdEN6NTAdMBNgADEso9vlBUtSGjNPNKAhL0shniARE1IKD5WbLxJ09WcptaVJXWkJk9vOI1NptkFiajL6pTZ6fX8YvBPj5ftjNUej2eUYoT4ef7Yz1Go9vbrGjrVZUQRJiBYFHXvExniBR17/rh1EejDfIQYEPL74dNNo/3xZyKPTDVGj1nXUpjLEqmIzCI+YcY29eikQU4led13BWa5QohMm3RgThs9oEalk+jgR+rMTRsaS+cuKp/sdDgudZ6+D2cWFfLNV9byzGg3Lup6pl8LtrlwE/9Am/mNt6/q0bJ9l5n78sETHqM/qOuka07MoP7jQD1HlG7zZeok24gHnQofmreSz7q/wDnPGXpdZVDXUZDEMwsrytqGHeHGv6bK7J27PpFLvkfdRS7QI5G1iQBMNA9XL0h+PT+qNUQVc1tOOYzi5T4OXVuxdi6x/Amrg3EV3Scxx+cDsxv74byhUHfBDTxxwjQNvRlY+NRQGk4bwdoQ2PGYVIIIIdQ7iFUwgIBrqHLEJdQHTXHPGQjMqCBRrIZxUFRLFzBYQECYgITz57Iw4cyjgdcaBnhGILiZu2aKKzgnGXOMcUTUSrzj6Mgy56QgH1x9CQeICGO2LkRK9aKZMhvZdPlM192mNmchJIA41m004gHnGTPxq0WC9nC0aTjQXqXQFWsQkcrWPdYtxdCXgaKmuco6cuUN+ra60/ReDEUyZs3bHTVrarXjC4IIIPHIEEEESADhRBANGpy6XnFDUB7B8Y7cpLIU6cg9qjiK8EEEfOs+IeAgghRD4OJS5gQohPBBaK2oqOwUQQQQ+gcJ4IIIi4ICvAAGoZHhnMJxNgHEIKwAGMyjjn3w+59Q2fQsKSoEyLx/Lv7UTCeNjMHsh1Pjhjj0s48+6HV7J5dprtKaOpTz7/bHrVpRala1MUMbBBBDmBgQohPHuQdcdv1QYzWCFWCCCHNHrCCn1wdoY8BiYmzZZi3dy6617avAm1BJJNY4VFQpmZ5VEwGMFQCiA4zEMwEAAchnP1ReSCioJuZiZmeQe2WYcQ7QculVZNw4RKdPuCZWLOQlsXMjLXHGlfticSR/KLm56VImoHCVCsJkuVNDL0uATY5xjUeK9YRHvhGOdAHOA5ZhodySPUIs6Vqu7OvUge21lvm/cSZZor7vTWpRSUWueK1D+eidENeiH2w09L9wMVy9AcyAPRHyigXknlAQlmmDPEAioBPpDnIjNnPHWPlugqtVFdBsXWdo/fBartFZok3QRyKE4jd8V5ZuiEwBxmDARnzeZDsclEa6MlmTRfhgdcw3lMfVGBmxoHHXhG0vZB2lLeWsaDwR3C1S66pOBE6vKHZtRT+YjE2taPaSrtNu/WyJ94WpoPsqzb8vckHfUxyayym6Ua0TibXJzfKyAzDr2hFrrAACAB2cOMOA91igqKxwwWD3cTI5ERxoPCMGpcfMIEd058RW8uyj2cksyYnzp5uIOM7rgnHSlISXXTk8tQQi4kQNlAzPUyOczD2w3oBkcRSmknl4jMMeBER8A4B2QMoqrrauFx4/kXUmttEqfOpzBYWHoh0vh5DGQKDhNqVAqWra7uHQDIYwGYxrI4xyzmM6SGoUOIlY8Kj6gyAhgpgczB4w9JLUpXnHeJRlnudhE9eXeGFUa001MJddBxgeXbGxawOwpPeGyjkvBWdiYkFkozWAokZyI4/5RE20lsq1xFogkk6xYqZOGt0A0dn6JHXmIxkMr3uRbumqMJGdCqkIR0zk6SIneiAjzxAa0FLOGB14qnMc2Qpg++5ecZW82uRyn0RzZCmMXPQNUsF5m8rGCPKUzrpjP4zFsNjgMh2w7F6TNsjy6lT2voqsqUCXRBV67+kJkOOIZ8ZhGUJeyHlGq2qOBJDVIPFm6HiuyFCccrp9Yaw546hyh6kAgov2UBSy82UwpkzjUQDOojDPFkQ2oFN9EBChkQAQ4CIReEhymGpPWApWEtjTo54+cJGqVa+ECR2tJcirp0nc3JRxcktPoirUaJmYJcDgBGH0vVb9nt0uiA0XWDslModA6rGwIGU8E4zNnJXA+ARgVv7R3qvEs0SNr7bOd2GTY8E9OwR8d8rafXGyJs+izu31dSV9o289p9n9AAfeSykuA6XDj/73KOAHzHhAK1xxzNGmvW+kHdpdNsxkHJRT9njn4DYdXUNWCM0KC5VpUCPyph4AP2jCSgm1plgE4gTMqikBnG6EwEQHnyjeRYGyPolWc7DDcWLgPPaDciWhVz8xt0LgW9ZU4h24DXGfrjyp7d72O1VRobF+x41bepYmtyJq5Bp5Ug8YjlLp6LoG3SdoN9KVcNCbAwMRUnEIDWs2CNqq7QiLH2f3SUL8QOvSn7ISj5mBAfqiahD0XzetpRFX2tdsa3NsSwjk422ST9onJKPccOBLL2chh02S/PSKM6s43g+H+zW9vaFuO5Pk+UUOry/+pEYgLWtjbiY4pr1x7zvG5rp60wcJIKeIkJx/wBcr/dDEzuKRuJU7FB5n/8AxQ722ylpt5qGJyn/APxRM5Tk9EfZejRoFkq7e1euiG+CcNnSiY2xDswGkPJY/a+dV4V6va7Yv2MLH20XuoeuxOHCBUBAun+IfjENDWaWyOq2yaRCyVl34p3FTUITtx6s4D0CGBwI5DiAD2ZjL0pWujZVJInyiKhW1XFVr7iB3q7ouFRTvDMTBlo/lbiieZMpHvddEGkba/RrvK9rZNK0R8Jy/wBN/wD0DdqW2l6Rp8ONVMt+iVbyYkjvqvKRaQp7e+Z86xiN00jaBvE9ZnO+topCtSJUQPGkki73Cebx1RzrpCWYu8HRvBc0qGjRXInTkufcQEOJkfjGUtWybpdyUtrCQlgbKJOp04cPATxz4DxibM9DccgrtzhsYXLD/ocQRlNeuKFsHYUtYYVDB4C1wDLv1uKcKIQBkM9o4AYkLb4rb6ra57KjI2eibqZ9tFUutCrupf3EZRMaYEA59wawwpRTfls289mAXXiJNLcI0ZXEU3QN8P7uOQAMh36xYybYLUWpVciq9RkT6MoevkJEZj0wCPAuY4ce/IQ4f+F8JFqnf6nBTtb+T8Ra7P8AR10cMnZ6OIo1FMuZUubJkyfOHHN7SzsIqG8tFusZpzZ/OiDRAD/xz90er5bTN1L/ACqXWHy8dShfBQmhFTKanAHhxhlW+qMdyKNBAZLRdD7XlQ1uaOkItIwJ892YlCUR+qNgVnvR9baV7S1ZNbuyi3bcFTCd0iz4vCtHG7Tx2y6iOR75QgeSUs23Etuc1Kn6n5h3WNottFI61dg3/wBklX78MBrU68dauMwq5tQrmDZnejnSmyBwe3Pb+2LkvsxdbrZSXasJxpMSXAarkkk6dJdGU+NDAzYz2fdHRIwPQXOdVAT20LtKpSQGfndu2uahUjOHD3Tro9gPqidbP2D/AEfVkDqXltlLmLre/Mjj3P8AtiLf74jsrpftKvg7A6jtUQZ3pus9eh0IpyZ4p3jm/mOXxo7JF1rsW0Zl1rW2/fdzJV9UMkFME9PArJkuIY3UR4hgB1+qNlVlvRVbXj+Tt4WLa2ys4lLxfdDJq6K6LueMg9oShoA+HZG7J47TTOtYB8tbljoLfQSvE4SIaDGtW7XpeSSTVrl0d4GjUpT+gkNIh9L50m3EiZvBMM9fUzhiU0rX6vU6NtsqM1O1lL/1D/mJZ2O9Dfs5WlVAc9yLiqb4cpNT30Sp+ZKT2/L/AGQAx98TkQFHZMsEnBQtvbpnFDKSH52hoO4AH3xzYun0yqqSRlUyx0E516q8RXFwcS+MRzQttHav2kvbAtb9uKisVaaX7VK/srp7PwxP7DvKbrV9fTr/ABip7ugr9m0dunJUus9IdPVwtsuseX0NsNcj72rKeCZTGukagNuq53UaO8esD33wzPo5XtcLaGeD/wBoi5Ffe0K3iCXaqQc/tMRv9I1dSiq+vbxauVyPZrDTbcAk3uwkSh21P8BBnCNRVujScSIXP7wMNWJFrVX0lPlYMvBtt+ZloMy2TJLigMp1f96wBVLDGohnPw7YhE6FcKJisAjjI89ACJVrqknA1CaSKKBZU6xE2LhyOTxcQEADHcI58ogs9lIesa48Q7OQRoK4niNVj19EWxpul+RIhvqOsW9He55rOUk4E4N5MJs2QyOkSEsPbtW2ib8pa+96MqXbJAr+2txlk6Ap6BSTSAgM2vDXUOegj5w/p0jamboEU+hOaPGZwlLFZdRHnj6o2l32uZVsxs5tPZfLLZZVfJ6jXW70myg5Tm/kfckkrNgOQ8Q+EZ5uWXVlc8Sgc2cyhFfQzkGSWclKvoo8U4cG2LWZ8vYz9+oYb0iO00k7Rl2gWW6lAkoTfSaDWIhxyBfICP2/CIHshvJrodBFHW1osglTUw70pHhEKUneMWSdSmmUJThiiJmUZhEQzoOIUudZJLCxWPpadQSqIiAylaegSj9sZqn56DfLEfbp02yhClbH1m+QNaFGiKxF8lNWUxej6tynx+3WEi6nlklXPkih2gplixgZS5ynKISnJdNQh/bX1abNYbteJgZgMqkvs0kmc/RmmABmEA8Al+ERxpUKxkzSpBmeaYQyIdww+l2qItik3mGXCeU2llcr5TOgKFYNQz3BgIWj6qMUtI3m4RyJolyJF9NUFNFaoa1+36ycPym5vs5w8G0S93DcZq7OrHKlzI0WzbymmUCg6AoqM00xc0Zx2iNL6hhgmqxU+g9QQ3ceBJLlpxlNmcdLoiAB+2L/AHuOVJT9vi8giEhS3CROIy8/XlQMh/8ATIZ6kZM1a/rJhm9YHDA8okVfcyhfClXCJjqIrJZO5kIQcFVGEauXUN6aomXdx3OqnMMxXk1MIKpoqjVRNkQn6JUzjHSDvh0WRbpdcyijoaMVmNrK4ZAgmFQ4HK8w4l+MNMj6nJJquoDNrnhE8Fe5KadZ1u0drtEq1HKyy1cDruIHzQqbhMVzWQHHIQzy7w8dL2VDx9PDqbleyX7xI7Lh4u4Fnj5+fIQmGUpfl5/5Ck67RvazD2XLd3FQ52872/NRlV0k4bA5gcZANNOf1Rs89Hjb0XG6qChuO97oaxGt0qfdVyHJ1k5lpTdDncBv3tWWT4qKifHvEcjy7Y6bNg+26DZW3qrdh8nkso17YoJ98OVYH/M5T/nEgud4kxjiIIds3+AW5fLtK3LNIwR8YsIDenBvcRKKVk9kJonfdraJA3AuKU1xKtGwwULCHPEozadohGhigHqKk2OQ50hzLvXaXb/XfuVetzgIKtynOYXKhMB6QEKAiO6FQ8AAA/3Ya9OH15nd+QDgOyHK34fkuPRi+4XdEatRnVk1bYddd0vyUClGUpiNUQr8OEZe8HCScSjXPJSUWQiwgHRJkpsyyx8czOMpBb19UmZoSZx0xlwAxgpPOdeOn3RJMFjc/k+cTd5SWgP/AC2/6hvp/wAHCfgoe3m52eYrYLXBtwJzjoPU5sJv/ijoZ2wE3cVhW5Dw4xyg+hjc9Zi+kzsEZ/r+ZTavd8uUZh/90I7C9sBtqTjetBHIbrvasp7ikRm6/wBL/wAw7d8IQZ1uGN1M2T9pmP8AmOTTa6JiRWPtjWqvcA8fvjb/AOkItuvWdey413RXK9ff5j/R0agF7gHj98aHgldfbCOI1ta1FULNIgvXgDGOzlDMqXEPxzGHgcn/AMQQzKn/ABfx2RFbj8XX5BlW/P8AaJ/kFnrGKdKvLUwGZRAcdsOa/wC4yG52o3khLRwJmU0Q3w10sjUxMA6/DiMM4bq50DGvPEWeuI5DPbqGcBzjJN4Xk7ZIuGDbLqli5DbgaIyWfsGrti2N0bimU/3hJU4TeP3xQivU4TeP3xQjO7vi+ccgQQQQGECCCCEECCCCCAgtpDgJ/DH1x1y+iBtXblkbCZ68C1UNvMvcO4SmSfiO1jwp7jYQJ8kpQlPr/P8Apf70ci4j9LvGOr30eKK8LRejwTFssnmTIXDUnI9gIyhofKyygkB9QRaNk06Nbcz5Ef4z0DbLUwj1/k/IZLdS1dmrmUa5iy+1QaVlQ2a69R0d1O3+B8XPYm2Ok6/t53vZi4F8GtcM3Lbo+uoyO1l3rJwt9R/rXHD4xqRoo9uNpq5yG0G/bh0JLycRrcjiOyOG8xsb2T3iY9GvtRoVtLUIrfVn25ncnNW6biXMKExAsoTSSHEkob7PlBrzHvGNLWtbtzsXiaEStked0W/oWt28WF2EcRa3RNjEzF+oRp2m2C/bYnly3DopYMs1TmIKhoJh6uNGBH9mkalJ1BUoPT1KoE4ymjWJhmxHQ76Vx+NVU2in+2E7qsoqFF7Cz2xrQ2e9lRYvFd9uny6oU6hKLwb4JIPlacot645xovFknnq2RPLQX5+kzdCNwpMLkbLGIoQw3FbKO1RV2ELV0Cyghr3UNwtw3xt8k+Ny989nW3r4fmzLeBvnkvqvei/5j/VyxECdszY5OEbesdHWKBkoZVksgeObj/KEbM7eqSCh7LqU6HRWKqxbZES9xBH/AKwMGCkZsh7v1Gdx8JxjOWj7S+8t1pKwL8htYffyj8/H0hF1lu8e2ZtAONSUzZ6gkXLV2Q2Zag/o9IRztZMJFpMcgp05ePMR7dIUgHSnxxyOI2r+ko2R6ltXKa2lbczm1Wz14nkqnVKQZcG7aOIwbnMnUA6ID9KXp5lEeWQ7AHVOUHMwCHEeGYpeXo8Xug/KtekWU1ufvkOK8Vr8MFdLj5hFyJ8fKLbS4+YRdyX7PuixLDRSXdkDcv5BlabnPjw+IQ5qPR7PKG5TaQiNIQ5hmHSR6P4/HnGxoFHUNMRMbPRqu8TDhp/Gj4DGfJ4DoPdj6wjDk71vS7vrhwU3+N4RMGSPMNcWqjXVdYcFt0d4rZ+uNmWze2v8QY3HzzGvFhkvXqREY3DbOqONCiR1zrAd7SOojSN8Q06U5KjGI5xsCtWm/wCI/cB+6Nhz8df5JNj/AGk3wW3rdWnYdXO6/wCqRC22JP8Ady/b8Ifj0gRz2c9Gntej/S7Nn0PwjLDtFJw7ZoV7v5DHyLxFecZt3HdMOAon+aUfH7whXCQn+aUfH7wipyDxH7o1KXqGpkPehPUFeCE8EfQI1/xCGWs2ojgOHYAxlaYSQqqSpVz56uXUpfUillOj0pT2RwOfAIxMRAeXnmPoDLqA5AOzMYsjlWjNanQlPu9sY/TVqlXhCWqAjoHZ98SEa99523s8vuwo2wt4qzPN3EHQFz1BL9ZcFv8AV4Y3NNOZDFOfpD0gDP0h0HMR9ABlHOM4490VvX68Mh4RGWtK1WWfUc5FDlMkb1Djuk5WQrgiHIuJ+S+qsIklraLiLpfs+SBwA555ZzgKOB30Zehpu+ejjw8IbmsI5llAcY0+2K6UTE8bolpQDIjqOcjDj3atgrWldp1qq6o31U0Tn6NQ411wq4E2YR7DlERAfD6okdI2RVhHNxoM0yJawhDancIQdVEXLuhnuToy/VQNfMOREQitR/xweIxQikAiHytezjgMx8vFkm7pFdenaDaUuYLaVKkNLIjnPaHCKHqcjx7u+K2KtEcBpnthaJM2Sq+oMUdc6Bj74cax1F1UWy7bg4jDzGuGOItceuhN2fXHmPUswhpxCEmsmvTdHgqyzYARDGo9kV5ZRMjgP2hCLIiHR5dkZs1pylOsInKPTDsxgQ8od7cSRmXZG+fowQklrliI44YjGIIVqHqapirNQAQAByGdMwhpcfMINVR1Cx24Gx8w9woi3wog1u41I8KbMPdHSWbv8+cPBYe4DCtrchJdtxrbpl2GuS9dvjOWjokU9RyGmRD7O+GdEMCIZ0gwOM407YHerO2dEasPGI/yH0jz84uayconlc6eJFAKlTJjMpQB6QBw+T+O2LaFYAEByHkAx8rcOPLh5xLy3bH2Z1fZnuc8Xu/1dJvglKdApbtjEiAzp69LN9KaaYOWuox3SSdvJdy3QWTIplMsfOO6KW1ZxEqCCCHlFZEDGpWtOYexmwAgIaZ1DOkfQAJs6YHu5Q4lWo0JmbJRkJmgdAGx6U2BCXo8gxDdYxkR4AOsuYcFE9Tk3yn3QQ7a7JkprCnzlobd8nxCrBBBB/OhUAjKlNnONJSEVePpZoqir3ruqDghiU/0dBwPwjEQCcB7O4R0i61VhRPFqBKucMGC5YR3QrgZgDPHARagGpMOmR8QhpVVTX50M2ALV2XW01OYV5OI+EeI9ycR8I8Q5/BEHKnFUKIqSlJ+YfshIA4HIcouVJRqhR9R/F5c4ISH2lVDHByEkKISUuPmEK47Mh4L8jHChZQpVz1KYxQzmaXOM/jT4wKpykZNVa1CkJeh0tA44ixTB0REOYRdE1MNHpw9TSEQ5iAZGHdKm9iHFF47XR5Kbk7QS0Qmmn+QGRzy15R7rAITYmDA5HjF0b6jRTFGgdMUJTWBEd2mHy4x8WjlI8oVa5eluvPohyjrTDHjHtEkeTqOM/SZuEWktSnmEJAHOR4RflJJOJVb1R2iMohjIc/KE6cSrVRGuNYAwONdRiusLJ1VqjXPVhMmP4wzcRgtGiGOI6ooooRx9ozazshU33MpJVb1xOcaOOAhxCFtdY304JgxWMB3hriLqhuBoprbVKCsQMmVsz+ZGgH5Mv47YdGymyxfi/1aqaYzUEo2OJx8OmbqBmkNf4x4Qx8MwlZ5NBqmg4pnUDus8WYsEW+3Z0+PJ3Aw5ukSL8KuR5jxjOLa2vuLdtdooFsWG53qqmvokENPFQmm+6JxJtu9hLZ1qU61yneu7VVwigfKbDEmBvWtI188Jj3Gblpw04RlSl6R67MqPVZ9j2swrDs0qPuhJpoXziAf6XbDdSSln1SLxLYqY9RjXjhYm4WnohxrdeibeZkmTUb4XYYVk6B0fc2MSOg7Lhnw7pJdA+sIzq2svo77KrTmpNmzi7e5fSyvSbruu8cJHEo8o90koBKAeAAENTs11Nq24lwkq79qEVdPL6TkPypvcf3uhrzOntPgIxL5i7B9uSK8pn7mP1TvQ8TMonDbbaX730EkYER+lNxH7NOARD5edg26yaFxOCvVO+hxidqM9HlupUc3S72xT/c0Pby/ENfl1NvHaluAt1WlbirI3C0xoSRNEtagiEw4HGAxn68RjTc2cNoa4ykRc99n6Vt+mK03vh17rwn3eIdxLj8fhG45q2Ne1C4VBj23YDXtkl/pz2bapD98TgjXzeoykpbwVEgaxw2YSjQkTgrUvSzgP+Ue2shOXDXUwaWxpCZaPtGU3d7s8hFlMzicfUILuy7c7L9tVOhQSENdvyvFCuAch2UATQUe4A0iWRO6lwq6CuK5gwzWmVSfzNtoca5yD7oDTrp6RRMgCqOdeI+ESIfF1bguGy7HtAvyIiU0GAbMLaOYJp3z+tVzOQ+VNnhqOo4idx2hy3ZLO+ldY/oT6hoqC/RpsB3Q7+WdqP6EKHruw5LF3etkkP5fuIvI9xkv3ILWIxEDqWAfzhmHAAHfEQq5lCLSARbyebNgJjBU4bDMwhyDAaQy524SfTp+oTU/A44zCMwxZ6DxMnTNGqfNmi9ERx0tdA7gix4Lkm14nYYvLj7eUWxBT1m2iiSDtwhSJ+2PPUS8RXW9WCC0gJ6kbbXWxeiSVyZWYZRqF+/4/XGfPyRjtEy3q6RcNRfQHGvKenMkyI0zyaoiOATMDkcBnj3x4tds3XZv06j4bMlkbn3KZClUEi23Q56ZVokQ7Zpj9fBLIdmRxiNr1n/QgXAJzIZvalvu3mnQICMxVo2wH1ipKIiIzbys1gAAz/o5DkMHzGkKEhFUUXrvXOKcPt+WIsV5pkhbfYJovXGpofxVTn3Cc9PPhT56DUez9pJ22RRnQhNFtpZZRehTcplY6QE8pykBz8mUPv4fCJQJ+yttrroNsvau0z2XitwmcQXDooKcaaicgAIfos0bPCGod4657telK1uyx6PTZFrJ6gwLTprsc5E0J0i+nWQ6ycCfnGhVZPfcIQ7dztqlntxBVVcs6mu00Eol/mZL+EQRSMlpdl5XO3go7/8AytwVpLaaLzeu6t7bJRPIXhcbmT29vOOd633oJNqd/VQVtoy7VvLVFjRffpkht1BuC8Jg5aB0cfEY2UW09FDsP2ia/VZxuLl7pzimAHAuGuBLIeMAGAACJcAAOHIIxK9npDmH1llGPLxvdEvO+Ht7b/WERLZ/pMlm7a8x7Pp5BLtklut97/7X7/8AwfMfgQgKRY6TZqPO4q55/b5RHEIu/Jp2sZ9vq98/bG4yq5LfbLraoJ7ftlbmyKD/AENDQUlvxgabtmJrxTLjLCO8UvdWQl78cWD0c6W3JtTvZ1vxUtwovH8oSUyVXcfaT+T3BjjEJETaDui2m45Ge3XWupSC9tHGTIiOVH8d0SCH0TtH0bSUfnySIlkbaMQ3a7dOZiPR0+3Z2wjqI9UpgJ92kxf9rEwiCOrkz4ez3zwPdDTbWibf5KctuWfba6hV2Oi4RXcQSCR/q/q+Od2syb1pRNnPhXaroSUF7+/M9Y/k5wRsgtKTvAeUm44C29FFRvDvxM4IxFb1rb9hZNgOY4pq/wDSlaejt3r4I5j5/SDS3avXtc2PPXUsu4Vs0V9q/cXIT3DXxiA7TYD8fizVSWahLrtVZS2/nCiIQE+JEt/SRAB4RvWdezrdq6jkVXO+EM0rKjhD3w4ei/Wx2M7kW4UlwxbdCVW8qKyXuCwc3COzPTpbtUtRsxuVhCa/pa2YZHLVE3KI0CMJSQGA9ExfWWslXBTCg1t8ba5+jlHjxjBE65D2YJhxAyF9dZYOor1EslUQ+KefUC2ciVHTPER746DLe+jHUvykNVQLESrT3tU344cXCGqfGVNX0eLVSb/F3gsHks2g29Xuu3IcJEP0hHZ5pwt1xXUIEU1YbJ79J20nqWoio5TVh8rG2xQdmXZQtVZcXGlpK84kvrx+PA9/J5lQ+dY5jtoh+VHC+3UNFTKq6YVXz24q5IPkqIZzn6vrjalt6bUCcvKb3Y1dUU0k2KXQBGAkQwEaClhRmPnK1LI6jyhx0cx0lFtD3W//AKYXdC0QxDuEtk9yS3+0Xgy88pnForWL1q44LS5AJtfxwiMb0aBw9Trn6PAsIZHT4w9A0pqxTeCYThQlD3rpDw1irZm3xm9T8UazhrmUC1rATfae47kwI7uVlHXA9oj8ADvh+uqT1DOj5fNzj40szES+hyUuShq6zgHvZyZlC0bSO7TdxEWYTQlM2ZSjwj86KOmFPvCXGneI90YAj7Vbbltrexsve2yW+H7cyYiLducoHjfWbMGgbA0c3WXn0tA8tdIvO0lfdY2gncUItlEMo7XbaH7Ls5oEg6UqenhqAaeUa/TwV6NeahVAQAB5cR1jLt3XFOWVHorNfGHzlVPUmbOcwzejMOoRIjeJ3N0xT/Hjze35BFHilx8wilCiMoIV6YtBHxJCzbbSJX2dX1D1au2WJQFdPAACJM6EuAAO4BHX/djG0xtXBvpcusjshurbtd6pUrHCqOhkxPqVX1IZEQl7AAA18Iu1RQmYtuKSQWERUnkIGlTmO70BHoyh46/AYxy0t2bg2PeqVcG2TiNtZ4pcwgRWSM37pJ64MD93wjRE9sbJozgl+hqc20LkJ2M/iyfUCFFNQgRjXz5jfLX8qC734QVFuuZFSVEDMpoGglTDKb+TMGSkuMd0NOl0c1pewOOmYk7tRnqrsW7fvcxOZMn3mxi6gqmToZ6RiUxULTjnu6MvxiOiPSH1kw9mNcdsHM4FRbSmvryfCEP/AIM4Fl60orUtBlqRSyNHtEdcQ+7VJ9kNMg0R9dQx8AiRLPTf8R9sbDh0dQiSgsrRPEbRIkGwPYotBWeL8S65ij7okjnu8Y2nel0u+X2ctkJm7OLbqiWfO0Ua9oHPLxAi3Sw6Sj3COA84p+jHsyNDqpYWSJUoVNmt+WTo8ero0mekS2oau2FtS3BuoWrmhY5c2DMtcSEMdXt5PyFOX6xH/e7ohqaStxXkstX3k26Io+7mk0bouxws3P7z6JIQfq5GnrRwI/xhjK0A0NAaVcdO/wAIxUAyH+Jx3Y/vhZTrDQmAAEQ7YsPVdDVASWIebFIkf1E7tobaoUrvtdntk6jpiYVZKX1ISmIgMozhnXPw+qIF1JhrT5HtyMVgrGa+o5H6o8D3aw8KqrLq69yfpRKb/v8AnNJUtWcnj51BMP0frqFk7c+ywrhwkucXJTDzAFAtun/xR3G7a6nWF31jJCvuhocRwI7OpsUraW2bD4fqt92zP/8AzAnDHehtrh84lzA8krUYobSMh4bGyFPGZ/yFB3ajTWfERQn8A5g9t5YUlVyAoLCqaVjRv88OHtI1POQcCAjGzHbGO/Pxfu78RrDcdT5QBFvQX/0w39vMNLW30FhI4hkV+txH8fCGnVBz5D90OYvVuQfEIaxTER6WYid4K6hqcZYulXXuzjFDfD8dkWioOByPZF2OcPOLMOoiPbGDr2WxdHoGhLrBCeFEJ4rNbrBYIIII4BAggghBAgggj7J1hDOmgxnC9lOVNbaYZUzM03yadIMiOOPcEdy7kuRsvWQ2S7OtdwuQ0cVWpbkg1SbctyR9oM9XpPERjlYsayjD3ssyUG3CEdcT8V7jniLqJIZAyfX/AFIgmgk4AAx0QEauMc8d8bgLy7Je0gzrPoZnqNecJlJQf0OS/q6Ng2RZVs29BsHEsfOo/KQxu4QTptB2wi1YmnlvHCXnoyrpWNOXcea6yLHoFvTTdZp90nX4uLwr7hEzGtizhZVX9p6y143nUFwTvW88jgccxwpmVQrzK8kxzIcB+nmM32ILg3O2dEK6j3cNuwVSptsdeNtJXQHAKPDxxEPCl1Taep0K9cnu26KInShXXBDJrecAHdrGp7YpbyKyy/wWb8v5jf8AopkLIQiaUq2M2TTWzl9foj/mM/2s7S3geF5rjqA2zXkgqVc54N7Ww6vzqET19Gku7LFpaqWXvftQWvahUFPPs4QP9YKIGOGv1RF7aZ2rSu1mTa9O7ZisXU2kkdRlDjalrkJlAM/rUg518NYZ7Zotzsft+6KGovxrvi4KXItUPVo5E7KnAd10yACAjrjTPKIrclmSU0wawLbUrJdvpuf6v5in7r/R1XuGYaxMfIt1m27v67J82GHl+OtB+htcKzVq9qi1lsr8WvcTYcLCabDPnt0Q/f01R3dJHgMaSvRavBSv8T257PuiglqxVWdB/c1c9/3f6v8Aet0iXTQdTJ2SrP3G2V7bv9Ltl+W5C9qrPdefo5OMKH54lRC9pT2h9Hxs+7T9xJH6hstXuK6q8l0biySipECSkZHAJKSHMR00DtjHSltyLGj9uyy7hT7ww1fUCrCThGOQusy7w1zOyoxj7B2wbSONszrttEQunlTCYaUeqyS45JR3uWaWYNQEBwID3RyvrZNsIpo4FJkTSAVNYGU4tDMMuvAeGY2UbWG3hs2Xgb9O3LJJXqJsud0+1TjOylUdpKTvM/0qYAEwMo9w4jXX1ps/16dWgJm6qcYxiWXc0pbk/wDhGJ5aU7aTJmdCVPnV7JzGTPk+wERKUiyaHoudPWelqz/fSoWL1vGYv2aN3dacoIymgO6k23C2JzonppqJ6QZiZotnUQyAyj36wxZIJpxllAMiGcBDxPW7SEbt6TtLb1MU01qCte0rhUVk7vik6VAJQkCebEoSyhKGMAHEeOObPExGWUBAcTAIgPaHKJFAKxL249fE5dXqya3VFyEOt8JkHCbVTVVJw8NM2Xz+3mGTpnEPH7gh1EHgPj98NWmcQ8fuCHZQOXl98aNjPEkEvsP34T5g6CV9Kb/RCM6TeI/jmEYGm8B/HIIzxN4j+OYRJIzxw19bfiqCRVpP0wR8o3P2Boj1aRjTNaWt88EeznG4yxqx+40P2RD9Jv8AshL28wqfTV2Pl/IbILY8aH45xnvpSqvqfRhbUAf/AHGlw7g1hpLerH7t9WkPB6Q6ibcfowtq8trkozN+D/5kiiE1f1g2Q9Gn4DPED7/R/sz/AMFBwUUP8VN4/fHuPJWp62lRAeXZoMeo051jTDfxKYIIIIQ6iHJJMUVCnVMEqJgxKW4zShkJA7cRbhAQEQHiA4i8Jq8pJVA4WIm5ixc2AAaCXQJgi0DMIj0s6xgF3yfsaOznNtHwoyZ0XlxH2aaabQQHPHtGPnRANBmwPgIw6TgYwoaMnqkqiWMCodLJMM9KTo6DmGtnz0hzxzD7c9sOrYV2d+PtVs5aq6lyTJUeYU1a1UxxDPhCaCI8issgjs4HCiCCCJEELkWMmCxkKsukwDnXgMZo+38rvw9ROqtOhQMly4FBCUMS6ffxjAgmHGBlzkRm15R8HURCT+NgQ8sRKEpKQRjzsdcbVH4ijqi7dJNTs0T4Jny5i+fAepZhHQBmzN8kBzoMOUu26W0JrJbpMVqIlVTWkGQDA98NpOMw9IMagORxyi7GVM7XJ0iBg2MxUqPu5URznIx1ZKxyDNzV8Qx1MvRGx4Dj7aKsEk1qPU6nPUu5gbDKbz184sEEEEBBvBBBBCCCkRCUZhlEQ100znPGH32fq9t6D1LV7pCqA28++gjCAKHdjMMKA9EBHsHXHKK0nHTpCIcMQfDyHJcik/yFPk7Jw9QcsaFlkZSiZVKpmzZTcFflGaPesjVF9QmQJhBPGcQLgHHo8vvjEqWM6Z4cuMJ/WzcBEcCPHGoxXLDieUeQjjvCDKSSTyQq44KnMG12rV26OvUtCZzdn8AuMljhefomKQl8hxmHEIAyA8OHHuhz7hXDNP00TMV0sqmbqWAlgnLgNPx9cNiGmRDWXnmO03sjdXwBYx0+8O0gjHIPzoMVs6HZPly/YDI6jyzrjSF9GnqGMhjsHIwkl6A/xR0nAc92Yfikz2+8klAJMImpG3KBWsacICGZREBz8kMcgAde/nDxa0eq9WW1FPo9/q4B2joh3NVM3Y86heEvbP6gZOrRmL6Dr5x5ikATVJwDiMw4CMnWW6ZRKBIxWqlzG9FukABN0gAOHlDmz6fOu3J0ZA16lZdM6yBOjILAAYERlH6PbxGMzY7Upu9bLpc54sm73NjeTg9GUPEYwv1NSWcQEBEA7Bi5pUh2sY91pzVq4jkejqMPDRVIypNejn3uEdY/VIyBNsJnTzcPPz/iL04masN0BM1ihgU3eaxMopiGJZ8cs8B/5xhVOvMI/KHXnGXq7tcJ9PpIigdM9XF5xHds/JlEeOkOZZSyirdVSrEU6hMazwAOPjHBCIrJ3GRvahDeqJLF22vd9xI27ZqKh1FuEhwz5xKV0opRPmSZouVNDkqaNBxwPIeEVCKS5FVMVVdPRVE0mIIB1qpkyIzESGR0EyOMBnvGJf3kUnatsBusJ4uGkCVaokYIM9I3HUAMmRMzhkPEePdEZW7cm4bSZjvt+3nGqJTPf3qAdiNJN7iuiWERl6XhAUxHS8K8I3YHU1eX6ecdLqtitry3J77Nw/EMYMJ6uVTyarXJmSycYEQKGw0lHHYMWiHPct3bgOu3jMtkvKs5xn2/nMHW0QEAwnifwM2vmENjJREB1HUeUc27x5VWld46eUnGIs6SSrTwcZyzk9snz4UnMbMlig8RkDMwQ5P5KJRnTJgUi/qFSWqcln6XSlAA7fGI/wDQrBgZRmAQ5cAGMpR3CqkqYeomERAcCIjyiUxEinjwfSEqgZG2kcjGfYZ6d4nGLV6gKFQBAdeAhF7IuA0lTVNzqiWlMBjEs2BEPwMWP1Nav6+EIgIDgYJqqrXrEXRdqs1dey3BWlnrVgEMaDx7YuBckAjgf+flFxrV07q6nQlJYUOkI73nQQ7MRlVsrc3Buy5aDPto1lR1rpowAykk8j0hJ6494HGMePZHxQ0QxWIg/wB+o6apWipO3iEq61qKXKTrnjgYNB0hHOoBD+7POxxfjaENBPbRvl0xo9P3y4T0PezzMIB2jUHTI8sAPiETTTdnvZh2WqhNc2k3EWvreAsHu1nWkIizUIwA6b6d4GgDIdgacIkNtx7WFmnTQtY0LQv9UVWYSa5eV5IxJDNM5oAZ/ooS5yPCFirKyGoZM8P/ALz2/ATyBtf3UTZKpH2KO/bm4CBgaDD2Gtj6UxKq1g2u72FC2OgaIdXWZQTOc47Zsd+cQwL02lVi/s7tMXtuStsluJbcEWJbpkoogzzhmUQwU6OQAA5iM3xDGqhtWZuRtEL0zYtAzjKrOaNdE44D5vcG8g51ybOiGA08+6JhNewuy/ssKIyuiiO1LfcqOqORIYtW0TOc/KHmPjAcxS37YkdniViuXnt9YlMnbTW354kDAko5cEL8ftUa1bK7KF7b0epUWu3RQGwIjvb4dAinN2n2ZmENfh5xsTtbYXZZs+vIRX5y2mbsqpnq8kSOJwS26T1Djge3zzGZXUfrkuaTrmXQ8ireS+q/mdhtU/1enp8RWoOygkHSx8mllyO6iXEsSJSjuEtehjA4+Mc4y25u4Udol1jM6icWVoJkLhabRcyxmbcbXbnXCeFj3IiN7aAPJaQVSdwyw2Of6wTlBOhg7v7dBRReFD8kzcBjtcpw6kEJVD4jELbhLb9uG4aTvucdN1Ta978WOHZRADtDOPdvOMkdqbbtpt9v1Umv1oomEwDasZwPRkMCI/JlDuxEitbQ7B1qs/lSF3C71VRctt/o9Wkyqq/XIXBEuc2tD02p2mdpe1Fwz15khf8AUOpwoQkJ1d0pwr8p4sA4xqER5ck6ouqSm/FgypOdTVFITriVz3E8ZMDnUe0fwHCGycl1VhbJ0S9c4JouV0lyOejGcWVtlfDaPcH5PLNMpyPRUMj0jhRGIiJBPDjk0b4AAf5QhFjGeWvFUxZkMfd46i063TbDenJEVmP3fX+QN4fXVQ5SlpT6ly4DNjn5xby5lafKkmoLfTFhwLpoyBJJSEUiZUFI/nhgOPkAR0uWU9BxTSEmgsbYdzCjANKSQJUxbq3y4UPKIBn9bVtZeQDjA+MSadBfZu2CGufadlLXtpm1DuAFzqUwqj1cOAwBrI+UQR1dVXPg0CsZz6vtgIrIquJValGLnXUPxlLvn+oaVNnz0NO1nd6iTc97VJs7NjOz9J2iK28JvAgA58BGbyjdPY/0YWxBss0CjuWGgqXrfKYVA8Vdd3Q9WlTYHIGktFDjjtHI98RetvtUJl6Lnh+WC5q83mYkoKvuZz9HfOMMO97nbS16ap4wXuMaVgbxr2VR9x+boYpdtqa7FLzBSKd84EkW1jW6lmfyRaq99bf/ANPmoN7T82tCduEdtli+6shBNmuo22TQyHV7diEO1R6T5CatuGOWtg4kB2XGOFa4PtGODkUDx+MQ5Tdmm8122q3Gu6HG/HugtNL+Z22R0FvxJCwPou7nJTwrudQY6WrILhS+oup3Ug9YRGEZKwbd8PfHUOGSuljRXaCR3zc6h0xDq7O0TfC8d62RbfZ4uq8numOyZPOo0p1P9gAFw65K57tPjDVNW312mbdSun3IQ15W9iHluL8bYLvtBHQX/wDWnU20lZuOhwXNQUk0HvvU/X3V/s/GUHE3Y+tW20pQdB5UcLyD+En9WqEMKunVL/ZNtVKj64rG9f0tpdvU8XExup9f5hBZyMm4W0K8Aug3rcoLTS28g+yu5nUHrD5u/pUULS+iYt6+LY3NcCxQeSsqMhL31HOEiH73RMxPFN9J9Z+zradKOz2qzfZdWTNxOdeaRGmj6US0vsrcYwn3qKshUSUvKOjof/eCK3jdI1815opYzMUkz01Xugrr2BzLKHzZhGlt+hz39NPOhYIrxtL6r/8AydGJXWl9H7su/k9cZc+uNdvLzIS/mffo1avz0ySwq0SLXRlR0OFLzjcyJ+GNJbTu1FcY4e9l7cqm6j+h1hc/e/HKSntIUpk5Wcm+mcRyeurSRN1I4lnJtX/WmG7DqGzKVRRG+oLZp7pbU/Q6Pw6vh1EC81mbcrFDqdnJf3xp/tvc54WeV0O4F0FtB3opobR4jfdTbGt8iLJ5fT1v2iVVdePndy/k4hEURiJa4veKIrxnA3PcSuoYI5x1rNvbwt7QJoaej2rZuM/PCx1DmJdNXausy42G43A6DyC3nRj9D7hH59qv6Sl5iFegnJBcoGcacI+D6Sy6h0nu5cvuZrH53v8ADl/4H3Y+/oCZBMI3Q5pD5R1+cpPpEHYXcjbTZNBe3kwqmgKlF7rzT+UIhbtObQdFgWNVXgWSjSSqPcrvxJt/1eWjVps4veb0lW0zZthtlnfk8txatDF8XdNnVwVAVIC2MzZHlrgPAeGmafpYL4FF9wA1kWsPVo+4kwieQFgbDczCKlVi8on4cgmEbodPCXDFQb6pdWfhyjS9cdzrD5dCgtqI7ypGhwI4yIxE1fWNxOCGeWNeEOjSfVMjQrVqFH3kDHSJmv5vl+OMRdWVKqqq9UA0E0Z8uMahl3iLJpgLx0mXVHMY9ohBH6QZyh3VV0BCONwkIy1lIKJPMoa9o/dD8XLfKDaGxiXYVpVBNu9YWPaq6quAYBPMBgSZMB7gEIa+0LLKJTjcdyHZQoGmzaUnWW5hzvyepqAaJBQe0BnDP+7GGLqOy1yyhy8qrdNMOXXW7h1kc5a8CPzlKnjL0utBmDQAGbQA++KVuq6arVIylT+BZTar1C/zFCSMnOOGqLeUMbaWxeiz9ghfzqMZtJtBvuwb9L3EY0yYWXiXrixMThAuoJ8uQABAZR05hrDTmCrlfyqsL1FNrmhEROqIlvoUgEQzN8YwyvU9dVEQ4ZwEZS33y4m2UPp6SeMFy6jKEhuSnN0fWgHaEZOkbvTuB/yXcblXk0hjHKVLDjr5sfagamjqqqSbGTWNVuXn5vwGGTCIhkNQEcAGIzJlJlJSWygmQ91LjvJof8mXj90YZLIM04SB+yHiFOnbDUA/WAQPKY/JAdRCXMC6OYdJ9LmlnxMWbMuuV+gA0yZ6i7IzIdF53SdINmhMcmKj0tOABGBnkeulqFYifAQMF/kjjXOITs95rjNUwVkE3MUPh+sdIQGXjgc9usXemcPONUmPnqu9VzM3ypv53IAi0bbkrZu6tHDkinKy6xjK9zJ8HkBD3kpWISo3KflDMbN3Mn5h/wC6QnFuyto1OqAjI35lBFl559cbmNh9QjDCJtLPgGvcEbCrf1bDlNm9dG9SW6VaoIGSlt5mvUCSYis8R3sRHUtjMQSTaUgziMvZrgNI0JGQSLeeI+ocusUTJnKCbojsHrZXPxpkr8/xjPWgSEMaeETJse1zbkeCEnluRnUYjO1CfZ2aRth2BLZC6n5QUfUfmnPEWU8keS4k7juFF025qbWs5WWr3RsY2tLo1tkbYHd51v15kl9XjH8j7S6GOl0T/vi2bDvwAxzsW3ZS8voh4UlLMqQICbv6x0Q0kL9uPxwjYz6ZO5oO+/rMsUkVZhQ7AM4ExUAAzLMsK2KlTPhiT/iGNTqK8VEhWr0KBswWAyOuZsZ8YZbPj0kWhcM2rOXD29vIItoyeR8M9LLSubVrF9vt5vmFxMdIxWD1Ijw0z+PCMnX7bvtpI6U4HM1l1IQnAGUg6eIzESCjjsi3N4ooqCqXlSiZhTMy++AUJSjMIhR14eX1xLLaP20H7tBW+tzbt3kEMqTt4m7ijTJ5HoDN+yJUsjWtTr0FlUSZrtDvnB8KiBEEEUenN2/VBIgGv+IOPZerVo3ysTrqF621MH/z3To7+ttg5+7EezqvnHAls8FhU9ovZ0IAGpy+rTp+GXAnhHeFtvKW7+oLh/VecRTGkbHbGLivfIK9neI/mzEHKPtgLA13tXL8e2Nfq9W8fsiXW0ssb8/D3hrjhEMHDVqZ15B+Pti4GiWzRCKFadkaiRxYWa2Q9EMgv1te/wCuG3UuAfjkMZssVvx+PKMDO/t++ITeC3QjHM6tRd2elBjJkJqM+70wEe7n5jCZSIHU85UJnypgqZL5ASpnMs0g88hpF8S1oykq5RcIfJMppoDZXPLA6Rll7LvvC+1xXFc977oLmcZzfD24EgIkQHulzGGburHrtVnNFzeM6JLLuZB4hq9X/WBmoIIIqlbrHcEEEEcAh6mEBHn5joEfZR5dLHdiPWcjnAh0dMY1HMOA17evR5prhVG431FVS2qlgsuI0SpjOSQywzeo3kyPCUBEcZ7RHvg5qweSStEGSRjqd0pcajqkiospq0S5qhuoIIIBHISQ2Yb1rez3fC2V1Us0vCUZL4SV9eR0JcnQDzkIkT1E2bThmAdfWSyTSfKyADNnAaCHbX6RPbi2UrkoQO9nX9u3Z5WOtghLK2TrRynoA54BHE7skWqP3q2krL2xSiUyoadj/TiE5QM4noBVlrmwHuCnJU+Eb0PSeWqezWQi9eg3TJNrJRvB0R4BrxGLr0btOVmqLFY/w26PFmm27OxX8WdT+HALtkvb0cjw2mmBZloIhm8dujipXQnErPghlxqSdrke7GA+MYF6QmyzLtntTXMbtuCRYqy5TVBblJkRz7OgYHOnnrjvhq9nxJo7MNtST8b5AwSvTdEJp05xidEE5hI1A3KAiAds2AznkHHQInRt1UUE9tFPjrCubN7ozSC71v8A+EjU7FKQtCPbVqQp083CNBsUbt0XWw2fuWxTpvOyNGDlI1Kir6mgAjgddYmJsu24dVxn+3Ws2CZk4vK5sCZIPjxHhwiMJJdmPnK9BXAsIGTVfIgAjjsjeb6FxtJyrf6sfGsWAylFMgTEMCId31xZMEiiydrT1Cc5N4XvonkaVnuXXxOfNwjdtb2z6C/6OzmxtrCv7Qv2wryIHiaweD+GEaOP8IINGKVhbS+ynWosRwbRDvUXKABlPIK8soiWK+UvSHyjY36Wx/uCzK1bq6yZKKWWbtxEooIB/NllGaYfIAEfKM523rP2Yf8AsNOE9dpNVJLZuk0YvCB0gHSUbfgICAmSwDoJgsAiAyjoICICAgOIz3pNiGb3Z3rc+RQ6JiZhnL9IJNo3vNGdp1vMxc3t5B+fLiUQ0HA98edZR7BCJObTWy889mJzJRFXUUt3Ml3JgOO3NzWzmo0H8nCICFSjN4hgZRHnzz8mLoz5DGNYzqrrmSx28gTUuSCi1efmCukOoh2iH2/3Rfi3L8dsWClx8wi+l+IfjnFz6PVumTxDa5pu8wzFP40fAYdlA5eX3w0Kf9IPKHZQeA+P3xq2H95pifWHTCQwDpp3P8cozhNHIeAftjASX7PujMSdXAfD+6JKzV6Ya6txXBIPW0FPca/nGzixr89RRI8OEai01Sz48h7Yk5at7ViKkR046d0GXSzSlGmI43tA+6KOxHQVb1e9fWodvOJ7Xgbf5W9hvaaY+omnFblWI8f7JGouyb2E96jh2xuksDWouNlOprmP+8LXPksc4ytRns8gthQYtVR5LljuKd0w/O1TvkkqXdMPnqMKoy5+tFSYD8fTGVqQlVRlvVQbJ0OYGCpyYrMH/lEYxGNLN1ubAaOb4IIpoAghPCiCR0EKxCTkGR5BAIzDrjGB011jzLjiI4HliM+Z9uXU/qqlM1Es2pdVJ1dbObnIM0xEsX1GYQ7AyEfnyyjnck8IwYImOp3SjLDZss8V1DctTqVGBCIy/JznEfNBARER6UAAI5xqAeQxmLUaaw8lskgIxcTKkpmQIlCwBkZhHQI7tGchJrEQYkMfslHiKSiypEES5jnGMjU6UwiICATfSAB4xnFvWGqXHciY2EiuXLqKoaAkV3sejKAjqGfxygfrCcVuHIptRzlxKqiYbEkaK8RCaXjjwjEyh02RrbwWrzFq/DIZAfP4xNEUUYuW2e5EDashulS4D+3t5ATREsZKbPLIm3DdIXhN8YqLKTXRVI6kmAwZKGeiPYIxao9V6o1qviMeYY1NVrj7P4rMG1atPIPYzjyDHfnMeIIIckXdFuqg4CQNr3u1W0kOIi40aZTNKZelucwTjIMvbqHaGmkMhXqBNUmmwPQmnmnklAdQARhIPyQyHyQm07ooiOc/fxh2nLhWcR7Zm4y9Dwh5dSzt7HtIxfLRNvmoTd79aVriAOPyc93bGQJqCqKFE0YIk65guWD3keQBnnjhFgAPlfJzprxwMZUiutaQyikRIGxLF1QsBQ3KIaTygOcD+OcN1uox+spV/m1e/wAIDRq11vhubJ6OH4jE4IIIIAQV9LEuAERzxyHCFIjPiUciPMPk4xCSmMnrJZpg/cwn6Qh2hD1PtyMVVbjQT2y3hSVZLTKpNxHBOdLrIwI/S/HbDrDtEXCay7hYpMhd0vfByTRNdquvrSkyYYF7/P5BkKXbZsJ5VuLrkcBaomqpoQVCxEcqBAAm1yHDUNYbB8UW6XcJ4u2a8xhG6QiVmnyAzBpjPnGK161bGk8wydIQlkGbMIJ5hGbOoiA89cxI5eeaVabC3bFJ5w5P5WPdsSMWLEqPCbPjmPX5/NUU4UQno1RoiPIYUREkap6n+tEfAOM6Bju4xektaPodYK5E2ZKmQ/jS5AYssKQDuEQ7ofmlFq+J8YPaqqIq69AX1Bbyo41MkmEaHvBs0EsmeEKHMiqTaWTaKrS9FRTDIlDMojnAgOBCMrUnmTnT0IsmpoJikm6TKxU4OZwzkBEOQh4xgs0x1dU5ZZwEwYM1+jgA1H/mMSdRFs3a7O3OY7g5vwDq7Si0UdmZHMdfMXe7GHyfKLViYOlppnAhyhzrcvs0w1wuuE6RauYKz9KUsdl6UvZqH44xRbaCmkXATLuykaLpozZNdGUQnx3RZnyKJSXjgNsJurpZsFZptBwOMZhyZpO7Y/Xuu6QhuHzDu0SkYZJOcbrFIqQ+Upe3T4wgci7XcKkcUDA/LNTZAAHMZ5be566wzPSTK4yhNxGXSGooVRrgE2uAHXEX8n+45H1OvOPqHVVXV90jc/OOcPOzcXOElWLkxHObNnFZyOQ+5DYnj9YR11GYcCI9gRicLgpdoTD5QmpS50DTH90MUjrV18KHDcss6eOjPXxs6pwto0aOvPPbwhKA1M6hNjlzxCr12aP4ziCjj1w7x/fDl+z2cDVpjzAzkQHURzr3w7Rx2J0zNKIApZcDRaYcqgZGebXhF7qN5sEXIUpesMmkfpBkBDE/eAfVFif6MmETAVkoRAtyHsiapNFIxHGhyiwkbdmrfiX75A6f7I5fiGKoLqUEskdIF6/u5rSYOGdeMYqdOTSziIBkZtRwOcQ+1qrDXMvS+iDItG1zbzXJxyMssu5ECPeaNZAA8x8In8lpOybsIqZRQdRpN2l9o9InMBXRCQyz2daBgRxKE0wAAzzAA8ccxwABpEOdvFUEdgofI9J2zhgo0kXyRGy5/Bie3zhsdnHYBdtyG6N19otcksXZQkWFaBRXZdzdjwDX8ykmlzr2za68OcZ/eTaSR7WoBi0WyI2AthbeX5B54fSez+xjBo2b4/8AKItXr2wLl38Xiyg+FaYU1J/Q7dlEZU1O8IcC1do7+7YNRLLtMjQS2M1MIircRzzgnMxugOvypsfYHwjtEIx0HEHfzjvXPe+JJEe5hvELLvVane9jJwCKCl1uruOUsVpKbpcqqaDdipOUT59QHyyIxsLtlsRpjaRkO421q4haaYr5Ot2xTVHN1XEHYZDHugcOOvhE9tn/AGaGLaIq65tnlUb6+8mSlifeG0DcOUJKcv8AZG9KGgcPOI+IbXq3WWrnugi7087KzG57TnXHcNcy5HFqGQl7R14d4dsKAWuG/JbUMz7MyE90caMpDSHKnzH1Lfze3WHPQbtJrqU0q26hXQdmazhRU3Ek2mqQ/MC3+dYi1cw+morkXk9rGCptBlXDBJHWADIqBbOANQz87jMqpytuQiAZz8njCk4p0UwaFc9VlUgoDqVERCX4xZMFbsJCZ12BPpjVNuWlZtrtDrwJNX6YeO6ttzrVcUzfC4SC9k8mm0DXtA2JxUUAM5wW5cMYHTnGJUbiGG61zDMLzljJAwbCYDmNREMYGGdXbhnz0lajXMiFArNoV55HiP2wnblD2qq1xGsOc+6FB5xI1ZBJeRPyVm1h93McShS+WbeXO3sypiKHKYvHjueYXZ4vNfcXVpZWUjKnKmFgJlJRDIEC4a4Du1ipbxlvu7SwQt7bFkuR+vk8a9xT0OX1k8wdwfeIhG3nZ69EJcC5pZGc+0WeUbQoZqf3C3pNN6yvE8McwpzaFgH/ACwHTkAx0ZWs2arcbMLWoNBkM9sWpSzhX3xiogio3nuB/tUYraWvRqzWPgfjFVXdONYuRO/uqR1dP3z+T25+caNtl/0JqUnHW8v7YCqquFcNjv8AJs62uOhLXmABzKWVVnIhKPAcSj3ZHjG/owYt/spNcmwWU3mJZNDLCMxViskjmYiI6iIjEebtOS/DOTS7HZ7HVGQmfrqOR/hlGeWU2BL17QlCi6XjRVPc1T3Q6eP4wEZ/ui9I5Z3jRbJXvDPNw6aI2KV1FtHyK984au8F+KLjclBXtuRXjaFvW474uEPnHeIivR2b7tbQrqSk54e1D39634msfpBxD2JUdMlh/R2MO3DboJ7/ADxUSqT8+LCMGjdhwHftx7Amzmb6uSeoQdKV+aI7TQvnEPAYrCX0nSNMG0SbEVnJaTLoeuz7c8yZzZ8o0opnoJXISrUAMNxL6rNDvwrHX+oeMTetX6P3ZdstRPflgeLXcJool5OEyMQD2wPS83OW2Q/3ujnireazdVCBH2bQ/wCGShGhO7e2BtdXbJ1y7XZt0Chr8+OOU983p3+qQZGsrouim0SDnn7wjbNF3dKvM5z+kqbcHXQpbXOzHszJqonsdgNfH8jrB0jGs2/3po2oYpV2xQeCA3jYaAJHiHnHPe5F7bM2k2faTZvfKq1kpLbxXrxto4/N7i/9qxlSP6Oa2LjchFHUDz8cDy/Mlhtrh72fbqgtfrnvsTZayIiLacq8q5PVFkS+ji3kI7aKTG2J9kpRf7++lzOHzioCcfXXAqiPGYcB8Y16Ojby2j7nINdv0UFRMgqjgmbIgJEfEMBj64lgpslhMaseR2faRB6+Jqnzwc6h9oMxjj8UaTHooZ94EQSSqsl9eNpHQxx1hD9BQ8c4VJyTHGP6w6QNrR76hGETHfvas5xEFXtNdK5iQmGDCmVZZXqrCqdXnbv4r+ug4AfqjNGfY6yiHUMV3O/11w9Ujk5voA3298fujC1y6TlNmKpROoFUpMmH8ylDIxirkaDuRKCWoOJNU06gvk9+SjR6XG/l88Zc8Q/GItpK15V4ifaVjI97VC92mjWUd1O/cnMiqT9l7cwm4w7mWbQlgUC1FuCzhXjZU8RRxEBDjqHxjF0Dbuu03HshOhJRGvKVQDOZUg8Q6QKPjiILUT0nrvXl8h9gRnrhczcVGk3UlKbEqWvJgVxWHBvwzdeAOofJHQMdgQXHWBaWqOu+JrlCdpXfzhxZ6MLH1RnD5HXq/wBbv5+oVb8X8uPtBv1buC6DBVLU3Ab32ckhgKenSD8YY6rSPhMAz1Juj2ZwIxfSGJZ5RnDMohqAxmjlLEHGvpSLbxEXFE0qhQJkkgrKJ9SPmB7AAPuiUxzNo3RPqUSk9EGVg2jeJO+qtkoTJu/lgGPJqagdnATwCIAOePZD722bb2vespduLRspVdLunn1kTiPrBxnICZNCOC4BjmIeMbeNkr0Hl07kkUy5212pGrOW6mETo29Jhl7qIcgANQl8te+N81gbHWTssNdn2QZ6YyWG0y3XjlWPzBScP/tmK4unSi1jKbBFdM9P8GXjFGO9KVbezsYo+0uD9n4Q41x2NtSl+iz2R3gNzVIrWvrewwWNvpUQ5xn9nUUA+Z0rI9o9KbxmjnCv5eBUfzlVXQr1xNGlUznPAY2V+lD2m693LzOpISK4ggN5UEAKDwyAaRooXnL1koCA5mllmHMudBh+s+MUbo0uOV3Hrkv7hBIKKq2rBctym5IvC5C+iQY+5XH1pxEPAOMNubMDLwx5/jxj5WNjgBANPtjLLSNQLi3ESEAyM0qXvQHXCbl1AiQoCAnDIj2BLkfHERC6rqj9a2Y198rGyFFBrvJK4pTH4Q+Am6tWtNNnZIsigVBBC/Ls+ZnQ4VY8GaZFHIaEjWez5Qzd+O/Ma63erFFJUNgnUN0TpRAsUKh/EANdY3Pbc967e3I2XrAfkgodUpTHMqFu1gluPR4AI/dGj5QARmzkQyPHnFDXs8kW9vHw3Owb1CbiZAUq5q4Inri8/wDyE6vxFuAQCUcDNKI8MDmUYdNTtMuJTES33XNEBTVOfo0ivrAA7x44xp8Ya2akIgM/RAJel26B3QvFVOzFaJCcxXmL0J+kXLCI8xzFPQ/Ibern3RtjHUOn0WU+TIcfbZVrRJajglT7u7vYZTecZOxG5ScC+ToGhn3ChUCYzOGmQDnCh/qoLjirzF5R3YtP0JdcZzxxF4Gau0WuATUZqCguBgBD+aA8A7OMJLfG26mOJKUHeTMG0TesmpJdMgOc4/HIYtlOCasYNCy6qFRcHMVw8OfsE+DTOCi18RFVPQmuMXMc3kx6g3dKjOA5nARxx14Q4Tb9T66L08izbMLSkYbRcyXRgmHdMgPSxyAYw0lWChWHj5xPrOtZOyZvaKnKdPsmDC8NVo81NT0PUhuyJSPRXpH7MlkUBwKW5hOZ5fKlEPvhpUwqNagOnGLskVjim1V0lMOgFt8EP9Ef7wi6spKOHSvRo0TJoeA88RfzPnkTuECdGdEn2CdUR90U60coE40/uqHHaCeIgAZ+jnHfmOmj0Y9vqJFNbiwoEfdShrrxY/8AZ8c4LCJ0jBsnQ5CIZ5hzjqMswpfkW2V7t3AUKG6exFh1Zc0/1SG++kddEIsKds38AsS+qUb2awYd82f9wcuO0DcSreHaGvLdWsP8Nriq68WDiHqJjg7n9XQDyhplGoMw4Dlw10i3JgZp+vEdfCFA/Km7MjiLHRZYI4CNMlsrPHvh7bKX3uFYF4C/rYqopC/KUMEQOCTCYALmOOn44Q2FdSE1Vq16+R3gwM2vjrGNUKgTBkNBDjFeSbojmO2oW8nWHJGXW1JEKH6MVoITxVpcfMI+wNQ+NcMBKjYIaZx77bmy+3ywf4m7KesjrwBPmA7/APD9cdlO3q5PnI94YjmW9B9byZ++kAZqiIjutt2UrvYQ7BpyygH/ANMH4RvH9IE98prxM8N0ilbnoqvdDOKpTxyn5fkIY6RVeyzGKp8Mt92FBzUXmUt4eK4YDjvXOIlumrrnlD4vY5vClXMfb8IYN1Vfk5468+UXEssNMX3XZ4TUdwoZ1YrdvnGCHBGbORzwjKVit9mnOMJOVs6eWv1xTN9SVEGh8TjGUittD04sVYePeIBCCFFfl+O2LeOc68YwfcjzXu8KgxGnNiCCCCIqO4IIIIQQ94CUdJsCHdGaIL1c7cILKUkrBtOT18sBFcKFJwCmoUAHISzhjUOOmQjDByADiUA7R0jxKA8uUGtHbpkttDJUxFO8UdE1VEq4pmwH0Jcy6cc4x/Oh52RY659wS5E21WkpqiUdN9Xl1Mzu6KQOGf6OXN15gkGbhoA+IBDQUfVhVlGrkJc8cacv743ZbWOzRd65V0Ety2IKFHHZNBY6SRtKeZB8FBvkUwCgCEpQaPDUBEfKJ3YVosbjWOu+ObVkMSmUhyEPXN649SqlSvS9Qfb0Luz2e2btv22V5NqMmiW/tzbJNV13rlwOhJMp8qgAClygABPMHGep34ANdRAOl7acUti3aMdRFHbDjQLhb2qe+Nvr7+UY4SFGw+1QhqAl3SzXykjMZ4HyE+5HBDnpoMSf2ehuLbhzoy9X6ySzSCaAQOlAxPJgeQ8I1lomsWOquSqDBwRuQ3Eco0doIt5nKXCwbzsYodvrM2tyCYO21dxTcr9UmMnJaSls5gKnskzSSIiAm9BPSRGUM/bGMbdDhXnTfUKrJoKRUk4bYtoBkEn0Z5vXpUpsQ+E31D2Q2F8LpuC7zyPPNeTCiacNmunUkJp/V4B3YjYvSvdsbOO3SMVWHQ8mxdlzWeSbYPBdRkEVJJIbtgZsy94SgA9wRfslHtZWRJXXdEQxCp+oNWXTbts3HLKIOHJtUQxCIG9D2w8w1DN9pJKAoiXei+a9eE2DYkiWZgHTSOi/0PzH2fU64bduMgXUU0lwGlP2WcjPdAgQTByGQHIceMabVEnsiJpxaolXS+3CTkH5mN9RAnnjo9ogI4DzhxdmrZmSdrZ21mTYu4blYF0G6FBcSTSgHQBR1H9GdEQHOde2Ap5FOMtddtrEfob6giN2LxVkWmfYToqYZctCZ1VB0mf4Sjs+LCVZkbgN+gWNM40qUHSdV+ARlG01d+y6J/g3NkrjrCWBVbcWzlKntcic1Ut6WCsyVNrz4y/CMZ210deuZ6NpKtxtvuo03S1shoEt8Yx4ooPN4J0akfVPD0hLVarXuwe/I5sR7MqCQIs+2+//AKQLo/8AWsZA2eYlY+MZS9ekZV/PD76V+UYSnb1eTcGjWVJk2YpBpmfF5lkv6PyxFr3s0C6+a9vVdbZ55ygPST06hpgAyA65x5xr7mX0SrTohVZCKW3f6UwTGpRn8flRs/20Hxbq7LklS7d3WssVY7UTNxbiSnnleUJg7phAQjWwYZ1WhINeVzM81/kE14qMwRZ0ajE1bEqudM6n92cNWxSqJCYV+4ZQq2vbj2sWuXsZhUUgzb5yEmy9kGbpHh3dVln3JTlEdQAZpRkHv8IjqnTCMuBHTjjyiT1e6SJbawr3sy3D8y6sXNXCB93GBKBM3yBZP95JiVEce8jNxHx7IjEnSzBL0uWfhEOt9Fl7s0dRq9bqya/VcGf26w0TmOt3sM+Xey+f5ubHz4DKU3jR8/tCHSQoa1K4y+X2hDpIUabt+ngZBJrJpg7TDklKohxjJaBrOoj5f3xidKrjQdMQt9cPf8Ah8RW1A03GvKodQzsnW+H1Q4bWWN3O0A74aEvVER7BDhrGVJ5kZaoD29usOUavSlecWEzXosnhUbd9m+5HqFKgX014Rv8A9l11busETHrw7o5OrGvCsRWCPDx7I6Ctmi4X6JM+u7+MU3pAjqRTtFxXxZxljS9A0ipAi9fFnHPT6Wa0tOy3pBtoFKLFBKIr0O0LitsMfJOFVfE0oh59Mcd0a8aP7hW8fjHSP/hF9psujZx2jE8jMJRxMyvb5xKocJppPe0bI9gSzTxzaGwGWqA+YRLrOebbbyS/m/IHwC3gpVvVP++KkEevlf4nTjw/vjzElEtoGbYNsUl4s9/OhQuA12ubZZEueT24szGOvHf68xu+7JoAAgIy5yPS4Bxjwqrq4kJqLIVKTNuUymDLKbJhNKC2GQDpdn3Rgi8QkbioeTypqY0XAcAYDIZDtiw1TVauFIMjgOMwB5xjRKWSs9oeKQSMhIkLkVyG4z5xmxVzVEmoQLkU4TGob2+z4xQDkHwHsjIEpfUEM5QOkq4lTxabMswaDKPDMY+ACOccucAzCPHXviDtJJ2zpigcxAElrElSrJdYyJbXD66arKSmbMmVEyOZp5tZpx4ZEf2Rjg8R8YqhTrVQENRHtjz0BAQAdMx0dKuni2vfZvWHihzrKGWV6x4gghVRCn62kOuAH5XD64+kmev8o4AEMY1DjwzwivnTHHzjJHOQQE1ZrlW4cqKKcGMGTtPoTCGvEOUVuoEwWxVXhWqHWAKO5ikhL+6AGM9KJqjHu27tZlu1UJxb3cHZVsfWHRxLuelzeTq84waUQCbPAPGLiMswCAhqI6gIcRhAHREZdPGHDt6XQ6riTaK+E0qbOYDeJs6hLzhstFKr12SKocpM5uIfbVpV46SQzlLnNl3urnwGFBTmlEQ+UADxABCPUoTDNjGvIOljESd2p0a0aQ+5y1mjqscbO7gMky0SAioBjjkPMIipNMOnSHpY4BMH3w/XU09yMitEFOU+TtE4A4XDBLW9OOYNwsU6iJsuYlcxK/IPULKNL917uPDSEcEfAjwcJ/siuyq5KhWOlzQmywHA6I9o84zNxWIuYzrTsO9q+lUCrDuYpn09oq+/Fpusa6cIAcDAahgRhmj6hOamEasw1JsYAZh+jCgFFSPky6eYOmDJUr+alZh0Dwj7eO4mlzuXEWibxfRZDcB+bjDysqwcKrVRSqRPslzY/wCoyalKiTolaarXm66A18kt0dJpYxKYQGYR5RR9aMoDkREOXKCQAEcDwh5kZ7XUIggQpA2ZarVJj10HuoIhMAhqORh6LS2ZU7pJj0WS7oaDeIMlLoratK6VsE0+eoZ6OCoCA9If7oZySYZJgmwA8sDwGHFSHG1jb4Rl5zNgAZ5VSoTOBuohzcJjpf8AjBIPIR7YHbKtHEiRwubteK4OPt6wdmyTanjxha0UKEVZSTk471mnFTHQLHA0CoHIYuSCjHVs5KUJ0ZjNfjoGceEeXbXQjjjWT7PTjSU2TalWNN5JPHN+Pp5fI4CabmOOY9nOLyjnHHbs4iuH1WN6LgeJiPGYNf7oeYFZFvILOH5PBiG4yb5CEzjszRZrSBKPs2z5t/L3fiFoXUBTQ64gcJTFtM/RzCdFVK6SbpHi1bdjJbkHHIDpDwvm7VF3p5ykYS5eszRrpCczkQ5Yixshk0lkqbUFaio0E3HuhkoGZQMcgHMS9GIRXuHX20cSSTg2nugIwsx2ZynxlPlyZPlDpkSNsrjMK6Lsety/ZV+NgoRnt4zpWyaUguFXrmt2OZOfxeiACOR7+zERgNk6FGtRAvXAznUBDXHdBUTxLjoI47M6jHk5UGh0e/4RzkaGXyS08iXWE7QjcrKu5NY9XBOlrxG5xUEjXTZy1QNRlmCYBxGfO58V3YTTqcqcWKypkvREaY6D4xgxpRPKoli1YAES/wAkAHQRzF4XmesNuahSVKExXePlZmxnxhM6Ko1P7myG1Y7JO5BGOdoMM2xHya38PtGM1aw6Byz48Yd+29pZLjINxF2d4NFrCwWv7TypTmUNwUncHT3bdEsMfLn14Z7PJoZilSgP7tnELi5YyX9SIU5gAwGZdcD2RwTKqZ0TlZHOn3Q2NKJ67pyZw5tn7Vm70XBRWGScTaappWnrfPDqUOrm+R9SAiOZvLzjA1mgJFRrEDFfegTDIk96l4aCIft+EWsvTMVdQEQ01jO7Z2fuZex5kmDbFsKbrdKr8mQgQk6Uwhx1GEq8Sj2hF6ImO9Ob98daUquns6BOb28gzOgotNdbExY8M8q8NTiIj0cZiYtiNhFfcyCYuzd9yfkMsEk7ueVnMuEP33ussIjogkRD5Q45jp4w8LYtdsxbDU1JWvJK2NpfaIEtvxK2aGojMzbfmAHTrceY9/1BERb/AG23dm96oqlXUaAo1zipv5RuSj0glHsH+6HJa4lZVomvU5Sf/ciYKy/KiCC7lvQlMuUq5PxD+3f272ujtCvZDY3Z5uydsBmydWpsjcR4Z/pZ3jEBijEMngA+qVRATRjMxcRwI8NYW29IVXk50xBayUoqroXVICSS3iRMRmnEc4AA/u5DG+/Z32ZmJYO59u+vzzYvFcSdVoETxI8SEWbbFRzkOkPPx7oVXcTGeHZ9p9T5vwEkgY6Ocxx386fXd0hBrRttsYzJTcRLwbURdXSGZVkA80rbowYeb9m6Q5KGRz82Bw1mDPHzmsvXIdT3Js5vo7W/JlYdJ9xSGG1SHs/7QRmW1+7hMXIf7PX91OrrTXhI9cENW8GNRFLDs14jEZLdvBHcr1b6Q9XQaa7ZrmwInHDMSNL0yCXEeUnEcacIkln6PmTpEkrdhPCTjUmibQVbaajZ9pJJ4Sc26X6hNpKvO4LCobccnVbXerHNs880yLMUE/otwREQDBsf5Tx36aDGrowjnFqsdrjXFJTTA4KyiGQDXh+O2HTNIJMkRMLCmuiIyVspqXgZxO9o9wQ1jlXTK4d3gxPusvIQDEW0rERLJrqEdxLspENx/UNBXRHW/GpEbsmBWyX7IhuP+sOoMUUXfSTpAKpwiIiOADjFtJI6k6BohRDXGMZxiPbgTCVA/Woo28KdDOCpkCQ9Kbv6PL+6Og/0U/ocbxXUnIbTO0bKTtnYAlMM4oK6fFAcbjDhLgNMBx46jFeXJcsdCUo4uVzkSIKNl7ljouR118uMkaTiMTgIQa3dnH0TW0/tJtBov62DcKl2Y6nRWQzDjXD+4gn4EMqQlOPRDIhp2B4x13bGPoVLHbDlvQue+VRJM3OMpQgZuLcRP6J+QwIiOEBG4lvEREe+JkpjwQWcyW5ZfZHtyVKILeS9xNvtcIfNyhE2rZ2DcdZnknTtOvYyeOJOBbpBZUZT7fQOXh2ceyMf3rpwmnqybeKR2Nn3hke4tMSDxbUWY22Zvl3lz8BBCtMTUF4/M9j2AqJJYoqdRrF1HV/CGHFbno9XbWdZK55dWLN9VlK4Kmzi4M4p44z1poHHGuOyHXvf6QvZy2emmLUZSyluE0Vk6EtEgfDoSZHIjniI6d3DhGnJ9+mufd5245GfY4gBo2yi25HnKB4E5OUhxj7gisqTtyPUcC/bzilpeSdTdaSz8+dQheEg2x3CO2IsvQPOi9Kp7WLpT9MOQeMQNv8A+m6S7aM9rlmAzV0qlLEvV7QccxDMqiodmPMfjGhW4Tbupdtyof5YLtqhRBJmtG21T8ZtuTPQ/UWnb7qKlMGtxbZx8H/3ut//AMZBGxRq2G0kEaZrLIe8NygcK6m3VtXX2t5XMFnGqMdzuxePriwC4f8A3ut4t/ZEaIZrFqzaq5CLouhdR0XCXSnvxw4RP+z7diz0XIccbwoNdr0DRt5KxvcSbbCMbTbkVm48K7HeCGaNqhQ1uKu2/wCUU/3v3yHPUyKCXgAeEWkuvziaSD1arUW4x2+lM1JMlCpjc1g8H/1VDYnX57RtV4p5kiqG102a9zOcG6n/AOtRirwUk18L1f8AI+hqjea//dvrz9I/+1YzZHvkg7MtvXijrDjQOq3Z/DAdwKKEco2Id63Z2ATOHdvldQ331BFhtsP9/jcdBhKVN1Ke/HPf+MOPtjbUVsaDkbhdHca83jSSV9zAjqoxr6vXtcOp/CcR7dFpmk3xEB0+kId0Mq2WM31RmOZfXnGAOZNMkZEpAqS9M8v7wI9KYP8ARDWNJ2XopkJPp7k8Zl4RsTRzoLuy4afr0+zNsvig+zQ21Hm1UG6KOntNLOKlxi24SrB3i3y/DBX8c4ZJ0olxmGnMlXXjxU5K62f+9sTh4qvHiCfqVAMaiW4DjgOMwtPdTV0JGSyjaKlVInNWmNqoGx35QzwAQ4AAcIskyGrK1cuWAuZMaYKlQDQe3SL8h7RawudvEk7vANfQOi6FtNmdvEo9IfLlyUDRy0K9Ux0g5DkA5Q910rw3Lu2g26bz2WZjiZbRs+yrQASeAIFc5x3joHwi4XIsHcyzji9lroNtTai8KdvxQmeD5UweP44xgciHJTHNav54zmDWcXRwidxh0Zx3RhpGqJ0KZtWfiDcUkWWacJaWcCGuNYy15shvIaqJIq4ibgKgIYOk94CUfDP3RIyymzvdW869RbtrmAqOs2IiE5wQ6vb5DumOcI31WO9FlYmwaBQuPflXQrmvwqO/ezR8jluJ0Ru5Lpt6ykj1lcpP63uCqtIN3WHo9iToypyrSH+7F4/qGkrZL9F7tCbXZkssJ5D8m9qcb8cuM6pRkp7vnI9WE+Mw/APHhHSPs87JWyFsEIQUGW3i1xLtmQ6Lifbq9/Pna+RHEocADIjoGmsW+5G1RRSkci32uQ9nmuU9xJkyI9XxrludtIVi/rjHWmPAdYyZd2kWWu79VRRNmb98YRvTSVN3rzxSOzN++Nilztqisqna+8KuhRL/ADMj+jk+L9dRyo9ndmkj+UhxjbJeuwl+3BtYPfyenfyNGovYhWDm1ftLfOHulpbepf5RrkLHEN3T/wCSowv0su1bWvXcUszU8BKpaBNwDjD1YtjO1rmbIS3dEr0ZaP3lLmbVf+MyjRxdNx1j9Y6fMVt5E0ZyIjpw1zERVhRqDVyM3d+yHkuCpDgccuIdsR1OVxrCOO/MXvesvsLQ9c/SHBml+e5Uuc4tRysA1OmA/KAdQ4RNXZnbBGha++lylpQFKSZGfMzAkAPz2Y2EoTf+7LER3C0FpFU6COaLz78ZEBL4+ljPKJ+3BbZK02z3Yu3JmiJma4C4euO+Mf5vKygBT4Z+EZhQRkX10OeViZPX/bHEDZtFWSp6LkyKE3fn6hHFuuMWuiuBFfVOUshXFCgcLoUkuNzGicGbeS2uC2PlAA8wDuhoVm36gjVjAljBZUTJZsyqhL5VPUe2MWdbjquZcPrBiURmOVxnEcCHEdPsiihu1wN+p0klRNFJs8ZJsY8oiyt72etK7HLtjLNkTG1SpTb/ANPz4jo6VTXps/YJzFN5fav2CRjA2cXE7GwcuItKCO2LfJh4CKg4lmYQxNMOACWQAyIiOADAhDjWYZrSNOOk5idtxX2Q3pt7Wl18DMKeABr8onQ07NAz5Qqtjdh+XLQk5rvOai4Wi1TYnSJI7xlMGNOIdusSPvGbWE+3KVTVK9Dc6xatMkpJLAEE7UOXjGiLPtCDlIpCXbpFIllMfxW+f+8OLrsXQ4ncVqPrzcOvAkCmMYtSfV7UESL533YdybggsJluExDQE5K6lJJCfPNLLNj9ZHHPu74wxKa9p3rXqylThltqEw4LyjPMdID3DNxDx1iONanULmg9aM/RHSbo6jGdLCk2kuVHMNM4c3uYt86CcDABNnUPgIxT0deqK672lys252zYxOjV4/oV6xU8RKooc75BJZDum4/NzV5qjMXVbFWZNWanVEFMqA5LKRMdB7w7fCG6zLNrPMOeGgZzEvmgbKuq2CzMth+g/fjBoQ11EZcQyxALWlzc1Q24j5mj0hyXKIoyzh3BmbH2xejyPt5ikz1DlNFssnnKU5w63TZkcgs2fwSxSNnJc+VU9MSBwrZpNX2TcyiYoj1fKVEgM2dAMGMdEMQkYzkVW1UPl06sGFSjuZkMcQzwjPEhYLOOVNSEgn1Y2yxkBKlZtN9HOpkz2iP2Q3KaTEFI7nmZ084s9jRZilx9niEyQRVZIwi8SfgzkKoUSPs+midXm4W/pZvtjoc2uF72B9HDtBqGN1NOFsJDGAO0usHI0P7N6bv1x2cW5CbyGOPONr3pbHT7K7Dlumh63djNy7n0JhDGgFkcpgBHuyIRF7pZ6+VZoV7CSpx9aU1tnVimNewiY45vyv0KPiMKYSUuPmEVJeIeMWRSmFMBD0aYVToK8EeZPohBJ9EIcB2LXD5xU6c3b9UHTm7fqhLHvpj2BCH1rajpL/wehlCXXNqO+hkR3VHbxC3hNVz8mUZxzkPEOjDkbftwvUI6qn9/GH19FNb6tZf0drPcBmgZLKl4l1duIbGUMAIShuaL9QRq428Lhdauuuj54RTUYltt7kp6Ocw+bCjOU78Qr3C5zjWC5Dn+P7fhDCr5sM1MDnOgw6zkOZ/GYYhera8dfrizpJ3WqR3FBZ2lOX6UyAwJSrfEeGusYScq5GMkUq398YgcEc6doxljS/MahLUUGXkenVxCCtOHh4whhRCeMfyLqrhataB3pSlOoEEEENo9BBBBCCBBBBCCHsQ6AgPH6ozhAfzybY0KaE5FlG9QIzF9yUaieEme+WYIwYdR0ER7Mx81lHvDzg5o7dsV9oZKmIp3i1wHRNU6VcSVG8r0WNwtoxUuK4Linl661wLZWxQq4nW8AnnahqKgf+STKTyDMIAIiAzYDu5DEvbybdz3a7koll/ZfSUhCNBkRPtRVOhjzHEQL9HB6QVF2UbX3XtYvU15JnfTnS3OgPVrZBVR5qY7ocAQ7Oj0MD2hMHKHXm2m9p3aJcCU0LbbXBCqtuBeAi3W3Xt3Ky1BQMCGQ+V0ZgjW2jm5Li5Cq/YLGcq6veMc5znzh+h7klopQiEeiU9cvbOJjXZtNaza12J6G1PZZKLN1z2oX67WuqzgI9XqA9kaOblsowzZJBPjguqlgOko6TUxi7Quyl6Lja9WL1XlYz+fThuuVII5BsOLrVTb8wSyhOPSAA0GbMwBjQBAMjjI8/N/HghGLTW5QFcuplX4jpe5nc8OPOJ5HXVNvkNvfpiQT963XN0O4uVH6QiK20us4lgvQLhkzMZ0joy9HDs4XPpHES7FmDxVLeVv/nyY6u6p02f5KjSXsvONotx1ETTgAMb1qJwMBHcb6KpBZJhnOosjUCqtvbX5wRG3TyUg2QcUx13aDvosWRQuFsxpuKuTcYbLaKeFHaFtW5HwjilC8mnuCHdW25H5/wDZ8zGi65RO6Tc9GvtBMZboAUcredZbf9yP9YdYJvtbr9UTnft56GyB6UVKaLgS5Sdsr5LSfbC5BEREE9UlWZpZSioHeByYB8AmiaT8tjb21V5lVgXQSkt2W5uEVVmO/G3/ACcoIyhFbX5HI2xIkYRK3gR+nV9A50wwfpA2vEaPtIT2Pto/6u1m1H+wfn1gGQHtDgEfZRGUcCGnZyjdT6TD0R7r2K3E6nhat0hd6wRKvRPSrQSARfrDLH9SUrgIh9ER4dKXTUMgGs0aZBrURAMjwigFYisYts7hYpFOybsHFfKVr5RUpcfMIvBMAAdBzw+6LPS4+YReKOs3mEXFYdOmJuBuXGYJfGTxCHTSeXlDWI3Gl4w6yXIIaYz2xsCAp4InUTSyqVqrStPiGYSVgyHbzihUOhkPqhHWrTUqQBzHl2RYaxubOMD5Q681KYC23kvs9MvlGekjYDxHjxjOU05/fiGbTDlP1vPo8dAhxketn7x4R9o+MqJvZ89r8gfhkrO4nKHHzjd5sivz15NK598aE0GtrjnG0rY/dX7sRLj+yG2+mWvtki/cMFpYjNttjaKdgbbPS5sCjeb0ajmcRekJhTs4rEHTPNLqPRHSb6hGONKrW9cnUBjvdBt0b07H+0ZacxQx7Q2vVyO55/skcAycYqzIlGiIZyOdIh2jh2lRJSKz+9ikJ7fWKRtZ5TZce+n/AAf6i7etHv8A+KPcI/XfQ0749+uHv+ARaOOImFF6V6hFKhV6Q6Z7+YxearaV5qIHgLj6gRwAgGQ+EOZbpq29OU3IYdzjNJhpJLdJBpFCInpVIx0vozdgYxr3w+axcBlEWru5YuIqQ6AOBwMZZtTRzytb1V7kWLTd3MhxXFtWnFSrBzKy0om1TIXMXHfOfnENaAp1YrXEzVMbzLjdQx8nGef45RkbGVUhKcSccW6ExlNozgJqQB1mDXT8dkYLrgR7R/bCulVpBRqfuXLID/Nito64qbWg4yJkURLmzHJxiEtFFWToi6PYMJLvp7JNN1g7We3xKIc8wAATCPRHs1hj3AjKsoUFg6VmoFVQRErOEug+HwjzWd60aQSzXr1wFKLG98xKAygA8Mxm7mPJrgrIqAx+tDJcC4YKnfpevHIDjl/zizZK5Gl+s1sFjdg5UuDpj9giYkkvJGn3Dh6ufnOahykIWhaZz+MyE8wZePoCIahFwWEtRRDldPPFxKmi03RNAPHz+MW6KLVRVZKnbuMxFCCMdYvSaFOnXo1TFLpFpR07IyF31m6oLhyu0E04monS6RQmcOCfqAHfNj9sJqDpOUkIwgy0S+7GDHTmEQzMGMRkTbuEKC21pvUG+mHTK4ZoGgVjmp8ju80w4lHhrkYtaPWt2jQjDaSkSOXOc2qzHIcvwZAQls509ncKZU+LNlDVx7oiICAjxxrmPdQd4rVa3Lpc+I8ovKjVTpqRMCFEyVn6ODXSmz0h7ogrNnhncILcBt30wBUIK1YavEO8e+PFGkJirjURlHXTMUaUogIzBr0RxjziRbAt6mGWYrPQy5CyWuJRqhMgo5oiM8y4GdRAeGmnHsiXWxHO7vd0rh0fGb1Chyi4h1JutmZFxrQuYR7NFapacJawiIcuUeKcwzcf4oY8IvbhWjTiVTioe1NGpxnEcYARiySjjlnPDENKiDVCQOgifowApqanPqfFi5Uy4GKktIdBmnCUB6WZZcjDpvu1pllo6Kr1zZcyWVZchLLNnxhpwpCX+UAhkdQ7QEO+LyoLykqUqBc+ZMGSxbQqE3AAiaRqsdsjlF+j0hy7voA5otEoR7tu+bmO4Pl1Rs3B5/lxGPQQRXpUatYQ9TSHy1xDKG0UIURUo0atbtHx0jzNL0fAYMSaK0S14Q+BmUc4+IRUrVqpgaQVqwiHb2RcyZOqfmpES9DJkREMcBGENKkHrMc88Yd6Rq2qTQQP0Zx51h0bUMNv3CUVss4H4lMgqmIlc+TNrZMzUlUK8oaFQ9SAiAjkdR+EOy0LvJxFqF2FNQKli5Y1nrUc9LxGG+fSfZeS3zAVmO4nOZuIcnPy3FbqgnBSbqF8oNzBMm4iAhnOR0hn6VCtLOAyiAhnpB390S235KStZbUNyFOocuVVUh8+chhLoK6ZK0VyuIPLrcMpjcWchvuD/r7/AG6UoqRVDpCalUQ6ICbDIyhnP4GGDNnROVshRHIDwxxi4SpB8Za1ejSEyAccBkIx6WeaXABKAZ4co9l553TI3XTyJ+qG+452VuF2VeUoUlOyUvNQVQMDKITSh9Ec66xl1F5KXrihw5MJqtQEPpcdByEKH77EmFjeGCRUySKJejgosnAPH/X4+VqHEIw+jTGsHRDTECMns4k8OhrS/Q4DhmproxUyDdX90ZrWUj79cBatUl6NczN0aVCQRGbA6CH2Q710UhNahJMQyBFRL40GWcciOcagHnGR2O2cbsXoeZRJsK2lNwTSzACqunCAkG+1JZs5FTPY6IAGnHtDADG6a5ezpaH0fDVa9xLh1S21vfNyIZc+jOqQkKjai2BgB+TnnMId/bEoZO2jFOrGV3Hv7Xye32CwY15U0fIsFia6ZeGJlNuYZOvmx8/xc3N5BrPstsC3Ferb/Ktf1elsBYqQRNqy66JBkdyhLyEmjCATDnj8oAx2dmZXI23Lf2nZZ+zGxiyC1vmePuaxdQ/n8orx/wBaGGD2lr+Xpv6ni7bgukTqcXU6wEUnPRCQRwPDn2cuMQ6R0I2q0K1f1/PUcxF1GbukgRisTXOTl4zhidxsgxWIxWTzKZc4yGkpL7iP1RM1TJkyb0GYdRmGJCbPGyRejaVUjRhioBlPaTfDLvfavNuLbbtAeIzzfcGfKJs7G2yN+UVXO3Du+ZMW/YSOnUFAm3TpA2QUroFx03RKEOIaBE4EF+uCY6iNlopZZk2xQB3NuW5RCPUCkQEeat6+JTSMkpXVsbbP6eQWlZ+iC4tIktyFA5n8r+yDWthp2v2XG6fYVoSSC43ocDJ28C4n4cJ8OO6FA4AHhGVuW4jWOWyII1SgpyPwobweceQ3FexxNCHHPjGBXkuAjl3WqLKUAmZRDcyWQHJIOwB++G5ZqeavoXUGUhtdTV7gnDFE23jZNZ6OC4YCYqJPgOQHOc5DPKLstexrXgmadKELyzlH6D2JodsjRNVNs9Im/nsoYhyONddagf3cuISzTfKmxoOuuPhGfIiAQZacjKxY+VXTakWEZyQBN0k/uHvid19li3VmGPbpxMlCaTXdjySjxOo2jiJ18oSlhEAA0aEwAgGc44RAazNy3CjLzgKprLRXEoL6XuRI0sShNMgZHU2VER0Hv1iRrLRUXJEcv1tc5P2v2Ikc8jCWddBOXZcq7k/GqQu4j7fH8wjs+hrnF0ZjNUc7170W5BiJobGexrebazfrda7WRDSSzlQ3uTjfhwj82t8uHONh+wL6I47et9nD18TBUogEUsVsybE8Ce3pQ44EecdP+y7Z9etygULLWPajNKgk+4flI3D2f9n/APZUZTu/TVFMlT8knz1H51X1+kDBwsu/b2qfXS3FlEOtm/0R+zJsDPVnOJ4V0u+94yxk8fJmzpwDia38BgBwHPXx4xtUdOz7cxyiiq1z11AatuiQ9dzESA9QN6UdBwPZxD4xSo3s2V9nOkqo9yHWlXNuerJfzy4zyf1i3RjRjtXel061R38WPvgqaKtL31GbfBxOAxGUVXd234719yEGZJaRua6XZF5x8V+n2Ekhu1uR6QHZ8sCn0WhbBoIQ7p+lzWgAH3xpz2mvSM3HvO28N1aMvUq4V/qUmz2ou4UEASGomzf9mjQo2wvLtNOSs8Nog8/be2lOL2W222qu9XuJwJ39qibybRaFnVI9+S+h7PIKsV6jOI//AHiUI7vI2Nia6jARyRZtGXg9Tl9UnAI6qTbcj3cio8Lwuo1upsr7natqn/3ut/8A9sw8zbXWSzkGgjtdDS0lBzhHR0MIvH5PazjYbxuQYdTXbqUkGtyJts8f+cVAtEXq14NjNDarOLl3jca9txVYd/WG21UH5uZ8OcbBTl0UpsIcY2Blro94kMfJ2SiSpxSXkM4hrDgImiho3u7qRya4gfpAtFZ7o7quasHlgwzksp7QqnXhwmS+b05PiHyjtcbWF/jUrasVYWVKMt5CwKmbQRd6snp3iIYx36+ERsdbbva86RiteraOVcFsSg3kpUNHxOj/AKpQxKHnFsW5oQuZ8vs74hsP9BoGxf0XdIU002/UGIl7ecTKcjDR2O8PaB0XwZrINE/ftz6+/fGnw17tvzsto1RMcUroed2XhIY6Ux4igdXAAf8A4+GYJs3ZWbbZXVdwFbhup8yqQSt4qaV5ZZTwZ0GYQDPHtiOqm6iQ1zJdIZSYlCBrTACO4/GLgZ6KIuM/28caE/8A45Rdrlwu2Szq5flEuzfpBK1BOrp7Rs+Yp5M5A4oL0w/UADETXI9HPcNXrqVdnFSk5rgFOUdP97SEicpPVcrUU9HSiw9hQkOgRKmwVrKrkeoBdhaUm8zgLZ35DPlciY7OyHJmrZFo+Jc5KeqHqC/8KLDzroSWTv5C0DMMu1T+ds9dIQ2L6w2ZEBlOnTXV0pDXvH7oys1Yi8iENYZm0VmAOPzgUP5842DWTsy5C9dcWCyqaNFv7cf0h7CbDcn5uX3o3vcQW49OiTGQpSKS1iYrG5/0r0oOV2C2yFUTJ7fENUFDZyvxXH3mVrJUvM0eXyoB9sZs2tmB+FzhNYNXSSUE0lmQO9JFIiozSY5hgftjceg7K/tG21VQUPago8g/g2TIkPm5Q/1uMDvAj232ULbkbgXYMJaSV5/1k4P/AAUQ7/xvux9XYW6JSCsZL9KnSRN80U5DDuSwP/SFdVB/X3uM8rhLvVe4k+owJt9OCJs7NHo2bJvH1CuYtygt5hFP0xci4wa/+FhFs90VJ1Nv8rF8G2VtOws79beyWP35uD+1KsOFdraWXnV83+v9nmv+Yttnof8AB2K4l9I95e96SX0RWUvpY0hrrbO/kjH9ESEXrwW3sEjex9n0pL3op/3kjWzdTaWrHqxgwsKprI8IZO/D8XmPWoF3Almkk0bK79uZ4ervdo06Xa2iTi6dOgWr5EdO2A7btB3dEh3GwDtuyZy6He0S242E172bSCwrNysYRuvxTP64/k5PjV8+7oL6uYOnjB8yAzDoGc4zFWleR91WUq2/69NCzlZV68OI4B8neO2JBejw2X/+mFtSt9nr9AwNqGCHtxd84Aj+5opD6QeI6B4CMaPgrXjrXiKYELrBoJpEW/ZMHRu1IXWHNxDdLsysM3sZ+jyG4DmSzRW51+Uz23cZTHRUiKKH5kl4jQJcC7Rug4lZzGqRc0ZOG6w4O/OEvfmN4vpPdtJSMLFe29tzxVJQTjY9lVkmBDUU6OYp9LonzlZP4a8YfrJRoxjeXXKnvwOcDLrWVZh7sQP+tngax2L1RVNVeiI5zmYIbaaqEs3EPIM4i8KWZB7BD9kIkdKruBVokumMoTD7yZGXQoGeIj3RQGky4pZa4UWLcmdyc2QhRmnXLSjo7hxxnMJQbMzDOP19kVU/QA2aOGQJJO+ZwBj+leBbAD8IkztzqdIxdiZpIMpnqm0FoiDeMzCOm8nikozAP/HJ9cNAmriY3aNuLZJZpUQ1W5Skn0nacIz5FAbxg2EoFQ5+vMAG/GeX0QjBHtd89QeNxX7PKXXzNyngeOzAskPWEFIhSNDNIGM8R+SHdiOlKtItXZ9p6NEptqV/rj9sSDZEdaiusfoyFNn9f2rT7hDWYcjnGQHTUcZj6ATjwyI8sCAhDwH0Njr0s5lvn5UY3nNdCPZGSXX9XNDoPhMEWVNYirvVKatSmlLTD+cYzLiKQpo0uFeUI2b0Ksmc3jUjZyfmBaNVjczemf1ecTksy3JzlVrtItxMVMiI665H9kZftJOlBU1Y4mma2C/5oUHnigAY/HfGV7OLcr1pH8/DAe7NNC6Yj4gBQI16XqelZdctaSjVmGQvOIAEun1xum6bjjtHej1OWXJ4424T0Cbg2ldFx+4nQW2ZasusfmyFKb9ilufmMGON2aoE1WgeLmc/S1wPmEXFOt6uDMHricwBjGofK5w24V64CFQJ5hEByETm2eFOo8JCzbVBDH5oUMzBnoa8PD9sZu0fq2PpDujZ3DMyLns7+ch6jKVh2u1ue4kYJc5iazhwGX26ZRuhZW+7vrzbsmI7UIkRD+mmTB4hgPv/AN6IPN6n0pph5DMI/Ec/sjbrthssxswbI9u7GuAuJS596nwYui8SgzDMCcjpQbkjFc9ojNNN8Y1vMpkG64FxCiIzcwEMCEXOpGrXFfDZdv4tmhkN66x8QXc0cq9l2dtRRM+pL9/P+QfRlExLJZg8Y+imFa03jjIffGCNP5dWQzVARlGcRDkI6w8NxClJg27IJRmqNBddRvpDKOR3FPoafWOIbFq0cfjMXNrtoerIdwu8LJVQSRnYqCQ62xd71z/6Cfux0k7/AHUQgEfzPvh/PTZvMZnBs02swHRbVuzrnOcfpKRwRD/3ZoTbADbqqz/mH1GcnSJLPbrxiKXpRbllblbbt2BIGhMpbCN0bYI0/wDFmkRh6ACH+90g8oiq5uVL3NTysykIIppOX11wqt+6QhPxGvynU6OocIrRbwEQHIQqp1OjqHCJwIkisK0VPW//AGj/AMkI/X931Qev7vqhDzXCv6keOBx25CMjQkFTeDnbjRQKG9LzyXC7aRyZMMhMYPmwKShjvEQDwGLUVERmDumxG0z0KOz0Wv1t3MNVWCgm2NY8tWuo6AEfkjIU+gAhzyP/ALgQBNPdmjXL6nl/kPoyVaqtmzbrPX2+wdO92k1BsfZq2Vn29upRLtlbkg1Ef/5kjlO2jnh7RP1UM8gHP1x0H7flztxTXGoiejmFeagJo9VrBqMw4xEYsqO6Z5LY+gUWZoPjqbG5uWvqFDLuo52wwa5W78B2YxDsuk4I8OHPMMar1hHh/wAoeJ55qWh6UED0myW0SBxiqjVzpnuGMWqiGR7OP2xfTlXX7Yx+twHwD7YwRpNkdpkDis2fWKEw5HjpyjzBFUKQ88j5RTXjVA4ilBCiE8cQgQQQQggQQQQghWn14yjLy15QBTEMDrpwHGAiWNj7IJz3tftA3ochuuZRLFt9HmqNxIOSlV9bMuA71UTmDID7sWEBmMiAZ6Mwajrlvm84rZVjNQFW2YH6AaBKXd5pPGXzEBzE7g7GXmSNSqPEkVHPiin1m9+4koCUkkVU9csuUny4/hQbf/QQbBpPbZvHeWVfTCywgWyt5RUjKUfH3NQrnzfq5Am75Qpjw/nRs2dPo6GhsGNu/m05cADSS5nAcMW82ZWgEuZmeoGAx1qPbgAHHn2xqi2CPTBP/wBHwZcrd2cLSMoohPdcLrDgFzmjJ53HwKhiWSVVlx0ZeWkuA7If7bi9Kzdrb6NN8w90JDZaUjlslG6hiM8m8dojx7MRpnRO0TjFk2K7xNaOa0NnKXgOt9Qu3RBAwa9woysu+1zNEpq6jIfJnr8wbtZusvENmbbNtdULGFSk8J229BOHTnziQMJixL0hHtHEwRqSIuZ2vA4SLkkqiuHytDoF5jkozgA57NM4xGzlrISMvN2ZTWK4CmOZOFsqps5kQT6443U1njpgB8AGJBvT0bN+LAEkc/bRJKXMbJ1MFQVXywju/wBKXI/RxnQA7ovG6IFw9liONv2bbC9jfOfn5tX7eQXdpM0WvrhviNcOHJiMnhanyk3zn5+bm+Ty/EID22tSz6R2goXLWpiyWaNZOpLYDKiAfYHOOnL0c+0Fs4WOTktq2heDnuEqKwYOM4+g7g4SAcPAQ8I0kMTZpu+5aptGSrROk6tkw97A2nGyAyeQ4iXVmvR6bfDPuVby5FrLQUSqqjKZdboGzy8T9WAZ16WummeHOJBI27BtoIiNTlIl62+JxIWJb9uR6KFaFRek3i9euFf0yFv3bcna0tC77YpZtTMON1IjfIhJLlQ663r5ICHZkA+EbMdvC5DVupf48YY9fe0pKKkCOP8APJdJjKvSwnbwbMtt2Ms2ftkVcN7XEULkXIsnCHWPV/V8aVLubX+1eStOQLN7Zgt7a5ae4ZF+q7pJqqp/rWBmAPOMpXQqhdqxHLfxhDEzb3cIMF6WLjdXdcWxZC6wimY30CCaii66V9dshJtAeVizgZypZI/Z66bdIEd/TwLrBTiaGOeV7+i8v4wXarILqclnGogJinWJE7hum5qW3masl5RwBmnUGaYcCHaGeXLMbs9hxBVmBZNy3pc+7OG4r3LH2qDkJqHtCJ8wX4Gsxq+v3sqXHuw9j7gT3CuvlUV1PBMmOT4h4YjiztuDm5BxBy2+o24TZ8ghMRTpeQ2+Xoe8I2IexbapUVi7Vk20LKSOk4d3IsWJtpxKTfnrjr0euAJBLjyiKT6t64rY3AdlsXdSLlXOyluuhrMpM0BwiBkuIhMATcw04/VxjYQZ2P2zsqSpdy9qx3oZcSYUFBu2SQT/AFhcJ31wwO7Gw4FCwYHMw8h5RAq41wl66dzHbdB1gXFffy6YXVAuT+gVmMDnQOQAAgHfiJdGw9uxS7bkltqU83SlIc5yZPpjpI6lauGShK/Lj9/ULOkUdaWfrHPOHJTuHiEYOjaj5RmITdGUNM5z3RoONRogzIJpavQJbRQAuM6qaTAIZ7uMUUtIPONWLoSAlqa8tnBECaSjERPqFTuAA1iVmzdsmOvaBon3isKxe2VlG+ZGVZuOtkhO7/rgSiES4mzOnAB7O8I2dt672z9suU67RsEySyAOOirvtc9/uGvBnODJvgABnQA0CGpa5CI12eJJtLgfCy09ci2zsCGcuBCq0nowdsB+kySustxoWrSjc353dF2AlqHiBSiAjy4YiQ9b0R+1GQJBXbrusY9TXDqgm8TJNQDwl6IfbGT/APTFXlxS3kxXVDf/AI/jD8Mnac9fRImTFc2UNQz7fe7JL3mY/pZw/pReke3kehbV/fGqJ/2sunZZepNe6zDcDAXM/I6xIYInu8qb1D4DEl9mlY9Q5CJfyjdKmL9vr7MmsyLvt0s9mcaHcgE6OFJO7FVKjVfcnZ2X9lK7aWkCqg4Wc4jW/wBuHgEoSyqBf/OgclLuh/hruSmmh4hx797osOA0gJXfHrW0+3JHLwjpL2S1jrVBPJ5nTrZL3GODu4Taqsi5FyGQY0MNS4Kuhz9+7HJyv/wx24bFpz3xuZ4+GY5BduZu1mrtkbUaRXyAyXkVznYA7+cE4H/vxGdHVEmS0ih3FDCmLeUrV4ZvTrIYRdghPH31wd3wGLZE+qvSnWIrDVmz0vlccZziPnrZphDIjnxjLxaJqieokqgD66vgRlDXOYzF5sAnQqy12lRUjZQqngcNicJ9Gan2jpyjBa1jXnRFZxq/Fm4e2KeSi3S7VV7QnMT2+wYZRRwrtyurCqFQEsZx1UOelqPGLLQL1qRWqd9T7sI9HPEIs4BXEMaiAf5QhFxKE1E77uXoiIgGM8obUZJJ8qjRu3U1hE8he3nOBMMObIMlZDb9oloklDW3eU1NgcjoIw6FxmLVtqrpldKOZGbWWblL3/XDFpagYImKNehWmpzAOZc8Yypeeq46fUdY15jO7BoI6xPLVnrMRtg7epDEe5iZTB/aP4Nvbztm4bVrI1MUySvdw6xYTywoHzlc8erCaMmxETQiGo+P1RbKM1OhVo1uIZz4RSioH7gNXIZwOMCPHMQNZ0q8eUcOD4+kffEbwwoM/us52k9X0tuBjMopbdBOGgmSmgSUzS7InBw6IGq/yh8dPCMHLB9IBHGuodvCMoKN5OPKJMsTPD6kziUwbmDHQ7YfVoMdBbqTI63PMUWyBg1uUySM4gocM5HsiwbbsWck5xaVfnT3zGzH7H+D8A+R8I/uB2eiGBE6bxj82QnlxEY56I9IejKM2nwihibMumJs8c5x5Q5K8lrDJUejXoCVE0X+SHDSFtrjdtSjoLmrppa4rNoaFUBJts5IkHxmDgORAQ7f74Ce2ulykSKoqVFU5t7PuEJ7fIG2rBwg/wBgfbimbKbP5BXuK4reuEGz7FNcw2Z0tt0CLgmE+J8V1QAR6RrA4xnIaQkbjyok6NAkrUJlIuVAQTS3TEQJ5HX/AJQ2s9CrNNkOlpr2xQGYAHozAIgHAR+TNCpdsjFSJ3y6JSVP3C7h/b7x1RlHxZDb2+Uqnq7n1dQ81qo5xjUOIcMQ6FtKrSFeJA9d6FGCbJkSc3ysa8O+G2ql55psYyOecOQyLcq7wObsQlAtzEZsjHtisrirc9HDYmfe7Y+oJF05lW5IpptKubdSy58/zDO3KZSXZSR0xDriXLl/X9KY8OAI8xz8Ahgz0k5QzVLDqEgjgOY51jPiboUmhSW0gvuxiU3IJM3oIhgOzt5w31fp1KvSDpT9Mc5DQR8IfdIMujKJJ4e+e19w7TUglJrEfK++a8x6ZcpCZMC0oHEoNClVald09bE8ljQEgSs++4xkJvCLe1nWoM9XA+kiMogGO2MLoma3RGkEwhKOvR5ceEEo6iM8vyQ0EQDh34gNC6UqbM4Yk1KpPb7QCV2Zk6bv4rMkoTDeobt+f4g7turpLDTOKdSgNAZVwqJI4JmXphgcCMJbmqjcU1SiZa5U2XoiX969ZP0psjxjD+plAsVpmJiswUDA/JEAznEIJSgGBzMI8OQ6jE82q53Fsktxff8Am9usdFJyQ5KpBufFUNnLmpzk8+Hy+UeZZhLDRzXyA8c8Ikym23s4/r8sO3NsbmGkpmO46QRTr7uIignSoBgwOBGaUOQDgAHTUeIxHZVQVFLnpAdJzFgEcgIhgRh17fXhT7e26uWxhtoxnYq3BT6BEm8XAR31xs71M2eklzDoAjzHuiN1rRk7og/IVFsQ2ffIcx9zsE/tAIlTU1Mg9GNXDagW3uK6WIK+huwq110wig42xN00BdAtMMu9Fh7B4xm1ZqFnUuEUxlEp8msEjAzCM3SHOBhgqvrQn6VbpcB6Qj8oR1iQdqbzEmGlL5M83yqpMplwKFDpz6aeIDnMo8OUSS25GOostEzp9mbHNn3+MhPMJTaJ7feS2xTx9SzObjwzmJl56U/AZCiJLDbjdfbcubTWwfJctRkaO5TgKHKPPphx1Dhyhj0Frq66ZMdQUZjNUvNx4j0QziHHtrZ29u0m6qyTa1luZ6Lc03ygTafrChEM6iYNaSh5iHdG2m3WwzZ3ZJQC7/21NoJAJGjRXfhsXa1QFRcykIDndTRzgHl8RjspIwj5Zs2cNjEZI58qvYOPaPIl7Ktm0qUyTImfKYnvgxPxwGqS3ezvdK6j2bFsbcN5ScC+vmpSROmSIzCJQTA/rI40x3xsoI7ENlthm5oqu3RdC3j+kQQAS1qrQuAw5qqiaDP6TnCSUQDh8kPPOmMWvV6TVY6v/J/sssxCsRbdJ9xSDaeSAHmoFv7VNqEayDriWHip11FyqCiqmjRrezhw7MJ6abtEcx25NQerEohmI2Jw7+4QcXiME3Xwis205tzzCcl7PSLv48QU7bWCRECwtp55vc2hbwl1dL4jNEfmq+7qO9ATm4ada6rphRRrHyiUfPifI0zGgjMAZ55+uGocbD9nU4urGToGTJodS2B6Qa842CbCFjbqv1xtl8pIFGBbNLXi5Fw3Uc03RSUsRHUe/TTHDXiMOcQglFzlKS63Rn7BOwTGgmtlx1Yy8yN7lOZg37WTsEPgGKCyb/uIt0Go2WovOx8Kqjgq306n05puYmTGe8R4iAcY2f2o2JWFshJjWuJfsumXKvArG/miz8xAFFnoX+uD+tGdM44aecSYfT7bds188nbN5JLaTOFVPkFZ+Dg+8lARxxExjrPnrDRLboXVVXoqYqJl6ucyWDCxNLuKhN3YizoiyZC7f1ggczZl3jjXejj9Gp1pQu0l21Ps0D3v6f8AQTF7uDdOk6xLq5gvugzDg2jj+oxGG4dx3UgJJSrRlUiqaqCJsoI5BPPY4iHbDZXGumeUqtUoWnGvriWYOI+UWQlSe7/TEyo41JUNoiFLuCTn5RFPAdcB+MxYbNdpCx57UtohsOzlGm0pmEspgfR/ofIoRKnaLzCsw0xXdCxQMKI4TQEN6AAx55h9Dt9ES3KjUN20JnUlySJwkutCR8cyZx0hAO/AfCGxQ2673mqkmVbhJU1hWNlfeShEn9GgA6D3xL22exQJOvMkuKgqOK7awbITJDQEhq3xHiJuI3dOkxpo2aUboHzqH4j8ZxTd7adbe0NxXJNVv1qc2cx+M/8AdhrbFbLL7vHcRrmNoWsvNBkrBauJNwAIqLhcA8t1yOvOOh/Zo2G2qwLbnm+6Eo0ba5te35hts8Q/6xHh/rUSDs9slupDOtxQMV0G7Fz0lB3E4cPEP3mM/wD1WJdPC8Fq9kIOsDNdCubdBW/lg8ob+3W/GHL1vW57hdYSpB+W96aUbnvV2m/ndxsHgYezGNBoF3vfBUK29ZreS/me1aF+kV9O/wA6xBXai9IPRaqa47X2/S0tkIO679/V/wA3RqF20vS6LzVuFXUEdxmnCvG1T3NH/SHvAxrfeFvb/bdzqVb0bSC4vW9QnD+ZsND5xEELVwacrXKfJ6QiqNuI1RJLPuhT73fD8bSG0VcO6n5OTOzeK9c004Su/PE3uGE4hGbMmz6Ozlg84FB1e29x3EV39Ych5A6wcSgZ/okOrUcTFs9Y9qSv54Ni3zYtohF0JskQDcFJSLjwA0EaunPtd3Dus4yH/Ribykxk9JNCdPOo+BY+rLpn+lzaYDwz5RKoe3bgu+pIi02GSO7wnkRa8pfkiSBsVhkT73bONox+/lvrPsV4M27ye2WUrK5vQ0thl6EP9kxCpt7Rl33grPgjsxMk09UsUL98btuMnlRIoBbtxwxy4xEa6rlt+XUqT6uI/Ve+t3z5sTriOH5uk3hD+b0tMj2449kMRUuE+bhUwbSPXAqmGTWiejybinCPeHZ4xetuaFrOt6hPdIfXKdwg0xaP6PVnW9kb3Ifb5Hue3MHfcSihUZks9du5S9ddTLKW+CxGyeNIbdTg0yWzjThxDWLC0kIw5nWO81qVpGQ4TdFGVzZIkaUJEEgIhnP8ab7RiQVp0Gxdg38YVbpoAXyppSWYEkkEToEWkoH8e6ZmxkZQ17teAw05gopvhYWV2tQLICWaUt7M9EN+Aj0hzoGMjkRjQTK3KszbO3a6v+rJ/wBRT2+Ua/gdGTSFqRu/Q6TN4gn/AFFP5iUd37qym1JrN6y9w7hL8iAzRZCm9FucUFScRfP0cBN0gAAyGRHPDjEJnO9E9vk5U9Jomja1JoqGQwIS6/qwB9sOu0i9J5lDxkTBUrbpvKhEFcnnq94u4ByOADlxGMuWbNNx9XbVlFsMJVZTYdyrv7QYhIfaESH+aor+57+irdVOxZrc4hOlD9IS3rdS5Kt1TF7l+r284jExGq7zC+3HAn190VCg9eI5zsiaSZYFeeK8fWHQqmlZeNqm/LBzETYszsonCKweTnQRNFDRRA3EmTEh84xP23tq2TbhHrrDw9lzZXdffCh4/wBXpyfGVJ6+pybW8A3E+8PzkvTSlI3FI7QgQpPSGsy1exycE5Q6vImzaob/ADPtibFHY5WGqpF09QIpZQzyiPV3/TPbM1hKpJJs/WMXhXG6p9ImUbBIExuzBnGTKwI5m8JcxqS2uvTcbYe1AvnldGnbNlk44V3LDRlE84Mf68Ov1ecNaNsXjN15VfEMs39AQ1aKuB7zSz/pO77fyHRTVUrG2kZPV7xXEFpmShrfjj8dR+GTOeln9HxbOgiEAOC+FOU1uB06hIBtQTD/AGGo46VpzPC5CsBt5u1xvFdNGQDC4pG1M8I9uZhGJitSxho+hIx24hqgzkYsVwSmOJxvfz4Z5SgA58c+UWbbmh3blTocYsbRzoeWu9VZCKoY+TtH4P7zyDpy9MH6XBu2+fNp7PejlUGvdI0usUicWl5qnfaICJrUZZJAJCHSnxgcZ4ZGIs7Mexi5UZYTNqfb7daldO8SlT64tzbpbUZpiTIHIiM84CIgA6gGJcBiUOI5EWX2PUu11tk8bskmqTJ9bDuTDMuhOA7cJfEAADpspKAAAJugcIfS520J6jKgsKu99vLPlEIuduwshI9i2soZRXsOScBPz9uYe3/b7GyZL3K2sXafQJwE/P25g6l1LtKRg4YWFE9vZqNad29qnqo5u5ev+acghn75X+E9vxYse4fGNfzjcldUrVhMBnA51DhiOliaMknCW3Sw+7K0ctdTt8sJC7R21xdXaNXkpwXAVBNqSQgeypQQDOC0Rfk3o8FWvW1EOI8xinRpbxW4j9sXoBAvxD+6NKw8PHRaWoYeKF7M0ar+gmKZ6qWIJdQzWmEaMw6y/wA3sjpr2CrYybE/o75rrrY7rdXauH2nVCmvWJJuFv0MXwPDpDmbHLpRoZ2M9mpw7Xe0ra21wlzRdim3LQWn0sAPyU1vp8wGlmbv+TnzGNzfpYL4FFBUSbfM2sJVDLD1CSJBxIJ6PEanEUZt42g+DPuFEOllfdRcbaDQJkz7hf8AqKfkNIl77gHXk8nG4D9cwO9qQzYmHSIVvFX9fXHXId3OHad6uIjXAIjWuGhnmENc8xxEgumSRiopYN2lOdwyRbCvRjG1CoNIZZQAcjoEO9b5tJhIwWU3LRMCiJJeVzOsp0Jqc1QjQzOWTelnGVERll1ENJgHGgxgbZLp5tTqqa2E06QiUd7MyZEZjw4ACpb/AHhDj2AMZFcVarESNNt1ZpOvFEwKu8DACOpiYfdyo9m7yjNkA5zxkaUk2iLx5cjjsFMRAvt7dYqiPappNTLL+3+tfxFvIOpXdFxFV7HpqEykcNVl05nSUB1zpHu6aHO3PYcRriYoLDKLLpbAY6O8DOIh5CH1Qmt5QpUEt8LBnPrE5tjKTxrisZMUi8v/AL4w4e0aUPEZ7UJ5/QwmWfR5RlAMhqE8R8y75xo4O4VMbaDqGVOb11qU+8d1KqVSwV8u991BGbpj0hyI6DrrjMSVsmtUSs1UjXrdGgYEBHTmHCI2BpiYdc5iSmzVbo/ch9o6OTmCQDalRJVq5n/FgMw8/wAco4aEXkiW+EGzImsUW5hJ7BRkVrxYIQhM7k6mQpfPiNwrrSKNnthFuVp+kWW74usyrksh9BPb5uYr8PWTiPnGhWgnSOFer0TJ4qmSzTDkydmEJQ8Y3N+kuuw2jzuT7eMoyJxi2bbJK1zaPjNmZTLJ4iAmx/0hEY0c1p/WGJhkmEBGbiA4EIuT9Iyea1kY1g/Jrmzbc1WfJ1df2i9f0qJ5ovdsdbTDxbBuVL6uv7RTlzNNKABrnj25jYjszs42oKLTSUiiZMrrgXC5IlLwyIzAGA+sfKIFpSTVPKhctj6U4ZDujeHsuUW3s924f+1M/wAuVNplvUv2Vtuj/wDrA4jEMmg+NVtdpK3Y/R5ibpRUejN4jCyC12OCZ02xd31zDHtuIi99onaxdp4qRNG0FmFU9qpHLBYsVAQ++PqGwLU2ISgft7lVMmNEyn727cIqgB94LqhnG7HCg6SgGQyI4AI1suTaEuTcNVVFdWcqlRnVTVY9UoFZxCmAjkcAACGn7IxYnPXPG6Js/WMGDAjkcfVrF42rMUe263rDuDHVP8KcfCF7RLJFZjDtTHcny5lTh1rgXDW7sPJSdirkZjZkerinSzISoAIjKVl8AH7YyNq0dKAjy0D+6GlRwHOB0yGIflkpwmDZAsNER3rQA5xZMXRalfCK51DiQaPUFXsrty/X7e1BvO9HcVTWilLFy1gNzS0BNUHYcV+OOqCmcRzrul2n368Hg/VH9JPNzn3Odz2nzQziHl0hjodvOfp7Pvo7rtKstQuXVLhFaFrissn0vXqwDMeHyABHyjnFo0BpJlOkOeIZ7dYjUFTbZ1xK+scQeekuW5x297xjHH3py9v1RV6Y9gQkgicc/lA1FK0C/wBcPf8AAIPXD3/AITSfRCPUEUrjTEe0WrWmIUkq+ZZjHgOB0jrF9BTaGhbPZAu1f9XoiUXL1uSs020cEciCcjhmbHcMwzD5xyZh6+qg1hxkx0sh2D68Y7uW41ymzdsd2CtCNfJxqWmSROncY6xURKRV2kB2i4akZL9tM375w1yLtGqaLJx1LFyfv4DT96Q64W/HOp/X90aV3EcDpByCJpbWT1Fyv1clAPzVUzED3JVEA6XYPjE2go2kXbqLanb3xqmCZ0t2xyN/phoVyYFIZshkcdusNMqTU0+YQlAREdR0zEubbbO92doV+l2DZ1uml5dEOmpmtSKC1S2RDelM7wlDQdR7NM8p8Hbd7KmxFQAnWQkvak2iQD3xwuaUJbMtEwGuUwmH55jtm4REp1d2/XrFR2UjnvnGcJeJdzk5VjQnSef29vn5hrJtBsObSl/KXWbAtgui2RHHteuS+yzQk8TpgAlHyzEma2wvs4WWkqGdovasQHErktTtudnZO9pVGebmX9oj4UCIDjTGB4RhF/dry+l1Ktei8XuqG0niUbZAer26R7gJ4iECk6jZwQ3mqIh2iPGKhkdH1gwnh1xk8I9PgDI7Rj4ymzL5quPsEx1K5ezBb+qaoW02eENwCAYJuK8TuVHeoTeJIlMWJ/UMWuvtsvlP9RQQWjZJqSlfoi1bRoFP/wCEYgXWr1R0zxDiOsIhqjnUREO4B1ivJfSvHMfB4KOTQSAir50vXdKUlPNSgnMc2yLjKofPKJaVwy5wBdctK3z8g/8AlzFcxtCWfdQyFri7K1pDoyzdMVS1x5TtKbzxDOJppZvAQxEEQrzDqAhp3R9CrPy+vWIqtpSTe1TbuWhTpgGpXNeswn+nWM2SLsz0y9ub7KtmnGYqe7NzaER94ah+qHyRllcqXLNJIAiIDmemI6ww169ly81g8GH22ZJ20bObmj3BbBsu62C4JtNSavQEacwa4AMhMOB07WBAyZl4TAGOGOcSJtRtKXStHRPorfWpVdnK4iUcdu3WU9o7euEuP8U2kVh6I9vIdePKG52lZNz+IbGbOe+Tg/4f5D3W1p1iMuvSENM41DtjyPRENMgP1RsQVLE272l0Vafeyqkm2++W8m9dvXZsNmzK0p9HpZnNM850OkdLgOA3KaYTkuBwEwYjXvNKMkwyzBgQ0EM5ivJy3n8AoXX76R+BQvAf5PyBlU606qh/9nraDd2z46FRfbpFEXkJ0oddpvlkOkj1g032jmeiJtMO0x1GWYMcByA65HhNJei0dhK7sphRbF4nrs1uUyaAAYd1Wmauc0B5gBRypYBU6Iahk6RDxjXEA9EAEB4jqGI+5mDAhwD+NjAw/W7fb6EaFj3CKbltjjQitMcnqeYfOevUN6FofRMSXDQVV/o21xstOhkNwf3yLCO/jMwJvjKMgD8RjOf+gw6RZJF0W4LDc5BOGa0pQ4xiJpeDTTXSNVex+bWFi+VrrTVFVVKMa7112qyrgJCeeEgK8nmVqhKMk/cEs1QQHtEO2O654XbZ9nU247At+wEFkWcsiw1ZdRyh4h+jy6f/AEWNIWHpWgmNva9CJzuTmym4z74ue2tLlo6O7YPqLbK5en3M+Jxx6gpLiVQOpOTIiVMj8kAxgYsqBtPXZSFQkgIr/dCBIM24yTEV40Q3APKJ0/lst6YQVW4DgSiqSqPf99XbECnIp2meLjVlctRLN0yI/NAEeA44Rasdesi9zot45T6Zw5zul2cuKrKKb1UZ+uJRNW7d7KCkX/64XiG9/wD3WjHV56F2jdlecTdc6iuOdwyigbi5t+P/ADdHFM26qdXUiBhPoKhs0UVMx0pejI23bm2zTEtnJCSBUBAdzNieyEMN1Rtz3FDkX+D+MCLIaQ5RBnKyxCkSIpvZR007Td2tnS418WdsvbQDcKpD7uZ77Z9YHVPcBgNN1/1mNeW3T6J7eUB4LLfrljSCVDJNXFPwPhGvb0n9z7t7RW0n6O5ntNuGwu0Uu9QuNTNkCGAI0E89Jp4AHSHX+bHY+v1lJxsMUfcN7S1b9MRQM5HEtdOHcMSdG5EJvq0I/GKet0zEUcLEIVXJ3yZxwAIatV2d7VSWkZLEWr0Oa2s9c4et6VXSyeurYUBwMxYKoGT2A4iEoCOOADwjU1eL0vl/HTMba9mGWztmtA6Qyzg1JZnY7gH9Z+ejoDMICIagEoD38w6oPSz7FDks8jOO8Nrj5pvPIoPtSjrBDl2xyc7eNuUy5NobR7dbeb5VrHLsGq7NvO3iEvuMrpKBMM6oW/yTcuZhDtlDvhycUWXiVp2ILk1Jsy/fOT+0FYs4zU62jhvUjght7MNa647HS+l485nevKTlXVSbJxVWjsygonhHtmERHlCsmIaaRi5OiGAERH/RANYztISVNVo+sSUw+a6OgiTkGYQ+qLO0fIqtYnXvj53J9/vnOElVVV3ujJEioKfSEOI8IktYC0yPdZ0HFu4B803rQMj5wfCwQEekdwIYTEvOm8msaB59kRzT0s+qnqKST6YnzRncxKShrNyxEqX26yrSZiVbNqVpizeSMHVsQyILyxjomjXcAYAA7gi+EkkXCRG1fFEFl27EO3yR13G4xQ9sA6t49pRffNdPa7eoFWRbdqFtwZ7FQw+bU4uPLMMmlGq52uOa2OwBhlUFTrqqoGo6zcOUbQdmnZpOOspReDhoiVQuADzg1FZhCx+0cCRBa8BccUyiTv8AgZEMMaZNtzhFNoOBwjuiXxz+PGFtE5vywR/VCsTFe7bRzxPq8Tw7qk8EaMIbdpU0+pe7/wB0NyN1I1S2ig9ZXeivnXcB4bKPA4RO0C5bOY2EL6Cj33tKuMczj2ob3z4zzg/1j/RYhzRZKazk0j79713w9lgXhuDqIj/aoquRWSeu+VYrxZ+IURciqW18vRQmNsZnPUVmrn645hPSqJ/VHpCtpsuH8Vykh7v0RT/ZHUdbFNotx+nk8vQ91KL3KObT006BWbvpC7tDnHtAipLnH/8AGSiAf+7D5YzxWUkSV7jQob7ZWohKq1r4zWDVjBFSpU6XhzGPGR7R+MXYLOqalK4VE0X56HXbTQAqHmUNvLxJxGbpCbt48gGmOOGAU5SuPjDT3Mbu0W1m4iIm0Fa13W2oNVM6mR5z9uhbtM6AD9E0cpyy5H4+ENWxNoraqt4YIC3rpPKjKBj3UnKuzVAz3ZGNvVi/SQXbnthdF13tuC1Xeba8xaVtWudSCU6/eAj345c/OMqxFJaL2l+wI6oqcu8kc+4f98Rm1uWopFzVgQxqnLvJcGf5f9Ro/uFOzKqUTBMqJ5Y0W0wGQGYc5AYV2UuJ7GirkJUaipiYK/JERHpU+eQx/wA9I24/9Kn0UO0ebpFb/wCymbtKpThiZx2aqez4Tf6QAP2xlbW9HH6Pq/ByjLsm7aRxCdG6Vjvs1dRJJrGOjw/xfRz5x3SuOTY3OS7GGzpJkLk3OMcvdG7ZXKS5WB029SdwaDOrEM0Qq1qNEclxD5Qj0s5GFqehs+oSOCcOGJTAUckgAnXDI89Q/GkbX1f0Oe0a23CTLNyS3d3yAjkJmi7wCT4GAoCHkMN/fbZdunbhIUizusfcVvikj+ptM0fbgF88ztHTHj9UFxsDb8trnGRhuF82fP8AaO1t2sSbinMvtbfoS8ObPn/crzDV8UbR2cyWkMAJcDQ53jOOl5xsptZYhhpRKQXeY3QspFvdDY6cwxEBemqU1ZMLVCRlNmKzZwblEBHXPAYlgpFlYu2DdBaWpjBgqVAEsyTn6Ukw54Z7BiV6J2dsQix5ZBsVTJ3/AG8osjQfWDi3klLSsPt+pLu5+D5/l+QREfiaSS1w3RSawzFgmGUsIDqIcox9AoFzZvFeqJcAHAYlyIQmU61cxN8rXtyORGE6OpTJRqic9VmUJs4xxxFVqy7VteRF19xsM/PFWq787gqeRM5uEVXIsqThVANH6sxgwOnSHXPbiFdZHUaSdRP+pHdph00zHuupVDy5Ip16I5GfpCIhjUdIk1180ZWbQIn5xMmzA53oQEcY7Qh5s+1kbidzDldbnObcMHyHiWtwrOV5B+UlUy1NmP2zhmrWuZvoa5WPOCiZMygW6BQAHGPGPTiEk4T6krUjoUBAfdSohnpRnzbswNesSrGpR9RkANdw84pX3ZjRYammlWYtHFssYL5NTHSAkJ5ZuwAzr/dEurHTkVZp6S2r1aJvp74lLm17tjbI18s0KSORUzd0+c4srsoORBlRix1BMJ1Y0X91MiAhv+ug4H7u2MRdZl2TKRmueLzlzIzCBoA4gPPSLq8Ltuq4sqLVXlA0pyIJIEdJln13IuGoShp3xkqTcFM3CgnlBMdYqcu6Kpk0IDLOA8g8e2OC0lHzay2wTChEz5dUbcKGZZaFk5BwxQeKEb7uTP19WH14hgaFccgIhnOmsZ+jrCSWSFMuYJ7yaMDgobzgZNeyHqN7PtEvRVJhO7tuhTfCgjwGIsmgmKVJ6QjnozYHHdEYWjbi0eJEXnSF3w1zFuT9oLELLI5M5TZPb5w9qo3mkiEpqoHRXhNlBAviYSAkjH+V24hmKBOvJN8iSYdf4oZGMjaJSg4VPdzClQTgDXNXIBDro6atV1nqBloii8jRsN1wioZs+o45AEoAI6+EO1EoO7kUZ5iTtZSZR8KtEpLIuYhWrTh3d/7OsOS21WZWasySqFi6XWAvjfBDI/70RXM0TSWqTDLgAyIy8sgIxtM2e9gbbjuEU9liuzc5W2VcCkBKR43KpVGclJ49gjUCUQ8cCESQVfQb3nazuO0L+bSOz1bFFKGaJGdyFlky86c2eGJZacohjx+EP9ySbCUj4pu3op9ImqOTq7+r+wTG6F17iiYrertqZcm9uff+A1ULFe4L9pFCyx0S5YrpxLSiH474bJSt5WJKAEQEyqGR0KlSZTM04+HGOhOvsneih2XkeVWfm0xcHafuEinPlMFiSlCDNPf5ITk8z4/3vGMSq7eVuGrI429sm7MzFbRM3Q6KAtuuQqpKVPI6iIdvHTnBkjVObRJWQjXCynoe35h4e25LXOj4Q0XWmj/tz4jXpaz0be0zfWlRNJNtqFrUWUcGVq6SgLMlHsECpj5XlgIkVT2Z9hnY9X5zd/bvqu0Y5kmh0jtuLbEBQW/KZHTAzjr8RxDAvPbw2jnBWcic4H0JkovpQok6X1cWJSkS/IJQCXID4wxDbVziu3qzbNyBQ9733rI4bEejp9cMyNqyj3p51zqXNOEyAj8PaKE1IqNnDkpHOU2XVE7ZPsEjbg+k7uGUQaLJ2eGi19nxilC25pZJjkC3WYBnURmwOoxrUVHg4nGcMH1dSNqZs2OTZs6dGaY73DkYzf2KETlAsX96MCOuAyARcXXaNzteejSPIxmWczqWkH5Izd4dsN3uWuhikd+ip0ZOIhAxLW3cK7RZwg2NqicWQob+gjVT40KxjGBmwIh44javsT7EVXaLui3mAkAIiJXrxxGwH9HJ4YER8eXnGD7Pfo+blXVT024F3XUl2Ns8SGUTK66hEF4+XDUeqiAhkfPHPQY6KNklv7LSBY+6lCxT4LWpTGSmdQrD8dJAFB5XNUNeAcAAOAAAc+ESmCkkoxXaEIozl5l3Cn4zn9vOLh0NQVUZJyvWH2xcmTIn9Xk/0Gqq7Ww9Y60d2FY/dhxg90FKEuLctayDoTPU+Ffh1oPEOfCHdfi63LjE7c+zyE12Slt5LyTZ7HT/AGfT0/eIlCU2QHS76yo4CCIpm3iroKQuO9yPnTI44B8IgRdC5icwqQkApGDBoDGRGabA/jWL2gbQt2jo89cbkpFDmzHyD9FdG+gW0YPPpIvlYpFGZt/L2zhyXzd82k2zRLT78liz2+qC50c31IEi+eMjkMjNnvHT64giu3aViq3Xrs02aTZTBfozBLPgfDMYwsKTmdyuSTiBcybNqhoCRMkT+ke4RMtt7BV60S5DcZzgT0Hr5WKlzwJJI/1iIAY4BHzL3Fqa7C3PkbZuIBaQNMTSWl0YmKOWNbZt3sCGrKZJpzKKWXmyW6xNdDI/xNdI2yz7Pz4t5aCug0Xk1zlnHABd7uN4Eh+iBYMAARjdxLFFLFbwwHiRKshdOJnWHtGtB16fz/VXRDTs4RPqz9h1HaatXau194bAGrfFSipv25kV75xcH9TRFpfSLB2hBpv4ImdyfiMKavPSvbGi2J/VT7O5PuGMI1bI9gxvlbJuKOyQReDHdCSaPnr2XUulKEianpwf1UARv92P9kv8n6D1w8HF7PNhW9+fd33z+kXD/sqJHpFvbKbK1rFRYuPK1jZnqvDQtY1iOE5f0/l/tjSL6Rn0xaCZZJ5GBVQSiqU0R0dD/wDqXc4xZcc/LX9LVpTmUoPziu66pa/JZOW+E7o2G7XXpLLY7Odk1Vj2frpbeSyhrrtYfZHVQcEcmO25tUXMu4Ttyz7YvNmvZz3NKdenCduHb7QqbRL/ANUqn98RKd9uNsDaucLduQ8Elfa1qrnDvyMdmP4SpE7PEO3zjYoDI2Zdi+36U4D6oVahw6mYNynJesLiuER5AAQmTSJt1Xvqd0oa2ddiWR2g+dTsFKMU2Uti2iNZVeNyK7ocF7iapXOo5P8ASDM3f9c3s7Divra9YVu1FQZFt0xSvDcWUzuI5m6vZrfM9gG+I+XnEUkjbPvteB3E0e0NJTtk0SY9E24CEoqDjBOyIDkeHwzDiM+8zP2c2eu2/s+zUt2PzrQ+By8B4YsqHsR3LKe6y+RcFoaLEpxT3S6QK52XdEvtofZ+bC+1rdbRG0IoG2gqiw+oidrWoQ36YDCP+mVXP6zGp+6d9DTwCshtFLKs1oFjYzFEVFzgBzxEc65iflk9t657jXkrebclb8uhvfwEJnT/ALPinJ367EXrf7P6bctQe17X6bKW3tGXXa6kaABAkeXa9cyMwoTYAQEDRoJcj2AACIxfdsLzSzM0VFMMjIa9sfluTRPB21G7Azr6f318wYazGz84Lun6JtYHqBqFDcpNwvM/KIN5BCbXpTzdmOWc6hEiyNCzjJdbYRilNeNMgqqgL1X0MJAdqgR6QAIJoV9JdM6CAaxl20Sn3TapBgpLsYqnbRpuFErr9umtOIgIEDE4CExgR1101EM68Is9urKuIumzPd2oiqeLCW35uNMmGFNxeHYH1/ZEzo7ti30sNsLj2jn9ur7ai72SFn6NonaMhcSGJrZE/wA31U+XnqEd361sJng4X5blsKNtrbTGS/soxlhbFdeB4vjAmQyI8R14iAdo8YY+kKxdU7QH1AlWwU/NEcR4w8qmyXU93UeWHQeNKypj3Nt/1fGwK3tt61dkofXKUllGu0zXuZz+UVCKAv8A0xUKhsED73OMWaV/0knbyO5JswhdnOMJ2V9nWik1kJYUKBU2VSTVA8TJnonjdN32at3XVbv3GVGJZ0udN76AAe3AR/2SSiEG2xtmJOyA0CLGttuqpetwJgHSpYU/Kazk8eBkyHMRwOA54HkAiHM6+rgvW5a+pu+4jmW3WvqxjfDp5QPesGYR7uAeQRVUdY0tcK1Xs3TZm4yK9ayEo7q+uo+d0fsjoD2jPTMtpqotQrszkqi47jxvJ95PVMNFKsodoSDMGfiHjGjO8u1TfzaJUa6hd25C4slzRoJ+oRmEigSY5hKA4+IDDG+orGa4Fi4jNOI4DPGJaWv2S3M6S9BVdx2gz0UflSGjojKeO9u6hxEfDEW9BaOE13mog2ZtWTsE4PpiU2lZVz3fIch2Ow/c/wCdT86iKZEgfUDFEsSLTz8syyjz7omJb7ZEey4mUV12V09iI0wgdkOrQdA8f7isuMiOndEj06nau1NMxRYSICoZERGVfcsnzgHhLwCG3dV31U8crmlVQNGDJgcjMOo58R+6LVStyJYpJ1lz65T9klwDWVr/AKPtkWSjR/pKf65T9klwE/vPyDnpxi1lnyNcuw07rRYGbILqxNnzCXOPMYQsAou3mV1W4z2rqXsIgKIAeOSj0lFwGOO6FR7e2GNtXbh439uDQZiSYBBRC2Tzuck4jMQbyfzmm+GA/u13Cty0yRRKJYpCWJViNQtuTQbh8RERM/1qMVVpF0sI29UjeJykU7JCcAaNKP6QGxxxLUtwhWDInCkQuUgaWi9lgvW64dH50kakynFut9OiLt5rwCerHi5f/lD5bQjkJtyjQT9B++NWLocVZQMVgxjI8YrWxIFnNOuVnBBRlrRzR6r7pXBObsiqrrtZWrZmHH3xZq3qe7H1RiNVbGiGeXfEpdm/ZfdN+qtd3uZWLW/tOlGgFZcp7Q+f45BMlENR4d3jFzLScdCNNolRKJK8I5ilhQN62Gq63Sp0UZlIptYNmfkyyy4EA7dYdFwWnRrc1xG5zi3lTKFukaRkMesZpQ7MxsNX7lWstYz1ZoWoSyzUbExXchERy4nCPHMQ8djfKqFcksXFrGCiq6jFCe3NrCZA0Lyd9c+b6rJjr4efDniI1Dzs3c8htDgmxxveOC4aSm7gptJibMy7JlRuE9E+2xtns13d2mllNKoEzu/evbkqJHIiXSNRND551jT1tS3PC4txVRZGtnyzrG7n0gbrTdnmyds7Dtcj7PFW819xOEyP9Jjmje6jN66tW1ARHOB5w/WgjR6ie4w52gjqGbm63HqFDKPBQ9eOKGAx35hklGsOcS5znXHOHDWDg1gqzcQ8YsqHTEhUMOStTEZU0Q3bsExW0l++IdpTXWXSI3QWyZ+I3cIKGmF6yksdcZOkSlW/R6RimIF2h7+p5AcHz1YR3Qt4B0ePZLNDJHzppUPGD52rMYMGa4mTJmb5U8wjxzp3jGcO87UIkSTVGsbGcnPVOrks+oCerZAfgEsofGG4wOmM6xka+JbwskRTcTbcRPT5tz+76h45VrWhUfMJEMRInN21MEA1Nv64CS1ikwBjAUs4H41ACHJ28Uyih3/VmyX4NxrICKP/AIdATf2wjtCklTbz2Y24pzZTFR40nArAAcgVOiHwCkAecN3tOOmm/r8XEcRcMdbOavUl79QD7okc4zVb2uRih15W6WX0z9MPp1jqy17BCkp+9vhtGWz1F6K9AgRpzyh0xEwYEcYyPb4RNm31b2UcaIjomS6ek195Mqg5lmOYxgR8OyMenbpC07JSS4iIri8G+Gjk2gShkRx9sK2eoUtwU12bIDkJeOMZ/wCcaE0ZWK1sNJCrr36fIqubuYb+rGiLFtxO0Zdsg4UySu4qp6BOPJ+f5Bjr+vSs43QcGvWGYd5mGbHLlEfC+tUB7NYWLKhVVD1U0I/SHQMR5SC4mDlKiI4/v5Rl647ieXhf208edTIUUHcUw6uKXcTC/jFjZhKKydvzDqciKWLk5je+GcCGcZDXSJy+kwfScxyVv9lNsVSwk7YpvXj63IPkzrR7AzBnuAQz4h2xcdi4o3bWtt67R1wBNlWZZhK64kDj7XrKiVEsjJIeYiPnGrW4T3XbmrrsuK7D2+OZ9uSsuLU4cJpphGYR8hmwHdKEaEvuSSY/qFj4wiJzn/cHknVJk0bR6HYLmP65hiSPRwPZjj3Rl9Hh5ffGPkJQDUPD64yhMpBXrc4sKxI2jKIQYtxGEOdXEZs2yWB7wHwibGzs0Pat+oiR6nIdoxF9rpPSHpCAZznSNxXo7LQHHU8SJn1H52qUCOOEWRIvOS4k7io0TAI+5e01pWvd3R89MY9aTcYmztYgr0yZs0SMXTcaTLr0d491SM/7vTjRQQHo1xyGg8/OJw+kau6TvRtlXkWEmuZMoLMU6NsG1MPMqjZJh9cswRB6QMGMB+OEBWS0SQhUdn8WTcL9DcFII1ogZL0cpBV6cvb9UHTl7fqijBE0HXOUEKaPAPAfthNCmjwDwH7YHBQdKzzaF63gs4yK9LJd2XUQGxMVxxA2rSFBD/zDHbr6Qd10W4m1y36q3muQIjHGvsWExO7Yuy0X4dK9SDL/APR8g/dHWR6VFSrEaL/HlFYXkjX3QxbfvrEL9lA4RaPKjxux77ghPsoOYO5Cl14vqhnt7oX7O2zW/dqG5AMhoGyjeQkiTrq4lxVvMrcYSfnWecfuD/mNO3zvvDdNvWvZFATa67VPAG+RGh+uGh+sY2TXpuU0dlS3SXs02Rr72mlR68fjwDRRf61wAyaDkAaAAcAxFgzCuNTsEPfA0hezpZw9JbcD78oGsvDfO3Wzyx6+zhsok5UliJY4cr+mEJXhc5R0DejfIAANMcgCNVLiWDinXqTGByOeEZ2rm66rXq16w5mHl2Rhx0vTLaiA4HXMckY3YEcPIO1LWRhI/ZmHV2jCOyomnlSpV/ccgOod0WsGJXrDkMgPfzh5lBQKk6OADIgHjiGzUnUMsw+pDuEIjcjEQb3ppYZ8noK3YpbXPljHUGBHGGbo5yI4EAHHfGNm25VLjrL5xmlZ1Vvriz1lca/b38oqyXsrRi+5smRQVw7Wj8cWOYYBXTa1EcgHw4wkjP8A11GuOoaxbjSTTrDmXIeAaxQ1yaIOY69tLZ/RCReecYjBTqjKOg8fLMVq5SpREBHIh3CMJsAEwY5hrzimlkZCKdahfMRUEFLStBn7ReLjaKwluVtLKggLqCaA8kq6McEifT6+chNLMA5DgPCNgzzTGvt4tsw/WOlJ7d2tW8l75cy3qT8lPvsXpBLNOvoVMOkPXI9MRMkwD5X0pQzmWNYlGoITdD+eOAHnrG4ykyEjYKt0hy1ukc2xbgoKe6leafE5Gx6KeklMFEvIAA9dGQl94l16EumuojcVnoS9+Nk4Ohdcnl6XN2P2YNj26hqqo0r0ft9o1Qq1vn0iU/XrDQcCVQH+OoohojJ59IAjCxpzSTYnl6I9uvRGOgmV4Prbea5hz2UeqtbLaWaaSJxyWqIr/VjPu6np/A2lZ/lMBxkB4hkNOIQqrXdYlVyezO1nsqs1YVSSpuasstGY5Z55kMaCJkCOChrt1AIGeaHq0S8HXMRTunIOdCYJ0pUhin+MOT6EG2pF/wC39atwOEaPspaAkoXQceR03YmVGgID261gGOoe9j8al235c5no9cqULXYZqu1Uc3/aVAp7lEf/AEROxzshSJl0Hfs5XbeCsp3SI0G/ISuGmEqaizyqeInMjgAyOR4jrw10iFnpUku6+yleey7PZSwVUl0mZPuskJGTp51AMY8x+ESWCtGQZNGduIHLrNYYxjE59/yD15aFwvFmzhFp0dDcXXvjSmrVXISonbTuhuGUh4t1UPIaykCR+cOsOEXNebKFZqiNW5yrVIucyXCcpb8rNvilTx/WgiIbt4YERxpHSa8dkBUcVhX3t41U9oMDaRNW9LEaBlYUgNoJI+WEN+XjBUQmCURDgIgOOweEcu53Z1cjqUTrlc1zU9WWFIwJ5RUz1A2oKJyabjNMNaQBmHx7uUXGSYuPk5FeBiirOT9s5yEIQWXbyV0M49NdiwzuMufOY9Mn1Y0x+4Ns4do1+Kwz0UWvTbafNqJQjPgPER4jFmb13bgoKiUV0p1LSYpkzG9kzhM8Mk0g54gIDxiZLL2DUV1HqJCpeZLphnJncWqcUppPAdI2NWk9CdZp4AmmHdtFOciVqcdwYgj341EYjaMjfEVLa+WlM7nm41chKfUIpPSF5VkP/Mj4xFObjV+TzVDP2b9OjteWtJIouAsyLuuBpZ9mnvcVL9e700v/ADQqBNw8vjHSHsr+mZvlctuta+aEAPllvcDxF4WUdR7cF9CWCAZNlmocHkIYEM8hjWsP+DfWlfKmTo2q2uq6YmzF+kcmfLRGTA55dEQic21J6PnZ92N9lm2lmWg+FxuG2ArC+lm48h0G5dJQWhHOkoYAA7gDEdn9GF0LNo+qJdYQu72/b5x3YyEvNy6LeRkinXJ4vLx+3yife2l6Q6wG1Rs0rqeXPez783XcjjbXP4ZJ8ciu2pQpNzZNsVsU23IKFxriG3LRug5qiOQmUVBPCkTEkTJgEoCI5AZuXDMSAfrinurYp7XfPW0bNO4bVW0tEfTyAP3xKBAxLMEvkMwAA92YlXsZXTk2SNmx87T1xWgWmXHqqAQtVMdIb+4pt2DUQ54EciETxLRa0tGDctVzmJrkcpjEL3xeV1aEI6y7Y91F1ypkFTpkPshCfQEBNlD0K9ZFoN27/pEnsVs1b04FFZJ2aITCF13fKIjkoZAMdV5zqMwCPDhiN+6q2D9VETWXs52Zt5aC1NCaiUbyWUQypKdToCORERHURERHUY5mx2ybk7Xm3FZZSuQtmzaF7eFyRNIOncygA6ajyjtjt9Z+tem8DcR2v7pblkFSBFYOEQ/WIqyWoWz1mdViGJvdKfNnWP8A3gy1cUxSLaclRBOcayfSneiatxbHYiVdqdRoJjf2iWohA65zSER6tBSLAPAY4t3KudeJNCvkB7wj9Jz0sV2mo92Gesf68qbQSaD7LD/fH5mp2jXIb4n5zKmGq5Mch2CIfdFhaIJeRk4RZCeEpSuN2gzcxReZPgN64lDsa2YN3vu8npAUvmsr6g8sAA8C4aafCN9N2lJHaqDQZ7XyUKlBzryjXz6JknSJNu8DnGh7zKBBClN9gCIj94/GJB3bXvXnK/3Q9O1ttuFshXu5/wB8ew2L12zYfBkLn+mcWysv1lWr1fEtLYtX1FHeM/mcQhZNbfljl3csRs4ZJPd2fXMh9kcLuryXTUB+vWtYvI3DMvZS9fRPKGfdUnjFt2b1/rx4UM/nRs14Yhq9pB4E0MmRa5Y970rQ+WxC2/nIioKHEol9enOyPpVHYrTJK17Zg3LRuotPXuO2bdGyFtqXr7nOLd6+CpQ1jQeEaQv8ITaBpubW1tbjF5RFNfFniqKBsOAmEY3MAh/5g+EbVrPuSsuKSq4DGPnZUPnRDiEMN6fiz8zx2VLSX3S6Js0pWxd9JrOM4H6gQV5R6AeHS6OfGAbXebPcB0K+v9whjBZZieqH0xymQnj105u36o8xoMWUN77P2Ytk66S4jXU2MtoNroC6mrgHStuLrJ/X7QPqGQmlSwHyDjkMD4DGt3bC2Htqq07mVV64tuvcVMzvxZx2+H2gZo7wORCWYAyH3RreAFFENbwj1TSUal4jKOJvsicFmvSYbW1j1GiaC4Ko9UwQ97Q3scFwJx+h/NyI/XrGVuXX7GOPFTqxj9vOTg8waWl5P30cS27kVMePqbP+Ags4qCuiGCqcqpYphoqGgCA9IdeOPxxhWiKD+Z1co5G/XUUOvWEZiioTHoTaccDG7x23n2U9uB3SHNoW1lezzqU6BBsIz7s6BQlIAgOA3tGxgQ7wzGVbRXomzSWYSmzsz7S9uNoDJbfkhtSB7JPGUM6/Jmznu1CB3tq1QeLLyskZH9llNkP7fJzjuvZS0YgtLN3GRMniq5yFP8/8hqzt5tUXbs8tNpfYFz3ju6WqUFFSb5xUN9QHTADkQmlzgQx3Z8Yn4n+mq22TDwWX9Omsg83Z5gCVrzpW+N1CyIAHR1GNa10tla/lnT4pVybWvhlzlhHMqihTBMHfngOfGGJkeC2iFVBCKnjBcgbmADNPo5EcDoAhHKdkY9u82idSMj9EnH9PyfUI08Qesnv/AJibmJu9zy83fx5hvEMemCaj/JylrzbHFoXgXLGc71Knlj+O4READPhGVJF+/Ry3aaSiqrGyE9GTRmx1+aYjg3JvoGR+TjHaMaBWu11dcOAWl0AAxkNBh0EKuvN0oqoQOM2nJipgTYbmIynvEOOI9spJ4sji4ZuUWxynJwf6Ai2dfHeEL1Vq2OUxN1c5PxoNtDash6H29TzJNy2z32jGotrxogitxuBTBQUT6iZEA92GuTzjIhx7Y9LPo+/R5UHUptklt71mUppRzqVXSLjN4rSUCJjPDEuPq+MadmM93Db5xIbwbCoaQXIgKUp9BOkwxOnmKAgMogPHOcfGETrc7jfjiVHKvnja84nIZ304rHRGY+cMTDqI9ufugNGOg0WpHFE1zuM3CQuT+Dy/gGtZdou0IvgXaM3DlJkyfniN3Lb9Ets4ORMrV2h6Qe2x0DIYlCZqTqIHsjy+VF4ePoMERno6SsF9uCyxsq4FPcCnuVT5Xj8r7I0Zo5dTImqJLdzJUwA4HUIk0nNUZmwcmPmjJgwXEOiG/CMo6458YfoHR6pNNCVpuZC/sDkyB/tW0ZC56rV7hRumefoYbuMxntSkt7XdtEEi4Q31uqK41qklObUB+kE2friLJT0OphbqrVdy7btiyJxIVNxWC4FKqhUJGO/5ePgARr2UL8Py8aaitK8d0rhPZCZKUJFjEVJdMKVNMzwCUJ8/Ede+IsuCsuUT8xc6pGugI5llmHUI8uNnK1ikX651Fk8uTxym58o7XHIqvWCLh+5MsnwF38cmT4huaa3or7UCdLpD59ITZVkljRnBTfkOoIzD2j8vj9UOPan0RWyNcu5iZb8v6RlgTrxwrXOCWRWlNNNL6jkGuNcRp/tizkpRTzqg56apWoTy4TDMnyQAQEdNdIkjaB72ut2smfaZKrnN5LCklSu9mJBzz17NQ0+qJTA2GlOM0qTxyppH7Sqpz5BO9H+j6Bm1otxciyLBqsbeVOev3eQbjzGxn6JpGPn0q4m3dc5eSgM9TAYQJUCY7LXAcCO5kikw4DvjKrObF/oN7j1rlEGUuv8Ada9b0lv1M4+Xars1NeACI6k+7QY0d3NuYTb4UadBtFUuXeqpxMmHPSlAR+vGAixsZTPvCYa8tfdq/bMGBiQTtiRM2uSJcP1K6vh7/wBZxNpaxbXm50lpryKzmRJ2u39Y2jq+0P6IyzZqukt7Y1LPiuUHAnV8oC9KI/8AiBhuh9No9WpTLBaDZ2szbKVKM5SRT0HpdHxjWkv+zygFcuWAQWpTWQNAOQlhoHSw1NEqUslMbzgZZRD6We+Gh3aKTdHoCJnSJ3CEFS3Tay8XU68UQqzYna4xsxu/6W7bn2mSieWMuuZqigVN8NKjJAaM0wZxkR1xEQ7/ANzLrPGYk8LjXHcz1d7gL9JXOrp+aecQ4AAjnH1RTaAlm0UxQES5c0HRNcx/GsNzes6UPgTBKpGcZ4DqIw7LQC0VCOHCJDH3RMJGMrCWG5lpCQMeSOUgfK0jkIojURlRlKBtSfxqcyTVUk1J0w9TjAa88h38oaa3qTXpvI+bWRnL9M1qWK/TEeHGGHabqVmodomEuvMXrAPyRlHA8eOsPyVbVwHfXSpWI21xzLSoGZSaKnzKJ/PYASgMBw93a6EIi4IbWI9kntiOEbdzS4I+Lc6k2sjPgiU3O5rPP8oR3O6soL1AwYyVLDwHnGY1E1iKyJQOSrZUyp1JglLt4oUNb9MNbXQcd/aMSmYvo2nq4JK7u2q7rtKxDcJz9IynqVQVx5rfMehTlHADnmIj4BGw62B/ZE2flGslbHdil25znKl5t5u9dMjKePpuR16MgaSh3AABpHeHmJ641jOLbjNc2P3+MOcC0ui65WUfQUIVykt2a8fxCFmyBsX3tuCZoOh6o81n7VDIC4bfdwSIpZw6n516sJiGZh8MAGeI8I2yJjRtRfV6Gba7N1rmc9n1bVsA6T9xnuoiDbIpwcOqw58YlNsf29vi6nsLw2kGcVcCWKXhGaC5+jm/4Rmy/sd2nshXcVzyC2ab1dfU99VihKbLeDUdAD4j5xK41vIrNDxMtz/L7eQa70ZaJb3Ut33GXY/5NTqYamrZ7Mj/AL0uQu57jLSs4N6Ad0mmHJAj9wRsFaNoGBaa11xHOsJAnAako9UN4kPtjjGABex5+WIuLlu0ybPuhLbtkS6DcNz3CK9RlEZrBkOuQGNfNFOeyqs3Ua7oIikmknV39rf/AM1RalZyPhYnCh9Wn7c3zjUbud0eaLonm/VolBNtGqN23KRSXzctytS1C/vDpcTdZAAL0BO/qrP7IYG1OyrZB33Zci/fYm/QtcWMKBxuIyGf6vemB/Q/Wg8s90TVtLZq3DVV6z+tgRHr0mztyJON1CKemgnDxE18A+Ea+b67ZKIxDx6tTkLrTgHgEp7IqEZ1u/ShIXF+q7GIPzl0v/pPTV+KFg9G6PRkGdMPZXtMwbhUHkLkNihDqkHDw5UW/GHXH2xlE9cgiz9kgkqXivG7FXcChQCGRTv7VvkMTaW0W1v6QV0nTLSmMMGypRUlKOS4J5OEUlPAc5CgVCYBUxDTQM8eIYxHUTshejFtPsuMUzSN0DNvUMRE+5LpvaUKd03dzxLKAYAO4AAIgcg45MrytdT/APWAzfOJyDPJLXk/10h/gEPdijYVer/WSV2Npc6q3Y2gXEO/K4HxyzbPecbxrtbU9mrEoVAukEirhuyaZ3Ujjd50/wDbEHL2bSDc6hXLb2HI7oltNLrrhwn18kp/uyf/AG2OMq6+3FtF7aL5V2HZsoppLZVTIEq6knkBFRJp2f4wh9EMZ7x7uMV4+o6nJAi7nxne9v8AQVlWalrnkdurl1ne/wCwbadpv0sFjnKm3+ZDoXLjGri9RAQtYVY+kgKI9oxqm2b9ge4N7V2g975gckRJpQOlm8SEBU1AQEf0mOMy+Q8uPKJrbOGx1ZXZ3sq4rz3XcSCkr6AOHC7XOe0UM8ASA/AjENbh7atzbrJ1W2+zGhKdtGcdDqQ4qp8wi83fzDI/qwCHIB8wh5jkZV8jSJtT6Rg+REdIStTREHmx7wmptT3rbWy+1kq32z+SQLgLreK7ksFCR8VFuWv8g5xqoJ2pfd0Kxi7G0G8TRQsbNYGdQ1UlIB4gVDhErbYNNN2fk91J5+qTf7vdSCJBwkTh0F+3gBnQBmAAGYe8YZp7KSkerCsLB/rZUxr2RN4GMibfV8C9+iyo6At62KYuszx75u+KSxchGSqNBHYyV7Js3kTI/wAInB/tWFjUt48bnlHsfbpdMKprUSwdLjNge3BPIdgd8M3Oa6Z2sVTqIAIqnEYmqwGtS2dlNLdt+mOu1CyukyulkW9WpOr093ZxuRlSAdervDUcYDTObYt22FXi+3ORo7RfZtLtluXZfcju0fuDJbJ2RR7bNujfS9yquNa3s0tco020inurLgXYHnKmBMAB1cGoGTvAM4DIjo0V277Oa9C4VCVNKJSWSHot5uoodBBQgzoEsvlzjCbk3cuPf95GXW7D4mVE3NuZVKJCMqaiFgz0SqdLkQAuGoAAdvPjFmPVk5gUE+gQrFlZzHdTfIEHEWBR20QS2etfBicR/b7hoZ1eiMZbB28UoZlA/CmP2/byU+vnEp6jwXHIpE3ZeJ0G7pveYtuKSjriiLgIogBw33UfgGnjoMPjbG7Vwm45K74R1UrvRtL3HfDxDrBut5OjXsgOpOSlOu73eub4aH+R+IuGL+dez2uZ7t+ikLGepwEBxFL3FGTekiR2Cn+zhla4mN7acJwkS2PnjhOk5chkpSkqmG8QKu10Kyp+eEYxS9u09V2YmKRUXkoFV68Bo0B5j27FPymtwt/SlQOY8cBz+uMFVHUxdmRpEnu9ElNcLlVR31oMU+H5/wAcGjf+bhwIAHMeEa/k7Z9vRtTOZSuI9D8zbSF87MKk+HOA0kEZhxguX01HQMAHZx7XVfR20tdpyRbKJlpI/wDg9vjDtc2ipno7WJYdhomkrjP9PU/hj8oho73e7blug243Wqm3C4F41vp06aAZp5hEecSBttsnPZ2FC64469BmtuebEqssSjiYeQAHEYmChNqydkfWezaJI9HOUNYldqxKZBP7t2JZD4zaw2r3vWoq1eqYPnZq4D/GnHPnwCJiytCPi+nuVbXOP2RDf+4p+QbID9H207dzzel+S1zj9gkb+NTy/MHORUq1VpCNCgykgwprUojvrgWZgGQ9rn3UmH5v3ZERhvHlddRVTYnTtYTdfOozYGabshmV1yG6NEa88w45DxhnlZ0mDM2JR4jjjiHl1OKLJbAxIVFt3CCfXPpjjrOiPc1bZNmbdZUidQdhyvGseq1jAchHTxhuSygru1cTkBtkjKmuLprqZJSiQCNScR0CUO8f2xglZcmmp1pa1UcjoAZ4xuU9G/skKtEolXtcVGYHa9QrErcE5tBQSGPlK4+ecd0VJpBvVG34+j5Y+fvDK14aTXj/ADPVzm1fb+ISx2W9mxJts0iNukndFY2IAdu+4wH5J5Y4AkgHYABgIkbc5STWcmniw+6RIRyE25Z1q9TlgK71uv57GiDa52oa6sdPIzer5HOAOcRGMnRkbIX5c6ezihYxlIXrLUX+CJxCK9/bp1nWv1/3bTiOnCIkLp2lR9ZWlq5EJsAAaiI/jMVXG481/XCYMGTRrXM3H4w9dnLIpdQ4jOS5lE0dA8G+tO3pIMKTjAB4GeYSjp3j9UahSqlCRxG8eQXq+e6lKkDEUxTJxG7guFibDl7ky0Lm3frmUu3hQ0HVLeDIOF+c+iUDAe7gPEfh2jssclwmfQtXXR0/r4pePr4gRtxZNqkP3mJ6L/nWGaV6DlEQV088lpJZJKlyCu4zpDcGYwC8QQuBfUiToqbRtTvRcgcmEHI9jwD7Qu0c6dL+jFv8kPMeUMDOBjplYktOnzt830zjjSIg4hAktdh9YrXsds4eR3XhQrSm6xuieTLmXgEeiB3IHmcwxAf1T+lGeAZ4BDoeiyYRvaS9IPbZeuFVOOZJYJivd55GRmGaaeVHEJ/lDz1CUdP5sar6YjNXmERHt1HPKOkb0HVtk5p2m2l9pRx9IoXXaRa1LcOCOg/riuIf7oyh5RKZ55VCKVze9yG1uUncSDMtdEtNPk16+90d/Vdjc+8Y16UO5HtVds6AV/dSpuvucaQ34b9fkeQcccI2K7cj1Ybkvi8jNrz66rMPIAjmlwflD4B3RrTdprpTVpe0eWuInMalsFvFrXui3bpwi7NRgfRDMrlWsYEJdNRwPdwjLDolkCrQIjrQaBfeTY50On63R+rSUO4JRhClSSkzZpxVpRGgizB0dOJjOAD4gIxizirhRJFUqcBrmp5hOKBkNZgERDAZ7gEIzZfkksiq5ll/GZd3/p/8RX7hndnWiKWvr2/b2+QYQeOmDxmqbNVBrmDEwzTzDkREeGRiomEK6qfKJ9AR3gzXArL3iIgAfjuhBUEQHAcRGJQbILLIO+9LclWt76kb4i5VDc9ZsFRlEAHz+yMvxrNWUnCN3GY+c28PnycwdJC3JK2gDnWNLKHZS3ZgmbANRDd0nc9f/GHsxHy0CBWuHdNMLGBzvinvZsQDT6Q5+wYyY08TdFq3YclKuPrrkrlJJmAP/QUDW9/XiQIzbYtoUwf6kpz8U9Nmqy/HEXvarJKV0h25bXwazgzg5fQ+D/8ASTFg2FBo3RfMVEyHi1li5vU9qDIdqWpSMXIqppYB3dMmAkHLGM/jyjA3wvA3WKSQqX5wZ+UIAP0tdA+uEVx10XFcdTWDFURLlzQnDI8c8tPjDEOxyV15Tq1xz6oKmZZOONIm2ky+uRUpV638Y5UORIPl53ci4um4ZVjXpHShiF/s8ecYjKOggHGYde6Hls9b9xP92JLebpITqoqmOgSLfzscRhsUdLrKhuUrQAREBzMPOJU1bkUbPs0+1WZLOWuC6iwknG4ZZszIRDA/NhbXIV8ygE03Lhx4Udo1jkoRM+kKW3G7bxXpqCqUkqK01y3iy/aHO2wbuNqROb2zLamvm3ttjQm3AqdCaYXeviEwVKo9wayh35/mjEHKwDQNk6GQyVHA9+uYsZCSaY1KMw8/Lsi94GtWr1x0zr3Q8QCshcVFpZx406hCF9BFLfDa7V84yApmYJRAPL4Q4LcLjWqhnIZ7eUYemlRHj266Q8LTTgmxjs49kbMttJZukmH2z4espIp0Dr2+SBMUiRcc5Hj2x0X21UaWyzsv3Mu8rkd1N20t1XBtB2rRkpuiMEaedlG2/tjchupxigIlcxNv0u1x6bGsbZjZ0Rjo9Zv5Ur3HeBXGgUCHuhEBH4j/ALowJdWpeum8V3C636fAmLO0jrIsKRtuU+BLrTDnxmNVjxisfMDvRo0NY4bEdOOufthLTqdHw5DFOFEWClStERS9KVoCFEJ49fI/yvqgkEitBCeLhCHdHrEq9hH9x21dloR//e+kCGP/AL5JHVt6Uqj683cXPEADjHJrsUmqZHbE2VjA8ZL4oAj3fONIPvCOwD0jKD14uvdH/pinuPjFM3zWlZtp/wDkF+4oe4roasnHcdE+6g1t7NVsqOznsxuO9CuRELoXuGuRJm85BntXAAI+eI08vxXqrjjVDRjhnGBjob20ifs5bci308d0Kt5rkCJPmEc4y6A0T1aXtHTETSyllpvaX7/1BovRO8dzVH08+8ZmyjHTNYO7t8eEYmpSiOMcv7ov9WqIjpx5xbDtLIa+PDWJSqrVelKUFhS9NekfAR7clar4dmIaxQqDNoHnDyuolgOXhwhm1ClibTt1xrFe3WktqRiG9UVkJA9FusYzWrCOsJpTAhxAfIYUV+X47Yt8Y/nZGQQdHxOI6j1ir60e/wCMXKgc1/boEWCFtLj5hAlt3Q7ZPCb/ADhLI0rQZUcTqZij68NYwYxQ6A4HOAHSM/SK4j39kW1XJaiI8osbSDZ7W4oQlyMSdJ2gkK1pXmEjtiVooTg2gGqrvGkJxmW2KmLrOkmOfnAogFhU5i4dgiNMA8Mxmz2fDgvY7Xhch6md7cD0XesFicO0eyMY2YSlYkxNphy4/NbW0UXjxFRWE6X7JAijbGhMZGYM8B5j2RKtBsYiytc+JOkWzi0bEj0n8uzY1J47N+QyJuG3jbZyJ7yYq4cQV9vmt9SjpA4IdEc93d9kbTXU1mJ6Sm0Rh8yEyrJ2l7dJmHdNLoDy7wiDRFLpGM+vDPnmMitytq9mLsNh8JB40TLE1GgTcBQiOAUU+tgZg+AiPkEWPdNrKPonXseMWzfeg92tHcrQW44GdbG21/8A9Cl7prbRSoKairL2XcrdLQAzgADtxHS9t72JpekBsUyLhWUUUKreBp16RzoS1BpifTzMoym0zOB+iIhNjnjA8Y4udoW35y3N6X63phmGVvOo6R3r+cAD/wA42u7HW2ZdRqoSWjp6qqdVkzZAjklpHKMdpIqrva+L7HqBt0Y32lb3KEc5R8Gw4c+Tc+X8R1/XltXbKvsZplp7kqnVCV7HkAD+UFHeC4B/fHJw8PR5mDzvPLFrnIWvdaQmPS/6uV8ooPMB/qsCXbGwe4W1E9rmtugXTzBr/M+/c4ymxtn1ihVPOFn4byqb/TCwhn+rlEYrimkDkRZ2ggQQy9NOqK7ty4QRybpSlKNHTg2hprDLVFGKWJclpjZMzkRdzXMUXCPnMIBEn7M7ZgOOiRLLD/S96N/92yJD98MbmHU5HIlE1Uu73Uluz+me1REooRq8uztrNa073bcqbbC3KxMVXve3GCeUICgeUNq0uldCx0KxfSCq0Z6t31OhVnnU7wnrba8F20peQ09rtW4xs0bK/M50igmxTlCJgbYzV6jsQLgvA3DT3uMbSyB5Hs//AAgcSh/tX/NkTA2BNu87c20q2suCigqyCaVNxYbkQ+CiWh+Ht7E3GTT+8IhU2aNpe4+46uGONrM1YqRPtC3qlOJJYlLXhLnjX0656Q5eE/YOOer0cC/YZKcFzrUX1SSyoZuGhGCTjNiRyMoePOPnpemeTXGqlW3t+R3Nh29S9+bfUnBQ+aYdS7ex+z7ZOQ84GPXNpJpW58Yw+s99xo0EdwUN7LFP1M9E2vS9Wj26DzrEgmGmnTU0u+59exRLuGzjj0tSZViF+rYGk6nu6sUuOk7p3GOtJBD6xEPKP1dbSk6OzZsxsgDFACjycKDXdTlOcesDMcWZL0Z7Ef8AtT2kufZcwaSUr8opBbcjaP69H3zOmeHCOxbbGdRxKUktjo/unVLN3EM84ry75ZKVVZt0K8Zs4qpvsq0c7lUfo/THMTtXX4UlV+GDBmvvZX28IEjnfHLLehAlat9rqt8vR3UqkvlXJFQz9HE84Y+GPjG8i8CasON4Hk/fsmjV7u3+1xqK2z5QpbX99CojvP79JvlYyAfJD9kXPaTTULJoOD9IdQPqcaixjkK18YZQbBPRwB1fs/v89/Wr4kIcf8iWETq9+XvsjN9hcpRTLHH2x+s9fdeG+4D/ALoEVXegh7Sf50xpmHKMd7DPvm1e6QTCzleSbgdt3JOk1ZP4Bf7bkzp5Sx3ctI2cUfUodva6gY4lNY1+2NTd/WCP47ImjtILFFuWNVS5f86NpeIjlx87ykTURi9cX0uSKGoVSXq11LtUD+nvapG4Zt0fyLbPb4dGd0U3Z+8dn90a69jmxqw6ntQUPzQqk+/nHIe1Tk8vGVbVG1E27jPZLY9t96/JfbL5jR1gf++Cj+uGomDyH90UtyVFdgosaXjvdDcJLbgvFolE9rGqRMKND+jcfCNlt2bQUtqbY0vrZKvXwcdVuq8yKdO8QUSxTKN9kaWtnt1BuRH33zx9cbyNl14VqFYh392IraYZSELLLN0CdEfjFNSLJKEuE67gfnfUqNYhXrEa+hkoZrlDevMP+Qwqp1/U1s9oRsH9L1s/V9mjb5vK16BISrYfqoN0GfLy3RZmGfAeYzfEI19gUEQHpCAjjs4RfsK9aPo5tqKCZxtFtc4bo9aZhP8AuDsyJFYcoyqVAR5gOIhG6LLqZWtgzQzG3NYtqm5/d0xSStchuWZftxGG1rU0z35upzcP15PKRHEdFtzoI6ipynG3579DLSPF+DuS7eNTdQorJVMSBLImShjfN7l0HlGRWUbd67k3bZ7ZtSoKY3DPKnzGbJnhTz5ExniE2Q+qNpLW2Y2U8KzrLOl/oTdLJDXwkK5IhgXAowxCBZq6rAcdB72woqiQ5m6b3Mm42qe/R490Nq1tSLjx5zEyCmZ79HvSGyoSlGyhMgs5X0mm1VZZwnWW5nU27qoSYbEiqkXahSqcqiAcczafZGdBtYej02jaVZPvvspFbYuhTn6Qvqzx7qGXIY4yDp5CENAh7NrMXXY6Dt+DVz0uUwmGDdM21iHtCvHVgREfnPpcAyOddddYjOu2ErN0aAClqgGynrgVix0l0PV4+6IA7tWdYqrN0NWVkc3AcoqOX0WXpFP1s0aUieb7BsTamx5spPOoaq7Mm2ARRFFTo7qTblyEEZKswDjpB0w11xzzGEvL0WW2c3ztZRRWy0rzJQS76JxiO8pXCf4iGPjEHmqcQGE238nLVvgX11wJtEk3HEJ+Yj7IiI6zAGMDnQO/ELmZtFbUFsxoGWZc59t4rvOQ3A+IAHxgOijpi1IxpnTydlHgJ+AjTskqxakbr0NSpOzl4PwGFvrZi2iLfqBgy8bI3EaaWXNYnMLTRPJ5IkGeYjLj64uzibbYZSBRoHgMyuPIGhMgIjLqOQ7/ADiZrW9LztttUaxdwGGe9Sg8SbqaQTiHwxEhLH7dmzvtMXPrF9sCz1kWSllUE+fld/sjv8ygoDgQLCHfkIFtWWh4tY7dvrNpWNu67/k8WGmNkY2MSf0qxzqqFypZ9/J/MaPU56zJ6iJ2aUTA5yITZARjJFF0Ki4FYS4cRwZ3MdB1jcnKU9EJco5WS1e3z9tkYA0BEk5Ww6jc9PuNCSHQfPSFLX2ePRhUk52I7B2vriN4HIm0EWuae7dJU5ZczdIdAAOccId5dNM+3Hbnb7/AXIfOOLJac/2UttJG5+vdGlys6qNYChgvLrwxnHR1hwGpbN2XFSHA7kdInFMbRUDyqaAd9AlKI4DOe0Y22NP0TmyY/jO6W/8ASH23VjQDndfZSc+Pbymx9USLanoi7ntxsrNu7c7a9hjzXdO7njcs00yfKo44ZERz2aBEkgrpYbX/AOclikTy/BHJznDlBosX0jX3RuCnbZT8JycfkGjVKVXUpoNJPIlhMFwL1w6I6YyAj90M+RXFRvuATxssJiaUdZR1/H98dQTK9Dtd1kJxkun7XWzWTMKyIKK4TIKRs+FMBHgI414AHlDKVvQUuOhUPKa3tqbPSaVzkpIKHMoHx885+uH+XuS36NEXCDw20fwCYXc8i6M4dwwms7j1yZCZMPjHPc73CccWa546W93DGo6/ZGDpDkNIgzCXMY/3dI6E1z0I9o0ijSPvD0g9qC0k2pswStxXCSX4VA+uPCd6PT0RLHAkRuntrOVdUvWCWVarSXG8To0hHX5IT9IceOYr13JSU075WiaIk9I6v/YIVRnPSsht+0F1nez/AOo0kWhaFV5uCrToKJQuBXJ0ybn+iOOP2w/95UxzTJKOBesZcpoyG6SlChKaaYMYAA4fdG8GyJz0POyqsV3awrW3GvwuJJzIGHQEq0kHqA6Z3A7iUPHEbMdnD0htk3imuJHb9lmZs9tdqBvzPbfsIkKKi4TP+aosdlITsXZOz8lF20/c4Pb5heNrW+7jNE8khyc920/FkL9Q5wtnnYI2z9pc3RSmbZ5bQkRNTRO1HZcOSZoNySXjrNMADke7PDUYyA56KPaITTZktf24FsrEo29mBcKavOEqtuEgBDjmSUfhibhG5mzLr25Lw3gVHgZde52cSX5vyujof73+sU7+qolDtCbFyjti3a/KS+G6DJKlUswho5MF72gAf86qseKsrmlZDZpcpm7LvH/lgJsjojv26WabaYKoi27x+b7sBoBSNkvZDsUxS91DLPuJtSy9a9SFFiVNMt61kxn/ACpuI+YxPjZSft/jq9QUbb7JTMN24V0E+QbbPz7HtxPz/KsbhGHsI29atvW5bdwqy84Wa3lTrwk2t+/e8I+ES6arJYTPAkjI5dLbxQQ9zJ8I+ELateLR2d62K5FlWpoDtdglr7qRKsmNB9rvRLuZ5n/bC7twVQ0eOKWVfGOlju7PGNntodj+0FmU6iIpiZ1qV4njw5mHzhwbp7XFvLRrHs+frACrvWN9/k6IHunbLbd4XUqN4s/0FkJQNc+tklc8Pzd1jE3Wl5BeKxff7PF+q3bE2S0xRwZs6+YbE6V5bcEXARaAORBBTNmcYOngT06Nat7H4m3iuE4yBiv7QpbTVD6GjE0P98AuCNTta9nr188oLDk62/25GVPDbSo7PLkbihbZ4oNzXObQffBIj/B8x/RIr2dknbJYkVaYzLemnq4aSCMTbZMkiJIIFq7etxkLlyCyqlpLot6q678f6veahEFnttjMNq+vA+XVVZVzvpwke4jEKNoPaauRcBRVRcBcskmHAqguTiRDKgeMZxrEwdlv0ZF/do9tN9ZfSUasowTf0HI6yJz2wdhfTBVKRxwM3PiAecBLWxLTS5n15nMs5J2SDPLy3Zy75JZtecjkekLw/UG6WttK7V3VJVZFq0BSoSOIr1IkN5HICoKA640ANRjatsF+gXf79ciU5tposvr4G5aC0Vte110BqTl85yvrP8XTGko9uoxv+2IPQ72c2Wkg0+nAngyW3MljOruJ0h11c8/kRHBrAYlDI8ADTPCLdti+mEs1sesuVOt6BZvoaWIJ8oSgUEZhHTAB28IryRvuKZZ4LRvlr/8Ad/B/z9uoM0vI2xaMTyHbqmSRPwrk30/5/P8AUJeHGhsv7E9s6JdQLMM08G8HUaO0UMer28gD4RyvelC9OWYWF5Vb7OPFXC8QHcZiyIeHqxN8RjVNtf8ApL9oLbeuCdQbFprxSkE6ZyBCSYJqg948g89e6KtlvR6pDXQT93b2vBCRkZIThUHC7V0Qmbqd/qw41HvH6ojaEDVjIbdcinhoqB2ulOSJJWUykc90obiinbRu3ldqs6XLvVtUQ2ggi+zrKTjSfKfTw4h0eAh3j8Ile5bwbPXo/EKuzmInoVz7tAPvrFQgGZNTTGn6VWQ1044ABHuhpXxt2rKsbpMDZMRlVoM8oAp6tcY7KIvN30NMCX/ogeGR7owdYtQg2jNzuh7olBfOOlMMHybeBS6wFvGc5Dr45y/vi04jR+9uKJOtKeAR2YWzaGida6YrlWbeFZx+byhkUob27TD7qve9Ty6qZ4KggNQ+d6ubyCA/qqUSzpju79YkQcdbcZ5Ou17UN0230s2AAsLC5q4nB3RFdyPxS/R6h7oWJ/mZMiP73U+GuULrnZ69WuFbehLDiURDHdEmUZOyo7PFH8CDoo8j4mhIKCWzsht4O2TdaHsxUNoAweS/YMoqbjof+ct3jXK6neLkOHjCdXHIjgAANRjDJLrXDfaEWax14r8zPKzY9mAPYbwmO3c+ESgYTNbNpiRJ8XTQ+v6ssoHGtb9QAyQlPgPypTJnTRP+SIaD8rA8sjDjZejqQV1z9wcu5vnN2CE9uoSjRToed3A8WlZ5Yp2Xe7BCfz8nnGQsm1yFadpJt2bvhKVoKo75b23Yh84PsZZsiaMf0ZNAdM654B34pcK8z+2iXGrrT5qTupyqgUCKQqHDwkyDWLhMI7snEgxKADoGNfPIiLcvJ5u29TyUXI5lI0qLqob6VScR6U048PhjlHpZVxtyXAikDgyOho32/jMXGiZGqNKo1yM+92z+32DWNHUelHGQZVMnAtq8XbP7fYHiuhbpt20sSz7ooD/ZrhMuxUroau2CJ/Lxb+O0nnPCIltxz23rsV1VzzddJ27Im6ANpYJHCh5nEC/YaD6o9vNLaqxbNpuFPuSC8+lRTPEVm3PUg05WiX7ekOcZ7oyO0VtnGfoKlFJomTJcCwG1UwAcu0fj9sQtZFa4VkytieqQgopWtzaXrpTiY8n6u7OUg+Mhmqa4bAZpRMmDQ6jjOYm40UP2RoUKNJN69cJkQlS2+EoCQm1DJkwayHqKAZzjId4gGsfGu1KCVR3gwJZKQyg5OHBDSGa2jr/G24pqrHSEI0yiyUO4K5LOFFQ7zQxYSRWFoU8OW7I2YkhZ2g61zryq+SWy7oylfcVvkdcrux07rdq6asIHDhk8WEgzWpN/RqBSiIAaH/hlDHDOcx9fd8FZwmfXrR4RCX3MtjTszEVVK51YeI6/b4w3ik4zh/Uc4EdB48IhKtzqlRO3j9zPxjFlz/pDM2rM7e2u2bMfzn/tA8K7cDIjqGQDhnGdIaxQdU9cdREQzoMYFXO1a+gCI6a64xBERWl6rqnxGbJ7SNOzauGcPks3tVlZr0GtMVKl6BacZhM/xhER4iMM7VVDFWbHDI5DEW6rVpCOAzx158IvLMba8+3WiMlqEplZyOhRLoqQTlDE05gwIAAAPiP2w1vLidN1ScR1OD8hHpi6bhudUnKzwx1MuUv4CZOw5sv1to26E59wETE9qbceoWn2IjN89AAy7mhyDnjP0RDwzpqGOtdtttNtW2/adQ3QoqKxXfiZP/1fL/0WGR2GtkRu2Ot2mJk2DKE1R35xuICIjK7VgNDZiXOR6MoAAAHIACI8bd+1yUaCdWKp1YZjcw/MwBrGX7odyN33ASKZE8HOK5dUkLgkEYmCEXdt3a5okhVWsnV8qnKNHbpeZ5WrTGK+pkxqWKy6ygEXh6ONYeyydUDU5pTNGzGciAiML0shSZNWgbMgXU3WaHBUtgR6iEB+GdeHKL9te3UbWidgYdXaML4iLe5ER5JiT5E/hVRcmih0Guo0FxeTC7gexqfpJDcPB0k9PEeJpTzjyDPePdPBhM1CYbcVLvX2dJpJLFjQArnAHDycA/1UlCMM8wpGbZ5vGLrXTqKpquqAM7aRSMwkV90186iIjwlDPEYhddq9z0vk5gV3HMBVLJjuLbaxEBlb7eLf0UoHL7fshxll0W7vkem+6P7c4Kll2dqo7LTxx/bGvt8gcTaF2j3Des1QTE4iXZdtUk0Ps4x08cSSYEQ3pREB+UZHmPjjhkYzbmPd8Y+kZa5oQlD/AJQ6zQtA+3scoFkVFNnZjQ6TBLgBjuyQTojt9MylT9oV/RKRuFbX1IZSoaszL6shUqBn5UwBwjr/ALbMb/o0+jXswwjNCYopuK3Ve6jjCYekIV1f51AM9wYDyjnhszYxhLt5LP2kcrmoupYuBcZJahxusjKkflAybCUQ6XPiHxjot9Ks6k1KJ1mujng3VJ3Bqk9NPmcpDc6RVfS6NWBy6w+VL1O2oJJCwStZJtFZy6xZQhPU9uYc2r7Ud5OHa4cx074jG4KuJhDv4hD7u43nyARD64aZMTaDjcZMhkd3z71iLUmHiyDXZ2/jDmE80m1Vm5gjFDxhzZCizLRCiklG6h1pphkMfvhXJh5AIiAa/wCiA/GGTVVGsqKJ08Ym6VczMIiIaajp90Os+FTfZVZcoSCBVaMzFUvkI0KIhy8AlCGZ5Bn+MOvxjF+lCQRXdkYtz9HxfQ4E/wAxT0nqivDooeL7PyeT8/nCcBGXMvbwiW9pq9dh2wuU5jVOUsZXmr0W2eAcHgGY4KbMAdgAM83wiLCWQrKimTI0NZjJgJZf7/LPxiSDuOUDLSTGskdKYXi6JZic4hnBBKAUwiA9/wBIf90YiNitNQi/nPhUU9Uh658B61TT3l6+QM66K1Um3GiiDWHMhSucMgHCX1xmYQz4BIESJ2U1aVDoXCVRH5VFGpSy5DnNOAfbEZnvWlMuVTplh92LGpihce6XX7ok9sps0070i8ZyetMVRGOyJnuvGJQzMBckICAB4iIhD/Y0ikx0yUcIH6NAqqRDf2SFSCbaP5Hku+2b+imGpzZTeonUR6XjdRLSpqFXIKCkOTWeOMw3pWgNetLKHPiOcd8XpyrFVzrRpRCn8s1OM/R/m8Nfqj1WlppibSEPzowGRxyDMMMu8SvC4VpRc36qZl/fJ/mKCvnVaUU6AZEXWaTTKBQSxn63rDje5R+gAjwDMN5Xq1K9WevOIjPMOsfJhyI6jN3iOY9lKIma1Kj8PMYiMvOyN0OmzBuTI3JuIJdwLWdFz9QyROyUSq5jXMw4AM4hYkUhEZhxxHxhKbrevNUyVH83LaShjjniMZOn0gz8ngAa/wB8ab0fQSTl4jqD+DMy6r1z/CHDSrXBbCvXUZUgkxrDSAcAPMeEP6z07gHnDfNxIzjIBp2aRLmydvq7wdKWnF6OmeADoMadR1TFDAaI0ZQNWSPKzinRkKNwvo8bGnckTCxQ3Qqr+/HDn9Xxo/28doibaX2n7m3JJ1Ok0KC1M17fS9HAUkZPmmlJS9/yQ6X++Eb+try6SZsb7DzwPoFcsTuJeIoNrmNrhS3U8AitKod+AHEcnk1KYsUkqTDkREBHGvEcRB7dX26ScyvAc/Sn9T4MU7Pzy0s8cPa9Sxs/0ChXBCeFEWHrqBoBBBH31wd3wGO4911BXj30x7AhP0x7Aj7II5xyAIIHfXh6NmE+KbtJbNp8MBul9mnU7for6cP3R3YbciP694OMwH62lb92xwe2K/8Al0sT/wDhibn/APXiEfoCbWiaB5Robzj9AkAilr76CXYIekQdUOnYHrX9okIH7VCD7VIJcxruqsglzxP/AOZI5knynVUlZOlxDgOY6l0c77f2r6oM+9rtvTXUZzngtGhTa/thWazxPK/qMFjggGYc9HLvUSK0T+2LnF5aD57USK0FXtlzFEAK040Zwm7B48hzHqgIgIiH44QpUKYBjlr58v74QlKoAIhyAfCLNVxbrc4vdWlW7zCvUMDchKlWo1xHPbDAq5Pojpy5RK5So/uI48Yj25U0PXjgAAB4cojkuz17Q4ztpZgdQrttQyVaj+OEWmqAiI47cxkRyj8PhFmrcB8A+2Mf3rD7O7PUUEgLdCijy78wnEBAcDCumAZ7gCKxZo9MHAX0pVxOHeOR1xiL0co+vKeA+EY7Q4hjj0oyKiOaWR7I05aqyUrErMXHizhvEvdnZWR6FhtphBwPXawKCbJTY4lyxo/0g+sPjFgtYAzVK8s3b0deUMpah0A03dVoHq09BEXy4oa/XkDpTbuYDM4AHkA+USdazdro1aanwmGbI40DtiUaN9VyGs2b+N1hyKlGiNDbSr6XYPkP6KY2t/ASEIladUsIAOmcjGWEm/M6USrTlpjvCeMoaBxAR0yEWFB5B2f3w89oK0xRym0quAYWywSCPDjqA/GLyZ6lZ2jtHi1NwfqdZcC0mXbOJX8Wv0Rvw+0M/tf2+mdDlbtwEUkJo292ERW1jHHrEQwMOdsF25GdfM0FIkJZMmHIiI5EfH6olJbqzKvdMqLOPklOZKJCK2SOy/RQcc/OLIgupk2y9o1Agqpe6pJo+RiptI1tyMW11LdDjKPz7/Sd0Hy2jV2RGJRNsRy7orXbvW1WO/RRzG6lEvevfNxh7FjaiWGOzqBhv+9pZvIe46DGlc2lrNx7gmVFQrGhMqhn3QTo8NY2SWrtucPNt42/UBNG0tpr3Uawb5xXE7o+St23mc64zdCbIYUDdOidW1rSZ3ZLk8CRNkMIdXm2s7hupRUC5hbNlShodUjkGYik41JRdNMDE1YTeB8BjblR2D2euVusFBx7oVDTujNm3so7MbVUup1A8qK6obHnDxG6QbNi0dREkHFlfdmxaJ2EEQ2r7pCCeFjSYWdtXaRnt/3QqksMh/8AREbYtmN7deORKRzH7IgS20FHXLPsd4N8/wBbdUh7DrH9Yh1fD52Zch1qupKMB+qd+sQNFF5yiTaPFnFAvEfC8ZcT19JLYH2OQKDwR6Huxv8AoXGNEiQg9arFcusVypM1+7846b9q65FV77KSW4TDVNOwUorqBLjpzjibOXadaGvHrgGK+9tc26P6f/B+IywaTEogi4N432/AOTOI5b6dh3SDe16P60pw7tUWyNF6+hN0UDw4P5jbntWNbedpVwkK/wCaq6TmNOfotb5I7r2obcly4fyngY6D9rZuVkW9LFeH6srFNxHPdoP2QwPaJsbqTR8mH5CRoNNhiT0cdhbeHLosWZR0O5y4oOAjuiY03QfdRw4eH/xUcs7aTU+/F6rw3yWQEmzzj6PL5clMGBPdZGj0xEoHYOAlzHVZ6aB+1LG20uwwEI4WL3D2mXVXayUQCbozEUTPvprPLOuscpB9ykWY1qLTQclkxMHpDNx6xM/0qNR6M4d44i05evinJjH9vbzCx9GdrO9XSWlveyJs/wA/t+AnPsTO+st3Oe6OX/NRZvgMOc/Dvz8e/bDRejFQBOVrwXNUA92IoFBDKAPaOv7A8oe5ynPXr38l5g54vVC8tR6IeaSKMrdZn+TslEkLDo/r1JKM9kP7f63qldRHQ2+n+6JfWnvh09+jU+MKszR6qbddYMfnI8MRFf0ou0ausdj282Y2SeMpRi4CCFw7pq5KYQUVGhPncksccgwIj5RGo5o6mrhWRQPkyCCL8oPLrPVifJkMGP2ldsBM6mr2A2eK+WaV9xfd0gHKjcExz3XsLRCttnPUeoDv7eENCk1OiP1+cZ2nGxAfDzzGhraaNItrRiw3Exr+z4KOhIjUNyDZjs6uT1CkRDtjeRYF77vWI/u/njhHN/ZNS9QrkeEbvLDr3r6JHs4xWGkeI2FZF+3FBaX43YXhHFBhf+EY2Nkeez9ZLakSqRgypW2WaVtnhNNoHqD8vSk+M0soecci6b+4VN44Y0Dzj9DbaJtZS2oNhG/lma1ATSq4LdGHUzh5goo//II/PCp+sLItKWp+4GByBjiH+JgDRZJGbwpYN/2E/wAv9PmEGgkEW7Zs4b/Ap5TeuT8x0u0btMlcz1ghoIjxDELATbVnRPGTFfc+/Ma2HhbjaYsjVzcG2DmIpgDkViQhMot+bwOUch9YRlez9tdMO1j0ML11bc/lLQBQzpAq3jh3oyymRDQdQEO0NQ5xpdnpJt16019Ww/d+3f0ubHetCLyBi+sJynLYs+skF3AWXEsBND+h9/xiKbt2aX8y0RsrsqxLNQeIgbS5QP6nBEAmDPkMQ4WnpcdCajbuqsNJWSrev1UMStBwnpfm1eMEPpAA88CI584eOzd7rj3ZXSyAnriHhqJNc+SF1LnUCYQIF9RDOeWQ+MOSD6DlV00KPPb2w84l/wD4taPJ16mhHrGJ7eTq/EXw5bO4CIo0VcupAaNpIAtgVOTDkMdw8fqh3lVHWHgzHU/nc4WerXEVXN8piTMLDeXiAAGVTrjx6XwhgUzatUhr+vrjk1nQYcQltJTGRJ16wGi/RDUZdQhLRtuydcUVxLVmWiu5/e703tgGsN23SK85hVV7NIRgoP0iKIfFPkHyD9kTR2tm1sXvKwdj0a0zWKSvtLLYFJRRwvt8sOuJvh9UNVQvqVUKtEhXTy4lTPHAcIy1FfrZaK2eUXsyU95b4m9SA3zkgIIIAAOoagIQFJ6Pol4iwlyn5/NzCMz/AOjzoxuCQbyzBtrE2AgbcjZxsS76zdBntZ4MpLKNggRcZU8e6xFQUAyB1UDu1jCk/wBHraJWP9VTPJcSzYqu5dTnmgaBwd2gaeUT5arvSEQ2lqKfQ+c0ld35I30f3uhyhyiV9zSJdNUuwnl0SZyLxIE85KJMeoMAAY1znOgaxzkdH1uvudhFFOGCZ/RV0Qr1I4WjEl9z2p1dXnGs11eisaCUmJiwN6GsWLHTe5brMnmxmAe3MVg9EAa9RQMULz2wEua1AQUTUofZGxgksNZTTlX2noiBdUHQQ4gID2w7toG4yXupKiOZrM4qCUhAdRwOnuoBDlmI2ro3tJjncakR65P0JtB8UhtLiN5hq9sRsV3v2e3ade1sLvWvSFRVTT7XNnVqcT4bsIYm0MFBDI4DUMcIqpno0HNuNNWG8tuyufzkRUjQTS+fR1jc46Lp7NxdvNJPSmfKUWyuOvyRAhginafKz5xjxS5FjvUjv7VBJTBDmH2x5D2FEII7e3ilNWGW2/0ZtGKKOoQjFCfTr5KjVAnejPc584BAteBCNzf2EkqHw+ABDqoPolXYuYAw965UeHvyWqfsjalR2irVtX5wT0pL6044jOUHa+mVEnr9PZq4qtAqpdRi4twwInwHHDsj2RtosVSn6qHeR/R+tKLwwjK/Of8AkIdKXobbdLSmlGkc+pNNBKIJFFWCYLRlfUV9RHiqcNA14cNeEZm2/Q124SqXrlFzHFbuzgI2C1dqdpoTkbrHcBc01FQUEgeWevSHUCegbxyiw3G2zUFgqC1QmLdZppUpluuIR3BvLwiGoZ58RCIfG0lWFfAU/sEIZWJHoVwYxtTBqWj6LezaMPqVokXWR5jMPSEPOJYsTZXsawKBIujsdrk90HiGs3wjXi9vSeoKSSHq4h86cBRz0M3cjbuSq9pmg+Ei5Saac7qUlUm5bWEg+cW+A8PLUNe+HFaOut7gXz/l7f6h0eIoMaeHPMBvOpLLEZ6bu6eaQkkqHIAwAwzzv2qLWNXfgLriUbUwDGI5tNqC+97dnx+fk/dDqKm1T2WIru+Ia91hksrhn7o17unahe6gOAVB+GYaaREch74XFVy+ky12NcUMrlMdLdzfSeIxAkeLt4CpPv5xCm8vpYlh4slKZ/VRUoaShr++Eh+cVD/Wo55F69amq1q4mDg44aBDSLFxztfjX1Dt4Q2LrRFa0qgfnGfbu06wS6J6L743GWxvkg3iu0lN++N2ytvGu4VT54eB4P0fEBbyXpKt64bwTmq4vaxCSlY8ntpycAUE8c4+OIhkpXBrHqQF/XCP1RsD2Z/Ri7Wu1wllFJr20FiMg5UEal47nGTbba9MA7Kg8R8JRDviu5S7NaqZxEuTOXOXhJ7feKElL9uK7Zwy0Ec51al83t9dREtWvUvrFICtZamLFxHQJQ6Qj5YzE2dkDYw2rtr9cLmbWNEUJohMIHrtPT97zMp47ZxAQzx0lzw4hwjpH2Hv8HZtWyFEstvhJrbSzmABwqOZONs6zSFzHP8AGm8xHHLEdEjbsbs7bOaOhmLoOkq7CrTS/mdtoZDq9mJ//saIG90jEZo+OK4cceqS/wCop+QCZcpQ0jt0851LjuE3a/X7fKNSmwP6GK3zcUEp2ghFrq3BSqHWCvfK6BAU9kN4dcdQIuRyIAIhkRzjnG6A3Q2atljqMuZVSj2uecU9xJuJcDIyqPMB/quNIG3Z/hEdlrQJriZttVQocVfzAoVa4gdcEudMjMOAAO8dI5Rbx7Y22zt8OosKVXXmczjinknXA/NJIH+lNoPkHxiuJd5ct0SB15Z39AgabpvSQkneoot9LJ9/8xu59MT6aC/1nr7OuwKeYQF9RIpsssx1quzrBmh0s8vIfhHPU2bFX42unUSuBe1bXerVf30mlD/CRfL5/UyXLxicuy16OquvqJ1/OerK9HISETzuuI9j2GW3s8REeIj3iI48NIkeo7ZFuLOLaSydikimXrvsWXaJE1eJdQOsbdziH/q+i+OAz48cYiU23DSM2jyFFsxD4iNm72lTsIQ+dTzCzVLX7Nfo8mv1xejelh5uEP3t2Ia83ReR8OGXBMOgBwiAb1du0RtyL9Uy7a5Zv28buTyQ0SXzBbq35cewP2/VGbXgSGsiXYdV5dpdxE3XcV2qphcWWK1T/WCmRUdMAbHyiLlzdqZfeVCi308iVaSATNe6MRj/ADe3Ai4o2BRhFcK02l4LVRtaJsNXXz59pcCTdJ4sWzCcfIW5opbieZxLMIiy/V4ct4R7UCIWPy8CweUlswYr9bGlb9cPQ1NwXY8UNQrtpfIm0A0lTdECRyUSCinjDVSHaimOaNXIDyHjHbXIvneofHzqhnuK9ncorqF6dILusOg4q1a1DkI40jPmkzD6z+7SSzTeARemJa+ofPF5cbwBkcFywj0vPEbGiKI2tmhKIqy91avXMMUgmTmwMoHyLU1ABFTD+k9kgZxzif27bKryhn7g+RkTiN7dfxU6xa2inQzI3Aqe5LzPqWROI3t11+LrqMcbTCRbKoJJ6XEJllNyqpTfGazBHpSiGcb0phxx3cR+xqzVF3XbcR1aWDhpTUjpkTqmqnhyI66zCMJ+ksvc8cczoU8y9LpG1I6IiAiOnxGES+95aRbc0wBS27TEB3b9fWRzxH8YDviavHceWhEchiR5OBLtremp7dXUNKu3cG2jiN8pkY8nATHfP6antzU5qDyqOUmmUK5NNn93DQypgA5EPuCGgOKczhn3cgA7uA6gIa5j5Vo13CO7hmUuA6dwxKaymyy+n+co9WkS6WmD+dLClginS/tiMUWdyfV2BXLtWcu53hhkjScRgzbJZJpUrUQEBEQHTl8YnuTbKrZC39V5PhQNt1nqmOgUARy7MDkMeELH2+7FbDtM+nnzpa59xxSslCZEcpzeUMcRjT3e/aVfl/nMcXngpzCIz+5pNPIECAcMSh8YbV71jYNLZ2R+l7w5zGmqD0TokYWWf9bd4OjdrabWHVV3AgBZJQig4JI5Efm8jEU19yK7rO1lBXOGTZk0Opo7MIzTfjujH8iPEcxQrKQUNA07hGILJSOvz0fn6MYtuS+py6V9fLL9H3R9qGhHw7Y8753/APlihW4D4B9sJfXD3/AID2xZutxiCrLecXGFEWz1o9//ABQb4PYPxhIySIWvC2lXpJlDUQyA8R5x0x+hn2DDZpOlvu9kMyLmfxPotuY6nCAtFG5m8iIjvCnwDuANM5jW16L7YQq7YN16DmfBE5+RdhKVDrEKlMMO8/8AJmkQZZhHOR1EdA0EOORCOzq7bkQdle0vU/uhReErk4cIjFL3zelK6uLYE6MhegL/ANQNkq8qijqK+NOUQc23toprbPVvTyOjVhKFm8W3ECXHMcjdy7gOm8DsU1o7WNGq6sazgdRm7NIlBtfbRClet7Hy5hV3koCplJbpIBEJfGIpKK8nMlNllGiXFaNFuAahKA8cRYei6y0oWP299XpDi2dHNqtIWIO+llsnfN/yBDWmR7bkJaZQesnYcm0lEREE7vHtGMkbYNm2yZ+Ua51IF9RND+9xob6AivGM/wAqcy5YA8x7IxRAa6iGHo5SXWZkTQdWIA5ET/bnGuNYtrlQaKioi7rrumgWmMDmZKKBmYhQ1ACxcqGMYzoHDx4xPpOrtu08HJk7pz7hESftFPjE4eVkWydF27bU0+AKfcIiT9of4/MG6e7odN1HBVXFqoJgyYHdSxYmOSCKXAdCxYOAAADoAfXF0QbbuGWhv6sYKoKKI4A4tnAIydmAzqPwj0ZuimoFOYmxmyWK0BH9KrMoH1Ef/hAPCG3U19Rcdfelw6aPmB5jMMwjEbZO2jZ2dwwObbe2fhJ/MVM6WhG9NeusZy5/dJ+dfi+oOsC/bNjj6hATfa5QEfzk5NMQT/IM5HzGMZcN2306aIlKyuYTEUR0b6Nkgmh/u8PjmGyHWbAgIDzDMZKhEiZ6r6muc3UA4zaiGY+kiyL3wdutkbdhJLcIBVp2QlFthQyop17JNz2+sbkPQUWsoP8A25KVwFijvaHZNiqL4mM8pT9cruhEc94zT/CJHekauF148Dxf1/vXWlfhDqeg3avsNss7T99jNDIvZaTrdJIjqIlyPyhz5zCHlGvHaodXtHcNxGQ4715cYOsem2ym0OPhCncfv+LFraJI3CbxX7CWcQWeFYQwPDvzxixINaVMQ3ItjkAmECSYPPIjx+EVnSdGYAl7ZgxzwMVq9IKJJqpVccSGjNZYNBjUddPqlia3BruTzVbgqUV190OHzc/AX/GfAgj68JpqFQolDxTS+BH6xhu6mk2OyL+sKMx86YPDpvIiOoah2xj2s2R55CMCX/LovpZddv4vNu+oQUtTFZXGgzhq0jdA3Oq0aMxgwXECaZ2AYr5ABx2gAzfGHQVjcn5QJ6QzjMQZKZMjls6CO7lxAM+M0swwmZVMG6dKKNWeeQWInVHgYEB/c5j9UAFKlHvGb1M3xhuCNerSbLhUKlWYTCiaok5QHiIBmb7vqiXQ/wCpUmqFPGJ53SvrtyZ//d6L5g6IK1Z4Ydeb+H+f3DCJqtSpVmqjnPHONAjZO0qEttfRqXGdtOobLre0BftJtx0gDEpxIbBIVcQ8AqziHnGtfWabQNR4RtrvO0lQzsCbD7Ipe7irOVyucBnHIn659VUQD4AAAHhFZWuykZV4ts++4Pul9c4ATV1FS4FGsNvI89WjXVzAjuqaHSEOY6jGMqJyodNCYHmOgQ913Kqc0qdC2yHWLGgQ5x9oFUmA9BRPhkBwI8pQDH/KGGg+7XDSLaI2dFn3Ed5c3fW/l5B1US1SmFesfRERzkf74yVNoCSI1VSaUQn6XRLdvHAxakxPE8cpFwAAyICI8cRkajVA6b3EvkSpUcY7YeLAglUEj3Iv4zNqkPSW7/8AdgRZWmACdH1wgPPw0hwUEkNYQ7Q10iwJpP49+sO220j19WiGeIaxteybc5LiCAy245aUliYkDkNZCmo0qIj28tI3hej9sCcVVlKWP1k354jWDY63xx8utLQC9DG+D4YjeVfu65DYV2KXG/ihYSt0XskzWutYAaCn1z0ozHlbyABHyhyvSSdt407dvTo8udU3oEF83rJI25BI22w8YcuY3qDSx6WXaZo372ka7GaajvdsbCS17eNWbpZIKVeWcZTqmEofzpgAMjqHQjWpWq6acc44wlmEOkNeuAmTH80RirBUAyaIa6qHjDjOiqq+uUNUEEEESwfAUQnghRBAQ9BVzwx8IrQnhRCBKPUH/wBkBFOurao2XEJPpCbNGr8NoJCn8/1Cunmfsz8I/QN2wB3dyVy/qNCaXHIb6AWxM96PSEshzmKJiZBsoi130sGw0mAawClkg+NQfhHVVtXOqiqrCooF64Y8MYjPl5r1cSRMf6Gp7fiOpPebatf6Sp/ANTqxec5Yh+UHh6jrZm/mLwR/6wLQbUVpEG5rPoOdnnutmu4Uvfm2sf8A6LEJ9rR4Vi5w8np+PhDX7K+2T+RBdr23uxvLgsS91MJlcNRUrZGBz72ld/DTs84nKNryNGZLlYn9UXO0sqWbwaN5xR/CSCCboRjyKpV09QoCWMyhnHPEYiIYEQ7I2Ybbtj+oVkHyj1yqsgqxXfkhXQ/0a4S3NVGNatShVp1xzoIxNkVuVGhH7cgvGImEbgj0ZZDtimd/xAfjlDNO8oICIh5w9s4YkEO/7obB1UR9Tzxz++Eqljz0EW0jM9oiD4iNShTwI6ZzxjGa4YHHYOPtjMVL+L4Ri1cMCPjGadIDOm/gMdCzwQQRnrU0DgLkTHUPj8IyUrUAOH2xilAcTB2CA/bpF9o1B8MxfNhyWoSIG/y8wQKNPA9LIhry4xOfZ/uDQcSR7MLlcQUUsMlDM366X7M93b3xB03gBxMHHMXBvOA621UopkZhlrlwAfHA6fbH3ETtLPvg8tT3stuqlE80a3s8sO5m0uh4vhVL5DkrgN24s6kQ9TX9dneS+ukLW0UAu+m+fEB3cqZDXlxzCNlLtN3o5KvQrDkyXxNnXA8wGM+aiBWNDWVQDNAqZCUB46hGzmcbSUVR1BOiPkOUfvHbkdEylWD62ydGcxFS/Q3xvhsy0kFh2hX3QkZE2qs75QjrnIZzGiu1dt0e43s4jrC4BQy97oeyvv0bTNni6kqq11hrqv0CbZHoCPHHKNLD8u1WtIsW5UEeuV60t7dCu+CZMP5Qiv8ASBMKoTh4luMsfprXUutcp4lkfs5ymGC7UW0fs6NS6NZCswnqi+TZVeujGlg+IAnuKsXm6PSAOOMgIZifvozNu85tWXQuXs53PZaAWU7iMZQWWe4CcoyVpTCfLJNKmjL/ADZgm+SOdeiPDTMGXH6OsntbuxXvHsXXWtT7MPNTrrivbm5ziC3bhYR8ybnmOJReUxKO9lyozSgEwYxKHAY2BbHeyfbD0Yam4L932uswblbQIM8+2mOx7Wr4KbSacyhJLLvXXYAAGVCXoj0JAD5ITCGR4xni478vW4q0ip1ZMjYih826TIcn/u6wfmRd2kCXu5ma2558Ukd7c4iur7RTqY686mu6K/ureVOo+GgRYre3fKV3eK165UEO2I03AXky5r2W3AQAcKqpvw8vxyh1WcjUW8UCtWDURzFuWVo5iVvCH6PSHLvDU+g/QhEzTsktLIl2Y5d4bkfRl3iqKbl2jLJqysWFLUG9Ruq3iZ/hLME5AFkA/wB3oD5xsyTUGjQdVDd/7o53PR3A7Kt+7iXMSSw+xzet2YbDi1+j1wcT5SgY8ZY35ILqogpUCxn9UHxivNIjyPWuByvk6TnGaf0iuRHGlNy4iiZFD4/f7UHz0tG1herZ/wDR6pLstCsGqfVd2UpCcUwy9ZJpAh0RGUO7I9EM8s5jlusJcR3bSpB6W0Q08svnHpMJss2SZDAt0Q4qniEdZV0nC3XqxnfbJ6t9Nf8Abt6F90cTSWhGUgeoAOQEB4hgecajEtc2ediRBdLf2c7TprWXlMlXkVjigom3C85JQ4Sgs1+AByCI3APFmK5GLdmXVavhyb5DkEEsmXX15IpuTOoIw2HU7g7Be1pbhYUDwmx3sgREeQhpiP0BHPdht7TFjbWPhOwC319uRsAl4DrmPy73dcF0OR0qCwoLhpVNm1vfgOiOsw55eUdkXo39pxYVWGwC5lU916rIHolOl+2kX8xGSDEnS09vb5hdmmlmjrY1fv7hvXLgNGXp5Noko89uW5rXTi+6lbYlKDJSQl44AMiMaBZ1VQdZ+RKIgI7yZAJQ4ZERxD3bb7/cb12xNqJTVq4nDVW+bnIzd1AgsTyB9QAPxhzdhu1iQ5LtNX2gyBUoa36YOADFqQKKULbrZtn6NHiEfZzFX6KzGPzEZIlMZX6xsfJtYpsv7MbOtwZMbo6XYa69WP74aW3pzrxyd/2Rnm3IpVly5FAun/oFppe4h98YTs9UfUE1V0GfzUfhEeja0Qt086HWHZooWOed+EWGw5MXidCslpBc9krzjUX6VipUo7XrQMjkN7sW3wHw6M+fsCJsW3uETXHV+fcR5ajEP/SzU6xe9tjXKPFYs7LMA54YEQ/+KGqERrFzaLcvdJ+AgJohaEuBtRfsZDf+pQQATDQ9vGM/Ta3Z5w06RWH1dHx8ocdNqCONO6LtZLdNiNYWe9ouiTESVtKpeoUiP1Y4Ruq2e1j3Mjx8OcaJWGc3dSLhG3rZ1WPX0aHb9sRbSM0xgyOBW+mWN16JHFB0F7N7k37qpHUPzUeeY4Rtveyk2zntibQ1mwyCW3riGVZuzCORmT1YOtCeO4JZ5Q8o7KLAuSsXOEe2NE/+EU2rKI21JZy9hUB3e8dsKpVVEB/WkaYJA/8Apn1RVFozCSMsjWvwxvvGd4RVJvSiHwixs318wgq1tu/bGs2c6vX19TPAUDcRSHsnjp8QCHXKbfGzbdgxWDaW2UWacmENHKxBFNcPx4RtXcl+EBcpdX3Qscw3sg/6jEa15iejsf8AVrn3hZ5VtiYzne0M/wCz4D5Q0s7jg31PEi3Y2disP1UfII4LFrNkC9yCmN60G1a8bZJqSNc6kW4vlKbUGemjXH9UOUNM9uQ++I7vLYU2mWFTqKyCmEblIOflLVsD5Z40w8QlAR+EbCVP0VWy+rMlae7R2kVu2leUcpCe+E0FyWb/AEhlwI/GGxRfR27X7BCov2a2j7Zqwk5vmsqnvI03lGcO6UQ0+MTSOuqLXUJtDjn75Di3WU9b67Mi+rN6yKo1gJSW7+uqKQrp5tBUq5jdJuugEhKQ8c8AjLlh2kLavqkgv06ColpapRIuEy1lAqo76WAQ0TJhAA4dnbriNlznD0hTYT6Ja+WzEl3dS+ILIs5KeR8O7fUkRGIhPxrbMj8PTEH7be69i3QaU8GwGUVJOQQ/1EwFA32RY7TXUitfEn6TN8LuCzU1lqwn/lOVoeWzcKuJP5CM6tfdLBSN1kWuaKowGh6rKnZ+mfJUBHIRVl2i5zlWtMaVxmMGvpfKEOl5xljv2LbaKS6qp9pL7oiullRySOuhEONsVD4gIQz6/sPX7RhrGCzaNOgpnInWuHWqePnQ/ZDdyjfCCuFGymr75N8n3iIy91fpIQlDr1ZVOl5yb5PsriJ0FtpFZuylplVWVGy2KVt2MXRUgoTI9XiuFiwiABp9KYeY/VDVFNoE0WrjKM4DgcBgNIiU3LeO1rq/VL0SXG2BAcGwPJ88k0vfgQCGWfC5KkuM4SInZzJblMIYHuhyPpHWbx2vfKZKcBs/zB8f/pP6Sbet1hOrVMRTNk5zfmNltLaEUdMVx8+MXGjtFHP/AE8akvb1S/8ATD8YrhcBT5VuHYGfugVHTUl/vgYEf02bsp21MBt1/wCkJW/pBn4w5Tq2grYUGAx67SVngauIZGv7elFrAt7H6nunbGkQLgKWcDX/AG/bHqs/TuM9IcctY7/+NSX+9FDhX9N+7apH4htIUtopRGlu++47ghxWFtNvko1XM1yly3M1m0bMCuFG0n+/IK6oAIZ6QcA0ANeHCNPZZxnz8wYmEMaCOYcqW4K+wqJ1LPlOiKkVAB6Q6h2CEc66QVn/AE79cDx/6W89KrbdOHUozp7c/wA4njcfbFf12XP7a3EdppfXTCbuMpwNOjKAaBgNIpXO23Lo3SSWSgO53GDaZb9L6kaRMkSBP3EvgA5YyOAAI1RVV84Afxu8A0hF7QVxHI1s+M0RFXShHMNXRdxzU+z8hVrv9KS8nqWzibA3l61rch0jJk6qrKhWufoDmUNR5ceMQfbdVwLp6gQbKIoLyoI+6k0UiaUD4/7ocvKNpVidiT0j17AAgwNl+41BMNy9ITboTJmelyiP6xMKh0R8wzHWN0nwb1XFy5UPT0CnOOto6X5GbWPS5dYfu5CDXg6LoLR4zWmrmzM0o885i2oDtTqgnJVNQmLzAHuwSgM4zD4R1XbK/wDgzd/zKO6y99Lysltk3iS3CYjb9te2rhzkZhEMBLgO4I3GbPv+DIbH1oqkjkWreK94Tcwh0zF83LTQ0fP/AN6pyyyB5BFVTGkiTY0ScUdoopn4iK8ZP3PzoIFyFdO2IytyvyoVrxFVPwfN5R+fHbq0F4r4KtFCtBbZ8XHVjGm4tZvGlOYB7PkB9sbvtmr/AAcjatunORWL/PJsbPrbNzZKJUxP8oFwT4cglIEeHiMw57I7q0axGztYJBLtc+9mGyEAp/3Ds80klnN8PKEdLbjsDbo6RY9qG6hdZ9WH8G1xQxjH/KIHOXdtKFHFElnKv/BJ7fWGFVtYcXQi7h5tKn1U9vnqNWWxz/g+ez9YM4luYhaoXIvFZukTudtCmwOHcgHEq2JQCSUcDxHEbZVJq7LNiSYLF0HiVdRpJAckTwZT0/s+Zsxy+bbH+EsmkpxuK3LHlXnAuIBk+iK0xMiCYmTGM9HTPHA54dkc9V2NvDbN2sjChRNLhpnoCrN0qlJC6UkswByGbjr3fGBEOVJpHZtpL6iJdz2+ocUL1dLJEYxLApPipT2++g7GNuj/AAiSzNkU9wsa21VLnqAU6JJuIcoDPr4RymXw9LNt0bXCwo0WYsG7XM5XECU1FLm6Gg8hqCAgA8eAD4xgViPR0ua4DaO3WX65owgE1OgQOb37+oiYHjkefnG2u2+wGyWO1Eq5G0xcBr7Mtm0n58OLDq1uI4P9UJx3ZRkJGLbOgthTukEdVdVqr+tnOZTu/wAxqi2eNiYoruqhXXkNeuU71XPRRCBHrD5wEc4EefnG7Ivs3WU2PbZLV59qZUKnDaAWCUNnu1Y9YPMREfmUHAsw2G0Ltezse3DKSPRqoyE22q/iasjOe+2OsLsz/KllGUxn9FjgRHXsGNQKw6WjaOVUcF1XYpXLuE6A385vi4aUCImRHXrWYdZh14ZiwbVsCWuCvLtx+ARP+D+Yse1tE81Ms+XLy/V8T7fWJQbQO0Xffa5pCRM0Uyw+zqTU9/psRA3tOZgDniaHPzmIctBhjrfHWIrXNalnrcPlCZJh1juJu775H2fTk7wiEt1NpO4NxTZgVgxuaWAgKS2kb5KCn+ARGidarKUwjXrDnnziyUHjSLYEiYk+zKZQ/wAhpMt214/kqxWepUDwXcdqiWfLvSazpkdptPcp4mcdxA8IkXWITjLvQeOM+eIZHrQ9vQVi9b3jOc9/jFt9TNMIfSEc6ZHMOG3EHfqkvaPZpDOgjLSfNVTImKSo7l7nkeM1VRe1RYfN3HgfeL1VDi+uKxrfVZXPD0p5x74kZbu1C05TqekIyWaU1hSMgTKEynGaYdAAO0R+6HAslYtzXOchNtMlENKilxCWWX8yoZDJgyPINeI/XpE3HY/WRs6JBq2dl1Is6H8aKiSed1iGejMGQ90QR0HojpmfiONO0LRte10m6OvfHMRt3+2f5PPUbh0RaC49hGnuu8lsjbvd8/7NPz1+7nr8QxhSFo7LJCumJ1eg6L5T5JGlWUAFBtxrpuw6ZUQGUdRyEuBxkc5h6ePVz6lWV3RXMHDBkx8mUMieOZHX7oxxYdPqlGgXLZXnGamxu4gI8fvivRCsTqU5q49euw0IBgZvcSWv1jD86kUFltQhuNkeEvYJ/mqieXFfaEy75JiiZGSJt1Im+QmP7T9qqLmfcBpUp0gXKQl59erEImONz1H84zrr8R7o+NW17juGuFCaYRNKpwyOZZCJLpYHnnlEztnrYGufeerSXnOJpkNaYcnHKtERAQ/HfEy7wX32ZfR/oR9kW3oFndcc4W3NbSRHIeIj98QaXuhJurs+O0vO7/3iorivSEicKT3hLj9nn+TxgZpibFTWtIjJT+vu60tHlAN8WG0d/UQ469sRM2j/AEkRwaRxj2JolG4klvcpXKSI4UB/1UeXPWIObQu1ldraQV6s73ck5pPCbJRHJB0U+QQ4RF2pSlozDNVGYQHnqIjEEmHsi+Z+G5dz9wgoK6dKUtNoVim+XZv8AvK2vK7hPV1ZXOGVM0ZH3s4cHpzCPjFuCrSoD8kOeuYttVRzw+OcQkE0IaiP/lgOkjHt86+uMdQU+q8WWV14uNVRGbgGACLcNfI8Q+sYS5EeI5ghhVnll645xzBBBCijRjkjrlwOPdLo1w01EeIxJTZQ2X3rtT3YJMFsgJRFKAB97uX+TW6n5yM4jzHTAB+zVv7K2MuHfy4yLbO3aXObXVUyAGK5vMqei0Mh0jRubGgAA579O8Q7sNhvYntFsJWLJu16DmaYqC4T37Q+7ViUAllUzIcglAAlAA0AAAAiJzs6kikRu4JkUT4/TCWW1CWupzqdkv4B3Nnazds9hSwaYbnSyyAXb6YJNot1Qm6U0wjxVlYf6VHMZ6R30kS9dd1LrQYCtvUpkwJI+eJcNOQd45jJfSjelfcd43itW5tmuCFIJgIn3MQHAj3B3xqDarKmT8qa30jSuZHpCE48O8Rjyy7XWuKWI+pzZP8AB/MPti2W8uGX26hMFP4AsQqBpDpCsH/eVQ1ym4iOYy5uN5IrjWflwDhoGilmQ0+ioLtfjupbPPmIjwD6qlOVPNVTZpQNzFkdNx14p9EREM6BQAOY5DAB2xHq49wzTvUpJJKYlEJNASSElyzDNKTlyA47403JPomEj6rrb/dL/wA5/brF43HKRNsR6JS7+Hi0u+f9of5PvGXvvaDdTvMS0EkkXaCEW/RSOQETcifQHl0h1Hx0hh641jtUa1ccmBHOgRQGuGfoj9kfPXY4y+WMZis1VUV67RLOTLDP8tOSs0trpBYx6/H7YD5BBBH0ARVlzKIzDoPbCn140KVYeIj9cIcjoHZwh0bMW5PXcuxbe2RDUy/nwnNgmPDU2clKh/7w/CPmr1UuRBl40/CPEUlVVSIo+2I6z7RNins3+i9sG0RESiq7WaXuob6Q5EDCub61AM9wAAeUc9VwVffVhSMjWHExscY1AcaR0b+lKeCa3EdKZyP7mVbyWQY5MmAZ/Q5SOZB7HRClWHhgeUT6z6JcnHXbeKJkSJ9AaxsRFKKtZ3K/Q/cDLuQwBpWlp0dQAcCHGL29VUaMqrWH9XIUSOfHoh9wxjaYO+ulNDXU0Ace+LTcI2PV+gjkypVpvqD9sNd3yOoYLOadgvt94qjlFbYJJ/3ze33hhKwiGMdmPti8N0nSPK1HepBEvKO8mgDh0Q1GLNX5fjtjLWsiH1Y2nJCdLlQcRoCJXPDWYA+sYwrHI0eXCjXJnTJv5RXyeGGIztUNbhbEAMUZ51i4Cz1nX5BIRTBn6IB4zzzD4S90YCrmJqLdRUoRwOaxsR8R/ujK7nqRVyv+smIFeocbSB+9lqTTDr1eS6XQHXjkAGbP+VGDOirRqq1eiXzu5YcSh98P8u6pSOlJDPjl1TIpu/z51D/j84LUUrWooNpuqbqcCK2kQuJxXXVOgkJpQOJquYmCSUM/6UwfEI3MbVTnQreLYIqPXNG0DZbYSTZC3InQzvzgAnk8cx3BkfKNcGygRJ0r1NRzrEwimMKWvcY5jTMqKWmUwD405RjKNohWWkpm2iaSsYOG15fRK94XYanDIKB9wmpgKTCPbKUI0/8AigS1tVbtsubkXp0h8xEh9JVqgsRwIlHThs8ZrHDVYTBkzNmeYdREdITAAiOA1EYpiGREAyOund2jGRoZL1k4H6oCJcvNw7xiFQkS7uKXIxQr0h67xvNTtnHHHmxqMkLFfZ5ECvr1gpj0ZQzqEufthMkEh4j/ABtcfXCQ3WFVNjXlzu2PdgzoARlaXKNINB1CNfWJDs3sii4Yk/VzYuRD0/2h/wC8DatWiy2z4jIkckNUQ4549wQ/zQSBwGeQcR5+MYS10jpTCP1conTs1Wgr3BeKUkDRyWE1qI90aL6Juj8Y0Jo3gkoVoadf06Mg2iejy2b1JWUiKgZIh1or6k8jqEasvSw7VZLaI2kTjQZCmJuz1jfX29YQ9IQlUasozAdVB75ppQ/4O+N3G2XfpL2DtjdUrtIxud4b2kxt7bsQmCUW+mVgGY8qgPDIgGAzzEI5AyknqpenPrmbpDnWK2aLLXVcRHr7xh8h1fQJ8GmKjuq5OXKmlPhHP+Ank/MVunL2/VHv1wd3wGE0ETzXUEYoWlOoXCCE8EP+2DiCFEW8BEByEKIZ0VgQFELP3P8AGYRxfSCScWz5BITqInFNcN0CRMqHEa9ccBp5/XDlWtUER0TrhUdi3+Dz2P8AyW7KN2No5WoiVXL1LVdAbICPBOR8jNjuGYZh84efacuF+fbwe1CJkU2Kn7LWy/YqxSCYGcvb+2BEmePTDmaYTKVkREe0Y0X7Y1zvUHDyfkNYoCAjPdPK7O37Bd77BNYC2+Wrmo3b9gpCGGs29jq62XzwdvZEUV+tr3/XDoOpRE8crzY0AdM84Zlx1sCGc/HOI0tIpUY1I2oNdzCSUVB6jzDYFsVXzJvpDr7Hd1VSYUFeN77Y1XPAM3s4taYTc9k2dO/PaERduQxFi3DwcbWcCWaSTSSp9ESYhyzEUXCfNkjtE+RriXUCxqicLGgHonStcNQwPiGfKNpdynQV2qrOM6/5ACvt8UKew94CRLQQUSAe5G/FTz8Yj5TdMdt8J7e31CmrImEoq4loevPn6vb4vy+MQehuXEHSp1A7dPshwztKpQCrqGmg5hvFscU6o9gh9sdFev6xP715o46Digjor/f94Rh9biPiH2Rmql/GjCjnHy/ZGddICNd8Yue0wXCCKEogAgIxUq8fMYSyiIzcePGM3PFum5gQl1hVS4+YReKXHzCLPS4+YRcqPEPEfsie2g9W624CX8gK3EfEPsi2+tHv/wCKLxWJ1eHdjSLRWojSHXnx7Y8uppIoK7Rk6IJDyjYjsV3ICipSsquOs4iJT48Y2WKZ0UymUSwyHvHSz+PEY562a4TjaXCCunVJi5woa16IiE2B4xu9bj2F7NZLdpn9ZLe+eMaq0EXgjOWySHcH8IQ/gH6zfoWabqOLDfWJKm8IYUodI9f2Plp82H3B3mJdsWQ3Hi4RDInEvcScafrvPtQVXaaMipTTYwEogOADxiSNwnVRLpldHTzHusQBXz0lddriNUTQbznI5+VH3PyLReWPO9/IQZF/SDu93NzZ5WvjFhMnZYXU5qOUw5ni3F5wphJME4IEe6HC2mrzuS5h71CezvZ5LJjkA4iMPFsjOhtoOyptGv0y3ijhXrYs7fSRU8PyfnA3umRiLts/SBO1AWaVW8FvmJeNjmgoEVVGW28VTj5KgXHHRTDlHAyiHHgPlxivHlwQLG4VV3+YijYu6cUok9jmKqLhxm1mXKU2YNKwnYYSzQ0a4ZlAccYc503UpUaIAFYB7dcRJvbc2Zbf2MrMh829VjZlh3ZQC74aBM9+kd2UCoCH1gHwjVU5VKY6bAKHS6IjwGLDRuNPkk67E5hZEbpfnbWtLYGC+fON9vofXimqrf21GsofnSraFJWimv8AV88w/fGyJHu0T9tupzFflGlD0XhOslPy8R+hn512aXMR/Hwh2WReD/rySt5Pb51slkMDFP3FArPZxy4QPwJik5CMd3PR4u/P4lMdBVZkvB8IJdYb9A17n+uEY087VGzrcL2kPPAxXKuE0P55uJ/9HxPja92uXps9+jiuWoWqrG0p9Ow4kNUq8E8QlU2+WUB99wOBANO6NDnosxuI874PVSVnguGGclM0yuv2Q4fmUAXQ0wAiIjnnHG20thamfMaGO5RT+gGa1XruETNKNz+EnKYRlcdUSR2uBihx0yIxuM9GpfdTTzqW1s8DeI1pbVyAjkbkKqg3g92NmsxOD0YbbpV1Q+8VAd2TG+FdQOj27hrFqXGtypaZF/VOX7BfV9vUpSzlnDgnZKYo1d7Z9IrQ23dpcC35sF31cJf/AM5UH7YlDsN+uW7zM1HLhjJnIYGNer/eNa5t47o3FMD/AA2fSs6h7QFQOTmw/wDejap6J9B602iTjgMUclWQzD58Q5gPZ9QQ7qKo0t1444EzmV/xqCMW/L7NEzFP2lDiVe1c1ayHWoI4B86Pd0aRFG5z1R2cm0bfo/nyhHdS8zqcb8dV2HQe/O1Q+SZyP/6vxBqs6Kyyt1zRqrkZtAEeABHe1Yh2gkntAsq0bdRg2bZvLHGw/Z1cm7usjn/lD1ekE2f7g7SC9s7N62KSKwtl2quyTmjs3Q6QBNLMOv8AuxDuzJysKwlGS4cfrjrQ2adntSSrbsC8DoI7oq9ab62yh79Q/ocRDSDJVtib5cr4s5d4QrSpRGMuEj6pM6Zy7w4or3WaP7Pt4nPbJQPCrUEieidQFgB+SpJ46yzdgc9P8nvjG0+oASgIDqPDlG930umyErnKJO6rJSxN1WYFc6WAgQH5wRj4hMbK8f5LEADPYIxoPITjLSo5x3iIxYFsy9ZpptuTJ7e32CcaMZejyP12TmDyNSsFA5Q8dI2lbN6x/iOH3RqiQf8AHF/D742K7PZwN8I8fhDzdTTXRGAluk1HXwdMBvCs+pfuxGI2/wCEPMSo6tiOyFz6BEd5t/cSaXew4zJ6gAlZA8Ol0fhDuWZOf4gx2+eYfT0l7DoXb9GHtIJ8xjegZFsQuMI894RznWsZjSVVZSuvr4w6Zhj5Om0SBP6xM4gCTrNVx+7rFDqk0HCLC9tnUmqk6BjeCoFlb8z5xgZx7I9fP5rgIWk7kbjR3csqGt17ucVyjrg1JIyCHiMxBlKC2jjxfhFQ2kKPtCzW81/ZVHJtUh7Pw0yk1XIlLCqYZ9dUSUE2qb8TJ7/jq9Oh2id4KPrqH7gVN7p2BFA4/CZ6tX/NfexzHZ5Lyz0Fqztwr8z4gw9NupdRq+8llxeKf2Pf4zZN2qLhGKO7ugi13YPEAXGlGN1nIm1/+wK+QZi21l5Hr43hKK719scOUqjtGzs4x94LBadXtml1e8vjZQtzvXM41P3vj2xfUG3uxQRrCoIDcvJbM0b0/eq/OsE6MVok2SeN0OsErBb9c3HjFFyI7PrrFf2fPKiSVAPc9+iVRuke52PbE2ZaXbyY1x29QSuR7Y2TVfm9P2qDSsl/ywj3iYiS8IulTYMsJcX1HRTNnRfKm/1xBFWZyiMQlOE1/wDkdVSzeP6dFgoq72Q/nAwzhN7oP54SXofmeli4V+ZwmUTxL9Ie8nyOzy2U4myv+gm2dHJSLmpbLrkwBocM2+vLLXk/4ZgEPqhnFX/B1dnQ3TrTUS21C3hDnKTTl0B8cShCmjt7ILVsn+TcwwH4kvzrTfjlyPnbAw3rb9KI6mqHu927jJOvfAK0so+98Q6a390Q4+Xdz22+rjW2qi2VP8GsaZz1PVV67rJ2f6xssdPAH/CIQto/4MQi1x942oXGHZjZ6Wv/APKJBtv01VzaGhm8RrziVNh/TO3TuO9kpnmb0Mxvb2l1zxw4uoGcQzyLvCvNCFJ9GpA3KzlpMksV7cU/dqIUtv8AwWtpUDdAwa2oLgTCOvuViqmQ/wDPD9KP+C22tehsoYcF4tpFTrzgHTNk2ejkw04azAOIzJ7en2dLWOLiOn3TZhs0TNbjvaEEV7M/4QEnPgHeXujtFjbIogIO+ownk/8ASRkOOICVlrh5KOghFl2Y/fKPHt0QdI7Z4qCMSOPxGrrKjOmJ/gn2yaUADDjL30cH9jcD+Rm2PH/7XIETeYf+Df7CFu6FE+Ysvb2fH6zcd2HHcnfXgI0OOn/CRHvRre7LjyVte0AjC7W+nQWr0PU6gXBexuzaAVQj62TeC5++Ad547p5hHArK6W5texKgif0ESY/f+AZnlxvypYMYdLh7hB13NHY12K9nROoF0ZStc1N0HIlLeMdJThyPHgAxeXJtIbJluatBPICZeyr1n7mUOnsYHtj8953+mb2h3XvtBJbUkmRwUNiemGaXt4BEZlTa3213vQ92VFdMmzvu+EKPVx74iID9UJ3A3bJc089PX5vyoBFbxvZ6kem00J8w/Qpu36cG2Fl/Xt9sEGu1CpTQ7v2nV8aRtpn/AAlQpPTVE5MeC44BEcE0lkiFOUPGYdA8xCOWhuWQfN/TlzXhd67xVvLzdTRXQKOyYRU3ioZ0KJYcMh3QrVLCWzJs23x5o+0xt4mSv/WmjLUgSCn/AOy8BqPeMOcbo2iEVs2GSoY/c49fO6PlzmEq75eml2j7tV6pZiIoNorNwOHjgqSljtx/fEGqirtMXnXBXnRcF9TnBHIzzKR1Px4AAh9cbJ2VsB16FvWO6KApjtVHZ+aMNrfODiT/APW42NMP0dSkwGqRuBtDvFm7Mlueq/ng4+D/AFg84O1tpss2oqZZT9wg4IOoOL8QpnGkWzWxSnj7w4SRYANakgAd/UD/AIBG5az/AKPBNQ0FKuRdBVa9hrcpKXvyxci8XzeoqCd/monC+/m2JYvY8rN1sbGNoCl63k9kEu6yl+LxAKlMR1xgEXhnxEA0jUBe6+N0LvqQuzapvCvPE6UDJRvnz80xFN1/NipLPRlDhqPDPGHGCtK5rnR2/MVhE/uEE0gtHV133Q75wtybEjbfcD0luzfszAqW69H1a0zd9zHNVe9t1iAkG+KjnG9pKKH34DvjTrem5twbpOtXultSXXXHs7Fg3vkxapU4iP1AHxiJbl2lJE+WuSZKaCEXHgZlz1h5jEaFd1KLmODXUTI1quc41mDzidxzOyLDpqYKpTyPt9Ymi1yaLLD57UR2973zbiP1ddfuEt13aUnrpq8iIaibbKJVl6cxIpMMwn64aB0h4/XyiHZ9fPHzMxirUHo50zNqMY8NSYOOfjmPcsozDgOMNEtekrN1xquKiu2/rnvBZNeeWxydX+n2DYhs5XcsS1bZXMQLjMYy63g4EICLOV+vTKf7Pmt5DJoccefHtiC5unIZUa00mtKaoIyhxEcj90ISJWpXnlp9EQmmm4gI66w/7btj6+lQMGR0EQzEvjHchcTRFBxl3BLqKXPpKiou2m7NPVsC5CmIXLzH/aDE2ew6yvME80vRphMGmch5RsLsBs0ue6akcJIcpZJb6QWBQdr2XBEg3WkVzqaNzcg0H8axndkdm2VcTa7/AHspUGXaxKNfOrhOBnf8CIiVTAx70ZxyDvz2Rld59oQkutyW19sCJph2dSppRBJlqDMoOkyGgKipjjNoHhpjut6JtdpFNCLP9xv2Sd/28/4jaujPQtb2juEJcd2e+TlzEJ21v8pL4/q5xk9yLxNG3LVO2e2fArprXnKzEXvcE0Iyr9ydR4gP5qVDIiEoDrnUQ565jrnUXUri02VREyaEcmlQc7iT11HPZ3x4K1HBdOpTooxoG00qBjJ1fOSzYNDyAR5j3BGxTZ52JzTolb1Vypi8y2OsDlut0mADcO6Jj+yhwiNzl0LPliZT6iOJ2+/6CH5iIX7pLeXSjtDY+zRJNwpi9sn7ND4vj+fn6xGSwuzw6l4xXb9sEg0vKABl2Os4OU1NARyAZHXXjnnG5a3WxtYjZib095NoNxJRssllt/KAtyhKAeAQivXtHWD9H82ktJUEJCcN2ALB7I2Jay982M7P8quAf6VoPwjnO2mdrm8m1C5BWbkuOY0WCYOqG6QHooCb/oh98VyrdOuZk5Cykjsu4UZsndLFFmZIm0yFRiuwXtjZhtQelgU18oeY1hiJlkNf8yOuUR/fCvB3jyjUrcx9pbvNlK6CXUytDdqEpuU8eE/MdMBz/HZDLidCkGRERHGudYtVdSrV8YyIZ48hhoWuOJt/wDP0fdIK3WumSNEniW+UjY/ZF2OKQiPbmLJNUq1hDUewO6KvqhH93MDkBHTthPWrev8AL4xEJd68Xw24/qlEX1/lHiavntH64rBWHmH3xQj4FGrz6XkMMKMjIVVwHoq0aO7jqAx7qDmbAhnXTXAhGWNpkOl5G9xQUcyqmuISkgGYYd2sxbZW1noVbjugo4VLOfZ1lz9YAHcYOaAHgGsO3JKrFp1FbMu+ruBxZxLt70/Al3jcAZFCRVJ1VxokyZgzMP8AFAMiESDtbs1KD/faGwCqkWFzuGb3NJJ+/qE3kHD4wjS30+38vJNq7EsKRBVXDXooxVPbUkxx2uEeASmTtUcjn/dAMcY7LPRhejUtb6N+2Vban2sC6EvXUUkwerE5cm6UtMB4lUrtEcBmbiOIaJG6YmLamcbNtLxHjXV3CZwUrWKi2p18mu9LsB79gH0dVi9gGzdC8V7EwZhNJXXcpI9gHA/TBcRHomQDQADPAMAEc/npZfSxuy/LwVrYWfVDYEZTO5LR8kGkocN1K+cWr0p/pdribW9xFO3NnDSkSbxtU3IDSLmYJ8fqiWEuoB2iHl3asiTOSbQlaCs5axY05DZffglERnCTI4DMBWtYru4ne2zmVF6h41XuBWja8jNO9c9OUiSfGfufzGKNJi0GvSFYXawmFo0XzLII9IQz39ukL5FFQc5yqUKAJcqUHJpTmyAEwAcDkeQRi9RYXH+rhQIiO7Z4Bj7Ysz5dZdIL1Gm360wUAnDrM5KGp4QEBDARorXQcJbmDDcbE/xnFtLzsfFx2WPIYkaQ303J/l++otdwHvSXPVpKL06CCnTDuoTCPSODnAmZg7R+qGt+SPyezgPb2xTEBAcDHqYQEAAOXdFYunarxY67gUfKSTuYdHfPj4qV9uYVoIIIkIagoghPCiHJmsECuIjMMwjqIh9kbcvQj21C4G3aznQoBhPsy3FS6ZvIajMXp9APqqjGo2vxH/S+6OmP0GLBFl7Pu1JtCmZRlmcJ9OtC3DfAB9V78bH/AIZpfhEfk6UrMU1++mTMqb6H88A9QaOveUWp2C5xjfpILne1b86vLnt73RUPndeUabHgc4/XEwtpN0+0lxHUZD+sxHxiCrwrCFPv6WsXFGpcmRSLeg1TLpe52w0Y+ndGLNWbC3NX4bqXrTfAB/bGGP6v6ughY4zUqxoOYDmbH3BGQtqcZqy/X/o6bjPbwCG1fNcZjhKgOPdyEoD35ERikNLEtqLdO575v+pT8hn/AGunuaoyp2jG++n5DDfViYr0aNIBmER+uH0Y9Qm3ibzfYesnFATJkhrmJR+ieOgJbeg/0ZQnm84ZghKMktQ3qE08wSls9uRzDlXCM9QtxtMOhWnGdO9arLknEAPVsBjP+TLLLL5xm+J1MXEu5Vx15c5fX4G/+b8wbo+vOZ7TqT/j9vuDct7JetVP8QKy5D64sNeoNarMPIRi7nOkTKUi4cRyI/GLCAZAR7Ih06oZmwbwRexvm9Y38gJhz4iY2zOnGSLP2gn7SoFzIo1sxaVADeMeucxqVJlEO/6cYBtKumR4XUcB0vNlLSiRJCSg4BJQIEyZSUP/AOGI+cZvblQmTLBLKRwK3Hu+jkj+eO7oxQ+YH61CI8O+rOqvJcr05pjAm1muMmAyM2ZxH8eETOWrqdH0fFIeMWMXGgM1Opa81eOpfzGKUqVQxWAA4Z1HtjJDtaaejSSqGZscRzFARpEqPqKGd6zxxrmPqdSGiPSmyIjzHgMOVrQyzH9Utz++Sl15i9gncDSsrh1C6k6Ofuhy20nTValIMDr2xjaYn+trduvhiH9Z6Fn1Omg9uoxti1oesWzIJDYttrTksTGnMHKYTZMHlKiQLiHSnHUeyOkLYV2aaKJRIqKxlJyO/OU5nUgnRrN2IbGnHS6iLgMUMlSnxjYR6VzaTJ7Jey8SskyDoFLv7RSVuigJI9MB5otTlLkNQGYcSh4ww3fPKUoeKrTwY5cyvp/1YsnSbPKNqEs1j73RLmVGhv0k21l/0wNp5wulGmk/JiwJPye2rJERwQlRU+YZQM8OJrHS8BCIChnIY450igWmpUaY57eIBFSiA1qoDju1hyjGTRvszivjTmzmFGKKrLKnxqPcEEESDW1HMEEEEfYQIIII+NbUIXAda4zdk0bIPRLWSp7QPpCNnRnHd4NIKI7wuAtSh/GKo4hVH/zSSRrZogIBrz5R0x/4NZbMp+Ve/wDfNQpTCDQZlBrpRkeEsxod5O48ZZafwhjux3qoPDHtZv3N8HtHaTJ2V6uToyVzmG9/bNfm8LC4ZL4jmV2ont1qvV/j4xuq2un5u9JVUBr4+6Ocu6i91qsHjGePGPnRZG6hZy/p2Bfeg6CwdrPq9gMasVobJYq8v74ztSrf3w2ivVEeHPhFjyS2vV5xb93vKUSOG1rVR4/84lJsXX2S7WXUMNh8GJJbU3SLA1Xj08gSRQmxuimAdsgiPkPdEVlKpkBm7OEYiYGnWmCjJnMvEQ4RE5nW1oTZ69KMkyjxdF2StK9Q2L3wt+etg911sH+JUzrjlEP3ecEaIAH7YmU5nwN0tn6z71NVjZl0pBSvbtxnJtRPgQAJiQj5fbEH3Jn927Am0+MGILIPmaLlftlzi7rvl3T6zWzinbTDRKf8X8dkYfX5fjtjJFKt/fGK1qvH4DGa9I8klTPTyjL2HTY+3WEoiIjkYTwCIiORhPGaXjymu5w4C8kJZ56tMOQjgPrjZ7sW7ANytq5doSoqWJNqkx+d3Ic0TyHjGvq2iFTXl0oXH+dn4iP7I6r/AEkDqLbEvoyba2qtFOVQ1zaLXhbLjUyNIax4o3yyRlVIlzYYzLPP0ZRwPCYcaxflkvGlr2by7LI501sxvoFBCWVnkfLkz0OYxS/KTnGpe5lu/RzsNwmbfmtplzOBRSa4lTjyt/boyts4vXARAegE0wTT6yiA9DPCIqXW2ZOo25Xubal3t+8Vr983EHi1php1E4c8FRHr+9lRH/KDEQRnnDpAOMCHHMPLZ+8rns04QW0AKJ9MNgBJwtw8AzITnLcZipuXnKORHu+2IR2mhKVf7BdbYpGR+0TjIHBV0m+UIg/oWifeIXnGC1SU5GsOdM6ahE/dnp9ATte5k0a3RCboyjnxwOIb69Vvmi4kEneGzwGpberhzcVdvm/lH2ErDr1YZm/jAMohNLMGggIDkQEIYhLdJhsNwyhlg/d1AyAiPPj94xeFqpNLQnCSrE5eSTpmPn9cSSwrmV0eXKtK8aerMX18cBlJ191q9Wt+7jrnwho1QzvRse8e3WLVWOD67lx4YxCPesjz7+A4iMXHpAQlUthc94QqSlpGUwq5ONn3o97ttBjXJXLc3PrlgtLeRmn7dPsTvIsoFYjFfXZ9U7BXqd1n1w8J0qlHRONdxhL6tMdiTOM4klOXH8WaUPiEwY01YluKVb19GvjGBxG6VnlNm/a2syjKm1K8rjW+XdnVr1iH5RrcoJRxdYJFYckE1SJ1uE0o8Jg/nCHARh2cMmb5m2uyJIU+c3AfczkP8GOrSlXrXp+tHKMD2r38p3M2Q9l9+KK7gZWyLTFIJ/JAOph6qEe6NUZ31tWlKIa/XE69qPaHtTcloMe0dg2euNqz1ld6S0c65zwHHC8BUDQz9aKYShiUdAwABpkNA4RBkav7ljOddIlUYii/SN05VM5eInrhS6+byjbR6MNRop93FVOAfenFZpyogctBDIfbEVVJeOpa8hqAVzRT3UhnHdGXbDr3INbaJtKYUfdip41XbE03EQ3/ACH3x4uEzxBYXEcvqqN5T1wOIljJFJGbP6aZBPrbRrV0suy/ZpDZDtBXa/Lh6PO8BdO0NMlfQVw2U7Cxg2EMJ6NMynW8sJf26yjWwbda0Vt2TAeIepJKB3/4ox3ZFucrtVeVWP7OJbtQXumeyrwZ66Q6wT3CW/osZRtF3RtU0lgts5WJZs9vmHapeMHnGXnXhcB9wrNbACPSHkGMRDkrQSpOrMkF+iImchSAdK0Ga06hB45EjiLFwnJWdan7vX3vdPhGy2wNAWr6P3ahcCfXEqbOWvXsAH+qRqF6zol1cA5Z7I2pTLtFvejRvnKZ3X54PJyETAOPzgc5RN7lS2eNZotxJr7qitBbEgf4QpRpJQEimbT6NehkMDgecbu/RSm6KOV2h3Ma/Nki3WO2NKDGOjSxQHnp4Ru72aitO0+whtM3BNairtY8nktOO/gBMPqCCpdHG3iMq/OImgi1ram0IdvKQ41i3TuGcVRDea+nDjxhoGUiuB8uQkgspvLTpXTpncyaQ2CBpQUVDPZKACP1Q3C8pVjtbWtkOOumI2/ej49KPV2NiJZslLJM4qmm5C5JzPtsy9B5KIhpvKkORz9Ueyc/IMqkQikdpSHaYulKbnKfAJk4SjdB6MT0RjuRFpvXp2tt2bxlKViJ9HtARlBdUR106/lDQOWgaBHTTdpHJ17V109GI9UJbe+fEdH7Y11bH+3HY7aZbiIrthVSwNqprAgSP/N5/wD/AOWpxs/JUPaNBXG+ofyulxmq6JGWuGW5WkPFiLSMkrNOz0uTqOXiGt51MlHfCPXb6wX1/Uzg/pJPjnN2uvRKOtqLiq97HgT3U2b3820MdXN8/wD7KH7o6Ykij57oqRFPan9IZsybHtLq57qhl73GNpeSdrGSIHj5/wD2sI6FY62hJXMxd7DahCjjaDybby20wY4/1m2dzrZqIp9wWO52ob45PEPcB84lls9nPUHKGc+MLtpD0j109pmueTUdhMOz7DVSu4HGkg5cCgo95pYrhn7IxOwJwSKl+zhGuqIzj+3Tozo1e7VlpW0j8qkKN2Fn/dyZH8DG0Qm2k26mz3du3Cx+ave1681fHrApGq+z9bhvH1DG1ewKkNeiRTzH7Izg8W2KWOtXtjHKy3JSx31BxF/lrOd/wg/LWc7/AIRFisc7Px5xRrLH45xNuSY7uDSWxxv7MTSJ3sUuP3xc/wAtal2D+POINdcfu3AeH484rUV/UTGnHyjl7lY/9mBuTIruFE6vy2VeyD8tlXsiE/X9bt+yD2k/0v8AhgL3Lx/cBPubiO4UTp/Lmpf+gH4wt/L8pe4/ZEA/aPu/Hxg9pKxf/t85he5eP7gC9zsV3CjYRRvwc3znwhbR2kDlDmH7Y13+1dX/ANOPxCPvtV3y/GPfcjHdyo4e5iD7hRsarbSBzj1V3jGNnbzI6qc+cG4gmw+EQPouX7xitRchzhy4fCPfchH+cJC0IlCuDcgmkDqZJ7Uyx0GLOpJtq1U57w1SvwiKNFyHP/T+fKLkTcnKOnubx97nN7YD3kBIPMdZFpS5w9u7cNQoWLKW4Lhv6e3RKAPGUBwEXZhsJ13HZL/uOj1yvVdvP0uHOMP9tq3qd3L9sBrM5BBXoFuDiHjyBdoLM3CJ8+TjFzKWutzSpb0aRUw6WEdRmIiIjGUptvbb161csXaqCGP7BDfKTqR6FHJcwV3rlEp7G7N9+L0touoWvtW/HCum1T88FB9n27/8+Y40iHS6W35zDh7leVI92+XPxhvSTJZ5D83Ijwx7jCysm0W4BBQMUEv/ANuRsITPR4fkrTfaDbA2obc2GQSiXvxxuET/AO+KMNqbauwVYOrQI7MFg3NtGvAmOCb9uso9XJ//AA6iPkERpFaQmkdogj7YK9213KSGw24z5STDW2x2Vr2XiOVwt/aNeVv88Osh7Hsz/wCbaEScUdm7ZG2XxIu/bX2oUw4qleFnrOB1ipKEQUvHt67ZV4ilVPc1yi1omLnIte3Uot6QceA5H6o14q92rRs4xUkqFlJ5KQ6b6dNGiU4eQajEjRs2VYo6+81isPXE7/8ADWRrWkpfMuVhX7a/JTrqN4z39LksJBOuz9hnZ0b9nEIp+Z3Hew+0VxfHs+uNTl3rvOR+LtZ67Sd43Rc10mzO+TFj6gMwhnmI8ADyzpEPV/afeqok10cqTKoCaaHM0pIBCI6H1FRUjFUycrTVB6Wgzy5AO/EF8s2TaCNELSYGP65cmT+7HH3UaMrLwNYrHaXn7VUuQn1eUSdeO1CuKlMSDTS+oywDgTks2T83jNEb1BZNKB3ej5gyYNTc8gIRjI1ZgmyEuPDhDnWrSGM43wjJNyHEbazRNmwlV1ciQ68PpxceYShxx9/CIRW8Ju4pBNu4eaxQ5qZc+6QV5PXTdd+PyUn3hlFM2BcxspCfN1UDaBXEBzkdO4I9zTdLGnCLytkU8uonaCVWEynAZ9zMzgICIchj0RTatfj9WkCso6QcLHQw6hEaJKmV1AQSS1DI4kAR1wIY1jO24zTinVDICAj2gIYjPGfbqsNQKtcAxnORDMT6sbstXBu+oUSDDbxgzQzg4qDKJFBTw7TRzgAeOuvCLatuy3jxdNd+TOoL80Z6C5271iVqib1PKIzs629aavQpFaExs2I6zxsbbFk2tZEgTd9+6BkFXpAeSLUzdJNUlvI8TQh+alh8MjyCHNMuqzeyyn129aowm3RvMPSKLtxRl6TOaYhw6gxjpDr9Me/wjXPcC5686XAYl6ai7nouG9QERmGeYftEceQBF0Is7etGO8I33Hd7BPzr8Q3NHx1haFIcj9wQrmR6il4yEP8A9VT4g7F6topeeQiccFcshotDVvNNGp9BBTuQgUJ50DtHv4xHhEtu57uq6VWXUxRqpquZAm3Won5BQXRDlIPw1h5bLbOrquA4S9M4VKud36DUA9NuTPadDtOD9gBG1W1drGS1Wq43gXeJZkW5Sf8A5VNrRcT/ANIf2RgE4rq870SXd/r/ADH/AKj/ADBmzSVpEezmeQvU5j5+FA5v/fw/9qgwvZ42TipUxRnXG8huV/oM3SmbyjMJG1loS48TbrPDrDd7WHpPmjZKgt2w2WFQrcG5x0dwfe0kfIAEoDkA3VrlM6Br9If2xCfbJ9JSaucjGLIbNBNcths+k/z0JpsPS55j+lr5viPgHZGqeiY9WOTY+ABxCKfkphCbz0erFO8oXi7BBli5Lkkbpd66VOUyfZJ2CC+OR1rzvVzzgcKmaVlRVMCbNnTx3fj8wj2iI5/5Ri1UxJL2j9kJq6lWrjpnAeUUqQDX0EOMMSk5RdbZ0FjHU7wiyqiq3WKYDPX0Ac9uIVYoksbwA/DMeqtWiTEQAd4MCPERHEI6VAwZyIgPx5QxUqsgts7cmue/vkIPqnNUVjE1Yav0phHOuQ4xVo9IRwGR1DhrDkMy1j0uEeGg2m+aVZSo5NmpZMJxEB4CZNcA+MOioyWhtNUq0FZZKXRexWqEkxdD/dWCGmc759I1/ugARI0I9KLWO+nHZUW2biVBTSKWe4a42RPvG9ucNMyrZO5/VqRdISzWBHG8zB7nLjtHGIcZRbdnbaziLnVQf7l6OPZ9sz7ggEa+cYMnB4gA8pQ8Yb16XgfrxL9V1VAUJtdPJNqomSDfIBjhLTzj458oaWSkM0wjNPNUmHXIgIj8IjMjdKTNLZ4hhrnP7dwT+BP8w51WhmSWDJHOp3z/AOX1fWHzdt9ni6C4oqNRTWM2Zhx7PNaUU1NnHtMa5HnqPwjFrSWwuDeu4DetlaxvHHW+3Yb3JGRyIfLqzD+NR8Iv9jbE3X2krjItpbNtRTej4cM+CKeQlEd2ogIdIwYHkABMGRHtDjHcds5bLmyd6CPZ3WrsXqdKC99o5wN8FlxOSWXHUIgAbmgJXaIjqI8xGIs7eSL5ZN+/cqbnGqf+BMNyzpZ2mdZc+PdKMV2G9gLZu9EhaY9tHbVym2HTf0wgieUqZ8QmTmYAj+aJYgAZm4ZmwGcBoAYCNCvpDPSaXl9Ifcytay1lFTBmHFTciCeS+mq+XIO/4Q3G1hto7SPpWr2V2WzKBsuw5Tu+E0wJhpkSRb+lqs2MBgYw1xXSt5sVNFVtVZQwDovWrFtyftyQD5vb5jOBKEw54h3iI5m9dklF8p3iG4dUnb/swK0h61oR8+ynOTtcHzU9vkGAHUFh7JiSfTzpxLet2DeoGiU2U9vd2R4jwiHh5ecD3Vpq56qMw7yHu+cY17PKMOOKSsvqVRSVjpk6aNzZNmjeozD2w6REzKyUsuuHqfv5rApdDGggA6zfXpF52tVnqdocZmySHY/zBMTSfLdaMEehiU+c4VuJWoMlHMIZIcLCliU3ymIhngHfrDCiIzzDNNzHIjjQIrmjVc5Vr1zVUTBkRyGdfGKOohKHABHEMMjO8qO8abiXYKIvNytZR3myZUyUykL5vbyirBBBDprkRHgQQQR3CBBBBHdHrCFSWqNIrOGNZh6OOIjqMdldpWYS2YvRjbPzar0Jii47meYvG4gmHpTBXWPogPgGA8o5UtlmzJvaD2jbK2UoUTZkbk3DTkFS3IRyBGc2G+D/AMMs455YCOqP0sFwE5FMVWI3QyhpY9QkQ70gdIAjNbKSOw+oiX+NQWHYkPym9IjXqWOQnt9g53H4pCdUjxga/wCtcB0iMDiN9KYQAdfiAw8rvUBEKw9vlEdlmuNSce3OPjF5vVq9JgLW0vzGK2opXnCNLr5TXPW5+oofXMEN66a2VUwAB/GzjhGZkhpzN9x1uyuTAOeM9KMNO4rOE5XAM0C5nI9wZ0D6oxrpFdrLxSLBA/jlP+oqKQUVxaty+j+Iy1jpxCsuEzJ0JjKE2i3W6vjOoZARl/8AdjFpzlVwr55cUh6W9nBOG5wDAziIhw+EZSqdNvMUiRAZgUnbX304Ajpu9AcFQDxzMMYCalmIlpS4ZCaYelkO/wDuiDv1kmSrej8nRNykXVL6ZyZW6H/CwH05SMg1Iyp18RvpYfh94staoNap0u3ThFGUMiHjmDI4wPjjEXhIKevMhL2Dpzipo9m6m5YjelekUMOYf5ZVRTWPatBoT53M+puEz2jXrT0wl+EtMIY+lVp0KZivWERrmR0EQ4B2w6CuUmLimVlXpdFPRt9GXnMFbgH/AJvqhnc1TmADiHHPLWLuu1WsJIIoNydIQvQF/u0iDpKUouvh5Mpfup+QU0BrHa3DI9+kZUmlB07uEWxNJhkBEMBnQAhyUJIzXoiPEde+LY0WWgrsvKz/AH1DmDckiq+eEbNxmDTRszSy8MjxCJmWPtZXfDrTEYtSEQEciPbDKMtuVa81GhLSzns0GOg3YP2YzhHcVAylfPxvhngEXvOyVbeiegJ0nAUaEpRKw7O2+pPCT8Im/s6MJibPdt1u49z65VKt1bNC9qXecAOPV/dHHttY7Sju2wr+va+TtyTqOFVGVAbwT9ORqJBccEicohpgJRDt1EdcYjdD6bXbPJSVKGwvaNRnPIDUNE1i8rjkEQFwqksoTFEzTlTCaWYQ8OWcc5gVBoVel26B2xW1uNEXD0j/AD9Et430zn/IUBJLVMnqFz51ONT5f5AgggixAzghPBBBA4mNmCiFEJ4IHHYEKITwQggqpa0hHxjtA9AMxatu9gB4XCr1xJmLmXXVTeB0yWTiUpPP1Rxdy1Bop9UP52A4aDrHfJsdtWhZ30beyk2AoCkmVe035RlbpB8rrBwFOcQ68FaOFm1PKsiYpv70ObJHFM/oDXrtsPbd0dVL+v8A2Ro3cilvBuvw7Mxsg2y3XvyweT+WOY6xq8V62RDlrzi27KaclW5h3zDY+ieN5LtfaO+MPUqunHuHthtl6tz+OsZwpTCIfjTSG1WNRAe2WEssGe+3ldUcYaoz4CYOfLsjDK1XA4DXl+2L6pVvgEYuZ+l8Iik88w56DLkwrRZbmE0mh82bObQIVwwaUXIprJUBD/sJZZZB+sIjcvHA6Xn5YiSjiCmVtTbYtQq6g2pjkwcpRE2P98RIWTlX1lUcjnXOkdSLbDDsm3cRILSvl5RjbkfH17CJBgJyt4Y+qMcrcR8Q+yLkcERzkc8OMWGpnIeEYi0gzFFn560FPIUxqPEEEEUzrqBwGZshS6vXE41/NMBN2dwx0E+lnfde8ewPsL3QLyjMTJudzNmrII43KtVKJ08wZ8JRjnXTanqTVDXjPjhG7V4Kda7Xog3Ejamzez5tAoToAA4p6esE1JJl/wDNiNB2frZrRhKsM/SJlN/3/wDTDgzRqszXr3OcaLoIIIzWG8SW2fLoprLXz7beEs5u3z8KAhOuX6c6eGm7KZYORgrNMM0viPHlh1zWmosh5KaEoAIGSZwZJx5chCGeknmlnlGUdZZsh2xKRDGneRokWlXqzi/mtLLSZwDKM0zoICEuU0BDTeC+s0nbKIhyyN1WZdC0nBGs5Y/TkNnbfL5U/wAaA9NKsg22Ht9n8ae3lEcRmEfDuhMI5HI84VVy9WhUq0Kuk2cTc4tg6CIdkRaQXdoe+A0Yi4l64hOAh29uY2J7KChI67f7S1oxA2ZW3bZastNMoSkHfjyg3zYKoFfPE2ndGuWiI9Ic5yHHHEOEPhZm5DqthcRrvhnqhlLc7VVAPo50B1piGgfaPx7otnRbJcUG4ObVrbg9aqal4U1BSYg0zDFcpYQEDJQxQNhnTQRmD74x1OqyFZvUCAhkcgIhoMbY3akbArKoH75O1l3PTHS8kre07ZkTlommsBRUVEoJsDJU8GDpdELHNAAcjiWUJeABGq5fOUa40D5GgJUDOgBKPfyi5LV1sLEosF1incsC5PXJnDhOJLI1Ig53FEdwZu1VM6kuJNUC1XBgoZA4VEdcDx+4Ym3tUEvZy4VC4COPzDdhL9qkgccI18JR315krkQ1HHYMT4luCiLSKlWse1cqaa6ohlziOsc2cZ1/Zr4hFo0rrtjXY09uYTG1TKrtF3Dc/Ab+MXHZDoKype9rFSvS3k0rEQDc9BHUcZjO7y2IetDaV21jC2iqiAkMZcWnRIZWpJpCAD62YZPlcBEQENQ4aQ/uxCDVtIytqC9DobntC/Nnxm13S2kgT+A94KYzEDHZtb7Qm0gWVD9wXmpK5Vwj89E5BAknnsdoeUNdVUH120YInyOU98hf8H/UDtV0qjcVWKFelT+3mw/H7gyKdRq+uoYyPnE5b9K5pu7AzGSJsiYuDdkVCbHH3YnmIIGq1Sgek48Rz5xK3aPUaCps+bLLXIaCZBeXDYd5g4EPU+tVwii3b97IPue/2So3b+Nz5P3yCKdo2spOFcIpCfRybOmaMgB2cI2t7e7io2C2arO7MJE7Q9pV9MLvh+lZQzgRAeiGe8Q+qEOxHaZqWfYrq2ubv5KM23hQ9K2kcf8AvgoAABun1Rq22lb5Om+FyHTc93VpplV2KgnRDOhChrgr9kM0wq0rQ67j3kzKIdJLJRbIkTX3y2/jOI/ibGt4xeU+uNLxAdYxqjy8RjL0cnnGf2Zj4gVVny1BBGVFtfSomlsv7QT7sRcFLfTOO1BK70ErkbohhOXyHOUfgMfoWbB+1Eg3+tihrBY9vfzX143Fg9+kf9lKv+c4/OCayWKcIyiAfK4jG/3Y521mtsWpaXZJzre6KcpYLvuU4RP6s8vQAd8b/wDtPQfhDXpMtukoyJVifI9/0Fv3PbbulvIv258kqNmfpL9volsl2/U05kDvN4XuqnyLGn6Iz+zYZDIiHdHHscc6+vrqk7XcsqTgdC+a35WVzhzpzziPaPOHs29do6jtF7TTqeKOqmlVnJM3UrQEQ/Pi2MmjX+9rx7AhgyQb8ACPbjUYkliQStsQhEPhCB+0ZRuqrqM/hJBnqUIjMIj+OMS3smd/doiAkjmab/RxEp7P1v3bn8cxZR/eZxf8r4REGG7CzKlvFEef1jG0SwKx6hSoc+4OEaf7Gqe8USPd5xsssypeoOUNIzdMI7FL4jC11NNRIHbji1lX9k5exuT3fjdzwJnUIFIPiEXyZi2OV/eEDaFb/bua2nKsv2BGryiTOnR93oGDA88ZEYzhLtPdBcqjSR2Q71Kb+anoBw7N/wCWWKiR0y3G4yYxWvT9DWCwGd6yKvE2KpX2+UT+q2HTP5IvDa9WDuXgCD8gLpMU/m9xsRVDnuS/0hCIwomyJtbLgeuR9nm9B6Xtp2/WAD/6WAw+zd9Gr6QtVkp10iwj6oSj9Gc4tpSCP/0QblGJUhpUeY4OIRx7fMHFC8Gmr17iK+lmr+NBKJf/ACgmLEpdnytgkI0uFXl7UhdRG1cmofoscRD1yW9uQk/pBkrpQf7aQEIkoh+i69IwPBCItzs67uShJ/21IeVL9GVt0lxHrraEsegBw99utKe//tjD+y0kJSta69BwT6SH/OqH93fkc9p+tUFCZ+4Yg1uVUtyUa2TBJSKeJEAi3VSyyOmTHmTl0+uNqsmwbc2hWoe2u3ps/JGeAlVUXGIfDELw2KbdkAEHD6Si34j/AEVEtrOoTf8A1biJIrdUK48fRYn/ABv+RUcFJOFY1ohg4/8AQ/MamPXqX9HD4R7pmzoDkaJkeek0bdyWzDseJ2DLt2yrluYA5NG2pcgA/wDFMMZ6m232CWrR3gu3Noy5v+vECjfjmpeEcypi4IYc1J6DZUpXa1qfRGlUkpevrAY/AxJH8mVtxs8l3GL3GKGrjG3SYRDlrBT8qSenYH50+uNldZ+bHzV/gvsWmlb/APCMvFG/H0nt7JrP+brb7KNm0ndP1z+EEBs7veOKfqqNMPY2dlnPMhFGefSIQanU229yVwaBZr2yuMrb3/QGkrYiSrP2Dtsx41qHsxYFf04HFs+UT4mlW9IdtgHqPzO3Lc29K/qW4tIonwx1wduLalUMl1baKLpZYNBJoQZhy1Wkd7TaEG6aKfpjtSO0nPUtobtkUU+8c4chteiY2swomPyg3ZtJZ1BN/pfK91+H1Rc6uzF6OyxW7lb/AO2g6Lsr5T88Z1qkDcG9+2NVlwdphPddXeXhcZ83CMgOhRQUjUpD4Z+6GCOX/koBu6K0yhabOho2cmGb7Iibx6zY1/8ANdwlOp3Ut/8AgDY8S1Fcs7dpj+i3JnG9NH259jqz9avR2WthsoqqpUfdH5dZfGaoPeIBr8YwO6npN9s17F6xf8o7as+iCGqMxUAmlyyeeufgEaYGxfhZrLZCq4TIijiZ95LFB0lDTOnbiLffR5N50vVSPMakqE2uJgRSiiqc6VaSXTGcQ4NH2j33OrXK3Jt+8QmQ/H+I+NdotZQh5yjfbJXNk8I4/X8okO772Nk0oV1txudy3Icxoc76tKRs6PLnMOfhDSrO025q0vqG0mlm2U/jYmE4M3mIZiLgHJZpsCAiA8M8YJqwCPyZcZ1xgYiMlpXkV+aJc6lPuok9qhod6VbyWT2eKWKzS7qO59vWMxVnMquGsNZVPGlGbGozzDNP9cWAKo51EQDxi2DWl7MD2YHEedR5ZHtiNu7tVWphnzqCs1Cqrq69fe+0fIUQUaP4CLzRTa1fXAD465jnHQMk9HIWejRHOMY5aReSibXMBzxzDlDhITJqHa4aiPbkdYkc0LR7/VoUSRKupGB4SgGRHwAPvi2bW0c6jAWPa2i+57uW8HRDCITCOV63ysyzcg4jEoLd2hV102STEFLNqiipmeiTSycozZEeAB2jE6mhseFm8l03LfJ3ptsUUJgmlQjhCY+71EAENSxGkGca8REIeEdoJrMxNFmbNDL9jCIz7ocfqucA9cBSAR1AZwxLKHdKA+UaAgrC2LJR/wBDXufCeTyfmN7aOv0Xoq11iPrzNqO6TjXP/d+T58MPKLKkbK9ubIUiSvtTOub2gAd9K2RZQ788ZgHQBU1UPdCnhmYRxpjhFjvFtOL7obAMZEoJVo7QFJgD8njKymph8ch70p65NmeGs3HsDjEc3s9+rTVcPelxxmpuI5myP2jDJm0vrUzQVXibBQq9PJVsE87p3BNMHAOGgBDxIu0mCJ2LBGizntf/ACKfhQWRdN6R9nIHtuzGxdZ2/wD5FPwp8g8gcW7lTfN9WZEbmeibXzpTEsviIfYESLshZtDmR1RZpKBW39uW8HSfV01sllQPZ/VEryD64v8AbSziYcQ6d171Kxto2tKGeg224RJCLkuEYz+i0An8OHZEyLju23+y0y25e/ambSYWcBUrv+zHsfIR/Ke3+ZNVX/hFZ3FcTSKoeRcHzqd4/Y/s/MMqXndrO1v1hIH101+1/wCynkGRUatsbSWg/KRehKVLI7NX58z7Pb91fffaR/2r/RS0aNdrnbpultTrtAuZoFGTbFuhuTFtW1/ktxul+wA5j+2Gt2kNpW6+0++zj3uO4DZ2YJsJST0h6tQi/wDNlD7++I21zEoTSylw1HkIZxiKNmF2aCx3z9TVve92zjHkjLu5B4Z7TrrxGHqtWDu4RbgARH7R7IBER1GLjRKhVD12N3LjzHUAiL6/lp3z9gN1a1p1CoTT6p6Yc8Q0EZQ4xVrerH9wI5wGkKJJTanUokSVDGnRAA4jEhUmydJopNB2XhUxZaPPMG6IM5TovBcDOPdSY4AAyIZmmwH2xNI+OaFS5k8iWXpVz7gKaMHb33vTmpxG8nkDEtJhLr4U6CM2EZRW1I2OCpMnKM046cg/5Q+0rTtLaH92uGq+2buKGhCdjtmfoJxTX9aVg8vkygOO/jGOO2+54umnWpalF/Jw0a0sxU8BI3vTsXqGeCmd/jeAAAAPaER1kqyzTiIzTTz9s45HyivFrjiYZciEC2KR7+3PwE9RP8w5FVi40mKJNoU7xuD5qc2Pzh5n7f17v4hTb1MSzXZ9CbJVlNoJk9ApCI5EehnUR7x8oZSjMITCPaIZj560e/8A4oPWzd//ABRDCyLtaR25+5Msr3zhudO1nlcV+seqfrQEchjHKJobF+w1fzbxueRtlY5rmlSsAyzOF0nZBBvNMuIiIz1ZuQdgBqOeXEZN+je9FBe/0hLppHw6VtLHJIgfd11FolmjRLgI5lTpRl+WOnIeiHfy6Dtqb0iWyd6Iu0xjZH2B2sgK70CXcnK5Z5/nFwmQDRUXxHiOgAABB6SFUFsd5ZPLnKXhOsPCpJVTPrz5FMuYpfOHpKmNhv8AwfTZ/Auz1VMvNtMOEmIOJ9APv5xXlAR3RJ7JZQz3AARy/wB2LmbUXpS7pKdzrrOWZr2jb5ofWrB7MrJt0ngI4AOYiGOPD4Q1yuSeu0IvGNpPbBfyoXbZw37qnHJxleDwDmUQCQ4AAAcfKHQPrhqrz7RyzcgjRZDLSS1t7RpcwgkM5FH9ylD+camAczDny8Ykkba6NUkXz5PXZC5ElCFyHW/ykw60IjRKi8rQpFMvAT5vsDlXK2hGJaxqnbN7MqXuiVOAknddE4ASuN4hnhgNJZePDs0CIMzhVO165oxV3gxNqJjIx5oUwlCbIAM03kEsO4wGHTXhrLi+anTWYizSgpqYBqGRAQLFtNTM3IPMe+eM4iQmcm0ZdV8El2EQJVeQn3ZGKPV3ewSn3U+MJme2SsqfVdbj6RdCTZ+iWl6IyzrM2R+TKPb2jyjAnOvn3QpVzpwREMjKWLgIhKU10wEXx9veq5zVMsnUerG4m6JiXLMOJQHlnmI8xjCaVUQDodH5QCAiPAQHlA6klHyuSBQObZicZv2x/bqClnTVulyXFeLJxG75/P8AJ5h8gggg4R0EEEEEBBRBCeFEOiK2vCBBBBBgHG+f0AdoqS5tOXM2hVijN1Fs/wBsj6kl8wmWVYBJEPMMz/8AFBt93Nruu6i5iuO7FDPDnE9/RrMafZv9GwefCoXLE3LtAOQ45MDUEooCnyyATSJgHsmmCaYA5dKNG95HdXcrlcS9XHU6qDxHjz+6HbRu01DrafhNXnN66u+NGaLGdGKjmQX+BR/xnEeneo/3d8MQqVgERHXu1jNXSpDXq5zjlDYHK3fD1d89qWh8RWV6zFZWXPWovBQZhbCp/aVGj0fIBGLohtwFVRpJQiBUFtSwZMzagSoUREPq1H/dCKDboTVySKRzoYUKxw3yz6kP2ZjNaJ2RIb646igdGuuGxRUIoA5mJUM5H6gCWKJTRaP4lo4liG3Ec/0ONT/3NSOUQ1RqsRdfxROP5Kc/44fOG1cyyXczjOK0oTgkl5x3cB0xLyDz1+EN+bq1DNepVHgI5mm8YyBZoTJdKilgOJwHJjvmD9gRimPlSiPEc579IoO+ZCR2tZi/P4Sc2tX9c3kDYoqquuddfjrUeQmEQwHHPGHEaCNKqqScliMw9aG/lzdlGl/yH4RhiaVE4aCXAZEchyxxh1U+WVHbyu6hlnlE18zogj9Ec/nX1CH/ABDHex4iiFSTj2nRb37hPGfkOzRPXuqUrToybxvkoKLvXDBsmYq0quCy0Y3YJefqCQS9ER+MvwhuaJTQQEePbz8ovLgGSZTAnRzNQT6W6hMPMcjkfiMXAmTHz46xajGCd3tdrldxvpo9EG2Qdq6zGvX7fzF0TCg9L5PMdQxEgmej/j9kYAgo4Va9IBDI/Z2xK21jKruJZJJxalnPHhrGuoeNSikU60Fw6LbXrVblB94sglbsi2NOPd1Eg9QPVRObhnyjeVtR36QtgLZgU7my0Cpq6DtKC1rQt0eEqgfAZjyuPcAAI+UJtj6wKPblt13A6DxVvNdJQfap4OQ9/J6dHMl6RXbQUts/aCVHWnb2StSzBFq2nbc0oyjQTZZhDeJgx+cmsBMPgHYMVfck+lMzZ608W23EP8wRS/Ll90UgZen+zyFyIFEJl1wq7sWlRyuZRNLq6vKNZXWFY7N01BRMV9ZpppueR17PKLLBBE0pSlKYUFa0pgFEEJ4I7a2o9CeCCCPjWH81AOLhBCeFEd0eoEAgggjuELslJNdxHUpAIZMmlxToIxMeeTBoAD68fGP0Stpb1LHZLAY45KFWnbgghjgP7JHCvsEMGtc3bU2XGQSJzmxO3nRzdcoGuaBA7IpzZH/RkmCO2D0hDk+cnGGvHnFX3CvVeWZsa04zEREki2W0R9f2h1CEHNDtLurrVer5z4xClYq6CPZp2w/d4Dm8LFf9nCI7qQ6AHPOY0WilqIkjf0RueNRqxt4iFO6MQUZtMdv7YaZWq5mHj9kOOr1fkzCPgOYa9YrQ115+oULpCe82FBip39v3xjZzn5RfTc+mRH4RjB0cZ/0cxXM6vjrMBQ8jWlac3tzCXLZUKK5ZBr0wyJpvqJ8idHmHr8TFPsm+ERgdYSyTiE3ABx2w/wBs8Jy2u1XAjdVGTDcUS/ROK3QECCJWo5mCYR4aZx5xTdNjpZ68w+1aHOOcj0Zh08Y6YrStmHbsSZ1CJ6r9zcFoSMdJXfaUWvFI1OoQuQ30PL84iAdpDnOQ8uEWjA8ZgEezEPer2gdFER3GlRVc/wBC+WH3Q0Kkmm0+uNE7RmL1gHMwCGo+UY60j2xLRTs67hmoRP28ordaNkIw2pfomJX4xYoIIIp8eBVTqdGqAiPPUcaRuy9HkAXhsftl7N5cvvq5cKxFd1tAmGmVlr+9k9Y0l0w6VQQDtCJ2bCV8Tuz5tCW6uUAiJRFXAlWC2PpJ9fQ2AeX2Rdmhl5ILO3ME38W5LlBcdWm10Qr1H3frEEp8yTAA9msUpvpDGxz0keypU2Yr6qNdrFq5yyl2wMXDsq4glmEgfRjM4iCcI8N4TemFKYOWJB1jXDFOTcYtCSi0Uv2DAdSmBucEXMieNpxugcJ15ixgtN0i5iX5M0ohnn26xbBDAiHYOI+iIjjPL64bklFG6pVkeao+K0xEn68iZeuhMdTxpJ10QEQUUqb5JV6iIzfu5cORrIjmXgPEB4xHs5Sr0K85c1RmoV5R4DkA48oTlzFcpXlr0ak5c1Q1CbAgID3w+tFxIVy6IlXhU6se443R2CICSXBzj5zH+dx97Ds1AcZi1GsqjeiJG71YqMj3uw4/+T6sQfghJc/C4/wm/Kv2fOGIozCIiPDHD6ouVCrNSrDjXti4rDWUEM5uZ6jMVnAflBP9sJaNL5YcQ5eEOsDBTkW6I2fImIomYMq9apK6mtecT/2oGpTcrb2PbrH6hoS11LUF0VcMleI12wc6gnmDlnEkkYXei2DTsy637bcwqg4FtuLu4FVgkOKQhLxz8fri9Wk27L22Ct4q2xbUzYVkI0IC3zDoQCq8os4xkMmUucQxKPHUQEM/CIyVjiosUq6sqGzRozMPvRk4PSGYeUaTs9FFCWlW/G9OUp1dzgyEyB45WaYa/UlOocvl8nn/ADHlIGekcARAdNMw6BtTNnJadYQ+UPwjFEqgVzkQ1HhgNQjJ6tcpWpBQDiGoCMXHGI7Cz5hIYJBRmzPTXcYn1ssX1YbcaF4rcXNrG0kLsWuP2tSH2BLrJPbhdQKjL7yT5hw1Dtio4bNtC0tiGGxQcTPejxmc9Z0OJ3Nap1oQTUw9KEsgDNjXASh8IYqhayol2hP3dOSm/ZlLc9Fq72AdIiJ8QzjPHhGZILadLwt/18QTDQlHAvghNwrIG49YGOeA5/3QDSMjnEkR+b3ymXJ9wtmMh2iEnt7lyXacvDm8nxiNSsNA8uTTF6WC+8/JAOcbVWRshL92gsWYcx4qkMFmWuPul5K57VPTwyA4+IB8Ii9b221uLWroLO0OqTDuKXvo2sQ/4YnjA8ChrTTzja/tI3IuGR2RSJZQSkG3hW4RrcSaOhfyejf1VDTOy7+rxmxY9swi0iqttjRBll1rlYa1dqy57bvCdSmykPQw1bSMgsBFns8mRE+Af2rICERNVrUWCK0y5oo+FNfNmhyBM6n9QY+MNM73DPVM1wlmEAmERHGnZDOnD000wiMwhMOuQHEdXiEczaEb1OU+Tvhhnpe2IV4VigwKtQnf/IS1TmaxqBijRLk0IJhHOTihv2fhEjrcWvZiqaoSmadvDco/xfaERlHyjVjQUxl4VzAahnI8YeNkr9ShV1rD5DiPY2RjZToGFCk9QOcDekRKOyMdiTbZ+0Ub7Gva3Zrs+nIbxcTPQjrpFUykFRP9Yt4fGNcu2Bs2LzLPKO0G2HGZuTbl/rpg4rrORlcDRUTMwzbqd79RwPYAeMWhAfSySQRRq52YSps1v2MZiX2z3eAnQWFVjPigVdjDe5XcX4jnv0cfLx4tAOmVNuziRz9hSFWhn+uMev3DUWm0fr+MOKmVho+qHlpnPKHC2kLBm9ni61ZsFTvW7IcBX2mt25OIqqbN9EfEOHwjBCBYZw465x2RK41faESOEB2sM20U6DmGfJn8b8dsPxbesG+f4/v4ww6Z/G/HbDysL/G+f3RLUvEjQH9GG4Gw5z19EiI8PGNk1qznzlQ8fGNTth1LFEjzz9UbOLYHPUHKGM6xnO6meomCDEF9s9RLHoOZOltpbYIDuyLRsCwA5+yzBSEsftGExjbH24TH59tON5HH+hk0luEQ/wDcCNS9dyLQSiIH6+cCP0xjHai+qiIgJueKfeyVqRXE1UN89PzHKri3y1prGeb5a4fcNs6jtI7QSoNcXBtnvGYA4ylCPUH2YjH61/qucuDan2gVXuIO2NVYKZwQD92m1AOYxmrVSy6uY6B2oYnl3jo/Jq9ER+qB2V4R8mpsTZlhT0zVr9w+DPo07cjNNmWlPjE71LaKtLQrDvDyvc9/9uu03mMVM7StqqYVxTrbOE3XEdJz7pmml+oIzm3uztbNYGkJ4goVP9E8Ev8A8MZycYzPaVeWkkt1KGUQ4nSspybl/Oi54GwLvnW9ToPUUS/Iof78BcNv6KbpmSZzyCZS+amsr+QYtOv+qnJppEGxzXrzmQ1lqCbOj9cZZRf+0AdogKTbFlpeupqm30sJh8xAAhvHdeZ7ItEZUasmpQBp7kny0+XeIxGlfvTcxVqYPOpRrB2DVEA5ww3JIW/ZDrUz1FnKnoFTIT6scQxv4u2LcNkfvXqxvPSqRf46qjZCqXIvSWJUQXrqNRCLFP1Un0TSiHl8r7Ya1XvQ2KQVpHNd14uARm0KIpLq0iPxEA+qNc1U8cM1Q9eZrVMjgelOMIwmmmmDpTTDniIzCIxWX/jDEsVKs4KFImbvHNU9fq5hHi3pHsq4QEYml61an/IThUNpRnFK9aZEYZhdMDoBx0LZpQmH/dDARixza9uIFMCqKSRWyWHknJ4SD98RG6U3bHmGSQ003keuLVzVL1CEL9wbnGkW8lq4baYnqbv3B1l+8FxXT6wFh1qZvPERqD8qG4rVZqo5HAD46jHwJQDlnx1g54DAaZyAaxGncnNSiv61eKLeuapvvERcyLqQW1zxQyineMataj1BCeCPjblgFkoFEEJ4I916vnH2CFEEL6VCnnhzCHCPilHi28oEPNMoYriGQx3xkxFAOmOACIgPZmMsQk8rNXoZp54RIluoyfJno0ADhzjQNs2EwaUJWlRP7LsL3VOaJmXyFDNI1uFMwIVpsjKA8Ma+USRYtklhYMUCiGlGlIxUHEsnAZvKJEWUYjeci4XKq9CsZogOgetwOnlD+uh8rzFTgINKoVQywjrISKhII+fGNC2zZTRWO5YkT4o08hOP664U+0b40Sfow2mWLNckosaqJPIXeP8AWbCn2hum5s4NxuJ1Neus7iqJQ3vRBKExOr49/RDGPMYcuS/ZJhEDSDs/tSg2BDJMy8jh0TruOyiORAB0CUBxwlAQiOqL65yGPXK5kwanEdc1AAB+qHhT0VOJkgnoUAlmzjIjmJvbzZORX2eBJRslTt8av115qfNgNG2u0YN2h/cQ3KyTLxq8bk/95hzfMMEX6imonazkeKuaUVQ0PS3s5MM80w9ojDeO25FcCISjV6mRSo9A0qBmbPYGmo+EUFM5XVyqirn5/X108Pdi46E5eeBk4/XET1RROOhVqzrdec5MPEZh6IxHLlmzRB0Whsxqn7WPP84zjpH0pv4ts4a2yQyNVeupjVrn/tK9dfmxGcgvb2YnItSgNCUBHKlkQPng7PPsCJ5Wqsqy7PMsve/aQJqhkorCAW4tCTyQcNzDGQ1zjO7B3RkHo37N2/f90KFV3Iki1RTCHXBcgan6RCevx6U8mMiHdkOESb2QzVa8r22k9pe483tJcayTVq17cUDmrWQZpuIykOA8R/jRC5VzWHhnUytTPSvAXuCqZRy7tKy071XPncV3iFLzEJ8lKi3va6hPZRbiTtD7TBJKde0Yrpm47PezgS/gZY9O/pZr+0xz03nvbcW+j/W7i3IXzThcSuazPUn1xngAB3dsVLt3Ufl4LhLztuG4TjjXjBmb1hw5NmYcDjAB5Q1KvKAUdOcVNJqruIpedNXwlPjN3xiyUknky7K/eULtFes3nFsNmwGYAojgPrCEmsw94xXj6SAN6pDjniIBQzl+7JVY/EYNNa4D4UpUyOK5jIzD2a4hzmGx3RdFwEkhLpFSdA6alKgZPm+r0EnnmZn5B+MQ3yZRkUj5eQ1meXsDSHGuU4lZOCRokDUxNALnBGmRoB0ZAHIaiPbrBBHiEFAOHilDcnN8lKpFwodU3nUrXmw+TEPsZGN3aR37rnTJ2aB6Fh8W4sIYlKWeVEm5L3pSjNVuEZRa5Ii1DUswS/MklYc185H5c8uvIBDhEpwuZxOxYMrzsVFNcWjs3SNKp88J4/PjtmEc/wDOMeIzCA54jpx17IrHhyACMV1LyshcMSpczg+QifCiXxdBwXfqOl6NiFoUnmp8wSQQohPEeV6HmoAhci5OpXrUyZCjXNmTM2Cxcr8oZhHgHbHSz6OH0Eqg90ojtG7da3QtPZJKKdclrezz7i9nnKGoSyh/FDu1Hv5RL7/B0tgvZyuOiOe/j4bB1yP9tCIoU6oaomUdNHtplho8e8ZhiFnpzttHaGWbzz7Povesl2pLoQDI2UWh1dRmzNgQGYJhH4Yh7Yw5X9Uli0KU1N5MvPkJ+IdVUqQ5UnS++Y4dH0hXpkqLcSi+yL6PVETGLbNulepDTkQyPRqV8DgZaemMhzHgH1RotIUWXaA77fXd3a6N1DhrfizSPH+sE8kYDSbr7XIiOfoAI/VmLUsy/k0tygrzVES606k/16mqGsGjlMchpRmH6Aaj2j3xFsDJhQMTmjlWetWmDWaYeHhFjPY5K3nqJEN94rvI5vFIk9XrOp8daUoHB2g1t5uQxiZ3BykMXuEx+KvXX5hntxrkvS7LiMOh7KplUOmq4iM0wj7oGmkoRg8oDnIcouFIA9UOmOPCF9MvSmrUZRl0EO2JYytejetFqLmOsrxGNziHqLqPlsVRlrNZ4OatXNKRsE1FTPfVNTnDpBKGdBx28cBHi4D99phot5BKClsxJmwlpfS/OxDIAZMjnExgQxr8O9bdZROJdYs2iNeagj0aADTKSj8kBHURzDQZHGOUN0++MVVS20ubNTBY37T0P7P4uuok8wYsGQ0Ez5q/CG7/AOVKfaCCE8KIjoiY9dObt+qK0IZB18YXQ4s1TKmwMECCCCDwgQQQQQEPVYdcj3CPxhxLa2+Wrv3JYdrG/L0l5+uxPaiSA6BLXPmpaco/EQhupuI92gRuC9Bc0EN4ekOt0K8WmOA1GytOdGlGfoy0DlFLnkp1B01wAjppxGG1wtti1Io3A5VIU3yA6OaUXfot615huX9JM6kGzlq2dYdnkShRBZDXIMcoTI/5njmid6xrWz28I27+lFcSsdukXJmDIz0KZs8EsuMRpFdFeoImMiA68wi9LW54TXU6zmMNCIO62/YZStvhTGNUNcsGvX1BEe3MYearTZ9RLkZg49sZDXERyI9n3wnalCmZcFEKwdIOn90VHfSztxJtYxufJVwplqbzDPKeLx5Whg4DfImiZE1SKZExQmopJcJeI164jkA8cTQqd56kTMUi9CYBT2nR3QvNzO16w5EfMcj4SwoZZmuMydVGpMM4SnFMBz/22Jvlf+UIbJ5BgukiAiAmgGpWwP0h6WPvhguR+lF2sWRQJzJpkyl+TCv40+oTldSrKEJRLtfhhX8afUG3q/Kn7xEYpY+ViXt0zFaKhSUJzEgTa5EPszGQ0yHdrlKau8cwjNeagzIpQq0SwJVGgMx1aGh3DgByAAHeI/XGRrgliauTTSfS9Q3KHvc4jpMYyPS+vEXG38oGVxaP1czGU0lvBWbOAkm7RCG2qVJ9xPT9IelObxMPhF6lK2hkTGbE3a1OWlPMVmXNWn94fnr8QJUpVJglWnbMPJMKpirUrCGojkR8YcxCTfWgHbz7IwhMDh8fsCHxalCn64Pk840Foog0I6BK7PXOc4EhGtJGXKkbmoHOajcyOeYa5jcvsObOtU+spThWC+NeHII1qWuTSZxZTJK9IJpd6DQBxmOorZlIEG7a5Tc6WTL0FJtMmmsI0oydIqTryFPkzBJ92Ynd6uqxUERFvTjF/wB9PqWtb7aHYl51+Iw1memY20C9s7epWw1aJUGZccCURXNoJxEToj0xABEmgeEugj3eMcyXqeHDXvGMpd7rcFwng4H48VMwuuh2LppXXlM5N06p8xV+XPPN4jMP1Ri46zY5Zx4REbZiUUkF3VK9FjkSL3CkGaZR3VRYrclMCJ7paeag8x6Crnhj4DHmPFLj5hEir45MAj3BHirx8xj3HmtwVOEPfTHsCPEEVB/7P8dkED5xrTrFSCE8KIQIKbMCCCCEPobgPQWMOm+PSQWwUZsiUt+iK1xDQ8gAoT4f+eOhbb8cnza6jGI07/4OMQLnNri7JyvKM1cpY00NCbOkvS6AD9gRse2+TVaRtLnRmD4eMQNBtRa4mdK/DrGqb6J+YTa30qa2Lx7an4jn5eBz16lX4Q0qzpn8dsOG5fzofD74bRYmHTvDMaOka9KNqTqtUY/Cnt1DC1it+Px5Q2StVyOO76ocFf5+f3Q26l/GhlGY77VrrTjHTYU6GcZz2hqMSXsns20HYgz3XusdMN62ZU30SZaXIOB9mOZQl38NfHHbGI2RZqG/b9MBmuWjWOIKq4KBY6UlrerGrIOMhnHdErdoN2KyrcJwt6WYulN9mdNBbqIjUdwTSBanjoyBTARzx1HMQUrYk/LqN3vvZvXGpO+bm56/EGqyLVYTTw757zpE7Hn6g0FxLiSSJ5VDRCKc2G4nTDMWb6NMMxAZhHM0wjxER149sRiUXUfCQc1hGTOgZjJ3RWqT1a4zD2w1Ktwl8YcJV3VtEGo0pkyl8g5X1OuqvqpNtxFPhL5gsovpeT6+8EDxgt4CIgPmEZCbfSM8KFAm8yoBME36TJjip26dsNkZqTSTzBKOAm46RaKkkozAAhpMIiPfrFAzdzzrZRRBY5Vm1d0ySpc5K/MIY0nJJBHUVWMdM/EQ3OWvzC5uRqVUYQMFagGk0yGSpoP4wBGHRnbbMVqpqsRnnGYvUHozSjxHzjHVMrRLVq8tKUQDPMcxSt2WtErsUrot4mpQVqalUjc+UxfKStPJ8o4UOalBZ5QyIB26cMxlyOpVUUxSM0RwOc55Ri5OUPWgHIM+esKawj6wP9KGyyHqsAnWbbePoYuWvmHFauJ8B0XbH+0HYzaks+U2NtskqBlFMGh9grkTSyzvFgGBDolTCGZmyAmBARlmlmAZZgEQEBARCNc+1v6MXaJ2WnOoFSyIF37cjKKg3LoW+JTqKUvkAEBlNViYZNlc8wqBgMfS10hs2FdQTp6BkkYmL1g1CeTiEb4iN6rmvrYcrvFXdaiUdDGH97a4jz9WqBHuCeXP3RoO87Lt66SspFZHVmdGKWhi8Zc32VD4RdOQbJFOXBXMUpjecc5ZsicI1qpY3QmL16A9GaWYNQEOUW8RHSWbQA498bibX3nXb7Oanbe9jXt5dJMMpZ4aThdLMLA+SH+rrJb1JmT/AIhiCe1fbBr2mu642e0ZVCmiJ5nBaioHN9rSeM/RAR84oe/9FitkUOuVzRUhTYYYVpUcFWtUeqvMIvwQQRUIGDiI75NkS4JinTBZRgmyBMzMMsso9sohqEXQDTCNz9IAWEbIa8D4fDQYawByM3doGI8gIgOOWcaxYbHSHcLBkmzc0TcJl4NcXOYvyVH1Q+avSc4eRrN8o8lhObiAfMHFpVUwIpRMwT+Sc6Wga64z2Q5Ky3y9tjCmzVIuMjhSjgklXI5CWvKOoB4ZxEcU0yYTFAqeI16pc2VOdOhWkmxPTENQEB7dImrc2qLwRGS91eSmDjcaHVPrB4nJugnKtOuoU5ZxlDn0ZJc+EaQ0R3MrPa1xVqmm9SrhQxamy5TeTDHrDtFtEis3DhEhaKE8vxfmGXRydX19H93EqHIR0xGQVd4IGymmggGR44i3oAjvHq9Oj9cZ3QpyTzlQmDgYz9kafaJU1Xt8QfYGHoux1jc+Q+br+oTVRzyOk7ClzzNwDE4Fyt1UVaZ7cABJCvHRpzBUzgOHQ6eRxwzESSG3ntKF6tYojOouRQ5ZZiKO1CaEU9nmpQyGAS5MfI58xjNtodUO0tnazyHJWmBNVXSqLB8vyMGJKKdSlnmH/RGImMxMJm1CjLWpAITTagA4zw/bFMXGzlbkuskbHvDNkUSEqapOI5jeXH4h83a6dp3CSORPhTm5xOPZ5vQ1jt0EBz3KtYLyPGVUJp5evJ5N/MiOAEZR0498byfSZNuiktxKT0ahuiW3maQ3Mn/tCNLTOaCFUrsj1ZUSs9VdIdOoVm9VUHzwMb1/SJSymk1V9cHSwlkO79UiST0SpHPooztTWONYTf8AqE8mo13Fz0IeQX1rjWcfth9w5Un5RqlzdbtARyMM5WH6Ij/OzEhbm0ZA1wOQ55iP53/GTdw/sjvdR1Nd1irNIrArO4XCJa8w8poD8kO/SH7Z6aUTCnWx0B+UGSoAPEecMoj05RP9AQ+SEw4CHsVK9SapITGb9wpCEskoaYDIQ42gl+rR82ORFoupJqFzVTpiWnpecZqmrNY8ZqVscByOsOsjrFagdImPXiGOOusMahAHHAZAOYeMOQnDnP45RNiuVKq40Gp7QfOFY3F0bNnGxG5KJS2kNlNxTGP4Y2c/fu0DeupYx+mUryHAh3gEax0Sr61PoAA8o2m7EnvjuWkKv8pLUmwfpGyoaSTyxq1TZQoUzFOnpLTNVpZO0AyAQ1RlKou3KVPbqEOjG6bO83jQtOYOET5ecPA0f8dRhpU3iP45hDqsn9J0PEIm6PWLs/ow2WWH/wAcR8QjZ7bet+7UMxq1sP8AnZfyjZZbb6NGKOur/bBfk/IZB0m/7Wp8g//Z"
\ No newline at end of file
@@ -1,7 +1,49 @@
 import streamlit as st
 import time
 import hashlib
-import login_assets
+import json
+import os
+from functools import lru_cache
+
+# ========== LOGIN IMAGERY ==========
+# Background images are static files built by generate_assets.py and served
+# by Streamlit (server.enableStaticServing) from static/login/. The page only
+# carries their URLs; the browser caches the images and revalidates them by
+# ETag instead of receiving ~500 KB of base64 CSS on every rerun.
+STATIC_URL = "app/static/"
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "login", "manifest.json")
+
+
+@lru_cache(maxsize=1)
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}        # run `python generate_assets.py`; the page falls back to plain colours
+
+
+def _image_set(variant):
+    webp = STATIC_URL + variant["webp"]
+    jpeg = STATIC_URL + variant["jpeg"]
+    return (
+        f'background-image: url("{jpeg}");'
+        f' background-image: image-set(url("{webp}") type("image/webp"), url("{jpeg}") type("image/jpeg"));'
+    )
+
+
+@lru_cache(maxsize=None)
+def background_css(selector, name):
+    """CSS rules giving `selector` the smallest variant of `name` that covers the viewport width."""
+    variants = load_manifest().get(name)
+    if not variants:
+        return ""
+    rules = [f"{selector} {{ {_image_set(variants[0])} }}"]
+    for smaller, variant in zip(variants, variants[1:]):
+        rules.append(
+            f"@media (min-width: {smaller['width'] + 1}px) {{ {selector} {{ {_image_set(variant)} }} }}"
+        )
+    return "\n        ".join(rules)
 
 # ========== LOGIN SYSTEM ==========
 # Initialize session state for login
@@ -39,8 +81,10 @@ def login_page():
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;600;800&display=swap');
         
         /* Global Styles */
+        {background_css(".stApp", "login_bg")}
+        {background_css(".block-container", "login_container")}
         .stApp {{
-            background-image: url("{login_assets.LOGIN_BG_B64}");
+            background-color: #0b2a30;
             background-size: cover;
             background-position: center;
             background-repeat: no-repeat;
@@ -56,7 +100,7 @@ def login_page():
         .block-container {{
             padding: 4rem 3rem !important;
             max-width: 1200px;
-            background-image: url("{login_assets.CONTAINER_BG_B64}");
+            background-color: #12323a;
             background-size: cover;
             background-position: center;
             border-radius: 30px;
@@ -0,0 +1,268 @@
+import csv
+import os
+import threading
+import time
+from bisect import bisect_right
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+# Camera loop stages, in pipeline order
+STAGES = (
+    "read", "preprocess", "process",                            # capture / inference threads
+    "draw_landmarks", "filter", "reflex_point", "reps",         # render loop
+    "encode", "image",                                          # display publisher
+    "record", "video_encode",                                   # session recorder (loop side, writer)
+    "press_to_hold", "release_to_ding",                         # motion → cue audio start (latency.py)
+)
+_STAGE_INDEX = {name: i for i, name in enumerate(STAGES)}
+
+# Log-spaced bucket upper edges: 0.1 ms … ~2 s, three buckets per doubling
+EDGES = [1e-4 * 2 ** (i / 3) for i in range(44)]
+_MIDPOINTS = np.array([EDGES[0] / 2] + [(a * b) ** 0.5 for a, b in zip(EDGES, EDGES[1:])] + [EDGES[-1]])
+
+
+# ========== STAGE LATENCY HISTOGRAMS ==========
+class StageMetrics:
+    """
+    perf_counter spans of one camera loop, binned into preallocated
+    histograms (one row per stage, fixed log-spaced buckets).
+
+    record() is a bisect and two array increments, cheap enough for every
+    frame. Each stage is only ever recorded from one thread, so no lock is
+    taken; readers work on snapshot() copies and tolerate a frame of skew.
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.counts = np.zeros((len(STAGES), len(EDGES) + 1), dtype=np.int64)
+        self.totals = np.zeros(len(STAGES))
+        self.frames = 0
+        self.dropped = 0
+
+    def record(self, stage, seconds):
+        i = _STAGE_INDEX[stage]
+        self.counts[i, bisect_right(EDGES, seconds)] += 1
+        self.totals[i] += seconds
+
+    @contextmanager
+    def span(self, stage):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - t0)
+
+    def frame(self):
+        """Count one frame through the render loop (for FPS)."""
+        self.frames += 1
+
+    def snapshot(self):
+        return {
+            "time": time.monotonic(),
+            "counts": self.counts.copy(),
+            "totals": self.totals.copy(),
+            "frames": self.frames,
+            "dropped": self.dropped,
+        }
+
+
+class _NullMetrics:
+    """Stand-in when a loop is not instrumented."""
+
+    label = None
+    frames = dropped = 0
+
+    def record(self, stage, seconds):
+        pass
+
+    @contextmanager
+    def span(self, stage):
+        yield
+
+    def frame(self):
+        pass
+
+
+NULL_METRICS = _NullMetrics()
+
+
+def summarize(current, previous=None):
+    """
+    FPS, dropped frames and per-stage p50/p95 (ms) between two snapshots
+    (or since the start when `previous` is None).
+    """
+    counts = current["counts"]
+    frames = current["frames"]
+    dropped = current["dropped"]
+    fps = None
+    if previous is not None:
+        counts = counts - previous["counts"]
+        frames -= previous["frames"]
+        dropped -= previous["dropped"]
+        elapsed = current["time"] - previous["time"]
+        fps = frames / elapsed if elapsed > 0 else None
+
+    stages = {}
+    for name, row in zip(STAGES, counts):
+        n = int(row.sum())
+        if n == 0:
+            continue
+        cum = np.cumsum(row)
+        p50, p95 = (_MIDPOINTS[np.searchsorted(cum, q * n)] for q in (0.5, 0.95))
+        stages[name] = {"count": n, "p50_ms": p50 * 1000, "p95_ms": p95 * 1000}
+    return {"fps": fps, "frames": frames, "dropped": dropped, "stages": stages}
+
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def get_metrics(label):
+    """The StageMetrics for a camera loop (a session or a station), created on first use."""
+    with _registry_lock:
+        if label not in _registry:
+            _registry[label] = StageMetrics(label)
+        return _registry[label]
+
+
+def drop_metrics(label):
+    with _registry_lock:
+        _registry.pop(label, None)
+
+
+def all_metrics():
+    with _registry_lock:
+        return list(_registry.values())
+
+
+# ========== EXPORT ==========
+def prometheus_text():
+    """Every registered loop as Prometheus histograms (cumulative since start)."""
+    lines = [
+        "# TYPE neurorehab_stage_seconds histogram",
+        "# TYPE neurorehab_frames_total counter",
+        "# TYPE neurorehab_dropped_frames_total counter",
+    ]
+    for metrics in all_metrics():
+        snap = metrics.snapshot()
+        label = metrics.label.replace('"', "")
+        lines.append(f'neurorehab_frames_total{{loop="{label}"}} {snap["frames"]}')
+        lines.append(f'neurorehab_dropped_frames_total{{loop="{label}"}} {snap["dropped"]}')
+        for name, row, total in zip(STAGES, snap["counts"], snap["totals"]):
+            n = int(row.sum())
+            if n == 0:
+                continue
+            cum = np.cumsum(row)
+            for edge, c in zip(EDGES, cum):
+                lines.append(f'neurorehab_stage_seconds_bucket{{loop="{label}",stage="{name}",le="{edge:.6g}"}} {c}')
+            lines.append(f'neurorehab_stage_seconds_bucket{{loop="{label}",stage="{name}",le="+Inf"}} {n}')
+            lines.append(f'neurorehab_stage_seconds_sum{{loop="{label}",stage="{name}"}} {total:.6f}')
+            lines.append(f'neurorehab_stage_seconds_count{{loop="{label}",stage="{name}"}} {n}')
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") not in ("", "/metrics"):
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class CsvExporter:
+    """
+    Appends one row per loop every `interval` seconds (FPS, dropped frames,
+    p50/p95 per stage over that interval) to a CSV file, rotating it to
+    .1 … .<backups> when it grows past `max_bytes`.
+    """
+
+    def __init__(self, path, interval=10.0, max_bytes=5_000_000, backups=3):
+        self.path = path
+        self.interval = interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._previous = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True, name="metrics-csv")
+
+    @staticmethod
+    def header():
+        columns = ["wall_time", "loop", "fps", "frames", "dropped"]
+        for name in STAGES:
+            columns += [f"{name}_p50_ms", f"{name}_p95_ms"]
+        return columns
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.write_rows()
+
+    def write_rows(self):
+        rows = []
+        for metrics in all_metrics():
+            snap = metrics.snapshot()
+            previous = self._previous.get(metrics.label)
+            self._previous[metrics.label] = snap
+            if previous is None:
+                continue
+            summary = summarize(snap, previous)
+            row = [f"{time.time():.3f}", metrics.label, f"{summary['fps']:.2f}", summary["frames"], summary["dropped"]]
+            for name in STAGES:
+                stage = summary["stages"].get(name)
+                row += [f"{stage['p50_ms']:.3f}", f"{stage['p95_ms']:.3f}"] if stage else ["", ""]
+            rows.append(row)
+        if not rows:
+            return
+        self._rotate()
+        new_file = not os.path.exists(self.path)
+        with open(self.path, "a", newline="") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(self.header())
+            writer.writerows(rows)
+
+    def _rotate(self):
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < self.max_bytes:
+            return
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+
+
+_exporters_started = False
+
+
+def start_exporters(port=None, csv_path=None, interval=10.0):
+    """
+    Start the process-wide exporters once: a /metrics HTTP endpoint on
+    127.0.0.1:`port` and/or a rotating CSV at `csv_path`.
+    """
+    global _exporters_started
+    with _registry_lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+    if port:
+        server = ThreadingHTTPServer(("127.0.0.1", int(port)), _MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True, name="metrics-http").start()
+    if csv_path:
+        CsvExporter(csv_path, interval=interval).start()
@@ -0,0 +1,156 @@
+import atexit
+import threading
+from collections import defaultdict
+
+import mediapipe as mp
+import numpy as np
+
+DEFAULT_HANDS_PARAMS = dict(
+    max_num_hands=2,
+    min_detection_confidence=0.88,
+    min_tracking_confidence=0.88,
+    model_complexity=1,
+)
+
+
+# ========== PROCESS-LEVEL HANDS CACHE ==========
+# Building a mp.solutions.hands.Hands graph (and its first inference) is
+# the slowest part of pressing "Start Camera". Graphs are kept in a pool
+# keyed by their parameters, warmed once, and leased to one camera loop at
+# a time (a graph carries per-stream tracking state and is not thread-safe).
+
+_idle = defaultdict(list)          # params key → idle, warmed Hands instances
+_keys = {}                         # id(hands) → (params key, hands), for every instance built
+_warming = set()
+_warm_requested = set()            # params keys warm_hands_async() was called for
+_lock = threading.Lock()
+
+
+def _key(params):
+    merged = dict(DEFAULT_HANDS_PARAMS, **params)
+    return tuple(sorted(merged.items()))
+
+
+def _build(key):
+    hands = mp.solutions.hands.Hands(**dict(key))
+    # Dummy inference so model loading / graph init happen now, not on the first camera frame
+    hands.process(np.zeros((256, 256, 3), dtype=np.uint8))
+    with _lock:
+        _keys[id(hands)] = (key, hands)
+    return hands
+
+
+def acquire_hands(**params):
+    """Lease a warmed Hands graph. Give it back with release_hands(), don't close() it."""
+    key = _key(params)
+    with _lock:
+        if _idle[key]:
+            return _idle[key].pop()
+    return _build(key)
+
+
+def release_hands(hands):
+    with _lock:
+        key, _ = _keys[id(hands)]
+        _idle[key].append(hands)
+
+
+def warm_hands(**params):
+    """Make sure one warmed graph with these parameters is waiting in the pool."""
+    key = _key(params)
+    with _lock:
+        if _idle[key] or key in _warming:
+            return
+        _warming.add(key)
+    try:
+        hands = _build(key)
+        release_hands(hands)
+    finally:
+        with _lock:
+            _warming.discard(key)
+
+
+def warm_hands_async(**params):
+    """
+    warm_hands() on a background thread, once per process for each set of
+    parameters: app.py calls this on every rerun, and a warm graph that a
+    session has since leased must not be rebuilt each time.
+    """
+    key = _key(params)
+    with _lock:
+        if key in _warm_requested:
+            return
+        _warm_requested.add(key)
+    threading.Thread(target=warm_hands, kwargs=params, daemon=True).start()
+
+
+class HandsLease:
+    """
+    The pooled graph one pipeline runs on. switch() moves the pipeline to a
+    graph with another model_complexity (for the quality governor): the new
+    graph is leased in the background, swapped in between frames, and the
+    old one goes back to the pool. `wrap` builds the provider around a
+    graph, e.g. ROITracker.
+
+    Every graph the lease took and has not returned is in `_held` until
+    the pipeline lets go of it. release() (after the pipeline stopped)
+    returns all of them, including a swapped-in graph the stopped pipeline
+    never picked up; a swap that finishes after release() returns its new
+    graph at once.
+    """
+
+    def __init__(self, wrap=None, **params):
+        self.wrap = wrap
+        self.params = dict(DEFAULT_HANDS_PARAMS, **params)
+        self.hands = acquire_hands(**self.params)
+        self._held = [self.hands]
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def provider(self):
+        return self.wrap(self.hands) if self.wrap is not None else self.hands
+
+    def switch(self, pipeline, model_complexity):
+        with self._lock:
+            if self.params["model_complexity"] == model_complexity:
+                return
+            self.params = dict(self.params, model_complexity=model_complexity)
+        threading.Thread(target=self._swap, args=(pipeline, dict(self.params)), daemon=True).start()
+
+    def _swap(self, pipeline, params):
+        hands = acquire_hands(**params)
+        with self._lock:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                old, self.hands = self.hands, hands
+                self._held.append(hands)
+        if closed:
+            release_hands(hands)        # session ended while the graph was being built
+            return
+        pipeline.replace_provider(self.provider(), on_replaced=lambda _: self._give_back(old))
+
+    def _give_back(self, hands):
+        with self._lock:
+            if hands not in self._held:
+                return                  # already returned by release()
+            self._held.remove(hands)
+        release_hands(hands)
+
+    def release(self):
+        """Return every graph of this lease; the pipeline must be stopped."""
+        with self._lock:
+            self._closed = True
+            held, self._held = self._held, []
+        for hands in held:
+            release_hands(hands)
+
+
+@atexit.register
+def _close_all():
+    with _lock:
+        for _, hands in _keys.values():
+            hands.close()
+        _keys.clear()
+        _idle.clear()
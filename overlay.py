@@ -0,0 +1,80 @@
+import cv2
+import numpy as np
+
+from reflex_points import draw_pulse
+
+# Overlay quality levels, most to least drawing work
+QUALITY_FULL = "full"               # both hand skeletons + reflex point
+QUALITY_FINGERTIPS = "fingertips"   # fingertip dots + reflex point
+QUALITY_REFLEX = "reflex"           # reflex point only
+QUALITY_LEVELS = (QUALITY_FULL, QUALITY_FINGERTIPS, QUALITY_REFLEX)
+
+# MediaPipe's 21 HAND_CONNECTIONS, as five finger chains and the palm's knuckle line
+HAND_CHAINS = (
+    (0, 1, 2, 3, 4),
+    (0, 5, 6, 7, 8),
+    (9, 10, 11, 12),
+    (13, 14, 15, 16),
+    (0, 17, 18, 19, 20),
+    (5, 9, 13, 17),
+)
+FINGERTIPS = (4, 8, 12, 16, 20)
+
+# Same look as mp.solutions.drawing_utils defaults
+CONNECTION_COLOR = (224, 224, 224)
+LANDMARK_COLOR = (0, 0, 255)
+BORDER_COLOR = (255, 255, 255)
+
+
+# ========== BATCHED OVERLAY RENDERER ==========
+class OverlayRenderer:
+    """
+    Draws the hand skeletons and the reflex point from landmark arrays.
+
+    Instead of walking landmark protobufs and drawing every connection and
+    landmark on its own (mp_draw.draw_landmarks), all skeleton lines of all
+    hands go out in one cv2.polylines call and all landmark dots in two more
+    (a zero-length segment with a thick pen is a filled dot). The pulse is
+    a function of the frame time, so the renderer keeps no animation state.
+
+    `quality` trades detail for speed on weak hardware (QUALITY_LEVELS).
+    """
+
+    def __init__(self, quality=QUALITY_FULL, thickness=2, dot_radius=2):
+        self.quality = quality
+        self.thickness = thickness
+        self.dot_radius = dot_radius
+        self._px = None
+        self._dots = None
+
+    def draw_hands(self, img, hands):
+        """hands: (N, 21, 2) normalized (x, y) landmarks, e.g. the HandPairFilter output."""
+        if self.quality == QUALITY_REFLEX:
+            return
+        h, w = img.shape[:2]
+        if self._px is None or self._px.shape != hands.shape:
+            self._px = np.empty(hands.shape, dtype=np.int32)
+        np.multiply(hands, (w, h), out=self._px, casting="unsafe")
+
+        if self.quality == QUALITY_FULL:
+            lines = [hand[list(chain)] for hand in self._px for chain in HAND_CHAINS]
+            cv2.polylines(img, lines, False, CONNECTION_COLOR, self.thickness)
+            dots = self._px.reshape(-1, 2)
+        else:
+            dots = self._px[:, FINGERTIPS].reshape(-1, 2)
+        self._draw_dots(img, dots)
+
+    def _draw_dots(self, img, dots):
+        n = len(dots)
+        if self._dots is None or len(self._dots) != n:
+            self._dots = np.empty((n, 2, 2), dtype=np.int32)
+        self._dots[:, 0] = dots
+        self._dots[:, 1] = dots
+        r = self.dot_radius
+        cv2.polylines(img, self._dots, False, BORDER_COLOR, 2 * max(r + 1, int(r * 1.2)))
+        cv2.polylines(img, self._dots, False, LANDMARK_COLOR, 2 * r)
+
+    def draw_reflex(self, img, point, t):
+        """The pulsing ring around the reflex point at frame time `t`."""
+        if point is not None:
+            draw_pulse(img, point, t)
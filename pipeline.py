@@ -0,0 +1,318 @@
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from landmarks import as_provider, wait_idle
+from metrics import NULL_METRICS
+
+log = logging.getLogger("neurorehab")
+
+
+# ========== LATEST-FRAME-WINS QUEUE ==========
+class LatestQueue:
+    """
+    Bounded hand-off between pipeline stages.
+    When full, put() drops the oldest item instead of blocking, so a slow
+    consumer always sees the freshest frame and never falls behind.
+    """
+
+    def __init__(self, maxsize=1, on_drop=None):
+        self._items = deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+        self._closed = False
+        self.on_drop = on_drop      # called with each item that gets replaced
+        self.dropped = 0
+
+    def put(self, item):
+        old = None
+        with self._cond:
+            if self._closed:
+                return
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+                old = self._items[0]
+            self._items.append(item)
+            self._cond.notify()
+        if old is not None and self.on_drop is not None:
+            self.on_drop(old)
+
+    def get(self, timeout=None):
+        """Return the next item, or None once the queue is closed and drained."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._items or self._closed, timeout):
+                return None
+            if self._items:
+                return self._items.popleft()
+            return None
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self):
+        return self._closed
+
+
+# ========== REUSABLE FRAME BUFFERS ==========
+class FramePool:
+    """
+    Free list of same-shaped frame buffers shared between pipeline stages.
+
+    A stage acquire()s a buffer, fills it with a dst= write and hands it on;
+    whoever consumes it last release()s it. Buffers never come back while
+    still in use, so nothing is overwritten under a slow consumer: if the
+    pool runs dry a new buffer is allocated (counted in `allocated`) and
+    kept afterwards, up to `max_free` idle buffers.
+    """
+
+    def __init__(self, max_free=4):
+        self.max_free = max_free
+        self.allocated = 0
+        self._free = []
+        self._lock = threading.Lock()
+
+    def acquire(self, shape, dtype=np.uint8):
+        with self._lock:
+            while self._free:
+                buf = self._free.pop()
+                if buf.shape == shape and buf.dtype == dtype:
+                    return buf
+            self.allocated += 1
+        return np.empty(shape, dtype)
+
+    def release(self, buf):
+        with self._lock:
+            if len(self._free) < self.max_free:
+                self._free.append(buf)
+
+
+def mirror_to_rgb(bgr, dst=None):
+    """
+    Mirror a BGR frame horizontally and convert it to RGB in one pass.
+
+    Viewed as an (h, w*3) byte image, reversing each row reverses the pixel
+    order and the channel order at once, so a single cv2.flip does both
+    jobs of flip(…, 1) + cvtColor(BGR2RGB), writing straight into `dst`.
+    """
+    h, w = bgr.shape[:2]
+    if dst is None:
+        dst = np.empty_like(bgr)
+    if not bgr.flags.c_contiguous:
+        bgr = np.ascontiguousarray(bgr)
+    cv2.flip(bgr.reshape(h, w * 3), 1, dst=dst.reshape(h, w * 3))
+    return dst
+
+
+@dataclass
+class FrameResult:
+    frame_id: int
+    timestamp: float        # capture time (time.monotonic())
+    image: object           # mirrored RGB frame; hand back with pipeline.release(result)
+    hands: list             # results.multi_hand_landmarks (or None)
+    submitted_at: float = 0.0   # perf_counter() when handed to the landmark provider
+    inferred: bool = True       # False: inference skipped for this frame (see HandPipeline.configure)
+
+
+# ========== CAPTURE → INFERENCE → RENDER PIPELINE ==========
+class HandPipeline:
+    """
+    Runs camera capture and MediaPipe inference on their own threads.
+
+    capture thread   : cap.read(into a pooled BGR buffer)             → frames queue
+    inference thread : mirror_to_rgb(into a pooled RGB buffer)
+                       → provider.submit                               → results queue
+    caller (render)  : for result in pipeline.results(): ...; pipeline.release(result)
+
+    `hands` is a landmark provider (landmarks.py) or a Hands-like object
+    with process(). A synchronous provider runs inference on the inference
+    thread; an asynchronous one (Tasks LIVE_STREAM) returns at once and
+    delivers results from MediaPipe's thread. At most `max_in_flight`
+    frames are submitted and not yet answered; the inference thread waits
+    for a free slot and then submits the newest frame.
+
+    Both queues are latest-frame-wins, so stale frames are dropped at every
+    stage instead of piling up behind the slowest one. Frame buffers cycle
+    through two FramePools, so the steady state allocates no frames.
+    Stage latencies go to `metrics` (a metrics.StageMetrics) when given.
+
+    configure() and replace_provider() change the inference cost while
+    running (see governor.py); both take effect on the next frame.
+    """
+
+    def __init__(self, cap, hands, metrics=None, max_in_flight=2):
+        self.cap = cap
+        self.provider = as_provider(hands)
+        self.metrics = metrics or NULL_METRICS
+        self.max_in_flight = max_in_flight
+        self.bgr_pool = FramePool()
+        self.rgb_pool = FramePool()
+        self._frames = LatestQueue(on_drop=lambda item: self.bgr_pool.release(item[2]))
+        self._results = LatestQueue(on_drop=self.release)
+        self._running = threading.Event()
+        self._threads = []
+        self._slot_free = threading.Condition()
+        self._provider_drops = 0
+        self.inference_scale = 1.0
+        self.infer_every = 1
+        self._small = None              # downscaled inference input (inference thread only)
+        self._replacement = None
+        self.error = None               # exception that ended the capture or inference thread
+
+    def start(self):
+        self.provider.start(self._on_result, self._on_provider_drop)
+        self._running.set()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, daemon=True),
+            threading.Thread(target=self._inference_loop, daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+        return self
+
+    def _capture_loop(self):
+        frame_id = 0
+        shape = None
+        record = self.metrics.record
+        try:
+            while self._running.is_set():
+                buf = self.bgr_pool.acquire(shape) if shape is not None else None
+                t0 = time.perf_counter()
+                ret, frame = self.cap.read(buf)
+                record("read", time.perf_counter() - t0)
+                if not ret:
+                    break
+                shape = frame.shape
+                self._frames.put((frame_id, time.monotonic(), frame))
+                frame_id += 1
+        except Exception as e:
+            self.error = e
+            log.exception("hand pipeline capture failed")
+        finally:
+            self._frames.close()    # ends the inference loop, which ends results()
+
+    def configure(self, inference_scale=1.0, infer_every=1):
+        """
+        Run inference on the frame scaled by `inference_scale`, and only on
+        every `infer_every`-th frame; the others are passed on with
+        inferred=False for the render loop to extrapolate.
+        """
+        self.inference_scale = inference_scale
+        self.infer_every = max(1, int(infer_every))
+
+    def replace_provider(self, provider, on_replaced=None):
+        """Switch landmark provider before the next frame; on_replaced(old) is called after."""
+        self._replacement = (as_provider(provider), on_replaced)
+
+    def _swap_provider(self):
+        provider, on_replaced = self._replacement
+        self._replacement = None
+        old = self.provider
+        if old.asynchronous:
+            wait_idle(old)
+        provider.start(self._on_result, self._on_provider_drop)
+        self.provider = provider
+        if on_replaced is not None:
+            on_replaced(old)
+        return provider
+
+    def _model_input(self, img):
+        scale = self.inference_scale
+        if scale >= 1.0:
+            return img
+        h, w = img.shape[:2]
+        size = (max(1, int(w * scale)), max(1, int(h * scale)))
+        if self._small is None or self._small.shape[:2] != (size[1], size[0]):
+            self._small = np.empty((size[1], size[0], 3), dtype=img.dtype)
+        # Landmarks are normalized, so they apply to the full frame unchanged
+        return cv2.resize(img, size, dst=self._small, interpolation=cv2.INTER_LINEAR)
+
+    def _inference_loop(self):
+        # Whatever ends this thread must also end results(), or the render
+        # loop would wait forever on a frozen frame
+        try:
+            self._infer_frames()
+        except Exception as e:
+            self.error = e
+            log.exception("hand pipeline inference failed")
+        finally:
+            if self.provider.asynchronous:
+                # Let the last submitted frames come back (frames MediaPipe skipped never will)
+                wait_idle(self.provider, timeout=0.5)
+            self._results.close()
+
+    def _infer_frames(self):
+        record = self.metrics.record
+        provider = self.provider
+        while self._running.is_set():
+            if self._replacement is not None:
+                provider = self._swap_provider()
+            if provider.asynchronous and not self._wait_for_slot():
+                continue
+            item = self._frames.get(timeout=0.5)
+            if item is None:
+                if self._frames.closed:
+                    break
+                continue
+            frame_id, timestamp, frame = item
+            t0 = time.perf_counter()
+            img = mirror_to_rgb(frame, self.rgb_pool.acquire(frame.shape))
+            self.bgr_pool.release(frame)
+            if frame_id % self.infer_every:
+                self._results.put(FrameResult(frame_id, timestamp, img, None, inferred=False))
+                continue
+            model_input = self._model_input(img)
+            t1 = time.perf_counter()
+            record("preprocess", t1 - t0)
+            provider.submit(FrameResult(frame_id, timestamp, img, None, t1), model_input, timestamp)
+
+    def _wait_for_slot(self, timeout=0.5):
+        with self._slot_free:
+            return self._slot_free.wait_for(lambda: self.provider.in_flight < self.max_in_flight, timeout)
+
+    def _on_result(self, result, hands):
+        # Inference thread (sync) or MediaPipe's callback thread (async)
+        self.metrics.record("process", time.perf_counter() - result.submitted_at)
+        result.hands = hands
+        self._results.put(result)
+        with self._slot_free:
+            self._slot_free.notify()
+
+    def _on_provider_drop(self, result):
+        self._provider_drops += 1
+        self.release(result)
+        with self._slot_free:
+            self._slot_free.notify()
+
+    def results(self):
+        """Yield the newest inference result until the source ends or stop() is called."""
+        while True:
+            result = self._results.get(timeout=0.5)
+            if result is None:
+                if self._results.closed:
+                    return
+                continue
+            yield result
+
+    def release(self, result):
+        """Return a result's frame buffer once it has been drawn on and published."""
+        self.rgb_pool.release(result.image)
+
+    @property
+    def dropped_frames(self):
+        return self._frames.dropped + self._results.dropped + self._provider_drops
+
+    def stop(self):
+        self._running.clear()
+        self._frames.close()
+        self._results.close()
+        for t in self._threads:
+            t.join(timeout=2.0)
+        self._threads = []
+        self.provider.close()
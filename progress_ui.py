@@ -0,0 +1,79 @@
+import io
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+
+# ========== PROGRESS CIRCLE UI ==========
+def create_progress_circle(progress):
+    size = 200
+    img = Image.new("RGB", (size, size), (30, 30, 30))
+    draw = ImageDraw.Draw(img)
+    center = size // 2
+    radius = 85
+
+    draw.ellipse(
+        (center-radius, center-radius, center+radius, center+radius),
+        outline=(80, 80, 80),
+        width=10,
+    )
+
+    angle = int(360 * (progress / 100))
+    draw.arc(
+        (center-radius, center-radius, center+radius, center+radius),
+        start=-90,
+        end=angle-90,
+        fill=(0, 255, 0),
+        width=14,
+    )
+
+    text = f"{int(progress)}%"
+    font = ImageFont.load_default()
+    bbox = draw.textbbox((0, 0), text, font=font)
+    draw.text(
+        (center - (bbox[2]-bbox[0])//2, center - (bbox[3]-bbox[1])//2),
+        text,
+        fill=(255, 255, 255),
+        font=font,
+    )
+    return img
+
+
+@lru_cache(maxsize=256)
+def progress_circle_png(progress):
+    """
+    PNG-encoded progress ring, rendered once per distinct progress value.
+    Progress only takes count/target_reps values, so the cache stays tiny and
+    lives for the whole process (across reruns and sessions).
+    """
+    buf = io.BytesIO()
+    create_progress_circle(progress).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+# ========== CHANGE-ONLY PLACEHOLDER ==========
+class ChangeOnlyPlaceholder:
+    """
+    Wraps an st.empty() placeholder and only sends an element to the browser
+    when the value it shows has changed since the last push.
+
+        progress = ChangeOnlyPlaceholder(st.empty())
+        progress.show(pct, "image", progress_circle_png(pct))
+    """
+
+    _UNSET = object()
+
+    def __init__(self, placeholder):
+        self.placeholder = placeholder
+        self._value = self._UNSET
+
+    def show(self, value, method, *args, **kwargs):
+        """Call placeholder.<method>(*args, **kwargs) if `value` changed. Returns True if pushed."""
+        if value == self._value:
+            return False
+        getattr(self.placeholder, method)(*args, **kwargs)
+        self._value = value
+        return True
+
+    def reset(self):
+        self._value = self._UNSET
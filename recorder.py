@@ -0,0 +1,206 @@
+import json
+import logging
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from metrics import NULL_METRICS
+from pipeline import FramePool, LatestQueue
+
+log = logging.getLogger("neurorehab")
+
+RECORDINGS_DIR = os.environ.get(
+    "NEUROREHAB_RECORDINGS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "recordings")
+)
+
+
+def recording_path(username, session_id, root=RECORDINGS_DIR):
+    """Base path (no extension) of a session's recording: <root>/<user>/<time>_<session>."""
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return os.path.join(root, username or "anonymous", f"{stamp}_{session_id[:8]}")
+
+
+# ========== BACKGROUND SESSION RECORDER ==========
+class SessionRecorder:
+    """
+    Writes a camera session to `<base>.mp4` plus a `<base>.jsonl` sidecar
+    from its own thread.
+
+    record() is the only camera loop cost: frames above the recording FPS
+    are skipped with a clock check, the rest are converted to BGR into a
+    pooled buffer (one pass, the copy VideoWriter needs anyway) and queued
+    with a copy of the landmarks. Encoding, JSON and disk I/O happen on the
+    writer thread. The queue holds `queue_size` frames; when the encoder
+    falls behind the oldest waiting frame is dropped, counted in `dropped`
+    and logged, so the camera loop never waits on the disk.
+
+    The sidecar has a header line, then one line per video frame:
+
+      {"frame": n, "t": s since start, "frame_id", "hands": [[[x, y] × 21] × 2] | null,
+       "point": [x, y] | null, "distance": float | null, "stage": str, "rep": int}
+
+    Dropped frames are missing from both files, so video frame n is always
+    sidecar row n; `t` gives its real capture time.
+    """
+
+    LOG_INTERVAL = 5.0      # seconds between "fell behind" warnings
+
+    def __init__(self, base_path, fps=15.0, annotated=True, fourcc="mp4v", queue_size=32, metrics=None):
+        self.base_path = base_path
+        self.video_path = base_path + ".mp4"
+        self.sidecar_path = base_path + ".jsonl"
+        self.fps = fps
+        self.annotated = annotated      # with the overlay, or the raw camera frame (caller's choice)
+        self.fourcc = fourcc
+        self.metrics = metrics or NULL_METRICS
+        self.written = 0
+        self.skipped = 0
+        self.started_at = None          # time.monotonic() of the first recorded frame
+        self._next_due = 0.0
+        self._pool = FramePool(max_free=queue_size + 2)
+        self._queue = LatestQueue(maxsize=queue_size, on_drop=self._on_drop)
+        self._writer = None
+        self._sidecar = None
+        self._size = None
+        self._resized = None
+        self._thread = None
+
+    @property
+    def dropped(self):
+        return self._queue.dropped
+
+    def start(self):
+        os.makedirs(os.path.dirname(self.base_path) or ".", exist_ok=True)
+        # Never overwrite: a second recording of the same session gets a suffix
+        base, n = self.base_path, 1
+        while os.path.exists(self.video_path) or os.path.exists(self.sidecar_path):
+            n += 1
+            self.base_path = f"{base}-{n}"
+            self.video_path = self.base_path + ".mp4"
+            self.sidecar_path = self.base_path + ".jsonl"
+        self._thread = threading.Thread(target=self._write_loop, daemon=True, name="session-recorder")
+        self._thread.start()
+        return self
+
+    # ---- camera loop side ----
+    def due(self, now):
+        """True when a frame captured at `now` should be recorded (rate limit only)."""
+        return now >= self._next_due and not self._queue.closed
+
+    def snapshot(self, img):
+        """BGR copy of an RGB frame in a pooled buffer, e.g. before the overlay is drawn."""
+        frame = self._pool.acquire(img.shape)
+        cv2.cvtColor(img, cv2.COLOR_RGB2BGR, dst=frame)
+        return frame
+
+    def record(self, img, frame_time, frame_id=None, hands=None, point=None, distance=None,
+               stage=None, rep=None, snapshot=None):
+        """
+        Queue one frame. img: RGB frame (copied now), or pass an earlier
+        snapshot(). hands: (2, 21, 2) normalized landmarks. Returns False
+        if the frame was skipped by the rate limit.
+        """
+        if not self.due(frame_time):
+            self.skipped += 1
+            if snapshot is not None:
+                self._pool.release(snapshot)
+            return False
+        if self.started_at is None:
+            self.started_at = frame_time
+        self._next_due = max(self._next_due + 1.0 / self.fps, frame_time)
+        frame = snapshot if snapshot is not None else self.snapshot(img)
+        row = (
+            frame_time - self.started_at, frame_id,
+            None if hands is None else np.array(hands, dtype=float),
+            None if point is None else (int(point[0]), int(point[1])),
+            None if distance is None else float(distance),
+            stage, rep,
+        )
+        self._queue.put((frame, row))
+        return True
+
+    def _on_drop(self, item):
+        self._pool.release(item[0])
+
+    # ---- writer thread ----
+    def _write_loop(self):
+        reported, reported_at = 0, 0.0
+        try:
+            while True:
+                item = self._queue.get(timeout=0.5)
+                if item is None:
+                    if self._queue.closed:
+                        return
+                    continue
+                frame, row = item
+                t0 = time.perf_counter()
+                self._write(frame, row)
+                self._pool.release(frame)
+                self.metrics.record("video_encode", time.perf_counter() - t0)
+                if self.dropped > reported and time.monotonic() - reported_at >= self.LOG_INTERVAL:
+                    reported_at = time.monotonic()
+                    log.warning("recorder fell behind: dropped %d frame(s) (%d total) for %s",
+                                self.dropped - reported, self.dropped, self.video_path)
+                    reported = self.dropped
+        except Exception:
+            log.exception("session recording failed: %s", self.video_path)
+            self._queue.close()
+        finally:
+            self._close_files()
+
+    def _open(self, frame):
+        h, w = frame.shape[:2]
+        self._size = (w, h)
+        self._writer = cv2.VideoWriter(self.video_path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, (w, h))
+        if not self._writer.isOpened():
+            raise RuntimeError(f"cannot open a {self.fourcc} VideoWriter for {self.video_path}")
+        self._sidecar = open(self.sidecar_path, "w")
+        header = {
+            "video": os.path.basename(self.video_path), "fps": self.fps, "width": w, "height": h,
+            "started_at": time.time() - (time.monotonic() - self.started_at),
+        }
+        self._sidecar.write(json.dumps(header) + "\n")
+
+    def _write(self, frame, row):
+        if self._writer is None:
+            self._open(frame)
+        if frame.shape[1::-1] != self._size:
+            # Mode change mid-session: the container keeps its first size
+            if self._resized is None:
+                self._resized = np.empty((self._size[1], self._size[0], 3), np.uint8)
+            frame = cv2.resize(frame, self._size, dst=self._resized, interpolation=cv2.INTER_AREA)
+        self._writer.write(frame)
+
+        t, frame_id, hands, point, distance, stage, rep = row
+        self._sidecar.write(json.dumps({
+            "frame": self.written,
+            "t": round(t, 4),
+            "frame_id": frame_id,
+            "hands": None if hands is None else np.round(hands, 5).tolist(),
+            "point": point,
+            "distance": None if distance is None else round(distance, 5),
+            "stage": stage,
+            "rep": rep,
+        }) + "\n")
+        self.written += 1
+
+    def _close_files(self):
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+        if self._sidecar is not None:
+            self._sidecar.close()
+            self._sidecar = None
+
+    def stop(self, timeout=5.0):
+        """Stop accepting frames, finish writing the queued ones and close the files."""
+        self._queue.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self.written:
+            log.info("recorded %d frames to %s (%d dropped, %d skipped)",
+                     self.written, self.video_path, self.dropped, self.skipped)
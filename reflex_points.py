@@ -0,0 +1,199 @@
+import time
+
+import cv2
+import numpy as np
+
+
+# ========== PULSE ANIMATION ==========
+PULSE_MIN_RADIUS = 20
+PULSE_MAX_RADIUS = 40
+PULSE_PERIOD = 1.0      # seconds for one grow-and-shrink cycle
+
+
+def pulse_radius(t):
+    """
+    Radius of the pulsing reflex-point ring at time `t` (seconds, any
+    monotonic clock): a triangle wave between the min and max radius.
+    No state, so the animation runs at the same speed at any frame rate.
+    """
+    phase = (t / PULSE_PERIOD) % 1.0
+    ramp = 2 * phase if phase < 0.5 else 2 - 2 * phase
+    return PULSE_MIN_RADIUS + (PULSE_MAX_RADIUS - PULSE_MIN_RADIUS) * ramp
+
+
+# ========== SPINE PATH HELPERS / VIRTUAL POINTS ==========
+# Every virtual vertebra point is a fixed combination of hand landmarks, so
+# the combinations are precomputed once per region into weight matrices.
+# Per frame we build one (21, 2) landmark array and each region's points
+# come from a single matrix multiply:
+#
+#   points (K, 2) = REGION_WEIGHTS[region] (K, 21) @ landmarks (21, 2)
+#
+# - Cervical: 7 virtual points along thumb (C1–C7)
+# - Thoracic: 12 virtual points under thumb towards wrist (T1–T12)
+# - Lumbar: 5 points from deep wrist centre to the palm edge below the pinky (L1–L5)
+# - Sacrum: 5 virtual points at extreme right palm base under pinky (S1–S5)
+# - Coccyx: 4 virtual points just below sacrum (Co1–Co4)
+#
+# The cervical path bends at the thumb joint and is spaced by arc length,
+# which is not linear in the landmarks. For it the table holds the path's
+# control-point weights and the points are resampled along the path.
+
+NUM_LANDMARKS = 21
+WRIST, THUMB_BASE, THUMB_MID, THUMB_TIP, MID_BASE, PINKY_BASE = 0, 2, 3, 4, 9, 17
+
+
+def _lm(**coeffs):
+    """Weight row over the 21 landmarks, e.g. _lm(wrist=0.6, thumb_base=0.4)."""
+    index = {
+        "wrist": WRIST, "thumb_base": THUMB_BASE, "thumb_mid": THUMB_MID,
+        "thumb_tip": THUMB_TIP, "mid_base": MID_BASE, "pinky_base": PINKY_BASE,
+    }
+    row = np.zeros(NUM_LANDMARKS)
+    for name, weight in coeffs.items():
+        row[index[name]] += weight
+    return row
+
+
+def _segment(start, end, count):
+    """Weights of `count` evenly spaced points from start to end (both weight rows)."""
+    s = np.linspace(0.0, 1.0, count)[:, None]
+    return (1 - s) * start + s * end
+
+
+def _build_region_tables():
+    edge_direction = _lm(wrist=1.0, pinky_base=-1.0)
+
+    # Thoracic: band under thumb toward wrist. Its control points
+    # (thumb_base, 0.7/0.3, 0.4/0.6) are collinear and evenly spaced,
+    # so it is a straight segment.
+    thoracic = _segment(_lm(thumb_base=1.0), _lm(thumb_base=0.4, wrist=0.6), 12)
+
+    # Lumbar: starts deep near the centre of the wrist and ends at the
+    # palm edge below the pinky, shifted slightly outward.
+    lumbar_start = _lm(mid_base=0.15, wrist=0.85)
+    lumbar_end = _lm(pinky_base=0.05, wrist=0.95) + 0.2 * _lm(pinky_base=1.0, mid_base=-1.0)
+    lumbar = _segment(lumbar_start, lumbar_end, 5)
+
+    # Sacrum continues from the last lumbar point with a tiny step down,
+    # and the coccyx continues from the last sacrum point the same way.
+    sacrum = _segment(lumbar[-1], lumbar[-1] + 0.015 * edge_direction, 5)
+    coccyx = _segment(sacrum[-1], sacrum[-1] + 0.015 * edge_direction, 4)
+
+    weights = {
+        "Thoracic (T1–T12)": thoracic,
+        "Lumbar (L1–L5)": lumbar,
+        "Sacrum": sacrum,
+        "Coccyx": coccyx,
+    }
+    paths = {
+        # Cervical: along thumb, tip → mid → base
+        "Cervical (C1–C7)": (
+            np.stack([_lm(thumb_tip=1.0), _lm(thumb_mid=1.0), _lm(thumb_base=1.0)]),
+            7,
+        ),
+    }
+    return weights, paths
+
+
+REGION_WEIGHTS, REGION_PATHS = _build_region_tables()
+
+
+def region_size(spinal_region):
+    """Number of virtual points in a region."""
+    if spinal_region in REGION_WEIGHTS:
+        return len(REGION_WEIGHTS[spinal_region])
+    return REGION_PATHS[spinal_region][1]
+
+
+def landmarks_to_array(hand, w, h):
+    """MediaPipe hand landmarks → (21, 2) pixel coordinates."""
+    return np.array([(lm.x, lm.y) for lm in hand.landmark], dtype=float) * (w, h)
+
+
+def interpolate_segment_batch(paths, count):
+    """
+    Interpolate `count` evenly spaced (by arc length) points along each path.
+    paths: (N, P, 2) path control points per frame → (N, count, 2).
+    """
+    paths = np.asarray(paths, dtype=float)
+    n, p, _ = paths.shape
+    if p == 1:
+        return np.repeat(paths, count, axis=1)
+
+    dists = np.sqrt(((paths[:, 1:] - paths[:, :-1]) ** 2).sum(axis=2))
+    cumdist = np.concatenate([np.zeros((n, 1)), np.cumsum(dists, axis=1)], axis=1)
+    total = cumdist[:, -1]
+
+    samples = np.linspace(0.0, total, count, axis=1)                          # (N, count)
+    # Row-wise np.searchsorted(cumdist, s) (side="left")
+    j = (cumdist[:, None, :] < samples[:, :, None]).sum(axis=2)
+    j = np.clip(j, 1, p - 1)
+
+    rows = np.arange(n)[:, None]
+    d0 = cumdist[rows, j - 1]
+    d1 = cumdist[rows, j]
+    span = d1 - d0
+    t = np.divide(samples - d0, span, out=np.zeros_like(samples), where=span != 0)
+
+    out = (1 - t)[..., None] * paths[rows, j - 1] + t[..., None] * paths[rows, j]
+    out[total == 0] = paths[total == 0, :1]
+    return out
+
+
+def region_points(landmarks_px, spinal_region):
+    """(21, 2) pixel landmarks → (K, 2) integer reflex points of one region."""
+    if spinal_region in REGION_WEIGHTS:
+        pts = REGION_WEIGHTS[spinal_region] @ landmarks_px
+    else:
+        control, count = REGION_PATHS[spinal_region]
+        pts = interpolate_segment_batch((control @ landmarks_px)[None], count)[0]
+    return np.trunc(pts).astype(int)
+
+
+def region_points_batch(landmarks_px, spinal_region):
+    """
+    Reflex points of one region for a whole session.
+    landmarks_px: (N, 21, 2) target-hand landmarks in pixels → (N, K, 2)
+    integer pixel positions, identical to region_points per frame.
+    """
+    lm = np.asarray(landmarks_px, dtype=float)
+    if spinal_region in REGION_WEIGHTS:
+        pts = np.einsum("kl,nld->nkd", REGION_WEIGHTS[spinal_region], lm)
+    else:
+        control, count = REGION_PATHS[spinal_region]
+        pts = interpolate_segment_batch(np.einsum("pl,nld->npd", control, lm), count)
+    return np.trunc(pts).astype(int)
+
+
+def region_point(landmarks_px, spinal_region, rep_index):
+    """(cx, cy) of the reflex point for this region and rep, or None."""
+    points = region_points(landmarks_px, spinal_region)
+    if not len(points):
+        return None
+    # clamp index
+    rep_index = max(0, min(rep_index, len(points) - 1))
+    return tuple(int(v) for v in points[rep_index])
+
+
+def draw_pulse(img, point, t):
+    cv2.circle(img, point, int(pulse_radius(t)), (0, 255, 0), 3)
+
+
+def draw_spine_reflex_point(img, spinal_region, hand, rep_index, t=None):
+    """Draw the reflex point from MediaPipe hand landmarks (see draw_reflex_point)."""
+    h, w, _ = img.shape
+    return draw_reflex_point(img, spinal_region, landmarks_to_array(hand, w, h), rep_index, t)
+
+
+def draw_reflex_point(img, spinal_region, landmarks_px, rep_index, t=None):
+    """
+    Draw the reflex point for the selected region and rep from (21, 2) pixel
+    landmarks. Only the selected region is evaluated. The ring pulses with
+    time `t` (default: now on the monotonic clock).
+    """
+    point = region_point(landmarks_px, spinal_region, rep_index)
+    if point is None:
+        return None, None
+    draw_pulse(img, point, time.monotonic() if t is None else t)
+    return point
@@ -0,0 +1,307 @@
+import json
+import os
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from reflex_points import region_points_batch, region_size
+
+
+# ========== HAND ASSIGNMENT ==========
+def assign_hands(multi_hand_landmarks, hand_choice):
+    """
+    Split the two detected hands into (target_hand, pressing_hand).
+    Left and right are identified by wrist x-coordinate on the mirrored frame.
+    Returns (None, None) unless exactly two hands are visible.
+    """
+    if not multi_hand_landmarks or len(multi_hand_landmarks) != 2:
+        return None, None
+
+    h1, h2 = multi_hand_landmarks
+    if h1.landmark[0].x < h2.landmark[0].x:
+        left, right = h1, h2
+    else:
+        left, right = h2, h1
+
+    if hand_choice == "Right Hand":
+        return right, left
+    return left, right
+
+
+# ========== FINGERTIP CONTACT ==========
+FINGERTIPS = {"thumb": 4, "index": 8, "middle": 12, "ring": 16, "pinky": 20}
+DEFAULT_FINGERS = ("thumb", "index", "middle")
+
+# Per-finger scale of the press/release thresholds. The thumb pad is broader
+# and its tip landmark sits further from the skin it presses on.
+FINGER_THRESHOLDS = {"thumb": 1.25, "index": 1.0, "middle": 1.0, "ring": 1.0, "pinky": 1.0}
+
+# Optional clinic override: {"fingers": [...], "thresholds": {finger: scale}}
+CONTACT_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "contact.json")
+
+
+def load_contact_config(path=CONTACT_CONFIG):
+    """Enabled fingers and per-finger threshold scales, from contact.json if present."""
+    config = {"fingers": list(DEFAULT_FINGERS), "thresholds": dict(FINGER_THRESHOLDS)}
+    if os.path.exists(path):
+        with open(path) as f:
+            override = json.load(f)
+        config["fingers"] = list(override.get("fingers", config["fingers"]))
+        config["thresholds"].update(override.get("thresholds", {}))
+    return config
+
+
+class ContactEngine:
+    """
+    Distance from every enabled fingertip of the pressing hand to the
+    reflex point, in one vectorized step per frame.
+
+    Distances are measured in pixels and expressed in frame heights, so a
+    distance means the same horizontally and vertically on any aspect
+    ratio (normalized landmark units stretch x by width / height). Each
+    finger's distance is divided by its threshold scale, so one press /
+    release threshold pair serves every finger. measure() returns the
+    smallest scaled distance; `finger` names the finger it came from.
+    """
+
+    def __init__(self, fingers=None, thresholds=None):
+        config = load_contact_config()
+        self.finger = None
+        self.configure(fingers or config["fingers"], thresholds or config["thresholds"])
+
+    def configure(self, fingers, thresholds=None):
+        thresholds = dict(FINGER_THRESHOLDS, **(thresholds or {}))
+        fingers = tuple(fingers) or DEFAULT_FINGERS
+        # Swapped in as one tuple: measure() may be running on the camera thread
+        self._state = (
+            fingers,
+            np.array([FINGERTIPS[f] for f in fingers]),
+            1.0 / np.array([thresholds[f] for f in fingers], dtype=float),
+            np.empty((len(fingers), 2)),
+            np.empty(len(fingers)),
+        )
+
+    @property
+    def fingers(self):
+        return self._state[0]
+
+    def measure(self, point_px, pressing, img_shape):
+        """
+        point_px: (x, y) reflex point in pixels; pressing: (21, 2) normalized
+        landmarks of the pressing hand. Returns the closest scaled distance.
+        """
+        fingers, tips, inv_scale, diff, dist = self._state
+        h, w = img_shape[:2]
+        np.take(pressing, tips, axis=0, out=diff)
+        diff *= (w, h)
+        diff -= point_px
+        np.hypot(diff[:, 0], diff[:, 1], out=dist)
+        dist *= inv_scale
+        i = int(dist.argmin())
+        self.finger = fingers[i]
+        return dist[i] / h
+
+
+# ========== PRESS / HOLD / RELEASE STATE MACHINE ==========
+@dataclass
+class RepTiming:
+    """Timing of one completed rep, in the clock passed to RepCounter.update()."""
+    pressed_at: float           # first frame of the stable press
+    countdown_at: float         # countdown started
+    released_at: float          # release detected, rep counted
+    min_distance: float         # closest smoothed fingertip distance during the press
+
+    @property
+    def hold_duration(self):
+        return self.released_at - self.countdown_at
+
+
+class RepCounter:
+    """
+    Live rep detection, one distance sample at a time.
+
+    waiting_press → (smoothed distance < press_th for stability_time) → countdown_running
+    countdown_running → (smoothed distance > release_th after hold_time) → rep counted, waiting_press
+    countdown_running → (smoothed distance > release_th before hold_time) → cancelled, waiting_press
+
+    update() returns "countdown" when the countdown should start, "rep" when a
+    rep was completed (its RepTiming is then in `last_rep`), "cancel" on an
+    early release, otherwise None. It never
+    sleeps or reads the clock, so the same logic runs live, headless and in
+    benchmarks.
+    """
+
+    def __init__(self, press_th=0.028, release_th=0.060, stability_time=0.25, smooth=5, hold_time=2.5):
+        self.press_th = press_th
+        self.release_th = release_th
+        self.stability_time = stability_time
+        self.hold_time = hold_time
+        self.distances = deque(maxlen=smooth)
+        self.stage = "waiting_press"
+        self.press_timer = None
+        self.countdown_started = None
+        self.count = 0
+        self.smooth = None
+        self.min_distance = None
+        self.last_rep = None
+
+    def update(self, dist, now):
+        self.distances.append(dist)
+        self.smooth = sum(self.distances) / len(self.distances)
+        event = None
+
+        # -------- STABLE PRESS DETECTION --------
+        if self.stage == "waiting_press":
+            if self.smooth < self.press_th:
+                if self.press_timer is None:
+                    self.press_timer = now
+                    self.min_distance = self.smooth
+                elif now - self.press_timer >= self.stability_time:
+                    self.stage = "countdown_running"
+                    self.countdown_started = now
+                    event = "countdown"
+            else:
+                self.press_timer = None  # lost press, reset
+
+        if self.press_timer is not None:
+            self.min_distance = min(self.min_distance, self.smooth)
+
+        # -------- RELEASE DETECTION AFTER COUNTDOWN --------
+        if self.stage == "countdown_running" and self.smooth > self.release_th:
+            if now - self.countdown_started >= self.hold_time:
+                self.count += 1
+                self.last_rep = RepTiming(self.press_timer, self.countdown_started, now, self.min_distance)
+                event = "rep"
+            else:
+                event = "cancel"  # released before the hold finished
+            self.stage = "waiting_press"
+            self.press_timer = None
+            self.countdown_started = None
+
+        return event
+
+
+# ========== BATCH SCORING OF RECORDED SESSIONS ==========
+# Same decisions as RepCounter, but over whole recorded landmark traces at
+# once, so archived sessions can be re-scored under new thresholds without
+# replaying them in real time.
+
+@dataclass
+class SessionScore:
+    count: int
+    countdown_frames: list = field(default_factory=list)   # frame index where each countdown started
+    release_frames: list = field(default_factory=list)     # frame index where each rep was counted
+    cancel_frames: list = field(default_factory=list)      # frame index of each early release
+    smooth: np.ndarray = None                                # smoothed distance per frame (NaN if not scored)
+
+
+def session_distances(target_landmarks, pressing_landmarks, spinal_region, frame_size,
+                      fingers=DEFAULT_FINGERS, thresholds=None):
+    """
+    Closest scaled fingertip distance to every reflex point of the region,
+    as ContactEngine computes it live.
+
+    target_landmarks / pressing_landmarks: (N, 21, 2+) normalized landmarks,
+    NaN on frames where the two hands were not both detected.
+    frame_size: (width, height) of the frames the landmarks came from.
+    Returns (N, K) distances in frame heights (NaN for missing frames).
+    """
+    w, h = frame_size
+    thresholds = dict(FINGER_THRESHOLDS, **(thresholds or {}))
+    tips = [FINGERTIPS[f] for f in fingers]
+    inv_scale = 1.0 / np.array([thresholds[f] for f in fingers], dtype=float)
+    target = np.asarray(target_landmarks, dtype=float)[..., :2]
+    pressing = np.asarray(pressing_landmarks, dtype=float)[..., :2]
+    valid = ~(np.isnan(target).any(axis=(1, 2)) | np.isnan(pressing).any(axis=(1, 2)))
+
+    dist = np.full((len(target), region_size(spinal_region)), np.nan)
+    if valid.any():
+        points = region_points_batch(target[valid] * (w, h), spinal_region)          # (M, K, 2) px
+        tip_px = pressing[valid][:, tips] * (w, h)                                     # (M, F, 2) px
+        d = np.linalg.norm(points[:, :, None, :] - tip_px[:, None, :, :], axis=3)    # (M, K, F)
+        dist[valid] = (d * inv_scale).min(axis=2) / h
+    return dist
+
+
+def _moving_average(values, window):
+    """Trailing mean over up to `window` samples along axis 0 (shorter at the start)."""
+    csum = np.cumsum(values, axis=0)
+    out = csum.copy()
+    out[window:] = csum[window:] - csum[:-window]
+    n = np.minimum(np.arange(1, len(values) + 1), window)
+    return out / n.reshape(-1, *([1] * (values.ndim - 1)))
+
+
+def detect_reps(timestamps, distances, press_th=0.028, release_th=0.060,
+                stability_time=0.25, smooth=5, hold_time=2.5, target_reps=None):
+    """
+    Run the press/stability/release state machine over precomputed distances.
+
+    distances: (N, K) from session_distances. Frames with NaN are skipped,
+    exactly as the live loop does when both hands are not visible.
+    Thresholds can be swept cheaply because distances are reused.
+    """
+    timestamps = np.asarray(timestamps, dtype=float)
+    distances = np.asarray(distances, dtype=float)
+    frame_idx = np.flatnonzero(~np.isnan(distances).any(axis=1))
+    t = timestamps[frame_idx]
+    d = distances[frame_idx]                      # (M, K)
+    m, k = d.shape
+
+    smoothed = _moving_average(d, smooth) if m else d
+    series = np.full(m, np.nan)
+    used = np.full(m, np.nan)                     # distance actually fed to the smoother
+    score = SessionScore(count=0)
+
+    start = 0
+    while start < m and (target_reps is None or score.count < target_reps):
+        col = min(score.count, k - 1)
+        seg = smoothed[start:, col].copy()
+
+        # The smoothing window right after a rep still holds distances to the
+        # previous reflex point(s), like the live deque does.
+        if start > 0:
+            lo = max(0, start - smooth + 1)
+            window = np.concatenate([used[lo:start], d[start:start + smooth - 1, col]])
+            for i in range(min(smooth - 1, len(seg))):
+                first = max(0, start + i - smooth + 1) - lo
+                seg[i] = window[first:start - lo + i + 1].mean()
+        series[start:] = seg
+        used[start:] = d[start:, col]
+
+        pressed = seg < press_th
+        idx = np.arange(len(seg))
+        run_begin = np.where(pressed & ~np.concatenate([[False], pressed[:-1]]), idx, 0)
+        run_start = np.maximum.accumulate(run_begin)
+        ts = t[start:]
+        stable = pressed & (idx > run_start) & (ts - ts[run_start] >= stability_time)
+        hits = np.flatnonzero(stable)
+        if not hits.size:
+            break
+        countdown = hits[0]
+
+        released = np.flatnonzero(seg[countdown:] > release_th)
+        if not released.size:
+            score.countdown_frames.append(int(frame_idx[start + countdown]))
+            break
+        release = countdown + released[0]
+
+        score.countdown_frames.append(int(frame_idx[start + countdown]))
+        if ts[release] - ts[countdown] >= hold_time:
+            score.count += 1
+            score.release_frames.append(int(frame_idx[start + release]))
+        else:
+            score.cancel_frames.append(int(frame_idx[start + release]))
+        start += release + 1
+
+    score.smooth = np.full(len(timestamps), np.nan)
+    score.smooth[frame_idx] = series
+    return score
+
+
+def score_session(timestamps, target_landmarks, pressing_landmarks, spinal_region,
+                  frame_size, **params):
+    """Distances + rep detection for one recorded session. See detect_reps for params."""
+    distances = session_distances(target_landmarks, pressing_landmarks, spinal_region, frame_size)
+    return detect_reps(timestamps, distances, **params)
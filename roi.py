@@ -0,0 +1,121 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+
+# ========== REGION-OF-INTEREST TRACKING ==========
+class ROITracker:
+    """
+    Drop-in wrapper around a MediaPipe Hands object that runs inference on a
+    crop around where the hands were last seen instead of the full frame.
+
+    - The crop is the union of the previous frame's hand bounding boxes plus
+      `margin` (fraction of the box size) on every side, at least
+      `min_size` of the frame in each dimension.
+    - It is kept steady while the hands stay well inside it and only moves
+      when they approach its border, so MediaPipe's own tracking between
+      frames stays valid.
+    - Landmarks are mapped back to full-frame normalized coordinates, so
+      callers see the same results as from hands.process(full_frame).
+    - If fewer than `expected_hands` are found, the next frame is searched
+      in full again.
+    - The crop is kept in normalized frame coordinates, so it stays valid
+      when the input size changes between frames (the quality governor
+      changing the inference scale).
+    """
+
+    def __init__(self, hands, margin=0.35, min_size=0.3, edge=0.08, expected_hands=2):
+        self.hands = hands
+        self.margin = margin
+        self.min_size = min_size
+        self.edge = edge
+        self.expected_hands = expected_hands
+        self.roi = None               # (x0, y0, x1, y1) normalized to [0, 1], None = full frame
+        self.full_frame_searches = 0
+
+    def process(self, img):
+        h, w = img.shape[:2]
+        crop_box = self._crop_box(w, h)
+        if crop_box is None:
+            self.full_frame_searches += 1
+            results = self.hands.process(img)
+            crop_box = (0, 0, w, h)
+        else:
+            x0, y0, x1, y1 = crop_box
+            results = self.hands.process(np.ascontiguousarray(img[y0:y1, x0:x1]))
+            _remap(results.multi_hand_landmarks, crop_box, w, h)
+
+        hands = results.multi_hand_landmarks
+        if not hands or len(hands) < self.expected_hands:
+            self.roi = None           # tracking lost → full-frame search next frame
+        else:
+            self._update_roi(hands, w, h)
+
+        return SimpleNamespace(
+            multi_hand_landmarks=hands,
+            multi_handedness=getattr(results, "multi_handedness", None),
+            roi=crop_box,
+        )
+
+    def _crop_box(self, w, h):
+        """The ROI in pixels of a w × h frame, or None for a full-frame search."""
+        if self.roi is None:
+            return None
+        x0, y0, x1, y1 = self.roi
+        box = (
+            max(0, int(x0 * w)), max(0, int(y0 * h)),
+            min(w, int(np.ceil(x1 * w))), min(h, int(np.ceil(y1 * h))),
+        )
+        if box[2] - box[0] < 2 or box[3] - box[1] < 2:
+            return None
+        return box
+
+    def _update_roi(self, hands, w, h):
+        xs = np.array([lm.x for hand in hands for lm in hand.landmark]) * w
+        ys = np.array([lm.y for hand in hands for lm in hand.landmark]) * h
+        bx0, bx1, by0, by1 = xs.min(), xs.max(), ys.min(), ys.max()
+
+        mx = max((bx1 - bx0) * self.margin, 0.5 * (self.min_size * w - (bx1 - bx0)))
+        my = max((by1 - by0) * self.margin, 0.5 * (self.min_size * h - (by1 - by0)))
+        candidate = (
+            int(max(0, bx0 - mx)), int(max(0, by0 - my)),
+            int(min(w, bx1 + mx)), int(min(h, by1 + my)),
+        )
+
+        current = self._crop_box(w, h)
+        if current is not None:
+            x0, y0, x1, y1 = current
+            ex, ey = self.edge * (x1 - x0), self.edge * (y1 - y0)
+            inside = bx0 > x0 + ex and bx1 < x1 - ex and by0 > y0 + ey and by1 < y1 - ey
+            # Keep the crop while the hands sit comfortably inside it and it
+            # is not much larger than a freshly fitted one.
+            if inside and _area(current) <= 2 * _area(candidate):
+                return
+
+        if _area(candidate) >= w * h:
+            self.roi = None
+        else:
+            x0, y0, x1, y1 = candidate
+            self.roi = (x0 / w, y0 / h, x1 / w, y1 / h)
+
+    def close(self):
+        self.hands.close()
+
+
+def _remap(hands, crop_box, w, h):
+    """Crop-normalized landmarks → full-frame normalized landmarks, in place."""
+    if not hands:
+        return
+    x0, y0, x1, y1 = crop_box
+    sx, sy = (x1 - x0) / w, (y1 - y0) / h
+    ox, oy = x0 / w, y0 / h
+    for hand in hands:
+        for lm in hand.landmark:
+            lm.x = lm.x * sx + ox
+            lm.y = lm.y * sy + oy
+            lm.z = lm.z * sx   # z uses the same scale as x
+
+
+def _area(box):
+    x0, y0, x1, y1 = box
+    return (x1 - x0) * (y1 - y0)
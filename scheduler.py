@@ -0,0 +1,114 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+# ========== CUE SCHEDULER ==========
+class CueScheduler:
+    """
+    Runs callbacks at absolute time.monotonic() deadlines on one worker
+    thread per session, instead of a sleeping thread per rep.
+
+    Events carry a tag so a whole countdown can be cancelled or replaced
+    when the patient releases early or presses again. The worker exits
+    after `idle_timeout` seconds with nothing scheduled and is restarted on
+    the next schedule(), so abandoned sessions don't leave threads behind.
+    """
+
+    def __init__(self, clock=time.monotonic, idle_timeout=30.0):
+        self.clock = clock
+        self.idle_timeout = idle_timeout
+        self._events = []              # heap of (when, seq, tag, callback)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def schedule_at(self, when, callback, tag=None):
+        with self._cond:
+            heapq.heappush(self._events, (when, next(self._seq), tag, callback))
+            self._ensure_worker()
+            self._cond.notify()
+
+    def schedule(self, delay, callback, tag=None):
+        self.schedule_at(self.clock() + delay, callback, tag)
+
+    def cancel(self, tag=None):
+        """Drop pending events with this tag (all events if tag is None). Returns how many."""
+        with self._cond:
+            before = len(self._events)
+            if tag is None:
+                self._events = []
+            else:
+                self._events = [e for e in self._events if e[2] != tag]
+                heapq.heapify(self._events)
+            self._cond.notify()
+            return before - len(self._events)
+
+    def pending(self, tag=None):
+        with self._cond:
+            return sum(1 for e in self._events if tag is None or e[2] == tag)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._events = []
+            self._cond.notify()
+
+    def _ensure_worker(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._closed = False
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        idle_since = self.clock()
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                if not self._events:
+                    if self.clock() - idle_since >= self.idle_timeout:
+                        self._thread = None
+                        return
+                    self._cond.wait(self.idle_timeout)
+                    continue
+                when, _, _, callback = self._events[0]
+                delay = when - self.clock()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._events)
+            callback()
+            idle_since = self.clock()
+
+
+# ========== COUNTDOWN PLAN ==========
+def countdown_plan(hold_time, duration, hold_cue, number_cues, release_cue):
+    """
+    Spread the countdown cues over `hold_time` seconds.
+
+    The hold cue always plays first (it acknowledges the press). As many of
+    the final numbers ("..., 2, 1") as fit in the time left after it are
+    then spaced evenly so the last one ends just before `release_cue`,
+    which is due exactly at hold_time. `duration(cue)` gives clip lengths
+    in seconds. Returns [(offset_seconds, cue), ...].
+    """
+    plan = [(0.0, hold_cue)]
+    remaining = hold_time - duration(hold_cue)
+
+    numbers = list(number_cues)
+    while numbers and sum(duration(c) for c in numbers) > remaining:
+        numbers.pop(0)
+
+    if numbers:
+        gap = (remaining - sum(duration(c) for c in numbers)) / len(numbers)
+        offset = duration(hold_cue)
+        for cue in numbers:
+            offset += gap
+            plan.append((offset, cue))
+            offset += duration(cue)
+
+    plan.append((max(hold_time, duration(hold_cue)), release_cue))
+    return plan
@@ -0,0 +1,198 @@
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sessions.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reps (
+    id            INTEGER PRIMARY KEY,
+    username      TEXT NOT NULL,
+    session_id    TEXT NOT NULL,
+    rep_index     INTEGER NOT NULL,
+    region        TEXT NOT NULL,
+    hand          TEXT NOT NULL,
+    pressed_at    REAL NOT NULL,      -- unix time
+    countdown_at  REAL NOT NULL,
+    released_at   REAL NOT NULL,
+    hold_duration REAL NOT NULL,      -- seconds from countdown start to release
+    min_distance  REAL,               -- closest scaled fingertip distance, in frame heights
+    finger        TEXT                -- fingertip in contact when the hold started
+);
+CREATE INDEX IF NOT EXISTS reps_user_region ON reps (username, region, released_at);
+CREATE INDEX IF NOT EXISTS reps_session ON reps (session_id, rep_index);
+"""
+
+COLUMNS = (
+    "username", "session_id", "rep_index", "region", "hand",
+    "pressed_at", "countdown_at", "released_at", "hold_duration", "min_distance",
+    "finger",
+)
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, timeout=10.0, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _migrate(conn):
+    """Add columns introduced after a database was created."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(reps)")}
+    if "finger" not in existing:
+        conn.execute("ALTER TABLE reps ADD COLUMN finger TEXT")
+
+
+# ========== SESSION HISTORY STORE ==========
+class SessionStore:
+    """
+    Rep history in a local SQLite database (WAL mode).
+
+    record_rep() only appends to an in-memory buffer and never touches the
+    disk, so it is safe to call from the camera loop. A writer thread drains
+    the buffer in batches (every `flush_interval` seconds or as soon as
+    `batch_size` rows are waiting), one transaction per batch. The buffer
+    holds at most `max_buffer` rows: if the disk stalls for long enough,
+    the oldest unwritten rows are dropped and counted in `dropped`.
+    """
+
+    def __init__(self, path=DB_PATH, batch_size=64, flush_interval=1.0, max_buffer=10_000):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.dropped = 0
+
+        self._buffer = deque()
+        self._max_buffer = max_buffer
+        self._pending = 0           # rows taken from the buffer but not yet committed
+        self._cond = threading.Condition()
+        self._closed = False
+        self._flush_requested = False
+
+        with _connect(path) as conn:
+            conn.executescript(SCHEMA)
+            _migrate(conn)
+        self._thread = threading.Thread(target=self._write_loop, daemon=True, name="session-store")
+        self._thread.start()
+
+    # ---- camera loop side ----
+    def record_rep(self, **row):
+        """Queue one rep (keys as in COLUMNS). Never blocks on I/O."""
+        values = tuple(row.get(name) for name in COLUMNS)
+        with self._cond:
+            if self._closed:
+                return
+            if len(self._buffer) >= self._max_buffer:
+                self._buffer.popleft()
+                self.dropped += 1
+            self._buffer.append(values)
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify()
+
+    # ---- writer thread ----
+    def _write_loop(self):
+        conn = _connect(self.path)
+        try:
+            while True:
+                with self._cond:
+                    # Collect until a full batch, the flush interval, flush() or close()
+                    deadline = time.monotonic() + self.flush_interval
+                    while len(self._buffer) < self.batch_size and not (self._closed or self._flush_requested):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    self._flush_requested = False
+                    if not self._buffer:
+                        if self._closed:
+                            return
+                        continue
+                    batch = list(self._buffer)
+                    self._buffer.clear()
+                    self._pending = len(batch)
+                with conn:
+                    conn.executemany(
+                        f"INSERT INTO reps ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                        batch,
+                    )
+                with self._cond:
+                    self.written += len(batch)
+                    self._pending = 0
+                    self._cond.notify_all()
+        finally:
+            conn.close()
+
+    def flush(self, timeout=5.0):
+        """Wait until everything queued so far is on disk. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._buffer or self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout=5.0):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    # ---- queries ----
+    def history(self, username, region=None, limit=200):
+        """Most recent reps of a user (optionally one region), newest first."""
+        query = f"SELECT {', '.join(COLUMNS)} FROM reps WHERE username = ?"
+        params = [username]
+        if region is not None:
+            query += " AND region = ?"
+            params.append(region)
+        query += " ORDER BY released_at DESC LIMIT ?"
+        params.append(limit)
+        conn = _connect(self.path)
+        try:
+            return [dict(row) for row in conn.execute(query, params)]
+        finally:
+            conn.close()
+
+    def region_summary(self, username):
+        """Per-region totals for a user: reps, sessions, mean hold, best distance, last rep time."""
+        conn = _connect(self.path)
+        try:
+            return [dict(row) for row in conn.execute(
+                """
+                SELECT region,
+                       COUNT(*)                   AS reps,
+                       COUNT(DISTINCT session_id) AS sessions,
+                       AVG(hold_duration)         AS mean_hold,
+                       MIN(min_distance)          AS best_distance,
+                       MAX(released_at)           AS last_rep
+                FROM reps WHERE username = ?
+                GROUP BY region ORDER BY last_rep DESC
+                """,
+                (username,),
+            )]
+        finally:
+            conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_session_store():
+    """Process-wide SessionStore shared by every Streamlit session."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SessionStore()
+            atexit.register(_store.close)
+        return _store
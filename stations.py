@@ -0,0 +1,356 @@
+import atexit
+import logging
+import multiprocessing
+import threading
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from pipeline import FrameResult, mirror_to_rgb
+
+log = logging.getLogger("neurorehab")
+
+MAX_HANDS = 2
+NUM_LANDMARKS = 21
+
+
+# ========== SHARED-MEMORY RING ==========
+class SharedRing:
+    """
+    Fixed-size ring of RGB frames + hand landmarks in one shared-memory
+    block, written by a station process and read by any number of sessions.
+
+    Each slot carries a sequence number used as a seqlock: the writer sets
+    it to -1 while filling the slot and to the frame's sequence number when
+    done, and readers re-check it after copying, so a torn read is detected
+    instead of returned. Nothing is pickled; readers copy straight out of
+    the shared block.
+    """
+
+    def __init__(self, shm, width, height, slots, owner):
+        self.shm = shm
+        self.width = width
+        self.height = height
+        self.slots = slots
+        self.owner = owner
+
+        buf = shm.buf
+        offset = 0
+
+        def view(dtype, shape):
+            nonlocal offset
+            arr = np.ndarray(shape, dtype=dtype, buffer=buf, offset=offset)
+            offset += arr.nbytes
+            return arr
+
+        self.latest = view(np.int64, (1,))                    # sequence of newest complete frame
+        self.slot_seq = view(np.int64, (slots,))
+        self.slot_time = view(np.float64, (slots,))
+        self.slot_hands = view(np.int64, (slots,))
+        self.landmarks = view(np.float32, (slots, MAX_HANDS, NUM_LANDMARKS, 3))
+        self.frames = view(np.uint8, (slots, height, width, 3))
+
+    @staticmethod
+    def nbytes(width, height, slots):
+        return (
+            8 + slots * (8 + 8 + 8)
+            + slots * MAX_HANDS * NUM_LANDMARKS * 3 * 4
+            + slots * height * width * 3
+        )
+
+    @classmethod
+    def create(cls, width, height, slots=4):
+        shm = shared_memory.SharedMemory(create=True, size=cls.nbytes(width, height, slots))
+        ring = cls(shm, width, height, slots, owner=True)
+        ring.latest[0] = -1
+        ring.slot_seq[:] = -1
+        return ring
+
+    @classmethod
+    def attach(cls, name, width, height, slots):
+        return cls(shared_memory.SharedMemory(name=name), width, height, slots, owner=False)
+
+    @property
+    def spec(self):
+        return (self.shm.name, self.width, self.height, self.slots)
+
+    # ---- writer side ----
+    def begin_write(self):
+        """Claim the next slot. Returns (seq, frame_view, landmarks_view)."""
+        seq = int(self.latest[0]) + 1
+        slot = seq % self.slots
+        self.slot_seq[slot] = -1
+        return seq, self.frames[slot], self.landmarks[slot]
+
+    def commit(self, seq, n_hands, timestamp):
+        slot = seq % self.slots
+        self.slot_hands[slot] = n_hands
+        self.slot_time[slot] = timestamp
+        self.slot_seq[slot] = seq
+        self.latest[0] = seq
+
+    # ---- reader side ----
+    def read_latest(self, after=-1):
+        """
+        Copy out the newest frame if it is newer than `after`.
+        Returns (seq, timestamp, frame, landmarks[:n_hands]) or None.
+        """
+        seq = int(self.latest[0])
+        if seq <= after or seq < 0:
+            return None
+        slot = seq % self.slots
+        timestamp = float(self.slot_time[slot])
+        n_hands = int(self.slot_hands[slot])
+        frame = self.frames[slot].copy()
+        landmarks = self.landmarks[slot, :n_hands].copy()
+        if int(self.slot_seq[slot]) != seq:
+            return None       # overwritten while copying; caller retries
+        return seq, timestamp, frame, landmarks
+
+    def close(self):
+        # Drop numpy views before closing the mapping
+        self.latest = self.slot_seq = self.slot_time = self.slot_hands = None
+        self.landmarks = self.frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+# ========== STATION WORKER PROCESS ==========
+def _letterbox_view(frame_shape, dst):
+    """The centred region of `dst` a frame of `frame_shape` fills without changing its aspect ratio."""
+    h, w = frame_shape[:2]
+    dh, dw = dst.shape[:2]
+    scale = min(dw / w, dh / h)
+    sw, sh = max(1, round(w * scale)), max(1, round(h * scale))
+    x0, y0 = (dw - sw) // 2, (dh - sh) // 2
+    return dst[y0:y0 + sh, x0:x0 + sw]
+
+
+def _station_worker(ring_spec, source_spec, source_options, hands_params, stop_event):
+    """Capture + inference loop of one station, in its own process."""
+    import mediapipe as mp
+    from frame_sources import open_source
+
+    ring = SharedRing.attach(*ring_spec)
+    source = open_source(source_spec, **source_options)
+    hands = mp.solutions.hands.Hands(max_num_hands=MAX_HANDS, **hands_params)
+    size = (ring.width, ring.height)
+    frame = None
+    resized = np.zeros((ring.height, ring.width, 3), dtype=np.uint8)
+    view = None
+    try:
+        while not stop_event.is_set():
+            ok, frame = source.read(frame)
+            if not ok:
+                break
+            timestamp = time.monotonic()
+            src = frame
+            if (frame.shape[1], frame.shape[0]) != size:
+                # Camera delivered another size than the ring's: letterbox,
+                # never stretch (landmark geometry must stay undistorted)
+                if view is None or view.shape[:2] != _letterbox_view(frame.shape, resized).shape[:2]:
+                    resized[:] = 0
+                    view = _letterbox_view(frame.shape, resized)
+                cv2.resize(frame, view.shape[1::-1], dst=view, interpolation=cv2.INTER_AREA)
+                src = resized
+
+            # Mirror + colour-convert straight into the shared slot
+            seq, rgb, landmarks = ring.begin_write()
+            mirror_to_rgb(src, rgb)
+            results = hands.process(rgb)
+
+            n_hands = 0
+            for hand in (results.multi_hand_landmarks or [])[:MAX_HANDS]:
+                landmarks[n_hands] = [(lm.x, lm.y, lm.z) for lm in hand.landmark]
+                n_hands += 1
+            ring.commit(seq, n_hands, timestamp)
+    finally:
+        hands.close()
+        source.release()
+        ring.close()
+
+
+def to_landmark_list(arr):
+    """(21, 3) array → mediapipe NormalizedLandmarkList, for drawing and rep detection."""
+    from mediapipe.framework.formats import landmark_pb2
+
+    hand = landmark_pb2.NormalizedLandmarkList()
+    for x, y, z in arr:
+        hand.landmark.add(x=float(x), y=float(y), z=float(z))
+    return hand
+
+
+# ========== STATIONS ==========
+class Station:
+    def __init__(self, station_id, source, ring, process, stop_event):
+        self.station_id = station_id
+        self.source = source
+        self.ring = ring
+        self.process = process
+        self.stop_event = stop_event
+        self.clients = 0            # attached StationClients that have not stopped (manager lock)
+
+    @property
+    def alive(self):
+        return self.process.is_alive()
+
+    @property
+    def frames(self):
+        """Frames processed so far."""
+        return int(self.ring.latest[0]) + 1
+
+    def stop(self, timeout=5.0):
+        self.stop_event.set()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.ring.close()
+
+
+class StationClient:
+    """
+    A session's view of a station. Same results()/stop() interface as
+    HandPipeline, so the camera loop does not care where inference runs.
+    """
+
+    def __init__(self, station, poll_interval=0.002, on_stop=None):
+        self.station = station
+        self.on_stop = on_stop
+        self.ring = station.ring     # already mapped in this process
+        self.poll_interval = poll_interval
+        self.dropped_frames = 0
+        self._stopped = threading.Event()
+
+    def start(self):
+        return self
+
+    def results(self):
+        last = -1
+        while not self._stopped.is_set():
+            item = self.ring.read_latest(last)
+            if item is None:
+                if not self.station.alive:
+                    return
+                time.sleep(self.poll_interval)
+                continue
+            seq, timestamp, frame, landmarks = item
+            if last >= 0:
+                self.dropped_frames += seq - last - 1
+            last = seq
+            hands = [to_landmark_list(lm) for lm in landmarks] or None
+            yield FrameResult(seq, timestamp, frame, hands)
+
+    def release(self, result):
+        pass        # frames are copied out of the ring; nothing to recycle
+
+    def configure(self, inference_scale=1.0, infer_every=1):
+        pass        # inference cost is fixed per station, shared by its sessions
+
+    def stop(self):
+        # The station keeps running for other sessions; only this view stops.
+        if not self._stopped.is_set():
+            self._stopped.set()
+            if self.on_stop is not None:
+                self.on_stop(self)
+
+
+class StationManager:
+    """
+    Runs one worker process per camera station and lets Streamlit sessions
+    attach to a station by ID. Capture and inference for each station run
+    on their own core, outside the Streamlit interpreter's GIL.
+    """
+
+    def __init__(self):
+        self._stations = {}
+        self._lock = threading.RLock()
+        self._ctx = multiprocessing.get_context("spawn")
+
+    def start_station(self, station_id, source="camera:0", source_options=None,
+                      width=640, height=480, slots=4, min_detection_confidence=0.88,
+                      min_tracking_confidence=0.88, model_complexity=1):
+        """
+        Start a station, or return it if it is already running. A running
+        station with another source or frame size is restarted only while
+        no session is attached to it; otherwise it is shared as it is (its
+        frames keep their own, undistorted size) rather than torn down
+        under the sessions using it. `source` is an open_source() spec,
+        evaluated inside the worker process. The ring holds width × height
+        frames; give it the camera mode's size.
+        """
+        with self._lock:
+            existing = self._stations.get(station_id)
+            if existing is not None and existing.alive:
+                same = existing.source == source and (existing.ring.width, existing.ring.height) == (width, height)
+                if same:
+                    return existing
+                if existing.clients > 0:
+                    log.warning(
+                        "station %s: %d session(s) attached, keeping %s at %dx%d (requested %s at %dx%d)",
+                        station_id, existing.clients, existing.source, existing.ring.width,
+                        existing.ring.height, source, width, height,
+                    )
+                    return existing
+            if existing is not None:
+                existing.stop()
+
+            ring = SharedRing.create(width, height, slots)
+            stop_event = self._ctx.Event()
+            hands_params = dict(
+                min_detection_confidence=min_detection_confidence,
+                min_tracking_confidence=min_tracking_confidence,
+                model_complexity=model_complexity,
+            )
+            process = self._ctx.Process(
+                target=_station_worker,
+                args=(ring.spec, source, source_options or {}, hands_params, stop_event),
+                name=f"station-{station_id}",
+                daemon=True,
+            )
+            process.start()
+            station = Station(station_id, source, ring, process, stop_event)
+            self._stations[station_id] = station
+            return station
+
+    def attach(self, station_id, **start_params):
+        """Client for a station, starting it first if it is not running."""
+        with self._lock:
+            station = self.start_station(station_id, **start_params)
+            station.clients += 1
+            return StationClient(station, on_stop=self._detach)
+
+    def _detach(self, client):
+        with self._lock:
+            client.station.clients -= 1
+
+    def stations(self):
+        with self._lock:
+            return dict(self._stations)
+
+    def stop_station(self, station_id):
+        with self._lock:
+            station = self._stations.pop(station_id, None)
+        if station is not None:
+            station.stop()
+
+    def stop_all(self):
+        for station_id in list(self.stations()):
+            self.stop_station(station_id)
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_station_manager():
+    """Process-wide StationManager shared by every Streamlit session."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = StationManager()
+            atexit.register(_manager.stop_all)
+        return _manager
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from roi import ROITracker
+
+# Two hands, full-frame normalized (x, y) of their 21 landmarks
+HANDS = [
+    np.column_stack([np.linspace(0.25, 0.35, 21), np.linspace(0.45, 0.6, 21)]),
+    np.column_stack([np.linspace(0.6, 0.7, 21), np.linspace(0.4, 0.55, 21)]),
+]
+
+
+class FakeHands:
+    """Reports HANDS relative to whatever crop it is given. Pixels hold their own (col, row)."""
+
+    def __init__(self):
+        self.size = None        # (w, h) of the full frame the crop came from
+
+    def process(self, img):
+        col0, row0 = img[0, 0, 0], img[0, 0, 1]
+        h, w = img.shape[:2]
+        fw, fh = self.size
+        hands = []
+        for hand in HANDS:
+            xs = (hand[:, 0] * fw - col0) / w
+            ys = (hand[:, 1] * fh - row0) / h
+            hands.append(SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=0.0) for x, y in zip(xs, ys)]))
+        return SimpleNamespace(multi_hand_landmarks=hands, multi_handedness=None)
+
+
+def coordinate_frame(w, h):
+    rows, cols = np.mgrid[0:h, 0:w]
+    return np.dstack([cols, rows, np.zeros_like(cols)]).astype(np.int32)
+
+
+def landmarks(results):
+    return np.array([[(lm.x, lm.y) for lm in hand.landmark] for hand in results.multi_hand_landmarks])
+
+
+def test_scale_change_mid_sequence_keeps_landmarks_in_place():
+    hands = FakeHands()
+    tracker = ROITracker(hands)
+    expected = np.array(HANDS)
+    for w, h in [(640, 480), (640, 480), (320, 240), (320, 240), (480, 360), (640, 480)]:
+        hands.size = (w, h)
+        results = tracker.process(coordinate_frame(w, h))
+        # Crop pixel rounding is at most one pixel of the smallest input
+        np.testing.assert_allclose(landmarks(results), expected, atol=1.0 / 240)
+    assert tracker.roi is not None
+    assert tracker.full_frame_searches == 1